@@ -134,6 +134,10 @@ local function get_simulation_app_tests()
             "tests-nativepython-testing-isaacsim.simulation_app.test_test_runner",
             "standalone_examples/testing/isaacsim.simulation_app/test_test_runner.py",
         },
+        {
+            "tests-nativepython-testing-isaacsim.simulation_app.test_startup_trace",
+            "standalone_examples/testing/isaacsim.simulation_app/test_startup_trace.py",
+        },
         -- Additional simulation_app standalone scripts
         {
             "tests-nativepython-isaacsim.simulation_app.constant_fps",
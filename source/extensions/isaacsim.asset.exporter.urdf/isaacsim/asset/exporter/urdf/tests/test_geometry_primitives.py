@@ -450,6 +450,42 @@ class TestBreadcrumbParsing(omni.kit.test.AsyncTestCase):
             results = parse_source_geometry_breadcrumbs(urdf_path)
         self.assertEqual(len(results), 0)
 
+    async def test_parse_all_breadcrumbs_in_one_pass(self) -> None:
+        """Parse geometry, joint and drive breadcrumbs with a single read of the URDF file."""
+        from isaacsim.asset.importer.urdf.impl.drive_reconstruction import parse_source_drive_breadcrumbs
+        from isaacsim.asset.importer.urdf.impl.geometry_reconstruction import parse_source_geometry_breadcrumbs
+        from isaacsim.asset.importer.urdf.impl.joint_reconstruction import parse_source_joint_breadcrumbs
+        from isaacsim.asset.importer.urdf.impl.source_breadcrumbs import parse_source_breadcrumbs
+
+        joint_xml = """\
+  <link name="arm"/>
+  <joint name="hip_rotX" type="revolute">
+    <parent link="base"/>
+    <child link="arm"/>
+    <!-- isaac:source_joint {"type": "PhysicsSphericalJoint", "original_name": "hip", "chain_joints": ["hip_rotX"], "ghost_links": []} -->
+    <!-- isaac:source_drive {"source": "physx", "instance": "angular", "drive": {"stiffness": 10}} -->
+  </joint>
+</robot>
+"""
+        with tempfile.TemporaryDirectory() as td:
+            urdf_path = os.path.join(td, "test.urdf")
+            self._write_urdf_with_breadcrumbs(urdf_path)
+            with open(urdf_path) as f:
+                content = f.read().replace("</robot>\n", joint_xml)
+            with open(urdf_path, "w") as f:
+                f.write(content)
+
+            breadcrumbs = parse_source_breadcrumbs(urdf_path)
+            self.assertEqual(breadcrumbs.geometry, parse_source_geometry_breadcrumbs(urdf_path))
+            self.assertEqual(breadcrumbs.joints, parse_source_joint_breadcrumbs(urdf_path))
+            self.assertEqual(breadcrumbs.drives, parse_source_drive_breadcrumbs(urdf_path))
+
+        self.assertEqual(len(breadcrumbs.geometry), 4)
+        self.assertEqual(len(breadcrumbs.joints), 1)
+        self.assertEqual(breadcrumbs.joints[0].original_name, "hip")
+        self.assertEqual(len(breadcrumbs.drives), 1)
+        self.assertEqual(breadcrumbs.drives[0].joint_name, "hip_rotX")
+
 
 class TestReconstructSourceGeometry(omni.kit.test.AsyncTestCase):
     """Verify that reconstruct_source_geometry replaces converted geometry with originals."""
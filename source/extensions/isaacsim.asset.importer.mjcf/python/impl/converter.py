@@ -17,6 +17,7 @@
 
 from __future__ import annotations
 
+import dataclasses
 import gc
 import importlib
 import os
@@ -26,6 +27,7 @@ from typing import Any
 
 from isaacsim.asset.importer.utils.impl import (
     asset_utils,
+    batch_utils,
     importer_utils,
     merge_mesh_utils,
     mjc_to_physx_conversion_utils,
@@ -35,6 +37,7 @@ from isaacsim.asset.transformer.rules import DEFAULT_PROFILE_PATH
 from pxr import Sdf
 
 from .config import MJCFImporterConfig
+from .mjcf_utils import collect_asset_dependencies
 
 
 class MJCFImporter:
@@ -223,3 +226,57 @@ class MJCFImporter:
                 shutil.rmtree(scratch_dir, ignore_errors=True)
 
         return final_path
+
+    def import_mjcf_batch(
+        self,
+        mjcf_paths: list[str],
+        usd_path: str,
+        *,
+        max_workers: int | None = None,
+        use_cache: bool = True,
+    ) -> list[batch_utils.BatchImportResult]:
+        """Import many MJCF files, skipping files whose inputs did not change.
+
+        Every file is imported with a copy of the importer configuration into its own directory under
+        *usd_path*, named after the file and the hash of the MJCF, its included and referenced asset files and
+        the configuration. Files whose hash matches a previous import in *usd_path* are not imported again.
+        See :func:`~isaacsim.asset.importer.utils.run_batch_import` for details.
+
+        Args:
+            mjcf_paths: Paths to the MJCF files to import.
+            usd_path: Directory holding the output directories of the imports.
+            max_workers: Maximum number of threads hashing the files. The imports run one after another.
+            use_cache: If False, every file is imported again.
+
+        Returns:
+            One result per MJCF file (output path, whether it was cached, timings and error), in the
+            order of *mjcf_paths*.
+
+        Example:
+
+        .. code-block:: python
+
+            >>> from isaacsim.asset.importer.mjcf import MJCFImporter, MJCFImporterConfig
+
+            >>> importer = MJCFImporter(MJCFImporterConfig(import_scene=False))
+            >>> # results = importer.import_mjcf_batch(["/tmp/a.xml", "/tmp/b.xml"], "/tmp/output")
+        """
+        template = self.config
+        config_fields = {
+            key: value for key, value in dataclasses.asdict(template).items() if key not in ("mjcf_path", "usd_path")
+        }
+        config_fields["importer"] = "mjcf"
+
+        def _import(mjcf_path: str, output_dir: str) -> str:
+            config = dataclasses.replace(template, mjcf_path=mjcf_path, usd_path=output_dir)
+            return MJCFImporter(config).import_mjcf()
+
+        return batch_utils.run_batch_import(
+            mjcf_paths,
+            _import,
+            usd_path,
+            dependency_fn=collect_asset_dependencies,
+            config=config_fields,
+            max_workers=max_workers,
+            use_cache=use_cache,
+        )
@@ -0,0 +1,81 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Utility functions for inspecting MJCF files before USD conversion."""
+
+from __future__ import annotations
+
+import logging
+import os
+import xml.etree.ElementTree as ET
+
+_logger = logging.getLogger(__name__)
+
+# Asset elements referencing a file, and the compiler directory attribute their paths are relative to.
+_ASSET_FILE_ELEMENTS = {"mesh": "meshdir", "skin": "meshdir", "texture": "texturedir", "hfield": "assetdir"}
+
+
+def collect_asset_dependencies(mjcf_path: str) -> list[str]:
+    """Collect the files referenced by an MJCF file.
+
+    Follows ``<include file="..."/>`` elements and resolves ``<mesh>``, ``<skin>``, ``<texture>`` and
+    ``<hfield>`` files against the ``meshdir``, ``texturedir`` and ``assetdir`` compiler settings, as
+    MuJoCo does.
+
+    Args:
+        mjcf_path: Path to the MJCF (.xml) file.
+
+    Returns:
+        Absolute paths to the included and referenced asset files, without duplicates. The files may not exist.
+    """
+    model_dir = os.path.dirname(os.path.abspath(mjcf_path))
+    compiler: dict[str, str] = {}
+    paths: dict[str, None] = {}
+    pending = [os.path.abspath(mjcf_path)]
+    visited: set[str] = set()
+    roots: list[ET.Element] = []
+
+    # Gather the main file and the included files first, compiler settings may appear in any of them
+    while pending:
+        path = os.path.normpath(pending.pop())
+        if path in visited:
+            continue
+        visited.add(path)
+        if path != os.path.normpath(os.path.abspath(mjcf_path)):
+            paths[path] = None
+        try:
+            root = ET.parse(path).getroot()
+        except (OSError, ET.ParseError):
+            _logger.warning(f"Failed to parse MJCF file {path}")
+            continue
+        roots.append(root)
+        for include in root.iter("include"):
+            if include.get("file"):
+                pending.append(os.path.join(model_dir, include.get("file")))
+        for element in root.iter("compiler"):
+            for key in ("assetdir", "meshdir", "texturedir"):
+                if element.get(key) is not None:
+                    compiler[key] = element.get(key)
+
+    for root in roots:
+        for tag, dir_key in _ASSET_FILE_ELEMENTS.items():
+            asset_dir = compiler.get(dir_key, compiler.get("assetdir", ""))
+            for element in root.iter(tag):
+                filename = element.get("file")
+                if not filename:
+                    continue
+                path = os.path.join(model_dir, asset_dir, filename)
+                paths[os.path.normpath(os.path.abspath(path))] = None
+    return list(paths)
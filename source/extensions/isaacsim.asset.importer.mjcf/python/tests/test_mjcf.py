@@ -29,6 +29,7 @@ import carb
 #   For most things refer to unittest docs: https://docs.python.org/3/library/unittest.html
 import omni.kit.test
 from isaacsim.asset.importer.mjcf import MJCFImporter, MJCFImporterConfig
+from isaacsim.asset.importer.mjcf.impl.mjcf_utils import collect_asset_dependencies
 from isaacsim.asset.importer.utils.impl import stage_utils
 from pxr import Sdf, Usd, UsdGeom, UsdPhysics
 
@@ -435,3 +436,28 @@ class TestMJCF(omni.kit.test.AsyncTestCase):
         self.assertTrue(os.path.exists(output_path), f"Output path not found: {output_path}")
 
         self._success = True
+
+    async def test_collect_asset_dependencies(self) -> None:
+        """Collect included files and asset files resolved against the compiler directories."""
+        model_path = os.path.join(self._tmpdir, "robot.xml")
+        with open(model_path, "w") as f:
+            f.write(
+                '<mujoco><compiler meshdir="meshes" texturedir="textures"/><include file="assets.xml"/>'
+                '<asset><mesh file="base.stl"/><mesh name="no_file"/></asset></mujoco>'
+            )
+        with open(os.path.join(self._tmpdir, "assets.xml"), "w") as f:
+            f.write(
+                '<mujocoinclude><asset><mesh file="arm.stl"/><mesh file="base.stl"/>'
+                '<texture name="grid" file="grid.png"/></asset></mujocoinclude>'
+            )
+
+        dependencies = collect_asset_dependencies(model_path)
+        expected = [
+            os.path.join(self._tmpdir, "assets.xml"),
+            os.path.join(self._tmpdir, "meshes", "base.stl"),
+            os.path.join(self._tmpdir, "meshes", "arm.stl"),
+            os.path.join(self._tmpdir, "textures", "grid.png"),
+        ]
+        self.assertCountEqual(dependencies, [os.path.normpath(path) for path in expected])
+
+        self._success = True
@@ -17,6 +17,7 @@
 
 from __future__ import annotations
 
+import dataclasses
 import gc
 import importlib
 import logging
@@ -27,6 +28,7 @@ from typing import Any
 
 from isaacsim.asset.importer.utils.impl import (
     asset_utils,
+    batch_utils,
     importer_utils,
     merge_mesh_utils,
     stage_utils,
@@ -36,10 +38,11 @@ from isaacsim.asset.transformer.rules import DEFAULT_PROFILE_PATH
 from pxr import Sdf
 
 from .config import URDFImporterConfig
-from .drive_reconstruction import parse_source_drive_breadcrumbs, reconstruct_source_drives
-from .geometry_reconstruction import parse_source_geometry_breadcrumbs, reconstruct_source_geometry
-from .joint_reconstruction import parse_source_joint_breadcrumbs, reconstruct_source_joints
-from .urdf_utils import _rewrite_relative_mesh_paths_to_absolute, merge_fixed_joints
+from .drive_reconstruction import reconstruct_source_drives
+from .geometry_reconstruction import reconstruct_source_geometry
+from .joint_reconstruction import reconstruct_source_joints
+from .source_breadcrumbs import parse_source_breadcrumbs
+from .urdf_utils import _rewrite_relative_mesh_paths_to_absolute, collect_mesh_dependencies, merge_fixed_joints
 
 _logger = logging.getLogger(__name__)
 
@@ -160,33 +163,34 @@ class URDFImporter:
             if not self.stage:
                 raise ValueError(f"Failed to open flattened stage at path: {asset.path}")
 
-            breadcrumbs = parse_source_geometry_breadcrumbs(urdf_path)
-            if breadcrumbs:
-                n = reconstruct_source_geometry(self.stage, breadcrumbs)
+            # Parse the URDF once and index the stage once, all post-processing steps share both
+            breadcrumbs = parse_source_breadcrumbs(urdf_path)
+            prim_index = stage_utils.StagePrimIndex(self.stage)
+
+            if breadcrumbs.geometry:
+                n = reconstruct_source_geometry(self.stage, breadcrumbs.geometry, prim_index=prim_index)
                 if n:
                     _logger.info(f"Reconstructed {n} source geometry primitives from breadcrumbs")
 
-            joint_breadcrumbs = parse_source_joint_breadcrumbs(urdf_path)
-            if joint_breadcrumbs:
-                n = reconstruct_source_joints(self.stage, joint_breadcrumbs)
+            if breadcrumbs.joints:
+                n = reconstruct_source_joints(self.stage, breadcrumbs.joints, prim_index=prim_index)
                 if n:
                     _logger.info(f"Reconstructed {n} source joint types from breadcrumbs")
 
             importer_utils.remove_custom_scopes(self.stage)
-            importer_utils.add_joint_schemas(self.stage)
+            importer_utils.add_joint_schemas(self.stage, prim_index=prim_index)
 
-            drive_breadcrumbs = parse_source_drive_breadcrumbs(urdf_path)
-            if drive_breadcrumbs:
-                n = reconstruct_source_drives(self.stage, drive_breadcrumbs)
+            if breadcrumbs.drives:
+                n = reconstruct_source_drives(self.stage, breadcrumbs.drives, prim_index=prim_index)
                 if n:
                     _logger.info(f"Reconstructed {n} joint drive configurations from breadcrumbs")
             if self.config.fix_base is True:
-                asset_utils.apply_fix_base(self.stage)
+                asset_utils.apply_fix_base(self.stage, prim_index=prim_index)
             elif self.config.fix_base is False:
-                asset_utils.apply_floating_base(self.stage)
+                asset_utils.apply_floating_base(self.stage, prim_index=prim_index)
 
             if self.config.link_density:
-                asset_utils.apply_link_density(self.stage, self.config.link_density)
+                asset_utils.apply_link_density(self.stage, self.config.link_density, prim_index=prim_index)
 
             has_drive_overrides = (
                 self.config.joint_drive_type is not None
@@ -201,17 +205,20 @@ class URDFImporter:
                     target_type=self.config.joint_target_type,
                     stiffness=self.config.override_joint_stiffness,
                     damping=self.config.override_joint_damping,
+                    prim_index=prim_index,
                 )
 
             if self.config.merge_mesh:
                 merge_mesh_utils.clean_mesh_operation(self.stage)
                 merge_mesh_utils.generate_mesh_uv_normals_operation(self.stage)
                 merge_mesh_utils.merge_meshes_operation(self.stage)
+                # Merging replaces the mesh prims
+                prim_index.rebuild()
 
             if self.config.collision_from_visuals:
-                importer_utils.collision_from_visuals(self.stage, self.config.collision_type)
+                importer_utils.collision_from_visuals(self.stage, self.config.collision_type, prim_index=prim_index)
 
-            importer_utils.enable_self_collision(self.stage, self.config.allow_self_collision)
+            importer_utils.enable_self_collision(self.stage, self.config.allow_self_collision, prim_index=prim_index)
             importer_utils.create_robot_schema(self.stage, robot_type=self.config.robot_type)
 
             if self.config.run_multi_physics_conversion:
@@ -247,3 +254,59 @@ class URDFImporter:
                 shutil.rmtree(scratch_dir, ignore_errors=True)
 
         return final_path
+
+    def import_urdf_batch(
+        self,
+        urdf_paths: list[str],
+        usd_path: str,
+        *,
+        max_workers: int | None = None,
+        use_cache: bool = True,
+    ) -> list[batch_utils.BatchImportResult]:
+        """Import many URDF files, skipping files whose inputs did not change.
+
+        Every file is imported with a copy of the importer configuration into its own directory under
+        *usd_path*, named after the file and the hash of the URDF, its referenced meshes and the
+        configuration. Files whose hash matches a previous import in *usd_path* are not imported again.
+        See :func:`~isaacsim.asset.importer.utils.run_batch_import` for details.
+
+        Args:
+            urdf_paths: Paths to the URDF files to import.
+            usd_path: Directory holding the output directories of the imports.
+            max_workers: Maximum number of threads hashing the files. The imports run one after another.
+            use_cache: If False, every file is imported again.
+
+        Returns:
+            One result per URDF file (output path, whether it was cached, timings and error), in the
+            order of *urdf_paths*.
+
+        Example:
+
+        .. code-block:: python
+
+            >>> from isaacsim.asset.importer.urdf import URDFImporter, URDFImporterConfig
+
+            >>> importer = URDFImporter(URDFImporterConfig(merge_mesh=True))
+            >>> # results = importer.import_urdf_batch(["/tmp/a.urdf", "/tmp/b.urdf"], "/tmp/output")
+        """
+        template = self.config
+        config_fields = {
+            key: value for key, value in dataclasses.asdict(template).items() if key not in ("urdf_path", "usd_path")
+        }
+        config_fields["importer"] = "urdf"
+
+        def _import(urdf_path: str, output_dir: str) -> str:
+            config = dataclasses.replace(
+                template, urdf_path=urdf_path, usd_path=output_dir, ros_package_paths=list(template.ros_package_paths)
+            )
+            return URDFImporter(config).import_urdf()
+
+        return batch_utils.run_batch_import(
+            urdf_paths,
+            _import,
+            usd_path,
+            dependency_fn=lambda urdf_path: collect_mesh_dependencies(urdf_path, template.ros_package_paths),
+            config=config_fields,
+            max_workers=max_workers,
+            use_cache=use_cache,
+        )
@@ -28,6 +28,7 @@ import xml.etree.ElementTree as ET
 from dataclasses import dataclass, field
 
 from isaacsim.asset.importer.utils.impl.physx_types import PhysxAttr, PhysxSchema
+from isaacsim.asset.importer.utils.impl.stage_utils import StagePrimIndex
 from pxr import Sdf, Usd, UsdPhysics
 
 _logger = logging.getLogger(__name__)
@@ -113,8 +114,20 @@ def _parse_with_comment_builder(urdf_path: str) -> list[SourceDriveInfo]:
     except ET.ParseError:
         return []
 
+    return collect_source_drive_breadcrumbs(tree.getroot(), urdf_path)
+
+
+def collect_source_drive_breadcrumbs(root: ET.Element, urdf_path: str = "") -> list[SourceDriveInfo]:
+    """Collect ``isaac:source_drive`` breadcrumbs from a URDF tree parsed with its comments.
+
+    Args:
+        root: Root ``robot`` element of a tree whose comments were kept as elements.
+        urdf_path: Path to the URDF file (for logging).
+
+    Returns:
+        Parsed ``isaac:source_drive`` breadcrumb records.
+    """
     results: list[SourceDriveInfo] = []
-    root = tree.getroot()
 
     for joint_elem in root.iter("joint"):
         joint_name = joint_elem.get("name", "")
@@ -156,7 +169,9 @@ def _parse_comment(text: str, joint_name: str, urdf_path: str) -> SourceDriveInf
     )
 
 
-def reconstruct_source_drives(stage: Usd.Stage, breadcrumbs: list[SourceDriveInfo]) -> int:
+def reconstruct_source_drives(
+    stage: Usd.Stage, breadcrumbs: list[SourceDriveInfo], *, prim_index: StagePrimIndex | None = None
+) -> int:
     """Apply saved drive / actuator parameters back onto the USD stage.
 
     Must be called **after** ``convert_joints_attributes`` so that the
@@ -165,41 +180,30 @@ def reconstruct_source_drives(stage: Usd.Stage, breadcrumbs: list[SourceDriveInf
     Args:
         stage: The USD stage produced by the URDF converter.
         breadcrumbs: Parsed breadcrumb records from the URDF file.
+        prim_index: Shared index of the stage prims, kept up to date with the created actuator prims.
+            Defaults to indexing the stage once for all breadcrumbs.
 
     Returns:
         Number of joints updated.
     """
     if not breadcrumbs:
         return 0
+    if prim_index is None:
+        prim_index = StagePrimIndex(stage)
 
     count = 0
     for bc in breadcrumbs:
-        if _reconstruct_one(stage, bc):
+        if _reconstruct_one(stage, prim_index, bc):
             count += 1
     return count
 
 
-def _find_prim_by_name(stage: Usd.Stage, name: str) -> Usd.Prim | None:
-    """Find a prim anywhere on the stage whose GetName() matches *name*.
-
-    Args:
-        stage: USD stage to search.
-        name: Prim name to match (``GetName()``).
-
-    Returns:
-        The first matching prim, or ``None`` if not found.
-    """
-    for prim in stage.Traverse():
-        if prim.GetName() == name:
-            return prim
-    return None
-
-
-def _reconstruct_one(stage: Usd.Stage, bc: SourceDriveInfo) -> bool:
+def _reconstruct_one(stage: Usd.Stage, prim_index: StagePrimIndex, bc: SourceDriveInfo) -> bool:
     """Reconstruct actuation data for a single joint.
 
     Args:
         stage: USD stage to modify.
+        prim_index: Index of the stage prims used to find the joint by name.
         bc: Parsed drive breadcrumb for one joint.
 
     Returns:
@@ -208,7 +212,7 @@ def _reconstruct_one(stage: Usd.Stage, bc: SourceDriveInfo) -> bool:
     if not bc.joint_name:
         return False
 
-    joint_prim = _find_prim_by_name(stage, bc.joint_name)
+    joint_prim = prim_index.find_by_name(bc.joint_name)
     if joint_prim is None:
         _logger.warning(f"Joint prim '{bc.joint_name}' not found for drive reconstruction")
         return False
@@ -242,6 +246,7 @@ def _reconstruct_one(stage: Usd.Stage, bc: SourceDriveInfo) -> bool:
         actuator_prim = stage.GetPrimAtPath(actuator_path)
         if not actuator_prim.IsValid():
             actuator_prim = stage.DefinePrim(actuator_path, "MjcActuator")
+            prim_index.add(actuator_prim)
 
         actuator_prim.CreateRelationship("mjc:target", custom=False).SetTargets([joint_prim.GetPath()])
 
@@ -29,6 +29,7 @@ import xml.etree.ElementTree as ET
 from collections import defaultdict
 from dataclasses import dataclass, field
 
+from isaacsim.asset.importer.utils.impl.stage_utils import StagePrimIndex
 from pxr import Sdf, Usd, UsdGeom, UsdPhysics
 
 _logger = logging.getLogger(__name__)
@@ -126,8 +127,20 @@ def _parse_breadcrumbs_with_comments(urdf_path: str) -> list[SourceGeometryInfo]
     except ET.ParseError:
         return []
 
+    return collect_source_geometry_breadcrumbs(tree.getroot(), urdf_path)
+
+
+def collect_source_geometry_breadcrumbs(root: ET.Element, urdf_path: str = "") -> list[SourceGeometryInfo]:
+    """Collect ``isaac:source_geometry`` breadcrumbs from a URDF tree parsed with its comments.
+
+    Args:
+        root: Root ``robot`` element of a tree whose comments were kept as elements.
+        urdf_path: Path to the URDF file (for logging).
+
+    Returns:
+        Parsed ``isaac:source_geometry`` breadcrumb records.
+    """
     results: list[SourceGeometryInfo] = []
-    root = tree.getroot()
 
     for link_elem in root.iter("link"):
         link_name = link_elem.get("name", "")
@@ -159,18 +172,24 @@ def _parse_breadcrumbs_with_comments(urdf_path: str) -> list[SourceGeometryInfo]
     return results
 
 
-def reconstruct_source_geometry(stage: Usd.Stage, breadcrumbs: list[SourceGeometryInfo]) -> int:
+def reconstruct_source_geometry(
+    stage: Usd.Stage, breadcrumbs: list[SourceGeometryInfo], *, prim_index: StagePrimIndex | None = None
+) -> int:
     """Replace converted geometry with original USD primitives on the stage.
 
     Args:
         stage: The USD stage produced by the URDF converter.
         breadcrumbs: Parsed breadcrumb records from the URDF file.
+        prim_index: Shared index of the stage prims, kept up to date with the reconstructed prims.
+            Defaults to indexing the stage once for all breadcrumbs.
 
     Returns:
         Number of primitives reconstructed.
     """
     if not breadcrumbs:
         return 0
+    if prim_index is None:
+        prim_index = StagePrimIndex(stage)
 
     # Group by (link_name, original_type, source_prim_name)
     groups: dict[tuple[str, str, str], list[SourceGeometryInfo]] = defaultdict(list)
@@ -182,32 +201,16 @@ def reconstruct_source_geometry(stage: Usd.Stage, breadcrumbs: list[SourceGeomet
 
     for (link_name, orig_type, source_name), entries in groups.items():
         if orig_type == "Capsule":
-            if _reconstruct_capsule(stage, link_name, source_name, entries):
+            if _reconstruct_capsule(stage, prim_index, link_name, source_name, entries):
                 count += 1
         elif orig_type == "Cone":
             for entry in entries:
-                if _reconstruct_cone(stage, link_name, source_name, entry):
+                if _reconstruct_cone(stage, prim_index, link_name, source_name, entry):
                     count += 1
 
     return count
 
 
-def _find_prim_by_name(stage: Usd.Stage, name: str) -> Usd.Prim | None:
-    """Find a prim anywhere on the stage whose GetName() matches *name*.
-
-    Args:
-        stage: USD stage to search.
-        name: Prim name to match (``GetName()``).
-
-    Returns:
-        The first matching prim, or ``None`` if not found.
-    """
-    for prim in stage.Traverse():
-        if prim.GetName() == name:
-            return prim
-    return None
-
-
 def _find_geometry_child(prim: Usd.Prim) -> Usd.Prim | None:
     """Find the first geometry-typed child of a prim.
 
@@ -257,11 +260,18 @@ def _copy_purpose(src: Usd.Prim, dst: Usd.Prim) -> None:
             dst_img.GetPurposeAttr().Set(purpose)
 
 
-def _reconstruct_capsule(stage: Usd.Stage, link_name: str, source_name: str, entries: list[SourceGeometryInfo]) -> bool:
+def _reconstruct_capsule(
+    stage: Usd.Stage,
+    prim_index: StagePrimIndex,
+    link_name: str,
+    source_name: str,
+    entries: list[SourceGeometryInfo],
+) -> bool:
     """Replace cylinder + 2 sphere prims with a single UsdGeom.Capsule.
 
     Args:
         stage: USD stage to modify.
+        prim_index: Index of the stage prims used to find the converted prims by name.
         link_name: URDF link name for the capsule group.
         source_name: Original USD prim name for the reconstructed capsule.
         entries: Breadcrumb records for all capsule parts (body, caps, etc.).
@@ -285,7 +295,7 @@ def _reconstruct_capsule(stage: Usd.Stage, link_name: str, source_name: str, ent
     body_geom_prim: Usd.Prim | None = None
 
     for entry in entries:
-        wrapper = _find_prim_by_name(stage, entry.element_name)
+        wrapper = prim_index.find_by_name(entry.element_name)
         if wrapper is None:
             continue
         geom_child = _find_geometry_child(wrapper)
@@ -298,7 +308,7 @@ def _reconstruct_capsule(stage: Usd.Stage, link_name: str, source_name: str, ent
         return False
 
     # Determine where to create the capsule — use the body wrapper's parent
-    body_wrapper = _find_prim_by_name(stage, body_entry.element_name)
+    body_wrapper = prim_index.find_by_name(body_entry.element_name)
     if body_wrapper is None:
         _logger.warning(f"Could not find body wrapper prim for capsule '{source_name}'")
         return False
@@ -328,6 +338,7 @@ def _reconstruct_capsule(stage: Usd.Stage, link_name: str, source_name: str, ent
 
     # Apply transform
     capsule_prim = capsule.GetPrim()
+    prim_index.add(capsule_prim)
     if xform_ops_data:
         xf = UsdGeom.Xformable(capsule_prim)
         for op_type, precision, suffix, val in xform_ops_data:
@@ -347,11 +358,14 @@ def _reconstruct_capsule(stage: Usd.Stage, link_name: str, source_name: str, ent
     return True
 
 
-def _reconstruct_cone(stage: Usd.Stage, link_name: str, source_name: str, entry: SourceGeometryInfo) -> bool:
+def _reconstruct_cone(
+    stage: Usd.Stage, prim_index: StagePrimIndex, link_name: str, source_name: str, entry: SourceGeometryInfo
+) -> bool:
     """Replace a mesh prim with a UsdGeom.Cone.
 
     Args:
         stage: USD stage to modify.
+        prim_index: Index of the stage prims used to find the converted prim by name.
         link_name: URDF link name (for logging).
         source_name: Original USD prim name for the reconstructed cone.
         entry: Breadcrumb for this cone instance.
@@ -364,7 +378,7 @@ def _reconstruct_cone(stage: Usd.Stage, link_name: str, source_name: str, entry:
     height = params.get("height", 2.0)
     axis = params.get("axis", "Z")
 
-    wrapper = _find_prim_by_name(stage, entry.element_name)
+    wrapper = prim_index.find_by_name(entry.element_name)
     if wrapper is None:
         _logger.warning(f"Could not find wrapper prim for cone '{source_name}'")
         return False
@@ -397,6 +411,7 @@ def _reconstruct_cone(stage: Usd.Stage, link_name: str, source_name: str, entry:
     cone.GetAxisAttr().Set(axis)
 
     cone_prim = cone.GetPrim()
+    prim_index.add(cone_prim)
     if xform_ops_data:
         xf = UsdGeom.Xformable(cone_prim)
         for op_type, precision, suffix, val in xform_ops_data:
@@ -28,6 +28,7 @@ import logging
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass, field
 
+from isaacsim.asset.importer.utils.impl.stage_utils import StagePrimIndex
 from pxr import Gf, Sdf, Usd, UsdPhysics
 
 _logger = logging.getLogger(__name__)
@@ -116,8 +117,20 @@ def _parse_with_comment_builder(urdf_path: str) -> list[SourceJointInfo]:
     except ET.ParseError:
         return []
 
+    return collect_source_joint_breadcrumbs(tree.getroot(), urdf_path)
+
+
+def collect_source_joint_breadcrumbs(root: ET.Element, urdf_path: str = "") -> list[SourceJointInfo]:
+    """Collect ``isaac:source_joint`` breadcrumbs from a URDF tree parsed with its comments.
+
+    Args:
+        root: Root ``robot`` element of a tree whose comments were kept as elements.
+        urdf_path: Path to the URDF file (for logging).
+
+    Returns:
+        Parsed ``isaac:source_joint`` breadcrumb records.
+    """
     results: list[SourceJointInfo] = []
-    root = tree.getroot()
 
     for joint_elem in root.iter("joint"):
         joint_name = joint_elem.get("name", "")
@@ -165,48 +178,39 @@ def _parse_comment(text: str, joint_name: str, urdf_path: str) -> SourceJointInf
     return info
 
 
-def reconstruct_source_joints(stage: Usd.Stage, breadcrumbs: list[SourceJointInfo]) -> int:
+def reconstruct_source_joints(
+    stage: Usd.Stage, breadcrumbs: list[SourceJointInfo], *, prim_index: StagePrimIndex | None = None
+) -> int:
     """Collapse chain joints and ghost links back into original USD joint types.
 
     Args:
         stage: The USD stage produced by the URDF converter.
         breadcrumbs: Parsed breadcrumb records from the URDF file.
+        prim_index: Shared index of the stage prims, kept up to date with the reconstructed joints.
+            Defaults to indexing the stage once for all breadcrumbs.
 
     Returns:
         Number of joints reconstructed.
     """
     if not breadcrumbs:
         return 0
+    if prim_index is None:
+        prim_index = StagePrimIndex(stage)
 
     count = 0
     for bc in breadcrumbs:
-        if _reconstruct_one(stage, bc):
+        if _reconstruct_one(stage, prim_index, bc):
             count += 1
 
     return count
 
 
-def _find_prim_by_name(stage: Usd.Stage, name: str) -> Usd.Prim | None:
-    """Find a prim anywhere on the stage whose GetName() matches *name*.
-
-    Args:
-        stage: USD stage to search.
-        name: Prim name to match (``GetName()``).
-
-    Returns:
-        The first matching prim, or ``None`` if not found.
-    """
-    for prim in stage.Traverse():
-        if prim.GetName() == name:
-            return prim
-    return None
-
-
-def _reconstruct_one(stage: Usd.Stage, bc: SourceJointInfo) -> bool:
+def _reconstruct_one(stage: Usd.Stage, prim_index: StagePrimIndex, bc: SourceJointInfo) -> bool:
     """Reconstruct a single multi-DOF joint from its chain representation.
 
     Args:
         stage: USD stage to modify.
+        prim_index: Index of the stage prims used to find the chain joints and ghost links by name.
         bc: Parsed joint breadcrumb describing the chain and original joint.
 
     Returns:
@@ -217,7 +221,7 @@ def _reconstruct_one(stage: Usd.Stage, bc: SourceJointInfo) -> bool:
 
     chain_prims: list[Usd.Prim] = []
     for jname in bc.chain_joints:
-        prim = _find_prim_by_name(stage, jname)
+        prim = prim_index.find_by_name(jname)
         if prim is None:
             _logger.warning(f"Chain joint prim '{jname}' not found for reconstruction of '{bc.original_name}'")
             return False
@@ -225,7 +229,7 @@ def _reconstruct_one(stage: Usd.Stage, bc: SourceJointInfo) -> bool:
 
     ghost_prims: list[Usd.Prim] = []
     for gname in bc.ghost_links:
-        prim = _find_prim_by_name(stage, gname)
+        prim = prim_index.find_by_name(gname)
         if prim is None:
             _logger.warning(f"Ghost link prim '{gname}' not found for reconstruction of '{bc.original_name}'")
             return False
@@ -287,6 +291,7 @@ def _reconstruct_one(stage: Usd.Stage, bc: SourceJointInfo) -> bool:
         new_joint_api.CreateLocalRot1Attr().Set(Gf.Quatf(q[0], q[1], q[2], q[3]))
 
     joint_prim = new_joint_api.GetPrim()
+    prim_index.add(joint_prim)
 
     # Restore per-axis limits
     for axis_token, limits in bc.per_axis_limits.items():
@@ -0,0 +1,75 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Parse all URDF round-trip breadcrumbs with a single read of the URDF file.
+
+The geometry, joint and drive reconstruction modules each expose a parser that
+reads the URDF file on its own.  The importer uses :func:`parse_source_breadcrumbs`
+instead, which parses the file once (keeping its XML comments) and collects the
+``isaac:source_geometry``, ``isaac:source_joint`` and ``isaac:source_drive``
+breadcrumbs from the same tree.
+"""
+
+from __future__ import annotations
+
+import logging
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+
+from .drive_reconstruction import SourceDriveInfo, collect_source_drive_breadcrumbs
+from .geometry_reconstruction import SourceGeometryInfo, collect_source_geometry_breadcrumbs
+from .joint_reconstruction import SourceJointInfo, collect_source_joint_breadcrumbs
+
+_logger = logging.getLogger(__name__)
+
+
+class _CommentedTreeBuilder(ET.TreeBuilder):
+    """Tree builder that keeps XML comments as ``ET.Comment`` elements."""
+
+    def comment(self, data: str) -> None:  # type: ignore[override]
+        self.start(ET.Comment, {})
+        self.data(data)
+        self.end(ET.Comment)  # type: ignore[arg-type]
+
+
+@dataclass
+class SourceBreadcrumbs:
+    """All round-trip breadcrumbs parsed from a URDF file."""
+
+    geometry: list[SourceGeometryInfo] = field(default_factory=list)
+    joints: list[SourceJointInfo] = field(default_factory=list)
+    drives: list[SourceDriveInfo] = field(default_factory=list)
+
+
+def parse_source_breadcrumbs(urdf_path: str) -> SourceBreadcrumbs:
+    """Parse the geometry, joint and drive breadcrumbs of a URDF file in a single pass.
+
+    Args:
+        urdf_path: Path to the URDF file.
+
+    Returns:
+        The parsed breadcrumb records, empty if the file cannot be parsed.
+    """
+    try:
+        tree = ET.parse(urdf_path, parser=ET.XMLParser(target=_CommentedTreeBuilder()))
+    except ET.ParseError:
+        _logger.warning(f"Failed to parse URDF XML at {urdf_path}")
+        return SourceBreadcrumbs()
+
+    root = tree.getroot()
+    return SourceBreadcrumbs(
+        geometry=collect_source_geometry_breadcrumbs(root, urdf_path),
+        joints=collect_source_joint_breadcrumbs(root, urdf_path),
+        drives=collect_source_drive_breadcrumbs(root, urdf_path),
+    )
@@ -54,6 +54,40 @@ def _rewrite_relative_mesh_paths_to_absolute(urdf_file: str, reference_dir: str)
         tree.write(urdf_file, xml_declaration=True, encoding="UTF-8")
 
 
+def collect_mesh_dependencies(urdf_path: str, ros_package_paths: list[dict[str, str]] | None = None) -> list[str]:
+    """Collect the mesh files referenced by a URDF file.
+
+    Relative ``<mesh filename="..."/>`` entries are resolved against the URDF directory and
+    ``package://<name>/...`` URIs against the matching entry of *ros_package_paths*. Package URIs
+    without a known package are skipped.
+
+    Args:
+        urdf_path: Path to the URDF file.
+        ros_package_paths: ROS package ``{"name": ..., "path": ...}`` mappings.
+
+    Returns:
+        Absolute paths to the referenced mesh files, without duplicates. The files may not exist.
+    """
+    packages = {entry.get("name", ""): entry.get("path", "") for entry in ros_package_paths or []}
+    urdf_dir = os.path.dirname(os.path.abspath(urdf_path))
+    paths: dict[str, None] = {}
+    for mesh in ET.parse(urdf_path).getroot().iter("mesh"):
+        filename = mesh.get("filename")
+        if not filename:
+            continue
+        if filename.startswith("package://"):
+            package_name, _, relative_path = filename[len("package://") :].partition("/")
+            package_path = packages.get(package_name)
+            if not package_path:
+                continue
+            path = os.path.join(package_path, relative_path)
+        else:
+            path = filename[len("file://") :] if filename.startswith("file://") else filename
+            path = os.path.join(urdf_dir, path)
+        paths[os.path.normpath(os.path.abspath(path))] = None
+    return list(paths)
+
+
 def merge_fixed_joints(urdf_path: str, output_path: str) -> str:
     """Pre-process a URDF file to merge links connected by fixed joints.
 
@@ -738,6 +738,37 @@ class TestUrdf(omni.kit.test.AsyncTestCase):
         self._timeline.stop()
         self._success = True
 
+    async def test_urdf_batch_import_cache(self) -> None:
+        """Import several URDF files in a batch and reuse the outputs of unchanged files."""
+        source_dir = os.path.join(self._tmpdir, "sources")
+        shutil.copytree(os.path.join(self._extension_path, "data", "urdf", "tests"), source_dir)
+        urdf_paths = [os.path.join(source_dir, "test_basic.urdf"), os.path.join(source_dir, "test_mtl.urdf")]
+        output_dir = os.path.join(self._tmpdir, "batch")
+
+        results = self.importer.import_urdf_batch(urdf_paths, output_dir, max_workers=2)
+        self.assertEqual([r.source_path for r in results], [os.path.normpath(p) for p in urdf_paths])
+        for result in results:
+            self.assertTrue(result.succeeded, result.error)
+            self.assertFalse(result.cached)
+            self.assertTrue(os.path.isfile(result.output_path))
+            self.assertGreater(result.import_time, 0.0)
+        first_outputs = [r.output_path for r in results]
+
+        # Nothing changed: every output is reused
+        results = self.importer.import_urdf_batch(urdf_paths, output_dir, max_workers=2)
+        self.assertTrue(all(r.cached and r.succeeded for r in results))
+        self.assertEqual([r.output_path for r in results], first_outputs)
+
+        # Editing a referenced mesh invalidates only the file referencing it
+        with open(os.path.join(source_dir, "test_mtl", "test_mtl.obj"), "a") as f:
+            f.write("\n# edited\n")
+        results = self.importer.import_urdf_batch(urdf_paths, output_dir, max_workers=2)
+        self.assertTrue(results[0].cached)
+        self.assertFalse(results[1].cached)
+        self.assertTrue(results[1].succeeded, results[1].error)
+        self.assertNotEqual(results[1].output_path, first_outputs[1])
+        self._success = True
+
     # test negative joint limits
     async def test_urdf_limits(self) -> None:
         """Import URDF with negative joint limits and validate limit configuration."""
@@ -24,7 +24,7 @@ import xml.etree.ElementTree as ET
 
 import numpy as np
 import omni.kit.test
-from isaacsim.asset.importer.urdf.impl.urdf_utils import merge_fixed_joints
+from isaacsim.asset.importer.urdf.impl.urdf_utils import collect_mesh_dependencies, merge_fixed_joints
 
 
 def _write_urdf(content: str, tmp_dir: str, name: str = "input.urdf") -> str:
@@ -773,3 +773,36 @@ class TestUrdfUtils(omni.kit.test.AsyncTestCase):
         self.assertIn("continuous", types.values())
         self.assertNotIn("C", _link_names(root))
         self._success = True
+
+    # -- mesh dependencies ---------------------------------------------------
+
+    async def test_collect_mesh_dependencies(self) -> None:
+        """Relative, file and package mesh URIs should resolve to absolute paths without duplicates."""
+        urdf = textwrap.dedent("""\
+            <robot name="test">
+              <link name="base">
+                <visual><geometry><mesh filename="meshes/base.obj"/></geometry></visual>
+                <collision><geometry><mesh filename="meshes/base.obj"/></geometry></collision>
+              </link>
+              <link name="arm">
+                <visual><geometry><mesh filename="package://arm_description/meshes/arm.stl"/></geometry></visual>
+                <collision><geometry><mesh filename="package://unknown/meshes/arm.stl"/></geometry></collision>
+              </link>
+              <link name="tool">
+                <visual><geometry><mesh filename="file:///abs/tool.dae"/></geometry></visual>
+              </link>
+            </robot>
+        """)
+        inp = _write_urdf(urdf, self._tmpdir)
+        package_dir = os.path.join(self._tmpdir, "arm_pkg")
+        paths = collect_mesh_dependencies(inp, [{"name": "arm_description", "path": package_dir}])
+
+        self.assertEqual(
+            paths,
+            [
+                os.path.normpath(os.path.join(self._tmpdir, "meshes", "base.obj")),
+                os.path.normpath(os.path.join(package_dir, "meshes", "arm.stl")),
+                os.path.normpath(os.path.abspath("/abs/tool.dae")),
+            ],
+        )
+        self._success = True
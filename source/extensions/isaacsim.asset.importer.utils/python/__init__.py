@@ -26,15 +26,16 @@ The implementation submodules remain accessible via their original names::
     importer_utils.collision_from_visuals(...)
 """
 
-from .impl import asset_utils, importer_utils, merge_mesh_utils, physx_types, stage_utils
+from .impl import asset_utils, batch_utils, importer_utils, merge_mesh_utils, physx_types, stage_utils
 from .impl.asset_utils import *  # noqa: F401,F403
+from .impl.batch_utils import *  # noqa: F401,F403
 from .impl.importer_utils import *  # noqa: F401,F403
 from .impl.merge_mesh_utils import *  # noqa: F401,F403
 from .impl.physx_types import *  # noqa: F401,F403
 from .impl.stage_utils import *  # noqa: F401,F403
 
 # Submodule names re-exported for ``isaacsim.asset.importer.utils.<submodule>`` access.
-_SUBMODULES = ("asset_utils", "importer_utils", "merge_mesh_utils", "physx_types", "stage_utils")
+_SUBMODULES = ("asset_utils", "batch_utils", "importer_utils", "merge_mesh_utils", "physx_types", "stage_utils")
 
 # De-duplicated union of every submodule's ``__all__`` plus the submodule names themselves.
 __all__ = list(
@@ -42,6 +43,7 @@ __all__ = list(
         [
             *_SUBMODULES,
             *asset_utils.__all__,
+            *batch_utils.__all__,
             *importer_utils.__all__,
             *merge_mesh_utils.__all__,
             *physx_types.__all__,
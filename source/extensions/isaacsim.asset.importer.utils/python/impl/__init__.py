@@ -13,6 +13,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from . import asset_utils, importer_utils, merge_mesh_utils, physx_types, stage_utils
+from . import asset_utils, batch_utils, importer_utils, merge_mesh_utils, physx_types, stage_utils
 
-__all__ = ["asset_utils", "importer_utils", "merge_mesh_utils", "physx_types", "stage_utils"]
+__all__ = ["asset_utils", "batch_utils", "importer_utils", "merge_mesh_utils", "physx_types", "stage_utils"]
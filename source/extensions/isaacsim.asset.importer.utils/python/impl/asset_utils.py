@@ -24,6 +24,8 @@ from collections.abc import Callable
 
 from pxr import Sdf, Usd, UsdPhysics, Vt
 
+from .stage_utils import StagePrimIndex, StageSpecBatch, _iter_prims
+
 __all__ = [
     "apply_fix_base",
     "apply_floating_base",
@@ -109,7 +111,7 @@ def _detect_fixed_base(stage: Usd.Stage, root_link: Usd.Prim, joints: list[Usd.P
     return False
 
 
-def _find_articulation_root_link(stage: Usd.Stage) -> Usd.Prim | None:
+def _find_articulation_root_link(stage: Usd.Stage, prim_index: StagePrimIndex | None = None) -> Usd.Prim | None:
     """Find the root rigid-body link of the articulation.
 
     The root is the rigid body that is never the child (``body1``) of a
@@ -117,20 +119,25 @@ def _find_articulation_root_link(stage: Usd.Stage) -> Usd.Prim | None:
 
     Args:
         stage: The USD stage to inspect.
+        prim_index: Shared index of the stage prims. Defaults to traversing the stage.
 
     Returns:
         The articulation root prim, or ``None`` if no rigid body exists.
     """
-    rigid_bodies: list[Usd.Prim] = [p for p in stage.Traverse() if p.HasAPI(UsdPhysics.RigidBodyAPI)]
+    rigid_bodies: list[Usd.Prim] = []
+    joints: list[Usd.Prim] = []
+    for prim in _iter_prims(stage, prim_index):
+        if prim.HasAPI(UsdPhysics.RigidBodyAPI):
+            rigid_bodies.append(prim)
+        elif prim.IsA(UsdPhysics.Joint) and not prim.IsA(UsdPhysics.FixedJoint):
+            joints.append(prim)
     if not rigid_bodies:
         return None
 
     rigid_body_paths = {str(p.GetPath()) for p in rigid_bodies}
 
     child_paths: set[str] = set()
-    for prim in stage.Traverse():
-        if not prim.IsA(UsdPhysics.Joint) or prim.IsA(UsdPhysics.FixedJoint):
-            continue
+    for prim in joints:
         body0 = _get_joint_body(prim, 0)
         body1 = _get_joint_body(prim, 1)
         if body0 and body1 and str(body0) in rigid_body_paths and str(body1) in rigid_body_paths:
@@ -152,25 +159,27 @@ def _find_articulation_root_link(stage: Usd.Stage) -> Usd.Prim | None:
     return candidates[0]
 
 
-def apply_fix_base(stage: Usd.Stage) -> None:
+def apply_fix_base(stage: Usd.Stage, *, prim_index: StagePrimIndex | None = None) -> None:
     """Add a fixed joint from the world to the articulation root link.
 
     Also relocates any ``ArticulationRootAPI`` off the root rigid body.
 
     Args:
         stage: The USD stage to modify.
+        prim_index: Shared index of the stage prims, kept up to date with the prims this function
+            defines. Defaults to traversing the stage.
     """
     default_prim = stage.GetDefaultPrim()
     if not default_prim or not default_prim.IsValid():
         _logger.warning("Cannot apply fix_base - no default prim found.")
         return
 
-    root_link = _find_articulation_root_link(stage)
+    root_link = _find_articulation_root_link(stage, prim_index)
     if root_link is None:
         _logger.warning("Cannot apply fix_base - no rigid body link found.")
         return
 
-    joints = [prim for prim in stage.Traverse() if prim.IsA(UsdPhysics.Joint)]
+    joints = [prim for prim in _iter_prims(stage, prim_index) if prim.IsA(UsdPhysics.Joint)]
 
     if _detect_fixed_base(stage, root_link, joints):
         _logger.info("Fixed base already present on %s - skipping fix_base.", root_link.GetPath())
@@ -179,15 +188,17 @@ def apply_fix_base(stage: Usd.Stage) -> None:
         joint_path = default_prim.GetPath().AppendChild("fix_base_joint")
         fixed_joint = UsdPhysics.FixedJoint.Define(stage, joint_path)
         fixed_joint.CreateBody1Rel().SetTargets([root_link.GetPath()])
+        if prim_index is not None:
+            prim_index.add(fixed_joint.GetPrim())
 
     # PhysX requires ArticulationRootAPI on the parent of the root rigid body
     # for proper reduced-coordinate fixed-base articulations.
-    relocated = fix_articulation_root_for_fixed_base(stage)
+    relocated = fix_articulation_root_for_fixed_base(stage, prim_index=prim_index)
     if relocated:
         _logger.info("Relocated ArticulationRootAPI on %d rigid body(ies).", relocated)
 
 
-def apply_floating_base(stage: Usd.Stage) -> None:
+def apply_floating_base(stage: Usd.Stage, *, prim_index: StagePrimIndex | None = None) -> None:
     """Remove any fixed joint anchoring the articulation root link to the world.
 
     The inverse of :func:`apply_fix_base`. Drops every ``FixedJoint`` whose
@@ -197,8 +208,9 @@ def apply_floating_base(stage: Usd.Stage) -> None:
 
     Args:
         stage: The USD stage to modify.
+        prim_index: Shared index of the stage prims. Defaults to traversing the stage.
     """
-    root_link = _find_articulation_root_link(stage)
+    root_link = _find_articulation_root_link(stage, prim_index)
     if root_link is None:
         _logger.warning("Cannot apply floating_base - no rigid body link found.")
         return
@@ -206,7 +218,7 @@ def apply_floating_base(stage: Usd.Stage) -> None:
     root_path = str(root_link.GetPath())
     joints_to_remove: list[Sdf.Path] = []
 
-    for joint in [p for p in stage.Traverse() if p.IsA(UsdPhysics.FixedJoint)]:
+    for joint in [p for p in _iter_prims(stage, prim_index) if p.IsA(UsdPhysics.FixedJoint)]:
         body0 = _get_joint_body(joint, 0)
         body1 = _get_joint_body(joint, 1)
 
@@ -232,7 +244,7 @@ def apply_floating_base(stage: Usd.Stage) -> None:
         _logger.info("No world-anchoring fixed joint found on %s - already floating-base.", root_path)
 
 
-def fix_articulation_root_for_fixed_base(stage: Usd.Stage) -> int:
+def fix_articulation_root_for_fixed_base(stage: Usd.Stage, *, prim_index: StagePrimIndex | None = None) -> int:
     """Move ArticulationRootAPI from rigid bodies to their parent prims.
 
     After the asset transformer, ArticulationRootAPI ends up on the root rigid
@@ -245,13 +257,14 @@ def fix_articulation_root_for_fixed_base(stage: Usd.Stage) -> int:
 
     Args:
         stage: The USD stage to modify.
+        prim_index: Shared index of the stage prims. Defaults to traversing the stage.
 
     Returns:
         Number of articulation roots that were relocated.
     """
     root_body_prims = [
         prim
-        for prim in stage.Traverse()
+        for prim in _iter_prims(stage, prim_index)
         if prim.HasAPI(UsdPhysics.ArticulationRootAPI) and prim.HasAPI(UsdPhysics.RigidBodyAPI)
     ]
 
@@ -345,39 +358,41 @@ def _remove_articulation_schemas(prim: Usd.Prim, api_names: list[str]) -> None:
             prim.RemoveAppliedSchema(name)
 
 
-def apply_link_density(stage: Usd.Stage, density: float) -> None:
+def apply_link_density(stage: Usd.Stage, density: float, *, prim_index: StagePrimIndex | None = None) -> None:
     """Set default density on rigid body links that have no explicit mass.
 
+    The links are found in a single pass and the mass schemas and densities are authored in one change block.
+
     Args:
         stage: The USD stage to modify.
         density: The density value in kg/m^3.
+        prim_index: Shared index of the stage prims. Defaults to traversing the stage.
     """
-    for prim in stage.Traverse():
+    batch = StageSpecBatch(stage)
+    for prim in _iter_prims(stage, prim_index):
         if not (prim.HasAPI(UsdPhysics.RigidBodyAPI) or prim.HasAPI("PhysicsRigidBodyAPI")):
             continue
         if not prim.HasAPI(UsdPhysics.MassAPI):
-            UsdPhysics.MassAPI.Apply(prim)
-        mass_api = UsdPhysics.MassAPI(prim)
-        mass_attr = mass_api.GetMassAttr()
+            batch.apply_api_schema(prim.GetPath(), "PhysicsMassAPI")
+        mass_attr = prim.GetAttribute("physics:mass")
         if mass_attr and mass_attr.HasValue() and mass_attr.Get() > 0.0:
             continue
-        density_attr = mass_api.GetDensityAttr()
-        if not density_attr:
-            density_attr = mass_api.CreateDensityAttr()
-        density_attr.Set(density)
+        batch.set_attribute(prim.GetPath(), "physics:density", Sdf.ValueTypeNames.Float, density)
+    batch.commit()
 
 
-def _collect_joints(stage: Usd.Stage) -> dict[str, tuple]:
+def _collect_joints(stage: Usd.Stage, prim_index: StagePrimIndex | None = None) -> dict[str, tuple]:
     """Collect all revolute/prismatic joints from *stage*.
 
     Args:
         stage: The USD stage to traverse for joint prims.
+        prim_index: Shared index of the stage prims. Defaults to traversing the stage.
 
     Returns:
         Mapping of joint name to ``(prim, is_revolute, instance_name)``.
     """
     joints: dict[str, tuple] = {}
-    for prim in stage.Traverse():
+    for prim in _iter_prims(stage, prim_index):
         if not (prim.IsA(UsdPhysics.RevoluteJoint) or prim.IsA(UsdPhysics.PrismaticJoint)):
             continue
         is_revolute = prim.IsA(UsdPhysics.RevoluteJoint)
@@ -392,11 +407,15 @@ def apply_joint_drives(
     target_type: str | dict[str, str] | None = None,
     stiffness: float | dict[str, float] | None = None,
     damping: float | dict[str, float] | None = None,
+    *,
+    prim_index: StagePrimIndex | None = None,
 ) -> None:
     """Set joint drive properties (type, target, gains) on USD joints.
 
     Each parameter accepts either a single value (applied to all joints) or a
-    ``dict`` mapping regex patterns to per-joint values.
+    ``dict`` mapping regex patterns to per-joint values. Every pattern is compiled
+    and matched against the joint names once, and all drive attributes are authored
+    in one change block.
 
     Args:
         stage: The USD stage to modify.
@@ -409,45 +428,58 @@ def apply_joint_drives(
             Nm/deg convention internally.
         damping: Damping in Nm*s/rad (revolute) or N*s/m (prismatic), or a
             dict of patterns.  Same unit conversion as *stiffness*.
+        prim_index: Shared index of the stage prims. Defaults to traversing the stage.
     """
-    joints = _collect_joints(stage)
+    joints = _collect_joints(stage, prim_index)
     if not joints:
         return
 
+    # Patterns are validated before anything is authored, and later settings override earlier ones
+    batch = StageSpecBatch(stage)
+    matcher = _JointNameMatcher(joints)
     if drive_type is not None:
-        _set_drive_type_on_joints(joints, drive_type)
+        _set_drive_type_on_joints(joints, drive_type, batch, matcher)
     if target_type is not None:
-        _set_target_type_on_joints(joints, target_type)
+        _set_target_type_on_joints(joints, target_type, batch, matcher)
     if stiffness is not None:
-        _set_stiffness_on_joints(joints, stiffness)
+        _set_stiffness_on_joints(joints, stiffness, batch, matcher)
     if damping is not None:
-        _set_damping_on_joints(joints, damping)
+        _set_damping_on_joints(joints, damping, batch, matcher)
+    batch.commit()
 
 
 def _set_drive_type_on_joints(
     joints: dict[str, tuple],
     drive_type: str | dict[str, str],
+    batch: StageSpecBatch,
+    matcher: _JointNameMatcher,
 ) -> None:
     """Set the drive type (force or acceleration) on joint prims.
 
     Args:
         joints: Mapping of joint name to ``(prim, is_revolute, instance_name)``.
         drive_type: A single type string or a dict of regex-pattern to type.
+        batch: Batch the attribute edits are queued on.
+        matcher: Joint name matcher shared by the drive settings.
     """
 
     def _apply(prim: Usd.Prim, instance_name: str, value: str) -> None:
-        drive = UsdPhysics.DriveAPI.Get(prim, instance_name)
-        type_attr = drive.GetTypeAttr()
-        if not type_attr:
-            type_attr = drive.CreateTypeAttr()
-        type_attr.Set(value)
+        batch.set_attribute(
+            prim.GetPath(),
+            f"drive:{instance_name}:physics:type",
+            Sdf.ValueTypeNames.Token,
+            value,
+            Sdf.VariabilityUniform,
+        )
 
-    _apply_to_joints(joints, drive_type, _apply)
+    _apply_to_joints(joints, drive_type, _apply, matcher=matcher)
 
 
 def _set_target_type_on_joints(
     joints: dict[str, tuple],
     target_type: str | dict[str, str],
+    batch: StageSpecBatch,
+    matcher: _JointNameMatcher,
 ) -> None:
     """Set the target type (none, effort, position, velocity) on joint prims.
 
@@ -457,32 +489,26 @@ def _set_target_type_on_joints(
     Args:
         joints: Mapping of joint name to ``(prim, is_revolute, instance_name)``.
         target_type: A single type string or a dict of regex-pattern to type.
+        batch: Batch the attribute edits are queued on.
+        matcher: Joint name matcher shared by the drive settings.
     """
 
     def _apply(prim: Usd.Prim, instance_name: str, value: str) -> None:
-        drive = UsdPhysics.DriveAPI.Get(prim, instance_name)
-        if value == "none" or value == "effort":
-            if drive.GetStiffnessAttr():
-                drive.GetStiffnessAttr().Set(0.0)
-            else:
-                drive.CreateStiffnessAttr().Set(0.0)
-            if drive.GetDampingAttr():
-                drive.GetDampingAttr().Set(0.0)
-            else:
-                drive.CreateDampingAttr().Set(0.0)
-
-        elif value == "velocity":
-            if drive.GetStiffnessAttr():
-                drive.GetStiffnessAttr().Set(0.0)
-            else:
-                drive.CreateStiffnessAttr().Set(0.0)
-
-    _apply_to_joints(joints, target_type, _apply)
+        if value in ("none", "effort", "velocity"):
+            batch.set_attribute(
+                prim.GetPath(), f"drive:{instance_name}:physics:stiffness", Sdf.ValueTypeNames.Float, 0.0
+            )
+        if value in ("none", "effort"):
+            batch.set_attribute(prim.GetPath(), f"drive:{instance_name}:physics:damping", Sdf.ValueTypeNames.Float, 0.0)
+
+    _apply_to_joints(joints, target_type, _apply, matcher=matcher)
 
 
 def _set_stiffness_on_joints(
     joints: dict[str, tuple],
     stiffness: float | dict[str, float],
+    batch: StageSpecBatch,
+    matcher: _JointNameMatcher,
 ) -> None:
     """Set stiffness on joint drive APIs.
 
@@ -491,22 +517,24 @@ def _set_stiffness_on_joints(
     Args:
         joints: Mapping of joint name to ``(prim, is_revolute, instance_name)``.
         stiffness: A single value or a dict of regex-pattern to value.
+        batch: Batch the attribute edits are queued on.
+        matcher: Joint name matcher shared by the drive settings.
     """
 
     def _apply(prim: Usd.Prim, instance_name: str, value: float, *, is_revolute: bool = False) -> None:
-        drive = UsdPhysics.DriveAPI.Get(prim, instance_name)
         usd_value = value * math.pi / 180.0 if is_revolute else value
-        attr = drive.GetStiffnessAttr()
-        if not attr:
-            attr = drive.CreateStiffnessAttr()
-        attr.Set(usd_value)
+        batch.set_attribute(
+            prim.GetPath(), f"drive:{instance_name}:physics:stiffness", Sdf.ValueTypeNames.Float, usd_value
+        )
 
-    _apply_to_joints(joints, stiffness, _apply, pass_is_revolute=True)
+    _apply_to_joints(joints, stiffness, _apply, pass_is_revolute=True, matcher=matcher)
 
 
 def _set_damping_on_joints(
     joints: dict[str, tuple],
     damping: float | dict[str, float],
+    batch: StageSpecBatch,
+    matcher: _JointNameMatcher,
 ) -> None:
     """Set damping on joint drive APIs.
 
@@ -515,17 +543,17 @@ def _set_damping_on_joints(
     Args:
         joints: Mapping of joint name to ``(prim, is_revolute, instance_name)``.
         damping: A single value or a dict of regex-pattern to value.
+        batch: Batch the attribute edits are queued on.
+        matcher: Joint name matcher shared by the drive settings.
     """
 
     def _apply(prim: Usd.Prim, instance_name: str, value: float, *, is_revolute: bool = False) -> None:
-        drive = UsdPhysics.DriveAPI.Get(prim, instance_name)
         usd_value = value * math.pi / 180.0 if is_revolute else value
-        attr = drive.GetDampingAttr()
-        if not attr:
-            attr = drive.CreateDampingAttr()
-        attr.Set(usd_value)
+        batch.set_attribute(
+            prim.GetPath(), f"drive:{instance_name}:physics:damping", Sdf.ValueTypeNames.Float, usd_value
+        )
 
-    _apply_to_joints(joints, damping, _apply, pass_is_revolute=True)
+    _apply_to_joints(joints, damping, _apply, pass_is_revolute=True, matcher=matcher)
 
 
 def apply_mjc_actuator_gains(
@@ -610,12 +638,45 @@ def _set_or_create_string(prim: Usd.Prim, name: str, value: str) -> None:
     attr.Set(value)
 
 
+class _JointNameMatcher:
+    """Match joint-name regex patterns against the joints, compiling and matching each pattern once.
+
+    Args:
+        joints: Mapping of joint name to ``(prim, is_revolute, instance_name)``.
+    """
+
+    def __init__(self, joints: dict[str, tuple]) -> None:
+        self._names = list(joints)
+        self._matches: dict[str, list[str]] = {}
+
+    def match(self, pattern: str) -> list[str]:
+        """Get the joint names matching a pattern, in joint order.
+
+        Args:
+            pattern: Regex searched in each joint name.
+
+        Returns:
+            The matching joint names.
+
+        Raises:
+            ValueError: If the pattern matches no joint.
+        """
+        matches = self._matches.get(pattern)
+        if matches is None:
+            search = re.compile(pattern).search
+            matches = self._matches[pattern] = [name for name in self._names if search(name)]
+        if not matches:
+            raise ValueError(f"Joint name pattern '{pattern}' matched no joints. Available joints: {self._names}")
+        return matches
+
+
 def _apply_to_joints(
     joints: dict[str, tuple],
     spec: object,
     fn: Callable[..., None],
     *,
     pass_is_revolute: bool = False,
+    matcher: _JointNameMatcher | None = None,
 ) -> None:
     """Dispatch *fn* across joints for a scalar or pattern-dict *spec*.
 
@@ -626,15 +687,13 @@ def _apply_to_joints(
         fn: Callable ``(prim, instance_name, value, **kw)`` to invoke.
         pass_is_revolute: If ``True``, forward ``is_revolute`` as a keyword
             argument to *fn*.
+        matcher: Matcher caching the pattern matches across calls. Defaults to a new one.
     """
     if isinstance(spec, dict):
+        if matcher is None:
+            matcher = _JointNameMatcher(joints)
         for pattern, value in spec.items():
-            matches = [n for n in joints if re.search(pattern, n)]
-            if not matches:
-                raise ValueError(
-                    f"Joint name pattern '{pattern}' matched no joints." f" Available joints: {list(joints.keys())}"
-                )
-            for name in matches:
+            for name in matcher.match(pattern):
                 prim, is_rev, inst = joints[name]
                 kw = {"is_revolute": is_rev} if pass_is_revolute else {}
                 fn(prim, inst, value, **kw)
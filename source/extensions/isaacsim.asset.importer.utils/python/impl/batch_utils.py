@@ -0,0 +1,275 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Batch import helpers: content hashing, output caching and parallel conversion of source asset files."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+__all__ = [
+    "IMPORT_CACHE_VERSION",
+    "IMPORT_MANIFEST_NAME",
+    "BatchImportResult",
+    "compute_import_hash",
+    "run_batch_import",
+]
+
+_logger = logging.getLogger(__name__)
+
+# Bump to invalidate all cached import outputs (e.g. when the post-processing pipeline changes).
+IMPORT_CACHE_VERSION = 1
+
+# Name of the file written next to a successful import output, marking it as a reusable cache entry.
+IMPORT_MANIFEST_NAME = "import_manifest.json"
+
+_READ_CHUNK_SIZE = 1 << 20
+
+
+@dataclass
+class BatchImportResult:
+    """Outcome of importing one source file in a batch.
+
+    Args:
+        source_path: Path to the source (URDF/MJCF) file.
+        output_path: Path to the generated USD file, or ``None`` if the import failed.
+        content_hash: Hash of the source file, its dependencies and the import configuration.
+        cached: Whether the output of a previous import with the same hash was reused.
+        hash_time: Time spent hashing the source file and its dependencies, in seconds.
+        import_time: Time spent converting the source file, in seconds. Zero for cached results.
+        error: Error message if the import failed, else ``None``.
+    """
+
+    source_path: str
+    output_path: str | None = None
+    content_hash: str = ""
+    cached: bool = False
+    hash_time: float = 0.0
+    import_time: float = 0.0
+    error: str | None = None
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the source file was imported (or found in the cache) successfully."""
+        return self.error is None and self.output_path is not None
+
+
+def _update_with_file(digest: Any, path: str) -> None:
+    """Feed the contents of a file into a hash, or a marker if the file cannot be read.
+
+    Args:
+        digest: Hash object to update.
+        path: Path to the file.
+    """
+    try:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(_READ_CHUNK_SIZE), b""):
+                digest.update(chunk)
+    except OSError:
+        digest.update(b"<missing>")
+
+
+def compute_import_hash(source_path: str, dependency_paths: Iterable[str], config: dict[str, Any]) -> str:
+    """Hash everything an import result depends on.
+
+    The hash covers the contents of the source file and of its dependencies (e.g. referenced meshes),
+    the dependency paths relative to the source file directory, the import configuration and
+    :data:`IMPORT_CACHE_VERSION`. Missing dependencies are hashed as such, so the hash changes once
+    they are added.
+
+    Args:
+        source_path: Path to the source file.
+        dependency_paths: Paths to the files referenced by the source file.
+        config: JSON-serializable import settings. Settings that do not affect the output (e.g. the
+            source and output paths) should be left out so that the hash stays stable.
+
+    Returns:
+        Hexadecimal SHA-256 digest.
+
+    Example:
+
+    .. code-block:: python
+
+        >>> from isaacsim.asset.importer.utils import compute_import_hash
+        >>>
+        >>> compute_import_hash("/tmp/robot.urdf", [], {"merge_mesh": False})  # doctest: +NO_CHECK
+        '5d1c...'
+    """
+    digest = hashlib.sha256()
+    digest.update(f"version:{IMPORT_CACHE_VERSION}\n".encode())
+    digest.update(f"config:{json.dumps(config, sort_keys=True, default=str)}\n".encode())
+    digest.update(b"source:")
+    _update_with_file(digest, source_path)
+    source_dir = os.path.dirname(os.path.abspath(source_path))
+    for path in sorted({os.path.normpath(os.path.abspath(p)) for p in dependency_paths}):
+        digest.update(f"\ndependency:{os.path.relpath(path, source_dir)}:".encode())
+        _update_with_file(digest, path)
+    return digest.hexdigest()
+
+
+def _read_cached_output(output_dir: str, content_hash: str) -> str | None:
+    """Get the output of a previous import from its manifest.
+
+    Args:
+        output_dir: Output directory of the import.
+        content_hash: Expected content hash.
+
+    Returns:
+        Path to the cached USD file, or ``None`` if there is no complete import with this hash.
+    """
+    manifest_path = os.path.join(output_dir, IMPORT_MANIFEST_NAME)
+    try:
+        with open(manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest.get("content_hash") != content_hash:
+        return None
+    output_path = os.path.normpath(os.path.join(output_dir, manifest.get("output_path", "")))
+    return output_path if os.path.isfile(output_path) else None
+
+
+def _write_manifest(output_dir: str, source_path: str, content_hash: str, output_path: str) -> None:
+    """Mark a finished import as a reusable cache entry.
+
+    Args:
+        output_dir: Output directory of the import.
+        source_path: Path to the source file.
+        content_hash: Content hash of the import.
+        output_path: Path to the generated USD file.
+    """
+    manifest = {
+        "content_hash": content_hash,
+        "source_path": os.path.abspath(source_path),
+        "output_path": os.path.relpath(output_path, output_dir),
+    }
+    with open(os.path.join(output_dir, IMPORT_MANIFEST_NAME), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+
+
+def run_batch_import(
+    source_paths: list[str],
+    import_fn: Callable[[str, str], str],
+    output_root: str,
+    *,
+    dependency_fn: Callable[[str], list[str]] | None = None,
+    config: dict[str, Any] | None = None,
+    max_workers: int | None = None,
+    use_cache: bool = True,
+) -> list[BatchImportResult]:
+    """Import many source files, hashing them in a worker pool and reusing outputs whose inputs did not change.
+
+    Every source file is imported into its own directory ``<output_root>/<file stem>_<hash prefix>``, where
+    the hash is computed by :func:`compute_import_hash`. When that directory already holds a complete import
+    with the same hash, the import is skipped and the previous output is returned. Source files with identical
+    hashes within a batch are imported once. Failures are reported per file and do not stop the batch.
+
+    Hashing and cache lookups only read files and run in a thread pool. The imports themselves run one after
+    another on the calling thread, since the converters and the asset transformer that ``import_fn`` typically
+    runs (stage opening, USD edits, garbage collection) are not known to be thread-safe.
+
+    Args:
+        source_paths: Paths to the source files.
+        import_fn: Callable ``(source_path, output_dir) -> usd_path`` that imports one file into a directory.
+        output_root: Directory holding the per-file output directories.
+        dependency_fn: Callable returning the files referenced by a source file (e.g. meshes). Defaults to no
+            dependencies.
+        config: JSON-serializable import settings included in the hash. Defaults to no settings.
+        max_workers: Maximum number of threads hashing source files and looking up cached outputs. Defaults to
+            the ``ThreadPoolExecutor`` default.
+        use_cache: If False, every file is imported again and existing outputs are replaced.
+
+    Returns:
+        One result per source file, in the order of *source_paths*.
+
+    Raises:
+        ValueError: If *max_workers* is not positive.
+    """
+    if max_workers is not None and max_workers < 1:
+        raise ValueError(f"max_workers must be positive, got {max_workers}")
+    config = config or {}
+    source_paths = [os.path.normpath(os.path.abspath(path)) for path in source_paths]
+    results = [BatchImportResult(source_path=path) for path in source_paths]
+    if not results:
+        return results
+
+    def _hash(result: BatchImportResult) -> None:
+        start = time.perf_counter()
+        try:
+            dependencies = dependency_fn(result.source_path) if dependency_fn is not None else []
+            result.content_hash = compute_import_hash(result.source_path, dependencies, config)
+        except Exception as exc:
+            result.error = f"Failed to hash {result.source_path}: {exc}"
+        result.hash_time = time.perf_counter() - start
+
+    def _output_dir(result: BatchImportResult) -> str:
+        stem = os.path.splitext(os.path.basename(result.source_path))[0]
+        return os.path.join(output_root, f"{stem}_{result.content_hash[:16]}")
+
+    def _lookup(group: list[BatchImportResult]) -> str | None:
+        result = group[0]
+        return _read_cached_output(_output_dir(result), result.content_hash) if use_cache else None
+
+    def _import(group: list[BatchImportResult], output_path: str | None) -> None:
+        result = group[0]
+        output_dir = _output_dir(result)
+        if output_path is not None:
+            cached = True
+        else:
+            cached = False
+            # Drop incomplete or outdated outputs so the importer does not write next to them
+            shutil.rmtree(output_dir, ignore_errors=True)
+            os.makedirs(output_dir, exist_ok=True)
+            start = time.perf_counter()
+            try:
+                output_path = import_fn(result.source_path, output_dir)
+                _write_manifest(output_dir, result.source_path, result.content_hash, output_path)
+            except Exception as exc:
+                _logger.warning(f"Failed to import {result.source_path}: {exc}")
+                result.error = str(exc)
+            result.import_time = time.perf_counter() - start
+        for duplicate in group:
+            duplicate.cached = cached or duplicate is not result
+            duplicate.output_path = output_path if result.error is None else None
+            duplicate.error = result.error
+            if duplicate is not result:
+                duplicate.import_time = 0.0
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(_hash, results))
+
+        groups: dict[tuple[str, str], list[BatchImportResult]] = {}
+        for result in results:
+            if result.error is None:
+                stem = os.path.splitext(os.path.basename(result.source_path))[0]
+                groups.setdefault((stem, result.content_hash), []).append(result)
+        cached_outputs = list(executor.map(_lookup, groups.values()))
+
+    for group, output_path in zip(groups.values(), cached_outputs):
+        _import(group, output_path)
+
+    num_cached = sum(result.cached for result in results)
+    num_failed = sum(not result.succeeded for result in results)
+    _logger.info(f"Batch import of {len(results)} file(s): {num_cached} cached, {num_failed} failed")
+    return results
@@ -24,6 +24,7 @@ import os
 from pxr import Sdf, Usd, UsdGeom, UsdPhysics
 
 from .physx_types import PhysxAttr, PhysxMimicAttr, PhysxMimicRel, PhysxSchema
+from .stage_utils import StagePrimIndex, StageSpecBatch, _iter_prims
 
 __all__ = [
     "PhysxAttr",
@@ -178,12 +179,16 @@ PHYSICS_AXIS_MAP = {
 }
 
 
-def collision_from_visuals(stage: Usd.Stage, collision_type: str) -> int:
+def collision_from_visuals(stage: Usd.Stage, collision_type: str, *, prim_index: StagePrimIndex | None = None) -> int:
     """Apply collisions from visual geometry and remove guide colliders.
 
+    The stage is read in a single pass over its geometry prims and the schemas and attributes are authored on
+    the edit target in one change block.
+
     Args:
         stage: USD stage for authoring collision APIs.
         collision_type: Collision approximation label. Defaults to convex hull when unknown.
+        prim_index: Shared index of the stage prims. Defaults to traversing the stage.
 
     Returns:
         Number of visual geometry prims processed.
@@ -200,75 +205,67 @@ def collision_from_visuals(stage: Usd.Stage, collision_type: str) -> int:
         >>> stage_utils.use_stage(stage)
         >>> collision_from_visuals(stage, "Convex Hull")  # doctest: +SKIP
     """
-    removed_colliders: list[Sdf.Path] = []
+    approx_type = MESH_APPROXIMATION_MAP.get(collision_type, UsdPhysics.Tokens.convexHull)
+    batch = StageSpecBatch(stage)
     removed_count = 0
     processed_count = 0
 
-    for prim in stage.Traverse():
+    for prim in _iter_prims(stage, prim_index):
+        # Only geometry prims are turned into colliders or removed as guide colliders
         prim_type = prim.GetTypeName()
-        prim_path = prim.GetPath().pathString
+        if prim_type not in USD_GEOMETRY_TYPES:
+            continue
+        prim_path = prim.GetPath()
         try:
-            if prim.HasAPI(UsdPhysics.CollisionAPI):
-                if prim_type in USD_GEOMETRY_TYPES:
-                    imageable = UsdGeom.Imageable(prim)
-                    purpose = imageable.GetPurposeAttr().Get()
-                    if purpose == UsdGeom.Tokens.guide:
-                        removed_colliders.append(prim.GetPath())
-                        continue
-
-            if prim_type not in USD_GEOMETRY_TYPES:
+            has_collision = prim.HasAPI(UsdPhysics.CollisionAPI)
+            purpose = UsdGeom.Imageable(prim).GetPurposeAttr().Get()
+            if has_collision and purpose == UsdGeom.Tokens.guide:
+                batch.remove_prim(prim_path)
+                removed_count += 1
                 continue
-
-            imageable = UsdGeom.Imageable(prim)
-            purpose = imageable.GetPurposeAttr().Get()
             if purpose not in (UsdGeom.Tokens.default_, UsdGeom.Tokens.render):
                 continue
 
-            if prim.HasAPI(UsdPhysics.CollisionAPI):
-                collision_api = UsdPhysics.CollisionAPI(prim)
-                collision_enabled_attr = collision_api.GetCollisionEnabledAttr()
-                if not collision_enabled_attr:
-                    collision_enabled_attr = collision_api.CreateCollisionEnabledAttr()
-                collision_enabled_attr.Set(True)
+            if has_collision:
+                batch.set_attribute(prim_path, "physics:collisionEnabled", Sdf.ValueTypeNames.Bool, True)
             else:
-                UsdPhysics.CollisionAPI.Apply(prim)
+                batch.apply_api_schema(prim_path, "PhysicsCollisionAPI")
 
             if prim_type == "Mesh":
                 if not prim.HasAPI(UsdPhysics.MeshCollisionAPI):
-                    mesh_collision_api = UsdPhysics.MeshCollisionAPI.Apply(prim)
-                else:
-                    mesh_collision_api = UsdPhysics.MeshCollisionAPI(prim)
-
-                approx_type = MESH_APPROXIMATION_MAP.get(collision_type, UsdPhysics.Tokens.convexHull)
-                mesh_collision_api.GetApproximationAttr().Set(approx_type)
+                    batch.apply_api_schema(prim_path, "PhysicsMeshCollisionAPI")
+                batch.set_attribute(
+                    prim_path, "physics:approximation", Sdf.ValueTypeNames.Token, approx_type, Sdf.VariabilityUniform
+                )
 
             processed_count += 1
         except Exception as exc:
             _logger.error(f"Error processing prim {prim_path}: {exc}")
             continue
 
-    for prim_path in removed_colliders:
-        stage.RemovePrim(prim_path)
-        removed_count += 1
+    batch.commit()
 
     _logger.info(f"Removed {removed_count} guide collision geometries")
     _logger.info(f"Processed collision for {processed_count} visual geometries")
     return processed_count
 
 
-def enable_self_collision(usd_stage: Usd.Stage, enabled: bool = True) -> int:
+def enable_self_collision(
+    usd_stage: Usd.Stage, enabled: bool = True, *, prim_index: StagePrimIndex | None = None
+) -> int:
     """Enable self-collisions on articulation roots.
 
     Args:
         usd_stage: USD stage for authoring articulation attributes.
         enabled: Whether to enable self collisions on articulation roots.
+        prim_index: Shared index of the stage prims. Defaults to traversing the stage.
 
     Returns:
         Number of articulation roots updated.
     """
     articulation_roots = [
         prim
-        for prim in usd_stage.Traverse()
+        for prim in _iter_prims(usd_stage, prim_index)
         if prim.HasAPI(UsdPhysics.ArticulationRootAPI)
         or prim.HasAPI("PhysicsArticulationRootAPI")
         or prim.HasAPI("NewtonArticulationRootAPI")
@@ -388,14 +385,15 @@ def delete_scope(stage: Usd.Stage, prim_path: str) -> None:
     stage.RemovePrim(Sdf.Path(prim_path))
 
 
-def add_joint_schemas(stage: Usd.Stage) -> None:
+def add_joint_schemas(stage: Usd.Stage, *, prim_index: StagePrimIndex | None = None) -> None:
     """Apply joint-related physics schemas to all joint prims.
 
     Args:
         stage: USD stage to update with joint schemas.
+        prim_index: Shared index of the stage prims. Defaults to traversing the stage.
 
     """
-    for prim in stage.Traverse():
+    for prim in _iter_prims(stage, prim_index):
         if not (prim.IsA(UsdPhysics.RevoluteJoint) or prim.IsA(UsdPhysics.PrismaticJoint)):
             continue
 
@@ -15,12 +15,16 @@
 
 """Stage helpers for asset importer utilities."""
 
-from pxr import Usd, UsdUtils
+from __future__ import annotations
+
+from pxr import Sdf, Usd, UsdUtils
 
 __all__ = [
     "save_stage",
     "open_stage",
     "get_stage_id",
+    "StagePrimIndex",
+    "StageSpecBatch",
 ]
 
 
@@ -123,3 +127,258 @@ def get_stage_id(stage: Usd.Stage) -> int:
     if stage_id < 0:
         stage_id = stage_cache.Insert(stage).ToLongInt()
     return stage_id
+
+
+class StagePrimIndex:
+    """Prim lookup tables for a stage built from a single traversal.
+
+    Post-import steps share one index instead of each running ``stage.Traverse()``, and name lookups are
+    constant time instead of a full traversal per query. Removed prims are skipped on access. Prims defined
+    after the index was built must be registered with :meth:`add`, or the index rebuilt with :meth:`rebuild`
+    after bulk structural edits (e.g. reparenting or merging meshes).
+
+    Args:
+        stage: USD stage to index.
+
+    Example:
+
+    .. code-block:: python
+
+        >>> from pxr import Usd, UsdGeom
+        >>> import isaacsim.asset.importer.utils.stage_utils as stage_utils
+        >>>
+        >>> stage = Usd.Stage.CreateInMemory()
+        >>> _ = UsdGeom.Xform.Define(stage, "/Robot/base_link")
+        >>> prim_index = stage_utils.StagePrimIndex(stage)
+        >>> prim_index.find_by_name("base_link").GetPath()
+        Sdf.Path('/Robot/base_link')
+    """
+
+    def __init__(self, stage: Usd.Stage) -> None:
+        self._stage = stage
+        self._prims: list[Usd.Prim] = []
+        self._by_name: dict[str, list[Usd.Prim]] = {}
+        self._by_path: dict[str, Usd.Prim] = {}
+        self.rebuild()
+
+    @property
+    def stage(self) -> Usd.Stage:
+        """The indexed stage."""
+        return self._stage
+
+    def rebuild(self) -> None:
+        """Re-index the stage with a single traversal."""
+        self._prims = []
+        self._by_name = {}
+        self._by_path = {}
+        for prim in self._stage.Traverse():
+            self._insert(prim)
+
+    def add(self, prim: Usd.Prim) -> None:
+        """Register a newly defined prim and its descendants.
+
+        Prims that are already indexed are skipped.
+
+        Args:
+            prim: Prim defined after the index was built.
+        """
+        for descendant in Usd.PrimRange(prim):
+            self._insert(descendant)
+
+    def prims(self) -> list[Usd.Prim]:
+        """Get the valid indexed prims in traversal order, followed by the prims registered with :meth:`add`.
+
+        Returns:
+            The indexed prims that still exist on the stage.
+        """
+        if not all(prim.IsValid() for prim in self._prims):
+            self._prims = [prim for prim in self._prims if prim.IsValid()]
+        return list(self._prims)
+
+    def find_by_name(self, name: str) -> Usd.Prim | None:
+        """Find the first valid prim whose ``GetName()`` matches *name*.
+
+        Args:
+            name: Prim name to match.
+
+        Returns:
+            The first matching prim, or ``None`` if not found.
+        """
+        candidates = self._by_name.get(name)
+        if not candidates:
+            return None
+        for prim in candidates:
+            if prim.IsValid():
+                return prim
+        del self._by_name[name]
+        return None
+
+    def _insert(self, prim: Usd.Prim) -> None:
+        """Append a prim to the lookup tables unless it is already indexed.
+
+        Args:
+            prim: Prim to index.
+        """
+        path = prim.GetPath().pathString
+        indexed = self._by_path.get(path)
+        if indexed is not None and indexed.IsValid():
+            return
+        self._by_path[path] = prim
+        self._prims.append(prim)
+        self._by_name.setdefault(prim.GetName(), []).append(prim)
+
+
+def _iter_prims(stage: Usd.Stage, prim_index: StagePrimIndex | None) -> list[Usd.Prim] | Usd.PrimRange:
+    """Get the prims of a stage from a shared index, or by traversing the stage.
+
+    Args:
+        stage: The USD stage to inspect.
+        prim_index: Index of the stage prims, or ``None`` to traverse the stage.
+
+    Returns:
+        The prims of the stage.
+    """
+    return prim_index.prims() if prim_index is not None else stage.Traverse()
+
+
+class StageSpecBatch:
+    """Queue of prim edits authored at the Sdf level on the stage edit target in one change block.
+
+    Applying schemas and setting attributes one prim at a time through the ``Usd`` API sends change
+    notifications and recomposes the prim for every edit. Post-import steps instead read the composed stage to
+    decide what to change, queue the edits here, and :meth:`commit` them as ``Sdf`` spec edits inside a single
+    ``Sdf.ChangeBlock``. The result is the same as authoring with ``UsdPrim.ApplyAPI`` and
+    ``UsdAttribute.Set`` on the edit target: ``over`` specs are created for prims defined in other layers.
+
+    Args:
+        stage: USD stage to author on.
+
+    Example:
+
+    .. code-block:: python
+
+        >>> from pxr import Sdf, Usd, UsdGeom, UsdPhysics
+        >>> import isaacsim.asset.importer.utils.stage_utils as stage_utils
+        >>>
+        >>> stage = Usd.Stage.CreateInMemory()
+        >>> cube = UsdGeom.Cube.Define(stage, "/Robot/cube").GetPrim()
+        >>> batch = stage_utils.StageSpecBatch(stage)
+        >>> batch.apply_api_schema(cube.GetPath(), "PhysicsCollisionAPI")
+        >>> batch.set_attribute(cube.GetPath(), "physics:collisionEnabled", Sdf.ValueTypeNames.Bool, True)
+        >>> batch.commit()
+        2
+        >>> cube.HasAPI(UsdPhysics.CollisionAPI)
+        True
+    """
+
+    def __init__(self, stage: Usd.Stage) -> None:
+        self._stage = stage
+        self._api_schemas: dict[Sdf.Path, list[str]] = {}
+        self._attributes: dict[tuple[Sdf.Path, str], tuple[Sdf.ValueTypeName, Sdf.Variability, object]] = {}
+        self._removed_prims: list[Sdf.Path] = []
+
+    def __len__(self) -> int:
+        return sum(len(names) for names in self._api_schemas.values()) + len(self._attributes) + len(
+            self._removed_prims
+        )
+
+    def apply_api_schema(self, prim_path: Sdf.Path, schema_name: str) -> None:
+        """Queue applying an API schema to a prim, like ``UsdPrim.ApplyAPI``.
+
+        Args:
+            prim_path: Path of the prim.
+            schema_name: Name of the API schema, including the instance name for multiple-apply schemas
+                (e.g. ``"PhysicsCollisionAPI"`` or ``"PhysicsDriveAPI:angular"``).
+        """
+        names = self._api_schemas.setdefault(prim_path, [])
+        if schema_name not in names:
+            names.append(schema_name)
+
+    def set_attribute(
+        self,
+        prim_path: Sdf.Path,
+        name: str,
+        type_name: Sdf.ValueTypeName,
+        value: object,
+        variability: Sdf.Variability = Sdf.VariabilityVarying,
+    ) -> None:
+        """Queue setting the default value of an attribute, creating the attribute if needed.
+
+        Setting the same attribute again replaces the queued value.
+
+        Args:
+            prim_path: Path of the prim.
+            name: Attribute name.
+            type_name: Value type used when the attribute is created, matching the schema definition.
+            value: Default value to author.
+            variability: Variability used when the attribute is created, matching the schema definition.
+        """
+        self._attributes[(prim_path, name)] = (type_name, variability, value)
+
+    def remove_prim(self, prim_path: Sdf.Path) -> None:
+        """Queue removing the spec of a prim from the edit target, like ``UsdStage.RemovePrim``.
+
+        Args:
+            prim_path: Path of the prim.
+        """
+        self._removed_prims.append(prim_path)
+
+    def commit(self) -> int:
+        """Author the queued edits in one change block and clear the queue.
+
+        Schemas are applied first, then attributes are set, then prims are removed.
+
+        Returns:
+            Number of edits authored.
+        """
+        count = len(self)
+        if not count:
+            return 0
+        edit_target = self._stage.GetEditTarget()
+        layer = edit_target.GetLayer()
+        prim_specs: dict[Sdf.Path, Sdf.PrimSpec] = {}
+
+        def prim_spec(prim_path: Sdf.Path) -> Sdf.PrimSpec:
+            spec = prim_specs.get(prim_path)
+            if spec is None:
+                spec = prim_specs[prim_path] = Sdf.CreatePrimInLayer(layer, edit_target.MapToSpecPath(prim_path))
+            return spec
+
+        with Sdf.ChangeBlock():
+            for prim_path, names in self._api_schemas.items():
+                spec = prim_spec(prim_path)
+                list_op = spec.GetInfo("apiSchemas")
+                if list_op.isExplicit:
+                    items = list(list_op.explicitItems)
+                    added = [name for name in names if name not in items]
+                    if added:
+                        spec.SetInfo("apiSchemas", Sdf.TokenListOp.CreateExplicit(items + added))
+                    continue
+                items = list(list_op.prependedItems)
+                added = [name for name in names if name not in items]
+                if not added:
+                    continue
+                list_op.prependedItems = items + added
+                deleted = list(list_op.deletedItems)
+                if any(name in deleted for name in added):
+                    list_op.deletedItems = [name for name in deleted if name not in added]
+                spec.SetInfo("apiSchemas", list_op)
+
+            for (prim_path, name), (type_name, variability, value) in self._attributes.items():
+                spec = prim_spec(prim_path)
+                attr_spec = spec.attributes.get(name)
+                if attr_spec is None:
+                    attr_spec = Sdf.AttributeSpec(spec, name, type_name, variability)
+                attr_spec.default = value
+
+            for prim_path in self._removed_prims:
+                spec = layer.GetPrimAtPath(edit_target.MapToSpecPath(prim_path))
+                if spec is None:
+                    continue
+                parent = spec.nameParent if spec.nameParent else layer.pseudoRoot
+                del parent.nameChildren[spec.name]
+
+        self._api_schemas.clear()
+        self._attributes.clear()
+        self._removed_prims.clear()
+        return count
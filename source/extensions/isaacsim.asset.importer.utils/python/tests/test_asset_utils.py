@@ -20,7 +20,7 @@ from typing import Any
 
 import omni.kit.test
 import omni.usd
-from isaacsim.asset.importer.utils.impl import asset_utils
+from isaacsim.asset.importer.utils.impl import asset_utils, stage_utils
 from pxr import Sdf, Usd, UsdPhysics
 
 
@@ -350,6 +350,24 @@ class TestAssetUtils(omni.kit.test.AsyncTestCase):
         fix_joint_prim = stage.GetPrimAtPath("/robot/fix_base_joint")
         self.assertFalse(fix_joint_prim.IsValid())
 
+    async def test_fix_base_with_shared_prim_index(self) -> None:
+        """The fixed joint defined with a shared prim index should be registered in the index."""
+        stage = _make_robot()
+        prim_index = stage_utils.StagePrimIndex(stage)
+
+        asset_utils.apply_fix_base(stage, prim_index=prim_index)
+
+        fix_joint_prim = prim_index.find_by_name("fix_base_joint")
+        self.assertIsNotNone(fix_joint_prim)
+        self.assertEqual(fix_joint_prim.GetPath(), Sdf.Path("/robot/fix_base_joint"))
+        self.assertEqual(
+            asset_utils._collect_joints(stage, prim_index).keys(), asset_utils._collect_joints(stage).keys()
+        )
+
+        # Removing the fixed base drops the joint from the name lookups
+        asset_utils.apply_floating_base(stage, prim_index=prim_index)
+        self.assertIsNone(prim_index.find_by_name("fix_base_joint"))
+
     async def test_fix_base_no_default_prim(self) -> None:
         """apply_fix_base should not crash when no default prim exists."""
         stage = Usd.Stage.CreateInMemory()
@@ -624,6 +642,16 @@ class TestAssetUtils(omni.kit.test.AsyncTestCase):
         stage = _make_robot()
         asset_utils.apply_joint_drives(stage)
 
+    async def test_drives_unmatched_pattern_authors_nothing(self) -> None:
+        """A pattern matching no joints should raise before any drive attribute is authored."""
+        stage = _make_robot()
+        with self.assertRaises(ValueError):
+            asset_utils.apply_joint_drives(stage, drive_type="force", stiffness={"no_such_joint": 1.0})
+
+        for prim in stage.Traverse():
+            if prim.IsA(UsdPhysics.RevoluteJoint):
+                self.assertFalse(UsdPhysics.DriveAPI.Get(prim, "angular").GetTypeAttr().HasAuthoredValue())
+
     async def test_stiffness_regex_pattern(self) -> None:
         """Per-pattern stiffness should apply correct values with unit conversion."""
         stage = _make_robot()
@@ -0,0 +1,140 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Verifies batch import hashing, output caching, de-duplication and per-file error reporting."""
+
+import os
+import shutil
+import tempfile
+import threading
+
+import omni.kit.test
+from isaacsim.asset.importer.utils.impl import batch_utils
+
+
+def _write(path: str, content: str) -> str:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(content)
+    return path
+
+
+class TestBatchUtils(omni.kit.test.AsyncTestCase):
+    """Test helpers in :mod:`isaacsim.asset.importer.utils.impl.batch_utils`."""
+
+    async def setUp(self) -> None:
+        """Create source files referencing a shared mesh in a temporary directory."""
+        self._tmpdir = tempfile.mkdtemp(prefix="batch_utils_test_")
+        self._output_dir = os.path.join(self._tmpdir, "output")
+        self._mesh = _write(os.path.join(self._tmpdir, "meshes", "link.obj"), "v 0 0 0\n")
+        self._sources = [
+            _write(os.path.join(self._tmpdir, f"robot_{i}.urdf"), f'<robot name="robot_{i}"/>') for i in range(3)
+        ]
+        self._imported: list[str] = []
+        self._import_threads: set[int] = set()
+        self._lock = threading.Lock()
+
+    async def tearDown(self) -> None:
+        """Remove the temporary directory."""
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
+
+    def _import(self, source_path: str, output_dir: str) -> str:
+        """Fake importer writing a USD file named after the source file."""
+        if "broken" in source_path:
+            raise RuntimeError("conversion failed")
+        with self._lock:
+            self._imported.append(source_path)
+            self._import_threads.add(threading.get_ident())
+        name = os.path.splitext(os.path.basename(source_path))[0]
+        return _write(os.path.join(output_dir, name, f"{name}.usda"), "#usda 1.0\n")
+
+    def _run(self, source_paths: list[str], **kwargs) -> list[batch_utils.BatchImportResult]:
+        self._imported.clear()
+        kwargs.setdefault("config", {"merge_mesh": False})
+        return batch_utils.run_batch_import(
+            source_paths, self._import, self._output_dir, dependency_fn=lambda _: [self._mesh], max_workers=2, **kwargs
+        )
+
+    async def test_compute_import_hash(self) -> None:
+        """The hash should change with the source, dependency contents and config, and only with them."""
+        source = self._sources[0]
+        reference = batch_utils.compute_import_hash(source, [self._mesh], {"a": 1, "b": 2})
+        self.assertEqual(reference, batch_utils.compute_import_hash(source, [self._mesh], {"b": 2, "a": 1}))
+        self.assertNotEqual(reference, batch_utils.compute_import_hash(source, [self._mesh], {"a": 2, "b": 2}))
+        self.assertNotEqual(reference, batch_utils.compute_import_hash(source, [], {"a": 1, "b": 2}))
+
+        missing = os.path.join(self._tmpdir, "meshes", "missing.obj")
+        without_file = batch_utils.compute_import_hash(source, [missing], {})
+        _write(missing, "v 1 1 1\n")
+        self.assertNotEqual(without_file, batch_utils.compute_import_hash(source, [missing], {}))
+
+        _write(self._mesh, "v 0 0 1\n")
+        self.assertNotEqual(reference, batch_utils.compute_import_hash(source, [self._mesh], {"a": 1, "b": 2}))
+
+    async def test_outputs_are_cached(self) -> None:
+        """Unchanged files should be skipped and changed ones imported again."""
+        results = self._run(self._sources)
+        self.assertEqual(sorted(self._imported), sorted(os.path.normpath(p) for p in self._sources))
+        self.assertTrue(all(r.succeeded and not r.cached for r in results))
+        self.assertEqual([r.source_path for r in results], [os.path.normpath(p) for p in self._sources])
+        outputs = [r.output_path for r in results]
+        self.assertEqual(len(set(outputs)), len(outputs))
+
+        results = self._run(self._sources)
+        self.assertEqual(self._imported, [])
+        self.assertTrue(all(r.succeeded and r.cached and r.import_time == 0.0 for r in results))
+        self.assertEqual([r.output_path for r in results], outputs)
+
+        # A different configuration, a changed source or a changed dependency invalidates the cache
+        results = self._run(self._sources[:1], config={"merge_mesh": True})
+        self.assertFalse(results[0].cached)
+        _write(self._sources[1], '<robot name="robot_1"><link name="base"/></robot>')
+        results = self._run(self._sources)
+        self.assertEqual(self._imported, [os.path.normpath(self._sources[1])])
+        _write(self._mesh, "v 0 0 1\n")
+        results = self._run(self._sources)
+        self.assertEqual(len(self._imported), len(self._sources))
+
+        results = self._run(self._sources, use_cache=False)
+        self.assertEqual(len(self._imported), len(self._sources))
+        self.assertFalse(any(r.cached for r in results))
+
+    async def test_duplicates_and_errors(self) -> None:
+        """Identical files should be imported once and failures reported without stopping the batch."""
+        broken = _write(os.path.join(self._tmpdir, "broken.urdf"), "<robot/>")
+        results = self._run([self._sources[0], broken, self._sources[0]])
+        self.assertEqual(self._imported, [os.path.normpath(self._sources[0])])
+        self.assertTrue(results[0].succeeded)
+        self.assertFalse(results[1].succeeded)
+        self.assertIn("conversion failed", results[1].error)
+        self.assertIsNone(results[1].output_path)
+        self.assertTrue(results[2].cached)
+        self.assertEqual(results[2].output_path, results[0].output_path)
+
+        # Failed imports are not cached
+        results = self._run([broken])
+        self.assertFalse(results[0].succeeded)
+        self.assertFalse(results[0].cached)
+
+        with self.assertRaises(ValueError):
+            batch_utils.run_batch_import(self._sources, self._import, self._output_dir, max_workers=0)
+
+    async def test_imports_run_on_calling_thread(self) -> None:
+        """Only hashing runs in the pool; the imports run one after another on the calling thread."""
+        self._import_threads.clear()
+        results = self._run(self._sources)
+        self.assertTrue(all(r.succeeded for r in results))
+        self.assertEqual(self._import_threads, {threading.get_ident()})
+        self.assertEqual(self._imported, [os.path.normpath(p) for p in self._sources])
@@ -70,6 +70,34 @@ class TestImporterUtils(omni.kit.test.AsyncTestCase):
         self.assertTrue(body_prim.HasAPI(UsdPhysics.RigidBodyAPI))
         self.assertTrue(body_prim.HasAPI(UsdPhysics.MassAPI))
 
+    async def test_collision_from_visuals(self) -> None:
+        """Turn visual geometry into colliders and remove guide colliders."""
+        stage = Usd.Stage.CreateInMemory()
+        UsdGeom.Xform.Define(stage, "/World")
+        mesh = UsdGeom.Mesh.Define(stage, "/World/visual_mesh").GetPrim()
+        cube = UsdGeom.Cube.Define(stage, "/World/visual_cube").GetPrim()
+        disabled = UsdGeom.Sphere.Define(stage, "/World/disabled_collider").GetPrim()
+        UsdPhysics.CollisionAPI.Apply(disabled).CreateCollisionEnabledAttr(False)
+        guide = UsdGeom.Cube.Define(stage, "/World/guide_collider")
+        guide.CreatePurposeAttr(UsdGeom.Tokens.guide)
+        UsdPhysics.CollisionAPI.Apply(guide.GetPrim())
+        proxy = UsdGeom.Cube.Define(stage, "/World/proxy")
+        proxy.CreatePurposeAttr(UsdGeom.Tokens.proxy)
+
+        processed = importer_utils.collision_from_visuals(stage, "Convex Decomposition")
+
+        self.assertEqual(processed, 3)
+        self.assertTrue(mesh.HasAPI(UsdPhysics.CollisionAPI))
+        self.assertTrue(mesh.HasAPI(UsdPhysics.MeshCollisionAPI))
+        self.assertEqual(
+            UsdPhysics.MeshCollisionAPI(mesh).GetApproximationAttr().Get(), UsdPhysics.Tokens.convexDecomposition
+        )
+        self.assertTrue(cube.HasAPI(UsdPhysics.CollisionAPI))
+        self.assertFalse(cube.HasAPI(UsdPhysics.MeshCollisionAPI))
+        self.assertTrue(UsdPhysics.CollisionAPI(disabled).GetCollisionEnabledAttr().Get())
+        self.assertFalse(stage.GetPrimAtPath("/World/guide_collider").IsValid())
+        self.assertFalse(proxy.GetPrim().HasAPI(UsdPhysics.CollisionAPI))
+
     async def test_enable_self_collision_applies_articulation_api(self) -> None:
         """Enable self-collision on the default prim when missing roots.
 
@@ -21,6 +21,7 @@ import tempfile
 import omni.kit.test
 import omni.usd
 from isaacsim.asset.importer.utils.impl import stage_utils
+from pxr import Sdf, Usd, UsdGeom
 
 
 class TestStageUtils(omni.kit.test.AsyncTestCase):
@@ -42,3 +43,72 @@ class TestStageUtils(omni.kit.test.AsyncTestCase):
             self.assertIsNotNone(stage)
             self.assertIsInstance(stage_id, int)
             self.assertGreaterEqual(stage_id, 0)
+
+    async def test_stage_prim_index(self) -> None:
+        """Look up prims by name and keep the index valid across removals and additions."""
+        stage = Usd.Stage.CreateInMemory()
+        UsdGeom.Xform.Define(stage, "/Robot/base_link")
+        UsdGeom.Xform.Define(stage, "/Robot/arm/link")
+        UsdGeom.Xform.Define(stage, "/Robot/hand/link")
+
+        prim_index = stage_utils.StagePrimIndex(stage)
+        self.assertEqual(len(prim_index.prims()), 6)
+        self.assertEqual(prim_index.find_by_name("base_link").GetPath(), Sdf.Path("/Robot/base_link"))
+        self.assertEqual(prim_index.find_by_name("link").GetPath(), Sdf.Path("/Robot/arm/link"))
+        self.assertIsNone(prim_index.find_by_name("missing"))
+
+        # Removed prims are skipped, newly defined prims are found once registered
+        stage.RemovePrim("/Robot/arm")
+        self.assertEqual(prim_index.find_by_name("link").GetPath(), Sdf.Path("/Robot/hand/link"))
+        self.assertIsNone(prim_index.find_by_name("arm"))
+        prim_index.add(UsdGeom.Xform.Define(stage, "/Robot/tool").GetPrim())
+        prim_index.add(stage.GetPrimAtPath("/Robot/tool"))
+        self.assertEqual(prim_index.find_by_name("tool").GetPath(), Sdf.Path("/Robot/tool"))
+        self.assertEqual([p.GetPath() for p in prim_index.prims()], [p.GetPath() for p in stage.Traverse()])
+
+        prim_index.rebuild()
+        self.assertEqual(len(prim_index.prims()), 5)
+
+    async def test_stage_spec_batch(self) -> None:
+        """Queue schema, attribute and removal edits and author them on the edit target in one commit."""
+        asset_layer = Sdf.Layer.CreateAnonymous()
+        asset_stage = Usd.Stage.Open(asset_layer)
+        UsdGeom.Mesh.Define(asset_stage, "/Robot/visual")
+
+        stage = Usd.Stage.CreateInMemory()
+        stage.DefinePrim("/World/Robot").GetReferences().AddReference(asset_layer.identifier, "/Robot")
+        stage.DefinePrim("/World/Robot/extra", "Xform")
+        batch = stage_utils.StageSpecBatch(stage)
+        batch.apply_api_schema(Sdf.Path("/World/Robot/visual"), "PhysicsCollisionAPI")
+        batch.set_attribute(Sdf.Path("/World/Robot/visual"), "physics:approximation", Sdf.ValueTypeNames.Token, "none")
+        batch.set_attribute(
+            Sdf.Path("/World/Robot/visual"),
+            "physics:approximation",
+            Sdf.ValueTypeNames.Token,
+            "convexHull",
+            Sdf.VariabilityUniform,
+        )
+        batch.remove_prim(Sdf.Path("/World/Robot/extra"))
+        self.assertEqual(len(batch), 3)
+        self.assertTrue(stage.GetPrimAtPath("/World/Robot/extra").IsValid())
+
+        self.assertEqual(batch.commit(), 3)
+        self.assertEqual(len(batch), 0)
+        visual = stage.GetPrimAtPath("/World/Robot/visual")
+        self.assertEqual(visual.GetAppliedSchemas(), ["PhysicsCollisionAPI"])
+        attr = visual.GetAttribute("physics:approximation")
+        self.assertEqual(attr.Get(), "convexHull")
+        self.assertEqual(attr.GetVariability(), Sdf.VariabilityUniform)
+        self.assertFalse(stage.GetPrimAtPath("/World/Robot/extra").IsValid())
+        # Edits on referenced prims are authored as overs, the asset layer is untouched
+        self.assertEqual(stage.GetRootLayer().GetPrimAtPath("/World/Robot/visual").specifier, Sdf.SpecifierOver)
+        self.assertIsNone(asset_layer.GetPrimAtPath("/Robot/visual").GetAttributeAtPath(".physics:approximation"))
+
+        # An explicit list op on the edit target keeps its other schemas
+        edit_spec = stage.GetRootLayer().GetPrimAtPath("/World/Robot/visual")
+        edit_spec.SetInfo("apiSchemas", Sdf.TokenListOp.CreateExplicit(["MaterialBindingAPI"]))
+        batch.apply_api_schema(Sdf.Path("/World/Robot/visual"), "PhysicsMeshCollisionAPI")
+        batch.commit()
+        self.assertEqual(
+            list(edit_spec.GetInfo("apiSchemas").explicitItems), ["MaterialBindingAPI", "PhysicsMeshCollisionAPI"]
+        )
@@ -18,11 +18,16 @@
 from __future__ import annotations
 
 import hashlib
+import json
 import math
 import os
-from collections import defaultdict
-from collections.abc import Iterable
+import struct
+import threading
+from collections import OrderedDict, defaultdict, deque
+from collections.abc import Iterable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
+from typing import Any
 
 import numpy as np
 from isaacsim.asset.transformer import RuleConfigurationParam, RuleInterface
@@ -75,6 +80,28 @@ _GEOMETRY_HASH_QUANTIZE_METERS: float = 0.001
 # deduplication.
 _GEOMETRY_HASH_QUANTIZE_MAX_METERS: float = 0.01
 
+# Default number of geometry hashing workers; 0 selects one worker per CPU core.
+_DEFAULT_HASH_WORKERS: int = 0
+
+# Upper bound on the number of hashing workers picked automatically.
+_MAX_AUTO_HASH_WORKERS: int = 32
+
+# Hash tasks kept in flight per worker while buffers are extracted from USD.
+# Bounds peak memory on assets with tens of thousands of meshes.
+_HASH_TASKS_IN_FLIGHT_PER_WORKER: int = 4
+
+# Maximum number of raw-content fingerprints kept in the process-wide hash cache.
+_GEOMETRY_HASH_CACHE_MAX_ENTRIES: int = 200_000
+
+# Format version of the on-disk geometry hash cache.
+_GEOMETRY_HASH_CACHE_VERSION: int = 1
+
+# Process-wide cache mapping a mesh's raw-content fingerprint to its quantized
+# geometry hash. Re-running the rule on a lightly edited asset only re-quantizes
+# the meshes whose authored content actually changed.
+_GEOMETRY_HASH_CACHE: OrderedDict[str, str] = OrderedDict()
+_GEOMETRY_HASH_CACHE_LOCK = threading.Lock()
+
 # Properties that should be treated as instance-specific, even if schema declares them.
 _INSTANCE_SPECIFIC_PROPERTIES: frozenset[str] = frozenset({"purpose", "visibility"})
 
@@ -139,6 +166,78 @@ class InstanceEntry:
     sources: list[GeometrySource] = field(default_factory=list)
 
 
+@dataclass
+class _GeometryHashInput:
+    """USD-independent hashing inputs extracted from a geometry prim.
+
+    Array values are copied out of USD into NumPy buffers on the calling thread
+    so that quantization and hashing can run on worker threads without touching
+    the stage.
+
+    Args:
+        type_name: USD type name of the prim.
+        quantum: Quantization grid-cell size in stage units.
+        values: Sorted ``(attribute name, value)`` pairs. Values are either NumPy
+            arrays still to be quantized or already-serialized bytes.
+
+    """
+
+    type_name: str
+    quantum: float
+    values: list[tuple[str, np.ndarray | bytes]] = field(default_factory=list)
+
+
+def _load_geometry_hash_cache(path: str) -> int:
+    """Merge a persisted geometry hash cache into the process-wide cache.
+
+    Missing, unreadable or version-mismatched files are ignored.
+
+    Args:
+        path: Path of the JSON cache file.
+
+    Returns:
+        Number of entries loaded.
+
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return 0
+    if not isinstance(data, dict) or data.get("version") != _GEOMETRY_HASH_CACHE_VERSION:
+        return 0
+    entries = data.get("entries")
+    if not isinstance(entries, dict):
+        return 0
+    with _GEOMETRY_HASH_CACHE_LOCK:
+        for key, value in entries.items():
+            if isinstance(key, str) and isinstance(value, str):
+                _GEOMETRY_HASH_CACHE[key] = value
+        while len(_GEOMETRY_HASH_CACHE) > _GEOMETRY_HASH_CACHE_MAX_ENTRIES:
+            _GEOMETRY_HASH_CACHE.popitem(last=False)
+    return len(entries)
+
+
+def _save_geometry_hash_cache(path: str, fingerprints: Iterable[str]) -> None:
+    """Persist the cached hashes for the given fingerprints.
+
+    Only the fingerprints seen in the current run are written so the file
+    tracks the asset instead of growing without bound.
+
+    Args:
+        path: Path of the JSON cache file.
+        fingerprints: Raw-content fingerprints to persist.
+
+    """
+    with _GEOMETRY_HASH_CACHE_LOCK:
+        entries = {key: _GEOMETRY_HASH_CACHE[key] for key in fingerprints if key in _GEOMETRY_HASH_CACHE}
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"version": _GEOMETRY_HASH_CACHE_VERSION, "entries": entries}, f, sort_keys=True)
+
+
 class GeometriesRoutingRule(RuleInterface):
     """Route geometry prims to a shared layer and create an instances layer for overrides.
 
@@ -152,6 +251,19 @@ class GeometriesRoutingRule(RuleInterface):
 
     source_stage: Usd.Stage
 
+    def __init__(self, source_stage: Usd.Stage, package_root: str, destination_path: str, args: dict[str, Any]) -> None:
+        """Initialize the rule.
+
+        Args:
+            source_stage: Input stage providing opinions to read from.
+            package_root: Root directory for output files.
+            destination_path: Relative path for rule outputs.
+            args: Mapping of parameters including keys such as ``destination`` and ``params``.
+        """
+        super().__init__(source_stage, package_root, destination_path, args)
+        # Worker threads hashing geometries, read from the ``hash_workers`` parameter in process_rule
+        self._hash_workers: int = _DEFAULT_HASH_WORKERS
+
     def get_configuration_parameters(self) -> list[RuleConfigurationParam]:
         """Return the configuration parameters for this rule.
 
@@ -208,6 +320,23 @@ class GeometriesRoutingRule(RuleInterface):
                 description="If True, log detailed transform decomposition information",
                 default_value=False,
             ),
+            RuleConfigurationParam(
+                name="hash_workers",
+                display_name="Hash Workers",
+                param_type=int,
+                description="Number of worker threads used to hash geometry buffers (0 uses one per CPU core)",
+                default_value=_DEFAULT_HASH_WORKERS,
+            ),
+            RuleConfigurationParam(
+                name="hash_cache_path",
+                display_name="Hash Cache Path",
+                param_type=str,
+                description=(
+                    "Optional JSON file, relative to the package root, used to reuse geometry hashes "
+                    "of unchanged meshes across runs"
+                ),
+                default_value="",
+            ),
         ]
 
     # --- Helper Methods for Common Operations ---
@@ -1286,6 +1415,7 @@ class GeometriesRoutingRule(RuleInterface):
         scope = params.get("scope") or "/"
         save_base_as_usda = params.get("save_base_as_usda", _DEFAULT_SAVE_BASE_AS_USDA)
         self._verbose = params.get("verbose", False)
+        self._hash_workers = int(params.get("hash_workers", _DEFAULT_HASH_WORKERS) or 0)
 
         # Pre-process: make all instanceable references non-instanceable
         # This clears local overrides on children and removes instanceable flags
@@ -1374,14 +1504,32 @@ class GeometriesRoutingRule(RuleInterface):
         new_count = 0
         reused_count = 0
 
+        # Compute geometry hashes (used for deduplication when enabled) in one
+        # batched pass so quantization and hashing run on the worker pool.
+        hash_cache_path = params.get("hash_cache_path") or ""
+        if hash_cache_path:
+            hash_cache_path = os.path.join(self.package_root, hash_cache_path)
+            loaded = _load_geometry_hash_cache(hash_cache_path)
+            self.log_operation(f"Loaded {loaded} cached geometry hashes from {hash_cache_path}")
+        hashed_sources: list[GeometrySource] = []
+        hashed_prims: list[Usd.Prim] = []
+        for source in geometry_sources:
+            prim = self.source_stage.GetPrimAtPath(source.prim_path)
+            if prim.IsValid():
+                hashed_sources.append(source)
+                hashed_prims.append(prim)
+        fingerprints = self._compute_geometry_hashes(hashed_prims, hash_workers=self._hash_workers)
+        for source, (geom_hash, _) in zip(hashed_sources, fingerprints):
+            source.geometry_hash = geom_hash
+        if hash_cache_path:
+            _save_geometry_hash_cache(hash_cache_path, (fingerprint for _, fingerprint in fingerprints))
+
         for source in geometry_sources:
             prim = self.source_stage.GetPrimAtPath(source.prim_path)
             if not prim.IsValid():
                 continue
 
-            # Compute geometry hash (used for deduplication when enabled)
-            geom_hash = self._compute_geometry_hash(prim)
-            source.geometry_hash = geom_hash
+            geom_hash = source.geometry_hash
             source.type_name = prim.GetTypeName()
 
             # Use content hash as key when deduplicating, prim path when not
@@ -1719,6 +1867,8 @@ class GeometriesRoutingRule(RuleInterface):
         if not geometries_scope.IsValid():
             return existing
 
+        candidates: list[tuple[Usd.Prim, GeometryEntry]] = []
+
         for xform_prim in geometries_scope.GetChildren():
             if not xform_prim.IsValid():
                 continue
@@ -1741,9 +1891,6 @@ class GeometriesRoutingRule(RuleInterface):
             if not geom_prim.IsValid() or not geom_prim.IsA(UsdGeom.Gprim):
                 continue
 
-            # Compute hash for this existing geometry
-            geom_hash = self._compute_geometry_hash(geom_prim)
-
             entry = GeometryEntry(
                 name=xform_name,
                 geom_layer_path=xform_path,
@@ -1752,6 +1899,13 @@ class GeometriesRoutingRule(RuleInterface):
                 sources=[],
                 existing=True,
             )
+            candidates.append((geom_prim, entry))
+
+        # Compute hashes for the existing geometries in one batched pass
+        hashes = self._compute_geometry_hashes(
+            [geom_prim for geom_prim, _ in candidates], hash_workers=self._hash_workers
+        )
+        for (_, entry), (geom_hash, _) in zip(candidates, hashes):
             existing[geom_hash] = entry
 
         return existing
@@ -1773,6 +1927,50 @@ class GeometriesRoutingRule(RuleInterface):
             sanitized = "geom_" + sanitized
         return sanitized
 
+    @staticmethod
+    def _quantize_array(arr: np.ndarray, inv_q: float, grid_offset: float, quantum: float) -> bytes:
+        """Quantize a NumPy array and return raw bytes for hashing.
+
+        Integer arrays (faceVertexIndices, faceVertexCounts, etc.) are topology
+        data, not continuous geometry -- hashing them through float quantization
+        shifts them off-grid and breaks unit invariance, so their raw bytes are
+        returned instead.
+
+        Args:
+            arr: Array extracted from a USD attribute value.
+            inv_q: Precomputed ``1.0 / quantum``.
+            grid_offset: Precomputed ``quantum * (sqrt(2) - 1)``.
+            quantum: Grid-cell size (used for the near-zero dead-zone).
+
+        Returns:
+            Deterministic byte sequence suitable for feeding into a hasher.
+
+        """
+        if arr.dtype.kind in ("i", "u", "b"):
+            return arr.tobytes()
+        arr = arr.astype(np.float64, copy=False)
+        mask = np.abs(arr) < quantum
+        snapped = np.floor((arr + grid_offset) * inv_q).astype(np.int64)
+        snapped[mask] = 0
+        return snapped.tobytes()
+
+    @staticmethod
+    def _to_hash_array(value: object) -> np.ndarray | None:
+        """Copy a numeric VtArray value into a NumPy array.
+
+        Args:
+            value: The attribute value to convert.
+
+        Returns:
+            The NumPy array, or None if the value is not a non-empty numeric VtArray.
+
+        """
+        if "Array" in type(value).__name__ and hasattr(value, "__len__") and len(value) > 0:
+            first = value[0]
+            if isinstance(first, (int, float)) or hasattr(first, "__len__"):
+                return np.asarray(value)
+        return None
+
     @staticmethod
     def _quantize_value(value: object, inv_q: float, grid_offset: float, quantum: float) -> bytes:
         """Quantize a USD attribute value and return raw bytes for hashing.
@@ -1794,24 +1992,11 @@ class GeometriesRoutingRule(RuleInterface):
             Deterministic byte sequence suitable for feeding into a hasher.
 
         """
-        type_name = type(value).__name__
-
         # --- Fast path: VtArray (points, normals, UVs, indices, …) ----------
-        if "Array" in type_name and hasattr(value, "__len__") and len(value) > 0:
-            first = value[0]
-            if isinstance(first, (int, float)) or hasattr(first, "__len__"):
-                arr = np.asarray(value)
-                # Integer arrays (faceVertexIndices, faceVertexCounts, etc.)
-                # are topology data, not continuous geometry -- hashing them
-                # through float quantization shifts them off-grid and breaks
-                # unit invariance, so pass the raw bytes instead.
-                if arr.dtype.kind in ("i", "u", "b"):
-                    return arr.tobytes()
-                arr = arr.astype(np.float64, copy=False)
-                mask = np.abs(arr) < quantum
-                snapped = np.floor((arr + grid_offset) * inv_q).astype(np.int64)
-                snapped[mask] = 0
-                return snapped.tobytes()
+        arr = GeometriesRoutingRule._to_hash_array(value)
+        if arr is not None:
+            return GeometriesRoutingRule._quantize_array(arr, inv_q, grid_offset, quantum)
+        if "Array" in type(value).__name__ and hasattr(value, "__len__") and len(value) > 0:
             return str(value).encode()
 
         # --- Scalar / small-value path ---------------------------------------
@@ -1831,28 +2016,22 @@ class GeometriesRoutingRule(RuleInterface):
 
         return str(value).encode()
 
-    def _compute_geometry_hash(self, prim: Usd.Prim) -> str:
-        """Compute a hash of the geometry's intrinsic data for deduplication.
+    def _extract_geometry_hash_input(self, prim: Usd.Prim) -> _GeometryHashInput:
+        """Read everything needed to hash a geometry prim out of USD.
 
         Float precision is derived from the stage's ``metersPerUnit`` and the
         mesh's coordinate magnitude so that quantization always targets
         ``_GEOMETRY_HASH_QUANTIZE_METERS`` (1 mm) regardless of unit system.
-
-        Large arrays (points, normals, UVs) are quantized via numpy in C,
-        avoiding per-element Python loops.
+        Large arrays are copied into NumPy buffers; small values are serialized
+        immediately.
 
         Args:
             prim: The geometry prim to hash.
 
         Returns:
-            A hex string hash representing the geometry's intrinsic content.
+            The extracted hashing inputs.
 
         """
-        hasher = hashlib.sha256()
-
-        # Include type name
-        hasher.update(prim.GetTypeName().encode())
-
         # Compute the quantization grid-cell size in vertex-space units.
         meters_per_unit = UsdGeom.GetStageMetersPerUnit(self.source_stage)
         quantum = _GEOMETRY_HASH_QUANTIZE_METERS / meters_per_unit
@@ -1871,10 +2050,12 @@ class GeometriesRoutingRule(RuleInterface):
         inv_q = 1.0 / quantum if quantum > 0 else 1.0
         grid_offset = quantum * (math.sqrt(2) - 1)
 
+        hash_input = _GeometryHashInput(type_name=prim.GetTypeName(), quantum=quantum)
+
         # Get intrinsic properties for this geometry type
         intrinsic_props = self._get_intrinsic_attributes(prim)
 
-        # Hash only authored intrinsic attribute values, excluding xform
+        # Collect only authored intrinsic attribute values, excluding xform
         # properties which are stripped from geometry copies in the layer.
         for attr in sorted(prim.GetAttributes(), key=lambda a: a.GetName()):
             attr_name = attr.GetName()
@@ -1882,11 +2063,132 @@ class GeometriesRoutingRule(RuleInterface):
                 continue
             if self._is_intrinsic_property(attr_name, intrinsic_props) and attr.HasAuthoredValue():
                 value = attr.Get()
-                if value is not None:
-                    hasher.update(attr_name.encode())
-                    hasher.update(self._quantize_value(value, inv_q, grid_offset, quantum))
+                if value is None:
+                    continue
+                arr = self._to_hash_array(value)
+                if arr is None:
+                    hash_input.values.append((attr_name, self._quantize_value(value, inv_q, grid_offset, quantum)))
+                else:
+                    hash_input.values.append((attr_name, arr))
 
-        return hasher.hexdigest()[:_GEOMETRY_HASH_LENGTH]
+        return hash_input
+
+    @staticmethod
+    def _hash_geometry_input(hash_input: _GeometryHashInput) -> tuple[str, str, bool]:
+        """Hash extracted geometry inputs, reusing cached results for unchanged content.
+
+        A cheap fingerprint of the raw (unquantized) buffers is looked up in the
+        process-wide cache first; only on a miss are the buffers quantized and
+        sha256-hashed. Safe to call from worker threads since it never touches USD.
+
+        Args:
+            hash_input: Inputs produced by :meth:`_extract_geometry_hash_input`.
+
+        Returns:
+            Tuple of (geometry hash, raw-content fingerprint, whether the hash came from the cache).
+
+        """
+        fingerprint_hasher = hashlib.blake2b(digest_size=16)
+        fingerprint_hasher.update(hash_input.type_name.encode())
+        fingerprint_hasher.update(struct.pack("<d", hash_input.quantum))
+        for attr_name, value in hash_input.values:
+            fingerprint_hasher.update(attr_name.encode())
+            if isinstance(value, np.ndarray):
+                value = np.ascontiguousarray(value)
+                fingerprint_hasher.update(f"{value.dtype.str}{value.shape}".encode())
+                fingerprint_hasher.update(memoryview(value).cast("B"))
+            else:
+                fingerprint_hasher.update(struct.pack("<Q", len(value)))
+                fingerprint_hasher.update(value)
+        fingerprint = fingerprint_hasher.hexdigest()
+
+        with _GEOMETRY_HASH_CACHE_LOCK:
+            cached = _GEOMETRY_HASH_CACHE.get(fingerprint)
+            if cached is not None:
+                _GEOMETRY_HASH_CACHE.move_to_end(fingerprint)
+                return cached, fingerprint, True
+
+        quantum = hash_input.quantum
+        inv_q = 1.0 / quantum if quantum > 0 else 1.0
+        grid_offset = quantum * (math.sqrt(2) - 1)
+
+        hasher = hashlib.sha256()
+        hasher.update(hash_input.type_name.encode())
+        for attr_name, value in hash_input.values:
+            hasher.update(attr_name.encode())
+            if isinstance(value, np.ndarray):
+                value = GeometriesRoutingRule._quantize_array(value, inv_q, grid_offset, quantum)
+            hasher.update(value)
+        geom_hash = hasher.hexdigest()[:_GEOMETRY_HASH_LENGTH]
+
+        with _GEOMETRY_HASH_CACHE_LOCK:
+            _GEOMETRY_HASH_CACHE[fingerprint] = geom_hash
+            if len(_GEOMETRY_HASH_CACHE) > _GEOMETRY_HASH_CACHE_MAX_ENTRIES:
+                _GEOMETRY_HASH_CACHE.popitem(last=False)
+        return geom_hash, fingerprint, False
+
+    def _compute_geometry_hash(self, prim: Usd.Prim) -> str:
+        """Compute a hash of the geometry's intrinsic data for deduplication.
+
+        Float precision is derived from the stage's ``metersPerUnit`` and the
+        mesh's coordinate magnitude so that quantization always targets
+        ``_GEOMETRY_HASH_QUANTIZE_METERS`` (1 mm) regardless of unit system.
+
+        Large arrays (points, normals, UVs) are quantized via numpy in C,
+        avoiding per-element Python loops.
+
+        Args:
+            prim: The geometry prim to hash.
+
+        Returns:
+            A hex string hash representing the geometry's intrinsic content.
+
+        """
+        return self._hash_geometry_input(self._extract_geometry_hash_input(prim))[0]
+
+    def _compute_geometry_hashes(self, prims: Sequence[Usd.Prim], hash_workers: int = 0) -> list[tuple[str, str]]:
+        """Compute geometry hashes for many prims on a worker pool.
+
+        USD reads stay on the calling thread; quantization and hashing of the
+        extracted NumPy buffers run on a :class:`~concurrent.futures.ThreadPoolExecutor`
+        (NumPy and hashlib release the GIL for large buffers). Extraction is
+        pipelined with hashing and the number of in-flight tasks is bounded.
+
+        Args:
+            prims: Geometry prims to hash.
+            hash_workers: Number of worker threads; 0 uses one per CPU core.
+
+        Returns:
+            List of (geometry hash, raw-content fingerprint) tuples, in input order.
+
+        """
+        workers = hash_workers if hash_workers > 0 else min(_MAX_AUTO_HASH_WORKERS, os.cpu_count() or 1)
+        results: list[tuple[str, str, bool]] = [("", "", False)] * len(prims)
+
+        if workers <= 1 or len(prims) < 2:
+            for index, prim in enumerate(prims):
+                results[index] = self._hash_geometry_input(self._extract_geometry_hash_input(prim))
+        else:
+            max_in_flight = workers * _HASH_TASKS_IN_FLIGHT_PER_WORKER
+            pending: deque[tuple[int, Future]] = deque()
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="geometry_hash") as pool:
+                for index, prim in enumerate(prims):
+                    hash_input = self._extract_geometry_hash_input(prim)
+                    pending.append((index, pool.submit(self._hash_geometry_input, hash_input)))
+                    while len(pending) >= max_in_flight:
+                        done_index, future = pending.popleft()
+                        results[done_index] = future.result()
+                while pending:
+                    done_index, future = pending.popleft()
+                    results[done_index] = future.result()
+
+        if prims:
+            reused = sum(1 for _, _, from_cache in results if from_cache)
+            self.log_operation(
+                f"Hashed {len(prims)} geometries with {workers} worker(s): "
+                f"{reused} reused from cache, {len(prims) - reused} computed"
+            )
+        return [(geom_hash, fingerprint) for geom_hash, fingerprint, _ in results]
 
     def _compute_instance_delta_hash(self, prim: Usd.Prim) -> str:
         """Compute a hash of the instance-specific data (deltas) for deduplication.
@@ -21,6 +21,7 @@ import os
 import tempfile
 
 import omni.kit.test
+from isaacsim.asset.transformer.rules.perf import geometries
 from isaacsim.asset.transformer.rules.perf.geometries import (
     _GEOMETRY_HASH_QUANTIZE_MAX_METERS,
     GeometriesRoutingRule,
@@ -168,3 +169,64 @@ class TestGeometryHashUnits(omni.kit.test.AsyncTestCase):
                 "5 cm differences distinguishable on large meshes."
             ),
         )
+
+
+class TestBatchedGeometryHashing(omni.kit.test.AsyncTestCase):
+    """`_compute_geometry_hashes` should match the per-prim hash and reuse cached results."""
+
+    async def setUp(self) -> None:
+        """Build a stage with several distinct triangle meshes."""
+        self._tmpdir = tempfile.mkdtemp(prefix="isaacsim_geometry_hash_batch_")
+        geometries._GEOMETRY_HASH_CACHE.clear()
+        self._stage = _build_unit_triangle_stage(os.path.join(self._tmpdir, "batch.usda"), 1.0)
+        for i in range(8):
+            mesh = UsdGeom.Mesh.Define(self._stage, f"/root/tri_{i}")
+            mesh.CreateFaceVertexCountsAttr([3])
+            mesh.CreateFaceVertexIndicesAttr([0, 1, 2])
+            mesh.CreatePointsAttr([Gf.Vec3f(0.0, 0.0, 0.0), Gf.Vec3f(2.0 + i, 0.0, 0.0), Gf.Vec3f(0.0, 1.0, 0.0)])
+        self._prims = [prim for prim in self._stage.Traverse() if prim.IsA(UsdGeom.Mesh)]
+        self._rule = GeometriesRoutingRule(
+            source_stage=self._stage,
+            package_root=self._tmpdir,
+            destination_path="payloads",
+            args={},
+        )
+
+    async def tearDown(self) -> None:
+        """Remove the scratch directory and reset the process-wide hash cache."""
+        import shutil
+
+        geometries._GEOMETRY_HASH_CACHE.clear()
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
+
+    async def test_batched_hashes_match_single_prim_hashes(self) -> None:
+        """Hashes from the worker pool match the sequential per-prim hashes in input order."""
+        batched = [geom_hash for geom_hash, _ in self._rule._compute_geometry_hashes(self._prims, hash_workers=4)]
+        geometries._GEOMETRY_HASH_CACHE.clear()
+        single = [self._rule._compute_geometry_hash(prim) for prim in self._prims]
+        self.assertEqual(batched, single)
+        self.assertEqual(len(set(batched)), len(self._prims))
+
+    async def test_unchanged_meshes_reuse_cached_hashes(self) -> None:
+        """A second run only recomputes the mesh whose authored content changed."""
+        first = self._rule._compute_geometry_hashes(self._prims, hash_workers=2)
+        UsdGeom.Mesh(self._stage.GetPrimAtPath("/root/tri_3")).GetPointsAttr().Set(
+            [Gf.Vec3f(0.0, 0.0, 0.0), Gf.Vec3f(2.0, 2.0, 0.0), Gf.Vec3f(0.0, 1.0, 0.0)]
+        )
+        second = self._rule._compute_geometry_hashes(self._prims, hash_workers=2)
+        changed = [prim.GetName() for prim, a, b in zip(self._prims, first, second) if a[0] != b[0]]
+        self.assertEqual(changed, ["tri_3"])
+        self.assertTrue(
+            any("8 reused from cache, 1 computed" in entry for entry in self._rule.get_operation_log()),
+            msg=f"Unexpected hashing log: {self._rule.get_operation_log()}",
+        )
+
+    async def test_persisted_cache_round_trip(self) -> None:
+        """Hashes saved to disk are reloaded into an empty process-wide cache."""
+        results = self._rule._compute_geometry_hashes(self._prims, hash_workers=2)
+        cache_path = os.path.join(self._tmpdir, "cache", "geometry_hashes.json")
+        geometries._save_geometry_hash_cache(cache_path, (fingerprint for _, fingerprint in results))
+        geometries._GEOMETRY_HASH_CACHE.clear()
+        self.assertEqual(geometries._load_geometry_hash_cache(cache_path), len(self._prims))
+        for geom_hash, fingerprint in results:
+            self.assertEqual(geometries._GEOMETRY_HASH_CACHE[fingerprint], geom_hash)
@@ -19,6 +19,7 @@ import omni.asset_validator.core as av_core
 from omni.asset_validator.core import registerRule
 from pxr import Gf, PhysxSchema, Usd, UsdGeom, UsdPhysics
 
+from .stage_index import get_stage_index
 from .util import DedupBaseRuleChecker
 
 
@@ -132,8 +133,8 @@ class JointHasCorrectTransformAndState(DedupBaseRuleChecker):
         else:
             return
 
-        # Get the expected transform
-        cache = UsdGeom.XformCache()
+        # Get the expected transform, body transforms are shared with the other joints of the stage
+        cache = get_stage_index(stage).xform_cache
         expected_tm_0 = get_world_body_transform(stage, cache, joint, False)
         expected_tm_1 = get_world_body_transform(stage, cache, joint, True)
 
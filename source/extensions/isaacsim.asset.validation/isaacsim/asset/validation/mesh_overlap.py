@@ -0,0 +1,394 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Geometric overlap test between colliders, used to find initially interpenetrating collision meshes.
+
+Colliders are converted to world-space triangle soups (meshes are fan-triangulated, implicit shapes are
+tessellated). Candidate pairs are found with an axis-aligned bounding box sweep-and-prune broadphase, and each
+candidate pair is tested with a triangle-level narrowphase: triangle boxes are culled against the overlap of
+the two collider boxes, the remaining triangle pairs are tested for edge/triangle crossings, and a collider
+fully enclosed by the other is detected with a ray parity test. Narrowphase tests run in a thread pool.
+"""
+
+from __future__ import annotations
+
+import math
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from pxr import Sdf, Usd, UsdGeom, UsdPhysics
+
+from .stage_index import get_stage_index
+
+__all__ = ["find_overlapping_collider_pairs", "get_collider_triangles", "triangle_meshes_overlap"]
+
+# Number of segments used to tessellate round implicit shapes.
+_NUM_SEGMENTS = 16
+
+# Upper bound on the number of triangle pairs whose boxes are compared at once, limits temporary memory.
+_MAX_PAIRS_PER_BLOCK = 1 << 20
+
+# Fixed, non axis-aligned direction for the point-in-mesh parity test, avoids grazing mesh edges.
+_RAY_DIRECTION = np.array([0.5773, 0.5774, 0.5775]) / np.linalg.norm([0.5773, 0.5774, 0.5775])
+
+_EPSILON = 1e-12
+
+# Segments touching a triangle only at their end points are not counted, so colliders sharing a face do not clash.
+_SEGMENT_TOLERANCE = 1e-9
+
+
+def _revolve(profile: list[tuple[float, float]], axis: str) -> np.ndarray:
+    """Tessellate a closed surface of revolution.
+
+    Args:
+        profile: ``(radius, height)`` points from the bottom to the top pole, with zero radius at the poles.
+        axis: Axis of revolution (``"X"``, ``"Y"`` or ``"Z"``).
+
+    Returns:
+        Triangles of shape ``(N, 3, 3)`` in local space.
+    """
+    angles = np.linspace(0.0, 2.0 * math.pi, _NUM_SEGMENTS, endpoint=False)
+    radius = np.array([r for r, _ in profile])
+    height = np.array([h for _, h in profile])
+    # rings[i, j] is the j-th point of the i-th profile point
+    rings = np.stack(
+        [
+            radius[:, None] * np.cos(angles)[None, :],
+            radius[:, None] * np.sin(angles)[None, :],
+            np.repeat(height[:, None], _NUM_SEGMENTS, axis=1),
+        ],
+        axis=-1,
+    )
+    a, b = rings[:-1], rings[1:]
+    a_next, b_next = np.roll(a, -1, axis=1), np.roll(b, -1, axis=1)
+    triangles = np.concatenate(
+        [np.stack([a, a_next, b_next], axis=2).reshape(-1, 3, 3), np.stack([a, b_next, b], axis=2).reshape(-1, 3, 3)]
+    )
+    if axis == "X":
+        triangles = triangles[..., [2, 0, 1]]
+    elif axis == "Y":
+        triangles = triangles[..., [1, 2, 0]]
+    return triangles
+
+
+def _box_triangles(half_extents: np.ndarray) -> np.ndarray:
+    """Triangulate an axis-aligned box centered at the origin.
+
+    Args:
+        half_extents: Half size of the box along each axis.
+
+    Returns:
+        Triangles of shape ``(12, 3, 3)``.
+    """
+    corners = np.array([[x, y, z] for x in (-1, 1) for y in (-1, 1) for z in (-1, 1)], dtype=np.float64)
+    faces = [(0, 1, 3, 2), (4, 6, 7, 5), (0, 4, 5, 1), (2, 3, 7, 6), (0, 2, 6, 4), (1, 5, 7, 3)]
+    indices = [(f[0], f[1], f[2]) for f in faces] + [(f[0], f[2], f[3]) for f in faces]
+    return (corners * half_extents)[np.array(indices)]
+
+
+def _mesh_triangles(mesh: UsdGeom.Mesh) -> np.ndarray | None:
+    """Fan-triangulate the faces of a mesh.
+
+    Args:
+        mesh: The mesh to triangulate.
+
+    Returns:
+        Triangles of shape ``(N, 3, 3)`` in local space, or None if the mesh has no valid faces.
+    """
+    points = mesh.GetPointsAttr().Get()
+    counts = mesh.GetFaceVertexCountsAttr().Get()
+    indices = mesh.GetFaceVertexIndicesAttr().Get()
+    if not points or not counts or not indices:
+        return None
+    points = np.asarray(points, dtype=np.float64)
+    counts = np.asarray(counts, dtype=np.int64)
+    indices = np.asarray(indices, dtype=np.int64)
+    if counts.sum() != len(indices) or indices.max() >= len(points) or indices.min() < 0:
+        return None
+
+    # Face i contributes counts[i] - 2 triangles (start, start + k, start + k + 1) for k in [1, counts[i] - 2]
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    num_triangles = np.maximum(counts - 2, 0)
+    total = int(num_triangles.sum())
+    if total == 0:
+        return None
+    face_starts = np.repeat(starts, num_triangles)
+    k = np.arange(total) - np.repeat(np.cumsum(num_triangles) - num_triangles, num_triangles) + 1
+    corners = np.stack([indices[face_starts], indices[face_starts + k], indices[face_starts + k + 1]], axis=1)
+    return points[corners]
+
+
+def get_collider_triangles(prim: Usd.Prim, xform_cache: UsdGeom.XformCache | None = None) -> np.ndarray | None:
+    """Get the world-space triangles of a collider.
+
+    Meshes are fan-triangulated. Cubes, spheres, capsules, cylinders and cones are tessellated. Other prim
+    types (e.g. infinite planes) are not supported.
+
+    Args:
+        prim: The collider prim.
+        xform_cache: Cache used to compute the world transform. A new cache is used if None.
+
+    Returns:
+        Triangles of shape ``(N, 3, 3)`` in world space, or None if the prim type is not supported or the
+        geometry is empty.
+
+    Example:
+
+    .. code-block:: python
+
+        triangles = get_collider_triangles(stage.GetPrimAtPath("/Robot/link0/collisions/mesh_0"))
+    """
+    if prim.IsA(UsdGeom.Mesh):
+        triangles = _mesh_triangles(UsdGeom.Mesh(prim))
+    elif prim.IsA(UsdGeom.Cube):
+        size = UsdGeom.Cube(prim).GetSizeAttr().Get()
+        triangles = _box_triangles(np.full(3, 0.5 * size))
+    elif prim.IsA(UsdGeom.Sphere):
+        radius = UsdGeom.Sphere(prim).GetRadiusAttr().Get()
+        latitudes = np.linspace(0.0, math.pi, _NUM_SEGMENTS // 2 + 1)
+        triangles = _revolve([(radius * math.sin(t), -radius * math.cos(t)) for t in latitudes], "Z")
+    elif prim.IsA(UsdGeom.Capsule):
+        capsule = UsdGeom.Capsule(prim)
+        radius, half_height = capsule.GetRadiusAttr().Get(), 0.5 * capsule.GetHeightAttr().Get()
+        # Two hemispheres, the equator rings are shifted apart by the height of the cylinder
+        latitudes = np.linspace(0.0, 0.5 * math.pi, _NUM_SEGMENTS // 4 + 1)
+        profile = [(radius * math.sin(t), -radius * math.cos(t) - half_height) for t in latitudes]
+        profile += [(radius * math.cos(t), radius * math.sin(t) + half_height) for t in latitudes]
+        triangles = _revolve(profile, capsule.GetAxisAttr().Get())
+    elif prim.IsA(UsdGeom.Cylinder):
+        cylinder = UsdGeom.Cylinder(prim)
+        radius, half_height = cylinder.GetRadiusAttr().Get(), 0.5 * cylinder.GetHeightAttr().Get()
+        profile = [(0.0, -half_height), (radius, -half_height), (radius, half_height), (0.0, half_height)]
+        triangles = _revolve(profile, cylinder.GetAxisAttr().Get())
+    elif prim.IsA(UsdGeom.Cone):
+        cone = UsdGeom.Cone(prim)
+        radius, half_height = cone.GetRadiusAttr().Get(), 0.5 * cone.GetHeightAttr().Get()
+        profile = [(0.0, -half_height), (radius, -half_height), (0.0, half_height)]
+        triangles = _revolve(profile, cone.GetAxisAttr().Get())
+    else:
+        return None
+    if triangles is None or len(triangles) == 0:
+        return None
+
+    xform_cache = xform_cache if xform_cache is not None else UsdGeom.XformCache()
+    matrix = np.array(xform_cache.GetLocalToWorldTransform(prim), dtype=np.float64)
+    # Gf matrices use the row-vector convention: world = local @ rotation_scale + translation
+    return triangles @ matrix[:3, :3] + matrix[3, :3]
+
+
+def _segments_cross_triangles(starts: np.ndarray, ends: np.ndarray, triangles: np.ndarray) -> np.ndarray:
+    """Test segments against triangles, pairwise (Moller-Trumbore).
+
+    Args:
+        starts: Segment start points of shape ``(N, 3)``.
+        ends: Segment end points of shape ``(N, 3)``.
+        triangles: Triangles of shape ``(N, 3, 3)``.
+
+    Returns:
+        Boolean array of shape ``(N,)``, True where the segment crosses the triangle between its end points.
+    """
+    directions = ends - starts
+    v0 = triangles[:, 0]
+    edge1 = triangles[:, 1] - v0
+    edge2 = triangles[:, 2] - v0
+    pvec = np.cross(directions, edge2)
+    det = np.einsum("ij,ij->i", edge1, pvec)
+    valid = np.abs(det) > _EPSILON
+    inv_det = 1.0 / np.where(valid, det, 1.0)
+    tvec = starts - v0
+    u = np.einsum("ij,ij->i", tvec, pvec) * inv_det
+    qvec = np.cross(tvec, edge1)
+    v = np.einsum("ij,ij->i", directions, qvec) * inv_det
+    t = np.einsum("ij,ij->i", edge2, qvec) * inv_det
+    inside = (t > _SEGMENT_TOLERANCE) & (t < 1.0 - _SEGMENT_TOLERANCE)
+    return valid & (u >= 0.0) & (v >= 0.0) & (u + v <= 1.0) & inside
+
+
+def _triangle_pairs_intersect(triangles_a: np.ndarray, triangles_b: np.ndarray) -> bool:
+    """Check whether any pair of triangles intersects, pairwise.
+
+    Two non-coplanar triangles intersect if an edge of one crosses the other.
+
+    Args:
+        triangles_a: Triangles of shape ``(N, 3, 3)``.
+        triangles_b: Triangles of shape ``(N, 3, 3)``.
+
+    Returns:
+        True if at least one pair intersects.
+    """
+    for first, second in ((triangles_a, triangles_b), (triangles_b, triangles_a)):
+        for i in range(3):
+            if _segments_cross_triangles(first[:, i], first[:, (i + 1) % 3], second).any():
+                return True
+    return False
+
+
+def _point_inside(point: np.ndarray, triangles: np.ndarray) -> bool:
+    """Check whether a point is inside a closed triangle mesh by ray parity.
+
+    Args:
+        point: The point to test.
+        triangles: Triangles of shape ``(N, 3, 3)`` forming a closed surface.
+
+    Returns:
+        True if a ray from the point crosses the surface an odd number of times.
+    """
+    # A segment longer than the mesh extent stands in for the ray
+    extent = np.linalg.norm(triangles.max(axis=(0, 1)) - triangles.min(axis=(0, 1))) + np.linalg.norm(point)
+    starts = np.broadcast_to(point, (len(triangles), 3))
+    ends = starts + _RAY_DIRECTION * (2.0 * extent + 1.0)
+    return bool(np.count_nonzero(_segments_cross_triangles(starts, ends, triangles)) % 2)
+
+
+def triangle_meshes_overlap(triangles_a: np.ndarray, triangles_b: np.ndarray) -> bool:
+    """Check whether two triangle meshes intersect or one encloses the other.
+
+    Args:
+        triangles_a: World-space triangles of the first mesh, shape ``(N, 3, 3)``.
+        triangles_b: World-space triangles of the second mesh, shape ``(M, 3, 3)``.
+
+    Returns:
+        True if the surfaces cross, if the first vertex of one mesh lies inside the other mesh, or if the
+        center of the overlap of their bounding boxes lies inside both meshes. Touching faces are not reported.
+
+    Example:
+
+    .. code-block:: python
+
+        overlap = triangle_meshes_overlap(get_collider_triangles(prim_a), get_collider_triangles(prim_b))
+    """
+    min_a, max_a = triangles_a.min(axis=(0, 1)), triangles_a.max(axis=(0, 1))
+    min_b, max_b = triangles_b.min(axis=(0, 1)), triangles_b.max(axis=(0, 1))
+    overlap_min, overlap_max = np.maximum(min_a, min_b), np.minimum(max_a, max_b)
+    if (overlap_min > overlap_max).any():
+        return False
+
+    # Only triangles touching the overlap box can intersect the other mesh
+    def _cull(triangles: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        tri_min, tri_max = triangles.min(axis=1), triangles.max(axis=1)
+        keep = ((tri_min <= overlap_max) & (tri_max >= overlap_min)).all(axis=1)
+        return triangles[keep], tri_min[keep], tri_max[keep]
+
+    culled_a, culled_min_a, culled_max_a = _cull(triangles_a)
+    culled_b, culled_min_b, culled_max_b = _cull(triangles_b)
+    if len(culled_a) and len(culled_b):
+        block_size = max(1, _MAX_PAIRS_PER_BLOCK // len(culled_b))
+        for start in range(0, len(culled_a), block_size):
+            end = start + block_size
+            boxes_overlap = (
+                (culled_min_a[start:end, None] <= culled_max_b[None])
+                & (culled_max_a[start:end, None] >= culled_min_b[None])
+            ).all(axis=2)
+            index_a, index_b = np.nonzero(boxes_overlap)
+            if len(index_a) and _triangle_pairs_intersect(culled_a[start:end][index_a], culled_b[index_b]):
+                return True
+
+    # No surface crossing, one mesh can still be enclosed by the other
+    if (min_a >= min_b).all() and (max_a <= max_b).all() and _point_inside(triangles_a[0, 0], triangles_b):
+        return True
+    if (min_b >= min_a).all() and (max_b <= max_a).all() and _point_inside(triangles_b[0, 0], triangles_a):
+        return True
+    # Surfaces sharing coplanar faces (e.g. equal boxes offset along one axis) cross only on edges
+    if (overlap_max - overlap_min > _SEGMENT_TOLERANCE).all():
+        center = 0.5 * (overlap_min + overlap_max)
+        return _point_inside(center, triangles_a) and _point_inside(center, triangles_b)
+    return False
+
+
+def _sweep_and_prune(box_min: np.ndarray, box_max: np.ndarray) -> list[tuple[int, int]]:
+    """Find the pairs of overlapping axis-aligned boxes.
+
+    Args:
+        box_min: Minimum corners of shape ``(N, 3)``.
+        box_max: Maximum corners of shape ``(N, 3)``.
+
+    Returns:
+        Index pairs ``(i, j)`` with ``i < j`` of the overlapping boxes.
+    """
+    order = np.argsort(box_min[:, 0], kind="stable")
+    sorted_min, sorted_max = box_min[order], box_max[order]
+    # Boxes after i along x overlap it on x while their minimum is below its maximum
+    ends = np.searchsorted(sorted_min[:, 0], sorted_max[:, 0], side="right")
+    pairs = []
+    for i in range(len(order)):
+        if ends[i] <= i + 1:
+            continue
+        others = np.arange(i + 1, ends[i])
+        overlap = (
+            (sorted_min[others, 1:] <= sorted_max[i, 1:]) & (sorted_max[others, 1:] >= sorted_min[i, 1:])
+        ).all(axis=1)
+        for j in others[overlap]:
+            a, b = int(order[i]), int(order[j])
+            pairs.append((min(a, b), max(a, b)))
+    return pairs
+
+
+def find_overlapping_collider_pairs(
+    stage: Usd.Stage, root_path: Sdf.Path | str | None = None, max_workers: int | None = None
+) -> set[tuple[str, str]]:
+    """Find the pairs of colliders whose geometry overlaps, without running a simulation.
+
+    Mirrors the pairs the physics engine would report on its first step: colliders with
+    ``physics:collisionEnabled`` set to False, pairs of colliders of the same rigid body and pairs without
+    any rigid body are skipped. Unlike the physics engine, mesh colliders are tested with their triangles
+    rather than their collision approximation, and contact offsets are not applied.
+
+    Args:
+        stage: The USD stage to check.
+        root_path: Only colliders under this path are checked. All colliders are checked if None.
+        max_workers: Maximum number of threads for the narrowphase. Defaults to the ``ThreadPoolExecutor``
+            default.
+
+    Returns:
+        Pairs of collider paths, each sorted alphabetically.
+
+    Example:
+
+    .. code-block:: python
+
+        pairs = find_overlapping_collider_pairs(stage, root_path=stage.GetDefaultPrim().GetPath())
+    """
+    stage_index = get_stage_index(stage)
+    root_path = Sdf.Path(root_path) if root_path is not None else Sdf.Path.absoluteRootPath
+
+    paths, bodies, meshes = [], [], []
+    for prim in stage_index.colliders:
+        path = prim.GetPath()
+        if not path.HasPrefix(root_path):
+            continue
+        enabled = UsdPhysics.CollisionAPI(prim).GetCollisionEnabledAttr().Get()
+        if enabled is not None and not enabled:
+            continue
+        triangles = get_collider_triangles(prim, stage_index.xform_cache)
+        if triangles is None:
+            continue
+        paths.append(str(path))
+        bodies.append(stage_index.rigid_body_ancestor(prim))
+        meshes.append(triangles)
+    if len(meshes) < 2:
+        return set()
+
+    box_min = np.array([triangles.min(axis=(0, 1)) for triangles in meshes])
+    box_max = np.array([triangles.max(axis=(0, 1)) for triangles in meshes])
+    candidates = [
+        (i, j)
+        for i, j in _sweep_and_prune(box_min, box_max)
+        if bodies[i] != bodies[j] and not (bodies[i].isEmpty and bodies[j].isEmpty)
+    ]
+
+    # numpy releases the GIL in the narrowphase kernels, so the pairs are tested concurrently
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        overlaps = list(executor.map(lambda pair: triangle_meshes_overlap(*(meshes[i] for i in pair)), candidates))
+    return {tuple(sorted((paths[i], paths[j]))) for (i, j), overlap in zip(candidates, overlaps) if overlap}
@@ -26,6 +26,8 @@ from omni.physics.core import ContactEventType, get_physics_simulation_interface
 from omni.physx.bindings._physx import SETTING_UPDATE_TO_USD
 from pxr import Gf, PhysicsSchemaTools, PhysxSchema, Sdf, Usd, UsdGeom, UsdPhysics, UsdUtils
 
+from .mesh_overlap import find_overlapping_collider_pairs
+from .stage_index import ValidationStageIndex, get_stage_index
 from .util import DedupBaseRuleChecker
 
 # from omni.physx.scripts.physicsUtils import get_initial_collider_pairs # ideally, import Ales's code here, blocked atm
@@ -134,9 +136,8 @@ class RigidBodyHasMassAPI(DedupBaseRuleChecker):
         Args:
             stage: The USD stage to validate.
         """
-        for prim in stage.Traverse():
-            if prim.HasAPI(UsdPhysics.RigidBodyAPI):
-                self.check_rigid_body_prim(prim)
+        for prim in get_stage_index(stage).rigid_bodies:
+            self.check_rigid_body_prim(prim)
 
 
 @registerRule("IsaacSim.PhysicsRules")
@@ -160,9 +161,12 @@ class RigidBodyHasCollider(DedupBaseRuleChecker):
             # check if the rigid body api is enabled
             if not rigid_body_api.GetRigidBodyEnabledAttr().Get():
                 return
-            for p in Usd.PrimRange(prim, Usd.TraverseInstanceProxies()):
-                if p.HasAPI(UsdPhysics.CollisionAPI):
+            stage_index = get_stage_index(prim.GetStage())
+            if stage_index.contains(prim):
+                if stage_index.has_collider_in_subtree(prim):
                     return
+            elif any(p.HasAPI(UsdPhysics.CollisionAPI) for p in Usd.PrimRange(prim, Usd.TraverseInstanceProxies())):
+                return
             self._AddError(message=f"Rigid body {prim.GetPath()} has rigid body api but no collision api", at=prim)
 
 
@@ -190,43 +194,37 @@ def _find_rigid_body_ancestor(prim: Usd.Prim) -> Sdf.Path:
     return Sdf.Path.emptyPath
 
 
+def _rigid_body_ancestor(prim: Usd.Prim, stage_index: ValidationStageIndex | None) -> Sdf.Path:
+    """Look up the rigid body owning a prim in an index, walking up the hierarchy if it is not indexed.
+
+    Args:
+        prim: The prim to search upward from.
+        stage_index: Index of the prim's stage, or None to always walk up the hierarchy.
+
+    Returns:
+        Path of the nearest rigid body ancestor (inclusive), or ``Sdf.Path.emptyPath`` if none.
+    """
+    if stage_index is not None and stage_index.contains(prim):
+        return stage_index.rigid_body_ancestor(prim)
+    return _find_rigid_body_ancestor(prim)
+
+
 def compute_adjacent_mesh_dict(stage: Usd.Stage) -> dict:
     """Compute a dictionary mapping body paths to lists of adjacent body paths.
 
+    The joint adjacency is read from the shared :class:`~.stage_index.ValidationStageIndex`.
+
     Args:
         stage: The USD stage to analyze.
 
     Returns:
         A dictionary mapping body paths to lists of adjacent body paths.
     """
-    # Traverse through the joints, log every pair of connected bodies
     defaultPrim = stage.GetDefaultPrim()
     if not defaultPrim or not defaultPrim.IsValid():
         return {}
 
-    adjacent_mesh_matrix = {}
-
-    for prim in stage.Traverse():
-        if prim.HasAPI(PhysxSchema.PhysxJointAPI):
-            joint = UsdPhysics.Joint(prim)
-            body0_targets = joint.GetBody0Rel().GetTargets()
-            if not body0_targets:
-                continue
-            body0 = body0_targets[0]
-            body1_targets = joint.GetBody1Rel().GetTargets()
-            if not body1_targets:
-                continue
-            body1 = body1_targets[0]
-
-            # body0 and body1 are adjacent, log into joint dict
-            if body0 not in adjacent_mesh_matrix:
-                adjacent_mesh_matrix[body0] = []
-            if body1 not in adjacent_mesh_matrix:
-                adjacent_mesh_matrix[body1] = []
-            adjacent_mesh_matrix[body0].append(body1)
-            adjacent_mesh_matrix[body1].append(body0)
-
-    return adjacent_mesh_matrix
+    return {body: list(adjacent) for body, adjacent in get_stage_index(stage).adjacent_bodies.items()}
 
 
 # Copied from Ales's code
@@ -325,7 +323,9 @@ class NonAdjacentCollisionMeshesDoNotClash(DedupBaseRuleChecker):
     """Validates that non-adjacent collision meshes don't intersect.
 
     This rule checks that collision meshes that aren't connected by joints don't
-    intersect each other, which can cause unstable physics simulation.
+    intersect each other, which can cause unstable physics simulation. Intersections
+    are found geometrically with :func:`find_overlapping_collider_pairs`, without
+    stepping the simulation.
     """
 
     def CheckStage(self, stage: Usd.Stage) -> None:  # noqa: N802
@@ -334,20 +334,29 @@ class NonAdjacentCollisionMeshesDoNotClash(DedupBaseRuleChecker):
         Populates ``self.adjacent_mesh_matrix`` and ``self.collisions_pairs``
         from the stage, then delegates to :meth:`_check_pairs`. The
         ``_check_pairs`` helper is public-to-the-class so tests can inject
-        pre-computed pair/adjacency state without running a live PhysX step.
+        pre-computed pair/adjacency state without computing the overlaps.
+
+        Only colliders under the default prim are tested for overlaps, the
+        same scope :meth:`_check_pairs` reports on.
 
         Args:
             stage: The USD stage to validate.
         """
+        stage_index = get_stage_index(stage)
         self.adjacent_mesh_matrix = compute_adjacent_mesh_dict(stage)  # keyed on rigid-body paths
-        self.collisions_pairs = get_initial_collider_pairs(stage)  # tuples of collider Sdf paths
-        self._check_pairs(stage)
+        default_prim = stage.GetDefaultPrim()
+        if not default_prim or not default_prim.IsValid():
+            self.collisions_pairs = set()
+            return
+        # tuples of collider Sdf paths
+        self.collisions_pairs = find_overlapping_collider_pairs(stage, root_path=default_prim.GetPath())
+        self._check_pairs(stage, stage_index)
 
-    def _check_pairs(self, stage: Usd.Stage) -> None:
+    def _check_pairs(self, stage: Usd.Stage, stage_index: ValidationStageIndex | None = None) -> None:
         """Run the inner pair-filter loop.
 
         Factored out of :meth:`CheckStage` so tests can inject collision pairs
-        without running a live PhysX simulation step.
+        without computing the collider overlaps.
 
         Two filters:
 
@@ -366,6 +375,8 @@ class NonAdjacentCollisionMeshesDoNotClash(DedupBaseRuleChecker):
 
         Args:
             stage: The USD stage being validated. Used for path->prim lookups.
+            stage_index: Index providing the rigid-body ancestors of the colliders. Colliders missing
+                from the index (or all colliders if None) are resolved by walking up the hierarchy.
         """
         default_prim = stage.GetDefaultPrim()
         if not default_prim or not default_prim.IsValid():
@@ -385,8 +396,8 @@ class NonAdjacentCollisionMeshesDoNotClash(DedupBaseRuleChecker):
                 continue
 
             # Walk to the rigid-body ancestor for adjacency lookup.
-            body0_rb = _find_rigid_body_ancestor(body0_prim)
-            body1_rb = _find_rigid_body_ancestor(body1_prim)
+            body0_rb = _rigid_body_ancestor(body0_prim, stage_index)
+            body1_rb = _rigid_body_ancestor(body1_prim, stage_index)
             if body0_rb.isEmpty or body1_rb.isEmpty:
                 # Orphan collider without a rigid-body ancestor. Not this validator's job.
                 continue
@@ -453,11 +464,9 @@ class HasArticulationRoot(DedupBaseRuleChecker):
         Args:
             stage: The USD stage to validate.
         """
-        if not any(prim.IsA(UsdPhysics.Joint) for prim in stage.Traverse()):
+        stage_index = get_stage_index(stage)
+        if not stage_index.joints or stage_index.articulation_roots:
             return
-        for prim in stage.Traverse():
-            if prim.HasAPI(UsdPhysics.ArticulationRootAPI):
-                return
         self._AddError(
             message="Articulation Root API is not set on any prim in the stage",
             at=stage,
@@ -25,6 +25,7 @@ from omni.asset_validator.core import AuthoringLayers, registerRule
 from pxr import Usd, UsdPhysics
 from usd.schema.isaac import robot_schema
 
+from .stage_index import get_stage_index
 from .util import DedupBaseRuleChecker, is_relationship_prepended, make_relationship_prepended
 
 # Compiled once at module level for efficiency.
@@ -238,11 +239,9 @@ class JointsExist(DedupBaseRuleChecker):
         Args:
             stage: The USD stage to validate for joint prims.
         """
-        if not any(prim.IsA(UsdPhysics.Joint) for prim in stage.Traverse()):
+        stage_index = get_stage_index(stage)
+        if not stage_index.joints or stage_index.prims_with_api(robot_schema.Classes.JOINT_API.value):
             return
-        for prim in stage.Traverse():
-            if prim.HasAPI(robot_schema.Classes.JOINT_API.value):
-                return
         self._AddWarning(
             message=f"No joints found in robot asset <{stage.GetRootLayer().realPath}>",
             at=stage,
@@ -266,11 +265,9 @@ class LinksExist(DedupBaseRuleChecker):
         Args:
             stage: The USD stage to validate for link existence.
         """
-        if not any(prim.IsA(UsdPhysics.Joint) for prim in stage.Traverse()):
+        stage_index = get_stage_index(stage)
+        if not stage_index.joints or stage_index.prims_with_api(robot_schema.Classes.LINK_API.value):
             return
-        for prim in stage.Traverse():
-            if prim.HasAPI(robot_schema.Classes.LINK_API.value):
-                return
         self._AddWarning(
             message=f"No links found in robot asset <{stage.GetRootLayer().realPath}>",
             at=stage,
@@ -417,7 +414,7 @@ class VerifyRobotPhysicsAttributesSourceLayer(DedupBaseRuleChecker):
             stage: The USD stage to validate.
         """
         # examine every physics attribute in the stage and ensure that they are authored in the physics layer
-        for prim in stage.Traverse():
+        for prim in get_stage_index(stage).prims:
             for attr in prim.GetAttributes():
                 property_stack = attr.GetPropertyStack()
                 for stack_item in property_stack:
@@ -452,8 +449,9 @@ class VerifyRobotPhysicsSchemaSourceLayer(DedupBaseRuleChecker):
             stage: The USD stage to validate for physics schema layer compliance.
         """
         # examine every prim schema in the stage and ensure that they are authored in the physics layer
-        for prim in stage.Traverse():
-            for layer in stage.GetLayerStack():
+        layer_stack = stage.GetLayerStack()
+        for prim in get_stage_index(stage).prims:
+            for layer in layer_stack:
                 prim_spec = layer.GetPrimAtPath(prim.GetPath())
 
                 if not prim_spec:
@@ -0,0 +1,223 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Stage index shared by the validation rules, built with a single traversal of the stage."""
+
+from __future__ import annotations
+
+import weakref
+
+from pxr import PhysxSchema, Sdf, Tf, Usd, UsdGeom, UsdPhysics
+
+__all__ = ["ValidationStageIndex", "get_stage_index", "invalidate_stage_index"]
+
+
+class ValidationStageIndex:
+    """Prims of a stage grouped by the schemas the validation rules query.
+
+    The index is built with one ``Usd.PrimRange`` sweep over the stage (including instance proxies) and
+    records, for the prims visited by ``stage.Traverse()``, the prims grouped by applied API schema, the
+    joints, rigid bodies and articulation roots, and the bodies connected by each PhysX joint. For every
+    visited prim, including instance proxies, it also records the colliders, the nearest rigid body
+    ancestor and whether a collider exists in its subtree.
+
+    Rules get the index through :func:`get_stage_index`, which shares it between all rules of a validation
+    run and drops it when the stage changes.
+
+    Args:
+        stage: The USD stage to index.
+
+    Example:
+
+    .. code-block:: python
+
+        index = get_stage_index(stage)
+        for prim in index.rigid_bodies:
+            print(prim.GetPath(), index.has_collider_in_subtree(prim))
+    """
+
+    def __init__(self, stage: Usd.Stage) -> None:
+        self.prims: list[Usd.Prim] = []
+        """Prims visited by ``stage.Traverse()``, in traversal order."""
+        self.joints: list[Usd.Prim] = []
+        """Prims that are a ``UsdPhysics.Joint``."""
+        self.rigid_bodies: list[Usd.Prim] = []
+        """Prims with ``UsdPhysics.RigidBodyAPI`` applied."""
+        self.articulation_roots: list[Usd.Prim] = []
+        """Prims with ``UsdPhysics.ArticulationRootAPI`` applied."""
+        self.colliders: list[Usd.Prim] = []
+        """Prims with ``UsdPhysics.CollisionAPI`` applied, including instance proxies."""
+        self.adjacent_bodies: dict[Sdf.Path, list[Sdf.Path]] = {}
+        """Bodies connected by a joint with ``PhysxSchema.PhysxJointAPI``, in both directions."""
+        self.xform_cache = UsdGeom.XformCache()
+        """Transform cache shared by the rules, valid until the index is dropped."""
+
+        self._by_api: dict[str, list[Usd.Prim]] = {}
+        self._rigid_body_ancestors: dict[Sdf.Path, Sdf.Path] = {}
+        self._collider_subtrees: set[Sdf.Path] = set()
+
+        empty_path = Sdf.Path.emptyPath
+        for prim in Usd.PrimRange.Stage(stage, Usd.TraverseInstanceProxies()):
+            path = prim.GetPath()
+            is_rigid_body = prim.HasAPI(UsdPhysics.RigidBodyAPI)
+            if is_rigid_body:
+                self._rigid_body_ancestors[path] = path
+            else:
+                self._rigid_body_ancestors[path] = self._rigid_body_ancestors.get(path.GetParentPath(), empty_path)
+            if prim.HasAPI(UsdPhysics.CollisionAPI):
+                self.colliders.append(prim)
+            if prim.IsInstanceProxy():
+                continue
+
+            self.prims.append(prim)
+            for schema in prim.GetAppliedSchemas():
+                self._by_api.setdefault(schema.split(":", 1)[0], []).append(prim)
+            if is_rigid_body:
+                self.rigid_bodies.append(prim)
+            if prim.HasAPI(UsdPhysics.ArticulationRootAPI):
+                self.articulation_roots.append(prim)
+            if prim.IsA(UsdPhysics.Joint):
+                self.joints.append(prim)
+            if prim.HasAPI(PhysxSchema.PhysxJointAPI):
+                self._add_joint_bodies(UsdPhysics.Joint(prim))
+
+        # Mark the colliders and their ancestors, stopping at the first ancestor already marked
+        for collider in self.colliders:
+            path = collider.GetPath()
+            while path not in self._collider_subtrees and path != Sdf.Path.absoluteRootPath:
+                self._collider_subtrees.add(path)
+                path = path.GetParentPath()
+
+    def _add_joint_bodies(self, joint: UsdPhysics.Joint) -> None:
+        """Record the two bodies of a joint as adjacent.
+
+        Args:
+            joint: The joint to record. Joints missing a body target are skipped.
+        """
+        body0_targets = joint.GetBody0Rel().GetTargets()
+        body1_targets = joint.GetBody1Rel().GetTargets()
+        if not body0_targets or not body1_targets:
+            return
+        body0, body1 = body0_targets[0], body1_targets[0]
+        self.adjacent_bodies.setdefault(body0, []).append(body1)
+        self.adjacent_bodies.setdefault(body1, []).append(body0)
+
+    def contains(self, prim: Usd.Prim) -> bool:
+        """Check whether a prim was visited when building the index.
+
+        Args:
+            prim: The prim to look up.
+
+        Returns:
+            True if the prim (or instance proxy) is part of the index.
+        """
+        return prim.GetPath() in self._rigid_body_ancestors
+
+    def prims_with_api(self, schema_name: str) -> list[Usd.Prim]:
+        """Get the prims with an applied API schema.
+
+        Args:
+            schema_name: Name of the API schema, e.g. ``"PhysicsRigidBodyAPI"``. Multiple-apply schemas
+                match all their instances, e.g. ``"PhysicsDriveAPI"`` matches ``"PhysicsDriveAPI:angular"``.
+
+        Returns:
+            The prims with the schema applied, in traversal order. Instance proxies are not included.
+        """
+        return self._by_api.get(schema_name, [])
+
+    def rigid_body_ancestor(self, prim: Usd.Prim) -> Sdf.Path:
+        """Get the nearest ancestor (inclusive) of a prim with ``UsdPhysics.RigidBodyAPI`` applied.
+
+        Args:
+            prim: The prim (typically a collider) to search upward from. Must be part of the index.
+
+        Returns:
+            Path of the rigid body owning the prim, or ``Sdf.Path.emptyPath`` if there is none.
+        """
+        return self._rigid_body_ancestors.get(prim.GetPath(), Sdf.Path.emptyPath)
+
+    def has_collider_in_subtree(self, prim: Usd.Prim) -> bool:
+        """Check whether a prim or one of its descendants has ``UsdPhysics.CollisionAPI`` applied.
+
+        Descendants include instance proxies.
+
+        Args:
+            prim: The prim whose subtree to check. Must be part of the index.
+
+        Returns:
+            True if the subtree contains a collider.
+        """
+        return prim.GetPath() in self._collider_subtrees
+
+
+class _StageIndexEntry:
+    """Index of one stage, dropped on USD change notices.
+
+    Args:
+        stage: The USD stage whose changes are observed.
+    """
+
+    def __init__(self, stage: Usd.Stage) -> None:
+        self.index: ValidationStageIndex | None = None
+        self._listener = Tf.Notice.Register(Usd.Notice.ObjectsChanged, self._on_objects_changed, stage)
+
+    def _on_objects_changed(self, notice: Usd.Notice.ObjectsChanged, sender: Usd.Stage) -> None:
+        # Any edit may change schemas, joint bodies or transforms, rebuilding is cheaper than tracking them
+        self.index = None
+
+
+_stage_indices: weakref.WeakKeyDictionary[Usd.Stage, _StageIndexEntry] = weakref.WeakKeyDictionary()
+
+
+def get_stage_index(stage: Usd.Stage) -> ValidationStageIndex:
+    """Return the index of a stage, building it if needed.
+
+    The index is kept while the stage object is alive and is rebuilt after any USD change on the stage,
+    so all rules of a validation run share one traversal while fixes applied between runs are picked up.
+
+    Args:
+        stage: The USD stage to index.
+
+    Returns:
+        The index of the stage.
+
+    Example:
+
+    .. code-block:: python
+
+        index = get_stage_index(stage)
+        if index.joints and not index.articulation_roots:
+            print("Stage has joints but no articulation root")
+    """
+    entry = _stage_indices.get(stage)
+    if entry is None:
+        entry = _StageIndexEntry(stage)
+        _stage_indices[stage] = entry
+    if entry.index is None:
+        entry.index = ValidationStageIndex(stage)
+    return entry.index
+
+
+def invalidate_stage_index(stage: Usd.Stage) -> None:
+    """Drop the index of a stage so the next query rebuilds it.
+
+    Only needed for changes USD does not report, such as edits made while notices are blocked.
+
+    Args:
+        stage: The USD stage whose index to drop.
+    """
+    entry = _stage_indices.get(stage)
+    if entry is not None:
+        entry.index = None
@@ -0,0 +1,188 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the geometric collider overlap test used by ``NonAdjacentCollisionMeshesDoNotClash``."""
+
+from __future__ import annotations
+
+import numpy as np
+import omni.kit.test
+from isaacsim.asset.validation.mesh_overlap import (
+    find_overlapping_collider_pairs,
+    get_collider_triangles,
+    triangle_meshes_overlap,
+)
+from isaacsim.asset.validation.physics_rules import NonAdjacentCollisionMeshesDoNotClash
+from pxr import Gf, PhysxSchema, Sdf, Usd, UsdGeom, UsdPhysics
+
+
+def _add_link(stage: Usd.Stage, name: str, position: tuple[float, float, float]) -> Usd.Prim:
+    """Define a rigid body link under /Robot at the given position.
+
+    Args:
+        stage: The stage to author on.
+        name: Name of the link.
+        position: World position of the link.
+
+    Returns:
+        The link prim.
+    """
+    link = UsdGeom.Xform.Define(stage, f"/Robot/{name}")
+    link.AddTranslateOp().Set(Gf.Vec3d(*position))
+    UsdPhysics.RigidBodyAPI.Apply(link.GetPrim())
+    return link.GetPrim()
+
+
+def _add_cube(
+    stage: Usd.Stage, path: str, size: float, offset: tuple[float, float, float] = (0.0, 0.0, 0.0)
+) -> Usd.Prim:
+    """Define a cube collider.
+
+    Args:
+        stage: The stage to author on.
+        path: Path of the cube.
+        size: Edge length of the cube.
+        offset: Translation of the cube relative to its parent.
+
+    Returns:
+        The cube prim.
+    """
+    cube = UsdGeom.Cube.Define(stage, path)
+    cube.CreateSizeAttr().Set(size)
+    cube.AddTranslateOp().Set(Gf.Vec3d(*offset))
+    UsdPhysics.CollisionAPI.Apply(cube.GetPrim())
+    return cube.GetPrim()
+
+
+def _new_robot_stage() -> Usd.Stage:
+    """Create a stage with an empty /Robot default prim.
+
+    Returns:
+        The in-memory stage.
+    """
+    stage = Usd.Stage.CreateInMemory()
+    stage.SetDefaultPrim(UsdGeom.Xform.Define(stage, "/Robot").GetPrim())
+    return stage
+
+
+class _ErrorCapturingChecker(NonAdjacentCollisionMeshesDoNotClash):
+    """Rule that records the reported error messages."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.errors: list[str] = []
+
+    def _AddError(self, message: str, **kwargs: object) -> None:  # type: ignore[override]  # noqa: N802
+        self.errors.append(message)
+
+
+class TestMeshOverlap(omni.kit.test.AsyncTestCase):
+    """Tests for :func:`find_overlapping_collider_pairs` and the triangle helpers."""
+
+    async def test_overlapping_and_separated_cubes(self) -> None:
+        """Interpenetrating colliders of different bodies are reported, separated or touching ones are not."""
+        stage = _new_robot_stage()
+        for i, x in enumerate((0.0, 0.8, 1.8, 2.8)):
+            _add_link(stage, f"link{i}", (x, 0.0, 0.0))
+            _add_cube(stage, f"/Robot/link{i}/collisions/box", 1.0)
+
+        # link0/link1 overlap by 0.2, link1/link2 and link2/link3 only touch along a face
+        self.assertEqual(
+            find_overlapping_collider_pairs(stage),
+            {("/Robot/link0/collisions/box", "/Robot/link1/collisions/box")},
+        )
+        self.assertEqual(find_overlapping_collider_pairs(stage, max_workers=1), find_overlapping_collider_pairs(stage))
+
+    async def test_same_body_and_disabled_colliders_are_skipped(self) -> None:
+        """Colliders of one rigid body and colliders with collision disabled are never reported."""
+        stage = _new_robot_stage()
+        _add_link(stage, "link0", (0.0, 0.0, 0.0))
+        _add_cube(stage, "/Robot/link0/collisions/box_a", 1.0)
+        _add_cube(stage, "/Robot/link0/collisions/box_b", 1.0, (0.5, 0.0, 0.0))
+        self.assertEqual(find_overlapping_collider_pairs(stage), set())
+
+        _add_link(stage, "link1", (0.5, 0.0, 0.0))
+        disabled = _add_cube(stage, "/Robot/link1/collisions/box", 1.0)
+        UsdPhysics.CollisionAPI(disabled).CreateCollisionEnabledAttr().Set(False)
+        self.assertEqual(find_overlapping_collider_pairs(stage), set())
+
+        UsdPhysics.CollisionAPI(disabled).GetCollisionEnabledAttr().Set(True)
+        self.assertEqual(len(find_overlapping_collider_pairs(stage)), 2)
+        self.assertEqual(find_overlapping_collider_pairs(stage, root_path="/Robot/link0"), set())
+
+    async def test_enclosed_collider_is_reported(self) -> None:
+        """A collider fully inside another one is reported even though the surfaces do not cross."""
+        stage = _new_robot_stage()
+        _add_link(stage, "link0", (0.0, 0.0, 0.0))
+        _add_cube(stage, "/Robot/link0/collisions/box", 2.0)
+        _add_link(stage, "link1", (0.1, 0.0, 0.0))
+        sphere = UsdGeom.Sphere.Define(stage, "/Robot/link1/collisions/sphere")
+        sphere.CreateRadiusAttr().Set(0.25)
+        UsdPhysics.CollisionAPI.Apply(sphere.GetPrim())
+
+        self.assertEqual(
+            find_overlapping_collider_pairs(stage),
+            {("/Robot/link0/collisions/box", "/Robot/link1/collisions/sphere")},
+        )
+
+    async def test_collider_triangles(self) -> None:
+        """Quad meshes are fan-triangulated and implicit shapes are tessellated in world space."""
+        stage = _new_robot_stage()
+        _add_link(stage, "link0", (1.0, 2.0, 3.0))
+        mesh = UsdGeom.Mesh.Define(stage, "/Robot/link0/collisions/quad")
+        mesh.CreatePointsAttr().Set([(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)])
+        mesh.CreateFaceVertexCountsAttr().Set([4])
+        mesh.CreateFaceVertexIndicesAttr().Set([0, 1, 2, 3])
+
+        triangles = get_collider_triangles(mesh.GetPrim())
+        self.assertEqual(triangles.shape, (2, 3, 3))
+        np.testing.assert_allclose(triangles.min(axis=(0, 1)), [1.0, 2.0, 3.0])
+        np.testing.assert_allclose(triangles.max(axis=(0, 1)), [2.0, 3.0, 3.0])
+
+        capsule = UsdGeom.Capsule.Define(stage, "/Robot/link0/collisions/capsule")
+        capsule.CreateRadiusAttr().Set(0.5)
+        capsule.CreateHeightAttr().Set(2.0)
+        capsule.CreateAxisAttr().Set("X")
+        triangles = get_collider_triangles(capsule.GetPrim())
+        np.testing.assert_allclose(triangles.min(axis=(0, 1))[0], -0.5, atol=1e-6)
+        np.testing.assert_allclose(triangles.max(axis=(0, 1))[0], 2.5, atol=1e-6)
+
+        self.assertIsNone(get_collider_triangles(UsdGeom.Xform.Define(stage, "/Robot/link0/empty").GetPrim()))
+
+        # Crossing triangles overlap, parallel ones do not
+        first = np.array([[[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0]]])
+        crossing = np.array([[[0.2, 0.2, -1.0], [0.2, 0.2, 1.0], [0.3, 0.3, 1.0]]])
+        self.assertTrue(triangle_meshes_overlap(first, crossing))
+        self.assertFalse(triangle_meshes_overlap(first, first + [0.0, 0.0, 0.5]))
+
+    async def test_rule_reports_overlapping_non_adjacent_colliders(self) -> None:
+        """The rule flags overlapping colliders of bodies that are not connected by a joint."""
+        stage = _new_robot_stage()
+        for i, x in enumerate((0.0, 0.8)):
+            _add_link(stage, f"link{i}", (x, 0.0, 0.0))
+            _add_cube(stage, f"/Robot/link{i}/collisions/box", 1.0)
+
+        checker = _ErrorCapturingChecker()
+        checker.CheckStage(stage)
+        self.assertEqual(len(checker.errors), 1)
+        self.assertIn("/Robot/link0/collisions/box", checker.errors[0])
+
+        joint = UsdPhysics.RevoluteJoint.Define(stage, "/Robot/joints/j0")
+        joint.CreateBody0Rel().SetTargets([Sdf.Path("/Robot/link0")])
+        joint.CreateBody1Rel().SetTargets([Sdf.Path("/Robot/link1")])
+        PhysxSchema.PhysxJointAPI.Apply(joint.GetPrim())
+        checker = _ErrorCapturingChecker()
+        checker.CheckStage(stage)
+        self.assertEqual(checker.errors, [])
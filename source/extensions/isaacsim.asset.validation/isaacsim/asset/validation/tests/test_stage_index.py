@@ -0,0 +1,108 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the stage index shared by the validation rules."""
+
+from __future__ import annotations
+
+import omni.kit.test
+from isaacsim.asset.validation.physics_rules import _find_rigid_body_ancestor, compute_adjacent_mesh_dict
+from isaacsim.asset.validation.stage_index import get_stage_index, invalidate_stage_index
+from pxr import PhysxSchema, Sdf, Usd, UsdGeom, UsdPhysics
+
+
+def _build_robot_stage() -> Usd.Stage:
+    """Build a three-link robot with nested and instanced colliders.
+
+    /Robot                      — default prim, ArticulationRootAPI
+    /Robot/link0                — rigid body, collider at /Robot/link0/collisions/mesh_0
+    /Robot/link1                — rigid body, collider only inside an instance of /Prototypes/collider
+    /Robot/link2                — rigid body, no collider
+    /Robot/joints/j0, j1        — revolute joints with PhysxJointAPI connecting link0-link1 and link1-link2
+
+    Returns:
+        The in-memory stage.
+    """
+    stage = Usd.Stage.CreateInMemory()
+    robot = UsdGeom.Xform.Define(stage, "/Robot").GetPrim()
+    stage.SetDefaultPrim(robot)
+    UsdPhysics.ArticulationRootAPI.Apply(robot)
+    for i in range(3):
+        UsdPhysics.RigidBodyAPI.Apply(UsdGeom.Xform.Define(stage, f"/Robot/link{i}").GetPrim())
+    UsdPhysics.CollisionAPI.Apply(UsdGeom.Cube.Define(stage, "/Robot/link0/collisions/mesh_0").GetPrim())
+
+    stage.CreateClassPrim("/Prototypes")
+    UsdPhysics.CollisionAPI.Apply(stage.DefinePrim("/Prototypes/collider/box", "Cube"))
+    instance = stage.DefinePrim("/Robot/link1/visuals", "Xform")
+    instance.GetReferences().AddInternalReference("/Prototypes/collider")
+    instance.SetInstanceable(True)
+
+    for i in range(2):
+        joint = UsdPhysics.RevoluteJoint.Define(stage, f"/Robot/joints/j{i}")
+        joint.CreateBody0Rel().SetTargets([Sdf.Path(f"/Robot/link{i}")])
+        joint.CreateBody1Rel().SetTargets([Sdf.Path(f"/Robot/link{i + 1}")])
+        PhysxSchema.PhysxJointAPI.Apply(joint.GetPrim())
+    return stage
+
+
+class TestValidationStageIndex(omni.kit.test.AsyncTestCase):
+    """Tests for :class:`ValidationStageIndex` and its per-stage sharing."""
+
+    async def test_index_matches_stage_queries(self) -> None:
+        """The groups, rigid body ancestors, collider subtrees and adjacency match direct stage queries."""
+        stage = _build_robot_stage()
+        index = get_stage_index(stage)
+
+        self.assertEqual([p.GetPath() for p in index.prims], [p.GetPath() for p in stage.Traverse()])
+        self.assertEqual([str(p.GetPath()) for p in index.rigid_bodies], [f"/Robot/link{i}" for i in range(3)])
+        self.assertEqual([str(p.GetPath()) for p in index.articulation_roots], ["/Robot"])
+        self.assertEqual([str(p.GetPath()) for p in index.joints], ["/Robot/joints/j0", "/Robot/joints/j1"])
+        self.assertEqual(index.prims_with_api("PhysicsRigidBodyAPI"), index.rigid_bodies)
+        self.assertEqual(len(index.prims_with_api("PhysxJointAPI")), 2)
+        self.assertEqual(index.prims_with_api("IsaacLinkAPI"), [])
+
+        # Rigid body ancestors, including an instance proxy collider
+        proxy = stage.GetPrimAtPath("/Robot/link1/visuals/box")
+        self.assertTrue(proxy.IsInstanceProxy())
+        for path in ("/Robot/link0/collisions/mesh_0", "/Robot/link1/visuals/box", "/Robot/joints/j0"):
+            prim = stage.GetPrimAtPath(path)
+            self.assertTrue(index.contains(prim))
+            self.assertEqual(index.rigid_body_ancestor(prim), _find_rigid_body_ancestor(prim))
+
+        links = [stage.GetPrimAtPath(f"/Robot/link{i}") for i in range(3)]
+        self.assertEqual([index.has_collider_in_subtree(link) for link in links], [True, True, False])
+        self.assertNotIn(Sdf.Path("/Prototypes/collider"), [p.GetPath() for p in index.prims])
+
+        adjacency = compute_adjacent_mesh_dict(stage)
+        self.assertEqual(adjacency[Sdf.Path("/Robot/link1")], [Sdf.Path("/Robot/link0"), Sdf.Path("/Robot/link2")])
+        adjacency[Sdf.Path("/Robot/link1")].clear()
+        self.assertEqual(len(index.adjacent_bodies[Sdf.Path("/Robot/link1")]), 2)
+
+    async def test_index_is_shared_until_the_stage_changes(self) -> None:
+        """One index is shared while the stage is unchanged and rebuilt after edits."""
+        stage = _build_robot_stage()
+        index = get_stage_index(stage)
+        self.assertIs(get_stage_index(stage), index)
+        self.assertIsNot(get_stage_index(_build_robot_stage()), index)
+
+        link = UsdGeom.Xform.Define(stage, "/Robot/link3").GetPrim()
+        UsdPhysics.RigidBodyAPI.Apply(link)
+        rebuilt = get_stage_index(stage)
+        self.assertIsNot(rebuilt, index)
+        self.assertIn(link, rebuilt.rigid_bodies)
+        self.assertFalse(rebuilt.has_collider_in_subtree(link))
+
+        invalidate_stage_index(stage)
+        self.assertIsNot(get_stage_index(stage), rebuilt)
@@ -0,0 +1,331 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Batched, tiled golden-image comparison used by the benchmark validators."""
+
+import json
+import logging
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TILE_SIZE = 256  # Tile edge length (pixels) for tiled comparison and per-tile reports
+DEFAULT_CHUNK_SIZE = 16  # Image pairs handed to a worker process per task
+
+
+@dataclass
+class ImagePair:
+    """A captured image and the golden image it is compared against.
+
+    Args:
+        key: Identifier reported back with the result (e.g. the relative file path).
+        captured_path: Path of the captured PNG.
+        golden_path: Path of the golden PNG.
+    """
+
+    key: str
+    captured_path: str
+    golden_path: str
+
+
+@dataclass
+class ImageComparisonResult:
+    """Outcome of comparing one image pair.
+
+    Args:
+        key: Identifier of the compared pair.
+        passed: Whether the mean absolute difference is within tolerance.
+        mean_diff: Mean absolute difference over the whole image (0-255 scale for
+            8-bit images). When *early_exit* is True this is a lower bound.
+        early_exit: Whether the comparison stopped before visiting every tile
+            because the tolerance was already exceeded.
+        reason: Failure reason when the images could not be compared, e.g. a shape mismatch.
+        shape: Shape of the compared images.
+        tile_size: Tile edge length used for the comparison.
+        failing_tiles: ``[row, col, mean_diff]`` for every visited tile whose
+            mean difference exceeds the tolerance.
+    """
+
+    key: str
+    passed: bool
+    mean_diff: float | None = None
+    early_exit: bool = False
+    reason: str | None = None
+    shape: tuple[int, ...] | None = None
+    tile_size: int = DEFAULT_TILE_SIZE
+    failing_tiles: list[list[float]] = field(default_factory=list)
+
+    def describe(self, tolerance: float) -> str:
+        """Return a one-line human-readable summary of the result.
+
+        Args:
+            tolerance: Tolerance the result was evaluated against.
+
+        Returns:
+            Summary such as ``mean_diff=1.23`` or ``mean_diff>=7.10 (tolerance=5.0)``.
+        """
+        if self.reason is not None:
+            return self.reason
+        op = ">=" if self.early_exit else "="
+        if self.passed:
+            return f"mean_diff{op}{self.mean_diff:.2f}"
+        return f"mean_diff{op}{self.mean_diff:.2f} (tolerance={tolerance})"
+
+
+def _load_image(path: str) -> np.ndarray:
+    """Decode an image file into a NumPy array.
+
+    Args:
+        path: Image file path.
+
+    Returns:
+        Decoded image array.
+    """
+    from PIL import Image
+
+    with Image.open(path) as img:
+        return np.asarray(img)
+
+
+def compare_image_arrays(
+    key: str,
+    captured: np.ndarray,
+    golden: np.ndarray,
+    tolerance: float,
+    blur_kernel: int = 0,
+    tile_size: int = DEFAULT_TILE_SIZE,
+    early_exit: bool = True,
+) -> ImageComparisonResult:
+    """Compare two image arrays tile by tile.
+
+    The absolute difference is accumulated over tiles of *tile_size* pixels. Since
+    every tile contributes a non-negative amount, the comparison stops as soon as
+    the accumulated difference proves the whole-image mean exceeds *tolerance*
+    (when *early_exit* is set). The pass/fail decision is identical to comparing
+    the whole-image mean absolute difference against *tolerance*.
+
+    Args:
+        key: Identifier reported back with the result.
+        captured: Captured image array.
+        golden: Golden image array.
+        tolerance: Mean-difference threshold.
+        blur_kernel: Gaussian-blur kernel size applied to both images. Use 0 to disable blurring.
+        tile_size: Tile edge length in pixels.
+        early_exit: Whether to stop at the first tile that makes the image fail.
+
+    Returns:
+        Comparison result for the pair.
+    """
+    if captured.shape != golden.shape:
+        return ImageComparisonResult(
+            key=key,
+            passed=False,
+            reason=f"shape mismatch {captured.shape} vs {golden.shape}",
+            shape=tuple(captured.shape),
+            tile_size=tile_size,
+        )
+
+    if blur_kernel > 0:
+        import cv2
+
+        k = blur_kernel | 1  # must be odd
+        captured = cv2.GaussianBlur(captured, (k, k), 0)
+        golden = cv2.GaussianBlur(golden, (k, k), 0)
+
+    height, width = captured.shape[:2]
+    channels = captured.shape[2] if captured.ndim == 3 else 1
+    total_elements = captured.size
+    budget = tolerance * total_elements
+    tile_size = max(1, int(tile_size))
+
+    diff_sum = 0
+    failing_tiles: list[list[float]] = []
+    stopped_early = False
+    for row, y0 in enumerate(range(0, height, tile_size)):
+        # One row band at a time keeps the signed intermediate small.
+        cap_band = captured[y0 : y0 + tile_size].astype(np.int32)
+        gold_band = golden[y0 : y0 + tile_size].astype(np.int32)
+        band_diff = np.abs(cap_band - gold_band)
+        band_height = band_diff.shape[0]
+        n_cols = -(-width // tile_size)
+        padded_width = n_cols * tile_size
+        if padded_width != width:
+            pad = [(0, 0), (0, padded_width - width)] + [(0, 0)] * (band_diff.ndim - 2)
+            band_diff = np.pad(band_diff, pad)
+        # Per-tile sums for the whole band in one reduction.
+        tile_sums = band_diff.reshape(band_height, n_cols, tile_size, -1).sum(axis=(0, 2, 3))
+        tile_widths = np.minimum(tile_size, width - np.arange(n_cols) * tile_size)
+        tile_means = tile_sums / (band_height * tile_widths * channels)
+        for col in np.flatnonzero(tile_means > tolerance):
+            failing_tiles.append([row, int(col), round(float(tile_means[col]), 3)])
+        diff_sum += int(tile_sums.sum())
+        if early_exit and diff_sum > budget and y0 + tile_size < height:
+            stopped_early = True
+            break
+
+    mean_diff = diff_sum / total_elements if total_elements else 0.0
+    return ImageComparisonResult(
+        key=key,
+        passed=mean_diff <= tolerance,
+        mean_diff=float(mean_diff),
+        early_exit=stopped_early,
+        shape=tuple(captured.shape),
+        tile_size=tile_size,
+        failing_tiles=failing_tiles,
+    )
+
+
+def _compare_pair_chunk(
+    pairs: list[ImagePair], tolerance: float, blur_kernel: int, tile_size: int, early_exit: bool
+) -> list[ImageComparisonResult]:
+    """Load and compare a chunk of image pairs (runs inside a worker).
+
+    Images are decoded lazily here so only one pair per worker is resident.
+
+    Args:
+        pairs: Image pairs to compare.
+        tolerance: Mean-difference threshold.
+        blur_kernel: Gaussian-blur kernel size. Use 0 to disable blurring.
+        tile_size: Tile edge length in pixels.
+        early_exit: Whether to stop comparing an image once it is known to fail.
+
+    Returns:
+        Comparison results in the order of *pairs*.
+    """
+    results = []
+    for pair in pairs:
+        try:
+            captured = _load_image(pair.captured_path)
+            golden = _load_image(pair.golden_path)
+        except OSError as e:
+            results.append(ImageComparisonResult(key=pair.key, passed=False, reason=f"failed to load image: {e}"))
+            continue
+        results.append(compare_image_arrays(pair.key, captured, golden, tolerance, blur_kernel, tile_size, early_exit))
+    return results
+
+
+class BatchImageComparator:
+    """Compare many captured/golden image pairs in parallel.
+
+    Pairs are split into chunks that are decoded and compared inside a thread
+    pool (or a process pool when *use_processes* is set), using
+    :func:`compare_image_arrays` for the tiled, early-exiting comparison.
+
+    Args:
+        tolerance: Mean-difference threshold (0-255 scale for 8-bit images).
+        blur_kernel: Gaussian-blur kernel size. Use 0 to disable blurring.
+        tile_size: Tile edge length in pixels.
+        early_exit: Whether to stop comparing an image once it is known to fail.
+        max_workers: Number of workers, or None for the executor default.
+        use_processes: Whether to use a process pool instead of a thread pool. Off by
+            default, since forking inside the Kit process is not safe.
+        chunk_size: Number of pairs handed to a worker per task.
+
+    Example:
+
+    .. code-block:: python
+
+        comparator = BatchImageComparator(tolerance=5.0, blur_kernel=3)
+        results = comparator.compare([ImagePair("rgb_0000.png", "cap/rgb_0000.png", "gold/rgb_0000.png")])
+        comparator.write_report(results, "diff_report.json")
+    """
+
+    def __init__(
+        self,
+        *,
+        tolerance: float,
+        blur_kernel: int = 0,
+        tile_size: int = DEFAULT_TILE_SIZE,
+        early_exit: bool = True,
+        max_workers: int | None = None,
+        use_processes: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        self.tolerance = tolerance
+        self.blur_kernel = blur_kernel
+        self.tile_size = tile_size
+        self.early_exit = early_exit
+        self.max_workers = max_workers
+        self.use_processes = use_processes
+        self.chunk_size = max(1, chunk_size)
+
+    def _make_executor(self) -> Executor:
+        """Create the executor used for a comparison batch.
+
+        Returns:
+            A process pool when *use_processes* is set, otherwise a thread pool.
+        """
+        if self.use_processes:
+            return ProcessPoolExecutor(max_workers=self.max_workers)
+        return ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="image_compare")
+
+    def compare(self, pairs: list[ImagePair]) -> list[ImageComparisonResult]:
+        """Compare all image pairs.
+
+        Falls back to a thread pool if worker processes cannot be started.
+
+        Args:
+            pairs: Image pairs to compare.
+
+        Returns:
+            Comparison results in the order of *pairs*.
+        """
+        if not pairs:
+            return []
+        chunks = [pairs[i : i + self.chunk_size] for i in range(0, len(pairs), self.chunk_size)]
+        args = (self.tolerance, self.blur_kernel, self.tile_size, self.early_exit)
+        try:
+            with self._make_executor() as executor:
+                futures = [executor.submit(_compare_pair_chunk, chunk, *args) for chunk in chunks]
+                return [result for future in futures for result in future.result()]
+        except (BrokenProcessPool, OSError) as e:
+            if not self.use_processes:
+                raise
+            logger.warning("Process pool unavailable for image comparison (%s); falling back to threads", e)
+            with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="image_compare") as executor:
+                futures = [executor.submit(_compare_pair_chunk, chunk, *args) for chunk in chunks]
+                return [result for future in futures for result in future.result()]
+
+    def write_report(self, results: list[ImageComparisonResult], path: str, **metadata: Any) -> None:
+        """Write a compact JSON diff report.
+
+        Only failing tiles are listed per image, so passing suites produce a small file.
+
+        Args:
+            results: Comparison results to report.
+            path: Output JSON path.
+            **metadata: Extra top-level fields to include in the report.
+        """
+        report = {
+            **metadata,
+            "tolerance": self.tolerance,
+            "blur_kernel": self.blur_kernel,
+            "tile_size": self.tile_size,
+            "total": len(results),
+            "passed": sum(1 for r in results if r.passed),
+            "failed": sum(1 for r in results if not r.passed),
+            "images": [asdict(r) for r in results],
+        }
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(report, f, separators=(",", ":"))
@@ -0,0 +1,117 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the batched, tiled golden-image comparison."""
+
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import omni.kit.test
+from isaacsim.benchmark.services.image_comparison import BatchImageComparator, ImagePair, compare_image_arrays
+from isaacsim.benchmark.services.validation import Validator
+from PIL import Image
+
+
+class TestImageComparison(omni.kit.test.AsyncTestCase):
+    """Tests for :func:`compare_image_arrays` and :class:`BatchImageComparator`."""
+
+    async def setUp(self) -> None:
+        """Create a scratch directory for PNG fixtures."""
+        self._tmpdir = tempfile.mkdtemp(prefix="isaacsim_image_compare_")
+        self._rng = np.random.default_rng(0)
+
+    async def tearDown(self) -> None:
+        """Remove the scratch directory."""
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
+
+    def _write(self, name: str, arr: np.ndarray) -> str:
+        path = os.path.join(self._tmpdir, name)
+        Image.fromarray(arr).save(path)
+        return path
+
+    async def test_tiled_mean_matches_whole_image_mean(self) -> None:
+        """Without early exit the tiled mean equals the whole-image mean absolute difference."""
+        a = self._rng.integers(0, 256, size=(70, 53, 3), dtype=np.uint8)
+        b = self._rng.integers(0, 256, size=(70, 53, 3), dtype=np.uint8)
+        expected = np.abs(a.astype(np.int32) - b.astype(np.int32)).mean()
+        result = compare_image_arrays("rgb", a, b, tolerance=1000.0, tile_size=16, early_exit=False)
+        self.assertTrue(result.passed)
+        self.assertAlmostEqual(result.mean_diff, expected, places=6)
+
+    async def test_early_exit_and_failing_tiles(self) -> None:
+        """A large difference in the first tile row stops the comparison and is reported per tile."""
+        a = np.zeros((64, 64), dtype=np.uint8)
+        b = a.copy()
+        b[:16, :16] = 255
+        result = compare_image_arrays("gray", a, b, tolerance=5.0, tile_size=16)
+        self.assertFalse(result.passed)
+        self.assertTrue(result.early_exit)
+        self.assertEqual(result.failing_tiles, [[0, 0, 255.0]])
+
+    async def test_shape_mismatch(self) -> None:
+        """Images with different shapes fail with a reason instead of a mean difference."""
+        result = compare_image_arrays("x", np.zeros((4, 4), np.uint8), np.zeros((4, 5), np.uint8), tolerance=5.0)
+        self.assertFalse(result.passed)
+        self.assertIn("shape mismatch", result.reason)
+
+    async def test_batch_compare_and_report(self) -> None:
+        """Batch results keep input order and the report lists only failing images' tiles."""
+        base = self._rng.integers(0, 256, size=(32, 32, 3), dtype=np.uint8)
+        changed = base.copy()
+        changed[:, :16] = 255 - changed[:, :16]
+        golden = self._write("gold.png", base)
+        pairs = [
+            ImagePair("same", self._write("same.png", base), golden),
+            ImagePair("changed", self._write("changed.png", changed), golden),
+        ] * 5
+        comparator = BatchImageComparator(tolerance=5.0, tile_size=16, use_processes=False, chunk_size=3)
+        results = comparator.compare(pairs)
+        self.assertEqual([r.key for r in results], [p.key for p in pairs])
+        self.assertEqual([r.passed for r in results], [True, False] * 5)
+
+        report_path = os.path.join(self._tmpdir, "report", "diff.json")
+        comparator.write_report(results, report_path, run="test")
+        with open(report_path) as f:
+            report = json.load(f)
+        self.assertEqual((report["total"], report["passed"], report["failed"]), (10, 5, 5))
+        self.assertEqual(report["images"][0]["failing_tiles"], [])
+        self.assertTrue(report["images"][1]["failing_tiles"])
+
+    async def test_validator_reports_exact_mean_unless_early_exit(self) -> None:
+        """Failing frames report the exact mean difference, or a lower bound when early exit is enabled."""
+        golden = np.zeros((64, 64), dtype=np.uint8)
+        captured = golden.copy()
+        captured[:16] = 255
+        captured[32:48] = 255
+        for root, arr in (("captured", captured), ("golden", golden)):
+            os.makedirs(os.path.join(self._tmpdir, root, "camera", "rgb"))
+            self._write(os.path.join(root, "camera", "rgb", "rgb_0000.png"), arr)
+        expected = np.abs(captured.astype(np.int32) - golden.astype(np.int32)).mean()
+
+        frame_results = {}
+        for early_exit in (False, True):
+            validator = Validator(tolerance=5.0, blur_kernel=0, tile_size=16, early_exit=early_exit)
+            results = validator.validate_frames(
+                os.path.join(self._tmpdir, "captured"), os.path.join(self._tmpdir, "golden")
+            )
+            frame_results[early_exit] = results["render_products"]["camera"]["frame_results"][0]
+            self.assertFalse(frame_results[early_exit]["passed"])
+        self.assertAlmostEqual(frame_results[False]["mean_diff"], expected, places=6)
+        self.assertNotIn("mean_diff_lower_bound", frame_results[False])
+        self.assertLess(frame_results[True]["mean_diff_lower_bound"], expected)
+        self.assertNotIn("mean_diff", frame_results[True])
@@ -15,6 +15,7 @@
 
 """Validation helpers for benchmark captures and coordinate checks."""
 
+import bisect
 import json
 import os
 import re
@@ -26,6 +27,8 @@ from typing import Any
 
 import numpy as np
 
+from .image_comparison import DEFAULT_TILE_SIZE, BatchImageComparator, ImageComparisonResult, ImagePair
+
 # Utility constants
 DEFAULT_BLUR = 3  # Gaussian-blur kernel (pixels); 0 disables blurring
 DEFAULT_TOLERANCE = 5.0  # Mean-difference threshold (0-255 scale)
@@ -49,6 +52,17 @@ class Validator:
         golden_root: Base directory storing golden reference images.
         auto_cleanup: Whether the last capture folder is deleted automatically
             after :py:meth:`validate_images` completes.
+        tile_size: Tile edge length (pixels) used by the batched comparison.
+        max_workers: Number of comparison workers, or None for the executor default.
+        use_processes: Whether image pairs are compared in a process pool instead of
+            a thread pool. Off by default, since forking inside the Kit process is not safe.
+        early_exit: Whether :py:meth:`validate_frames` and
+            :py:meth:`validate_frames_by_timestamp` stop comparing a frame once it is
+            known to fail. The pass/fail result is unchanged, but the difference of
+            such a frame is then only a lower bound and is reported as
+            ``mean_diff_lower_bound`` instead of ``mean_diff``.
+        diff_report_dir: Directory where a compact per-tile JSON diff report is
+            written for each validation run, or None to skip writing reports.
 
     Example usage:
 
@@ -83,6 +97,11 @@ class Validator:
         output_root: str = "captures",
         golden_root: str = "golden_data",
         auto_cleanup: bool = True,
+        tile_size: int = DEFAULT_TILE_SIZE,
+        max_workers: int | None = None,
+        use_processes: bool = False,
+        early_exit: bool = False,
+        diff_report_dir: str | None = None,
     ) -> None:
         self.tolerance: float = tolerance
         self.blur_kernel: int = blur_kernel
@@ -93,6 +112,12 @@ class Validator:
 
         self.auto_cleanup: bool = auto_cleanup
 
+        self.tile_size: int = tile_size
+        self.max_workers: int | None = max_workers
+        self.use_processes: bool = use_processes
+        self.early_exit: bool = early_exit
+        self.diff_report_dir: str | None = os.fspath(diff_report_dir) if diff_report_dir is not None else None
+
         self.render_product_map: dict[str, str] = {}
         self._last_capture_path: str | None = None
         self._last_benchmark_name: str | None = None
@@ -276,22 +301,12 @@ class Validator:
             else:
                 golden_dir = self.golden_root
 
-        import cv2
-        import numpy as np
-        from PIL import Image
-
         print("\nValidating Images")
         print("-" * 40)
 
-        def _collect_pngs(root: str) -> list[str]:
-            return sorted(
-                os.path.relpath(os.path.join(r, f), root)
-                for r, _, files in os.walk(root)
-                for f in files
-                if f.endswith(".png")
-            )
-
         all_passed = True
+        pairs: list[ImagePair] = []
+        pair_names: dict[str, str] = {}
 
         for rp_path, nice_name in self.render_product_map.items():
             cap_root = os.path.join(captured_dir, nice_name)
@@ -303,8 +318,8 @@ class Validator:
                 all_passed = False
                 continue
 
-            out_pngs = _collect_pngs(cap_root)
-            gold_pngs = _collect_pngs(gold_root)
+            out_pngs = self._collect_pngs(cap_root)
+            gold_pngs = self._collect_pngs(gold_root)
 
             common_files = sorted(set(out_pngs) & set(gold_pngs))
 
@@ -313,49 +328,24 @@ class Validator:
                 continue
 
             for rel in common_files:
-                cap_path = os.path.join(cap_root, rel)
-                gold_path = os.path.join(gold_root, rel)
+                key = os.path.join(nice_name, rel)
+                pair_names[key] = nice_name
+                pairs.append(ImagePair(key, os.path.join(cap_root, rel), os.path.join(gold_root, rel)))
 
-                cap_arr = np.array(Image.open(cap_path))
-                gold_arr = np.array(Image.open(gold_path))
-
-                if cap_arr.shape != gold_arr.shape:
-                    print(f"Shape mismatch: {rel}")
-                    all_passed = False
-                    continue
+        # Failures print their exact mean difference, so compare without early exit.
+        results = self._compare_pairs(pairs, "validate_images", early_exit=False)
 
-                if self.blur_kernel > 0:
-                    k = self.blur_kernel | 1  # must be odd
-                    cap_arr = cv2.GaussianBlur(cap_arr, (k, k), 0)
-                    gold_arr = cv2.GaussianBlur(gold_arr, (k, k), 0)
+        for pair, result in zip(pairs, results):
+            if result.passed:
+                continue  # passes – no diff written
 
-                diff = cv2.absdiff(cap_arr, gold_arr)
-                mean_diff = diff.mean()
-
-                if mean_diff <= self.tolerance:
-                    continue  # passes – no diff written
-
-                all_passed = False
-
-                # ---------- visual diff ----------
-                base = cap_arr.copy()
-                base = self._ensure_rgb(base)
-
-                mag = diff.max(axis=2) if diff.ndim == 3 else diff  # H×W
-                norm = (mag * 255.0 / mag.max()).astype(np.uint8)
-
-                red_layer = np.zeros_like(base)
-                red_layer[..., 0] = 255  # R channel (RGB)
-
-                alpha = (norm.astype(np.float32) / 255.0)[..., None]
-                overlay = (red_layer.astype(np.float32) * alpha + base.astype(np.float32) * (1.0 - alpha)).astype(
-                    np.uint8
-                )
+            all_passed = False
+            if result.reason is not None:
+                print(f"[FAIL] {pair.key}: {result.reason}")
+                continue
 
-                tmp = tempfile.mkdtemp(prefix="diff_")
-                out_png = os.path.join(tmp, f"diff_{os.path.basename(cap_path)}")
-                self._write_png(out_png, overlay)
-                print(f"[FAIL] {nice_name}: mean={mean_diff:.2f}  diff→ {out_png}")
+            out_png = self._write_visual_diff(pair)
+            print(f"[FAIL] {pair_names[pair.key]}: mean={result.mean_diff:.2f}  diff→ {out_png}")
 
         if not all_passed:
             print("\nValidation failed for some images. Check the diff images at the paths listed above.\n")
@@ -414,22 +404,10 @@ class Validator:
         Returns:
             Dictionary with validation results per render product and overall statistics.
         """
-        import cv2
-        import numpy as np
-        from PIL import Image
-
         print(f"\n{'='*80}")
         print("VALIDATING ALL FRAMES")
         print(f"{'='*80}\n")
 
-        def _collect_pngs(root: str) -> list[str]:
-            return sorted(
-                os.path.relpath(os.path.join(r, f), root)
-                for r, _, files in os.walk(root)
-                for f in files
-                if f.endswith(".png")
-            )
-
         if not os.path.isdir(captured_run_dir):
             raise ValueError(f"Captured run directory does not exist: {captured_run_dir}")
 
@@ -442,59 +420,36 @@ class Validator:
             print("No common render product directories found between captured and golden data")
             return {"render_products": {}, "total": 0, "passed": 0, "failed": 0}
 
-        rp_results = {}
-
+        # Gather every pair up front so all render products are compared in one batch.
+        rp_files: dict[str, list[str]] = {}
+        pairs: list[ImagePair] = []
         for rp_name in common_rps:
             cap_root = os.path.join(captured_run_dir, rp_name)
             gold_root = os.path.join(golden_benchmark_dir, rp_name)
+            common_files = sorted(set(self._collect_pngs(cap_root)) & set(self._collect_pngs(gold_root)))
+            rp_files[rp_name] = common_files
+            for rel in common_files:
+                pairs.append(ImagePair(rel, os.path.join(cap_root, rel), os.path.join(gold_root, rel)))
+
+        results = iter(self._compare_pairs(pairs, "validate_frames", early_exit=self.early_exit))
+
+        rp_results = {}
 
-            cap_pngs = _collect_pngs(cap_root)
-            gold_pngs = _collect_pngs(gold_root)
-            common_files = sorted(set(cap_pngs) & set(gold_pngs))
+        for rp_name in common_rps:
+            common_files = rp_files[rp_name]
 
             if not common_files:
                 print(f"[SKIP] {rp_name}: No common PNG files")
                 rp_results[rp_name] = {"passed": False, "reason": "no_common_files", "failures": []}
                 continue
 
-            rp_passed = True
-            failures = []
-            frame_results = []
-
             print(f"\n  Validating {rp_name} ({len(common_files)} frames):")
 
-            for rel in common_files:
-                cap_path = os.path.join(cap_root, rel)
-                gold_path = os.path.join(gold_root, rel)
-
-                cap_arr = np.array(Image.open(cap_path))
-                gold_arr = np.array(Image.open(gold_path))
-
-                if cap_arr.shape != gold_arr.shape:
-                    failure_msg = f"shape mismatch {cap_arr.shape} vs {gold_arr.shape}"
-                    failures.append(f"{rel}: {failure_msg}")
-                    frame_results.append({"file": rel, "passed": False, "reason": failure_msg})
-                    print(f"    [FAIL] {rel}: {failure_msg}")
-                    rp_passed = False
-                    continue
-
-                if self.blur_kernel > 0:
-                    k = self.blur_kernel | 1
-                    cap_arr = cv2.GaussianBlur(cap_arr, (k, k), 0)
-                    gold_arr = cv2.GaussianBlur(gold_arr, (k, k), 0)
-
-                diff = cv2.absdiff(cap_arr, gold_arr)
-                mean_diff = diff.mean()
-
-                if mean_diff > self.tolerance:
-                    failure_msg = f"mean_diff={mean_diff:.2f} (tolerance={self.tolerance})"
-                    failures.append(f"{rel}: {failure_msg}")
-                    frame_results.append({"file": rel, "passed": False, "mean_diff": mean_diff})
-                    print(f"    [FAIL] {rel}: {failure_msg}")
-                    rp_passed = False
-                else:
-                    frame_results.append({"file": rel, "passed": True, "mean_diff": mean_diff})
-                    print(f"    [PASS] {rel}: mean_diff={mean_diff:.2f}")
+            failures = []
+            frame_results = []
+            for _ in common_files:
+                self._record_frame_result(next(results), failures, frame_results)
+            rp_passed = not failures
 
             rp_results[rp_name] = {
                 "passed": rp_passed,
@@ -597,10 +552,6 @@ class Validator:
         Raises:
             ValueError: If the captured or golden directory does not exist.
         """
-        import cv2
-        import numpy as np
-        from PIL import Image
-
         print(f"\n{'='*80}")
         print("VALIDATING FRAMES BY TIMESTAMP")
         print(f"{'='*80}\n")
@@ -628,108 +579,91 @@ class Validator:
             print("No common render product directories between captured and golden")
             return {"render_products": {}, "total": 0, "passed": 0, "failed": 0}
 
-        rp_results = {}
-        total_pairs, passed_pairs, failed_pairs = 0, 0, 0
-
+        # Match captured frames to golden frames first, then compare all matches in one batch.
+        # Each entry is (cap_rel, failure_msg) for unmatched frames or (cap_rel, None) for pairs.
+        rp_matches: dict[str, tuple[int, int, list[tuple[str, str | None]]]] = {}
+        pairs: list[ImagePair] = []
         for rp_name in common_rps:
             cap_root = os.path.join(captured_run_dir, rp_name)
             gold_root = os.path.join(golden_benchmark_dir, rp_name)
 
             cap_list = _collect_pngs_with_timestamps(cap_root)
             gold_list = _collect_pngs_with_timestamps(gold_root)
-
             if not gold_list:
-                print(f"[SKIP] {rp_name}: No timestamp-based PNGs in golden")
-                rp_results[rp_name] = {
-                    "passed": False,
-                    "reason": "no_golden_timestamps",
-                    "failures": [],
-                    "frame_results": [],
-                }
                 continue
+            gold_times = [ts for _, ts in gold_list]
 
-            rp_passed = True
-            failures = []
-            frame_results = []
-
-            print(f"\n  Validating {rp_name} ({len(cap_list)} captured, {len(gold_list)} golden):")
-
+            matches: list[tuple[str, str | None]] = []
             for cap_rel, cap_ts in cap_list:
                 cap_path = os.path.join(cap_root, cap_rel)
                 if not os.path.isfile(cap_path):
                     continue
 
-                best_dt = float("inf")
-                best_gold_rel = None
-                for gold_rel, gold_ts in gold_list:
-                    dt = abs(cap_ts - gold_ts)
-                    if dt < best_dt:
-                        best_dt = dt
-                        best_gold_rel = gold_rel
+                # Golden frames are sorted by timestamp, so the nearest one is adjacent to the insertion point.
+                idx = bisect.bisect_left(gold_times, cap_ts)
+                candidates = [i for i in (idx - 1, idx) if 0 <= i < len(gold_list)]
+                best = min(candidates, key=lambda i: abs(cap_ts - gold_times[i]))
+                best_dt = abs(cap_ts - gold_times[best])
+                best_gold_rel = gold_list[best][0]
 
-                if best_gold_rel is None or best_dt > time_tolerance_sec:
-                    failure_msg = f"no golden within {time_tolerance_sec}s (nearest dt={best_dt:.4f}s)"
-                    failures.append(f"{cap_rel}: {failure_msg}")
-                    frame_results.append({"file": cap_rel, "passed": False, "reason": failure_msg})
-                    print(f"    [FAIL] {cap_rel}: {failure_msg}")
-                    rp_passed = False
-                    failed_pairs += 1
-                    total_pairs += 1
+                if best_dt > time_tolerance_sec:
+                    matches.append((cap_rel, f"no golden within {time_tolerance_sec}s (nearest dt={best_dt:.4f}s)"))
                     continue
 
                 gold_path = os.path.join(gold_root, best_gold_rel)
                 if not os.path.isfile(gold_path):
-                    failure_msg = f"golden file missing: {best_gold_rel}"
-                    failures.append(f"{cap_rel}: {failure_msg}")
-                    frame_results.append({"file": cap_rel, "passed": False, "reason": failure_msg})
-                    rp_passed = False
-                    failed_pairs += 1
-                    total_pairs += 1
+                    matches.append((cap_rel, f"golden file missing: {best_gold_rel}"))
                     continue
 
-                cap_arr = np.array(Image.open(cap_path))
-                gold_arr = np.array(Image.open(gold_path))
+                matches.append((cap_rel, None))
+                pairs.append(ImagePair(cap_rel, cap_path, gold_path))
+            rp_matches[rp_name] = (len(cap_list), len(gold_list), matches)
 
-                if cap_arr.shape != gold_arr.shape:
-                    failure_msg = f"shape mismatch {cap_arr.shape} vs {gold_arr.shape}"
-                    failures.append(f"{cap_rel}: {failure_msg}")
-                    frame_results.append({"file": cap_rel, "passed": False, "reason": failure_msg})
-                    print(f"    [FAIL] {cap_rel}: {failure_msg}")
-                    rp_passed = False
-                    failed_pairs += 1
-                    total_pairs += 1
-                    continue
+        results = iter(self._compare_pairs(pairs, "validate_frames_by_timestamp", early_exit=self.early_exit))
 
-                if self.blur_kernel > 0:
-                    k = self.blur_kernel | 1
-                    cap_arr = cv2.GaussianBlur(cap_arr, (k, k), 0)
-                    gold_arr = cv2.GaussianBlur(gold_arr, (k, k), 0)
+        rp_results = {}
+        total_pairs, passed_pairs, failed_pairs = 0, 0, 0
 
-                diff = cv2.absdiff(cap_arr, gold_arr)
-                mean_diff = diff.mean()
+        for rp_name in common_rps:
+            if rp_name not in rp_matches:
+                print(f"[SKIP] {rp_name}: No timestamp-based PNGs in golden")
+                rp_results[rp_name] = {
+                    "passed": False,
+                    "reason": "no_golden_timestamps",
+                    "failures": [],
+                    "frame_results": [],
+                }
+                continue
 
-                if mean_diff > self.tolerance:
-                    failure_msg = f"mean_diff={mean_diff:.2f} (tolerance={self.tolerance})"
+            n_captured, n_golden, matches = rp_matches[rp_name]
+            failures = []
+            frame_results = []
+
+            print(f"\n  Validating {rp_name} ({n_captured} captured, {n_golden} golden):")
+
+            for cap_rel, failure_msg in matches:
+                total_pairs += 1
+                if failure_msg is not None:
                     failures.append(f"{cap_rel}: {failure_msg}")
-                    frame_results.append({"file": cap_rel, "passed": False, "mean_diff": mean_diff})
+                    frame_results.append({"file": cap_rel, "passed": False, "reason": failure_msg})
                     print(f"    [FAIL] {cap_rel}: {failure_msg}")
-                    rp_passed = False
                     failed_pairs += 1
-                else:
-                    frame_results.append({"file": cap_rel, "passed": True, "mean_diff": mean_diff})
-                    print(f"    [PASS] {cap_rel}: mean_diff={mean_diff:.2f}")
+                    continue
+                if self._record_frame_result(next(results), failures, frame_results):
                     passed_pairs += 1
-                total_pairs += 1
+                else:
+                    failed_pairs += 1
+            rp_passed = not failures
 
             rp_results[rp_name] = {
                 "passed": rp_passed,
-                "total_files": len(cap_list),
+                "total_files": n_captured,
                 "failures": failures if not rp_passed else [],
                 "frame_results": frame_results,
             }
             status = "PASS" if rp_passed else "FAIL"
             passed_n = sum(1 for fr in frame_results if fr.get("passed"))
-            print(f"  [{status}] {rp_name}: {passed_n}/{len(cap_list)} frames passed")
+            print(f"  [{status}] {rp_name}: {passed_n}/{n_captured} frames passed")
 
         print(f"\n{'='*80}")
         print(f"Validation by timestamp: {passed_pairs}/{total_pairs} frame pairs passed")
@@ -742,6 +676,129 @@ class Validator:
             "failed": failed_pairs,
         }
 
+    @staticmethod
+    def _collect_pngs(root: str) -> list[str]:
+        """Return the sorted relative paths of all PNGs under *root*.
+
+        Args:
+            root: Directory to scan recursively.
+
+        Returns:
+            PNG paths relative to *root*.
+        """
+        return sorted(
+            os.path.relpath(os.path.join(r, f), root)
+            for r, _, files in os.walk(root)
+            for f in files
+            if f.endswith(".png")
+        )
+
+    def _compare_pairs(
+        self, pairs: list[ImagePair], run_name: str, early_exit: bool = False
+    ) -> list[ImageComparisonResult]:
+        """Compare image pairs in one batch and optionally write the diff report.
+
+        Args:
+            pairs: Image pairs to compare.
+            run_name: Name of the validation run, used for the report filename.
+            early_exit: Whether to stop comparing an image once it is known to fail,
+                leaving only a lower bound of its mean difference.
+
+        Returns:
+            Comparison results in the order of *pairs*.
+        """
+        comparator = BatchImageComparator(
+            tolerance=self.tolerance,
+            blur_kernel=self.blur_kernel,
+            tile_size=self.tile_size,
+            early_exit=early_exit,
+            max_workers=self.max_workers,
+            use_processes=self.use_processes,
+        )
+        start = time.perf_counter()
+        results = comparator.compare(pairs)
+        elapsed = time.perf_counter() - start
+        if pairs:
+            print(f"Compared {len(pairs)} image pairs in {elapsed:.2f}s")
+        if self.diff_report_dir is not None:
+            report_path = os.path.join(self.diff_report_dir, f"{run_name}_diff_report.json")
+            comparator.write_report(results, report_path, run=run_name, elapsed_sec=elapsed)
+            print(f"Diff report written to {report_path}")
+        return results
+
+    def _record_frame_result(
+        self, result: ImageComparisonResult, failures: list[str], frame_results: list[dict]
+    ) -> bool:
+        """Append a frame comparison result to the per-render-product lists and print it.
+
+        Args:
+            result: Comparison result for the frame.
+            failures: Failure messages of the render product, appended to on failure.
+            frame_results: Per-frame result entries of the render product.
+
+        Returns:
+            True if the frame passed.
+        """
+        message = result.describe(self.tolerance)
+        if result.reason is not None:
+            failures.append(f"{result.key}: {message}")
+            frame_results.append({"file": result.key, "passed": False, "reason": message})
+            print(f"    [FAIL] {result.key}: {message}")
+            return False
+        if not result.passed:
+            failures.append(f"{result.key}: {message}")
+            # An early-exited comparison only accumulated part of the image
+            mean_diff_key = "mean_diff_lower_bound" if result.early_exit else "mean_diff"
+            frame_results.append(
+                {
+                    "file": result.key,
+                    "passed": False,
+                    mean_diff_key: result.mean_diff,
+                    "failing_tiles": result.failing_tiles,
+                }
+            )
+            print(f"    [FAIL] {result.key}: {message}")
+            return False
+        frame_results.append({"file": result.key, "passed": True, "mean_diff": result.mean_diff})
+        print(f"    [PASS] {result.key}: {message}")
+        return True
+
+    def _write_visual_diff(self, pair: ImagePair) -> str:
+        """Write a red overlay highlighting where the captured image differs from the golden one.
+
+        Args:
+            pair: The failing image pair.
+
+        Returns:
+            Path of the written diff PNG.
+        """
+        import cv2
+        from PIL import Image
+
+        cap_arr = np.array(Image.open(pair.captured_path))
+        gold_arr = np.array(Image.open(pair.golden_path))
+        if self.blur_kernel > 0:
+            k = self.blur_kernel | 1  # must be odd
+            cap_arr = cv2.GaussianBlur(cap_arr, (k, k), 0)
+            gold_arr = cv2.GaussianBlur(gold_arr, (k, k), 0)
+        diff = cv2.absdiff(cap_arr, gold_arr)
+
+        base = self._ensure_rgb(cap_arr.copy())
+
+        mag = diff.max(axis=2) if diff.ndim == 3 else diff  # H×W
+        norm = (mag * 255.0 / max(int(mag.max()), 1)).astype(np.uint8)
+
+        red_layer = np.zeros_like(base)
+        red_layer[..., 0] = 255  # R channel (RGB)
+
+        alpha = (norm.astype(np.float32) / 255.0)[..., None]
+        overlay = (red_layer.astype(np.float32) * alpha + base.astype(np.float32) * (1.0 - alpha)).astype(np.uint8)
+
+        tmp = tempfile.mkdtemp(prefix="diff_")
+        out_png = os.path.join(tmp, f"diff_{os.path.basename(pair.captured_path)}")
+        self._write_png(out_png, overlay)
+        return out_png
+
     @staticmethod
     def _ensure_rgb(arr: np.ndarray) -> np.ndarray:
         """Return a three-channel RGB view of an image array.
@@ -810,7 +867,8 @@ class Validator:
 
         The following attribute names are read if present: ``tolerance`` (DEFAULT_TOLERANCE), ``blur_kernel``
         (DEFAULT_BLUR), ``regenerate_golden`` (False), ``output_dir`` ("captures"),
-        ``golden_dir`` ("golden_data").
+        ``golden_dir`` ("golden_data"), ``tile_size`` (DEFAULT_TILE_SIZE), ``max_workers`` (None),
+        ``diff_report_dir`` (None).
 
         Args:
             args: Argument object containing optional validator configuration.
@@ -824,6 +882,9 @@ class Validator:
         regen = getattr(args, "regenerate_golden", False)
         out_dir = getattr(args, "output_dir", "captures")
         gold_dir = getattr(args, "golden_dir", "golden_data")
+        tile_size = getattr(args, "tile_size", DEFAULT_TILE_SIZE)
+        max_workers = getattr(args, "max_workers", None)
+        diff_report_dir = getattr(args, "diff_report_dir", None)
 
         if auto_cleanup is None:
             auto_cleanup = True
@@ -841,6 +902,9 @@ class Validator:
             output_root=str(out_dir),
             golden_root=str(gold_dir),
             auto_cleanup=auto_cleanup,
+            tile_size=tile_size,
+            max_workers=max_workers,
+            diff_report_dir=diff_report_dir,
         )
 
 
@@ -37,6 +37,7 @@ import carb
 import omni.ext
 
 from .executor import ExecutionResult, Executor
+from .framing import FRAMED_MAGIC, FrameDecoder, FrameError, FramePayload, decode_frame, encode_buffer, encode_frame
 
 _SETTINGS_PREFIX = "/exts/isaacsim.code_editor.python_server"
 _AUTH_HEADER_PREFIX = "# isaacsim-python-server-token:"
@@ -106,26 +107,122 @@ def _get_event_loop() -> asyncio.AbstractEventLoop:
         return asyncio.get_event_loop_policy().get_event_loop()
 
 
-def _serialize_result(value: object) -> object:
+def _serialize_result(value: object, payload: FramePayload | None = None) -> object:
     """Attempt to convert *value* into a JSON-native representation.
 
     Falls back to `repr` for objects that are not directly JSON-serializable.
+    When a frame *payload* is given (framed connections), NumPy arrays and
+    byte buffers are moved into the payload and replaced by buffer descriptors.
 
     Args:
         value: The Python object to serialize.
+        payload: Binary payload of the reply frame, or None for JSON-only replies.
 
     Returns:
         A JSON-compatible representation of *value*.
     """
     if value is None or isinstance(value, (bool, int, float, str)):
         return value
+    if payload is not None:
+        descriptor = encode_buffer(value, payload)
+        if descriptor is not None:
+            return descriptor
     if isinstance(value, (list, tuple)):
-        return [_serialize_result(item) for item in value]
+        return [_serialize_result(item, payload) for item in value]
     if isinstance(value, dict):
-        return {str(k): _serialize_result(v) for k, v in value.items()}
+        return {str(k): _serialize_result(v, payload) for k, v in value.items()}
     return repr(value)
 
 
+def _error_reply(ename: str, evalue: str) -> dict[str, object]:
+    """Build an error reply that is not tied to code execution.
+
+    Args:
+        ename: Exception class name reported to the client.
+        evalue: Error message.
+
+    Returns:
+        A JSON-serializable error reply dict.
+    """
+    return {"status": "error", "output": "", "ename": ename, "evalue": evalue, "traceback": []}
+
+
+class _FramedConnection:
+    """State of a TCP connection that switched to the framed protocol.
+
+    Args:
+        transport: The connection's asyncio transport.
+    """
+
+    def __init__(self, transport: asyncio.Transport) -> None:
+        self.transport = transport
+        self.decoder = FrameDecoder()
+        #: Whether a request on this connection has already been authenticated.
+        self.authenticated = False
+        #: Number of requests received but not yet answered.
+        self.pending = 0
+        #: Whether the client half-closed the connection.
+        self.eof = False
+
+    def reply_sent(self) -> None:
+        """Account for an answered request and close the connection once drained after EOF."""
+        self.pending = max(0, self.pending - 1)
+        if self.eof and self.pending == 0 and not self.transport.is_closing():
+            self.transport.close()
+
+
+class _FramedReplyChannel:
+    """Reply target for a single request on a framed connection.
+
+    Used in place of the transport by the request handlers.  Sending the reply
+    writes one frame (tagged with the request ``id``) and keeps the connection
+    open; `is_closing` reports True once the reply was sent, so late replies
+    (e.g. after a timeout) are discarded like on a closed per-request connection.
+
+    Args:
+        connection: The framed connection the request arrived on.
+        request_id: The request ``id`` echoed in the reply, if any.
+    """
+
+    def __init__(self, connection: _FramedConnection, request_id: object = None) -> None:
+        self.connection = connection
+        self.request_id = request_id
+        self.payload = FramePayload()
+        self._replied = False
+
+    def is_closing(self) -> bool:
+        """Return whether the reply was sent or the connection is closing."""
+        return self._replied or self.connection.transport.is_closing()
+
+    def send_reply(self, reply: dict[str, object]) -> None:
+        """Send *reply* as one frame together with the collected binary payload.
+
+        Args:
+            reply: The JSON-serializable reply dict.
+        """
+        if self._replied:
+            return
+        self._replied = True
+        if self.request_id is not None:
+            reply = {**reply, "id": self.request_id}
+        transport = self.connection.transport
+        if not transport.is_closing():
+            transport.writelines(encode_frame(reply, self.payload))
+        self.connection.reply_sent()
+
+
+def _reply_payload(transport: asyncio.Transport | _FramedReplyChannel) -> FramePayload | None:
+    """Return the binary payload of a framed reply, or None for JSON-only connections.
+
+    Args:
+        transport: The reply target of the request.
+
+    Returns:
+        The frame payload collecting binary results, if any.
+    """
+    return transport.payload if isinstance(transport, _FramedReplyChannel) else None
+
+
 class Extension(omni.ext.IExt):
     """TCP socket server for remote Python code execution in Isaac Sim.
 
@@ -334,7 +431,9 @@ class Extension(omni.ext.IExt):
 
             Incoming data is buffered until the client signals EOF (half-close),
             ensuring that TCP-fragmented payloads are fully reassembled before
-            execution.
+            execution.  A connection that starts with ``FRAMED_MAGIC`` switches
+            to the framed protocol instead: requests are length-prefixed frames,
+            may be pipelined, and are answered on the same connection.
 
             Args:
                 parent: The owning Extension instance.
@@ -344,6 +443,8 @@ class Extension(omni.ext.IExt):
                 super().__init__()
                 self._parent = parent
                 self._buffer = bytearray()
+                self._framed: _FramedConnection | None = None
+                self._mode_checked = False
 
             def connection_made(self, transport: asyncio.BaseTransport) -> None:
                 carb.log_info(f"Connection from {transport.get_extra_info('peername')}")
@@ -354,9 +455,51 @@ class Extension(omni.ext.IExt):
                 self._parent._active_connections = max(0, self._parent._active_connections - 1)
 
             def data_received(self, data: bytes) -> None:
+                if self._framed is not None:
+                    self._frames_received(data)
+                    return
                 self._buffer.extend(data)
+                if not self._mode_checked:
+                    n = min(len(self._buffer), len(FRAMED_MAGIC))
+                    if self._buffer[:n] != FRAMED_MAGIC[:n]:
+                        self._mode_checked = True
+                    elif n == len(FRAMED_MAGIC):
+                        self._mode_checked = True
+                        self._framed = _FramedConnection(self.transport)
+                        self.transport.write(FRAMED_MAGIC)
+                        data = bytes(self._buffer[n:])
+                        self._buffer.clear()
+                        self._frames_received(data)
+
+            def _frames_received(self, data: bytes) -> None:
+                framed = self._framed
+                try:
+                    frames = framed.decoder.feed(data)
+                except FrameError as exc:
+                    # The stream can no longer be split into frames; report and drop the connection.
+                    carb.log_warn(f"python_server framing error: {exc}")
+                    self._parent._send_raw_reply(_error_reply("ProtocolError", str(exc)), _FramedReplyChannel(framed))
+                    self.transport.close()
+                    return
+                loop = _get_event_loop()
+                for json_bytes, payload in frames:
+                    framed.pending += 1
+                    channel = _FramedReplyChannel(framed)
+                    try:
+                        envelope = decode_frame(json_bytes, payload)
+                    except FrameError as exc:
+                        loop.call_soon(self._parent._send_raw_reply, _error_reply("ProtocolError", str(exc)), channel)
+                        continue
+                    channel.request_id = envelope.get("id")
+                    # Same deferral as for raw requests (see eof_received); call_soon keeps request order.
+                    loop.call_soon(self._parent._process_code, "", channel, envelope)
 
             def eof_received(self) -> bool:
+                if self._framed is not None:
+                    self._framed.eof = True
+                    if self._framed.pending == 0:
+                        self.transport.close()
+                    return True
                 try:
                     code = self._buffer.decode()
                 except UnicodeDecodeError as exc:
@@ -461,7 +604,9 @@ class Extension(omni.ext.IExt):
             return False
         return hmac.compare_digest(token, self._auth_token)
 
-    def _process_code(self, source: str, transport: asyncio.Transport) -> None:
+    def _process_code(
+        self, source: str, transport: asyncio.Transport | _FramedReplyChannel, envelope: dict | None = None
+    ) -> None:
         """Execute Python source and send a JSON reply back to the client.
 
         Parses the incoming *source* as a JSON envelope (if it starts with
@@ -477,10 +622,11 @@ class Extension(omni.ext.IExt):
 
         Args:
             source: The raw incoming string from the TCP connection.
-            transport: The asyncio transport for sending the response.
+            transport: The asyncio transport (or framed reply channel) for sending the response.
+            envelope: Already decoded request envelope (framed connections); *source* is ignored when given.
         """
         try:
-            self._process_code_inner(source, transport)
+            self._process_code_inner(source, transport, envelope)
         except Exception as exc:
             carb.log_error(f"python_server internal error: {exc}")
             reply: dict[str, object] = {
@@ -492,15 +638,23 @@ class Extension(omni.ext.IExt):
             }
             self._send_raw_reply(reply, transport)
 
-    def _process_code_inner(self, source: str, transport: asyncio.Transport) -> None:
+    def _process_code_inner(
+        self, source: str, transport: asyncio.Transport | _FramedReplyChannel, envelope: dict | None = None
+    ) -> None:
         """Inner implementation of ``_process_code``, wrapped by a safety-net handler.
 
         Args:
             source: The raw incoming string from the TCP connection.
-            transport: The asyncio transport for sending the response.
+            transport: The asyncio transport (or framed reply channel) for sending the response.
+            envelope: Already decoded request envelope (framed connections); *source* is ignored when given.
         """
-        code, envelope = self._parse_envelope(source)
-        if not self._is_authenticated(envelope):
+        if envelope is None:
+            code, envelope = self._parse_envelope(source)
+        else:
+            code = envelope.get("code", "")
+        # Framed connections authenticate once; later requests on the same connection may omit the token.
+        framed = transport.connection if isinstance(transport, _FramedReplyChannel) else None
+        if not (framed is not None and framed.authenticated) and not self._is_authenticated(envelope):
             self._send_raw_reply(
                 {
                     "status": "error",
@@ -512,12 +666,12 @@ class Extension(omni.ext.IExt):
                 transport,
             )
             return
+        if framed is not None:
+            framed.authenticated = True
 
         # Introspection shortcut — no code execution needed
         if "introspect" in envelope:
-            reply = self._handle_introspect(envelope)
-            transport.write(json.dumps(reply, separators=(",", ":")).encode())
-            transport.close()
+            self._send_raw_reply(self._handle_introspect(envelope), transport)
             return
 
         context_name: str = envelope.get("context", "")
@@ -538,8 +692,7 @@ class Extension(omni.ext.IExt):
                 "fire_and_forget": True,
                 "task_id": task_id,
             }
-            transport.write(json.dumps(ack, separators=(",", ":")).encode())
-            transport.close()
+            self._send_raw_reply(ack, transport)
             _get_event_loop().call_soon(self._execute_background, code, ctx_globals, task_id, timeout)
             return
 
@@ -589,7 +742,7 @@ class Extension(omni.ext.IExt):
             _drive_coroutine(self._await_and_reply(exec_result, transport, remaining, start_time, timeout))
             return
 
-        reply = self._build_reply_dict(exec_result)
+        reply = self._build_reply_dict(exec_result, _reply_payload(transport))
         if self._keepalive_interval > 0 and elapsed >= self._keepalive_interval:
             reply["elapsed_seconds"] = elapsed
         self._send_raw_reply(reply, transport)
@@ -681,11 +834,12 @@ class Extension(omni.ext.IExt):
     # Reply helpers
     # ------------------------------------------------------------------
 
-    def _build_reply_dict(self, exec_result: ExecutionResult) -> dict[str, object]:
+    def _build_reply_dict(self, exec_result: ExecutionResult, payload: FramePayload | None = None) -> dict[str, object]:
         """Build the JSON reply dict from an execution result.
 
         Args:
             exec_result: The completed execution result.
+            payload: Binary payload of a framed reply; array and buffer results are moved into it.
 
         Returns:
             A JSON-serializable reply dict.
@@ -700,7 +854,7 @@ class Extension(omni.ext.IExt):
         }
 
         if exec_result.exception is None and exec_result.is_expression:
-            reply["result"] = _serialize_result(exec_result.result)
+            reply["result"] = _serialize_result(exec_result.result, payload)
 
         if exec_result.exception is not None:
             reply["traceback"] = [exec_result.traceback_str]
@@ -709,24 +863,27 @@ class Extension(omni.ext.IExt):
 
         return reply
 
-    def _send_raw_reply(self, reply: dict[str, object], transport: asyncio.Transport) -> None:
+    def _send_raw_reply(self, reply: dict[str, object], transport: asyncio.Transport | _FramedReplyChannel) -> None:
         """Serialize *reply* and send it over *transport*, then close the connection.
 
         Silently skips writing if the transport is already closing (e.g. when a
-        watchdog timer fires after the connection was closed normally).
+        watchdog timer fires after the connection was closed normally).  On a
+        framed connection the reply is sent as a frame and the connection stays open.
 
         Args:
             reply: The JSON-serializable reply dict.
-            transport: The asyncio transport for sending the response.
+            transport: The asyncio transport (or framed reply channel) for sending the response.
         """
-        if not transport.is_closing():
+        if isinstance(transport, _FramedReplyChannel):
+            transport.send_reply(reply)
+        elif not transport.is_closing():
             transport.write(json.dumps(reply, separators=(",", ":")).encode())
             transport.close()
 
     async def _await_and_reply(
         self,
         exec_result: ExecutionResult,
-        transport: asyncio.Transport,
+        transport: asyncio.Transport | _FramedReplyChannel,
         timeout: float = 0.0,
         start_time: float | None = None,
         requested_timeout: float | None = None,
@@ -801,7 +958,7 @@ class Extension(omni.ext.IExt):
             exec_result = ExecutionResult(output=combined_output, result=awaited)
 
         elapsed = time.monotonic() - _start
-        reply = self._build_reply_dict(exec_result)
+        reply = self._build_reply_dict(exec_result, _reply_payload(transport))
         if self._keepalive_interval > 0 and elapsed >= self._keepalive_interval:
             reply["elapsed_seconds"] = elapsed
         self._send_raw_reply(reply, transport)
@@ -0,0 +1,249 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Length-prefixed framing for persistent python_server connections.
+
+A client opts into framed mode by sending :data:`FRAMED_MAGIC` as the first
+bytes of a connection; the server echoes it back.  Afterwards both directions
+exchange frames::
+
+    +----------------------+-------------------------+-------------+--------------+
+    | json length (uint32) | payload length (uint32) | JSON header | payload      |
+    +----------------------+-------------------------+-------------+--------------+
+
+Lengths are big-endian.  The JSON header is the request envelope (or the
+reply dict).  Binary values (NumPy arrays, ``bytes``) are carried in the
+payload and referenced from the JSON by a buffer descriptor::
+
+    {"__buffer__": {"offset": 0, "nbytes": 24, "dtype": "<f8", "shape": [3]}}
+
+``dtype`` is ``None`` for raw bytes.
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+
+__all__ = [
+    "FRAMED_MAGIC",
+    "FRAME_HEADER",
+    "MAX_FRAME_BYTES",
+    "FrameError",
+    "FramePayload",
+    "encode_buffer",
+    "decode_buffers",
+    "encode_frame",
+    "FrameDecoder",
+    "decode_frame",
+]
+
+#: Bytes that switch a new connection into framed mode.  The leading NUL can
+#: never start valid Python source or a JSON envelope.
+FRAMED_MAGIC = b"\x00PSF"
+
+#: Frame header: JSON length and binary payload length, big-endian uint32.
+FRAME_HEADER = struct.Struct("!II")
+
+#: Upper bound for a single frame (header JSON plus payload) accepted by the server.
+MAX_FRAME_BYTES = 1 << 30
+
+_BUFFER_KEY = "__buffer__"
+
+
+class FrameError(ValueError):
+    """Raised when a frame cannot be parsed."""
+
+
+class FramePayload:
+    """Collect binary buffers for the payload section of one frame.
+
+    Example:
+
+    .. code-block:: python
+
+        payload = FramePayload()
+        header = {"result": encode_buffer(array, payload)}
+        chunks = encode_frame(header, payload)
+    """
+
+    def __init__(self) -> None:
+        self.buffers: list[memoryview] = []
+        self.nbytes = 0
+
+    def add(self, buffer: memoryview, dtype: str | None, shape: list[int]) -> dict:
+        """Append a buffer and return the JSON descriptor that references it.
+
+        Args:
+            buffer: Byte-addressable view of the data.
+            dtype: NumPy dtype string, or None for raw bytes.
+            shape: Array shape.
+
+        Returns:
+            The buffer descriptor to embed in the JSON header.
+        """
+        descriptor = {"offset": self.nbytes, "nbytes": buffer.nbytes, "dtype": dtype, "shape": shape}
+        self.buffers.append(buffer)
+        self.nbytes += buffer.nbytes
+        return {_BUFFER_KEY: descriptor}
+
+
+def encode_buffer(value: object, payload: FramePayload) -> dict | None:
+    """Move *value* into *payload* if it is a binary buffer or a numeric array.
+
+    Args:
+        value: The value to encode.
+        payload: Payload collecting the frame's buffers.
+
+    Returns:
+        The buffer descriptor, or None if *value* is not binary data.
+    """
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        view = memoryview(value).cast("B") if isinstance(value, memoryview) else memoryview(value)
+        return payload.add(view, None, [view.nbytes])
+    if not hasattr(value, "__array_interface__"):
+        return None
+    import numpy as np
+
+    array = np.asarray(value)
+    if array.dtype.hasobject:
+        return None
+    shape = list(array.shape)
+    flat = np.ascontiguousarray(array).reshape(-1).view(np.uint8)
+    return payload.add(memoryview(flat), array.dtype.str, shape)
+
+
+def decode_buffers(value: object, payload: memoryview) -> object:
+    """Replace buffer descriptors in a decoded JSON value with the referenced data.
+
+    Descriptors with a dtype become NumPy arrays (copied out of the frame);
+    descriptors without one become ``bytes``.
+
+    Args:
+        value: A value decoded from a frame's JSON header.
+        payload: The frame's payload section.
+
+    Returns:
+        *value* with every buffer descriptor resolved.
+
+    Raises:
+        FrameError: If a descriptor points outside of the payload.
+    """
+    if isinstance(value, list):
+        return [decode_buffers(item, payload) for item in value]
+    if not isinstance(value, dict):
+        return value
+    descriptor = value.get(_BUFFER_KEY) if len(value) == 1 else None
+    if not isinstance(descriptor, dict):
+        return {k: decode_buffers(v, payload) for k, v in value.items()}
+    try:
+        offset = int(descriptor["offset"])
+        nbytes = int(descriptor["nbytes"])
+    except (KeyError, TypeError, ValueError) as exc:
+        raise FrameError(f"Invalid buffer descriptor: {descriptor}") from exc
+    if offset < 0 or nbytes < 0 or offset + nbytes > payload.nbytes:
+        raise FrameError(f"Buffer descriptor outside of payload: {descriptor}")
+    data = payload[offset : offset + nbytes]
+    dtype = descriptor.get("dtype")
+    if dtype is None:
+        return bytes(data)
+    import numpy as np
+
+    try:
+        return np.frombuffer(data, dtype=np.dtype(dtype)).reshape(descriptor.get("shape", [-1])).copy()
+    except (TypeError, ValueError) as exc:
+        raise FrameError(f"Invalid buffer descriptor: {descriptor}") from exc
+
+
+def encode_frame(header: dict, payload: FramePayload | None = None) -> list[bytes | memoryview]:
+    """Serialize a frame.
+
+    Args:
+        header: JSON-serializable header dict.
+        payload: Binary buffers referenced from *header*.
+
+    Returns:
+        Chunks to write to the socket in order (suitable for ``writelines``).
+    """
+    header_bytes = json.dumps(header, separators=(",", ":")).encode()
+    buffers = payload.buffers if payload is not None else []
+    nbytes = payload.nbytes if payload is not None else 0
+    return [FRAME_HEADER.pack(len(header_bytes), nbytes), header_bytes, *buffers]
+
+
+class FrameDecoder:
+    """Incrementally split a byte stream into frames.
+
+    Args:
+        max_frame_bytes: Largest accepted frame (JSON header plus payload).
+    """
+
+    def __init__(self, max_frame_bytes: int = MAX_FRAME_BYTES) -> None:
+        self._buffer = bytearray()
+        self._max_frame_bytes = max_frame_bytes
+
+    def feed(self, data: bytes) -> list[tuple[bytes, memoryview]]:
+        """Add received bytes and return every frame completed by them.
+
+        Args:
+            data: Bytes received from the socket.
+
+        Returns:
+            ``(json_bytes, payload)`` tuples for the completed frames.
+
+        Raises:
+            FrameError: If a frame exceeds *max_frame_bytes*.
+        """
+        self._buffer.extend(data)
+        frames = []
+        start = 0
+        end = len(self._buffer)
+        while end - start >= FRAME_HEADER.size:
+            json_len, payload_len = FRAME_HEADER.unpack_from(self._buffer, start)
+            if json_len + payload_len > self._max_frame_bytes:
+                raise FrameError(f"Frame of {json_len + payload_len} bytes exceeds the {self._max_frame_bytes} limit")
+            frame_end = start + FRAME_HEADER.size + json_len + payload_len
+            if frame_end > end:
+                break
+            json_start = start + FRAME_HEADER.size
+            json_bytes = bytes(self._buffer[json_start : json_start + json_len])
+            payload = memoryview(bytes(self._buffer[json_start + json_len : frame_end]))
+            frames.append((json_bytes, payload))
+            start = frame_end
+        if start:
+            del self._buffer[:start]
+        return frames
+
+
+def decode_frame(json_bytes: bytes, payload: memoryview) -> dict:
+    """Decode a frame's JSON header and resolve its buffers.
+
+    Args:
+        json_bytes: The frame's JSON header.
+        payload: The frame's payload section.
+
+    Returns:
+        The decoded header dict.
+
+    Raises:
+        FrameError: If the header is not a JSON object or references invalid buffers.
+    """
+    try:
+        header = json.loads(json_bytes.decode())
+    except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+        raise FrameError(f"Invalid frame header: {exc}") from exc
+    if not isinstance(header, dict):
+        raise FrameError("Frame header must be a JSON object")
+    return decode_buffers(header, payload)
@@ -0,0 +1,154 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test the framed protocol: persistent connections, pipelining and binary results."""
+
+from __future__ import annotations
+
+import asyncio
+
+import carb
+import numpy as np
+import omni.kit.test
+
+from ..framing import FRAME_HEADER, FRAMED_MAGIC, FramePayload, decode_frame, encode_buffer, encode_frame
+from ._auth import get_auth_token
+
+_SETTINGS_PREFIX = "/exts/isaacsim.code_editor.python_server"
+_HOST = "127.0.0.1"
+
+
+async def _open_framed(port: int) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    """Open a connection and switch it to the framed protocol.
+
+    Args:
+        port: The TCP port to connect to.
+
+    Returns:
+        The stream reader and writer of the connection.
+    """
+    reader, writer = await asyncio.open_connection(_HOST, port)
+    writer.write(FRAMED_MAGIC)
+    ack = await asyncio.wait_for(reader.readexactly(len(FRAMED_MAGIC)), timeout=30.0)
+    assert ack == FRAMED_MAGIC
+    return reader, writer
+
+
+def _write_frame(writer: asyncio.StreamWriter, envelope: dict, payload: FramePayload | None = None) -> None:
+    """Write one request frame.
+
+    Args:
+        writer: The connection's stream writer.
+        envelope: The request envelope.
+        payload: Binary buffers referenced from *envelope*.
+    """
+    writer.writelines(encode_frame(envelope, payload))
+
+
+async def _read_frame(reader: asyncio.StreamReader) -> dict:
+    """Read and decode one reply frame.
+
+    Args:
+        reader: The connection's stream reader.
+
+    Returns:
+        The decoded reply with buffers resolved.
+    """
+    header = await asyncio.wait_for(reader.readexactly(FRAME_HEADER.size), timeout=30.0)
+    json_len, payload_len = FRAME_HEADER.unpack(header)
+    body = await asyncio.wait_for(reader.readexactly(json_len + payload_len), timeout=30.0)
+    return decode_frame(body[:json_len], memoryview(body[json_len:]))
+
+
+class TestFramedProtocol(omni.kit.test.AsyncTestCase):
+    """Test requests sent over a persistent framed connection."""
+
+    async def setUp(self) -> None:
+        """Open an authenticated framed connection."""
+        settings = carb.settings.get_settings()
+        self._port: int = settings.get(f"{_SETTINGS_PREFIX}/port")
+        self._reader, self._writer = await _open_framed(self._port)
+        _write_frame(self._writer, {"id": 0, "code": "None", "auth_token": get_auth_token()})
+        reply = await _read_frame(self._reader)
+        self.assertEqual("ok", reply.get("status"), reply)
+
+    async def tearDown(self) -> None:
+        """Close the connection."""
+        self._writer.close()
+
+    async def test_pipelined_requests_keep_order(self) -> None:
+        """Verify that many requests sent back to back are answered in order on one connection."""
+        for i in range(1, 201):
+            _write_frame(self._writer, {"id": i, "code": f"{i} * 2", "context": "framed"})
+        await self._writer.drain()
+        for i in range(1, 201):
+            reply = await _read_frame(self._reader)
+            self.assertEqual(i, reply.get("id"))
+            self.assertEqual("ok", reply.get("status"))
+            self.assertEqual(i * 2, reply.get("result"))
+
+    async def test_numpy_result_is_binary(self) -> None:
+        """Verify that arrays are returned as binary buffers with dtype and shape."""
+        _write_frame(self._writer, {"id": 1, "code": "import numpy as np", "context": "framed"})
+        code = "np.arange(12, dtype=np.float32).reshape(3, 4)"
+        _write_frame(self._writer, {"id": 2, "code": code, "context": "framed"})
+        self.assertEqual("ok", (await _read_frame(self._reader)).get("status"))
+        reply = await _read_frame(self._reader)
+        self.assertEqual("ok", reply.get("status"), reply)
+        result = reply["result"]
+        self.assertIsInstance(result, np.ndarray)
+        self.assertEqual(np.float32, result.dtype)
+        np.testing.assert_array_equal(np.arange(12, dtype=np.float32).reshape(3, 4), result)
+
+    async def test_binary_args_and_nested_results(self) -> None:
+        """Verify that binary args are decoded and buffers inside containers are encoded."""
+        payload = FramePayload()
+        args = {
+            "points": encode_buffer(np.ones((5, 3), dtype=np.float64), payload),
+            "blob": encode_buffer(b"\x00\x01\x02", payload),
+        }
+        _write_frame(
+            self._writer,
+            {"id": 2, "code": "{'sum': points.sum(axis=0), 'blob': blob, 'n': len(blob)}", "args": args},
+            payload,
+        )
+        reply = await _read_frame(self._reader)
+        self.assertEqual("ok", reply.get("status"), reply)
+        np.testing.assert_array_equal(np.full(3, 5.0), reply["result"]["sum"])
+        self.assertEqual(b"\x00\x01\x02", reply["result"]["blob"])
+        self.assertEqual(3, reply["result"]["n"])
+
+    async def test_invalid_header_keeps_connection(self) -> None:
+        """Verify that a malformed frame header is reported without dropping the connection."""
+        body = b"not json"
+        self._writer.write(FRAME_HEADER.pack(len(body), 0) + body)
+        reply = await _read_frame(self._reader)
+        self.assertEqual("error", reply.get("status"))
+        self.assertEqual("ProtocolError", reply.get("ename"))
+
+        _write_frame(self._writer, {"id": 3, "code": "1 + 1"})
+        reply = await _read_frame(self._reader)
+        self.assertEqual(2, reply.get("result"))
+
+    async def test_unauthenticated_connection_is_rejected(self) -> None:
+        """Verify that a new framed connection without a token cannot execute code."""
+        reader, writer = await _open_framed(self._port)
+        try:
+            _write_frame(writer, {"id": 1, "code": "1 + 1"})
+            reply = await _read_frame(reader)
+            self.assertEqual("AuthenticationError", reply.get("ename"))
+            self.assertEqual(1, reply.get("id"))
+        finally:
+            writer.close()
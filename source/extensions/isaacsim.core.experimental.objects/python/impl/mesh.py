@@ -27,7 +27,22 @@ import omni.kit.commands
 import warp as wp
 from isaacsim.core.experimental.prims import XformPrim
 from isaacsim.core.experimental.prims.impl.prim import _MSG_PRIM_NOT_VALID
-from pxr import Gf, Usd, UsdGeom, Vt
+from pxr import Gf, Sdf, Usd, UsdGeom, Vt
+
+
+_EMPTY_VEC3F = np.zeros((0, 3), dtype=np.float32)
+
+
+def _to_vec3f_array(data: np.ndarray) -> Vt.Vec3fArray:
+    """Convert an array of 3-vectors to a USD ``Vec3fArray`` without going through Python lists.
+
+    Args:
+        data: Array of 3-vectors (shape ``(number of vectors, 3)``).
+
+    Returns:
+        USD array holding the vectors.
+    """
+    return Vt.Vec3fArray.FromNumpy(np.ascontiguousarray(data, dtype=np.float32).reshape((-1, 3)))
 
 
 class Mesh(XformPrim):
@@ -346,8 +361,9 @@ class Mesh(XformPrim):
         elif isinstance(colors, (list, tuple)):
             colors = [matplotlib.colors.to_rgb(color) if isinstance(color, str) else color for color in colors]
         colors = ops_utils.broadcast_to(colors, shape=(indices.shape[0], 3), dtype=wp.float32, device="cpu").numpy()
-        for i, index in enumerate(indices.numpy()):
-            self.geoms[index].GetDisplayColorAttr().Set([Gf.Vec3f(*colors[i].tolist())])
+        with Sdf.ChangeBlock():
+            for i, index in enumerate(indices.numpy()):
+                self.geoms[index].GetDisplayColorAttr().Set([Gf.Vec3f(*colors[i].tolist())])
 
     def set_points(
         self, points: list[list | np.ndarray | wp.array], *, indices: int | list | np.ndarray | wp.array | None = None
@@ -374,9 +390,10 @@ class Mesh(XformPrim):
         assert self.valid, _MSG_PRIM_NOT_VALID
         # USD API
         indices = ops_utils.resolve_indices(indices, count=len(self), device="cpu")
-        for i, index in enumerate(indices.numpy()):
-            data = ops_utils.place(points[0 if len(points) == 1 else i], device="cpu").numpy().reshape((-1, 3))
-            self.geoms[index].GetPointsAttr().Set(Vt.Vec3fArray(data.tolist()))
+        with Sdf.ChangeBlock():
+            for i, index in enumerate(indices.numpy()):
+                data = ops_utils.place(points[0 if len(points) == 1 else i], device="cpu").numpy().reshape((-1, 3))
+                self.geoms[index].GetPointsAttr().Set(_to_vec3f_array(data))
 
     def get_points(self, *, indices: int | list | np.ndarray | wp.array | None = None) -> list[wp.array]:
         """Get the mesh points (in local space) of the prims.
@@ -442,9 +459,10 @@ class Mesh(XformPrim):
         assert self.valid, _MSG_PRIM_NOT_VALID
         # USD API
         indices = ops_utils.resolve_indices(indices, count=len(self), device="cpu")
-        for i, index in enumerate(indices.numpy()):
-            data = ops_utils.place(normals[0 if len(normals) == 1 else i], device="cpu").numpy().reshape((-1, 3))
-            self.geoms[index].GetNormalsAttr().Set(Vt.Vec3fArray(data.tolist()))
+        with Sdf.ChangeBlock():
+            for i, index in enumerate(indices.numpy()):
+                data = ops_utils.place(normals[0 if len(normals) == 1 else i], device="cpu").numpy().reshape((-1, 3))
+                self.geoms[index].GetNormalsAttr().Set(_to_vec3f_array(data))
 
     def get_normals(self, *, indices: int | list | np.ndarray | wp.array | None = None) -> list[wp.array]:
         """Get the mesh normals (object-space orientation for individual points) of the prims.
@@ -477,6 +495,141 @@ class Mesh(XformPrim):
             data.append(ops_utils.place(np.array(self.geoms[index].GetNormalsAttr().Get()), device=self._device))
         return data
 
+    def set_points_packed(
+        self,
+        points: list | np.ndarray | wp.array,
+        offsets: list | np.ndarray | wp.array,
+        *,
+        indices: int | list | np.ndarray | wp.array | None = None,
+    ) -> None:
+        """Set the mesh points (in local space) of the prims from a packed buffer.
+
+        Backends: :guilabel:`usd`.
+
+        The points of all processed prims are concatenated into a single buffer: the points of the i-th
+        processed prim are ``points[offsets[i]:offsets[i + 1]]``. All prims are written inside a single
+        USD change block, so the stage emits one change notification for the whole batch.
+
+        Args:
+            points: Concatenated mesh points (shape ``(total number of points, 3)``).
+            offsets: Start offset of the points of each prim followed by the total number of points
+                (shape ``(N + 1,)``), as returned by :py:meth:`get_points_packed`.
+            indices: Indices of prims to process (shape ``(N,)``). If not defined, all wrapped prims are processed.
+
+        Raises:
+            AssertionError: Wrapped prims are not valid.
+            AssertionError: If the offsets are inconsistent with the points or the processed prims.
+
+        Example:
+
+        .. code-block:: python
+
+            >>> # translate the points of all prims by 1.0 along the Z axis
+            >>> points, offsets = prims.get_points_packed()
+            >>> points = points.numpy()
+            >>> points[:, 2] += 1.0
+            >>> prims.set_points_packed(points, offsets)
+        """
+        assert self.valid, _MSG_PRIM_NOT_VALID
+        # USD API
+        self._set_packed_vec3f([geom.GetPointsAttr() for geom in self.geoms], points, offsets, indices)
+
+    def get_points_packed(
+        self, *, indices: int | list | np.ndarray | wp.array | None = None
+    ) -> tuple[wp.array, wp.array]:
+        """Get the mesh points (in local space) of the prims as a packed buffer.
+
+        Backends: :guilabel:`usd`.
+
+        Args:
+            indices: Indices of prims to process (shape ``(N,)``). If not defined, all wrapped prims are processed.
+
+        Returns:
+            Two-elements tuple. 1) Concatenated mesh points (shape ``(total number of points, 3)``).
+            2) Start offset of the points of each prim followed by the total number of points (shape ``(N + 1,)``).
+
+        Raises:
+            AssertionError: Wrapped prims are not valid.
+
+        Example:
+
+        .. code-block:: python
+
+            >>> # get the points of all prims
+            >>> points, offsets = prims.get_points_packed()
+            >>> points.shape, offsets.shape
+            ((12, 3), (4,))
+        """
+        assert self.valid, _MSG_PRIM_NOT_VALID
+        # USD API
+        return self._get_packed_vec3f([geom.GetPointsAttr() for geom in self.geoms], indices)
+
+    def set_normals_packed(
+        self,
+        normals: list | np.ndarray | wp.array,
+        offsets: list | np.ndarray | wp.array,
+        *,
+        indices: int | list | np.ndarray | wp.array | None = None,
+    ) -> None:
+        """Set the mesh normals (object-space orientation for individual points) of the prims from a packed buffer.
+
+        Backends: :guilabel:`usd`.
+
+        The normals of the i-th processed prim are ``normals[offsets[i]:offsets[i + 1]]``.
+        All prims are written inside a single USD change block.
+
+        Args:
+            normals: Concatenated mesh normals (shape ``(total number of normals, 3)``).
+            offsets: Start offset of the normals of each prim followed by the total number of normals
+                (shape ``(N + 1,)``), as returned by :py:meth:`get_normals_packed`.
+            indices: Indices of prims to process (shape ``(N,)``). If not defined, all wrapped prims are processed.
+
+        Raises:
+            AssertionError: Wrapped prims are not valid.
+            AssertionError: If the offsets are inconsistent with the normals or the processed prims.
+
+        Example:
+
+        .. code-block:: python
+
+            >>> # flip the normals of all prims
+            >>> normals, offsets = prims.get_normals_packed()
+            >>> prims.set_normals_packed(-normals.numpy(), offsets)
+        """
+        assert self.valid, _MSG_PRIM_NOT_VALID
+        # USD API
+        self._set_packed_vec3f([geom.GetNormalsAttr() for geom in self.geoms], normals, offsets, indices)
+
+    def get_normals_packed(
+        self, *, indices: int | list | np.ndarray | wp.array | None = None
+    ) -> tuple[wp.array, wp.array]:
+        """Get the mesh normals (object-space orientation for individual points) of the prims as a packed buffer.
+
+        Backends: :guilabel:`usd`.
+
+        Args:
+            indices: Indices of prims to process (shape ``(N,)``). If not defined, all wrapped prims are processed.
+
+        Returns:
+            Two-elements tuple. 1) Concatenated mesh normals (shape ``(total number of normals, 3)``).
+            2) Start offset of the normals of each prim followed by the total number of normals (shape ``(N + 1,)``).
+
+        Raises:
+            AssertionError: Wrapped prims are not valid.
+
+        Example:
+
+        .. code-block:: python
+
+            >>> # get the normals of all prims
+            >>> normals, offsets = prims.get_normals_packed()
+            >>> offsets.shape  # one start offset per prim and the total number of normals
+            (4,)
+        """
+        assert self.valid, _MSG_PRIM_NOT_VALID
+        # USD API
+        return self._get_packed_vec3f([geom.GetNormalsAttr() for geom in self.geoms], indices)
+
     def set_face_specs(
         self,
         vertex_indices: list[list | np.ndarray | wp.array] | None = None,
@@ -899,3 +1052,60 @@ class Mesh(XformPrim):
             interpolate_boundaries.append(geom.GetInterpolateBoundaryAttr().Get())
             triangle_subdivision_rules.append(geom.GetTriangleSubdivisionRuleAttr().Get())
         return subdivision_schemes, interpolate_boundaries, triangle_subdivision_rules
+
+    """
+    Internal methods.
+    """
+
+    def _get_packed_vec3f(
+        self, attrs: list[Usd.Attribute], indices: int | list | np.ndarray | wp.array | None
+    ) -> tuple[wp.array, wp.array]:
+        """Read a 3-vector array attribute of the prims into a packed buffer.
+
+        Args:
+            attrs: Attribute of each wrapped prim.
+            indices: Indices of prims to process.
+
+        Returns:
+            Concatenated values (shape ``(total number of values, 3)``) and offsets (shape ``(N + 1,)``).
+        """
+        indices = ops_utils.resolve_indices(indices, count=len(self), device="cpu").numpy()
+        chunks = []
+        for index in indices:
+            values = attrs[index].Get()
+            chunks.append(np.asarray(values, dtype=np.float32).reshape((-1, 3)) if values else _EMPTY_VEC3F)
+        offsets = np.zeros((indices.shape[0] + 1,), dtype=np.int32)
+        np.cumsum([chunk.shape[0] for chunk in chunks], out=offsets[1:])
+        data = np.concatenate(chunks, axis=0) if chunks else _EMPTY_VEC3F
+        return ops_utils.place(data, device=self._device), ops_utils.place(offsets, device=self._device)
+
+    def _set_packed_vec3f(
+        self,
+        attrs: list[Usd.Attribute],
+        data: list | np.ndarray | wp.array,
+        offsets: list | np.ndarray | wp.array,
+        indices: int | list | np.ndarray | wp.array | None,
+    ) -> None:
+        """Write a packed buffer to a 3-vector array attribute of the prims inside a single change block.
+
+        Args:
+            attrs: Attribute of each wrapped prim.
+            data: Concatenated values (shape ``(total number of values, 3)``).
+            offsets: Start offset of the values of each prim followed by the total number of values.
+            indices: Indices of prims to process.
+        """
+        indices = ops_utils.resolve_indices(indices, count=len(self), device="cpu").numpy()
+        data = np.ascontiguousarray(ops_utils.place(data, device="cpu").numpy(), dtype=np.float32).reshape((-1, 3))
+        offsets = ops_utils.place(offsets, dtype=wp.int32, device="cpu").numpy().reshape(-1)
+        assert offsets.shape[0] == indices.shape[0] + 1, (
+            f"The number of offsets ({offsets.shape[0]}) must be the number of processed prims "
+            f"({indices.shape[0]}) plus one"
+        )
+        assert offsets[0] == 0 and offsets[-1] == data.shape[0], (
+            f"The offsets must start at 0 and end at the number of values ({data.shape[0]}), "
+            f"got {offsets[0]} and {offsets[-1]}"
+        )
+        assert np.all(np.diff(offsets) >= 0), "The offsets must be non-decreasing"
+        with Sdf.ChangeBlock():
+            for i, index in enumerate(indices):
+                attrs[index].Set(Vt.Vec3fArray.FromNumpy(data[offsets[i] : offsets[i + 1]]))
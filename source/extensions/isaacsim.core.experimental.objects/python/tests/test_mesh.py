@@ -449,3 +449,62 @@ class TestMesh(omni.kit.test.AsyncTestCase):
             cprint(f"  |    |-- indices: {type(indices).__name__}, expected_count: {expected_count}")
             for v0, expected_v0 in draw_choice(shape=(expected_count,), choices=choices):
                 prim.set_display_colors(v0, indices=indices)
+
+    @parametrize(backends=["usd"], prim_class=Mesh, populate_stage_func=populate_stage)
+    async def test_points_packed(self, prim: Any, num_prims: Any, device: Any, backend: Any) -> None:
+        """Test packed points.
+
+        Args:
+            prim: Object wrapper collection under test.
+            num_prims: Number of prims in the parametrized collection.
+            device: Device expected for returned arrays.
+            backend: Backend name selected by parametrization.
+        """
+        for indices, expected_count in draw_indices(count=num_prims, step=2):
+            cprint(f"  |    |-- indices: {type(indices).__name__}, expected_count: {expected_count}")
+            for v0, expected_v0 in self.custom_sample(
+                num_prims=expected_count, batch_range=(1, 10), data_shape=(3,), dtype=wp.float32
+            ):
+                expected_points = [np.asarray(item, dtype=np.float32).reshape((-1, 3)) for item in expected_v0]
+                expected_offsets = np.concatenate(([0], np.cumsum([item.shape[0] for item in expected_points])))
+                prim.set_points_packed(np.concatenate(expected_points), expected_offsets, indices=indices)
+                points, offsets = prim.get_points_packed(indices=indices)
+                check_array(points, shape=(expected_offsets[-1], 3), dtype=wp.float32, device=device)
+                check_array(offsets, shape=(expected_count + 1,), dtype=wp.int32, device=device)
+                check_allclose(expected_offsets, offsets)
+                check_allclose(np.concatenate(expected_points), points)
+                # the unpacked getter sees the same values
+                output = prim.get_points(indices=indices)
+                for i in range(expected_count):
+                    check_allclose(expected_points[i], output[i].numpy().reshape((-1, 3)))
+        # inconsistent offsets
+        with self.assertRaises(AssertionError):
+            prim.set_points_packed(np.zeros((4, 3)), [0, 5])
+
+    @parametrize(backends=["usd"], prim_class=Mesh, populate_stage_func=populate_stage)
+    async def test_normals_packed(self, prim: Any, num_prims: Any, device: Any, backend: Any) -> None:
+        """Test packed normals.
+
+        Args:
+            prim: Object wrapper collection under test.
+            num_prims: Number of prims in the parametrized collection.
+            device: Device expected for returned arrays.
+            backend: Backend name selected by parametrization.
+        """
+        for indices, expected_count in draw_indices(count=num_prims, step=2):
+            cprint(f"  |    |-- indices: {type(indices).__name__}, expected_count: {expected_count}")
+            for v0, expected_v0 in self.custom_sample(
+                num_prims=expected_count, batch_range=(5, 10), data_shape=(3,), dtype=wp.float32
+            ):
+                expected_normals = [np.asarray(item, dtype=np.float32).reshape((-1, 3)) for item in expected_v0]
+                expected_offsets = np.concatenate(([0], np.cumsum([item.shape[0] for item in expected_normals])))
+                prim.set_normals_packed(
+                    wp.array(np.concatenate(expected_normals), dtype=wp.float32),
+                    wp.array(expected_offsets, dtype=wp.int32),
+                    indices=indices,
+                )
+                normals, offsets = prim.get_normals_packed(indices=indices)
+                check_array(normals, shape=(expected_offsets[-1], 3), dtype=wp.float32, device=device)
+                check_array(offsets, shape=(expected_count + 1,), dtype=wp.int32, device=device)
+                check_allclose(expected_offsets, offsets)
+                check_allclose(np.concatenate(expected_normals), normals)
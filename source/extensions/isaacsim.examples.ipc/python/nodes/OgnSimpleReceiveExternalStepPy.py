@@ -17,22 +17,28 @@
 import socket
 import struct
 
+import numpy as np
 import omni.graph.core as og
 from isaacsim.core.nodes import BaseResetNode
+from isaacsim.examples.ipc.scripts.shm_ring import ShmRing, parse_shm_uri
 
 
 class OgnSimpleReceiveExternalStepPyInternalState(BaseResetNode):
-    """Per-instance TCP server state for receiving external step values."""
+    """Per-instance TCP server or shared-memory ring state for receiving external step values."""
 
     def __init__(self) -> None:
         self.listen_sock = None
         self.client_sock = None
+        self.ring = None
         self.buf = bytearray()
         self.uri = ""
         super().__init__(initialize=False)
 
     def custom_reset(self) -> None:
-        """Close sockets and clear buffered input."""
+        """Close sockets and the ring, and clear buffered input."""
+        if self.ring is not None:
+            self.ring.close()
+            self.ring = None
         if self.client_sock is not None:
             try:
                 self.client_sock.close()
@@ -50,14 +56,14 @@ class OgnSimpleReceiveExternalStepPyInternalState(BaseResetNode):
 
 
 class OgnSimpleReceiveExternalStepPy:
-    """Receive a uint32 simulation step over TCP."""
+    """Receive a uint32 simulation step over TCP or a shared-memory ring."""
 
     @staticmethod
     def internal_state() -> OgnSimpleReceiveExternalStepPyInternalState:
         """Create per-instance state for the node.
 
         Returns:
-            Per-instance TCP server state.
+            Per-instance TCP server or shared-memory ring state.
         """
         return OgnSimpleReceiveExternalStepPyInternalState()
 
@@ -73,9 +79,13 @@ class OgnSimpleReceiveExternalStepPy:
         """
         state = db.per_instance_state
         uri = db.inputs.uri
-        if state.listen_sock is not None and state.uri != uri:
+        if (state.listen_sock is not None or state.ring is not None) and state.uri != uri:
             state.custom_reset()
 
+        shm = parse_shm_uri(uri)
+        if shm is not None:
+            return OgnSimpleReceiveExternalStepPy._compute_shm(db, state, uri, *shm)
+
         if state.listen_sock is None:
             try:
                 host, port_str = uri.rsplit(":", 1)
@@ -128,5 +138,41 @@ class OgnSimpleReceiveExternalStepPy:
         (step,) = struct.unpack("<I", state.buf)
         state.buf.clear()
         db.outputs.step = step
+        db.outputs.payload = np.empty(0, dtype=np.uint8)
+        db.outputs.execOut = og.ExecutionAttributeState.ENABLED
+        return True
+
+    @staticmethod
+    def _compute_shm(
+        db: object, state: OgnSimpleReceiveExternalStepPyInternalState, uri: str, name: str, options: dict[str, int]
+    ) -> bool:
+        """Read one step message from a shared-memory ring without blocking.
+
+        The node owns the ring like it owns the listening socket, the external process opens it as producer.
+
+        Args:
+            db: OmniGraph database object for the current node evaluation.
+            state: Per-instance state of the node.
+            uri: The ``shm://`` URI of the ring.
+            name: Name of the ring.
+            options: Ring options given in the URI.
+
+        Returns:
+            True when a step message is received, otherwise False.
+        """
+        if state.ring is None:
+            try:
+                state.ring = ShmRing.create(name, "consumer", **options)
+            except (OSError, ValueError):
+                return False
+            state.uri = uri
+
+        message = state.ring.try_recv()
+        if message is None or len(message) < 4:
+            return False  # no complete message yet; retry next evaluation
+
+        (step,) = struct.unpack_from("<I", message)
+        db.outputs.step = step
+        db.outputs.payload = np.frombuffer(message, dtype=np.uint8, offset=4)
         db.outputs.execOut = og.ExecutionAttributeState.ENABLED
         return True
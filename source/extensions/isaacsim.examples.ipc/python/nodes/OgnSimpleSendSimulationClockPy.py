@@ -19,18 +19,23 @@ import struct
 
 import omni.graph.core as og
 from isaacsim.core.nodes import BaseResetNode
+from isaacsim.examples.ipc.scripts.shm_ring import ShmPeerClosedError, ShmRing, parse_shm_uri
 
 
 class OgnSimpleSendSimulationClockPyInternalState(BaseResetNode):
-    """Per-instance TCP client state for sending simulation clock values."""
+    """Per-instance TCP client or shared-memory ring state for sending simulation clock values."""
 
     def __init__(self) -> None:
         self.sock = None
+        self.ring = None
         self.uri = ""
         super().__init__(initialize=False)
 
     def custom_reset(self) -> None:
-        """Close the socket and reset the cached URI."""
+        """Close the socket or ring and reset the cached URI."""
+        if self.ring is not None:
+            self.ring.close()
+            self.ring = None
         if self.sock is not None:
             try:
                 self.sock.close()
@@ -41,14 +46,14 @@ class OgnSimpleSendSimulationClockPyInternalState(BaseResetNode):
 
 
 class OgnSimpleSendSimulationClockPy:
-    """Send simulation time over TCP as signed nanoseconds."""
+    """Send simulation time over TCP or a shared-memory ring as signed nanoseconds."""
 
     @staticmethod
     def internal_state() -> OgnSimpleSendSimulationClockPyInternalState:
         """Create per-instance state for the node.
 
         Returns:
-            Per-instance TCP client state.
+            Per-instance TCP client or shared-memory ring state.
         """
         return OgnSimpleSendSimulationClockPyInternalState()
 
@@ -64,9 +69,13 @@ class OgnSimpleSendSimulationClockPy:
         """
         state = db.per_instance_state
         uri = db.inputs.uri
-        if state.sock is not None and state.uri != uri:
+        if (state.sock is not None or state.ring is not None) and state.uri != uri:
             state.custom_reset()
 
+        shm = parse_shm_uri(uri)
+        if shm is not None:
+            return OgnSimpleSendSimulationClockPy._compute_shm(db, state, uri, shm[0])
+
         if state.sock is None:
             try:
                 host, port_str = uri.rsplit(":", 1)
@@ -79,6 +88,7 @@ class OgnSimpleSendSimulationClockPy:
             try:
                 s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
                 s.connect((host, port))
+                s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)  # lockstep messages must not wait for ACKs
             except OSError:
                 s.close()
                 db.outputs.execOut = (
@@ -99,3 +109,37 @@ class OgnSimpleSendSimulationClockPy:
 
         db.outputs.execOut = og.ExecutionAttributeState.ENABLED
         return True
+
+    @staticmethod
+    def _compute_shm(db: object, state: OgnSimpleSendSimulationClockPyInternalState, uri: str, name: str) -> bool:
+        """Send one simulation clock value, followed by the payload, over a shared-memory ring.
+
+        The external process owns the ring like it owns the listening socket, the node opens it as producer.
+
+        Args:
+            db: OmniGraph database object for the current node evaluation.
+            state: Per-instance state of the node.
+            uri: The ``shm://`` URI of the ring.
+            name: Name of the ring.
+
+        Returns:
+            True when the clock value is sent, otherwise False.
+        """
+        # pulse execOut even on failure so downstream nodes keep running
+        db.outputs.execOut = og.ExecutionAttributeState.ENABLED
+        if state.ring is None:
+            try:
+                state.ring = ShmRing.open(name, "producer")
+            except (OSError, ValueError):
+                return False  # ring not created yet; retry next evaluation
+            state.uri = uri
+
+        message = struct.pack("<q", int(round(float(db.inputs.simulationTime) * 1e9))) + db.inputs.payload.tobytes()
+        try:
+            return state.ring.try_send(message)
+        except ShmPeerClosedError:
+            state.custom_reset()
+            return False
+        except ValueError as e:
+            db.log_warning(str(e))
+            return False
@@ -0,0 +1,481 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Shared-memory message ring for lockstep IPC with the isaacsim.examples.ipc nodes.
+
+A ring is a single-producer / single-consumer queue of messages in a POSIX shared-memory segment
+(``/dev/shm/<name>``). Messages are copied into fixed-size slots and published by advancing a counter, so a
+message crosses processes without a system call. A receiver first spins briefly, then sleeps on a futex that the
+sender only wakes when the receiver is actually sleeping, which keeps the lockstep round trip in the
+single-digit microseconds.
+
+The ring carries the same messages as the TCP transport (a little-endian uint32 **step** or int64 **clock**),
+and any larger payload that fits in a slot, such as joint commands or states appended after the step.
+
+The module only uses the standard library so external processes can copy or import it. It requires Linux on
+x86-64 or aarch64.
+
+Example:
+
+.. code-block:: python
+
+    consumer = ShmRing.create("isaacsim_ipc_step", "consumer")
+    producer = ShmRing.open("isaacsim_ipc_step", "producer")
+    producer.send(struct.pack("<I", 1))
+    (step,) = struct.unpack_from("<I", consumer.recv(timeout=1.0))
+"""
+
+from __future__ import annotations
+
+import ctypes
+import mmap
+import os
+import platform
+import struct
+import sys
+import time
+
+SHM_URI_SCHEME = "shm://"
+"""URI prefix selecting the shared-memory transport on the IPC nodes, e.g. ``shm://isaacsim_ipc_step``."""
+
+DEFAULT_NUM_SLOTS = 8
+"""Default number of messages a ring can hold."""
+
+DEFAULT_SLOT_SIZE = 4096
+"""Default slot size in bytes, including the 4-byte message length."""
+
+DEFAULT_SPIN_TIME = 50e-6 if len(os.sched_getaffinity(0) if hasattr(os, "sched_getaffinity") else [0]) > 1 else 0.0
+"""Default seconds to busy-wait before sleeping. Spinning only helps when the peer can run on another CPU."""
+
+_MAGIC = 0x4D485349  # "ISHM"
+_VERSION = 1
+
+# Segment layout. The producer and consumer counters live on separate cache lines.
+#   0: magic u32, version u32, num_slots u32, slot_size u32
+#  64: head u64, data_seq u32 (futex), producer_waiting u32, producer_closed u32
+# 128: tail u64, space_seq u32 (futex), consumer_waiting u32, consumer_closed u32
+# 192: num_slots slots of slot_size bytes, each a u32 message length followed by the message
+_CONFIG = struct.Struct("<IIII")
+_LENGTH = struct.Struct("<I")
+_PRODUCER_OFFSET = 64
+_CONSUMER_OFFSET = 128
+_SLOTS_OFFSET = 192
+
+_SYS_FUTEX = {"x86_64": 202, "AMD64": 202, "aarch64": 98, "arm64": 98}.get(platform.machine())
+_FUTEX_WAIT = 0
+_FUTEX_WAKE = 1
+_FUTEX_PRIVATE_FLAG = 128
+# x86-64 does not reorder stores with other stores or loads with other loads, so publishing a message by
+# advancing a counter after writing it needs no fence there. It may still move a load ahead of an earlier store,
+# which a locked instruction prevents. Elsewhere a futex call stands in for the fences, the kernel orders memory
+# accesses around it.
+_X86 = platform.machine() in ("x86_64", "AMD64")
+_libc = ctypes.CDLL(None, use_errno=True) if sys.platform.startswith("linux") else None
+if _libc is not None:
+    # Typed arguments avoid building ctypes objects on every call. syscall() reads each argument as a long.
+    _libc.syscall.argtypes = [
+        ctypes.c_long,
+        ctypes.c_void_p,
+        ctypes.c_long,
+        ctypes.c_long,
+        ctypes.c_void_p,
+        ctypes.c_void_p,
+        ctypes.c_long,
+    ]
+    _libc.syscall.restype = ctypes.c_long
+    _libc.pthread_spin_trylock.argtypes = [ctypes.c_void_p]
+
+
+class _Timespec(ctypes.Structure):
+    _fields_ = [("tv_sec", ctypes.c_long), ("tv_nsec", ctypes.c_long)]
+
+
+def _futex(address: int, op: int, value: int, timeout: _Timespec | None = None) -> None:
+    _libc.syscall(_SYS_FUTEX, address, op, value, ctypes.byref(timeout) if timeout is not None else None, None, 0)
+
+
+_fence_word = ctypes.c_int(0)
+_fence_address = ctypes.addressof(_fence_word)
+
+
+def _publish_fence() -> None:
+    """Order the writes of a message before the counter that publishes it (and the reads after it)."""
+    if not _X86:
+        _futex(_fence_address, _FUTEX_WAKE | _FUTEX_PRIVATE_FLAG, 1)
+
+
+def _full_fence() -> None:
+    """Order a store before the following loads, so a waiter and a waker cannot both miss each other."""
+    if _X86:
+        # A lock cmpxchg on a private word, without entering the kernel
+        _libc.pthread_spin_trylock(_fence_address)
+        _fence_word.value = 0
+    else:
+        _futex(_fence_address, _FUTEX_WAKE | _FUTEX_PRIVATE_FLAG, 1)
+
+
+class ShmPeerClosedError(ConnectionError):
+    """The process on the other end of a ring closed it."""
+
+
+def parse_shm_uri(uri: str) -> tuple[str, dict[str, int]] | None:
+    """Parse a shared-memory URI such as ``shm://isaacsim_ipc_step?num_slots=8&slot_size=4096``.
+
+    Args:
+        uri: URI given to an IPC node.
+
+    Returns:
+        The ring name and the ring options (``num_slots``, ``slot_size``) given in the query, or None if the
+        URI does not use the ``shm://`` scheme or is malformed.
+    """
+    if not uri.startswith(SHM_URI_SCHEME):
+        return None
+    name, _, query = uri[len(SHM_URI_SCHEME) :].partition("?")
+    if not name or "/" in name:
+        return None
+    options = {}
+    for item in filter(None, query.split("&")):
+        key, _, value = item.partition("=")
+        if key not in ("num_slots", "slot_size") or not value.isdigit():
+            return None
+        options[key] = int(value)
+    return name, options
+
+
+class ShmRing:
+    """One end of a single-producer / single-consumer message ring in shared memory.
+
+    Use :meth:`create` on the side that owns the ring (like a listening socket) and :meth:`open` on the other
+    side. The creator unlinks the segment on :meth:`close`.
+
+    Args:
+        name: Name of the shared-memory segment, without leading slash.
+        role: ``"producer"`` to send messages or ``"consumer"`` to receive them.
+        create: Whether to create the segment, replacing a stale one with the same name.
+        num_slots: Number of messages the ring can hold. Only used when creating.
+        slot_size: Size of a slot in bytes, including the 4-byte message length. Only used when creating.
+        spin_time: Seconds to busy-wait for a message or free slot before sleeping on the futex.
+
+    Raises:
+        OSError: If the platform is not supported.
+        FileNotFoundError: If opening a ring that does not exist or is not initialized yet.
+        ValueError: If the arguments are invalid or the segment is not a ring of this version.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        role: str,
+        create: bool,
+        num_slots: int = DEFAULT_NUM_SLOTS,
+        slot_size: int = DEFAULT_SLOT_SIZE,
+        spin_time: float = DEFAULT_SPIN_TIME,
+    ) -> None:
+        if _libc is None or _SYS_FUTEX is None:
+            raise OSError("The shared-memory transport requires Linux on x86-64 or aarch64")
+        if role not in ("producer", "consumer"):
+            raise ValueError(f"Invalid ring role '{role}', expected 'producer' or 'consumer'")
+        if not name or "/" in name:
+            raise ValueError(f"Invalid ring name '{name}'")
+        self.name = name
+        self.role = role
+        self.spin_time = spin_time
+        self._path = f"/dev/shm/{name}"
+        self._owner = create
+        self._mmap = None
+        self._words = []
+
+        if create:
+            if num_slots < 1 or slot_size <= _LENGTH.size:
+                raise ValueError("A ring needs at least one slot larger than the 4-byte message length")
+            size = _SLOTS_OFFSET + num_slots * slot_size
+            try:
+                fd = os.open(self._path, os.O_CREAT | os.O_EXCL | os.O_RDWR, 0o600)
+            except FileExistsError:
+                # Left behind by a process that did not close the ring, replace it like SO_REUSEADDR would
+                os.unlink(self._path)
+                fd = os.open(self._path, os.O_CREAT | os.O_EXCL | os.O_RDWR, 0o600)
+            try:
+                os.ftruncate(fd, size)
+                self._mmap = mmap.mmap(fd, size)
+            finally:
+                os.close(fd)
+            # Publish the configuration last, an opener treats a segment without magic as not ready
+            _CONFIG.pack_into(self._mmap, 0, 0, _VERSION, num_slots, slot_size)
+            _publish_fence()
+            _CONFIG.pack_into(self._mmap, 0, _MAGIC, _VERSION, num_slots, slot_size)
+        else:
+            fd = os.open(self._path, os.O_RDWR)
+            try:
+                size = os.fstat(fd).st_size
+                if size < _SLOTS_OFFSET:
+                    raise FileNotFoundError(f"Shared-memory ring '{name}' is not initialized yet")
+                self._mmap = mmap.mmap(fd, size)
+            finally:
+                os.close(fd)
+            magic, version, num_slots, slot_size = _CONFIG.unpack_from(self._mmap, 0)
+            if magic != _MAGIC:
+                self._mmap.close()
+                raise FileNotFoundError(f"Shared-memory ring '{name}' is not initialized yet")
+            if version != _VERSION or size < _SLOTS_OFFSET + num_slots * slot_size:
+                self._mmap.close()
+                raise ValueError(f"Shared memory segment '{name}' is not a version {_VERSION} message ring")
+            _publish_fence()
+
+        self.num_slots = num_slots
+        self.slot_size = slot_size
+        self._head = self._word(ctypes.c_uint64, _PRODUCER_OFFSET)
+        self._data_seq = self._word(ctypes.c_uint32, _PRODUCER_OFFSET + 8)
+        self._producer_waiting = self._word(ctypes.c_uint32, _PRODUCER_OFFSET + 12)
+        self._producer_closed = self._word(ctypes.c_uint32, _PRODUCER_OFFSET + 16)
+        self._tail = self._word(ctypes.c_uint64, _CONSUMER_OFFSET)
+        self._space_seq = self._word(ctypes.c_uint32, _CONSUMER_OFFSET + 8)
+        self._consumer_waiting = self._word(ctypes.c_uint32, _CONSUMER_OFFSET + 12)
+        self._consumer_closed = self._word(ctypes.c_uint32, _CONSUMER_OFFSET + 16)
+        self._data_seq_address = ctypes.addressof(self._data_seq)
+        self._space_seq_address = ctypes.addressof(self._space_seq)
+        # A new peer replaces one that closed the ring before
+        if role == "producer":
+            self._producer_closed.value = 0
+        else:
+            self._consumer_closed.value = 0
+
+    @classmethod
+    def create(
+        cls,
+        name: str,
+        role: str,
+        num_slots: int = DEFAULT_NUM_SLOTS,
+        slot_size: int = DEFAULT_SLOT_SIZE,
+        spin_time: float = DEFAULT_SPIN_TIME,
+    ) -> ShmRing:
+        """Create a ring, replacing a stale segment with the same name.
+
+        Args:
+            name: Name of the shared-memory segment, without leading slash.
+            role: ``"producer"`` to send messages or ``"consumer"`` to receive them.
+            num_slots: Number of messages the ring can hold.
+            slot_size: Size of a slot in bytes, including the 4-byte message length.
+            spin_time: Seconds to busy-wait before sleeping on the futex.
+
+        Returns:
+            The created ring end.
+        """
+        return cls(name, role, True, num_slots, slot_size, spin_time)
+
+    @classmethod
+    def open(cls, name: str, role: str, spin_time: float = DEFAULT_SPIN_TIME) -> ShmRing:
+        """Open a ring created by another process.
+
+        Args:
+            name: Name of the shared-memory segment, without leading slash.
+            role: ``"producer"`` to send messages or ``"consumer"`` to receive them.
+            spin_time: Seconds to busy-wait before sleeping on the futex.
+
+        Returns:
+            The opened ring end.
+
+        Raises:
+            FileNotFoundError: If the ring does not exist or is not initialized yet.
+        """
+        return cls(name, role, False, spin_time=spin_time)
+
+    def _word(self, ctype: type, offset: int) -> ctypes._SimpleCData:
+        word = ctype.from_buffer(self._mmap, offset)
+        self._words.append(word)
+        return word
+
+    def __enter__(self) -> ShmRing:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def max_message_size(self) -> int:
+        """Largest message in bytes that fits in a slot."""
+        return self.slot_size - _LENGTH.size
+
+    @property
+    def peer_closed(self) -> bool:
+        """Whether the process on the other end closed the ring."""
+        if self.role == "producer":
+            return bool(self._consumer_closed.value)
+        return bool(self._producer_closed.value)
+
+    def try_send(self, data: bytes) -> bool:
+        """Send a message without waiting.
+
+        Args:
+            data: Message to send, at most :attr:`max_message_size` bytes.
+
+        Returns:
+            True if the message was queued, False if the ring is full.
+
+        Raises:
+            ShmPeerClosedError: If the consumer closed the ring.
+            ValueError: If the message does not fit in a slot.
+        """
+        if len(data) > self.max_message_size:
+            raise ValueError(f"Message of {len(data)} bytes exceeds the ring slot capacity of {self.max_message_size}")
+        if self._consumer_closed.value:
+            raise ShmPeerClosedError(f"Consumer closed shared-memory ring '{self.name}'")
+        head = self._head.value
+        if head - self._tail.value >= self.num_slots:
+            return False
+        offset = _SLOTS_OFFSET + (head % self.num_slots) * self.slot_size
+        _LENGTH.pack_into(self._mmap, offset, len(data))
+        self._mmap[offset + _LENGTH.size : offset + _LENGTH.size + len(data)] = data
+        _publish_fence()
+        self._head.value = head + 1
+        self._data_seq.value = (self._data_seq.value + 1) & 0xFFFFFFFF
+        _full_fence()
+        if self._consumer_waiting.value:
+            _futex(self._data_seq_address, _FUTEX_WAKE, 1)
+        return True
+
+    def try_recv(self) -> bytes | None:
+        """Receive a message without waiting.
+
+        Returns:
+            The oldest queued message, or None if the ring is empty.
+        """
+        tail = self._tail.value
+        if self._head.value == tail:
+            return None
+        _publish_fence()
+        offset = _SLOTS_OFFSET + (tail % self.num_slots) * self.slot_size
+        (length,) = _LENGTH.unpack_from(self._mmap, offset)
+        message = self._mmap[offset + _LENGTH.size : offset + _LENGTH.size + length]
+        _publish_fence()
+        self._tail.value = tail + 1
+        self._space_seq.value = (self._space_seq.value + 1) & 0xFFFFFFFF
+        _full_fence()
+        if self._producer_waiting.value:
+            _futex(self._space_seq_address, _FUTEX_WAKE, 1)
+        return message
+
+    def _wait(
+        self, poll: object, seq: ctypes.c_uint32, seq_address: int, waiting: ctypes.c_uint32, timeout: float | None
+    ) -> object:
+        """Spin, then sleep on a futex, until ``poll`` returns something other than None.
+
+        Args:
+            poll: Callable attempting the operation, returning None while it cannot complete.
+            seq: Futex word the peer increments when the operation may succeed.
+            seq_address: Address of ``seq``.
+            waiting: Flag telling the peer to wake ``seq``.
+            timeout: Seconds to wait, or None to wait forever.
+
+        Returns:
+            The result of ``poll``, or None on timeout.
+        """
+        now = time.perf_counter()
+        deadline = None if timeout is None else now + timeout
+        spin_end = now + self.spin_time
+        while True:
+            result = poll()
+            if result is not None:
+                return result
+            now = time.perf_counter()
+            if deadline is not None and now >= deadline:
+                return None
+            if now < spin_end:
+                continue
+            # Announce the sleep before checking one last time, the peer wakes the futex after a change it
+            # publishes once it sees the flag. The futex only sleeps while its word still has the value read here.
+            expected = seq.value
+            waiting.value = 1
+            _full_fence()
+            result = poll()
+            if result is None:
+                if deadline is None:
+                    _futex(seq_address, _FUTEX_WAIT, expected)
+                else:
+                    remaining = deadline - now
+                    _futex(seq_address, _FUTEX_WAIT, expected, _Timespec(int(remaining), int(remaining % 1 * 1e9)))
+            waiting.value = 0
+            if result is not None:
+                return result
+
+    def send(self, data: bytes, timeout: float | None = None) -> bool:
+        """Send a message, waiting for a free slot if the ring is full.
+
+        Args:
+            data: Message to send, at most :attr:`max_message_size` bytes.
+            timeout: Seconds to wait for a free slot, or None to wait forever.
+
+        Returns:
+            True if the message was queued, False on timeout.
+
+        Raises:
+            ShmPeerClosedError: If the consumer closed the ring.
+            ValueError: If the message does not fit in a slot.
+        """
+        if self.try_send(data):
+            return True
+        poll = lambda: True if self.try_send(data) else None  # noqa: E731
+        return self._wait(poll, self._space_seq, self._space_seq_address, self._producer_waiting, timeout) is not None
+
+    def recv(self, timeout: float | None = None) -> bytes | None:
+        """Receive a message, waiting for one if the ring is empty.
+
+        Args:
+            timeout: Seconds to wait for a message, or None to wait forever.
+
+        Returns:
+            The oldest queued message, or None on timeout.
+
+        Raises:
+            ShmPeerClosedError: If the producer closed the ring and all its messages were received.
+        """
+
+        message = self.try_recv()
+        if message is not None:
+            return message
+
+        def poll() -> bytes | None:
+            message = self.try_recv()
+            if message is None and self._producer_closed.value:
+                raise ShmPeerClosedError(f"Producer closed shared-memory ring '{self.name}'")
+            return message
+
+        return self._wait(poll, self._data_seq, self._data_seq_address, self._consumer_waiting, timeout)
+
+    def close(self) -> None:
+        """Close this end of the ring, waking the peer. The creator also unlinks the segment."""
+        if self._mmap is None:
+            return
+        if self.role == "producer":
+            self._producer_closed.value = 1
+            # Change the futex word so a peer about to sleep on it returns immediately
+            self._data_seq.value = (self._data_seq.value + 1) & 0xFFFFFFFF
+            _futex(self._data_seq_address, _FUTEX_WAKE, 1)
+        else:
+            self._consumer_closed.value = 1
+            self._space_seq.value = (self._space_seq.value + 1) & 0xFFFFFFFF
+            _futex(self._space_seq_address, _FUTEX_WAKE, 1)
+        # The mapping cannot be closed while ctypes views into it are alive
+        self._head = self._data_seq = self._producer_waiting = self._producer_closed = None
+        self._tail = self._space_seq = self._consumer_waiting = self._consumer_closed = None
+        self._words.clear()
+        self._data_seq_address = self._space_seq_address = 0
+        self._mmap.close()
+        self._mmap = None
+        if self._owner:
+            try:
+                os.unlink(self._path)
+            except FileNotFoundError:
+                pass
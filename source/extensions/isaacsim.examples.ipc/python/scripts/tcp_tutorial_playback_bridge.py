@@ -13,7 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-"""TCP bridge for the isaacsim.examples.ipc tutorial with **On Playback Tick** pacing.
+"""TCP or shared-memory bridge for the isaacsim.examples.ipc tutorial with **On Playback Tick** pacing.
 
 Use with a graph wired like::
 
@@ -35,6 +35,11 @@ This process:
 **Startup order:** start **playback** in Isaac Sim first so **Receive External Step** is
 listening, then run this script, then let the timeline advance (playback ticks).
 
+With ``--transport shm`` the same exchange goes through shared-memory rings instead of sockets
+(see ``shm_ring.py``): this process creates the clock ring ``--clock-shm`` and opens the step ring
+``--step-shm`` created by **Receive External Step**. Set the node uris to ``shm://isaacsim_ipc_step``
+and ``shm://isaacsim_ipc_clock`` to match the defaults.
+
 Matches the wire formats in the Isaac Sim user guide (IPC OmniGraph nodes).
 """
 
@@ -44,6 +49,12 @@ import argparse
 import socket
 import struct
 import sys
+from collections.abc import Callable
+
+try:
+    from .shm_ring import ShmPeerClosedError, ShmRing
+except ImportError:  # run as a script
+    from shm_ring import ShmPeerClosedError, ShmRing
 
 
 class ClockPeerDisconnected(Exception):
@@ -76,8 +87,97 @@ def _recv_exact(conn: socket.socket, n: int) -> bytes:
     return b"".join(chunks)
 
 
+def _lockstep(
+    recv_clock: Callable[[], bytes], send_step: Callable[[int], None], step_val: int, args: argparse.Namespace
+) -> int:
+    """Exchange clock and step messages until ``--max-frames`` or a peer disconnects.
+
+    Args:
+        recv_clock: Blocks until the next clock message arrives, raising :class:`ClockPeerDisconnected`.
+        send_step: Sends a step value, raising :class:`ConnectionError` if the peer is gone.
+        step_val: Step value sent to prime the first tick.
+        args: Parsed command-line arguments.
+
+    Returns:
+        Process exit code.
+    """
+    frame = 0
+    while args.max_frames is None or frame < args.max_frames:
+        try:
+            data = recv_clock()
+        except ClockPeerDisconnected as e:
+            if e.bytes_received == 0:
+                print(
+                    "No clock connection: peer closed (simulation stopped or Send Simulation Clock disconnected).",
+                    flush=True,
+                )
+            else:
+                print(
+                    "No clock connection: peer closed mid-message "
+                    f"({e.bytes_received} of {e.expected} bytes; simulation stopped or graph unloaded).",
+                    flush=True,
+                )
+            return 0
+        (t_ns,) = struct.unpack_from("<q", data)
+        if not args.quiet:
+            print(f"frame={frame} time_ns={t_ns}", flush=True)
+        frame += 1
+        if args.max_frames is not None and frame >= args.max_frames:
+            break
+        step_val = (step_val + args.step_delta) & 0xFFFFFFFF
+        try:
+            send_step(step_val)
+        except ConnectionError:
+            print(
+                "No step connection: peer closed (simulation stopped or Receive External Step disconnected).",
+                flush=True,
+            )
+            return 0
+    return 0
+
+
+def _run_shm(args: argparse.Namespace) -> int:
+    """Run the bridge over shared-memory rings.
+
+    Args:
+        args: Parsed command-line arguments.
+
+    Returns:
+        Process exit code.
+    """
+    clock_ring = ShmRing.create(args.clock_shm, "consumer")
+    step_ring: ShmRing | None = None
+    try:
+        print(f"Created clock ring '{args.clock_shm}' for Send Simulation Clock…", flush=True)
+        try:
+            step_ring = ShmRing.open(args.step_shm, "producer")
+        except FileNotFoundError:
+            print(
+                f"No step ring: Receive External Step has not created '{args.step_shm}' yet. "
+                "Start simulation / playback in Isaac Sim first, then run this script again.",
+                flush=True,
+            )
+            return 0
+
+        step_val = args.initial_step & 0xFFFFFFFF
+        step_ring.send(struct.pack("<I", step_val))
+        print(f"Primed step={step_val}; waiting for Send Simulation Clock…", flush=True)
+
+        def recv_clock() -> bytes:
+            try:
+                return clock_ring.recv()
+            except ShmPeerClosedError:
+                raise ClockPeerDisconnected(0, 8) from None
+
+        return _lockstep(recv_clock, lambda step: step_ring.send(struct.pack("<I", step)), step_val, args)
+    finally:
+        if step_ring is not None:
+            step_ring.close()
+        clock_ring.close()
+
+
 def main(argv: list[str] | None = None) -> int:
-    """Run the tutorial TCP playback bridge.
+    """Run the tutorial TCP or shared-memory playback bridge.
 
     Args:
         argv: Command-line arguments to parse, or None to use ``sys.argv``.
@@ -126,6 +226,27 @@ def main(argv: list[str] | None = None) -> int:
         default=None,
         help="Exit after this many clock messages (default: run until Ctrl+C).",
     )
+    p.add_argument(
+        "--transport",
+        choices=("tcp", "shm"),
+        default="tcp",
+        help="Exchange messages over TCP sockets or shared-memory rings (default: tcp).",
+    )
+    p.add_argument(
+        "--clock-shm",
+        default="isaacsim_ipc_clock",
+        help="Name of the clock ring this process creates with --transport shm (default: isaacsim_ipc_clock).",
+    )
+    p.add_argument(
+        "--step-shm",
+        default="isaacsim_ipc_step",
+        help="Name of the step ring created by Receive External Step (default: isaacsim_ipc_step).",
+    )
+    p.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Do not print every clock message.",
+    )
     args = p.parse_args(argv)
 
     if args.initial_step < 0 or args.initial_step > 0xFFFFFFFF:
@@ -135,6 +256,16 @@ def main(argv: list[str] | None = None) -> int:
         print("--step-delta must fit in uint32", file=sys.stderr)
         return 1
 
+    if args.transport == "shm":
+        try:
+            return _run_shm(args)
+        except KeyboardInterrupt:
+            print("Interrupted.", file=sys.stderr)
+            return 130
+        except (OSError, ValueError) as e:
+            print(e, file=sys.stderr)
+            return 1
+
     clock_srv = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     clock_srv.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
     clock_srv.bind((args.clock_host, args.clock_port))
@@ -153,6 +284,7 @@ def main(argv: list[str] | None = None) -> int:
         )
         try:
             step_sock.connect((args.step_host, args.step_port))
+            step_sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)  # do not hold steps back waiting for ACKs
         except ConnectionRefusedError:
             print(
                 "No connection: Receive External Step is not listening yet "
@@ -172,39 +304,9 @@ def main(argv: list[str] | None = None) -> int:
         clock_conn, peer = clock_srv.accept()
         print(f"Clock TCP peer {peer}", flush=True)
 
-        frame = 0
-        while args.max_frames is None or frame < args.max_frames:
-            try:
-                data = _recv_exact(clock_conn, 8)
-            except ClockPeerDisconnected as e:
-                if e.bytes_received == 0:
-                    print(
-                        "No clock connection: peer closed (simulation stopped or Send Simulation Clock disconnected).",
-                        flush=True,
-                    )
-                else:
-                    print(
-                        "No clock connection: peer closed mid-message "
-                        f"({e.bytes_received} of {e.expected} bytes; simulation stopped or graph unloaded).",
-                        flush=True,
-                    )
-                return 0
-            (t_ns,) = struct.unpack("<q", data)
-            print(f"frame={frame} time_ns={t_ns}", flush=True)
-            frame += 1
-            if args.max_frames is not None and frame >= args.max_frames:
-                break
-            step_val = (step_val + args.step_delta) & 0xFFFFFFFF
-            try:
-                step_sock.sendall(struct.pack("<I", step_val))
-            except BrokenPipeError:
-                print(
-                    "No step connection: peer closed (simulation stopped or Receive External Step disconnected).",
-                    flush=True,
-                )
-                return 0
-
-        return 0
+        return _lockstep(
+            lambda: _recv_exact(clock_conn, 8), lambda step: step_sock.sendall(struct.pack("<I", step)), step_val, args
+        )
     except KeyboardInterrupt:
         print("Interrupted.", file=sys.stderr)
         return 130
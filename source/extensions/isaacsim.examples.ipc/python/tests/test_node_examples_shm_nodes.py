@@ -0,0 +1,195 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the shared-memory ring and the Python IPC nodes using it."""
+
+import os
+import struct
+import threading
+import time
+
+import omni
+import omni.graph.core as og
+import omni.kit.test
+from isaacsim.examples.ipc.scripts.shm_ring import ShmPeerClosedError, ShmRing, parse_shm_uri
+
+
+def _ring_name(suffix: str) -> str:
+    """Ring name unique to this test process.
+
+    Args:
+        suffix: Distinguishes rings of one test.
+
+    Returns:
+        Shared-memory segment name.
+    """
+    return f"isaacsim_ipc_test_{os.getpid()}_{suffix}"
+
+
+class TestShmRing(omni.kit.test.AsyncTestCase):
+    """Unit tests for :class:`ShmRing`."""
+
+    async def test_parse_shm_uri(self) -> None:
+        """Only ``shm://`` URIs with a plain name and known integer options are accepted."""
+        self.assertEqual(parse_shm_uri("shm://ring"), ("ring", {}))
+        self.assertEqual(
+            parse_shm_uri("shm://ring?num_slots=4&slot_size=256"), ("ring", {"num_slots": 4, "slot_size": 256})
+        )
+        self.assertIsNone(parse_shm_uri("127.0.0.1:9001"))
+        self.assertIsNone(parse_shm_uri("shm://"))
+        self.assertIsNone(parse_shm_uri("shm://a/b"))
+        self.assertIsNone(parse_shm_uri("shm://ring?depth=4"))
+
+    async def test_send_and_receive(self) -> None:
+        """Messages arrive in order with their payload, a full ring rejects messages until one is received."""
+        with ShmRing.create(_ring_name("order"), "consumer", num_slots=2, slot_size=64) as consumer:
+            with ShmRing.open(consumer.name, "producer") as producer:
+                self.assertEqual(producer.max_message_size, 60)
+                self.assertIsNone(consumer.try_recv())
+                self.assertTrue(producer.try_send(struct.pack("<I", 7) + b"joint commands"))
+                self.assertTrue(producer.try_send(struct.pack("<I", 8)))
+                self.assertFalse(producer.try_send(struct.pack("<I", 9)))
+                self.assertFalse(producer.send(struct.pack("<I", 9), timeout=0.01))
+                with self.assertRaises(ValueError):
+                    producer.try_send(bytes(61))
+
+                self.assertEqual(consumer.recv(timeout=1.0), struct.pack("<I", 7) + b"joint commands")
+                self.assertTrue(producer.try_send(struct.pack("<I", 9)))
+                self.assertEqual(consumer.try_recv(), struct.pack("<I", 8))
+                self.assertEqual(consumer.try_recv(), struct.pack("<I", 9))
+                self.assertIsNone(consumer.recv(timeout=0.01))
+        self.assertFalse(os.path.exists(f"/dev/shm/{consumer.name}"))
+        with self.assertRaises(FileNotFoundError):
+            ShmRing.open(consumer.name, "producer")
+
+    async def test_blocking_receive_and_peer_close(self) -> None:
+        """A receiver sleeping on the ring is woken by a message and learns when the producer closes."""
+        consumer = ShmRing.create(_ring_name("wake"), "consumer", spin_time=0.0)
+        producer = ShmRing.open(consumer.name, "producer")
+
+        def produce() -> None:
+            for step in range(100):
+                producer.send(struct.pack("<I", step))
+                time.sleep(0.0005)
+            producer.close()
+
+        thread = threading.Thread(target=produce, daemon=True)
+        thread.start()
+        try:
+            steps = [struct.unpack("<I", consumer.recv(timeout=5.0))[0] for _ in range(100)]
+            self.assertEqual(steps, list(range(100)))
+            with self.assertRaises(ShmPeerClosedError):
+                consumer.recv(timeout=5.0)
+            self.assertTrue(consumer.peer_closed)
+        finally:
+            thread.join(timeout=5.0)
+            consumer.close()
+
+        with ShmRing.create(_ring_name("closed"), "producer") as producer:
+            ShmRing.open(producer.name, "consumer").close()
+            self.assertTrue(producer.peer_closed)
+            with self.assertRaises(ShmPeerClosedError):
+                producer.try_send(b"\x00")
+
+
+class TestNodeExamplesShmNodes(omni.kit.test.AsyncTestCase):
+    """Integration tests for the Python IPC nodes over shared-memory rings."""
+
+    graph_path = "/ActionGraph"
+
+    async def setUp(self) -> None:
+        """Create a new stage before each test."""
+        await omni.usd.get_context().new_stage_async()
+        await omni.kit.app.get_app().next_update_async()
+
+    async def tearDown(self) -> None:
+        """Stop playback and clear the stage after each test."""
+        timeline = omni.timeline.get_timeline_interface()
+        if timeline.is_playing():
+            timeline.stop()
+        await omni.usd.get_context().new_stage_async()
+        await omni.kit.app.get_app().next_update_async()
+
+    async def _trigger_impulse(self) -> None:
+        og.Controller.attribute(f"{self.graph_path}/OnImpulse.state:enableImpulse").set(True)
+        await omni.kit.app.get_app().next_update_async()
+
+    async def test_py_send_simulation_clock_shm(self) -> None:
+        """The Python send node writes the clock followed by the payload into a ring created by the peer."""
+        with ShmRing.create(_ring_name("clock"), "consumer") as clock_ring:
+            og.Controller.edit(
+                {"graph_path": self.graph_path, "evaluator_name": "execution"},
+                {
+                    og.Controller.Keys.CREATE_NODES: [
+                        ("OnImpulse", "omni.graph.action.OnImpulseEvent"),
+                        ("Sender", "isaacsim.examples.ipc.SimpleSendSimulationClockPy"),
+                    ],
+                    og.Controller.Keys.SET_VALUES: [
+                        ("Sender.inputs:uri", f"shm://{clock_ring.name}"),
+                        ("Sender.inputs:simulationTime", 100e-9),
+                        ("Sender.inputs:payload", [1, 2, 3]),
+                    ],
+                    og.Controller.Keys.CONNECT: [
+                        ("OnImpulse.outputs:execOut", "Sender.inputs:execIn"),
+                    ],
+                },
+            )
+
+            timeline = omni.timeline.get_timeline_interface()
+            timeline.play()
+            await self._trigger_impulse()
+
+            self.assertEqual(clock_ring.recv(timeout=5.0), struct.pack("<q", 100) + bytes([1, 2, 3]))
+
+    async def test_py_receive_external_step_shm(self) -> None:
+        """The Python receive node creates the step ring and outputs the step and its payload."""
+        name = _ring_name("step")
+        og.Controller.edit(
+            {"graph_path": self.graph_path, "evaluator_name": "execution"},
+            {
+                og.Controller.Keys.CREATE_NODES: [
+                    ("OnImpulse", "omni.graph.action.OnImpulseEvent"),
+                    ("Receiver", "isaacsim.examples.ipc.SimpleReceiveExternalStepPy"),
+                ],
+                og.Controller.Keys.SET_VALUES: [
+                    ("Receiver.inputs:uri", f"shm://{name}?num_slots=4&slot_size=128"),
+                ],
+                og.Controller.Keys.CONNECT: [
+                    ("OnImpulse.outputs:execOut", "Receiver.inputs:execIn"),
+                ],
+            },
+        )
+
+        timeline = omni.timeline.get_timeline_interface()
+        timeline.play()
+        # The first compute creates the ring
+        await self._trigger_impulse()
+
+        with ShmRing.open(name, "producer") as step_ring:
+            self.assertEqual(step_ring.max_message_size, 124)
+            step_ring.send(struct.pack("<I", 4294967290) + bytes([9, 8]))
+            step_attr = og.Controller.attribute(f"{self.graph_path}/Receiver.outputs:step")
+            for _ in range(240):
+                await self._trigger_impulse()
+                if int(step_attr.get()) == 4294967290:
+                    break
+            else:
+                self.fail(f"Timed out waiting for the step, last outputs:step={step_attr.get()!r}")
+            payload = og.Controller.attribute(f"{self.graph_path}/Receiver.outputs:payload").get()
+            self.assertEqual(list(payload), [9, 8])
+
+        timeline.stop()
+        await omni.kit.app.get_app().next_update_async()
+        self.assertFalse(os.path.exists(f"/dev/shm/{name}"))
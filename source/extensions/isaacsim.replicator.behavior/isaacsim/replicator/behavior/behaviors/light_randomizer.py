@@ -28,6 +28,7 @@ from isaacsim.replicator.behavior.utils.behavior_utils import (
     get_exposed_variable,
     remove_exposed_variables,
 )
+from isaacsim.replicator.behavior.utils.write_scheduler import get_write_scheduler
 from omni.behavior.scripting.core import BehaviorScript
 from pxr import Gf, Sdf, Usd, UsdLux
 
@@ -82,6 +83,7 @@ class LightRandomizer(BehaviorScript):
         self._interval = 0
         self._valid_prims = []
         self._initial_attributes = {}
+        self._light_attributes = []
 
         # Expose the variables as USD attributes
         create_exposed_variables(self.prim, EXPOSED_ATTR_NS, self.BEHAVIOR_NS, self.VARIABLES_TO_EXPOSE)
@@ -153,8 +155,16 @@ class LightRandomizer(BehaviorScript):
         for prim in self._valid_prims:
             self._cache_initial_attributes(prim)
 
+        # Cache the randomized attributes to avoid looking them up on every update
+        self._light_attributes = [
+            (prim.GetAttribute("inputs:color"), prim.GetAttribute("inputs:intensity")) for prim in self._valid_prims
+        ]
+
     def _reset(self) -> None:
-        # Restore original attributes
+        # Drop randomized values not yet written and restore original attributes
+        get_write_scheduler().discard(
+            [prim.GetAttribute(attr_name) for prim, attrs in self._initial_attributes.items() for attr_name in attrs]
+        )
         for prim, attrs in self._initial_attributes.items():
             for attr_name, attr_value in attrs.items():
                 if attr_value is None:
@@ -164,20 +174,23 @@ class LightRandomizer(BehaviorScript):
         # Clear cached values
         self._valid_prims.clear()
         self._initial_attributes.clear()
+        self._light_attributes = []
         self._update_counter = 0
         self._rng = None
 
     def _apply_behavior(self) -> None:
-        for prim in self._valid_prims:
+        # Queue the writes to the cached attributes, applied with the other behaviors' writes in a batch
+        scheduler = get_write_scheduler()
+        for color_attr, intensity_attr in self._light_attributes:
             rand_color = (
                 self._rng.uniform(self._min_color[0], self._max_color[0]),
                 self._rng.uniform(self._min_color[1], self._max_color[1]),
                 self._rng.uniform(self._min_color[2], self._max_color[2]),
             )
-            prim.GetAttribute("inputs:color").Set(rand_color)
+            scheduler.set(color_attr, rand_color)
 
             rand_intensity = self._rng.uniform(self._intensity_range[0], self._intensity_range[1])
-            prim.GetAttribute("inputs:intensity").Set(rand_intensity)
+            scheduler.set(intensity_attr, rand_intensity)
 
     def _cache_initial_attributes(self, prim: Usd.Prim) -> None:
         if not prim.HasAttribute("inputs:intensity"):
@@ -28,7 +28,12 @@ from isaacsim.replicator.behavior.utils.behavior_utils import (
     get_exposed_variable,
     remove_exposed_variables,
 )
-from isaacsim.replicator.behavior.utils.scene_utils import get_world_location
+from isaacsim.replicator.behavior.utils.scene_utils import (
+    compute_translation_op_value,
+    get_translation_op,
+    get_world_location,
+)
+from isaacsim.replicator.behavior.utils.write_scheduler import get_write_scheduler
 from omni.behavior.scripting.core import BehaviorScript
 from pxr import Gf, Sdf, Usd, UsdGeom
 
@@ -104,6 +109,7 @@ class LocationRandomizer(BehaviorScript):
         self._valid_prims = []
         self._initial_locations = {}
         self._target_offsets = {}
+        self._location_ops = {}
 
         # Expose the variables as USD attributes
         create_exposed_variables(self.prim, EXPOSED_ATTR_NS, self.BEHAVIOR_NS, self.VARIABLES_TO_EXPOSE)
@@ -186,26 +192,33 @@ class LocationRandomizer(BehaviorScript):
                         f"[{self.prim_path}] Target prim '{target_prim_path}' not found, not valid, or not Xformable."
                     )
 
-        # Save the initial locations (and relative offsets) of the prims
+        # Save the initial locations (and relative offsets) of the prims, and cache the xform ops to write to
         for prim in self._valid_prims:
             self._initial_locations[prim] = self._get_location(prim)
+            self._location_ops[prim] = get_translation_op(prim)
             if self._target_prim:
                 self._target_offsets[prim] = self._initial_locations[prim] - get_world_location(self._target_prim)
 
     def _reset(self) -> None:
-        # Set prims back to their initial locations
+        # Drop randomized locations not yet written and set prims back to their initial locations
+        get_write_scheduler().discard([op for op in self._location_ops.values() if op])
         for prim, location in self._initial_locations.items():
             self._set_location(prim, location)
         # Clear cached values
         self._valid_prims.clear()
         self._initial_locations.clear()
         self._target_offsets.clear()
+        self._location_ops.clear()
         self._target_prim = None
         self._interval = 0
         self._update_counter = 0
         self._rng = None
 
     def _apply_behavior(self) -> None:
+        # Locations relative to a target depend on its current world location, apply any writes queued by other
+        # behaviors first
+        if self._target_prim:
+            get_write_scheduler().flush()
         # Run the randomization for each valid prim
         for prim in self._valid_prims:
             self._randomize_location(prim)
@@ -235,23 +248,21 @@ class LocationRandomizer(BehaviorScript):
 
     def _set_location(self, prim: Usd.Prim, location: Gf.Vec3d) -> None:
         # Set the location of the prim based on the available xformOps
-        xformable = UsdGeom.Xformable(prim)
-        xform_ops = xformable.GetOrderedXformOps()
-
-        # Look for a valid translation op to set the new rotation
-        for op in xform_ops:
-            op_name = op.GetOpName()
-            if op_name == "xformOp:translate":
-                op.Set(location)
-                return
-            elif op_name == "xformOp:transform":
-                transform_matrix = op.Get()
-                transform = Gf.Transform(transform_matrix)
-                transform.SetTranslation(location)
-                op.Set(transform.GetMatrix())
-                return
+        translation_op = get_translation_op(prim)
+        if translation_op is None:
+            carb.log_warn(f"No valid location op found on {prim.GetPath()}")
+            return
+        translation_op.Set(compute_translation_op_value(translation_op, location))
 
-        carb.log_warn(f"No valid location op found on {prim.GetPath()}")
+    def _queue_location(self, prim: Usd.Prim, location: Gf.Vec3d) -> None:
+        # Queue the location write using the cached xformOp, applied with the other behaviors' writes in a batch
+        translation_op = self._location_ops.get(prim)
+        if translation_op is None:
+            carb.log_warn(f"No valid location op found on {prim.GetPath()}")
+            return
+        scheduler = get_write_scheduler()
+        current_value = scheduler.get(translation_op) if translation_op.GetOpName() == "xformOp:transform" else None
+        scheduler.set(translation_op, compute_translation_op_value(translation_op, location, current_value))
 
     def _randomize_location(self, prim: Usd.Prim) -> None:
         # Generate a random offset within the bounds
@@ -279,8 +290,8 @@ class LocationRandomizer(BehaviorScript):
                 # Add the initial location if using the relative frame
                 loc += self._initial_locations[prim]
 
-        # Set the randomized location to the prim
-        self._set_location(prim, loc)
+        # Queue the randomized location to be set on the prim
+        self._queue_location(prim, loc)
 
     def set_rng(self, rng: np.random.Generator | None = None) -> None:
         """Set the random number generator, overriding the USD seed attribute.
@@ -29,11 +29,13 @@ from isaacsim.replicator.behavior.utils.behavior_utils import (
 )
 from isaacsim.replicator.behavior.utils.scene_utils import (
     calculate_look_at_rotation,
+    get_rotation_op,
     get_rotation_op_and_value,
     get_world_location,
+    queue_rotation_with_op,
     set_rotation_op_and_value,
-    set_rotation_with_ops,
 )
+from isaacsim.replicator.behavior.utils.write_scheduler import get_write_scheduler
 from omni.behavior.scripting.core import BehaviorScript
 from pxr import Gf, Sdf, Usd, UsdGeom
 
@@ -93,6 +95,7 @@ class LookAtBehavior(BehaviorScript):
         self._interval = 0
         self._valid_prims = []
         self._initial_rotations = {}
+        self._rotation_ops = {}
 
         # Expose the variables as USD attributes
         create_exposed_variables(self.prim, EXPOSED_ATTR_NS, self.BEHAVIOR_NS, self.VARIABLES_TO_EXPOSE)
@@ -158,6 +161,7 @@ class LookAtBehavior(BehaviorScript):
         for prim in self._valid_prims:
             rotation_data = get_rotation_op_and_value(prim)
             self._initial_rotations[prim] = rotation_data
+            self._rotation_ops[prim] = get_rotation_op(prim)
 
         # Check if targetPrimPath is specified and retrieve the target prim
         if target_prim_path:
@@ -175,17 +179,21 @@ class LookAtBehavior(BehaviorScript):
                     )
 
     def _reset(self) -> None:
-        # Set prims back to their initial rotations
+        # Drop look-at rotations not yet written and set prims back to their initial rotations
+        get_write_scheduler().discard(list(self._rotation_ops.values()))
         for prim, rotation_data in self._initial_rotations.items():
             rotation_op_name, rotation_value = rotation_data
             set_rotation_op_and_value(prim, rotation_op_name, rotation_value)
         # Clear cached values
         self._valid_prims.clear()
         self._initial_rotations.clear()
+        self._rotation_ops.clear()
         self._interval = 0
         self._update_counter = 0
 
     def _apply_behavior(self) -> None:
+        # The look-at depends on the current world locations, apply any writes queued by other behaviors first
+        get_write_scheduler().flush()
         target_location = self._get_target_location()
 
         for prim in self._valid_prims:
@@ -195,8 +203,8 @@ class LookAtBehavior(BehaviorScript):
             # Calculate the look-at rotation
             look_at_rotation = calculate_look_at_rotation(eye, target_location, self._up_axis)
 
-            # Set the rotation using and existing xformOp (orient, rotate, transform) or create a new default xformOp:orient
-            set_rotation_with_ops(prim, look_at_rotation)
+            # Queue the rotation write to the cached xformOp (orient, rotate, transform)
+            queue_rotation_with_op(self._rotation_ops[prim], look_at_rotation)
 
     def _get_target_location(self) -> Gf.Vec3d:
         # Fetches the target location from the prim or stored location
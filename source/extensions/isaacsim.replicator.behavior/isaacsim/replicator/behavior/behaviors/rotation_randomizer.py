@@ -29,10 +29,12 @@ from isaacsim.replicator.behavior.utils.behavior_utils import (
     remove_exposed_variables,
 )
 from isaacsim.replicator.behavior.utils.scene_utils import (
+    get_rotation_op,
     get_rotation_op_and_value,
+    queue_rotation_with_op,
     set_rotation_op_and_value,
-    set_rotation_with_ops,
 )
+from isaacsim.replicator.behavior.utils.write_scheduler import get_write_scheduler
 from omni.behavior.scripting.core import BehaviorScript
 from pxr import Gf, Sdf, Usd, UsdGeom
 
@@ -88,6 +90,7 @@ class RotationRandomizer(BehaviorScript):
         self._interval = 0
         self._valid_prims = []
         self._initial_rotations = {}
+        self._rotation_ops = {}
 
         # Expose the variables as USD attributes
         create_exposed_variables(self.prim, EXPOSED_ATTR_NS, self.BEHAVIOR_NS, self.VARIABLES_TO_EXPOSE)
@@ -157,15 +160,18 @@ class RotationRandomizer(BehaviorScript):
         for prim in self._valid_prims:
             rotation_data = get_rotation_op_and_value(prim)
             self._initial_rotations[prim] = rotation_data
+            self._rotation_ops[prim] = get_rotation_op(prim)
 
     def _reset(self) -> None:
-        # Set prims back to their initial rotations
+        # Drop randomized rotations not yet written and set prims back to their initial rotations
+        get_write_scheduler().discard(list(self._rotation_ops.values()))
         for prim, rotation_data in self._initial_rotations.items():
             rotation_op, rotation_val = rotation_data
             set_rotation_op_and_value(prim, rotation_op, rotation_val)
         # Clear cached values
         self._valid_prims.clear()
         self._initial_rotations.clear()
+        self._rotation_ops.clear()
         self._interval = 0
         self._update_counter = 0
         self._rng = None
@@ -182,8 +188,8 @@ class RotationRandomizer(BehaviorScript):
             * Gf.Rotation(Gf.Vec3d.YAxis(), self._rng.uniform(self._min_rotation[1], self._max_rotation[1]))
             * Gf.Rotation(Gf.Vec3d.ZAxis(), self._rng.uniform(self._min_rotation[2], self._max_rotation[2]))
         )
-        # Set the rotation using and existing xformOp (orient, rotate, transform) or create a new default xformOp:orient
-        set_rotation_with_ops(prim, rotation)
+        # Queue the rotation write to the cached xformOp (orient, rotate, transform)
+        queue_rotation_with_op(self._rotation_ops[prim], rotation)
 
     def _get_exposed_variable(self, attr_name: str) -> Any:
         full_attr_name = f"{EXPOSED_ATTR_NS}:{self.BEHAVIOR_NS}:{attr_name}"
@@ -32,6 +32,7 @@ from isaacsim.replicator.behavior.utils.behavior_utils import (
     remove_exposed_variables,
 )
 from isaacsim.replicator.behavior.utils.scene_utils import create_mdl_material
+from isaacsim.replicator.behavior.utils.write_scheduler import get_write_scheduler
 from isaacsim.storage.native import get_assets_root_path
 from omni.behavior.scripting.core import BehaviorScript
 from pxr import Gf, Sdf, Usd, UsdGeom, UsdShade
@@ -104,6 +105,7 @@ class TextureRandomizer(BehaviorScript):
         self._valid_prims = []
         self._initial_materials = {}
         self._texture_materials = []
+        self._shader_inputs = []
 
         # Expose the variables as USD attributes
         create_exposed_variables(self.prim, EXPOSED_ATTR_NS, self.BEHAVIOR_NS, self.VARIABLES_TO_EXPOSE)
@@ -229,20 +231,20 @@ class TextureRandomizer(BehaviorScript):
             carb.log_warn(f"[{self.prim_path}] No texture URLs configured; skipping randomization tick.")
             return
 
-        # Randomize the textures and parameters for each material
-        for mat in self._texture_materials:
-            shader = UsdShade.Shader(omni.usd.get_shader_from_material(mat.GetPrim(), get_prim=True))
+        # Randomize the textures and parameters for each material, queue the writes to the cached shader inputs
+        scheduler = get_write_scheduler()
+        for diffuse_input, project_uvw_input, scale_input, rotate_input in self._shader_inputs:
             diffuse_texture = self._rng.choice(self._texture_urls)
-            shader.GetInput("diffuse_texture").Set(diffuse_texture)
+            scheduler.set(diffuse_input, diffuse_texture)
             project_uvw = self._rng.choice(
                 [True, False],
                 p=[self._project_uvw_probability, 1 - self._project_uvw_probability],
             )
-            shader.GetInput("project_uvw").Set(bool(project_uvw))
+            scheduler.set(project_uvw_input, bool(project_uvw))
             texture_scale = self._rng.uniform(self._texture_scale_range[0], self._texture_scale_range[1])
-            shader.GetInput("texture_scale").Set((texture_scale, texture_scale))
+            scheduler.set(scale_input, (texture_scale, texture_scale))
             texture_rotate = self._rng.uniform(self._texture_rotate_range[0], self._texture_rotate_range[1])
-            shader.GetInput("texture_rotate").Set(texture_rotate)
+            scheduler.set(rotate_input, texture_rotate)
 
     def _create_materials(self) -> None:
         if not self.stage:
@@ -264,8 +266,15 @@ class TextureRandomizer(BehaviorScript):
             material = create_mdl_material(MDL, mtl_name, mtl_path)
             UsdShade.MaterialBindingAPI(prim).Bind(material, UsdShade.Tokens.strongerThanDescendants)
 
-            # Cache the material for randomization
+            # Cache the material and its shader inputs for randomization
             self._texture_materials.append(material)
+            shader = UsdShade.Shader(omni.usd.get_shader_from_material(material.GetPrim(), get_prim=True))
+            self._shader_inputs.append(
+                tuple(
+                    shader.GetInput(name).GetAttr()
+                    for name in ("diffuse_texture", "project_uvw", "texture_scale", "texture_rotate")
+                )
+            )
 
     def _get_exposed_variable(self, attr_name: str) -> Any:
         full_attr_name = f"{EXPOSED_ATTR_NS}:{self.BEHAVIOR_NS}:{attr_name}"
@@ -281,6 +290,9 @@ class TextureRandomizer(BehaviorScript):
         self._initial_materials.clear()
 
     def _remove_texture_materials(self) -> None:
+        # Drop randomized values not yet written to the materials about to be removed
+        get_write_scheduler().discard([attr for shader_inputs in self._shader_inputs for attr in shader_inputs])
+        self._shader_inputs.clear()
         for mat in self._texture_materials:
             # Unbind from any still bound prims
             UsdShade.MaterialBindingAPI(mat.GetPrim()).UnbindAllBindings()
@@ -49,6 +49,7 @@ from isaacsim.replicator.behavior.utils.scene_utils import (
     reset_simulation_and_enable_reset_on_stop,
     run_simulation_async,
     set_transform_attributes,
+    simulate_until_rest_async,
 )
 from isaacsim.storage.native import get_assets_root_path_async
 from omni.behavior.scripting.core import BehaviorScript
@@ -148,6 +149,15 @@ class VolumeStackRandomizer(BehaviorScript):
                 "NOTE: If multiple simulation behaviors are running concurently, this should be managed externally."
             ),
         },
+        {
+            "attr_name": "settleUntilRest",
+            "attr_type": Sdf.ValueTypeNames.Bool,
+            "default_value": True,
+            "doc": (
+                "Stop the settling simulations early once all assets are asleep or at rest.\n"
+                "NOTE: Disable to always run the full number of settling steps."
+            ),
+        },
         {
             "attr_name": "seed",
             "attr_type": Sdf.ValueTypeNames.Int,
@@ -166,6 +176,8 @@ class VolumeStackRandomizer(BehaviorScript):
         self._render_simulation = True
         self._remove_rigid_body_dynamics = True
         self._preserve_simulation_state = False  # keep False at init to avoid physx reset without performed simulation
+        self._settle_until_rest = True
+        self._saved_sim_steps = 0
         self._valid_prims = []
         self._prim_collision_walls = {}
         self._prim_assets = {}
@@ -239,6 +251,7 @@ class VolumeStackRandomizer(BehaviorScript):
         self._render_simulation = self._get_exposed_variable("renderSimulation")
         self._remove_rigid_body_dynamics = self._get_exposed_variable("removeRigidBodyDynamics")
         self._preserve_simulation_state = self._get_exposed_variable("preserveSimulationState")
+        self._settle_until_rest = self._get_exposed_variable("settleUntilRest")
         seed = self._get_exposed_variable("seed")
 
         # Initialize the random number generator (use seed if valid, otherwise non-deterministic)
@@ -309,6 +322,7 @@ class VolumeStackRandomizer(BehaviorScript):
     async def _run_behavior_async(self) -> None:
         # Update the current behavior state and publish the new value
         self._set_state_and_publish(BehaviorState.RUNNING)
+        self._saved_sim_steps = 0
 
         # Disable the simulation reset on stop setting to preserve the simulation state after play+stop
         if self._preserve_simulation_state:
@@ -350,6 +364,9 @@ class VolumeStackRandomizer(BehaviorScript):
         if self._preserve_simulation_state:
             reset_simulation_and_enable_reset_on_stop()
 
+        if self._settle_until_rest:
+            carb.log_info(f"[{self.prim_path}] Early settling exit saved {self._saved_sim_steps} simulation steps.")
+
         # Update the current behavior state and publish the new value
         self._set_state_and_publish(BehaviorState.FINISHED)
 
@@ -438,9 +455,7 @@ class VolumeStackRandomizer(BehaviorScript):
                 return
 
         # Let the simulation run for additional steps to allow all assets to finish dropping
-        await run_simulation_async(
-            sim_steps=settling_sim_steps, physx_dt=self._physx_dt, render=self._render_simulation
-        )
+        await self._settle_async(max_steps=settling_sim_steps)
 
     async def _start_batched_asset_drop_async(self, prim_asset_batch: list, drop_height: float, sim_steps: int) -> None:
         # For each prim-assset pair calculate the drop area and prepare to drop the asset from a random location
@@ -557,7 +572,7 @@ class VolumeStackRandomizer(BehaviorScript):
 
     async def _finalize_simulation_async(self) -> None:
         # Let the simulation run for a few more steps to allow the assets to settle
-        await run_simulation_async(sim_steps=20, physx_dt=self._physx_dt, render=self._render_simulation)
+        await self._settle_async(max_steps=20)
 
         # If no app updates happened during the simulation, wait an update to ensure the simulation is solved
         if not self._render_simulation:
@@ -584,6 +599,27 @@ class VolumeStackRandomizer(BehaviorScript):
             if scope_root_prim:
                 remove_empty_scopes(scope_root_prim, self.stage)
 
+    async def _settle_async(self, max_steps: int) -> None:
+        # Run the full number of steps if early exit is disabled
+        if not self._settle_until_rest:
+            await run_simulation_async(sim_steps=max_steps, physx_dt=self._physx_dt, render=self._render_simulation)
+            return
+
+        # Stop once all assets are at rest, thresholds are given in meters and converted to stage units
+        meters_per_unit = UsdGeom.GetStageMetersPerUnit(self.stage)
+        body_paths = [asset.GetPath() for assets in self._prim_assets.values() for asset in assets if asset.IsValid()]
+        steps = await simulate_until_rest_async(
+            body_paths,
+            max_steps=max_steps,
+            physx_dt=self._physx_dt,
+            render=self._render_simulation,
+            linear_velocity_threshold=0.01 / meters_per_unit,
+            displacement_threshold=0.001 / meters_per_unit,
+            stage_id=UsdUtils.StageCache.Get().GetId(self.stage).ToLongInt(),
+        )
+        self._saved_sim_steps += max_steps - steps
+        carb.log_info(f"[{self.prim_path}] Assets settled after {steps}/{max_steps} simulation steps.")
+
     def _group_prims_and_assets_into_batches(self) -> list:
         # Early return if no valid prims or assets were found
         if not self._prim_assets or not self._valid_prims:
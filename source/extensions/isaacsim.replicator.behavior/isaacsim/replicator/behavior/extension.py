@@ -17,6 +17,8 @@
 
 import omni.ext
 
+from .utils.write_scheduler import release_write_scheduler
+
 
 class Extension(omni.ext.IExt):
     """Extension for the isaacsim.replicator.behavior module.
@@ -34,3 +36,4 @@ class Extension(omni.ext.IExt):
 
     def on_shutdown(self) -> None:
         """Called when the extension is stopped."""
+        release_write_scheduler()
@@ -19,9 +19,16 @@ from __future__ import annotations
 
 import omni.kit.app
 import omni.kit.test
+import omni.timeline
 import omni.usd
-from isaacsim.replicator.behavior.utils.scene_utils import decompose_rotation, set_rotation_with_ops
-from pxr import Gf, UsdGeom
+from isaacsim.replicator.behavior.utils.scene_utils import (
+    add_colliders,
+    add_rigid_body_dynamics,
+    decompose_rotation,
+    set_rotation_with_ops,
+    simulate_until_rest_async,
+)
+from pxr import Gf, UsdGeom, UsdPhysics, UsdUtils
 
 
 class TestSceneUtils(omni.kit.test.AsyncTestCase):
@@ -68,3 +75,82 @@ class TestSceneUtils(omni.kit.test.AsyncTestCase):
 
         with self.assertRaises(ValueError):
             decompose_rotation(rotation, "ABC")
+
+
+class TestSimulateUntilRest(omni.kit.test.AsyncTestCase):
+    """Test the early-exit settling simulation."""
+
+    async def setUp(self) -> None:
+        """Set up a new stage with a physics scene and a falling cube before each test."""
+        await omni.kit.app.get_app().next_update_async()
+        omni.usd.get_context().new_stage()
+        await omni.kit.app.get_app().next_update_async()
+        self._stage = omni.usd.get_context().get_stage()
+        UsdGeom.SetStageMetersPerUnit(self._stage, 1.0)
+        UsdGeom.SetStageUpAxis(self._stage, UsdGeom.Tokens.z)
+        UsdPhysics.Scene.Define(self._stage, "/World/PhysicsScene")
+        self._cube = UsdGeom.Cube.Define(self._stage, "/World/Cube")
+        self._cube.CreateSizeAttr(0.2)
+        self._cube.AddTranslateOp().Set(Gf.Vec3d(0, 0, 0.5))
+        add_colliders(self._cube.GetPrim())
+        add_rigid_body_dynamics(self._cube.GetPrim())
+        self._stage_id = UsdUtils.StageCache.Get().GetId(self._stage).ToLongInt()
+        self._physx_dt = 1 / 60
+        self._timeline = omni.timeline.get_timeline_interface()
+
+    async def tearDown(self) -> None:
+        """Stop the timeline and close the stage after each test."""
+        self._timeline.stop()
+        await omni.kit.app.get_app().next_update_async()
+        omni.usd.get_context().close_stage()
+        await omni.kit.app.get_app().next_update_async()
+
+    async def _start_simulation_async(self) -> None:
+        # Advance the timeline with one update and pause it so only the explicit simulation steps advance physics
+        self._timeline.play()
+        await omni.kit.app.get_app().next_update_async()
+        self._timeline.pause()
+        self._timeline.commit()
+
+    async def test_returns_early_when_bodies_rest(self) -> None:
+        """Test that a cube dropped onto a ground collider stops the simulation before the step cap."""
+        ground = UsdGeom.Cube.Define(self._stage, "/World/Ground")
+        ground.CreateSizeAttr(1.0)
+        ground.AddTranslateOp().Set(Gf.Vec3d(0, 0, -0.5))
+        ground.AddScaleOp().Set(Gf.Vec3f(10, 10, 1))
+        add_colliders(ground.GetPrim())
+        await self._start_simulation_async()
+
+        max_steps = 600
+        steps = await simulate_until_rest_async(
+            [self._cube.GetPath()], max_steps, self._physx_dt, render=False, stage_id=self._stage_id
+        )
+        self.assertGreater(steps, 0)
+        self.assertLess(steps, max_steps)
+
+        # Once at rest, the next settling call exits after the rest window
+        steps = await simulate_until_rest_async(
+            [self._cube.GetPath()], max_steps, self._physx_dt, render=False, rest_steps=3, stage_id=self._stage_id
+        )
+        self.assertLessEqual(steps, 3)
+
+    async def test_runs_max_steps_while_bodies_move(self) -> None:
+        """Test that a cube in free fall keeps the simulation running until the step cap."""
+        await self._start_simulation_async()
+
+        steps = await simulate_until_rest_async(
+            [self._cube.GetPath()], 30, self._physx_dt, render=False, stage_id=self._stage_id
+        )
+        self.assertEqual(steps, 30)
+
+    async def test_min_steps_and_empty_body_list(self) -> None:
+        """Test that no steps are run without bodies and that min_steps is respected."""
+        await self._start_simulation_async()
+
+        self.assertEqual(await simulate_until_rest_async([], 100, self._physx_dt, render=False), 0)
+
+        # Paths that are not simulated rigid bodies count is at rest as soon as min_steps is reached
+        steps = await simulate_until_rest_async(
+            ["/World/Missing"], 100, self._physx_dt, render=False, min_steps=10, rest_steps=1, stage_id=self._stage_id
+        )
+        self.assertEqual(steps, 10)
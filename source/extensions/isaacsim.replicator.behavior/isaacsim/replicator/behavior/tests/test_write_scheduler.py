@@ -0,0 +1,120 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the batched behavior write scheduler."""
+
+from __future__ import annotations
+
+import omni.kit.app
+import omni.kit.test
+import omni.usd
+from isaacsim.replicator.behavior.utils.scene_utils import (
+    compute_rotation_op_value,
+    compute_translation_op_value,
+    get_rotation_op,
+    get_translation_op,
+)
+from isaacsim.replicator.behavior.utils.write_scheduler import BehaviorWriteScheduler, get_write_scheduler
+from pxr import Gf, Sdf, Tf, Usd, UsdGeom
+
+
+class TestWriteScheduler(omni.kit.test.AsyncTestCase):
+    """Test the write scheduler shared by the behavior scripts."""
+
+    async def setUp(self) -> None:
+        """Set up a new stage with a few prims before each test."""
+        await omni.kit.app.get_app().next_update_async()
+        omni.usd.get_context().new_stage()
+        await omni.kit.app.get_app().next_update_async()
+        self._stage = omni.usd.get_context().get_stage()
+        self._attrs = []
+        for i in range(10):
+            prim = self._stage.DefinePrim(f"/World/Prim_{i}", "Xform")
+            attr = prim.CreateAttribute("inputs:intensity", Sdf.ValueTypeNames.Float)
+            attr.Set(0.0)
+            self._attrs.append(attr)
+
+    async def tearDown(self) -> None:
+        """Close the stage after each test."""
+        get_write_scheduler().discard()
+        await omni.kit.app.get_app().next_update_async()
+        omni.usd.get_context().close_stage()
+        await omni.kit.app.get_app().next_update_async()
+
+    async def test_flush_applies_writes_in_one_change_block(self) -> None:
+        """Test that queued writes are applied on flush with a single change notification."""
+        scheduler = BehaviorWriteScheduler()
+        notices = []
+        listener = Tf.Notice.Register(Usd.Notice.ObjectsChanged, lambda notice, _: notices.append(notice), self._stage)
+        try:
+            for i, attr in enumerate(self._attrs):
+                scheduler.set(attr, float(i))
+            self.assertEqual(scheduler.num_pending, len(self._attrs))
+            self.assertEqual(self._attrs[5].Get(), 0.0)
+
+            self.assertEqual(scheduler.flush(), len(self._attrs))
+        finally:
+            listener.Revoke()
+            scheduler.shutdown()
+
+        self.assertEqual(len(notices), 1)
+        self.assertEqual(scheduler.num_pending, 0)
+        for i, attr in enumerate(self._attrs):
+            self.assertEqual(attr.Get(), float(i))
+
+    async def test_last_write_wins_and_get_returns_pending(self) -> None:
+        """Test that repeated writes collapse and that get returns the queued value."""
+        scheduler = BehaviorWriteScheduler()
+        attr = self._attrs[0]
+        scheduler.set(attr, 1.0)
+        scheduler.set(attr, 2.0)
+        self.assertEqual(scheduler.num_pending, 1)
+        self.assertEqual(scheduler.get(attr), 2.0)
+        self.assertEqual(scheduler.get(self._attrs[1]), 0.0)
+
+        scheduler.discard([attr])
+        self.assertEqual(scheduler.flush(), 0)
+        self.assertEqual(attr.Get(), 0.0)
+        scheduler.shutdown()
+
+    async def test_writes_are_applied_after_app_update(self) -> None:
+        """Test that the shared scheduler flushes the queued writes on the next app update."""
+        scheduler = get_write_scheduler()
+        scheduler.set(self._attrs[3], 42.0)
+        await omni.kit.app.get_app().next_update_async()
+        self.assertEqual(scheduler.num_pending, 0)
+        self.assertEqual(self._attrs[3].Get(), 42.0)
+
+    async def test_transform_op_read_modify_write(self) -> None:
+        """Test that location and rotation writes to the same transform op within a frame are combined."""
+        prim = self._stage.DefinePrim("/World/TransformPrim", "Xform")
+        UsdGeom.Xformable(prim).AddTransformOp().Set(Gf.Matrix4d(1.0))
+        translation_op = get_translation_op(prim)
+        rotation_op = get_rotation_op(prim)
+        self.assertEqual(translation_op.GetOpName(), "xformOp:transform")
+        self.assertEqual(rotation_op.GetOpName(), "xformOp:transform")
+
+        scheduler = BehaviorWriteScheduler()
+        location = Gf.Vec3d(1.0, 2.0, 3.0)
+        rotation = Gf.Rotation(Gf.Vec3d.ZAxis(), 90.0)
+        scheduler.set(translation_op, compute_translation_op_value(translation_op, location))
+        scheduler.set(rotation_op, compute_rotation_op_value(rotation_op, rotation, scheduler.get(rotation_op)))
+        scheduler.flush()
+        scheduler.shutdown()
+
+        transform = Gf.Transform(translation_op.Get())
+        self.assertTrue(Gf.IsClose(transform.GetTranslation(), location, 1e-6))
+        rotation_imaginary = transform.GetRotation().GetQuat().GetImaginary()
+        self.assertTrue(Gf.IsClose(rotation_imaginary, rotation.GetQuat().GetImaginary(), 1e-6))
@@ -19,12 +19,14 @@ from __future__ import annotations
 
 import carb
 import carb.settings
+import numpy as np
 import omni.kit.app
 import omni.kit.commands
 import omni.physics.core
 import omni.physx
 import omni.usd
-from pxr import Gf, PhysxSchema, Sdf, Usd, UsdGeom, UsdPhysics, UsdShade
+from isaacsim.replicator.behavior.utils.write_scheduler import get_write_scheduler
+from pxr import Gf, PhysicsSchemaTools, PhysxSchema, Sdf, Usd, UsdGeom, UsdPhysics, UsdShade
 
 
 def get_world_location(prim: Usd.Prim, xform_cache: UsdGeom.XformCache | None = None) -> Gf.Vec3d:
@@ -116,6 +118,51 @@ def set_rotation_op_and_value(
             return
 
 
+def get_rotation_op(prim: Usd.Prim) -> UsdGeom.XformOp:
+    """Get the first orient, rotate or transform op of the prim, if none found create a new orient op.
+
+    Args:
+        prim: The USD prim to get the rotation op from.
+
+    Returns:
+        The xform op used to set the rotation of the prim.
+    """
+    xformable = UsdGeom.Xformable(prim)
+    for op in xformable.GetOrderedXformOps():
+        op_name = op.GetOpName()
+        if op_name == "xformOp:orient" or op_name.startswith("xformOp:rotate") or op_name == "xformOp:transform":
+            return op
+    return xformable.AddXformOp(UsdGeom.XformOp.TypeOrient, UsdGeom.XformOp.PrecisionDouble)
+
+
+def compute_rotation_op_value(
+    op: UsdGeom.XformOp, rotation: Gf.Rotation, current_value: Gf.Matrix4d | None = None
+) -> float | Gf.Vec3f | Gf.Quatf | Gf.Quatd | Gf.Matrix4d:
+    """Compute the value to write to a rotation op (see :func:`get_rotation_op`) to apply the rotation.
+
+    Args:
+        op: The orient, rotate or transform op.
+        rotation: The rotation to apply.
+        current_value: The current matrix of a transform op, its rotation is replaced. Read from the op if None.
+
+    Returns:
+        The op value representing the rotation.
+
+    Raises:
+        ValueError: If the op is a rotate op with an unsupported rotation order.
+    """
+    op_name = op.GetOpName()
+    if op_name == "xformOp:orient":
+        if op.GetTypeName() == Sdf.ValueTypeNames.Quatf:
+            return Gf.Quatf(rotation.GetQuat())
+        return Gf.Quatd(rotation.GetQuat())
+    if op_name.startswith("xformOp:rotate"):
+        return decompose_rotation(rotation, op_name[len("xformOp:rotate") :])
+    transform = Gf.Transform(current_value if current_value is not None else op.Get())
+    transform.SetRotation(rotation)
+    return transform.GetMatrix()
+
+
 def set_rotation_with_ops(prim: Usd.Prim, rotation: Gf.Rotation) -> None:
     """Set the rotation using the first valid op from orient, rotate, transform, if none found create new orient op.
 
@@ -123,40 +170,30 @@ def set_rotation_with_ops(prim: Usd.Prim, rotation: Gf.Rotation) -> None:
         prim: The USD prim to set the rotation on.
         rotation: The rotation to apply.
     """
-    xformable = UsdGeom.Xformable(prim)
-    xform_ops = xformable.GetOrderedXformOps()
-
-    for op in xform_ops:
-        op_name = op.GetOpName()
-
-        if op_name == "xformOp:orient":
-            op_type = op.GetTypeName()
-            if op_type == Sdf.ValueTypeNames.Quatf:
-                quat = Gf.Quatf(rotation.GetQuat())
-            elif op_type == Sdf.ValueTypeNames.Quatd:
-                quat = Gf.Quatd(rotation.GetQuat())
-            op.Set(quat)
-            return
+    rotation_op = get_rotation_op(prim)
+    try:
+        rotation_value = compute_rotation_op_value(rotation_op, rotation)
+    except ValueError as error:
+        carb.log_warn(f"[{prim.GetPath()}] {error}")
+        return
+    rotation_op.Set(rotation_value)
 
-        elif op_name.startswith("xformOp:rotate"):
-            rotation_order = op_name[len("xformOp:rotate") :]
-            try:
-                rotation_decomp = decompose_rotation(rotation, rotation_order)
-            except ValueError as error:
-                carb.log_warn(f"[{prim.GetPath()}] {error}")
-                return
-            op.Set(rotation_decomp)
-            return
 
-        elif op_name == "xformOp:transform":
-            transform = Gf.Transform(op.Get())
-            transform.SetRotation(rotation)
-            op.Set(transform.GetMatrix())
-            return
+def queue_rotation_with_op(rotation_op: UsdGeom.XformOp, rotation: Gf.Rotation) -> None:
+    """Queue a rotation write to a cached rotation op (see :func:`get_rotation_op`) on the shared write scheduler.
 
-    # Create a new orient op if none found
-    orient_op = xformable.AddXformOp(UsdGeom.XformOp.TypeOrient, UsdGeom.XformOp.PrecisionDouble)
-    orient_op.Set(Gf.Quatd(rotation.GetQuat()))
+    Args:
+        rotation_op: The orient, rotate or transform op.
+        rotation: The rotation to apply.
+    """
+    scheduler = get_write_scheduler()
+    current_value = scheduler.get(rotation_op) if rotation_op.GetOpName() == "xformOp:transform" else None
+    try:
+        rotation_value = compute_rotation_op_value(rotation_op, rotation, current_value)
+    except ValueError as error:
+        carb.log_warn(f"[{rotation_op.GetAttr().GetPrimPath()}] {error}")
+        return
+    scheduler.set(rotation_op, rotation_value)
 
 
 def decompose_rotation(rotation: Gf.Rotation, rotation_order: str) -> float | Gf.Vec3f:
@@ -237,6 +274,41 @@ def calculate_look_at_rotation(
     return look_at_matrix.ExtractRotation()
 
 
+def get_translation_op(prim: Usd.Prim) -> UsdGeom.XformOp | None:
+    """Get the first translate or transform op of the prim.
+
+    Args:
+        prim: The USD prim to get the translation op from.
+
+    Returns:
+        The xform op used to set the location of the prim, or None if the prim has neither.
+    """
+    for op in UsdGeom.Xformable(prim).GetOrderedXformOps():
+        if op.GetOpName() in ("xformOp:translate", "xformOp:transform"):
+            return op
+    return None
+
+
+def compute_translation_op_value(
+    op: UsdGeom.XformOp, location: Gf.Vec3d, current_value: Gf.Matrix4d | None = None
+) -> Gf.Vec3d | Gf.Matrix4d:
+    """Compute the value to write to a translation op (see :func:`get_translation_op`) to apply the location.
+
+    Args:
+        op: The translate or transform op.
+        location: The location to apply.
+        current_value: The current matrix of a transform op, its translation is replaced. Read from the op if None.
+
+    Returns:
+        The op value representing the location.
+    """
+    if op.GetOpName() == "xformOp:translate":
+        return location
+    transform = Gf.Transform(current_value if current_value is not None else op.Get())
+    transform.SetTranslation(location)
+    return transform.GetMatrix()
+
+
 def set_location(prim: Usd.Prim, location: Gf.Vec3d) -> None:
     """Set the location of the prim, handling translate xformOps.
 
@@ -778,6 +850,112 @@ async def apply_forces_and_simulate_async(
             await omni.kit.app.get_app().next_update_async()
 
 
+def _get_rigid_body_poses(
+    physx_interface: omni.physx.bindings._physx.PhysX, body_paths: list[str]
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Read the current simulated poses of the given rigid bodies.
+
+    Args:
+        physx_interface: The PhysX interface to query.
+        body_paths: Prim paths of the rigid bodies.
+
+    Returns:
+        Tuple of positions (N, 3), quaternions (N, 4) and a mask (N,) of bodies found in the simulation.
+    """
+    positions = np.zeros((len(body_paths), 3))
+    orientations = np.zeros((len(body_paths), 4))
+    found = np.zeros(len(body_paths), dtype=bool)
+    for i, body_path in enumerate(body_paths):
+        pose = physx_interface.get_rigidbody_transformation(body_path)
+        if not pose.get("ret_val", False):
+            continue
+        positions[i] = pose["position"]
+        orientations[i] = pose["rotation"]
+        found[i] = True
+    return positions, orientations, found
+
+
+async def simulate_until_rest_async(
+    body_paths: list[str | Sdf.Path],
+    max_steps: int,
+    physx_dt: float,
+    render: bool = True,
+    min_steps: int = 0,
+    rest_steps: int = 5,
+    linear_velocity_threshold: float = 0.01,
+    angular_velocity_threshold: float = 5.0,
+    displacement_threshold: float = 0.001,
+    stage_id: int | None = None,
+) -> int:
+    """Run the simulation until the given rigid bodies come to rest, or for at most the specified number of steps.
+
+    The simulation stops early as soon as every body is asleep, or when every body stayed below the velocity
+    thresholds for ``rest_steps`` consecutive steps without drifting further than ``displacement_threshold`` over
+    those steps. Velocities are derived from the simulated poses before and after each step. Bodies that are no
+    longer part of the simulation (e.g. removed or disabled) are considered at rest.
+
+    Args:
+        body_paths: Prim paths of the rigid bodies to track.
+        max_steps: Maximum number of simulation steps to run.
+        physx_dt: Physics time step duration.
+        render: Whether to render each simulation step.
+        min_steps: Minimum number of simulation steps to run before checking for rest.
+        rest_steps: Number of consecutive steps the bodies need to be below the thresholds to be considered at rest.
+        linear_velocity_threshold: Linear speed (stage units per second) below which a body is considered at rest.
+        angular_velocity_threshold: Angular speed (degrees per second) below which a body is considered at rest.
+        displacement_threshold: Maximum distance (stage units) a body may drift over the rest steps.
+        stage_id: The stage identifier used for the sleep queries, defaults to the stage of the current USD context.
+
+    Returns:
+        The number of simulation steps that were run.
+    """
+    if not body_paths:
+        return 0
+    body_paths = [str(body_path) for body_path in body_paths]
+    if stage_id is None:
+        stage_id = omni.usd.get_context().get_stage_id()
+    body_ids = [PhysicsSchemaTools.sdfPathToInt(body_path) for body_path in body_paths]
+    physx_interface = omni.physx.get_physx_interface()
+    physx_sim_interface = omni.physx.get_physx_simulation_interface()
+
+    prev_positions, prev_orientations, _ = _get_rigid_body_poses(physx_interface, body_paths)
+    anchor_positions = prev_positions
+    calm_steps = 0
+    for step in range(1, max_steps + 1):
+        physx_sim_interface.simulate(physx_dt, 0)
+        physx_sim_interface.fetch_results()
+        if render:
+            await omni.kit.app.get_app().next_update_async()
+
+        positions, orientations, found = _get_rigid_body_poses(physx_interface, body_paths)
+
+        # Linear and angular speeds from the pose change over the last step
+        linear_speeds = np.linalg.norm(positions - prev_positions, axis=1) / physx_dt
+        quat_dots = np.clip(np.abs(np.sum(orientations * prev_orientations, axis=1)), 0.0, 1.0)
+        angular_speeds = np.degrees(2.0 * np.arccos(quat_dots)) / physx_dt
+        calm = (linear_speeds < linear_velocity_threshold) & (angular_speeds < angular_velocity_threshold)
+        calm |= ~found
+
+        # Restart the rest window (and its drift anchor) whenever a body moves
+        drifts = np.linalg.norm(positions - anchor_positions, axis=1)
+        if calm.all() and np.all(drifts[found] <= displacement_threshold):
+            calm_steps += 1
+        else:
+            calm_steps = 0
+            anchor_positions = positions
+        prev_positions, prev_orientations = positions, orientations
+
+        if step < min_steps:
+            continue
+        if calm_steps >= rest_steps:
+            return step
+        # Sleeping bodies already passed the PhysX sleep hysteresis, no need to wait for the rest window
+        if all(physx_sim_interface.is_sleeping(stage_id, body_id) for body_id in body_ids):
+            return step
+
+    return max_steps
+
+
 def disable_simulation_reset_on_stop() -> None:
     """Disable the simulation reset on stop setting. Needed to preserve the simulation state after play+stop."""
     carb.settings.get_settings().set(omni.physx.bindings._physx.SETTING_RESET_ON_STOP, False)
@@ -0,0 +1,153 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Per-frame scheduler batching the USD attribute writes of all behavior scripts."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import carb
+import carb.eventdispatcher
+import omni.kit.app
+from pxr import Sdf, Usd
+
+
+class BehaviorWriteScheduler:
+    """Collect attribute writes from behavior scripts and apply them together once per frame.
+
+    Behaviors queue their per-frame writes with :meth:`set` during ``on_update``. After all update
+    subscribers ran, the pending writes are applied inside a single ``Sdf.ChangeBlock``, so the stage
+    emits one change notification per frame instead of one per written attribute. Multiple writes to
+    the same attribute within a frame collapse into the last one.
+
+    Attributes (and xform ops) should be resolved once (e.g. on setup) and reused between frames, the
+    change block only contains value writes to already existing attributes.
+
+    Example:
+
+    .. code-block:: python
+
+        scheduler = get_write_scheduler()
+        scheduler.set(prim.GetAttribute("inputs:intensity"), 1000.0)
+        # ... applied after the current app update, or explicitly:
+        scheduler.flush()
+    """
+
+    def __init__(self) -> None:
+        self._pending: dict[Usd.Attribute, Any] = {}
+        self._post_update_sub = None
+
+    @property
+    def num_pending(self) -> int:
+        """Number of attributes with a queued value."""
+        return len(self._pending)
+
+    def set(self, attr: Usd.Attribute | Usd.Property, value: Any) -> None:
+        """Queue a value to be written to the attribute on the next flush.
+
+        Args:
+            attr: The attribute (or xform op / shader input attribute) to write.
+            value: The value to write.
+        """
+        if isinstance(attr, Usd.Attribute):
+            self._pending[attr] = value
+        else:
+            self._pending[attr.GetAttr()] = value
+        if self._post_update_sub is None:
+            self._post_update_sub = carb.eventdispatcher.get_eventdispatcher().observe_event(
+                event_name=omni.kit.app.GLOBAL_EVENT_POST_UPDATE,
+                on_event=lambda _: self.flush(),
+                observer_name="isaacsim.replicator.behavior.BehaviorWriteScheduler._post_update_sub",
+            )
+
+    def get(self, attr: Usd.Attribute | Usd.Property) -> Any:
+        """Get the value the attribute will have after the next flush.
+
+        Needed for read-modify-write updates (e.g. changing only the rotation of an ``xformOp:transform``)
+        when another behavior may have already queued a value for the same attribute in this frame.
+
+        Args:
+            attr: The attribute to read.
+
+        Returns:
+            The queued value if any, otherwise the current attribute value.
+        """
+        if not isinstance(attr, Usd.Attribute):
+            attr = attr.GetAttr()
+        if attr in self._pending:
+            return self._pending[attr]
+        return attr.Get()
+
+    def discard(self, attrs: list[Usd.Attribute | Usd.Property] | None = None) -> None:
+        """Drop queued writes without applying them.
+
+        Args:
+            attrs: The attributes whose queued writes to drop, all queued writes are dropped if None.
+        """
+        if attrs is None:
+            self._pending.clear()
+            return
+        for attr in attrs:
+            self._pending.pop(attr if isinstance(attr, Usd.Attribute) else attr.GetAttr(), None)
+
+    def flush(self) -> int:
+        """Apply all queued writes inside a single change block.
+
+        Returns:
+            The number of attributes written.
+        """
+        if not self._pending:
+            return 0
+        pending = self._pending
+        self._pending = {}
+        num_written = 0
+        with Sdf.ChangeBlock():
+            for attr, value in pending.items():
+                if not attr.IsValid():
+                    continue
+                if not attr.Set(value):
+                    carb.log_warn(f"[BehaviorWriteScheduler] Failed to write {attr.GetPath()}")
+                    continue
+                num_written += 1
+        return num_written
+
+    def shutdown(self) -> None:
+        """Apply the remaining writes and stop listening to app updates."""
+        self.flush()
+        self._post_update_sub = None
+
+
+_write_scheduler: BehaviorWriteScheduler | None = None
+
+
+def get_write_scheduler() -> BehaviorWriteScheduler:
+    """Get the write scheduler shared by all behavior scripts.
+
+    Returns:
+        The shared write scheduler.
+    """
+    global _write_scheduler
+    if _write_scheduler is None:
+        _write_scheduler = BehaviorWriteScheduler()
+    return _write_scheduler
+
+
+def release_write_scheduler() -> None:
+    """Flush and release the shared write scheduler."""
+    global _write_scheduler
+    if _write_scheduler is not None:
+        _write_scheduler.shutdown()
+        _write_scheduler = None
@@ -21,7 +21,9 @@ a render manifest against it (PSNR / SSIM / image-diff, with optional panels and
 `render_and_score` renders the GT timestamps then scores them. Used by the nurec render-vs-GT
 and pose-consistency tests.
 
-Scoring is torch-based, so the caller must already have a `SimulationApp` running.
+Scoring is torch-based, so the caller must already have a `SimulationApp` running. Image pairs
+are decoded by a pool of prefetch threads and scored in stacked batches (`score_batch`), so a
+long manifest is bounded by decode throughput rather than per-frame tensor overhead.
 """
 
 from __future__ import annotations
@@ -31,6 +33,9 @@ import csv
 import json
 import os
 import posixpath
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any
 
 import carb
@@ -40,7 +45,7 @@ from isaacsim.replicator.nurec_utils.metrics.psnr_ssim import (
     image_diff,
     load_rgb,
     match_shape,
-    score,
+    score_batch,
 )
 from isaacsim.replicator.nurec_utils.metrics.scoped_timer import ScopedTimer
 from isaacsim.replicator.nurec_utils.render import render_keyframes
@@ -53,6 +58,12 @@ _IMAGE_EXTS = (".png", ".jpg", ".jpeg")
 # Maps a remote `gt_root` URL to its local mirror directory.
 _GT_MIRROR_CACHE: dict[str, str] = {}
 
+# Concurrent `omni.client` downloads when mirroring a remote GT tree.
+_MIRROR_WORKERS = 8
+# Defaults for the decode/score pipeline in `evaluate`.
+_DECODE_WORKERS = 4
+_SCORE_BATCH_SIZE = 4
+
 
 @atexit.register
 def _cleanup_gt_mirrors() -> None:
@@ -100,35 +111,58 @@ def resolve_gt_root(gt_root: str) -> str:
     return local_dir
 
 
-def _mirror_tree(client: Any, url: str, local_dir: str) -> int:
+def _mirror_tree(client: Any, url: str, local_dir: str, max_workers: int = _MIRROR_WORKERS) -> int:
     """Download the folder `url` into `local_dir`, recursing into subfolders; return the file count.
 
+    The tree is listed first, then the files are downloaded concurrently on `max_workers` threads.
+
     Args:
         client: The `omni.client` module.
         url: The remote folder URL to mirror.
         local_dir: The local directory to write into.
+        max_workers: Number of concurrent downloads.
 
     Returns:
         The number of files downloaded.
     """
+    files: list[tuple[str, str]] = []
+    _list_tree(client, url, local_dir, files)
+
+    def _download(item: tuple[str, str]) -> None:
+        child_url, local_path = item
+        res_read, _, content = client.read_file(child_url)
+        if res_read != client.Result.OK:
+            raise RuntimeError(f"omni.client.read_file failed for {child_url}: {res_read}")
+        with open(local_path, "wb") as f:
+            f.write(memoryview(content))
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="nurec_gt_mirror") as pool:
+        # Consuming the iterator re-raises the first download failure.
+        for _ in pool.map(_download, files):
+            pass
+    return len(files)
+
+
+def _list_tree(client: Any, url: str, local_dir: str, files: list[tuple[str, str]]) -> None:
+    """Create the local folders for the remote folder `url` and collect its files.
+
+    Args:
+        client: The `omni.client` module.
+        url: The remote folder URL to list.
+        local_dir: The local directory mirroring `url`.
+        files: Receives `(file_url, local_path)` for every file under `url`.
+    """
     res, entries = client.list(url)
     if res != client.Result.OK:
         raise RuntimeError(f"omni.client.list failed for {url}: {res}")
-    count = 0
     for entry in entries:
         name = entry.relative_path
         child_url = posixpath.join(url, name)
         if int(entry.flags) & int(client.ItemFlags.CAN_HAVE_CHILDREN):
             os.makedirs(os.path.join(local_dir, name), exist_ok=True)
-            count += _mirror_tree(client, child_url, os.path.join(local_dir, name))
+            _list_tree(client, child_url, os.path.join(local_dir, name), files)
         else:
-            res_read, _, content = client.read_file(child_url)
-            if res_read != client.Result.OK:
-                raise RuntimeError(f"omni.client.read_file failed for {child_url}: {res_read}")
-            with open(os.path.join(local_dir, name), "wb") as f:
-                f.write(bytes(memoryview(content)))
-            count += 1
-    return count
+            files.append((child_url, os.path.join(local_dir, name)))
 
 
 def read_gt_timestamps(gt_root: str, cameras: set[str] | None = None) -> dict[str, list[int]]:
@@ -182,6 +216,71 @@ def gt_path(gt_root: str, camera: str, ts_ns: int) -> str:
     return os.path.join(gt_root, camera, f"{ts_ns}.png")
 
 
+def _load_pair(gt: str, rendered_path: str) -> tuple[np.ndarray, np.ndarray]:
+    """Decode a GT / rendered pair, resizing the rendered image to the GT resolution.
+
+    Args:
+        gt: Path of the GT image.
+        rendered_path: Path of the rendered image.
+
+    Returns:
+        The `(gt, rendered)` images as same-shaped HxWx3 uint8 arrays.
+    """
+    gt_img = load_rgb(gt)
+    return gt_img, match_shape(load_rgb(rendered_path), gt_img)
+
+
+def _scored_batches(
+    items: list[tuple[dict, str]], batch_size: int, num_workers: int
+) -> Iterator[tuple[list[tuple[dict, str]], list[dict]]]:
+    """Decode pairs on prefetch threads and score them in stacked batches, preserving order.
+
+    At most `num_workers + 2 * batch_size` decoded pairs are in flight, which bounds memory
+    regardless of the manifest size. A batch is cut early when the image shape changes.
+
+    Args:
+        items: `(manifest pair, gt path)` tuples to score, in output order.
+        batch_size: Maximum number of pairs scored together.
+        num_workers: Number of decode threads.
+
+    Yields:
+        `(items, scores)` for each scored batch, `scores` aligned with `items`.
+    """
+    batch_size = max(1, batch_size)
+    window = max(1, num_workers) + 2 * batch_size
+    with ThreadPoolExecutor(max_workers=max(1, num_workers), thread_name_prefix="nurec_eval_decode") as pool:
+        pending: deque[tuple[tuple[dict, str], Future]] = deque()
+        remaining = iter(items)
+
+        def _refill() -> None:
+            while len(pending) < window:
+                item = next(remaining, None)
+                if item is None:
+                    return
+                pair, gt = item
+                pending.append((item, pool.submit(_load_pair, gt, pair["rendered"])))
+
+        batch_items: list[tuple[dict, str]] = []
+        gts: list[np.ndarray] = []
+        rendereds: list[np.ndarray] = []
+        _refill()
+        while pending:
+            item, future = pending.popleft()
+            _refill()
+            gt_img, rendered = future.result()
+            if gts and gt_img.shape != gts[0].shape:
+                yield batch_items, score_batch(gts, rendereds)
+                batch_items, gts, rendereds = [], [], []
+            batch_items.append(item)
+            gts.append(gt_img)
+            rendereds.append(rendered)
+            if len(gts) >= batch_size:
+                yield batch_items, score_batch(gts, rendereds)
+                batch_items, gts, rendereds = [], [], []
+        if gts:
+            yield batch_items, score_batch(gts, rendereds)
+
+
 def _aggregate(rows: list[dict]) -> dict:
     out: dict = {"n": len(rows)}
     for k, _ in HEADLINES:
@@ -252,11 +351,15 @@ def evaluate(
     out_dir: str | None = None,
     write_panels: bool = True,
     write_plots: bool = True,
+    batch_size: int = _SCORE_BATCH_SIZE,
+    num_workers: int = _DECODE_WORKERS,
 ) -> dict | None:
     """Score every frame in a render manifest against its GT and write metrics/panels/plots.
 
     Each rendered frame is matched to its GT by `gt_path(gt_root, camera, ts_ns)`. Assumes a
     `SimulationApp` is already running (torch must be importable); the caller owns the app.
+    Images are decoded on `num_workers` threads ahead of scoring and scored `batch_size`
+    pairs at a time; the scores match scoring each pair on its own.
 
     Args:
         manifest_path: Path to the render manifest.json to score.
@@ -264,6 +367,8 @@ def evaluate(
         out_dir: Output directory; defaults to `<manifest dir>/eval`.
         write_panels: Whether to write per-frame `GT | rendered | diff` panels.
         write_plots: Whether to write per-metric time/histogram/pose plots.
+        batch_size: Number of same-resolution pairs scored together (bounds device memory).
+        num_workers: Number of image-decode threads.
 
     Returns:
         A summary dict with "manifest", "overall", "by_camera", and "n_skipped", or None when
@@ -279,31 +384,35 @@ def evaluate(
     )
     os.makedirs(out_dir, exist_ok=True)
 
-    rows: list[dict] = []
+    items: list[tuple[dict, str]] = []
     skipped = 0
     for pair in pairs:
-        cam = pair.get("camera", "")
-        rendered_path = pair.get("rendered", "")
-        gt = gt_path(gt_root, cam, pair.get("ts_ns"))
-        if not (os.path.isfile(gt) and os.path.isfile(rendered_path)):
+        gt = gt_path(gt_root, pair.get("camera", ""), pair.get("ts_ns"))
+        if not (os.path.isfile(gt) and os.path.isfile(pair.get("rendered", ""))):
             skipped += 1
             continue
-        gt_img = load_rgb(gt)
-        rendered = match_shape(load_rgb(rendered_path), gt_img)
-        sc = score(gt_img, rendered)
-        row = {
-            "camera": cam,
-            "ts_ns": pair.get("ts_ns", ""),
-            **sc,
-            "rendered": rendered_path,
-            "gt": gt,
-        }
-        if pair.get("position") is not None:
-            row["position"] = pair["position"]
-        rows.append(row)
-
-        stem = os.path.splitext(os.path.basename(rendered_path))[0]
-        carb.log_info(f"  {cam} {stem} psnr={sc['psnr']:6.2f} ssim={sc['ssim']:.4f} mad={sc['mean_abs_diff']:6.2f}")
+        items.append((pair, gt))
+
+    rows: list[dict] = []
+    for batch_items, scores in _scored_batches(items, batch_size, num_workers):
+        for (pair, gt), sc in zip(batch_items, scores):
+            cam = pair.get("camera", "")
+            rendered_path = pair["rendered"]
+            row = {
+                "camera": cam,
+                "ts_ns": pair.get("ts_ns", ""),
+                **sc,
+                "rendered": rendered_path,
+                "gt": gt,
+            }
+            if pair.get("position") is not None:
+                row["position"] = pair["position"]
+            rows.append(row)
+
+            stem = os.path.splitext(os.path.basename(rendered_path))[0]
+            carb.log_info(
+                f"  {cam} {stem} psnr={sc['psnr']:6.2f} ssim={sc['ssim']:.4f} mad={sc['mean_abs_diff']:6.2f}"
+            )
 
     if not rows:
         return None
@@ -20,7 +20,8 @@ PSNR and SSIM follow the torchmetrics conventions: inputs normalized to ``[0, 1]
 (``sigma=1.5``).
 
 The torch-backed functions must be called after a ``SimulationApp`` exists; ``mean_abs_diff``
-and ``image_diff`` are pure numpy and work anywhere.
+and ``image_diff`` are pure numpy and work anywhere. ``score_batch`` scores a stack of
+same-shaped pairs in one pass on CUDA or CPU-only torch.
 """
 
 from __future__ import annotations
@@ -89,6 +90,38 @@ def score(gt: np.ndarray, rendered: np.ndarray) -> dict:
     }
 
 
+def score_batch(gts: list[np.ndarray], rendereds: list[np.ndarray]) -> list[dict]:
+    """Compute PSNR / SSIM / mean-abs-diff for a batch of same-shaped (gt, rendered) pairs.
+
+    All pairs are stacked into one ``[B, C, H, W]`` tensor per side and scored with a single
+    set of tensor ops; the per-pair values are transferred back to the host once.
+
+    Args:
+        gts: The ground-truth images (HxWx3 uint8), all of the same shape.
+        rendereds: The rendered images, one per GT, each the same shape as its GT.
+
+    Returns:
+        One dict per pair with "psnr", "ssim", and "mean_abs_diff" keys, in input order.
+
+    Raises:
+        ValueError: If the lists differ in length or the images do not share one shape.
+    """
+    if len(gts) != len(rendereds):
+        raise ValueError(f"score_batch got {len(gts)} GT images but {len(rendereds)} rendered images")
+    if not gts:
+        return []
+    shape = np.shape(gts[0])
+    if any(np.shape(img) != shape for img in (*gts, *rendereds)):
+        raise ValueError("score_batch requires every image in the batch to have the same shape")
+    import torch
+
+    with torch.no_grad():
+        a, b = _to_tensor(gts), _to_tensor(rendereds)
+        metrics = torch.stack([_psnr_tensor(a, b), _ssim_tensor(a, b), _mean_abs_diff_tensor(a, b)], dim=1)
+        values = metrics.cpu().tolist()
+    return [{"psnr": p, "ssim": s, "mean_abs_diff": m} for p, s, m in values]
+
+
 def _device() -> torch.device:
     """Return the torch device to score on: CUDA when available (under a booted app), else CPU.
 
@@ -100,26 +133,90 @@ def _device() -> torch.device:
     return torch.device("cuda" if torch.cuda.is_available() else "cpu")
 
 
-def _to_tensor(img: np.ndarray) -> torch.Tensor:
-    """Convert a uint8 HxWx3 (or HxW) numpy image to a float32 [1, C, H, W] tensor in [0, 1].
+def _to_tensor(img: np.ndarray | list[np.ndarray]) -> torch.Tensor:
+    """Convert uint8 HxWx3 (or HxW) numpy images to a float32 [B, C, H, W] tensor in [0, 1].
 
     Args:
-        img: The uint8 image array; grayscale (HxW) gains a channel axis.
+        img: One uint8 image array (B = 1) or a list of same-shaped ones; grayscale (HxW)
+            gains a channel axis.
 
     Returns:
-        The image as a float32 tensor of shape [1, C, H, W] on the scoring device.
+        The images as a float32 tensor of shape [B, C, H, W] on the scoring device.
     """
     import torch
 
-    arr = np.asarray(img)
-    if arr.ndim == 2:  # grayscale -> add channel
+    # `np.stack` always yields a fresh, writable, contiguous buffer for `torch.from_numpy`.
+    arr = np.stack([np.asarray(img)] if isinstance(img, np.ndarray) else [np.asarray(i) for i in img])
+    if arr.ndim == 3:  # grayscale -> add channel
         arr = arr[..., None]
-    # Writable, contiguous buffer for `torch.from_numpy`.
-    buf = np.ascontiguousarray(arr)
-    if buf is arr:
-        buf = buf.copy()
-    t = torch.from_numpy(buf).to(_device(), dtype=torch.float32) / 255.0
-    return t.permute(2, 0, 1).unsqueeze(0)  # HWC -> [1, C, H, W]
+    # Upload as uint8 and convert on the device: a quarter of the host-to-device traffic.
+    t = torch.from_numpy(arr).to(_device()).to(torch.float32) / 255.0
+    return t.permute(0, 3, 1, 2)  # BHWC -> [B, C, H, W]
+
+
+def _psnr_tensor(a: torch.Tensor, b: torch.Tensor) -> torch.Tensor:
+    """Compute the per-image PSNR of two [B, C, H, W] tensors in [0, 1].
+
+    Args:
+        a: The ground-truth batch.
+        b: The rendered batch.
+
+    Returns:
+        A [B] tensor of PSNR values in dB, identical images capped at 100 dB.
+    """
+    import torch
+
+    mse = torch.mean((a - b) ** 2, dim=(1, 2, 3))
+    psnr_db = 10.0 * torch.log10((_DATA_RANGE**2) / mse)
+    return torch.where(mse == 0.0, torch.full_like(mse, _PSNR_MAX_DB), psnr_db)
+
+
+def _ssim_tensor(a: torch.Tensor, b: torch.Tensor) -> torch.Tensor:
+    """Compute the per-image mean SSIM of two [B, C, H, W] tensors in [0, 1].
+
+    Args:
+        a: The ground-truth batch.
+        b: The rendered batch.
+
+    Returns:
+        A [B] tensor of mean SSIM values.
+    """
+    import torch
+    import torch.nn.functional as F
+
+    channels = a.shape[1]
+    kernel = _gaussian_window(channels, _SSIM_KERNEL_SIZE, _SSIM_SIGMA, a.device, a.dtype)
+
+    c1 = (_SSIM_K1 * _DATA_RANGE) ** 2
+    c2 = (_SSIM_K2 * _DATA_RANGE) ** 2
+
+    # One grouped conv over [a, b, a*a, b*b, a*b] (valid convolution, like torchmetrics).
+    stacked = torch.cat([a, b, a * a, b * b, a * b], dim=0)
+    out = F.conv2d(stacked, kernel, groups=channels)
+    mu_a, mu_b, a_sq, b_sq, ab = out.split(a.shape[0], dim=0)
+
+    mu_a_sq, mu_b_sq, mu_ab = mu_a**2, mu_b**2, mu_a * mu_b
+    sigma_a_sq = a_sq - mu_a_sq
+    sigma_b_sq = b_sq - mu_b_sq
+    sigma_ab = ab - mu_ab
+
+    ssim_map = ((2 * mu_ab + c1) * (2 * sigma_ab + c2)) / ((mu_a_sq + mu_b_sq + c1) * (sigma_a_sq + sigma_b_sq + c2))
+    return ssim_map.mean(dim=(1, 2, 3))
+
+
+def _mean_abs_diff_tensor(a: torch.Tensor, b: torch.Tensor) -> torch.Tensor:
+    """Compute the per-image mean absolute difference in 8-bit levels.
+
+    Args:
+        a: The ground-truth batch in [0, 1].
+        b: The rendered batch in [0, 1].
+
+    Returns:
+        A [B] tensor of mean absolute differences (0-255 scale).
+    """
+    import torch
+
+    return torch.mean(torch.abs(a - b), dim=(1, 2, 3)) * 255.0
 
 
 def psnr(gt: np.ndarray, rendered: np.ndarray) -> float:
@@ -135,13 +232,7 @@ def psnr(gt: np.ndarray, rendered: np.ndarray) -> float:
     Returns:
         The PSNR value in decibels (higher is better).
     """
-    import torch
-
-    a, b = _to_tensor(gt), _to_tensor(rendered)
-    mse = torch.mean((a - b) ** 2)
-    if mse.item() == 0.0:
-        return _PSNR_MAX_DB
-    return float((10.0 * torch.log10((_DATA_RANGE**2) / mse)).item())
+    return float(_psnr_tensor(_to_tensor(gt), _to_tensor(rendered)).item())
 
 
 def _gaussian_window(
@@ -185,28 +276,7 @@ def ssim(gt: np.ndarray, rendered: np.ndarray) -> float:
     Returns:
         The mean SSIM over the image, in [-1, 1] (higher is better).
     """
-    import torch
-    import torch.nn.functional as F
-
-    a, b = _to_tensor(gt), _to_tensor(rendered)
-    channels = a.shape[1]
-    kernel = _gaussian_window(channels, _SSIM_KERNEL_SIZE, _SSIM_SIGMA, a.device, a.dtype)
-
-    c1 = (_SSIM_K1 * _DATA_RANGE) ** 2
-    c2 = (_SSIM_K2 * _DATA_RANGE) ** 2
-
-    # One grouped conv over [a, b, a*a, b*b, a*b] (valid convolution, like torchmetrics).
-    stacked = torch.cat([a, b, a * a, b * b, a * b], dim=0)
-    out = F.conv2d(stacked, kernel, groups=channels)
-    mu_a, mu_b, a_sq, b_sq, ab = out.split(a.shape[0], dim=0)
-
-    mu_a_sq, mu_b_sq, mu_ab = mu_a**2, mu_b**2, mu_a * mu_b
-    sigma_a_sq = a_sq - mu_a_sq
-    sigma_b_sq = b_sq - mu_b_sq
-    sigma_ab = ab - mu_ab
-
-    ssim_map = ((2 * mu_ab + c1) * (2 * sigma_ab + c2)) / ((mu_a_sq + mu_b_sq + c1) * (sigma_a_sq + sigma_b_sq + c2))
-    return float(ssim_map.mean().item())
+    return float(_ssim_tensor(_to_tensor(gt), _to_tensor(rendered)).item())
 
 
 def mean_abs_diff(gt: np.ndarray, rendered: np.ndarray) -> float:
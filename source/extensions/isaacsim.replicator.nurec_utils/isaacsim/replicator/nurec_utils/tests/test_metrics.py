@@ -23,7 +23,7 @@ from __future__ import annotations
 
 import numpy as np
 import omni.kit.test
-from isaacsim.replicator.nurec_utils.metrics.psnr_ssim import psnr, score, ssim
+from isaacsim.replicator.nurec_utils.metrics.psnr_ssim import mean_abs_diff, psnr, score, score_batch, ssim
 
 # Golden values for (gt, noisy), verified against skimage's Wang-Gaussian SSIM / PSNR.
 GOLDEN_PSNR_NOISY = 24.7727
@@ -60,3 +60,23 @@ class TestTorchMetrics(omni.kit.test.AsyncTestCase):
     async def test_score_keys(self) -> None:
         """score() returns exactly the PSNR / SSIM / mean-abs-diff keys."""
         self.assertEqual(set(score(self.gt, self.noisy)), {"psnr", "ssim", "mean_abs_diff"})
+
+    async def test_score_batch_matches_per_pair(self) -> None:
+        """score_batch() reproduces score() for every pair of a stacked batch, in order."""
+        gts = [self.gt, self.gt, self.noisy]
+        rendereds = [self.noisy, self.gt, self.gt]
+        batch = score_batch(gts, rendereds)
+        self.assertEqual(len(batch), len(gts))
+        for gt, rendered, sc in zip(gts, rendereds, batch):
+            self.assertAlmostEqual(sc["psnr"], psnr(gt, rendered), places=3)
+            self.assertAlmostEqual(sc["ssim"], ssim(gt, rendered), places=5)
+            self.assertAlmostEqual(sc["mean_abs_diff"], mean_abs_diff(gt, rendered), places=3)
+        self.assertAlmostEqual(batch[1]["psnr"], 100.0, places=5)
+
+    async def test_score_batch_rejects_mixed_shapes(self) -> None:
+        """score_batch() requires one shape across the batch and matching list lengths."""
+        with self.assertRaises(ValueError):
+            score_batch([self.gt, self.gt[:128]], [self.gt, self.gt[:128]])
+        with self.assertRaises(ValueError):
+            score_batch([self.gt], [])
+        self.assertEqual(score_batch([], []), [])
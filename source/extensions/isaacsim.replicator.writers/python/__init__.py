@@ -20,6 +20,7 @@ from .scripts import (
     PoseWriter,
     PytorchListener,
     PytorchWriter,
+    WritePipeline,
     YCBVideoWriter,
 )
 
@@ -29,5 +30,6 @@ __all__ = [
     "PoseWriter",
     "PytorchListener",
     "PytorchWriter",
+    "WritePipeline",
     "YCBVideoWriter",
 ]
@@ -22,6 +22,7 @@ from .writers.dope_writer import DOPEWriter
 from .writers.pose_writer import PoseWriter
 from .writers.pytorch_listener import PytorchListener
 from .writers.pytorch_writer import PytorchWriter
+from .writers.write_pipeline import WritePipeline
 from .writers.ycb_video_writer import YCBVideoWriter
 
 __all__ = [
@@ -30,5 +31,6 @@ __all__ = [
     "PoseWriter",
     "PytorchListener",
     "PytorchWriter",
+    "WritePipeline",
     "YCBVideoWriter",
 ]
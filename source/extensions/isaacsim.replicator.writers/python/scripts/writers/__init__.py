@@ -20,6 +20,7 @@ from .dope_writer import *
 from .pose_writer import *
 from .pytorch_listener import *
 from .pytorch_writer import *
+from .write_pipeline import *
 from .ycb_video_writer import *
 
 
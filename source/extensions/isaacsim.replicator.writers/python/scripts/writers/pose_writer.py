@@ -23,6 +23,12 @@ from isaacsim.replicator.writers.scripts.utils import (
     calculate_truncation_ratio_simple,
     project_point_to_screen,
 )
+from isaacsim.replicator.writers.scripts.writers.write_pipeline import (
+    WritePipeline,
+    encode_image,
+    encode_json,
+    snapshot_annotator_data,
+)
 from omni.replicator.core import AnnotatorRegistry, Writer
 from omni.replicator.core import functional as F
 from omni.replicator.core.scripts.backends import BackendDispatch, BackendGroup, BaseBackend
@@ -63,6 +69,12 @@ class PoseWriter(Writer):
             ``rep.backends.get("DiskBackend")``.
         image_output_format:
             Image file format for RGB and debug outputs (``jpeg``, ``jpg``, ``png`` or ``exr``).
+        num_write_workers:
+            If greater than 0, frame processing, encoding and file I/O run on a background
+            :class:`WritePipeline` with this many encoding threads instead of inside ``write()``.
+        write_pipeline:
+            Existing :class:`WritePipeline` to submit frames to, e.g. one shared between several writers.
+            Takes precedence over ``num_write_workers``.
     """
 
     RGB_ANNOT_NAME = "rgb"
@@ -97,6 +109,8 @@ class PoseWriter(Writer):
         s3_region: str = None,
         backend: BaseBackend = None,
         image_output_format: str = "png",
+        num_write_workers: int = 0,
+        write_pipeline: WritePipeline = None,
     ) -> None:
         self.version = __version__
         self.data_structure = "renderProduct"
@@ -110,6 +124,8 @@ class PoseWriter(Writer):
         self._image_output_format = image_output_format.lower()
         if self._image_output_format not in {"jpeg", "jpg", "png", "exr"}:
             raise ValueError("Unsupported `image_output_format`. Valid options are {'jpeg', 'jpg', 'png', 'exr'}.")
+        if (num_write_workers > 0 or write_pipeline is not None) and self._image_output_format == "exr":
+            raise ValueError("Background writing supports `image_output_format` 'jpeg', 'jpg' or 'png' only.")
 
         dispatch_backend = None
         if use_s3:
@@ -140,6 +156,9 @@ class PoseWriter(Writer):
         self._write_debug_images = write_debug_images
         self._frame_padding = frame_padding
         self._frame_id = 0
+        self._num_write_workers = num_write_workers
+        self._write_pipeline = write_pipeline
+        self._owns_write_pipeline = False
         if format is not None and format.lower() not in self.SUPPORTED_FORMATS:
             raise ValueError(f"Unsupported format: {format}. Supported formats: {self.SUPPORTED_FORMATS}")
         else:
@@ -175,6 +194,17 @@ class PoseWriter(Writer):
             # Process the frame data of the current render product
             bounding_box_3d_data = annotators_data[self.BB3D_ANNOT_NAME]
             camera_params_data = annotators_data[self.CAM_PARAMS_ANNOT_NAME]
+            pipeline = self._get_write_pipeline()
+            if pipeline is not None:
+                # Only the visibility count is needed here to keep frame ids in sync; the rest runs in the pipeline
+                num_objs = self._count_visible_objects(bounding_box_3d_data)
+                if self._skip_empty_frames and num_objs == 0:
+                    continue
+                rp_subfolder = f"{rp_name}/" if self._use_subfolders else ""
+                self._submit_frame(pipeline, annotators_data, rp_subfolder)
+                if not self._use_subfolders:
+                    self._frame_id += 1
+                continue
             num_objs = self._process_frame_data(bounding_box_3d_data, camera_params_data)
 
             # Early exist if empty frames should not be written
@@ -219,33 +249,68 @@ class PoseWriter(Writer):
             Number of visible objects in the frame.
         """
         # Store the frame data for writing to disk
-        self._frame_data = {}
+        self._frame_data = self._build_frame_data(bounding_box_3d_data, camera_params_data, self._debug_frame_data)
+        return len(self._frame_data.get("objects", []))
+
+    def _build_frame_data(self, bounding_box_3d_data: dict, camera_params_data: dict, debug_frame_data: dict) -> dict:
+        """Build the frame data in the selected format without touching the writer state.
+
+        Args:
+            bounding_box_3d_data: 3D bounding box annotator data containing object information.
+            camera_params_data: Camera parameters annotator data containing camera configuration.
+            debug_frame_data: Dictionary filled with the data needed to draw debug overlays.
+
+        Returns:
+            Frame data to be written, or an empty dictionary if the frame has no visible objects and empty
+            frames are skipped.
+        """
+        frame_data = {}
 
         # Get and process the bounding box 3d annotator data in the selected format
-        objs_data = self._process_bounding_boxes(bounding_box_3d_data, camera_params_data)
+        objs_data = self._process_bounding_boxes(bounding_box_3d_data, camera_params_data, debug_frame_data)
 
         # Early exist if empty frames should be skipped and there are no visible objects in the frame
         if self._skip_empty_frames and len(objs_data) == 0:
-            return 0
+            return frame_data
 
         # Store the camera information in the
-        self._frame_data["camera_data"] = self._process_camera_parameters(camera_params_data)
+        frame_data["camera_data"] = self._process_camera_parameters(camera_params_data, debug_frame_data)
 
         # Store the predefined order of the cuboid keypoints
-        self._frame_data["keypoint_order"] = self._cuboid_keypoints_order
+        frame_data["keypoint_order"] = self._cuboid_keypoints_order
 
         # Add the objects data to the frame entries
-        self._frame_data["objects"] = objs_data
+        frame_data["objects"] = objs_data
+
+        return frame_data
+
+    def _count_visible_objects(self, bounding_box_3d_data: dict) -> int:
+        """Count the objects whose visibility is above the threshold.
 
-        return len(objs_data)
+        Uses the same criterion as :meth:`_process_bounding_boxes` without computing any pose data.
+
+        Args:
+            bounding_box_3d_data: 3D bounding box annotator data containing object information.
+
+        Returns:
+            Number of visible objects in the frame.
+        """
+        bbox_data = bounding_box_3d_data["data"]
+        if len(bbox_data) == 0:
+            return 0
+        visibility = 1.0 - np.abs(bbox_data["occlusionRatio"].astype(np.float64))
+        return int(np.count_nonzero(visibility > self._visibility_threshold))
 
     # Process the bounding box annotator data (extract objects label, location, rotation, visibility, etc.)
-    def _process_bounding_boxes(self, bounding_box_3d_data: dict, camera_params: dict) -> list:
+    def _process_bounding_boxes(
+        self, bounding_box_3d_data: dict, camera_params: dict, debug_frame_data: dict | None = None
+    ) -> list:
         """Process 3D bounding box data to extract object pose information.
 
         Args:
             bounding_box_3d_data: 3D bounding box annotator data containing object information.
             camera_params: Camera parameters for projection calculations.
+            debug_frame_data: Dictionary receiving debug overlay data. Defaults to the writer's debug frame data.
 
         Returns:
             List of processed object data with pose, keypoints, and visibility information.
@@ -254,11 +319,13 @@ class PoseWriter(Writer):
         # ('idToLabels': {0: {'class': 'cube'}, 1: {'class': 'sphere'}} -> {0: 'cube', 1: 'sphere'})
         id_to_labels = {k: v["class"] for k, v in bounding_box_3d_data["idToLabels"].items()}
 
+        if debug_frame_data is None:
+            debug_frame_data = self._debug_frame_data
         if self._write_debug_images:
-            self._debug_frame_data["world_frame_transforms"] = []
-            self._debug_frame_data["projected_keypoints"] = []
-            self._debug_frame_data["size_local"] = []
-            self._debug_frame_data["center_local"] = []
+            debug_frame_data["world_frame_transforms"] = []
+            debug_frame_data["projected_keypoints"] = []
+            debug_frame_data["size_local"] = []
+            debug_frame_data["center_local"] = []
         # Iterate the bounding box data and extract the object informations
         objs = []
         for i, bbox in enumerate(bounding_box_3d_data["data"]):
@@ -297,7 +364,7 @@ class PoseWriter(Writer):
                     quat_world_frame_gf.GetImaginary()
                 )
             if self._write_debug_images:
-                self._debug_frame_data["world_frame_transforms"].append(local_to_world_tf)
+                debug_frame_data["world_frame_transforms"].append(local_to_world_tf)
 
             # World to camera transform (row-major) (transform a point from world coordinate to camera coordinate)
             world_to_camera_tf = camera_params["cameraViewTransform"].reshape(4, 4)
@@ -329,8 +396,8 @@ class PoseWriter(Writer):
             size_local = np.abs(max_local - min_local)[:3]
             center_local = min_local + (max_local - min_local) / 2
             if self._write_debug_images:
-                self._debug_frame_data["size_local"].append(size_local.tolist())
-                self._debug_frame_data["center_local"].append(center_local[:3].tolist())
+                debug_frame_data["size_local"].append(size_local.tolist())
+                debug_frame_data["center_local"].append(center_local[:3].tolist())
 
             # Cuboid keypoints in local frame
             keypoints_local = {
@@ -375,7 +442,7 @@ class PoseWriter(Writer):
             elif self._format == "centerpose" or self._format == "dope":
                 obj["projected_cuboid"] = keypoints_projected_ordered
             if self._write_debug_images:
-                self._debug_frame_data["projected_keypoints"].append(keypoints_projected_ordered)
+                debug_frame_data["projected_keypoints"].append(keypoints_projected_ordered)
 
             obj["truncation_ratio"] = calculate_truncation_ratio_simple(
                 keypoints_projected_ordered, screen_size[0], screen_size[1]
@@ -386,11 +453,12 @@ class PoseWriter(Writer):
         return objs
 
     # Get the camera parameters from the annotator data
-    def _process_camera_parameters(self, camera_params: Any) -> dict:
+    def _process_camera_parameters(self, camera_params: Any, debug_frame_data: dict | None = None) -> dict:
         """Process camera parameters from annotator data.
 
         Args:
             camera_params: Raw camera parameters from the annotator.
+            debug_frame_data: Dictionary receiving debug overlay data. Defaults to the writer's debug frame data.
 
         Returns:
             Processed camera data including intrinsics, view matrix, and projection matrix.
@@ -421,7 +489,9 @@ class PoseWriter(Writer):
 
         # Debug data needed for the overlay projections
         if self._write_debug_images:
-            self._debug_frame_data["camera_params"] = camera_params
+            if debug_frame_data is None:
+                debug_frame_data = self._debug_frame_data
+            debug_frame_data["camera_params"] = camera_params
 
         return camera_data
 
@@ -449,21 +519,39 @@ class PoseWriter(Writer):
             rgb_data: RGB image data to overlay debug information on.
             render_product_subfolder: Subfolder path for the render product.
         """
+        rgb_img = self._draw_debug_overlay(rgb_data, self._debug_frame_data)
+
+        file_path = (
+            f"{render_product_subfolder}{self._frame_id:0{self._frame_padding}}_overlay.{self._image_output_format}"
+        )
+        overlay_data = np.asarray(rgb_img) if self._image_output_format == "exr" else rgb_img
+        self.backend.schedule(F.write_image, path=file_path, data=overlay_data)
+
+    def _draw_debug_overlay(self, rgb_data: Any, debug_frame_data: dict) -> Image.Image:
+        """Draw the projected keypoints and coordinate axes over the RGB image.
+
+        Args:
+            rgb_data: RGB image data to overlay debug information on.
+            debug_frame_data: Debug data collected while processing the frame.
+
+        Returns:
+            The overlay image.
+        """
         # Create overlay image from the RGB data
         rgb_img = Image.fromarray(rgb_data)
         draw = ImageDraw.Draw(rgb_img)
 
         # Draw the projected cuboid and its edges
-        for keypoints in self._debug_frame_data["projected_keypoints"]:
+        for keypoints in debug_frame_data["projected_keypoints"]:
             self._draw_projected_keypoints(draw, keypoints)
 
         # Get the stored camera parameters for debug purposes
-        camera_params = self._debug_frame_data["camera_params"]
+        camera_params = debug_frame_data["camera_params"]
 
         # Draw objects local frame axes
-        for i, tf in enumerate(self._debug_frame_data["world_frame_transforms"]):
-            size = self._debug_frame_data["size_local"][i]
-            center = self._debug_frame_data["center_local"][i]
+        for i, tf in enumerate(debug_frame_data["world_frame_transforms"]):
+            size = debug_frame_data["size_local"][i]
+            center = debug_frame_data["center_local"][i]
             self._draw_local_frame_axes(
                 draw,
                 tf,
@@ -474,12 +562,55 @@ class PoseWriter(Writer):
 
         # Overlay the world frame axes on the bottom left part of the RGB image
         self._draw_world_frame_axes_bottom_left(draw, camera_params)
+        return rgb_img
 
-        file_path = (
-            f"{render_product_subfolder}{self._frame_id:0{self._frame_padding}}_overlay.{self._image_output_format}"
-        )
-        overlay_data = np.asarray(rgb_img) if self._image_output_format == "exr" else rgb_img
-        self.backend.schedule(F.write_image, path=file_path, data=overlay_data)
+    def _get_write_pipeline(self) -> WritePipeline | None:
+        """Return the background write pipeline, creating an owned one if requested.
+
+        Returns:
+            The pipeline frames are submitted to, or None if frames are written inline.
+        """
+        if self._write_pipeline is None and self._num_write_workers > 0:
+            self._write_pipeline = WritePipeline(num_workers=self._num_write_workers, name="pose_writer")
+            self._owns_write_pipeline = True
+        return self._write_pipeline
+
+    def _submit_frame(self, pipeline: WritePipeline, annotators_data: dict, render_product_subfolder: str) -> None:
+        """Submit one render product frame to the background write pipeline.
+
+        Args:
+            pipeline: Pipeline to submit the frame to.
+            annotators_data: Annotator data of the render product for the current frame.
+            render_product_subfolder: Subfolder path for the render product.
+        """
+        bounding_box_3d_data = snapshot_annotator_data(annotators_data[self.BB3D_ANNOT_NAME])
+        camera_params_data = snapshot_annotator_data(annotators_data[self.CAM_PARAMS_ANNOT_NAME])
+        rgb_data = np.array(annotators_data[self.RGB_ANNOT_NAME]["data"], copy=True)
+        file_prefix = f"{render_product_subfolder}{self._frame_id:0{self._frame_padding}}"
+        image_format = self._image_output_format
+
+        def _encode() -> list[tuple[str, bytes]]:
+            debug_frame_data = {}
+            frame_data = self._build_frame_data(bounding_box_3d_data, camera_params_data, debug_frame_data)
+            outputs = [
+                (f"{file_prefix}.json", encode_json(frame_data, indent=2)),
+                (f"{file_prefix}.{image_format}", encode_image(rgb_data, image_format)),
+            ]
+            if self._write_debug_images:
+                overlay = self._draw_debug_overlay(rgb_data, debug_frame_data)
+                outputs.append((f"{file_prefix}_overlay.{image_format}", encode_image(overlay, image_format)))
+            return outputs
+
+        def _commit(outputs: list[tuple[str, bytes]]) -> None:
+            for path, blob in outputs:
+                self.backend.write_blob(path, blob)
+
+        pipeline.submit(_encode, _commit)
+
+    def flush(self) -> None:
+        """Wait until all frames submitted to the background write pipeline are written."""
+        if self._write_pipeline is not None:
+            self._write_pipeline.flush()
 
     # Transform a 3D point from world coordinates to camera coordinates
     def _world_point_to_camera_point(self, world_point: Any, view_matrix: Any) -> Any:
@@ -647,6 +778,12 @@ class PoseWriter(Writer):
 
     # Override to clear the writer state
     def detach(self) -> None:
-        """Clear the writer state by resetting the frame counter to zero."""
+        """Flush pending background writes and clear the writer state by resetting the frame counter to zero."""
+        if self._owns_write_pipeline:
+            self._write_pipeline.close()
+            self._write_pipeline = None
+            self._owns_write_pipeline = False
+        else:
+            self.flush()
         super().detach()
         self._frame_id = 0
@@ -0,0 +1,251 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Bounded, ordered background pipeline that moves frame encoding and file I/O off the writer thread."""
+
+import io
+import json
+import queue
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+import carb
+import numpy as np
+from PIL import Image
+
+__all__ = ["WritePipeline"]
+
+# Image formats that can be encoded to bytes off the writer thread (PIL format names)
+_PIL_IMAGE_FORMATS = {"png": "PNG", "jpg": "JPEG", "jpeg": "JPEG"}
+
+
+def snapshot_annotator_data(data: Any) -> Any:
+    """Return a copy of annotator data that stays valid after ``write()`` returns.
+
+    Replicator may reuse annotator buffers for the next frame, so NumPy arrays are
+    copied and containers are rebuilt. Other values are returned as-is.
+
+    Args:
+        data: Annotator data (nested dicts/lists of NumPy arrays and plain values).
+
+    Returns:
+        A copy of *data* that is safe to hand to a background task.
+    """
+    if isinstance(data, np.ndarray):
+        return data.copy()
+    if isinstance(data, dict):
+        return {k: snapshot_annotator_data(v) for k, v in data.items()}
+    if isinstance(data, list):
+        return [snapshot_annotator_data(v) for v in data]
+    return data
+
+
+def encode_image(data: Any, image_format: str) -> bytes | None:
+    """Encode an image array (or PIL image) to bytes.
+
+    Args:
+        data: Image as a NumPy array or PIL image.
+        image_format: Output file extension (e.g. ``png``, ``jpg``).
+
+    Returns:
+        Encoded bytes, or None if the format cannot be encoded with PIL (e.g. ``exr``).
+    """
+    pil_format = _PIL_IMAGE_FORMATS.get(image_format.lower())
+    if pil_format is None:
+        return None
+    img = data if isinstance(data, Image.Image) else Image.fromarray(np.asarray(data))
+    if pil_format == "JPEG" and img.mode not in ("RGB", "L"):
+        img = img.convert("RGB")
+    buf = io.BytesIO()
+    img.save(buf, format=pil_format)
+    return buf.getvalue()
+
+
+def encode_json(data: Any, indent: int | None = 2) -> bytes:
+    """Serialize data to JSON bytes, converting NumPy scalars and arrays to native values.
+
+    Args:
+        data: JSON-serializable data, possibly containing NumPy values.
+        indent: JSON indentation level.
+
+    Returns:
+        UTF-8 encoded JSON.
+    """
+
+    def _default(obj: Any) -> Any:
+        if isinstance(obj, (np.ndarray, np.generic)):
+            return obj.tolist()
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    return json.dumps(data, indent=indent, default=_default).encode()
+
+
+class WritePipeline:
+    """Bounded background pipeline for writer output.
+
+    Each submitted frame consists of an *encode* callable, executed on a pool of
+    worker threads (projections, JSON/PNG/npz encoding, ...), and an optional
+    *commit* callable that receives the encoded payload and performs the file
+    I/O. Commits run on a single committer thread in submission order, so output
+    files complete in the same order frames were written.
+
+    At most *max_pending* frames are in flight; :meth:`submit` blocks once that
+    limit is reached, applying backpressure to the data pipeline instead of
+    buffering without bound. :meth:`flush` is a barrier that waits until every
+    submitted frame is committed. A single pipeline can be shared by several writers.
+
+    Args:
+        num_workers: Number of encoding worker threads.
+        max_pending: Maximum number of frames submitted but not yet committed.
+        name: Prefix used for the worker thread names.
+
+    Example:
+
+    .. code-block:: python
+
+        pipeline = WritePipeline(num_workers=4, max_pending=16)
+        pipeline.submit(lambda: encode_json({"frame": 0}), lambda payload: backend.write_blob("0.json", payload))
+        pipeline.close()
+    """
+
+    def __init__(self, num_workers: int = 2, max_pending: int = 8, name: str = "write_pipeline") -> None:
+        if num_workers < 1:
+            raise ValueError("`num_workers` must be at least 1.")
+        if max_pending < 1:
+            raise ValueError("`max_pending` must be at least 1.")
+        self._encoders = ThreadPoolExecutor(max_workers=num_workers, thread_name_prefix=f"{name}_encode")
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._ordered: queue.Queue = queue.Queue()
+        self._errors: list[BaseException] = []
+        self._errors_lock = threading.Lock()
+        self._closed = False
+        self._frames_submitted = 0
+        self._frames_committed = 0
+        self._blocked_time = 0.0
+        self._committer = threading.Thread(target=self._commit_loop, name=f"{name}_commit", daemon=True)
+        self._committer.start()
+
+    @property
+    def frames_submitted(self) -> int:
+        """Number of frames submitted so far.
+
+        Returns:
+            The submitted frame count.
+        """
+        return self._frames_submitted
+
+    @property
+    def frames_committed(self) -> int:
+        """Number of frames whose commit step has finished.
+
+        Returns:
+            The committed frame count.
+        """
+        return self._frames_committed
+
+    @property
+    def blocked_time(self) -> float:
+        """Total time in seconds :meth:`submit` spent waiting for a free slot (backpressure).
+
+        Returns:
+            The accumulated blocking time in seconds.
+        """
+        return self._blocked_time
+
+    def submit(self, encode: Callable[[], Any], commit: Callable[[Any], None] | None = None) -> Future:
+        """Queue a frame for background encoding and ordered commit.
+
+        Blocks while *max_pending* frames are in flight.
+
+        Args:
+            encode: Callable producing the encoded payload; runs on a worker thread.
+            commit: Callable receiving the payload; runs on the committer thread in submission order.
+
+        Returns:
+            Future of the encode step.
+
+        Raises:
+            RuntimeError: If the pipeline is closed, or if an earlier frame failed.
+        """
+        if self._closed:
+            raise RuntimeError("Cannot submit to a closed WritePipeline.")
+        self._raise_errors()
+        if not self._slots.acquire(blocking=False):
+            start = time.perf_counter()
+            self._slots.acquire()
+            self._blocked_time += time.perf_counter() - start
+        future = self._encoders.submit(encode)
+        self._ordered.put((future, commit))
+        self._frames_submitted += 1
+        return future
+
+    def flush(self) -> None:
+        """Wait until every submitted frame has been encoded and committed.
+
+        Raises:
+            RuntimeError: If any frame failed to encode or commit since the last flush.
+        """
+        self._ordered.join()
+        self._raise_errors()
+
+    def close(self) -> None:
+        """Flush pending frames and stop the worker threads. Safe to call more than once.
+
+        Raises:
+            RuntimeError: If any frame failed to encode or commit since the last flush.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._ordered.join()
+        self._ordered.put(None)
+        self._committer.join()
+        self._encoders.shutdown(wait=True)
+        self._raise_errors()
+
+    def _commit_loop(self) -> None:
+        """Commit encoded frames in submission order until the stop sentinel is received."""
+        while True:
+            item = self._ordered.get()
+            if item is None:
+                self._ordered.task_done()
+                return
+            future, commit = item
+            try:
+                payload = future.result()
+                if commit is not None:
+                    commit(payload)
+            except Exception as e:
+                carb.log_error(f"WritePipeline: failed to write frame: {e}")
+                with self._errors_lock:
+                    self._errors.append(e)
+            finally:
+                self._frames_committed += 1
+                self._slots.release()
+                self._ordered.task_done()
+
+    def _raise_errors(self) -> None:
+        """Re-raise the first recorded frame failure on the calling thread.
+
+        Raises:
+            RuntimeError: If any frame failed since the last check.
+        """
+        with self._errors_lock:
+            errors, self._errors = self._errors, []
+        if errors:
+            raise RuntimeError(f"{len(errors)} frame(s) failed to write; first error: {errors[0]}") from errors[0]
@@ -22,6 +22,11 @@ from typing import Any
 import carb
 import numpy as np
 from isaacsim.replicator.writers.scripts.utils import get_mesh_vertices_relative_to
+from isaacsim.replicator.writers.scripts.writers.write_pipeline import (
+    WritePipeline,
+    encode_image,
+    snapshot_annotator_data,
+)
 from omni.replicator.core import AnnotatorRegistry, BackendDispatch, Writer, WriterRegistry
 from omni.syntheticdata import SyntheticData
 from PIL import Image
@@ -32,6 +37,16 @@ NodeTemplate, NodeConnectionTemplate = SyntheticData.NodeTemplate, SyntheticData
 
 __version__ = "0.0.1"
 
+# Output kind -> (annotator name, file suffix) of the files written per frame
+_OUTPUT_SUFFIXES = {
+    "rgb": ("rgb", "color.{image_format}"),
+    "depth": ("distance_to_image_plane", "depth.{image_format}"),
+    "label": ("semantic_segmentation", "label.{image_format}"),
+    "box": ("bounding_box_2d_tight", "box.txt"),
+    "meta": ("pose", "meta.mat"),
+}
+_IMAGE_OUTPUTS = {"rgb", "depth", "label"}
+
 
 class YCBVideoWriter(Writer):
     """Writer capable of writing annotator groundtruth in the YCB Video Dataset format.
@@ -59,6 +74,10 @@ class YCBVideoWriter(Writer):
             color the semantic segmentation (where pixels are colored according to the grayscale class index).
         factor_depth: Depth scaling factor used in the YCB Video Dataset.
         intrinsic_matrix: Camera intrinsic matrix. shape is (3, 3).
+        num_write_workers: If greater than 0, images and metadata are encoded and written on a background
+            :class:`WritePipeline` with this many encoding threads instead of inside ``write()``.
+        write_pipeline: Existing :class:`WritePipeline` to submit frames to, e.g. one shared between several
+            writers. Takes precedence over ``num_write_workers``.
     """
 
     def __init__(
@@ -75,6 +94,8 @@ class YCBVideoWriter(Writer):
         class_name_to_index_map: dict = None,
         factor_depth: int = 10000,
         intrinsic_matrix: np.ndarray = None,
+        num_write_workers: int = 0,
+        write_pipeline: WritePipeline = None,
     ) -> None:
         carb.log_warn(
             "Deprecation warning: YCBVideoWriter has been deprecated and will be removed in the next major release."
@@ -93,6 +114,15 @@ class YCBVideoWriter(Writer):
         self.class_to_index = class_name_to_index_map
         self.factor_depth = factor_depth
         self.intrinsic_matrix = intrinsic_matrix
+        self._num_write_workers = num_write_workers
+        self._write_pipeline = write_pipeline
+        self._owns_write_pipeline = False
+        if (num_write_workers > 0 or write_pipeline is not None) and image_output_format.lower() not in {
+            "png",
+            "jpg",
+            "jpeg",
+        }:
+            raise ValueError("Background writing supports `image_output_format` 'jpeg', 'jpg' or 'png' only.")
 
         # Specify the semantic types that will be included in output
         if semantic_types is None:
@@ -241,38 +271,18 @@ class YCBVideoWriter(Writer):
             print(f"No training data in frame {self._frame_id} (object(s) fully occluded), skipping writing..")
             return
 
-        for annotator in data:
-            annotator_split = annotator.split("-")
-            render_product_path = ""
-            multi_render_prod = 0
-            # multiple render_products
-            if len(annotator_split) > 1:
-                multi_render_prod = 1
-                render_product_name = annotator_split[-1]
-                render_product_path = f"{render_product_name}/"
-
-            if annotator.startswith("rgb"):
-                if multi_render_prod:
-                    render_product_path += "rgb/"
-                self._write_rgb(data, render_product_path, annotator)
-
-            if annotator.startswith("distance_to_image_plane"):
-                if multi_render_prod:
-                    render_product_path += "distance_to_image_plane/"
-                self._write_distance_to_image_plane(data, render_product_path, annotator)
-
-            if annotator.startswith("semantic_segmentation"):
-                if multi_render_prod:
-                    render_product_path += "semantic_segmentation/"
-                self._write_semantic_segmentation(data, render_product_path, annotator)
-
-            if annotator.startswith("bounding_box_2d_tight"):
-                if multi_render_prod:
-                    render_product_path += "bounding_box_2d_tight/"
-                self._write_bounding_box_data(data, render_product_path, annotator)
-
-            if annotator.startswith("pose"):
-                self._write_pose(data, render_product_path, annotator)
+        pipeline = self._get_write_pipeline()
+        if pipeline is not None:
+            self._submit_frame(pipeline, data)
+            self._frame_id += 1
+            return
+
+        for file_path, kind, annotator in self._frame_outputs(data):
+            output = self._output_data(kind, data[annotator])
+            if kind in _IMAGE_OUTPUTS:
+                self._backend.write_image(file_path, output)
+            else:
+                self._backend.write_blob(file_path, output)
 
         self._frame_id += 1
 
@@ -295,33 +305,15 @@ class YCBVideoWriter(Writer):
         points = get_mesh_vertices_relative_to(mesh_prim, coord_prim)
         np.savetxt(file_path, points, fmt="%.6f", delimiter=" ", newline="\n")
 
-    def _write_rgb(self, data: dict, render_product_path: str, annotator: str) -> None:
-        """Save a RGB image for the YCB Video Dataset.
+    def _depth_image(self, dis_to_img_plane_data: np.ndarray) -> Image.Image:
+        """Convert distance_to_image_plane data to an inverse-depth visualization image.
 
         Args:
-            data: A dictionary containing the annotator data for the current frame.
-            render_product_path: Directory name to save data to, corresponding to a specific render product.
-            annotator: Annotator name used as a key in the data dictionary, which can also be used to retrieve the
-                annotator from the annotator registry.
-        """
-        image_id = f"{self._frame_id:06d}"
-
-        file_path = f"{self.vid_dir}/{render_product_path}{image_id}-color.{self._image_output_format}"
-
-        self._backend.write_image(file_path, data[annotator])
-
-    def _write_distance_to_image_plane(self, data: dict, render_product_path: str, annotator: str) -> None:
-        """Save a depth image for the YCB Video Dataset. Note: Depth images are only for visualization and testing, and.
+            dis_to_img_plane_data: Distance to image plane annotator data.
 
-           would need to be adapted to conform to the exact format used in the YCB Video Dataset.
-
-        Args:
-            data: A dictionary containing the annotator data for the current frame.
-            render_product_path: Directory name to save data to, corresponding to a specific render product.
-            annotator: Annotator name used as a key in the data dictionary, which can also be used to retrieve the
-                annotator from the annotator registry.
+        Returns:
+            Grayscale depth image.
         """
-        dis_to_img_plane_data = data[annotator]
         dis_to_img_plane_data = dis_to_img_plane_data.squeeze()
 
         # Convert linear depth to inverse depth for better visualization
@@ -337,27 +329,20 @@ class YCBVideoWriter(Writer):
         if np.max(dis_to_img_plane_data) > 0:
             dis_to_img_plane_data /= np.max(dis_to_img_plane_data)
 
-        depth_img = Image.fromarray((dis_to_img_plane_data * 255.0).astype(np.uint8))
-
-        image_id = f"{self._frame_id:06d}"
-        file_path = f"{self.vid_dir}/{render_product_path}{image_id}-depth.{self._image_output_format}"
-
-        self._backend.write_image(file_path, depth_img)
+        return Image.fromarray((dis_to_img_plane_data * 255.0).astype(np.uint8))
 
-    def _write_semantic_segmentation(self, data: dict, render_product_path: str, annotator: str) -> None:
-        """Save a segmentation label image file for the YCB Video Dataset. Segmentation label is saved as a grayscale.
-
-           image.
+    def _label_image(self, annotator_data: dict) -> Image.Image:
+        """Remap semantic segmentation ids to class indexes as a grayscale label image.
 
         Args:
-            data: A dictionary containing the annotator data for the current frame.
-            render_product_path: Directory name to save data to, corresponding to a specific render product.
-            annotator: Annotator name used as a key in the data dictionary, which can also be used to retrieve the
-                annotator from the annotator registry.
+            annotator_data: Semantic segmentation annotator data.
+
+        Returns:
+            Grayscale label image.
         """
-        semantic_seg_data = data[annotator]["data"]
+        semantic_seg_data = annotator_data["data"]
 
-        id_to_labels = data[annotator]["info"]["idToLabels"]
+        id_to_labels = annotator_data["info"]["idToLabels"]
 
         max_semantic_id = 0
         for semantic_id_str in id_to_labels:
@@ -379,30 +364,24 @@ class YCBVideoWriter(Writer):
 
         segmentation_data_remapped = np.take(semantic_id_to_class_index_map, semantic_seg_data)
 
-        # Save ground truth data as png
-        img = Image.fromarray(np.uint8(segmentation_data_remapped)).convert("L")
-
-        image_id = f"{self._frame_id:06d}"
-        file_path = f"{self.vid_dir}/{render_product_path}{image_id}-label.{self._image_output_format}"
+        return Image.fromarray(np.uint8(segmentation_data_remapped)).convert("L")
 
-        self._backend.write_image(file_path, img)
+    def _bounding_box_text(self, annotator_data: dict) -> bytes:
+        """Encode the bounding box text file contents.
 
-    def _write_bounding_box_data(self, data: dict, render_product_path: str, annotator: str) -> None:
-        """Save a text file describing bounding boxes of semantically-labeled objects in view for the YCB Video.
-
-           Dataset. Note: Lines of the bounding box text file consist of a class name and the position of the bounding
-           box. The positions of the bounding boxes are represented by the upper-left coordinate, followed by the
-           bottom-right coordinate. Coordinates are expressed in pixels, where the origin of the image is the top-left
-           corner, with +x to the right and +y down.
+        Lines of the bounding box text file consist of a class name and the position of the bounding box. The
+        positions of the bounding boxes are represented by the upper-left coordinate, followed by the bottom-right
+        coordinate. Coordinates are expressed in pixels, where the origin of the image is the top-left corner, with
+        +x to the right and +y down.
 
         Args:
-            data: A dictionary containing the annotator data for the current frame.
-            render_product_path: Directory name to save data to, corresponding to a specific render product.
-            annotator: Annotator name used as a key in the data dictionary, which can also be used to retrieve the
-                annotator from the annotator registry.
+            annotator_data: Bounding box 2D tight annotator data.
+
+        Returns:
+            Bounding box lines encoded as bytes.
         """
-        bbox_data = data[annotator]["data"]
-        id_to_labels = data[annotator]["info"]["idToLabels"]
+        bbox_data = annotator_data["data"]
+        id_to_labels = annotator_data["info"]["idToLabels"]
 
         buf = io.BytesIO()
 
@@ -416,13 +395,10 @@ class YCBVideoWriter(Writer):
 
             buf.write(bbox_str.encode())
 
-        image_id = f"{self._frame_id:06d}"
-        file_path = f"{self.vid_dir}/{render_product_path}{image_id}-box.txt"
-
-        self._backend.write_blob(file_path, buf.getvalue())
+        return buf.getvalue()
 
-    def _write_pose(self, data: dict, render_product_path: str, annotator: str) -> None:
-        """Save a metadata ".mat" file for the YCB Video Dataset.
+    def _meta_mat(self, annotator_data: dict) -> bytes:
+        """Encode the metadata ".mat" file contents.
 
         The file contains:
 
@@ -431,16 +407,16 @@ class YCBVideoWriter(Writer):
         - The intrinsic matrix of the camera.
         - Poses from the frame of each semantically-labeled object in view to the world frame, represented as a
           rotation matrix and a translation.
-           - The center (in pixel coordinates) of each semantically-labeled object in view. Pixel coordinates are
-             expressed relative to the top-left corner of the image, with +x to the right and +y down.
+        - The center (in pixel coordinates) of each semantically-labeled object in view. Pixel coordinates are
+          expressed relative to the top-left corner of the image, with +x to the right and +y down.
 
         Args:
-            data: A dictionary containing the annotator data for the current frame.
-            render_product_path: Directory name to save data to, corresponding to a specific render product.
-            annotator: Annotator name used as a key in the data dictionary, which can also be used to retrieve the
-                annotator from the annotator registry.
+            annotator_data: Pose annotator data.
+
+        Returns:
+            The encoded ".mat" file.
         """
-        pose_data = data[annotator]["data"]
+        pose_data = annotator_data["data"]
 
         n = len(pose_data)
 
@@ -449,7 +425,7 @@ class YCBVideoWriter(Writer):
         else:
             transform_matrices = np.array([[[]]])
 
-        id_to_labels = data[annotator]["info"]["idToLabels"]
+        id_to_labels = annotator_data["info"]["idToLabels"]
 
         cls_indexes = []
         centers = []
@@ -485,11 +461,106 @@ class YCBVideoWriter(Writer):
 
         buf = io.BytesIO()
         savemat(buf, meta_dict)
+        return buf.getvalue()
+
+    def _frame_outputs(self, data: dict) -> list[tuple[str, str, str]]:
+        """List the files written for the current frame.
+
+        With multiple render products, annotator keys carry a render product suffix and every output except the
+        pose metadata is written to a ``<render product>/<annotator>/`` subfolder.
 
+        Args:
+            data: A dictionary containing the annotator data for the current frame.
+
+        Returns:
+            ``(file_path, kind, annotator)`` per output, where *kind* is a key of ``_OUTPUT_SUFFIXES``.
+        """
         image_id = f"{self._frame_id:06d}"
-        file_path = f"{self.vid_dir}/{render_product_path}{image_id}-meta.mat"
+        outputs = []
+        for annotator in data:
+            annotator_split = annotator.split("-")
+            render_product_path = f"{annotator_split[-1]}/" if len(annotator_split) > 1 else ""
+            for kind, (annotator_name, suffix) in _OUTPUT_SUFFIXES.items():
+                if not annotator.startswith(annotator_name):
+                    continue
+                folder = render_product_path
+                if render_product_path and kind != "meta":
+                    folder += f"{annotator_name}/"
+                suffix = suffix.format(image_format=self._image_output_format)
+                outputs.append((f"{self.vid_dir}/{folder}{image_id}-{suffix}", kind, annotator))
+        return outputs
+
+    def _output_data(self, kind: str, annotator_data: Any) -> Any:
+        """Convert annotator data into the contents of one output file.
 
-        self._backend.write_blob(file_path, buf.getvalue())
+        Args:
+            kind: Output kind, a key of ``_OUTPUT_SUFFIXES``.
+            annotator_data: Data of the annotator producing the output.
+
+        Returns:
+            The image to write for kinds in ``_IMAGE_OUTPUTS``, otherwise the encoded file contents.
+        """
+        if kind == "rgb":
+            return annotator_data
+        if kind == "depth":
+            return self._depth_image(annotator_data)
+        if kind == "label":
+            return self._label_image(annotator_data)
+        if kind == "box":
+            return self._bounding_box_text(annotator_data)
+        return self._meta_mat(annotator_data)
+
+    def _get_write_pipeline(self) -> WritePipeline | None:
+        """Return the background write pipeline, creating an owned one if requested.
+
+        Returns:
+            The pipeline frames are submitted to, or None if frames are written inline.
+        """
+        if self._write_pipeline is None and self._num_write_workers > 0:
+            self._write_pipeline = WritePipeline(num_workers=self._num_write_workers, name="ycb_video_writer")
+            self._owns_write_pipeline = True
+        return self._write_pipeline
+
+    def _submit_frame(self, pipeline: WritePipeline, data: dict) -> None:
+        """Submit the current frame to the background write pipeline.
+
+        Writes the same files as :meth:`write`, but encodes and writes every output off the writer thread.
+
+        Args:
+            pipeline: Pipeline to submit the frame to.
+            data: A dictionary containing the annotator data for the current frame.
+        """
+        image_format = self._image_output_format
+        jobs = self._frame_outputs(data)
+        frame = {annotator: snapshot_annotator_data(data[annotator]) for _, _, annotator in jobs}
+
+        def _encode() -> list[tuple[str, bytes]]:
+            outputs = []
+            for file_path, kind, annotator in jobs:
+                output = self._output_data(kind, frame[annotator])
+                outputs.append((file_path, encode_image(output, image_format) if kind in _IMAGE_OUTPUTS else output))
+            return outputs
+
+        def _commit(outputs: list[tuple[str, bytes]]) -> None:
+            for file_path, blob in outputs:
+                self._backend.write_blob(file_path, blob)
+
+        pipeline.submit(_encode, _commit)
+
+    def flush(self) -> None:
+        """Wait until all frames submitted to the background write pipeline are written."""
+        if self._write_pipeline is not None:
+            self._write_pipeline.flush()
+
+    def detach(self) -> None:
+        """Flush pending background writes and detach the writer."""
+        if self._owns_write_pipeline:
+            self._write_pipeline.close()
+            self._write_pipeline = None
+            self._owns_write_pipeline = False
+        else:
+            self.flush()
+        super().detach()
 
     def _create_output_folders(self) -> None:
         """Create an output directory structure (if necessary), similar to that used in the YCB Video Dataset. Note: A.
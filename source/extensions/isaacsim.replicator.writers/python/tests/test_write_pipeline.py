@@ -0,0 +1,209 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Verifies the background WritePipeline used by PoseWriter and YCBVideoWriter.
+
+The tests cover in-order commits, bounded in-flight frames, error propagation
+and the encoding helpers, and that YCBVideoWriter writes the same files with
+and without the pipeline.
+"""
+
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+from unittest import mock
+
+import numpy as np
+import omni.kit.test
+import omni.replicator.core as rep
+from isaacsim.replicator.writers.scripts.writers.write_pipeline import (
+    WritePipeline,
+    encode_image,
+    encode_json,
+    snapshot_annotator_data,
+)
+from isaacsim.replicator.writers.scripts.writers.ycb_video_writer import YCBVideoWriter
+from PIL import Image
+from scipy.io import loadmat
+
+
+class TestWritePipeline(omni.kit.test.AsyncTestCase):
+    """Test WritePipeline ordering, backpressure and error handling."""
+
+    async def test_commits_follow_submission_order(self) -> None:
+        """Test that commits run in submission order even when encodes finish out of order."""
+        committed = []
+        pipeline = WritePipeline(num_workers=4, max_pending=16)
+
+        def _encode(i: int) -> int:
+            time.sleep(random.uniform(0.0, 0.005))
+            return i
+
+        for i in range(50):
+            pipeline.submit(lambda i=i: _encode(i), committed.append)
+        pipeline.close()
+
+        self.assertEqual(committed, list(range(50)))
+        self.assertEqual(pipeline.frames_submitted, 50)
+        self.assertEqual(pipeline.frames_committed, 50)
+
+    async def test_in_flight_frames_are_bounded(self) -> None:
+        """Test that submit blocks once max_pending frames are in flight."""
+        release = threading.Event()
+        in_flight = []
+        lock = threading.Lock()
+        peak = [0]
+
+        def _encode() -> None:
+            with lock:
+                in_flight.append(None)
+                peak[0] = max(peak[0], len(in_flight))
+            release.wait()
+
+        def _commit(_: None) -> None:
+            with lock:
+                in_flight.pop()
+
+        pipeline = WritePipeline(num_workers=4, max_pending=2)
+        submitter = threading.Thread(target=lambda: [pipeline.submit(_encode, _commit) for _ in range(6)])
+        submitter.start()
+        time.sleep(0.1)
+        self.assertEqual(pipeline.frames_submitted, 2)
+        release.set()
+        submitter.join()
+        pipeline.close()
+
+        self.assertLessEqual(peak[0], 2)
+        self.assertEqual(pipeline.frames_committed, 6)
+        self.assertGreater(pipeline.blocked_time, 0.0)
+
+    async def test_flush_reraises_frame_errors(self) -> None:
+        """Test that a failing frame is reported on flush and does not block later frames."""
+        committed = []
+        pipeline = WritePipeline(num_workers=2)
+
+        def _fail() -> None:
+            raise OSError("disk full")
+
+        with mock.patch("carb.log_error"):
+            pipeline.submit(_fail, committed.append)
+            pipeline.submit(lambda: 1, committed.append)
+            with self.assertRaises(RuntimeError):
+                pipeline.flush()
+        pipeline.flush()
+        pipeline.close()
+
+        self.assertEqual(committed, [1])
+        with self.assertRaises(RuntimeError):
+            pipeline.submit(lambda: 2)
+
+
+class TestWritePipelineEncoding(omni.kit.test.AsyncTestCase):
+    """Test the helpers used to prepare frames for background writing."""
+
+    async def test_snapshot_copies_arrays(self) -> None:
+        """Test that snapshots are unaffected by later buffer reuse."""
+        data = {"data": np.zeros(4), "info": {"ids": [np.ones(2)]}}
+        snapshot = snapshot_annotator_data(data)
+        data["data"][:] = 5
+        data["info"]["ids"][0][:] = 5
+
+        np.testing.assert_array_equal(snapshot["data"], np.zeros(4))
+        np.testing.assert_array_equal(snapshot["info"]["ids"][0], np.ones(2))
+
+    async def test_encode_helpers(self) -> None:
+        """Test JSON encoding of NumPy values and PNG/JPEG image encoding."""
+        payload = json.loads(encode_json({"a": np.float32(1.5), "b": np.arange(3)}))
+        self.assertEqual(payload, {"a": 1.5, "b": [0, 1, 2]})
+
+        rgba = np.zeros((8, 8, 4), dtype=np.uint8)
+        self.assertTrue(encode_image(rgba, "png").startswith(b"\x89PNG"))
+        self.assertTrue(encode_image(rgba, "jpg").startswith(b"\xff\xd8"))
+        self.assertIsNone(encode_image(rgba, "exr"))
+
+
+class TestYCBVideoWriterPipeline(omni.kit.test.AsyncTestCase):
+    """Test that YCBVideoWriter writes the same files with and without the background pipeline."""
+
+    def _frame(self) -> dict:
+        """Return synthetic annotator data for one frame with two render products.
+
+        Returns:
+            Annotator name to data, as passed to ``YCBVideoWriter.write``.
+        """
+        labels = {"0": {"class": "BACKGROUND"}, "1": {"class": "cube"}}
+        segmentation = np.zeros((8, 8), dtype=np.uint32)
+        segmentation[2:6, 2:6] = 1
+        box_fields = ("semanticId", "x_min", "y_min", "x_max", "y_max")
+        box_dtype = [(name, "<i4") for name in box_fields] + [("occlusionRatio", "<f4")]
+        boxes = np.array([(1, 2, 2, 5, 5, 0.0)], dtype=box_dtype)
+        pose_dtype = [("semanticId", "<u4"), ("pose", "<f4", (4, 4)), ("center", "<f4", (2,))]
+        poses = np.array([(1, np.eye(4), (4.0, 4.0))], dtype=pose_dtype)
+        frame = {"pose": {"data": poses, "info": {"idToLabels": labels}}}
+        for rp in ("rp1", "rp2"):
+            frame[f"rgb-{rp}"] = np.random.default_rng(0).integers(0, 255, (8, 8, 4), dtype=np.uint8)
+            frame[f"distance_to_image_plane-{rp}"] = np.linspace(1.0, 2.0, 64, dtype=np.float32).reshape(8, 8)
+            frame[f"semantic_segmentation-{rp}"] = {"data": segmentation, "info": {"idToLabels": labels}}
+            frame[f"bounding_box_2d_tight-{rp}"] = {"data": boxes, "info": {"idToLabels": labels}}
+        return frame
+
+    async def _write(self, num_write_workers: int) -> str:
+        """Write two frames with a YCBVideoWriter and return its video directory.
+
+        Args:
+            num_write_workers: Background write workers, 0 to write inline.
+
+        Returns:
+            The directory holding the written frame files.
+        """
+        writer = YCBVideoWriter(
+            output_dir=tempfile.mkdtemp(prefix=f"test_ycb_video_writer_{num_write_workers}_"),
+            num_frames=2,
+            class_name_to_index_map={"cube": 1},
+            intrinsic_matrix=np.eye(3),
+            num_write_workers=num_write_workers,
+        )
+        for _ in range(2):
+            writer.write(self._frame())
+        writer.flush()
+        await rep.orchestrator.wait_until_complete_async()
+        return writer.vid_dir
+
+    async def test_pipelined_and_inline_outputs_match(self) -> None:
+        """Test that the pipelined writer produces the same files and contents as the inline writer."""
+        inline_dir = await self._write(0)
+        pipelined_dir = await self._write(2)
+
+        def _files(root: str) -> list[str]:
+            return sorted(os.path.relpath(os.path.join(d, f), root) for d, _, names in os.walk(root) for f in names)
+
+        files = _files(inline_dir)
+        self.assertEqual(len(files), 2 * (1 + 2 * 4))
+        self.assertEqual(files, _files(pipelined_dir))
+        for name in files:
+            inline_path, pipelined_path = os.path.join(inline_dir, name), os.path.join(pipelined_dir, name)
+            if name.endswith(".png"):
+                with Image.open(inline_path) as inline_image, Image.open(pipelined_path) as pipelined_image:
+                    np.testing.assert_array_equal(np.asarray(inline_image), np.asarray(pipelined_image))
+            elif name.endswith(".mat"):
+                inline_mat, pipelined_mat = loadmat(inline_path), loadmat(pipelined_path)
+                for key in ("cls_indexes", "factor_depth", "intrinsic_matrix", "poses", "center"):
+                    np.testing.assert_array_equal(inline_mat[key], pipelined_mat[key])
+            else:
+                with open(inline_path, "rb") as f, open(pipelined_path, "rb") as g:
+                    self.assertEqual(f.read(), g.read(), name)
@@ -16,18 +16,37 @@
 from .ackermann_controller import AckermannController
 from .differential_controller import DifferentialController
 from .holonomic_controller import HolonomicController
-from .quintic_path_planner import QuinticPolynomial, quintic_polynomials_planner
-from .stanley_control import State, calc_target_index, normalize_angle, pid_control, stanley_control
+from .quintic_path_planner import (
+    QuinticPolynomial,
+    quintic_durations_batch,
+    quintic_polynomials_planner,
+    quintic_polynomials_planner_batch,
+)
+from .stanley_control import (
+    State,
+    calc_target_index,
+    calc_target_index_batch,
+    normalize_angle,
+    normalize_angle_batch,
+    pid_control,
+    stanley_control,
+    stanley_control_batch,
+)
 
 __all__ = [
     "AckermannController",
     "DifferentialController",
     "HolonomicController",
     "QuinticPolynomial",
+    "quintic_durations_batch",
     "quintic_polynomials_planner",
+    "quintic_polynomials_planner_batch",
     "State",
     "calc_target_index",
+    "calc_target_index_batch",
     "normalize_angle",
+    "normalize_angle_batch",
     "pid_control",
     "stanley_control",
+    "stanley_control_batch",
 ]
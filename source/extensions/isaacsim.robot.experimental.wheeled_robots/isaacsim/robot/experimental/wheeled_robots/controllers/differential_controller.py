@@ -26,6 +26,9 @@ class DifferentialController:
     Convert [linear_speed, angular_speed] commands into [left, right] wheel velocities
     using the standard differential-drive kinematic model.
 
+    For fleets of robots, :meth:`forward_batch` converts the commands of all robots at once.
+    The parameters can then also be given per robot as arrays of shape (N,).
+
     Args:
         wheel_radius: Radius of each drive wheel in m.
         wheel_base: Distance between left and right wheels in m.
@@ -40,22 +43,22 @@ class DifferentialController:
     def __init__(
         self,
         *,
-        wheel_radius: float,
-        wheel_base: float,
-        max_linear_speed: float = 1.0e20,
-        max_angular_speed: float = 1.0e20,
-        max_wheel_speed: float = 1.0e20,
+        wheel_radius: float | np.ndarray,
+        wheel_base: float | np.ndarray,
+        max_linear_speed: float | np.ndarray = 1.0e20,
+        max_angular_speed: float | np.ndarray = 1.0e20,
+        max_wheel_speed: float | np.ndarray = 1.0e20,
     ) -> None:
         self.wheel_radius = wheel_radius
         self.wheel_base = wheel_base
         self.max_linear_speed = max_linear_speed
         self.max_angular_speed = max_angular_speed
         self.max_wheel_speed = max_wheel_speed
-        if self.max_linear_speed < 0:
+        if np.any(np.asarray(self.max_linear_speed) < 0):
             raise ValueError(f"max_linear_speed must be >= 0, got {self.max_linear_speed}")
-        if self.max_angular_speed < 0:
+        if np.any(np.asarray(self.max_angular_speed) < 0):
             raise ValueError(f"max_angular_speed must be >= 0, got {self.max_angular_speed}")
-        if self.max_wheel_speed < 0:
+        if np.any(np.asarray(self.max_wheel_speed) < 0):
             raise ValueError(f"max_wheel_speed must be >= 0, got {self.max_wheel_speed}")
 
     def forward(self, command: np.ndarray) -> np.ndarray:
@@ -88,3 +91,33 @@ class DifferentialController:
             a_max=[self.max_wheel_speed, self.max_wheel_speed],
         )
         return joint_velocities
+
+    def forward_batch(self, commands: np.ndarray) -> np.ndarray:
+        """Convert the [linear_speed, angular_speed] commands of N robots to wheel velocities.
+
+        Scalar parameters apply to all robots, array parameters of shape (N,) apply per robot.
+
+        Args:
+            commands: Shape (N, 2) — [forward speed, angular speed] per robot.
+
+        Returns:
+            Shape (N, 2) — [left wheel velocity, right wheel velocity] per robot.
+
+        Raises:
+            ValueError: If commands does not have shape (N, 2).
+        """
+        commands = np.asarray(commands, dtype=np.float64)
+        if commands.ndim != 2 or commands.shape[1] != 2:
+            raise ValueError(f"commands must have shape (N, 2), got {commands.shape}")
+        max_linear_speed = np.asarray(self.max_linear_speed, dtype=np.float64)
+        max_angular_speed = np.asarray(self.max_angular_speed, dtype=np.float64)
+        linear = np.clip(commands[:, 0], -max_linear_speed, max_linear_speed)
+        angular = np.clip(commands[:, 1], -max_angular_speed, max_angular_speed)
+        wheel_base = np.asarray(self.wheel_base, dtype=np.float64)
+        wheel_radius = np.asarray(self.wheel_radius, dtype=np.float64)
+        # omega_L = (2V - omega*b)/(2r), omega_R = (2V + omega*b)/(2r)
+        joint_velocities = np.empty_like(commands)
+        joint_velocities[:, 0] = ((2 * linear) - (angular * wheel_base)) / (2 * wheel_radius)
+        joint_velocities[:, 1] = ((2 * linear) + (angular * wheel_base)) / (2 * wheel_radius)
+        max_wheel_speed = np.asarray(self.max_wheel_speed, dtype=np.float64).reshape(-1, 1)
+        return np.clip(joint_velocities, -max_wheel_speed, max_wheel_speed)
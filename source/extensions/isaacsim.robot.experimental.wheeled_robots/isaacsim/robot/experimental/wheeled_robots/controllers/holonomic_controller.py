@@ -31,6 +31,11 @@ class HolonomicController:
     Convert [forward, lateral, yaw] velocity commands into per-wheel angular
     velocities by solving a quadratic program.
 
+    For fleets of identical robots, :meth:`forward_batch` converts the commands of all robots
+    at once. The QP only has equality constraints, so its solution is a fixed linear map of the
+    command. This map is precomputed once, and the batch path needs no per-robot solve. The speed
+    limits and gains can then also be given per robot as arrays of shape (N,).
+
     Args:
         wheel_radius: Radius of each wheel (scalar broadcast to all wheels, or per-wheel array).
         wheel_positions: Positions of each wheel relative to the robot center, shape (N, 3).
@@ -145,6 +150,11 @@ class HolonomicController:
         self.prob.solve()
         self._l = l.copy()
         self._u = u.copy()
+        # Closed-form minimizer of 0.5 x^T P x subject to the equality rows (x, y linear and z angular):
+        # x = P^-1 A^T (A P^-1 A^T)^+ b, the pseudo-inverse covers degenerate wheel layouts
+        A_eq = concat_vw[[0, 1, 5]]
+        P_inv_At = A_eq.T / diag_P[:, None]
+        self._command_to_wheels = P_inv_At @ np.linalg.pinv(A_eq @ P_inv_At)
 
     def forward(self, command: np.ndarray) -> np.ndarray:
         """Compute wheel velocities from [forward, lateral, yaw] command.
@@ -189,3 +199,41 @@ class HolonomicController:
                 values = values * scale
             self.joint_commands = values.astype(np.float64)
         return self.joint_commands.copy()
+
+    def forward_batch(self, commands: np.ndarray) -> np.ndarray:
+        """Compute the wheel velocities of N robots from their [forward, lateral, yaw] commands.
+
+        All robots share the wheel geometry of this controller. Speed limits and gains may be
+        scalars or per-robot arrays of shape (N,). Zero commands produce zero wheel velocities.
+
+        Args:
+            commands: Shape (N, 3) — [forward speed, lateral speed, yaw speed] per robot.
+
+        Returns:
+            Shape (N, num_wheels) — wheel joint velocities per robot.
+
+        Raises:
+            ValueError: If commands does not have shape (N, 3).
+        """
+        commands = np.asarray(commands, dtype=np.float64)
+        if commands.ndim != 2 or commands.shape[1] != 3:
+            raise ValueError(f"commands must have shape (N, 3), got {commands.shape}")
+        linear = commands[:, :2] * np.asarray(self.linear_gain, dtype=np.float64).reshape(-1, 1)
+        angular = commands[:, 2] * np.asarray(self.angular_gain, dtype=np.float64)
+
+        # Clamp the linear speed norm and the yaw rate
+        max_linear_speed = np.asarray(self.max_linear_speed, dtype=np.float64)
+        linear_norm = np.linalg.norm(linear, axis=1)
+        linear_scale = np.minimum(1.0, max_linear_speed / np.maximum(linear_norm, np.finfo(np.float64).tiny))
+        linear = linear * linear_scale[:, None]
+        max_angular_speed = np.asarray(self.max_angular_speed, dtype=np.float64)
+        angular = np.clip(angular, -max_angular_speed, max_angular_speed)
+
+        targets = np.column_stack((linear, angular))
+        values = targets @ self._command_to_wheels.T
+
+        # Scale down robots exceeding the wheel speed limit, keeping the wheel velocity ratios
+        max_values = np.max(np.abs(values), axis=1)
+        max_wheel_speed = np.asarray(self.max_wheel_speed, dtype=np.float64)
+        wheel_scale = np.minimum(1.0, max_wheel_speed / np.maximum(max_values, np.finfo(np.float64).tiny))
+        return values * wheel_scale[:, None]
@@ -52,8 +52,6 @@ CHANGELOG:
 
 from __future__ import annotations
 
-import math
-
 import numpy as np
 
 MAX_T = 100.0
@@ -62,6 +60,9 @@ MAX_T = 100.0
 MIN_T = 5.0
 #: Minimum planning horizon in seconds.
 
+_MAX_CHUNK_ELEMENTS = 1 << 22
+#: Upper bound on the number of (pair, duration, sample) elements evaluated at once by the batched planner.
+
 
 class QuinticPolynomial:
     """Quintic (5th-order) polynomial for one-dimensional trajectory interpolation.
@@ -183,60 +184,247 @@ def quintic_polynomials_planner(
     Raises:
         ValueError: If no trajectory satisfies the acceleration and jerk constraints.
     """
-    vxs = sv * math.cos(syaw)
-    vys = sv * math.sin(syaw)
-    vxg = gv * math.cos(gyaw)
-    vyg = gv * math.sin(gyaw)
-
-    axs = sa * math.cos(syaw)
-    ays = sa * math.sin(syaw)
-    axg = ga * math.cos(gyaw)
-    ayg = ga * math.sin(gyaw)
-
-    time: list[float] = []
-    rx: list[float] = []
-    ry: list[float] = []
-    ryaw: list[float] = []
-    rv: list[float] = []
-    ra: list[float] = []
-    rj: list[float] = []
-
-    for T in np.arange(MIN_T, MAX_T, MIN_T):
-        xqp = QuinticPolynomial(sx, vxs, axs, gx, vxg, axg, float(T))
-        yqp = QuinticPolynomial(sy, vys, ays, gy, vyg, ayg, float(T))
-
-        time, rx, ry, ryaw, rv, ra, rj = [], [], [], [], [], [], []
-
-        for t in np.arange(0.0, T + dt, dt):
-            time.append(t)
-            rx.append(xqp.calc_point(t))
-            ry.append(yqp.calc_point(t))
-
-            vx = xqp.calc_first_derivative(t)
-            vy = yqp.calc_first_derivative(t)
-            v = np.hypot(vx, vy)
-            yaw = math.atan2(vy, vx)
-            rv.append(v)
-            ryaw.append(yaw)
-
-            ax = xqp.calc_second_derivative(t)
-            ay = yqp.calc_second_derivative(t)
-            a = np.hypot(ax, ay)
-            if len(rv) >= 2 and rv[-1] - rv[-2] < 0.0:
-                a *= -1
-            ra.append(a)
-
-            jx = xqp.calc_third_derivative(t)
-            jy = yqp.calc_third_derivative(t)
-            j = np.hypot(jx, jy)
-            if len(ra) >= 2 and ra[-1] - ra[-2] < 0.0:
-                j *= -1
-            rj.append(j)
-
-        if max([abs(i) for i in ra]) <= max_accel and max([abs(i) for i in rj]) <= max_jerk:
-            return time, rx, ry, ryaw, rv, ra, rj
-
-    raise ValueError(
-        f"could not find a valid trajectory with max_accel={max_accel}, max_jerk={max_jerk}, "
-        f"and dt={dt} for T in [{MIN_T}, {MAX_T})"
+    trajectory = quintic_polynomials_planner_batch(
+        sx, sy, syaw, sv, sa, gx, gy, gyaw, gv, ga, max_accel=max_accel, max_jerk=max_jerk, dt=dt
+    )[0]
+    if trajectory is None:
+        raise ValueError(
+            f"could not find a valid trajectory with max_accel={max_accel}, max_jerk={max_jerk}, "
+            f"and dt={dt} for T in [{MIN_T}, {MAX_T})"
+        )
+    time, rx, ry, ryaw, rv, ra, rj = trajectory
+    return list(time), rx.tolist(), ry.tolist(), ryaw.tolist(), rv.tolist(), ra.tolist(), rj.tolist()
+
+
+def _quintic_coefficients(
+    p0: np.ndarray, v0: np.ndarray, a0: np.ndarray, p1: np.ndarray, v1: np.ndarray, a1: np.ndarray, T: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Closed-form coefficients a0..a5 of quintic polynomials (broadcast over all inputs).
+
+    Args:
+        p0: Start positions.
+        v0: Start velocities.
+        a0: Start accelerations.
+        p1: End positions.
+        v1: End velocities.
+        a1: End accelerations.
+        T: Segment durations in seconds.
+
+    Returns:
+        Tuple of the coefficients (c0, c1, c2, c3, c4, c5).
+    """
+    dp = p1 - p0
+    c3 = (20.0 * dp - (8.0 * v1 + 12.0 * v0) * T - (3.0 * a0 - a1) * T**2) / (2.0 * T**3)
+    c4 = (-30.0 * dp + (14.0 * v1 + 16.0 * v0) * T + (3.0 * a0 - 2.0 * a1) * T**2) / (2.0 * T**4)
+    c5 = (12.0 * dp - 6.0 * (v1 + v0) * T - (a0 - a1) * T**2) / (2.0 * T**5)
+    return p0, v0, a0 / 2.0, c3, c4, c5
+
+
+def _boundary_components(
+    sx: float | np.ndarray,
+    sy: float | np.ndarray,
+    syaw: float | np.ndarray,
+    sv: float | np.ndarray,
+    sa: float | np.ndarray,
+    gx: float | np.ndarray,
+    gy: float | np.ndarray,
+    gyaw: float | np.ndarray,
+    gv: float | np.ndarray,
+    ga: float | np.ndarray,
+) -> tuple[tuple[np.ndarray, ...], tuple[np.ndarray, ...]]:
+    """Split the start and goal states of all pairs into x and y boundary conditions.
+
+    Args:
+        sx: Start x positions.
+        sy: Start y positions.
+        syaw: Start yaw angles.
+        sv: Start velocities.
+        sa: Start accelerations.
+        gx: Goal x positions.
+        gy: Goal y positions.
+        gyaw: Goal yaw angles.
+        gv: Goal velocities.
+        ga: Goal accelerations.
+
+    Returns:
+        Tuple of x and y boundary conditions, each as (start, start velocity, start acceleration,
+        goal, goal velocity, goal acceleration) arrays of shape (N,).
+    """
+    sx, sy, syaw, sv, sa, gx, gy, gyaw, gv, ga = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(value, dtype=np.float64)) for value in (sx, sy, syaw, sv, sa, gx, gy, gyaw, gv, ga))
     )
+    cs, ss = np.cos(syaw), np.sin(syaw)
+    cg, sg = np.cos(gyaw), np.sin(gyaw)
+    x = (sx, sv * cs, sa * cs, gx, gv * cg, ga * cg)
+    y = (sy, sv * ss, sa * ss, gy, gv * sg, ga * sg)
+    return x, y
+
+
+def quintic_durations_batch(
+    sx: float | np.ndarray,
+    sy: float | np.ndarray,
+    syaw: float | np.ndarray,
+    sv: float | np.ndarray,
+    sa: float | np.ndarray,
+    gx: float | np.ndarray,
+    gy: float | np.ndarray,
+    gyaw: float | np.ndarray,
+    gv: float | np.ndarray,
+    ga: float | np.ndarray,
+    max_accel: float | np.ndarray,
+    max_jerk: float | np.ndarray,
+    dt: float,
+) -> np.ndarray:
+    """Find the shortest feasible trajectory duration for many start/goal pairs at once.
+
+    The candidate durations are the same as in :func:`quintic_polynomials_planner`
+    (``np.arange(MIN_T, MAX_T, MIN_T)``), sampled every ``dt`` seconds. The polynomial coefficients
+    of all pairs and candidates are computed in closed form, and the acceleration and jerk magnitudes
+    are evaluated for all candidates and sample times as arrays. Pairs are processed in chunks to
+    bound the memory use.
+
+    Args:
+        sx: Start x positions in m, shape (N,) or scalar.
+        sy: Start y positions in m, shape (N,) or scalar.
+        syaw: Start yaw angles in rad, shape (N,) or scalar.
+        sv: Start velocities in m/s, shape (N,) or scalar.
+        sa: Start accelerations in m/s^2, shape (N,) or scalar.
+        gx: Goal x positions in m, shape (N,) or scalar.
+        gy: Goal y positions in m, shape (N,) or scalar.
+        gyaw: Goal yaw angles in rad, shape (N,) or scalar.
+        gv: Goal velocities in m/s, shape (N,) or scalar.
+        ga: Goal accelerations in m/s^2, shape (N,) or scalar.
+        max_accel: Maximum acceleration in m/s^2, shape (N,) or scalar.
+        max_jerk: Maximum jerk in m/s^3, shape (N,) or scalar.
+        dt: Time tick in s.
+
+    Returns:
+        Shortest feasible duration in seconds per pair, shape (N,). NaN for pairs without a feasible duration.
+    """
+    x, y = _boundary_components(sx, sy, syaw, sv, sa, gx, gy, gyaw, gv, ga)
+    num_pairs = x[0].shape[0]
+    max_accel = np.broadcast_to(np.asarray(max_accel, dtype=np.float64), (num_pairs,))
+    max_jerk = np.broadcast_to(np.asarray(max_jerk, dtype=np.float64), (num_pairs,))
+
+    durations = np.arange(MIN_T, MAX_T, MIN_T)
+    # Same sample times as np.arange(0.0, T + dt, dt) for every candidate, padded to the longest one
+    num_samples = np.array([len(np.arange(0.0, T + dt, dt)) for T in durations])
+    t = np.arange(num_samples.max()) * dt
+    valid = np.arange(t.shape[0])[None, :] < num_samples[:, None]
+    t2 = t * t
+
+    result = np.full(num_pairs, np.nan)
+    chunk = max(1, _MAX_CHUNK_ELEMENTS // valid.size)
+    for begin in range(0, num_pairs, chunk):
+        end = min(begin + chunk, num_pairs)
+        accel_sq = 0.0
+        jerk_sq = 0.0
+        for boundary in (x, y):
+            # Coefficients of shape (C, K, 1) for a chunk of C pairs and K candidate durations
+            coefficients = _quintic_coefficients(*(value[begin:end, None] for value in boundary), durations[None, :])
+            _, _, c2, c3, c4, c5 = (c[..., None] for c in coefficients)
+            accel = 2.0 * c2 + 6.0 * c3 * t + 12.0 * c4 * t2 + 20.0 * c5 * t2 * t
+            jerk = 6.0 * c3 + 24.0 * c4 * t + 60.0 * c5 * t2
+            accel_sq = accel_sq + accel * accel
+            jerk_sq = jerk_sq + jerk * jerk
+        # (C, K) largest magnitudes over the valid samples of each candidate
+        max_accel_sq = np.where(valid, accel_sq, 0.0).max(axis=-1)
+        max_jerk_sq = np.where(valid, jerk_sq, 0.0).max(axis=-1)
+        feasible = (np.sqrt(max_accel_sq) <= max_accel[begin:end, None]) & (
+            np.sqrt(max_jerk_sq) <= max_jerk[begin:end, None]
+        )
+        first = np.argmax(feasible, axis=1)
+        result[begin:end] = np.where(feasible.any(axis=1), durations[first], np.nan)
+    return result
+
+
+def quintic_polynomials_planner_batch(
+    sx: float | np.ndarray,
+    sy: float | np.ndarray,
+    syaw: float | np.ndarray,
+    sv: float | np.ndarray,
+    sa: float | np.ndarray,
+    gx: float | np.ndarray,
+    gy: float | np.ndarray,
+    gyaw: float | np.ndarray,
+    gv: float | np.ndarray,
+    ga: float | np.ndarray,
+    max_accel: float | np.ndarray,
+    max_jerk: float | np.ndarray,
+    dt: float,
+) -> list[tuple[np.ndarray, ...] | None]:
+    """Plan quintic polynomial trajectories for many start/goal pairs at once.
+
+    Vectorized version of :func:`quintic_polynomials_planner`: the duration of every pair is found
+    with :func:`quintic_durations_batch`, then all trajectories are sampled together.
+
+    Args:
+        sx: Start x positions in m, shape (N,) or scalar.
+        sy: Start y positions in m, shape (N,) or scalar.
+        syaw: Start yaw angles in rad, shape (N,) or scalar.
+        sv: Start velocities in m/s, shape (N,) or scalar.
+        sa: Start accelerations in m/s^2, shape (N,) or scalar.
+        gx: Goal x positions in m, shape (N,) or scalar.
+        gy: Goal y positions in m, shape (N,) or scalar.
+        gyaw: Goal yaw angles in rad, shape (N,) or scalar.
+        gv: Goal velocities in m/s, shape (N,) or scalar.
+        ga: Goal accelerations in m/s^2, shape (N,) or scalar.
+        max_accel: Maximum acceleration in m/s^2, shape (N,) or scalar.
+        max_jerk: Maximum jerk in m/s^3, shape (N,) or scalar.
+        dt: Time tick in s.
+
+    Returns:
+        One (time, rx, ry, ryaw, rv, ra, rj) tuple of arrays per pair, or None for pairs where no
+        trajectory satisfies the acceleration and jerk constraints.
+
+    Example:
+
+    .. code-block:: python
+
+        >>> trajectories = quintic_polynomials_planner_batch(
+        ...     sx=[0.0, 1.0], sy=0.0, syaw=0.0, sv=0.0, sa=0.0,
+        ...     gx=[10.0, 5.0], gy=[5.0, -2.0], gyaw=0.0, gv=0.0, ga=0.0,
+        ...     max_accel=1.0, max_jerk=0.5, dt=0.1,
+        ... )
+        >>> time, rx, ry, ryaw, rv, ra, rj = trajectories[0]
+    """
+    durations = quintic_durations_batch(sx, sy, syaw, sv, sa, gx, gy, gyaw, gv, ga, max_accel, max_jerk, dt)
+    x, y = _boundary_components(sx, sy, syaw, sv, sa, gx, gy, gyaw, gv, ga)
+    trajectories: list[tuple[np.ndarray, ...] | None] = [None] * durations.shape[0]
+    found = np.flatnonzero(~np.isnan(durations))
+    if found.size == 0:
+        return trajectories
+
+    T = durations[found]
+    num_samples = np.array([len(np.arange(0.0, duration + dt, dt)) for duration in T])
+    t = np.arange(num_samples.max()) * dt
+    t2 = t * t
+    samples = []
+    for boundary in (x, y):
+        c0, c1, c2, c3, c4, c5 = (c[:, None] for c in _quintic_coefficients(*(v[found] for v in boundary), T))
+        point = c0 + t * (c1 + t * (c2 + t * (c3 + t * (c4 + t * c5))))
+        velocity = c1 + 2.0 * c2 * t + 3.0 * c3 * t2 + 4.0 * c4 * t2 * t + 5.0 * c5 * t2 * t2
+        accel = 2.0 * c2 + 6.0 * c3 * t + 12.0 * c4 * t2 + 20.0 * c5 * t2 * t
+        jerk = 6.0 * c3 + 24.0 * c4 * t + 60.0 * c5 * t2
+        samples.append((point, velocity, accel, jerk))
+    (rx, vx, ax, jx), (ry, vy, ay, jy) = samples
+
+    rv = np.hypot(vx, vy)
+    ryaw = np.arctan2(vy, vx)
+    # Acceleration is negative while decelerating, jerk while the signed acceleration decreases
+    ra = np.hypot(ax, ay)
+    ra[:, 1:] = np.where(np.diff(rv, axis=1) < 0.0, -ra[:, 1:], ra[:, 1:])
+    rj = np.hypot(jx, jy)
+    rj[:, 1:] = np.where(np.diff(ra, axis=1) < 0.0, -rj[:, 1:], rj[:, 1:])
+
+    for row, (index, n) in enumerate(zip(found, num_samples)):
+        trajectories[index] = (
+            t[:n],
+            rx[row, :n],
+            ry[row, :n],
+            ryaw[row, :n],
+            rv[row, :n],
+            ra[row, :n],
+            rj[row, :n],
+        )
+    return trajectories
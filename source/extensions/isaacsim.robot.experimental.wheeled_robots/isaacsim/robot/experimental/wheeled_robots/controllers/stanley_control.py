@@ -205,3 +205,97 @@ def calc_target_index(state: State, cx: list[float], cy: list[float]) -> tuple[i
     error_front_axle = np.dot([dx[target_idx], dy[target_idx]], front_axle_vec)
 
     return int(target_idx), float(error_front_axle)
+
+
+def normalize_angle_batch(angles: np.ndarray) -> np.ndarray:
+    """Normalize an array of angles to [-pi, pi].
+
+    Args:
+        angles: Angles in radians, any shape.
+
+    Returns:
+        Normalized angles in [-pi, pi], same shape as the input.
+
+    Raises:
+        ValueError: If any angle is not finite.
+    """
+    angles = np.asarray(angles, dtype=np.float64)
+    if not np.all(np.isfinite(angles)):
+        raise ValueError("angles must be finite")
+    normalized = (angles + np.pi) % (2.0 * np.pi) - np.pi
+    return np.where((normalized == -np.pi) & (angles > 0.0), np.pi, normalized)
+
+
+def calc_target_index_batch(
+    x: np.ndarray, y: np.ndarray, yaw: np.ndarray, wheel_base: float | np.ndarray, cx: np.ndarray, cy: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Compute the nearest target indices and cross-track errors of N vehicles.
+
+    Args:
+        x: Vehicle x-coordinates, shape (N,).
+        y: Vehicle y-coordinates, shape (N,).
+        yaw: Vehicle yaw angles, shape (N,).
+        wheel_base: Distance between front and rear axles, scalar or shape (N,).
+        cx: Reference path x-coordinates, shape (M,) shared by all vehicles or (N, M) per vehicle.
+        cy: Reference path y-coordinates, same shape as cx.
+
+    Returns:
+        Tuple of (target_indices, front_axle_errors), each of shape (N,).
+    """
+    x, y, yaw = (np.asarray(value, dtype=np.float64) for value in (x, y, yaw))
+    cx = np.atleast_2d(np.asarray(cx, dtype=np.float64))
+    cy = np.atleast_2d(np.asarray(cy, dtype=np.float64))
+    fx = x + wheel_base * np.cos(yaw)
+    fy = y + wheel_base * np.sin(yaw)
+
+    dx = fx[:, None] - cx
+    dy = fy[:, None] - cy
+    dx, dy = np.broadcast_arrays(dx, dy)
+    target_idx = np.argmin(np.hypot(dx, dy), axis=1)
+
+    rows = np.arange(len(target_idx))
+    # Dot product with the front axle vector [-cos(yaw + pi/2), -sin(yaw + pi/2)] = [sin(yaw), -cos(yaw)]
+    error_front_axle = dx[rows, target_idx] * np.sin(yaw) - dy[rows, target_idx] * np.cos(yaw)
+    return target_idx, error_front_axle
+
+
+def stanley_control_batch(
+    x: np.ndarray,
+    y: np.ndarray,
+    yaw: np.ndarray,
+    v: np.ndarray,
+    wheel_base: float | np.ndarray,
+    cx: np.ndarray,
+    cy: np.ndarray,
+    cyaw: np.ndarray,
+    last_target_idx: np.ndarray,
+    k: float | np.ndarray = 0.5,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Compute the Stanley steering control outputs of N vehicles.
+
+    Batched equivalent of :func:`stanley_control` operating on arrays of vehicle states.
+
+    Args:
+        x: Vehicle x-coordinates, shape (N,).
+        y: Vehicle y-coordinates, shape (N,).
+        yaw: Vehicle yaw angles, shape (N,).
+        v: Vehicle speeds, shape (N,).
+        wheel_base: Distance between front and rear axles, scalar or shape (N,).
+        cx: Reference path x-coordinates, shape (M,) shared by all vehicles or (N, M) per vehicle.
+        cy: Reference path y-coordinates, same shape as cx.
+        cyaw: Reference path yaw angles, same shape as cx.
+        last_target_idx: Previous target indices on the path, shape (N,).
+        k: Cross-track error gain, scalar or shape (N,).
+
+    Returns:
+        Tuple of (steering_angles, target_indices), each of shape (N,).
+    """
+    current_target_idx, error_front_axle = calc_target_index_batch(x, y, yaw, wheel_base, cx, cy)
+    current_target_idx = np.maximum(current_target_idx, np.asarray(last_target_idx, dtype=np.int64))
+
+    cyaw = np.atleast_2d(np.asarray(cyaw, dtype=np.float64))
+    rows = np.arange(len(current_target_idx)) if cyaw.shape[0] > 1 else 0
+    theta_e = normalize_angle_batch(cyaw[rows, current_target_idx] - np.asarray(yaw, dtype=np.float64))
+    theta_d = np.arctan2(k * normalize_angle_batch(error_front_axle), np.asarray(v, dtype=np.float64))
+
+    return theta_e + theta_d, current_target_idx
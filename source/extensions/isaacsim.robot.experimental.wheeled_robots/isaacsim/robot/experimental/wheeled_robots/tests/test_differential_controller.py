@@ -15,6 +15,7 @@
 
 """Tests for differential drive controller."""
 
+import numpy as np
 import omni.kit.test
 from isaacsim.robot.experimental.wheeled_robots.controllers.differential_controller import DifferentialController
 
@@ -48,3 +49,31 @@ class TestDifferentialController(omni.kit.test.AsyncTestCase):
         controller.max_wheel_speed = 9
         actions = controller.forward(command)
         self.assertEqual(actions.tolist(), [8.125, 9])
+
+    async def test_differential_drive_batch(self) -> None:
+        """Test that forward_batch() matches forward() per robot, with shared and per-robot parameters."""
+        rng = np.random.default_rng(0)
+        commands = rng.uniform(-2.0, 2.0, (32, 2))
+
+        controller = DifferentialController(
+            wheel_radius=0.03, wheel_base=0.1125, max_linear_speed=1.5, max_angular_speed=1.0, max_wheel_speed=40.0
+        )
+        expected = np.array([controller.forward(command) for command in commands])
+        np.testing.assert_allclose(controller.forward_batch(commands), expected)
+
+        wheel_radius = rng.uniform(0.02, 0.05, 32)
+        wheel_base = rng.uniform(0.1, 0.3, 32)
+        max_wheel_speed = rng.uniform(10.0, 50.0, 32)
+        batch_controller = DifferentialController(
+            wheel_radius=wheel_radius, wheel_base=wheel_base, max_wheel_speed=max_wheel_speed
+        )
+        expected = np.array(
+            [
+                DifferentialController(wheel_radius=r, wheel_base=b, max_wheel_speed=m).forward(command)
+                for r, b, m, command in zip(wheel_radius, wheel_base, max_wheel_speed, commands)
+            ]
+        )
+        np.testing.assert_allclose(batch_controller.forward_batch(commands), expected)
+
+        with self.assertRaises(ValueError):
+            controller.forward_batch(np.zeros((4, 3)))
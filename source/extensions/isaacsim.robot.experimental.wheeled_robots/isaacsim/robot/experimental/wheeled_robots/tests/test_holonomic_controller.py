@@ -100,3 +100,40 @@ class TestHolonomicController(omni.kit.test.AsyncTestCase):
             kwargs[missing] = None
             with self.assertRaises(ValueError):
                 HolonomicController(**kwargs)
+
+    async def test_holonomic_drive_batch(self) -> None:
+        """Test that the closed-form forward_batch() matches the QP-based forward() per robot."""
+        controller = HolonomicController(
+            wheel_radius=[0.04, 0.04, 0.04],
+            wheel_positions=[
+                [-0.0980432, 0.000636773, -0.050501],
+                [0.0493475, -0.084525, -0.050501],
+                [0.0495291, 0.0856937, -0.050501],
+            ],
+            wheel_orientations=[[0, 0, 0, 1], [0.866, 0, 0, -0.5], [0.866, 0, 0, 0.5]],
+            mecanum_angles=[90, 90, 90],
+            max_linear_speed=1.0,
+            max_angular_speed=1.5,
+            max_wheel_speed=30.0,
+        )
+        rng = np.random.default_rng(0)
+        commands = rng.uniform(-2.0, 2.0, (16, 3))
+        commands[0] = 0.0
+        commands[1] = [1.0, 1.0, 0.1]
+
+        actions = controller.forward_batch(commands)
+        self.assertEqual(actions.shape, (16, controller.num_wheels))
+        np.testing.assert_array_equal(actions[0], np.zeros(controller.num_wheels))
+        for command, action in zip(commands[1:], actions[1:]):
+            # The QP is solved iteratively with OSQP's default tolerances
+            np.testing.assert_allclose(action, controller.forward(command), rtol=1e-2, atol=0.05)
+        self.assertLessEqual(np.max(np.abs(actions)), 30.0 + 1e-9)
+
+        # Per-robot limits
+        max_wheel_speed = np.linspace(5.0, 50.0, 16)
+        controller.max_wheel_speed = max_wheel_speed
+        actions = controller.forward_batch(commands)
+        self.assertTrue(np.all(np.max(np.abs(actions), axis=1) <= max_wheel_speed + 1e-9))
+
+        with self.assertRaises(ValueError):
+            controller.forward_batch(np.zeros(3))
@@ -15,8 +15,48 @@
 
 """Tests for quintic path planner."""
 
+import math
+
+import numpy as np
 import omni.kit.test
-from isaacsim.robot.experimental.wheeled_robots.controllers.quintic_path_planner import quintic_polynomials_planner
+from isaacsim.robot.experimental.wheeled_robots.controllers.quintic_path_planner import (
+    MAX_T,
+    MIN_T,
+    QuinticPolynomial,
+    quintic_durations_batch,
+    quintic_polynomials_planner,
+    quintic_polynomials_planner_batch,
+)
+
+
+def _reference_planner(sx, sy, syaw, sv, sa, gx, gy, gyaw, gv, ga, max_accel, max_jerk, dt):
+    """Per-duration search with scalar polynomial evaluation, returning None if no duration is feasible."""
+    vxs, vys = sv * math.cos(syaw), sv * math.sin(syaw)
+    vxg, vyg = gv * math.cos(gyaw), gv * math.sin(gyaw)
+    axs, ays = sa * math.cos(syaw), sa * math.sin(syaw)
+    axg, ayg = ga * math.cos(gyaw), ga * math.sin(gyaw)
+    for T in np.arange(MIN_T, MAX_T, MIN_T):
+        xqp = QuinticPolynomial(sx, vxs, axs, gx, vxg, axg, float(T))
+        yqp = QuinticPolynomial(sy, vys, ays, gy, vyg, ayg, float(T))
+        time, rx, ry, ryaw, rv, ra, rj = [], [], [], [], [], [], []
+        for t in np.arange(0.0, T + dt, dt):
+            time.append(t)
+            rx.append(xqp.calc_point(t))
+            ry.append(yqp.calc_point(t))
+            vx, vy = xqp.calc_first_derivative(t), yqp.calc_first_derivative(t)
+            rv.append(np.hypot(vx, vy))
+            ryaw.append(math.atan2(vy, vx))
+            a = np.hypot(xqp.calc_second_derivative(t), yqp.calc_second_derivative(t))
+            if len(rv) >= 2 and rv[-1] - rv[-2] < 0.0:
+                a *= -1
+            ra.append(a)
+            j = np.hypot(xqp.calc_third_derivative(t), yqp.calc_third_derivative(t))
+            if len(ra) >= 2 and ra[-1] - ra[-2] < 0.0:
+                j *= -1
+            rj.append(j)
+        if max(abs(i) for i in ra) <= max_accel and max(abs(i) for i in rj) <= max_jerk:
+            return time, rx, ry, ryaw, rv, ra, rj
+    return None
 
 
 class TestQuinticPathPlanner(omni.kit.test.AsyncTestCase):
@@ -40,3 +80,43 @@ class TestQuinticPathPlanner(omni.kit.test.AsyncTestCase):
                 max_jerk=0.0,
                 dt=1.0,
             )
+
+    async def test_planner_matches_reference(self) -> None:
+        """Verify the vectorized planner returns the trajectory of the per-duration search."""
+        start = dict(sx=1.0, sy=-2.0, syaw=0.3, sv=0.5, sa=0.1)
+        goal = dict(gx=12.0, gy=7.0, gyaw=-0.4, gv=0.2, ga=0.0)
+        limits = dict(max_accel=1.0, max_jerk=0.5, dt=0.1)
+        expected = _reference_planner(**start, **goal, **limits)
+        result = quintic_polynomials_planner(**start, **goal, **limits)
+        self.assertIsNotNone(expected)
+        self.assertEqual(len(result[0]), len(expected[0]))
+        for values, expected_values in zip(result, expected):
+            np.testing.assert_allclose(values, expected_values, rtol=1e-6, atol=1e-8)
+
+    async def test_batch_planner_matches_reference(self) -> None:
+        """Verify batched durations and trajectories match the per-pair search, including infeasible pairs."""
+        rng = np.random.default_rng(0)
+        num_pairs = 16
+        start = rng.uniform([-5.0, -5.0, -np.pi, 0.0, 0.0], [5.0, 5.0, np.pi, 1.0, 0.2], (num_pairs, 5))
+        goal = rng.uniform([-20.0, -20.0, -np.pi, 0.0, 0.0], [20.0, 20.0, np.pi, 1.0, 0.2], (num_pairs, 5))
+        max_accel = rng.uniform(0.05, 1.0, num_pairs)
+        max_accel[3] = 0.0
+        max_jerk = 0.5
+        dt = 0.2
+
+        durations = quintic_durations_batch(*start.T, *goal.T, max_accel, max_jerk, dt)
+        trajectories = quintic_polynomials_planner_batch(*start.T, *goal.T, max_accel, max_jerk, dt)
+        self.assertEqual(durations.shape, (num_pairs,))
+        self.assertEqual(len(trajectories), num_pairs)
+        self.assertTrue(np.isnan(durations[3]))
+        self.assertIsNone(trajectories[3])
+
+        for i in range(num_pairs):
+            expected = _reference_planner(*start[i], *goal[i], max_accel[i], max_jerk, dt)
+            if expected is None:
+                self.assertTrue(np.isnan(durations[i]))
+                self.assertIsNone(trajectories[i])
+                continue
+            self.assertAlmostEqual(durations[i], expected[0][-1], delta=dt)
+            for values, expected_values in zip(trajectories[i], expected):
+                np.testing.assert_allclose(values, expected_values, rtol=1e-6, atol=1e-8)
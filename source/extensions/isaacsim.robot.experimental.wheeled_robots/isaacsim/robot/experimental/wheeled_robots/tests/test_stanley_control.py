@@ -17,8 +17,15 @@
 
 import math
 
+import numpy as np
 import omni.kit.test
-from isaacsim.robot.experimental.wheeled_robots.controllers.stanley_control import normalize_angle
+from isaacsim.robot.experimental.wheeled_robots.controllers.stanley_control import (
+    State,
+    normalize_angle,
+    normalize_angle_batch,
+    stanley_control,
+    stanley_control_batch,
+)
 
 
 class TestStanleyControl(omni.kit.test.AsyncTestCase):
@@ -38,3 +45,31 @@ class TestStanleyControl(omni.kit.test.AsyncTestCase):
             normalize_angle(-math.inf)
         with self.assertRaises(ValueError):
             normalize_angle(math.nan)
+
+    async def test_normalize_angle_batch_matches_scalar(self) -> None:
+        """Verify the batched normalization matches the scalar one, including the +pi edge case."""
+        angles = np.array([5.0 * math.pi, -5.0 * math.pi, 1.5 * math.pi, 0.3, -2.0, 7.0])
+        expected = [normalize_angle(angle) for angle in angles]
+        np.testing.assert_allclose(normalize_angle_batch(angles), expected)
+        with self.assertRaises(ValueError):
+            normalize_angle_batch(np.array([0.0, math.nan]))
+
+    async def test_stanley_control_batch_matches_per_vehicle(self) -> None:
+        """Verify the batched Stanley control matches the per-vehicle control for shared and per-vehicle paths."""
+        rng = np.random.default_rng(0)
+        wheel_base = 0.5
+        cx = np.linspace(0.0, 20.0, 200)
+        cy = np.sin(cx * 0.3)
+        cyaw = np.arctan2(np.gradient(cy), np.gradient(cx))
+        states = rng.uniform([0.0, -1.0, -0.5, 0.5], [18.0, 1.0, 0.5, 2.0], (16, 4))
+        last_target_idx = rng.integers(0, 100, 16)
+
+        expected = [
+            stanley_control(State(wheel_base, x=s[0], y=s[1], yaw=s[2], v=s[3]), cx, cy, cyaw, int(idx))
+            for s, idx in zip(states, last_target_idx)
+        ]
+        x, y, yaw, v = states.T
+        for paths in ((cx, cy, cyaw), (np.tile(cx, (16, 1)), np.tile(cy, (16, 1)), np.tile(cyaw, (16, 1)))):
+            delta, target_idx = stanley_control_batch(x, y, yaw, v, wheel_base, *paths, last_target_idx)
+            np.testing.assert_allclose(delta, [e[0] for e in expected], atol=1e-12)
+            np.testing.assert_array_equal(target_idx, [e[1] for e in expected])
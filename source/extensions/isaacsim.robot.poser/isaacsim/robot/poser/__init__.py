@@ -21,14 +21,19 @@ from usd.schema.isaac.robot_schema.math import Transform as Transform
 
 from .extension import Extension as Extension
 from .robot_poser import (
+    PoseLibrary,
     PoseResult,
+    RobotPoseBatch,
     RobotPoser,
     apply_joint_state,
     apply_joint_state_anchored,
+    apply_joint_states,
     apply_pose_by_name,
     delete_named_pose,
+    export_pose_library,
     export_poses,
     get_named_pose,
+    import_pose_library,
     import_poses,
     list_named_poses,
     store_named_pose,
@@ -38,9 +43,12 @@ from .robot_poser import (
 __all__ = [
     "RobotPoser",
     "PoseResult",
+    "RobotPoseBatch",
+    "PoseLibrary",
     "validate_robot_schema",
     "apply_joint_state",
     "apply_joint_state_anchored",
+    "apply_joint_states",
     "store_named_pose",
     "apply_pose_by_name",
     "get_named_pose",
@@ -48,4 +56,6 @@ __all__ = [
     "delete_named_pose",
     "export_poses",
     "import_poses",
+    "export_pose_library",
+    "import_pose_library",
 ]
@@ -26,7 +26,7 @@ from __future__ import annotations
 
 import json
 import logging
-from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Iterable, Mapping, Sequence
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -34,12 +34,15 @@ import numpy as np
 
 # Ensure the default LM solver is registered at import time.
 import usd.schema.isaac.robot_schema.lm_ik as _lm_ik  # noqa: F401
-from pxr import Gf, Sdf, Tf, Usd, UsdGeom
+from pxr import Gf, Sdf, Tf, Usd, UsdGeom, Vt
 from usd.schema.isaac.robot_schema import Attributes, Classes, Relations
-from usd.schema.isaac.robot_schema.ik_solver import IKSolver, IKSolverRegistry, pose_error
+from usd.schema.isaac.robot_schema.ik_solver import IKSolver, IKSolverRegistry, pose_error, pose_error_batch
 from usd.schema.isaac.robot_schema.kinematic_chain import (
     KinematicChain,
+    _fk_propagate_node,
+    _joint_is_prismatic,
     _joint_is_revolute,
+    _read_subtree_transforms,
 )
 from usd.schema.isaac.robot_schema.math import (
     Transform,
@@ -51,6 +54,7 @@ from usd.schema.isaac.robot_schema.utils import GetAllNamedPoses
 logger = logging.getLogger(__name__)
 
 NAMED_POSES_SCOPE = "NamedPoses"
+POSE_LIBRARY_SCOPE = "PoseLibrary"
 
 # ---------------------------------------------------------------------------
 # Data structures
@@ -176,6 +180,24 @@ def _from_native_value(stage: Usd.Stage, joint_path: str, value: float) -> float
     return float(value)
 
 
+def _is_revolute_cached(stage: Usd.Stage, joint_path: str, cache: dict[str, bool]) -> bool:
+    """Return whether ``joint_path`` is a revolute joint, looking each prim up once.
+
+    Args:
+        stage: USD stage.
+        joint_path: Prim path of the joint.
+        cache: Joint prim path to result, shared across calls.
+
+    Returns:
+        True if the joint prim exists and is a revolute joint.
+    """
+    revolute = cache.get(joint_path)
+    if revolute is None:
+        jprim = stage.GetPrimAtPath(joint_path)
+        revolute = cache[joint_path] = bool(jprim) and _joint_is_revolute(jprim)
+    return revolute
+
+
 def _joint_dict_to_array(joint_dict: dict[str, float], joints: list) -> np.ndarray:
     """Convert a joint dict to a numpy array in joint-chain order.
 
@@ -269,6 +291,41 @@ def _build_cold_start_seeds(
     return seeds
 
 
+def _batch_error_sq(chain: KinematicChain, targets: list[Transform], q: np.ndarray) -> np.ndarray:
+    """Return the squared pose error of every row of *q* against its target.
+
+    Args:
+        chain: Kinematic chain the configurations belong to.
+        targets: One chain-local target per row of *q*.
+        q: Joint configurations of shape ``(B, N)``.
+
+    Returns:
+        Squared pose-error norms of shape ``(B,)``.
+    """
+    T_t, T_q, _ = chain.compute_fk_and_jacobian_batch(q)
+    target_t = np.array([t.t for t in targets], dtype=float)
+    target_q = np.array([t.q for t in targets], dtype=float)
+    err = pose_error_batch(target_t, target_q, T_t, T_q)
+    return np.einsum("bi,bi->b", err, err)
+
+
+def _select_ladder_result(errs_sq: np.ndarray, tol_sq: float) -> int:
+    """Pick the ladder attempt to return.
+
+    Args:
+        errs_sq: Squared pose errors of the attempts, in seed priority order.
+        tol_sq: Squared convergence tolerance.
+
+    Returns:
+        Index of the highest-priority converged attempt, or of the lowest-error
+        attempt (earliest on ties, so the result is deterministic) if none converged.
+    """
+    converged = np.flatnonzero(errs_sq < tol_sq)
+    if converged.size:
+        return int(converged[0])
+    return int(np.argmin(errs_sq))
+
+
 # ---------------------------------------------------------------------------
 # RobotPoser class
 # ---------------------------------------------------------------------------
@@ -422,26 +479,25 @@ class RobotPoser:
         * No ``seed=`` and a cached ``_last_solution``: the cached
           configuration is tried first (lowest latency for tracking targets
           near the previous solve). If that attempt does not converge, the
-          full cold-start ladder is run in parallel as a fallback so a
+          full cold-start ladder is run as one batch as a fallback so a
           stale cache cannot trap the solver in the wrong basin.
         * No ``seed=`` and no cached solution: the full cold-start ladder
           (joint-limit midpoint, deterministic random restarts within
-          joint limits, and the all-zero configuration) runs in parallel
-          via a thread pool. The highest-priority converged result wins.
+          joint limits, and the all-zero configuration) is solved as one
+          batch. The highest-priority converged result wins.
 
         On every path, when no candidate converges the lowest-error attempt
         is returned with ``success=False`` and a single warning is logged
         recommending an explicit ``seed=``.
 
-        Parallel ladder execution
-        -------------------------
-        Cold-start (and ``_last_solution`` fallback) ladders run candidate
-        seeds concurrently on a :class:`~concurrent.futures.ThreadPoolExecutor`.
-        The LM solver in this project is stateless and ``chain.compute_fk``
-        does not mutate the chain, so the only shared mutable state across
-        attempts is the result aggregation, which happens after the threads
-        join. The latency of a cold-start ladder is therefore bounded by the
-        slowest single solve, not by the sum of all attempts.
+        Batched ladder execution
+        ------------------------
+        Cold-start (and ``_last_solution`` fallback) ladders hand all
+        candidate seeds to :meth:`IKSolver.solve_batch` in one call. The
+        default LM solver advances every seed together with stacked FK,
+        Jacobian and linear solves and drops seeds from the computation as
+        they converge, so the cost of a ladder grows with the array width
+        rather than with the number of Python-level solver calls.
 
         Args:
             target: Desired end-effector pose in the robot-base frame.
@@ -464,14 +520,7 @@ class RobotPoser:
             return PoseResult(success=False)
 
         joints = self._chain.joints
-        n = len(joints)
-        joint_fixed_dict = solver_kwargs.pop("joint_fixed", None)
-        fixed_mask = (
-            [joint_fixed_dict.get(j.prim_path, False) for j in joints]
-            if isinstance(joint_fixed_dict, dict)
-            else [False] * n
-        )
-        solver_kwargs["joint_fixed"] = fixed_mask
+        fixed_mask = self._fixed_mask(solver_kwargs)
 
         # Recompute the start-link pose every call so that changes made
         # by other tracked chains (which move the robot's joints) are
@@ -496,7 +545,7 @@ class RobotPoser:
             return q_sol, float(err @ err)
 
         def _run_ladder(candidate_seeds: list[np.ndarray]) -> tuple[np.ndarray, float, bool, int]:
-            """Run the ladder in parallel and return the best result.
+            """Solve every seed in one batched solver call and return the best result.
 
             Returns the highest-priority converged result, or the lowest-error
             attempt if none converge.
@@ -513,24 +562,11 @@ class RobotPoser:
                 q_sol, err_sq = _solve_one(candidate_seeds[0])
                 return q_sol, err_sq, err_sq < tol_sq, 0
 
-            with ThreadPoolExecutor(max_workers=len(candidate_seeds)) as pool:
-                # ``pool.map`` preserves submission order, which is the priority
-                # order produced by ``_build_cold_start_seeds``.
-                results = list(pool.map(_solve_one, candidate_seeds))
-
-            # Pick the highest-priority candidate that converged.
-            for idx, (q_sol, err_sq) in enumerate(results):
-                if err_sq < tol_sq:
-                    return q_sol, err_sq, True, idx
-            # No convergence: return the lowest-error attempt (priority is the
-            # tie-breaker so the result is deterministic across runs).
-            best_idx = 0
-            best_err = results[0][1]
-            for idx, (_q, err_sq) in enumerate(results):
-                if err_sq < best_err:
-                    best_err = err_sq
-                    best_idx = idx
-            return results[best_idx][0], best_err, False, best_idx
+            # Rows keep the priority order produced by ``_build_cold_start_seeds``.
+            q_sols = self._solver.solve_batch(self._chain, target_local, np.stack(candidate_seeds), **solver_kwargs)
+            errs_sq = _batch_error_sq(self._chain, [target_local] * len(q_sols), q_sols)
+            idx = _select_ladder_result(errs_sq, tol_sq)
+            return q_sols[idx], float(errs_sq[idx]), bool(errs_sq[idx] < tol_sq), idx
 
         used_ladder_fallback = False
         if seed is not None:
@@ -549,7 +585,7 @@ class RobotPoser:
             if cached_err_sq < tol_sq:
                 best_q, best_err_sq, success = cached_q, cached_err_sq, True
             else:
-                # Fall back to the full cold-start ladder in parallel.
+                # Fall back to the full cold-start ladder as one batch.
                 used_ladder_fallback = True
                 ladder_seeds = _build_cold_start_seeds(joints)
                 best_q, best_err_sq, success, _ = _run_ladder(ladder_seeds)
@@ -574,16 +610,118 @@ class RobotPoser:
                 float(np.sqrt(best_err_sq)),
             )
 
-        joint_dict: dict[str, float] = {j.prim_path: float(qval) for j, qval in zip(joints, best_q)}
-        fixed_dict: dict[str, bool] = {j.prim_path: fixed_mask[i] for i, j in enumerate(joints)}
-
         if success:
             self._last_solution = best_q
 
+        return self._make_pose_result(success, best_q, fixed_mask, target)
+
+    def solve_ik_batch(
+        self,
+        targets: list[Transform],
+        seeds: np.ndarray | list[list[float]] | None = None,
+        *,
+        tolerance: float = 1e-4,
+        **solver_kwargs: Any,
+    ) -> list[PoseResult]:
+        """Solve inverse kinematics for many targets in one batched solver call.
+
+        Intended for bulk work such as generating a pose library.  Without
+        ``seeds`` every target runs the full cold-start ladder (see
+        :meth:`solve_ik`), and all ``targets x ladder`` attempts are stacked
+        into a single :meth:`IKSolver.solve_batch` call.  With ``seeds``
+        each target is solved once from its row.  The cached solution used
+        by :meth:`solve_ik` is neither read nor updated.
+
+        Args:
+            targets: Desired end-effector poses in the robot-base frame.
+            seeds: Initial joint values of shape ``(len(targets), N)`` in
+                joint-chain order, or None to use the cold-start ladder.
+            tolerance: Convergence threshold on the pose-error norm.
+            **solver_kwargs: Forwarded to the IK solver, as in :meth:`solve_ik`.
+
+        Returns:
+            One PoseResult per target, in order.  Failed targets carry their
+            lowest-error attempt with ``success=False``.
+
+        Raises:
+            ValueError: When ``seeds`` does not have one row per target.
+        """
+        if self._chain is None or not self._chain.joints:
+            return [PoseResult(success=False) for _ in targets]
+        if not targets:
+            return []
+
+        joints = self._chain.joints
+        fixed_mask = self._fixed_mask(solver_kwargs)
+        start_pose_inv = _prim_pose_in_robot_frame(self._robot_prim, self._chain.start_prim).inv()
+        targets_local = [start_pose_inv @ target for target in targets]
+        tol_sq = tolerance * tolerance
+
+        if seeds is not None:
+            seeds = np.asarray(seeds, dtype=float)
+            if seeds.shape != (len(targets), len(joints)):
+                raise ValueError(f"seeds must have shape {(len(targets), len(joints))}, got {seeds.shape}")
+            ladder = seeds[:, None, :]
+        else:
+            ladder_seeds = np.stack(_build_cold_start_seeds(joints))
+            ladder = np.broadcast_to(ladder_seeds, (len(targets),) + ladder_seeds.shape)
+        n_seeds = ladder.shape[1]
+
+        # Row r solves target r // n_seeds from seed r % n_seeds.
+        rows_targets = [target for target in targets_local for _ in range(n_seeds)]
+        q_sols = self._solver.solve_batch(self._chain, rows_targets, ladder.reshape(-1, len(joints)), **solver_kwargs)
+        errs_sq = _batch_error_sq(self._chain, rows_targets, q_sols).reshape(len(targets), n_seeds)
+        q_sols = q_sols.reshape(len(targets), n_seeds, len(joints))
+
+        results = []
+        for i, target in enumerate(targets):
+            idx = _select_ladder_result(errs_sq[i], tol_sq)
+            results.append(self._make_pose_result(bool(errs_sq[i, idx] < tol_sq), q_sols[i, idx], fixed_mask, target))
+
+        n_failed = sum(not result.success for result in results)
+        if n_failed:
+            logger.warning("solve_ik_batch: %d of %d targets did not converge.", n_failed, len(targets))
+        return results
+
+    def _fixed_mask(self, solver_kwargs: dict[str, Any]) -> list[bool]:
+        """Convert the ``joint_fixed`` solver option to a chain-ordered mask.
+
+        The dict form (joint prim path to bool) is replaced in *solver_kwargs*
+        by the mask the solver expects.
+
+        Args:
+            solver_kwargs: Solver keyword arguments, updated in place.
+
+        Returns:
+            Fixed flag per chain joint.
+        """
+        joints = self._chain.joints
+        joint_fixed_dict = solver_kwargs.pop("joint_fixed", None)
+        fixed_mask = (
+            [joint_fixed_dict.get(j.prim_path, False) for j in joints]
+            if isinstance(joint_fixed_dict, dict)
+            else [False] * len(joints)
+        )
+        solver_kwargs["joint_fixed"] = fixed_mask
+        return fixed_mask
+
+    def _make_pose_result(self, success: bool, q: np.ndarray, fixed_mask: list[bool], target: Transform) -> PoseResult:
+        """Build the PoseResult for a solved configuration.
+
+        Args:
+            success: Whether the solve converged.
+            q: Joint values in chain order.
+            fixed_mask: Fixed flag per chain joint.
+            target: Target pose in the robot-base frame.
+
+        Returns:
+            The pose result.
+        """
+        joints = self._chain.joints
         return PoseResult(
             success=success,
-            joints=joint_dict,
-            joint_fixed=fixed_dict,
+            joints={j.prim_path: float(qval) for j, qval in zip(joints, q)},
+            joint_fixed={j.prim_path: fixed_mask[i] for i, j in enumerate(joints)},
             start_link=str(self._chain.start_prim.GetPath()),
             end_link=str(self._chain.end_prim.GetPath()),
             target_position=target.t.tolist(),
@@ -735,12 +873,15 @@ def invalidate_articulation_cache(robot_path: str | None = None) -> None:
     """Drop cached Articulation instances.
 
     Args:
-        robot_path: If given, drop only that entry; otherwise clear all.
+        robot_path: If given, drop only the entries wrapping that robot; otherwise clear all.
     """
     if robot_path is None:
         _articulation_cache.clear()
+        _batch_articulation_cache.clear()
     else:
         _articulation_cache.pop(robot_path, None)
+        for robot_paths in [key for key in _batch_articulation_cache if robot_path in key]:
+            del _batch_articulation_cache[robot_paths]
 
 
 def _drive_robot(stage: Usd.Stage, robot_prim: Usd.Prim, joint_dict: dict[str, float]) -> None:
@@ -813,6 +954,301 @@ def apply_joint_state_anchored(
         KinematicChain(stage, robot_prim).teleport_anchored(joint_dict, anchor_prim=anchor_prim)
 
 
+# ---------------------------------------------------------------------------
+# Batched Joint-State Application
+# ---------------------------------------------------------------------------
+
+
+_batch_articulation_cache: dict[tuple[str, ...], tuple] = {}
+
+
+def _get_batch_articulation(robot_paths: tuple[str, ...]) -> tuple[Any, list[dict[str, int]]]:
+    """Return a cached (Articulation, dof_path_to_idx per robot) pair wrapping all *robot_paths*.
+
+    A single view only works when every robot has the same joint layout. When the
+    DOF paths relative to each robot root differ, no view is returned.
+
+    Args:
+        robot_paths: USD paths to the robot prims.
+
+    Returns:
+        Tuple of (Articulation, list of dof_path_to_idx mappings in robot order),
+        or (None, []) when the robots do not share one joint layout.
+    """
+    cached = _batch_articulation_cache.get(robot_paths)
+    if cached is not None:
+        return cached
+
+    from isaacsim.core.experimental.prims import Articulation
+
+    articulation = Articulation(list(robot_paths))
+    layouts = {
+        tuple(path[len(robot_path) :] for path in dof_paths)
+        for robot_path, dof_paths in zip(robot_paths, articulation.dof_paths)
+    }
+    if len(layouts) > 1:
+        logger.info("Robots %s do not share one joint layout; driving them one view per robot.", robot_paths)
+        _batch_articulation_cache[robot_paths] = (None, [])
+        return None, []
+    dof_path_to_idx = [{p: i for i, p in enumerate(dof_paths)} for dof_paths in articulation.dof_paths]
+    _batch_articulation_cache[robot_paths] = (articulation, dof_path_to_idx)
+    return articulation, dof_path_to_idx
+
+
+class RobotPoseBatch:
+    """Apply joint states to many robots at once.
+
+    Joint prims, drive instances and DOF indices are resolved once and
+    reused by every :meth:`apply` call, so posing many robots (for example
+    replaying a named pose across cloned environments) does not pay the
+    per-robot and per-joint lookups of :func:`apply_joint_state`.
+
+    When simulation is stopped the joint attributes of every robot are
+    converted to native units as one array and written in a single
+    ``Sdf.ChangeBlock``, then the body transforms of each robot are
+    propagated through its kinematic tree, which is built once per batch.
+    When simulation is running the DOF targets of every robot are sent in
+    one call on an Articulation wrapping all robots. That requires every
+    robot to have the same joint layout (for example clones of one asset);
+    otherwise each robot is driven through its own Articulation.
+
+    Create a new batch when joints or links are added to or removed from
+    the robots.
+
+    Args:
+        stage: USD stage containing the robots.
+        robot_prims: Robot root prims (must carry IsaacRobotAPI), in the
+            order poses are passed to :meth:`apply`.
+    """
+
+    def __init__(self, stage: Usd.Stage, robot_prims: Sequence[Usd.Prim]) -> None:
+        self._stage = stage
+        self._robot_prims = list(robot_prims)
+        self._robot_paths = tuple(str(prim.GetPath()) for prim in self._robot_prims)
+        self._chains: list[KinematicChain | None] = [None] * len(self._robot_prims)
+        self._drive_instances: dict[str, str | None] = {}
+        self._attribute_decls: dict[str, tuple[Sdf.ValueTypeName, bool]] = {}
+
+    def __len__(self) -> int:
+        return len(self._robot_prims)
+
+    @property
+    def stage(self) -> Usd.Stage:
+        """The USD stage."""
+        return self._stage
+
+    @property
+    def robot_prims(self) -> list[Usd.Prim]:
+        """The robot root prims, in pose order."""
+        return list(self._robot_prims)
+
+    def apply(self, poses: Sequence[dict[str, float] | PoseResult | None]) -> None:
+        """Apply one joint state to every robot.
+
+        Teleports when simulation is stopped, drives via joint targets when running.
+
+        Args:
+            poses: One entry per robot: a mapping of joint prim path to value
+                (radians or meters), a :class:`PoseResult`, or None to leave
+                the robot unchanged. A ``PoseResult`` with ``success=False``
+                leaves its robot unchanged and logs a warning, as in
+                :meth:`RobotPoser.apply_pose`.
+
+        Raises:
+            ValueError: When the number of poses does not match the number of robots.
+        """
+        if len(poses) != len(self._robot_prims):
+            raise ValueError(f"Expected {len(self._robot_prims)} poses, one per robot, got {len(poses)}")
+
+        joint_dicts: list[dict[str, float]] = []
+        for robot_path, pose in zip(self._robot_paths, poses):
+            if isinstance(pose, PoseResult):
+                if not pose.success:
+                    logger.warning("RobotPoseBatch.apply: skipping a failed PoseResult for %s.", robot_path)
+                    pose = None
+                else:
+                    pose = pose.joints
+            joint_dicts.append(pose or {})
+        if not any(joint_dicts):
+            return
+
+        if _is_simulation_running():
+            self._drive(joint_dicts)
+        else:
+            self._teleport(joint_dicts)
+
+    def apply_named_pose(self, pose_name: str | Sequence[str]) -> list[bool]:
+        """Apply a stored named pose to every robot.
+
+        Args:
+            pose_name: Name of the pose stored on every robot, or one name
+                per robot. Sanitized to a valid USD identifier using the same
+                rules as :func:`store_named_pose`.
+
+        Returns:
+            Per robot, True if the pose was found and applied.
+
+        Raises:
+            ValueError: When a list of names does not have one name per robot.
+        """
+        names = [pose_name] * len(self._robot_prims) if isinstance(pose_name, str) else list(pose_name)
+        if len(names) != len(self._robot_prims):
+            raise ValueError(f"Expected {len(self._robot_prims)} pose names, one per robot, got {len(names)}")
+        poses = [get_named_pose(self._stage, robot_prim, name) for robot_prim, name in zip(self._robot_prims, names)]
+        applied = [pose is not None and pose.success for pose in poses]
+        self.apply([pose.joints if ok else None for pose, ok in zip(poses, applied)])
+        return applied
+
+    def _drive_instance(self, joint_path: str) -> str | None:
+        """Return the drive instance of a joint, resolved once per batch.
+
+        Args:
+            joint_path: Prim path of the joint.
+
+        Returns:
+            ``"angular"`` for revolute joints, ``"linear"`` for prismatic
+            joints, or None for missing prims and other joint types.
+        """
+        try:
+            return self._drive_instances[joint_path]
+        except KeyError:
+            pass
+        prim = self._stage.GetPrimAtPath(joint_path)
+        instance = None
+        if prim and prim.IsValid():
+            if _joint_is_revolute(prim):
+                instance = "angular"
+            elif _joint_is_prismatic(prim):
+                instance = "linear"
+        self._drive_instances[joint_path] = instance
+        return instance
+
+    def _attribute_decl(self, joint_path: str, attr_name: str) -> tuple[Sdf.ValueTypeName, bool]:
+        """Return the type and custom flag for authoring a joint attribute, resolved once per batch.
+
+        Attributes defined by an applied schema (e.g. a drive) are authored as
+        non-custom with their schema type, matching what ``Usd.Attribute.Set``
+        writes in :meth:`KinematicChain.teleport`; missing attributes are
+        created as custom Float attributes.
+
+        Args:
+            joint_path: Prim path of the joint.
+            attr_name: Attribute name.
+
+        Returns:
+            Tuple of (value type name, whether the spec declares a custom attribute).
+        """
+        key = f"{joint_path}.{attr_name}"
+        try:
+            return self._attribute_decls[key]
+        except KeyError:
+            pass
+        attr = self._stage.GetPrimAtPath(joint_path).GetAttribute(attr_name)
+        if attr:
+            decl = (attr.GetTypeName(), attr.IsCustom())
+        else:
+            decl = (Sdf.ValueTypeNames.Float, True)
+        self._attribute_decls[key] = decl
+        return decl
+
+    def _teleport(self, joint_dicts: list[dict[str, float]]) -> None:
+        """Write the joint attributes of all robots in one change block, then propagate FK per robot.
+
+        Args:
+            joint_dicts: Joint prim path to value (radians or meters), per robot.
+        """
+        joint_paths = [joint_path for joint_dict in joint_dicts for joint_path in joint_dict]
+        instances = [self._drive_instance(joint_path) for joint_path in joint_paths]
+        values = np.fromiter(
+            (value for joint_dict in joint_dicts for value in joint_dict.values()), dtype=float, count=len(joint_paths)
+        )
+        native_values = np.where([instance == "angular" for instance in instances], np.degrees(values), values)
+        # Composed attributes are queried before the change block, where the stage is not recomposed
+        writes = [
+            (joint_path, attr_name, *self._attribute_decl(joint_path, attr_name), value)
+            for joint_path, instance, value in zip(joint_paths, instances, native_values.tolist())
+            if instance is not None
+            for attr_name in (f"drive:{instance}:physics:targetPosition", f"state:{instance}:physics:position")
+        ]
+
+        edit_target = self._stage.GetEditTarget()
+        layer = edit_target.GetLayer()
+        with Sdf.ChangeBlock():
+            for joint_path, attr_name, type_name, custom, value in writes:
+                spec = Sdf.CreatePrimInLayer(layer, edit_target.MapToSpecPath(Sdf.Path(joint_path)))
+                attr_spec = spec.attributes.get(attr_name)
+                if attr_spec is None:
+                    attr_spec = Sdf.AttributeSpec(
+                        spec, attr_name, type_name, Sdf.VariabilityVarying, declaresCustom=custom
+                    )
+                attr_spec.default = value
+
+        # Body transforms are read back while they are propagated, so they cannot share the change block
+        for i, joint_dict in enumerate(joint_dicts):
+            if not joint_dict:
+                continue
+            chain = self._chains[i]
+            if chain is None:
+                chain = self._chains[i] = KinematicChain(self._stage, self._robot_prims[i])
+            if chain.tree_root is None:
+                continue
+            old_transforms: dict[str, Any] = {}
+            _read_subtree_transforms(chain.tree_root, old_transforms)
+            for child in chain.tree_root.children:
+                _fk_propagate_node(self._stage, child, joint_dict, old_transforms, affected=False)
+
+    def _drive(self, joint_dicts: list[dict[str, float]]) -> None:
+        """Send the DOF targets of all robots in one call (simulation running).
+
+        Args:
+            joint_dicts: Joint prim path to value (radians or meters), per robot.
+        """
+        articulation, dof_path_to_idx = _get_batch_articulation(self._robot_paths)
+        if articulation is None:
+            for robot_prim, joint_dict in zip(self._robot_prims, joint_dicts):
+                if joint_dict:
+                    _drive_robot(self._stage, robot_prim, joint_dict)
+            return
+
+        robot_indices = [i for i, joint_dict in enumerate(joint_dicts) if joint_dict]
+        rows: list[int] = []
+        dof_indices: list[int] = []
+        positions: list[float] = []
+        for row, i in enumerate(robot_indices):
+            path_to_idx = dof_path_to_idx[i]
+            for joint_path, value in joint_dicts[i].items():
+                idx = path_to_idx.get(joint_path)
+                if idx is not None:
+                    rows.append(row)
+                    dof_indices.append(idx)
+                    positions.append(float(value))
+
+        if positions:
+            # DOFs missing from a pose keep their current targets
+            targets = articulation.get_dof_position_targets(indices=robot_indices).numpy()
+            targets[rows, dof_indices] = positions
+            articulation.set_dof_position_targets(targets, indices=robot_indices)
+
+
+def apply_joint_states(
+    stage: Usd.Stage,
+    robot_prims: Sequence[Usd.Prim],
+    joint_dicts: Sequence[dict[str, float]],
+) -> None:
+    """Apply one joint-state dictionary to each of many robots.
+
+    Batched equivalent of :func:`apply_joint_state`; see
+    :class:`RobotPoseBatch`, which should be kept and reused when the same
+    robots are posed repeatedly.
+
+    Args:
+        stage: USD stage.
+        robot_prims: Robot root prims (must carry IsaacRobotAPI).
+        joint_dicts: Joint prim path to value (radians or meters), one per robot.
+    """
+    RobotPoseBatch(stage, robot_prims).apply(joint_dicts)
+
+
 # ---------------------------------------------------------------------------
 # FR-11, FR-12, FR-21: Named-Pose Storage
 # ---------------------------------------------------------------------------
@@ -1136,13 +1572,14 @@ def export_poses(
     """
     names = list_named_poses(stage, robot_prim)
     data: dict = {}
+    revolute: dict[str, bool] = {}
     for name in names:
         pose = get_named_pose(stage, robot_prim, name)
         if pose is not None:
             joints = pose.joints
             if degrees:
                 joints = {
-                    p: float(np.degrees(v)) if _joint_is_revolute(stage.GetPrimAtPath(p)) else v
+                    p: float(np.degrees(v)) if _is_revolute_cached(stage, p, revolute) else v
                     for p, v in joints.items()
                 }
             data[name] = {
@@ -1164,20 +1601,15 @@ def export_poses(
     return True
 
 
-def import_poses(
-    stage: Usd.Stage,
-    robot_prim: Usd.Prim,
-    filepath: str,
-) -> int:
-    """Import named poses from a JSON file and store them on robot_prim.
+def _read_poses_json(stage: Usd.Stage, filepath: str) -> dict[str, PoseResult]:
+    """Read the poses of a JSON file written by :func:`export_poses`.
 
     Args:
-        stage: USD stage.
-        robot_prim: Robot root prim.
-        filepath: Source file path (as written by export_poses).
+        stage: USD stage used to look up which joints are revolute.
+        filepath: Source file path.
 
     Returns:
-        Number of poses successfully imported.
+        Pose name to PoseResult, with revolute joint values in radians.
     """
     with open(filepath) as fh:
         raw = json.load(fh)
@@ -1190,14 +1622,15 @@ def import_poses(
         units = "radians"
         data = raw
 
-    count = 0
+    revolute: dict[str, bool] = {}
+    poses: dict[str, PoseResult] = {}
     for name, pd in data.items():
         joints = pd.get("joints", {})
         if units == "degrees":
             joints = {
-                p: float(np.radians(v)) if _joint_is_revolute(stage.GetPrimAtPath(p)) else v for p, v in joints.items()
+                p: float(np.radians(v)) if _is_revolute_cached(stage, p, revolute) else v for p, v in joints.items()
             }
-        result = PoseResult(
+        poses[name] = PoseResult(
             success=pd.get("valid", True),
             joints=joints,
             joint_fixed=pd.get("joint_fixed", {}),
@@ -1206,6 +1639,479 @@ def import_poses(
             target_position=pd.get("target_position"),
             target_orientation=pd.get("target_orientation"),
         )
+    return poses
+
+
+def import_poses(
+    stage: Usd.Stage,
+    robot_prim: Usd.Prim,
+    filepath: str,
+) -> int:
+    """Import named poses from a JSON file and store them on robot_prim.
+
+    Args:
+        stage: USD stage.
+        robot_prim: Robot root prim.
+        filepath: Source file path (as written by export_poses).
+
+    Returns:
+        Number of poses successfully imported.
+    """
+    count = 0
+    for name, result in _read_poses_json(stage, filepath).items():
         if store_named_pose(stage, robot_prim, name, result):
             count += 1
     return count
+
+
+# ---------------------------------------------------------------------------
+# FR-16: Columnar Pose Library
+# ---------------------------------------------------------------------------
+
+_POSE_LIBRARY_NAMES = "isaac:robot:poseLibrary:names"
+_POSE_LIBRARY_JOINTS = "isaac:robot:poseLibrary:joints"
+_POSE_LIBRARY_JOINT_VALUES = "isaac:robot:poseLibrary:jointValues"
+_POSE_LIBRARY_JOINT_FIXED = "isaac:robot:poseLibrary:jointFixed"
+_POSE_LIBRARY_LINKS = "isaac:robot:poseLibrary:links"
+_POSE_LIBRARY_START_LINKS = "isaac:robot:poseLibrary:startLinks"
+_POSE_LIBRARY_END_LINKS = "isaac:robot:poseLibrary:endLinks"
+_POSE_LIBRARY_TARGETS = "isaac:robot:poseLibrary:targets"
+
+# Layout version of the files written by PoseLibrary.export_file
+_POSE_LIBRARY_FILE_VERSION = 1
+
+
+def _read_library_array(prim: Usd.Prim, name: str, dtype: type, shape: tuple[int, ...]) -> np.ndarray:
+    """Read an array attribute of the pose library scope into a writable array.
+
+    Args:
+        prim: Pose library scope prim.
+        name: Attribute name.
+        dtype: Array dtype.
+        shape: Expected shape; the flat attribute value is reshaped to it.
+
+    Returns:
+        The attribute value with the given shape; an unauthored attribute reads as empty.
+
+    Raises:
+        ValueError: When the attribute holds a different number of elements.
+    """
+    attr = prim.GetAttribute(name)
+    value = attr.Get() if attr else None
+    array = np.array(value if value is not None else [], dtype=dtype)
+    if array.size != int(np.prod(shape)):
+        raise ValueError(
+            f"Pose library attribute {prim.GetPath()}.{name} holds {array.size} values, expected shape {shape}"
+        )
+    return array.reshape(shape)
+
+
+class PoseLibrary:
+    """Columnar named-pose store for large pose libraries.
+
+    Where :func:`store_named_pose` creates one IsaacNamedPose prim per pose,
+    the library keeps every pose of a robot in a few array-valued attributes
+    on a single ``PoseLibrary`` scope under the robot:
+
+    - ``isaac:robot:poseLibrary:names``: pose names, which index the rows.
+    - ``isaac:robot:poseLibrary:joints``: relationship to the joint columns.
+    - ``isaac:robot:poseLibrary:jointValues``: rows x columns joint values in
+      native units (degrees for revolute joints), NaN where a pose does not
+      set the joint.
+    - ``isaac:robot:poseLibrary:jointFixed``: rows x columns fixed flags.
+    - ``isaac:robot:poseLibrary:links``: relationship to the start and end
+      links, indexed per row by ``startLinks`` and ``endLinks`` (-1 if unset).
+    - ``isaac:robot:poseLibrary:targets``: rows x 7 end-link target position
+      and orientation (w, x, y, z), NaN when the pose has no target.
+
+    The attributes are read on first access and a :class:`PoseResult` is
+    built only for the name that is looked up. Edits rewrite the whole
+    library, so group them into one :meth:`update` or :meth:`remove` call.
+    Pose names are stored as given, without the sanitizing applied by
+    :func:`store_named_pose`. The library is separate from the per-prim named
+    poses: :func:`list_named_poses` and :func:`get_named_pose` do not see it.
+
+    Create a new library object after the attributes were edited by other means.
+
+    Args:
+        stage: USD stage.
+        robot_prim: Robot root prim.
+    """
+
+    def __init__(self, stage: Usd.Stage, robot_prim: Usd.Prim) -> None:
+        self._stage = stage
+        self._robot_prim = robot_prim
+        self._loaded = False
+        self._names: list[str] = []
+        self._rows: dict[str, int] = {}
+        self._joint_paths: list[str] = []
+        self._revolute = np.zeros(0, dtype=bool)
+        self._values = np.zeros((0, 0), dtype=np.float32)
+        self._fixed = np.zeros((0, 0), dtype=bool)
+        self._link_paths: list[str] = []
+        self._start_links = np.zeros(0, dtype=np.int32)
+        self._end_links = np.zeros(0, dtype=np.int32)
+        self._targets = np.zeros((0, 7), dtype=np.float64)
+
+    def __len__(self) -> int:
+        self._load()
+        return len(self._names)
+
+    def __contains__(self, pose_name: object) -> bool:
+        self._load()
+        return pose_name in self._rows
+
+    @property
+    def stage(self) -> Usd.Stage:
+        """The USD stage."""
+        return self._stage
+
+    @property
+    def robot_prim(self) -> Usd.Prim:
+        """The robot root prim."""
+        return self._robot_prim
+
+    @property
+    def names(self) -> list[str]:
+        """Names of all poses in the library, in storage order."""
+        self._load()
+        return list(self._names)
+
+    def get(self, pose_name: str) -> PoseResult | None:
+        """Retrieve a pose from the library.
+
+        Args:
+            pose_name: Name of the pose.
+
+        Returns:
+            PoseResult with revolute joint values in radians, or None when the
+            library has no pose with that name.
+        """
+        self._load()
+        row = self._rows.get(pose_name)
+        if row is None:
+            return None
+        values = self._values[row].astype(np.float64)
+        values = np.where(self._revolute, np.radians(values), values)
+        joints: dict[str, float] = {}
+        joint_fixed: dict[str, bool] = {}
+        for col in np.flatnonzero(~np.isnan(values)):
+            joint_path = self._joint_paths[col]
+            joints[joint_path] = float(values[col])
+            joint_fixed[joint_path] = bool(self._fixed[row, col])
+        start_link = int(self._start_links[row])
+        end_link = int(self._end_links[row])
+        target = self._targets[row]
+        has_target = not np.isnan(target).any()
+        return PoseResult(
+            success=True,
+            joints=joints,
+            joint_fixed=joint_fixed,
+            start_link=self._link_paths[start_link] if start_link >= 0 else "",
+            end_link=self._link_paths[end_link] if end_link >= 0 else "",
+            target_position=target[:3].tolist() if has_target else None,
+            target_orientation=target[3:].tolist() if has_target else None,
+        )
+
+    def update(self, poses: Mapping[str, PoseResult | None]) -> int:
+        """Add poses to the library, replacing poses with the same name.
+
+        Args:
+            poses: Pose name to PoseResult. Entries that are None or have
+                ``success=False`` are skipped, as in :func:`store_named_pose`.
+
+        Returns:
+            Number of poses stored.
+        """
+        results = [(name, result) for name, result in poses.items() if result is not None and result.success]
+        if not results:
+            return 0
+
+        joint_paths = list(dict.fromkeys(path for _, result in results for path in result.joints))
+        columns = {path: col for col, path in enumerate(joint_paths)}
+        link_paths = list(
+            dict.fromkeys(link for _, result in results for link in (result.start_link, result.end_link) if link)
+        )
+        link_index = {path: i for i, path in enumerate(link_paths)}
+
+        values = np.full((len(results), len(joint_paths)), np.nan)
+        fixed = np.zeros(values.shape, dtype=bool)
+        targets = np.full((len(results), 7), np.nan)
+        for row, (_, result) in enumerate(results):
+            for joint_path, value in result.joints.items():
+                values[row, columns[joint_path]] = value
+            for joint_path, is_fixed in result.joint_fixed.items():
+                if joint_path in result.joints:
+                    fixed[row, columns[joint_path]] = is_fixed
+            if result.target_position is not None and result.target_orientation is not None:
+                targets[row, :3] = result.target_position
+                targets[row, 3:] = result.target_orientation
+
+        self._merge(
+            [name for name, _ in results],
+            joint_paths,
+            values,
+            fixed,
+            link_paths,
+            np.array([link_index.get(result.start_link, -1) for _, result in results], dtype=np.int32),
+            np.array([link_index.get(result.end_link, -1) for _, result in results], dtype=np.int32),
+            targets,
+        )
+        return len(results)
+
+    def remove(self, pose_names: Iterable[str]) -> int:
+        """Remove poses from the library.
+
+        Args:
+            pose_names: Names of the poses to remove; unknown names are ignored.
+
+        Returns:
+            Number of poses removed.
+        """
+        self._load()
+        rows = {self._rows[name] for name in pose_names if name in self._rows}
+        if not rows:
+            return 0
+        keep = np.ones(len(self._names), dtype=bool)
+        keep[list(rows)] = False
+        self._names = [name for name, kept in zip(self._names, keep) if kept]
+        self._rows = {name: row for row, name in enumerate(self._names)}
+        self._values = self._values[keep]
+        self._fixed = self._fixed[keep]
+        self._start_links = self._start_links[keep]
+        self._end_links = self._end_links[keep]
+        self._targets = self._targets[keep]
+        self._write()
+        return len(rows)
+
+    def export_file(self, filepath: str) -> None:
+        """Write the library to a NumPy ``.npz`` file.
+
+        The file holds the library columns with revolute joint values in radians.
+
+        Args:
+            filepath: Destination file path, written as given.
+        """
+        self._load()
+        values = self._values.astype(np.float64)
+        values = np.where(self._revolute, np.radians(values), values)
+        with open(filepath, "wb") as fh:
+            np.savez(
+                fh,
+                version=np.int32(_POSE_LIBRARY_FILE_VERSION),
+                names=np.array(self._names, dtype=str),
+                joints=np.array(self._joint_paths, dtype=str),
+                joint_values=values,
+                joint_fixed=self._fixed,
+                links=np.array(self._link_paths, dtype=str),
+                start_links=self._start_links,
+                end_links=self._end_links,
+                targets=self._targets,
+            )
+
+    def import_file(self, filepath: str) -> int:
+        """Add the poses of a file to the library, replacing poses with the same name.
+
+        Args:
+            filepath: A ``.npz`` file written by :meth:`export_file`, or a
+                ``.json`` file written by :func:`export_poses`.
+
+        Returns:
+            Number of poses imported.
+
+        Raises:
+            ValueError: When the ``.npz`` file was written by a newer layout version.
+        """
+        if filepath.lower().endswith(".json"):
+            return self.update(_read_poses_json(self._stage, filepath))
+
+        with np.load(filepath, allow_pickle=False) as data:
+            version = int(data["version"])
+            if version > _POSE_LIBRARY_FILE_VERSION:
+                raise ValueError(f"Pose library file {filepath} has unsupported version {version}")
+            names = data["names"].tolist()
+            num_joints = len(data["joints"])
+            self._merge(
+                names,
+                data["joints"].tolist(),
+                data["joint_values"].reshape(len(names), num_joints),
+                data["joint_fixed"].reshape(len(names), num_joints),
+                data["links"].tolist(),
+                data["start_links"].astype(np.int32),
+                data["end_links"].astype(np.int32),
+                data["targets"].reshape(len(names), 7),
+            )
+        return len(names)
+
+    def _scope_path(self) -> Sdf.Path:
+        """Path of the scope holding the library attributes."""
+        return self._robot_prim.GetPath().AppendChild(POSE_LIBRARY_SCOPE)
+
+    def _revolute_mask(self, joint_paths: Sequence[str]) -> np.ndarray:
+        """Return which of the joints are revolute."""
+        revolute: dict[str, bool] = {}
+        return np.array([_is_revolute_cached(self._stage, path, revolute) for path in joint_paths], dtype=bool)
+
+    def _load(self) -> None:
+        """Read the library attributes once."""
+        if self._loaded:
+            return
+        self._loaded = True
+        prim = self._stage.GetPrimAtPath(self._scope_path())
+        if not prim or not prim.IsValid():
+            return
+
+        names_attr = prim.GetAttribute(_POSE_LIBRARY_NAMES)
+        names = names_attr.Get() if names_attr else None
+        self._names = list(names) if names is not None else []
+        self._rows = {name: row for row, name in enumerate(self._names)}
+        joints_rel = prim.GetRelationship(_POSE_LIBRARY_JOINTS)
+        self._joint_paths = [str(p) for p in joints_rel.GetTargets()] if joints_rel else []
+        links_rel = prim.GetRelationship(_POSE_LIBRARY_LINKS)
+        self._link_paths = [str(p) for p in links_rel.GetTargets()] if links_rel else []
+        self._revolute = self._revolute_mask(self._joint_paths)
+
+        shape = (len(self._names), len(self._joint_paths))
+        self._values = _read_library_array(prim, _POSE_LIBRARY_JOINT_VALUES, np.float32, shape)
+        self._fixed = _read_library_array(prim, _POSE_LIBRARY_JOINT_FIXED, bool, shape)
+        self._start_links = _read_library_array(prim, _POSE_LIBRARY_START_LINKS, np.int32, shape[:1])
+        self._end_links = _read_library_array(prim, _POSE_LIBRARY_END_LINKS, np.int32, shape[:1])
+        self._targets = _read_library_array(prim, _POSE_LIBRARY_TARGETS, np.float64, (shape[0], 7))
+
+    def _merge(
+        self,
+        names: list[str],
+        joint_paths: list[str],
+        values: np.ndarray,
+        fixed: np.ndarray,
+        link_paths: list[str],
+        start_links: np.ndarray,
+        end_links: np.ndarray,
+        targets: np.ndarray,
+    ) -> None:
+        """Insert or replace rows given in the column layout, then write the library.
+
+        Args:
+            names: Pose name per row.
+            joint_paths: Joint path per column of ``values`` and ``fixed``.
+            values: Rows x columns joint values in radians or meters, NaN where unset.
+            fixed: Rows x columns fixed flags.
+            link_paths: Link paths indexed by ``start_links`` and ``end_links``.
+            start_links: Start link index per row, -1 if unset.
+            end_links: End link index per row, -1 if unset.
+            targets: Rows x 7 target position and orientation, NaN if unset.
+        """
+        self._load()
+
+        columns = {path: col for col, path in enumerate(self._joint_paths)}
+        new_joints = [path for path in dict.fromkeys(joint_paths) if path not in columns]
+        if new_joints:
+            columns.update((path, col) for col, path in enumerate(new_joints, start=len(self._joint_paths)))
+            self._joint_paths.extend(new_joints)
+            self._revolute = np.concatenate([self._revolute, self._revolute_mask(new_joints)])
+            padding = ((0, 0), (0, len(new_joints)))
+            self._values = np.pad(self._values, padding, constant_values=np.nan)
+            self._fixed = np.pad(self._fixed, padding, constant_values=False)
+        cols = np.array([columns[path] for path in joint_paths], dtype=np.intp)
+
+        link_index = {path: i for i, path in enumerate(self._link_paths)}
+        for path in link_paths:
+            if path not in link_index:
+                link_index[path] = len(self._link_paths)
+                self._link_paths.append(path)
+        # The trailing -1 maps unset links (index -1) to -1
+        link_lut = np.array([link_index[path] for path in link_paths] + [-1], dtype=np.int32)
+
+        num_rows = len(self._names)
+        rows = np.empty(len(names), dtype=np.intp)
+        for i, name in enumerate(names):
+            row = self._rows.get(name)
+            if row is None:
+                row = self._rows[name] = len(self._names)
+                self._names.append(name)
+            rows[i] = row
+        added = len(self._names) - num_rows
+        if added:
+            num_cols = len(self._joint_paths)
+            self._values = np.concatenate([self._values, np.full((added, num_cols), np.nan, dtype=np.float32)])
+            self._fixed = np.concatenate([self._fixed, np.zeros((added, num_cols), dtype=bool)])
+            self._start_links = np.concatenate([self._start_links, np.full(added, -1, dtype=np.int32)])
+            self._end_links = np.concatenate([self._end_links, np.full(added, -1, dtype=np.int32)])
+            self._targets = np.concatenate([self._targets, np.full((added, 7), np.nan)])
+
+        # Replaced poses drop the joints they do not set
+        self._values[rows] = np.nan
+        self._values[rows[:, None], cols] = np.where(self._revolute[cols], np.degrees(values), values)
+        self._fixed[rows] = False
+        self._fixed[rows[:, None], cols] = fixed
+        self._start_links[rows] = link_lut[start_links]
+        self._end_links[rows] = link_lut[end_links]
+        self._targets[rows] = targets
+        self._write()
+
+    def _write(self) -> None:
+        """Author every library attribute from the in-memory columns."""
+        prim = self._stage.GetPrimAtPath(self._scope_path())
+        if not prim or not prim.IsValid():
+            prim = self._stage.DefinePrim(self._scope_path(), "Scope")
+
+        prim.CreateAttribute(_POSE_LIBRARY_NAMES, Sdf.ValueTypeNames.StringArray).Set(Vt.StringArray(self._names))
+        prim.CreateRelationship(_POSE_LIBRARY_JOINTS).SetTargets([Sdf.Path(p) for p in self._joint_paths])
+        prim.CreateAttribute(_POSE_LIBRARY_JOINT_VALUES, Sdf.ValueTypeNames.FloatArray).Set(
+            Vt.FloatArray.FromNumpy(self._values.ravel())
+        )
+        prim.CreateAttribute(_POSE_LIBRARY_JOINT_FIXED, Sdf.ValueTypeNames.BoolArray).Set(
+            Vt.BoolArray.FromNumpy(self._fixed.ravel())
+        )
+        prim.CreateRelationship(_POSE_LIBRARY_LINKS).SetTargets([Sdf.Path(p) for p in self._link_paths])
+        prim.CreateAttribute(_POSE_LIBRARY_START_LINKS, Sdf.ValueTypeNames.IntArray).Set(
+            Vt.IntArray.FromNumpy(self._start_links)
+        )
+        prim.CreateAttribute(_POSE_LIBRARY_END_LINKS, Sdf.ValueTypeNames.IntArray).Set(
+            Vt.IntArray.FromNumpy(self._end_links)
+        )
+        prim.CreateAttribute(_POSE_LIBRARY_TARGETS, Sdf.ValueTypeNames.DoubleArray).Set(
+            Vt.DoubleArray.FromNumpy(self._targets.ravel())
+        )
+
+
+def export_pose_library(
+    stage: Usd.Stage,
+    robot_prim: Usd.Prim,
+    filepath: str,
+) -> bool:
+    """Export the pose library of robot_prim to a NumPy ``.npz`` file.
+
+    See :meth:`PoseLibrary.export_file`.
+
+    Args:
+        stage: USD stage.
+        robot_prim: Robot root prim.
+        filepath: Destination file path.
+
+    Returns:
+        True on success.
+    """
+    PoseLibrary(stage, robot_prim).export_file(filepath)
+    return True
+
+
+def import_pose_library(
+    stage: Usd.Stage,
+    robot_prim: Usd.Prim,
+    filepath: str,
+) -> int:
+    """Import poses from a file into the pose library of robot_prim.
+
+    See :meth:`PoseLibrary.import_file`.
+
+    Args:
+        stage: USD stage.
+        robot_prim: Robot root prim.
+        filepath: Source ``.npz`` (as written by export_pose_library) or
+            ``.json`` (as written by export_poses) file path.
+
+    Returns:
+        Number of poses imported.
+    """
+    return PoseLibrary(stage, robot_prim).import_file(filepath)
@@ -26,12 +26,19 @@ import omni.kit.test
 import omni.usd
 from isaacsim.robot.poser.robot_poser import (
     NAMED_POSES_SCOPE,
+    POSE_LIBRARY_SCOPE,
+    PoseLibrary,
     PoseResult,
+    RobotPoseBatch,
     _build_cold_start_seeds,
     _sanitize_name,
+    apply_joint_state,
+    apply_joint_states,
     delete_named_pose,
+    export_pose_library,
     export_poses,
     get_named_pose,
+    import_pose_library,
     import_poses,
     list_named_poses,
     store_named_pose,
@@ -43,25 +50,26 @@ from usd.schema.isaac.robot_schema import utils as robot_utils
 from usd.schema.isaac.robot_schema.math import Joint, Transform
 
 
-def _create_test_robot(stage: Usd.Stage) -> tuple[Usd.Prim, Usd.Prim, Usd.Prim]:
+def _create_test_robot(stage: Usd.Stage, robot_path: str = "/World/Robot") -> tuple[Usd.Prim, Usd.Prim, Usd.Prim]:
     """Create a two-link robot with a revolute joint and RobotAPI.
 
     Shared fixture used by multiple test classes.
 
     Args:
         stage: USD stage to define prims on.
+        robot_path: Path of the robot root prim.
 
     Returns:
         Tuple of (robot_prim, link1_prim, joint_prim).
     """
-    robot_xform = UsdGeom.Xform.Define(stage, "/World/Robot")
+    robot_xform = UsdGeom.Xform.Define(stage, robot_path)
     UsdPhysics.RigidBodyAPI.Apply(robot_xform.GetPrim())
     UsdPhysics.ArticulationRootAPI.Apply(robot_xform.GetPrim())
 
-    link1 = UsdGeom.Xform.Define(stage, "/World/Robot/Link1")
+    link1 = UsdGeom.Xform.Define(stage, f"{robot_path}/Link1")
     UsdPhysics.RigidBodyAPI.Apply(link1.GetPrim())
 
-    joint = UsdPhysics.RevoluteJoint.Define(stage, "/World/Robot/joint1")
+    joint = UsdPhysics.RevoluteJoint.Define(stage, f"{robot_path}/joint1")
     joint.CreateBody0Rel().SetTargets([robot_xform.GetPrim().GetPath()])
     joint.CreateBody1Rel().SetTargets([link1.GetPrim().GetPath()])
     joint.CreateAxisAttr("X")
@@ -466,6 +474,134 @@ class TestNamedPoseImportExport(omni.kit.test.AsyncTestCase):
             os.unlink(path)
 
 
+class TestPoseLibrary(omni.kit.test.AsyncTestCase):
+    """Tests for the columnar PoseLibrary and its file import/export."""
+
+    async def setUp(self) -> None:
+        """Create a fresh USD stage and the test robot before each test."""
+        await omni.usd.get_context().new_stage_async()
+        await omni.kit.app.get_app().next_update_async()
+        self._stage = omni.usd.get_context().get_stage()
+        self._robot_prim, _, _ = _create_test_robot(self._stage)
+
+    def _make_pose(self, angle: float, *, fixed: bool = False, target: bool = True) -> PoseResult:
+        """Return a valid PoseResult setting joint1 to ``angle`` radians.
+
+        Args:
+            angle: Joint value in radians.
+            fixed: Fixed flag of the joint.
+            target: If False, the pose has no end-link target.
+
+        Returns:
+            A successful PoseResult.
+        """
+        return PoseResult(
+            success=True,
+            joints={"/World/Robot/joint1": angle},
+            joint_fixed={"/World/Robot/joint1": fixed},
+            start_link="/World/Robot",
+            end_link="/World/Robot/Link1",
+            target_position=[0.5, 0.25, 0.0] if target else None,
+            target_orientation=[1.0, 0.0, 0.0, 0.0] if target else None,
+        )
+
+    def _assert_same_pose(self, actual: PoseResult | None, expected: PoseResult | None) -> None:
+        """Assert two pose results match, joint values to float32 precision.
+
+        Args:
+            actual: Pose to check.
+            expected: Reference pose.
+        """
+        self.assertIsNotNone(actual)
+        self.assertIsNotNone(expected)
+        self.assertEqual(actual.success, expected.success)
+        self.assertEqual(actual.joints.keys(), expected.joints.keys())
+        for joint_path, value in expected.joints.items():
+            self.assertAlmostEqual(actual.joints[joint_path], value, places=6)
+        self.assertEqual(actual.joint_fixed, expected.joint_fixed)
+        self.assertEqual(actual.start_link, expected.start_link)
+        self.assertEqual(actual.end_link, expected.end_link)
+        self.assertEqual(actual.target_position, expected.target_position)
+        self.assertEqual(actual.target_orientation, expected.target_orientation)
+
+    async def test_library_matches_named_poses(self) -> None:
+        """Poses read back from the library match the same poses stored as prims."""
+        poses = {
+            "home": self._make_pose(float(np.radians(45)), fixed=True),
+            "no_target": self._make_pose(-0.5, target=False),
+            "grasp:7": self._make_pose(1.25),
+        }
+        for name, pose in poses.items():
+            store_named_pose(self._stage, self._robot_prim, name, pose)
+
+        library = PoseLibrary(self._stage, self._robot_prim)
+        self.assertEqual(library.update(poses), 3)
+        self.assertTrue(self._stage.GetPrimAtPath(f"/World/Robot/{POSE_LIBRARY_SCOPE}").IsValid())
+
+        library = PoseLibrary(self._stage, self._robot_prim)
+        self.assertEqual(library.names, ["home", "no_target", "grasp:7"])
+        self.assertEqual(len(library), 3)
+        self.assertIn("grasp:7", library)
+        for name in poses:
+            self._assert_same_pose(library.get(name), get_named_pose(self._stage, self._robot_prim, name))
+        self.assertIsNone(library.get("missing"))
+        # The library stores joint values in degrees, like the named-pose prims
+        values = self._stage.GetPrimAtPath(f"/World/Robot/{POSE_LIBRARY_SCOPE}").GetAttribute(
+            "isaac:robot:poseLibrary:jointValues"
+        )
+        self.assertAlmostEqual(values.Get()[0], 45.0, places=4)
+        self.assertEqual(sorted(list_named_poses(self._stage, self._robot_prim)), ["grasp_7", "home", "no_target"])
+
+    async def test_library_update_and_remove(self) -> None:
+        """Updates replace poses by name, skip failed ones, and removals drop rows."""
+        library = PoseLibrary(self._stage, self._robot_prim)
+        self.assertEqual(len(library), 0)
+        failed = PoseResult(success=False, joints={"/World/Robot/joint1": 0.1})
+        self.assertEqual(library.update({"a": self._make_pose(0.1), "b": self._make_pose(0.2), "c": failed}), 2)
+        # Joints that are not revolute joint prims are stored without unit conversion
+        gripper = self._make_pose(0.2)
+        gripper.joints.update({"/World/Robot/finger_left": 0.04, "/World/Robot/finger_right": 0.03})
+        gripper.joint_fixed.update({"/World/Robot/finger_left": True, "/World/Robot/finger_right": False})
+        self.assertEqual(library.update({"a": PoseResult(success=True), "d": None, "e": gripper}), 2)
+
+        library = PoseLibrary(self._stage, self._robot_prim)
+        self.assertEqual(library.names, ["a", "b", "e"])
+        self._assert_same_pose(library.get("a"), PoseResult(success=True))
+        self._assert_same_pose(library.get("e"), gripper)
+        self.assertEqual(library.remove(["a", "missing"]), 1)
+        self.assertEqual(library.remove(["missing"]), 0)
+
+        library = PoseLibrary(self._stage, self._robot_prim)
+        self.assertEqual(library.names, ["b", "e"])
+        self._assert_same_pose(library.get("b"), self._make_pose(0.2))
+
+    async def test_library_file_roundtrip(self) -> None:
+        """A library exported to ``.npz`` and a JSON export both import into another robot's library."""
+        poses = {f"pose_{i}": self._make_pose(0.1 * i, fixed=i % 2 == 0, target=i != 3) for i in range(5)}
+        PoseLibrary(self._stage, self._robot_prim).update(poses)
+        for name, pose in poses.items():
+            store_named_pose(self._stage, self._robot_prim, name, pose)
+        robot2, _, _ = _create_test_robot(self._stage, "/World/Robot2")
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            npz_path = os.path.join(tmp_dir, "library.npz")
+            json_path = os.path.join(tmp_dir, "poses.json")
+            self.assertTrue(export_pose_library(self._stage, self._robot_prim, npz_path))
+            self.assertTrue(export_poses(self._stage, self._robot_prim, json_path, degrees=True))
+
+            self.assertEqual(import_pose_library(self._stage, robot2, npz_path), 5)
+            library = PoseLibrary(self._stage, robot2)
+            self.assertEqual(library.names, list(poses))
+            for name, pose in poses.items():
+                self._assert_same_pose(library.get(name), pose)
+
+            library.remove(library.names)
+            self.assertEqual(import_pose_library(self._stage, robot2, json_path), 5)
+            library = PoseLibrary(self._stage, robot2)
+            for name, pose in poses.items():
+                self._assert_same_pose(library.get(name), pose)
+
+
 class TestColdStartSeedLadder(omni.kit.test.AsyncTestCase):
     """Unit tests for the multi-seed cold-start ladder used by ``RobotPoser.solve_ik``.
 
@@ -673,3 +809,249 @@ class TestColdStartSolveIK(omni.kit.test.AsyncTestCase):
             any("refusing to apply a failed PoseResult" in msg for msg in cm.output),
             f"Expected refusal warning, got: {cm.output}",
         )
+
+
+class TestBatchedIK(omni.kit.test.AsyncTestCase):
+    """Tests for the batched FK, LM solver and ``RobotPoser.solve_ik_batch``.
+
+    The batched path must reproduce the per-configuration results.  Targets
+    are generated with the chain's own FK so they are reachable; the chain
+    starts at the robot root, so chain-local and robot-base frames coincide.
+    """
+
+    async def setUp(self) -> None:
+        """Create a fresh USD stage and 1-DOF revolute robot fixture before each test."""
+        await omni.usd.get_context().new_stage_async()
+        await omni.kit.app.get_app().next_update_async()
+        self._stage = omni.usd.get_context().get_stage()
+        self._robot, self._link, self._joint = _create_test_robot(self._stage)
+
+    def _target(self, angle: float) -> Transform:
+        """Return the pose the fixture's end link reaches at joint value *angle*.
+
+        Args:
+            angle: Joint value in radians.
+
+        Returns:
+            The reachable end-link pose.
+        """
+        from isaacsim.robot.poser import RobotPoser
+
+        chain = RobotPoser(self._stage, self._robot, self._robot, self._link).chain
+        return chain.compute_fk(np.array([angle]))[0]
+
+    async def test_batched_fk_and_jacobian_match_single(self) -> None:
+        """Verify that the batched FK/Jacobian rows equal the single-configuration results."""
+        from isaacsim.robot.poser import RobotPoser
+
+        chain = RobotPoser(self._stage, self._robot, self._robot, self._link).chain
+        q = np.linspace(-2.0, 2.0, 7)[:, None]
+        t, quat, jac = chain.compute_fk_and_jacobian_batch(q)
+        for i in range(len(q)):
+            T, J = chain.compute_fk_and_jacobian(q[i])
+            np.testing.assert_allclose(t[i], T.t, atol=1e-12)
+            np.testing.assert_allclose(quat[i], T.q, atol=1e-12)
+            np.testing.assert_allclose(jac[i], J, atol=1e-12)
+
+    async def test_batched_fk_matches_compute_fk(self) -> None:
+        """Verify that batched end-effector and link poses equal the per-configuration FK on a mixed chain."""
+        from usd.schema.isaac.robot_schema.kinematic_chain import KinematicChain
+
+        parent = self._link
+        for name, joint_type, axis, pos, rot in (
+            ("2", UsdPhysics.PrismaticJoint, "Z", Gf.Vec3f(0.5, 0.0, 0.0), Gf.Quatf(1.0, 0.0, 0.0, 0.0)),
+            ("3", UsdPhysics.RevoluteJoint, "Y", Gf.Vec3f(0.0, 0.2, 0.1), Gf.Quatf(0.7071068, 0.0, 0.0, 0.7071068)),
+        ):
+            link = UsdGeom.Xform.Define(self._stage, f"/World/Robot/Link{name}").GetPrim()
+            UsdPhysics.RigidBodyAPI.Apply(link)
+            joint = joint_type.Define(self._stage, f"/World/Robot/joint{name}")
+            joint.CreateBody0Rel().SetTargets([parent.GetPath()])
+            joint.CreateBody1Rel().SetTargets([link.GetPath()])
+            joint.CreateAxisAttr(axis)
+            joint.CreateLocalPos0Attr().Set(pos)
+            joint.CreateLocalRot0Attr().Set(rot)
+            joint.CreateLocalPos1Attr().Set(Gf.Vec3f(0.0, 0.0, 0.0))
+            joint.CreateLocalRot1Attr().Set(Gf.Quatf(1.0, 0.0, 0.0, 0.0))
+            parent = link
+        robot_utils.RecalculateRobotSchema(self._stage, self._robot)
+
+        chain = KinematicChain(self._stage, self._robot, self._robot, parent)
+        self.assertEqual(len(chain.joints), 3)
+        q = np.random.default_rng(0).uniform(-1.5, 1.5, (11, 3))
+        t, quat, link_t, link_q = chain.compute_fk_batch(q, return_link_poses=True, chunk_size=4)
+        self.assertEqual((t.shape, quat.shape, link_t.shape, link_q.shape), ((11, 3), (11, 4), (11, 3, 3), (11, 3, 4)))
+        for i in range(len(q)):
+            T, link_transforms = chain.compute_fk(q[i])
+            np.testing.assert_allclose(t[i], T.t, atol=1e-12)
+            np.testing.assert_allclose(quat[i], T.q, atol=1e-12)
+            for j, link_transform in enumerate(link_transforms):
+                np.testing.assert_allclose(link_t[i, j], link_transform.t, atol=1e-12)
+                np.testing.assert_allclose(link_q[i, j], link_transform.q, atol=1e-12)
+
+        t_single, quat_single = chain.compute_fk_batch(q[5])
+        np.testing.assert_allclose(t_single[0], t[5], atol=1e-12)
+        np.testing.assert_allclose(quat_single[0], quat[5], atol=1e-12)
+        with self.assertRaises(ValueError):
+            chain.compute_fk_batch(np.zeros((2, 2)))
+
+    async def test_ik_lm_batch_matches_ik_lm(self) -> None:
+        """Verify that every row of the batched LM solve follows the scalar solver."""
+        from isaacsim.robot.poser import RobotPoser
+        from usd.schema.isaac.robot_schema.lm_ik import ik_lm, ik_lm_batch
+
+        chain = RobotPoser(self._stage, self._robot, self._robot, self._link).chain
+        seeds = np.array([[0.0], [1.5], [-2.5], [0.29]])
+        targets = [self._target(angle) for angle in (0.3, -0.7, 1.1, 0.3)]
+        q_batch = ik_lm_batch(chain, seeds, targets)
+        for seed, target, q in zip(seeds, targets, q_batch):
+            np.testing.assert_allclose(q, ik_lm(chain, seed, target), atol=1e-6)
+
+    async def test_solve_ik_batch_matches_solve_ik(self) -> None:
+        """Verify that batch solving many targets gives the same solutions as one-by-one solving."""
+        from isaacsim.robot.poser import RobotPoser
+
+        poser = RobotPoser(self._stage, self._robot, self._robot, self._link)
+        angles = [0.3, -0.7, 1.1]
+        targets = [self._target(angle) for angle in angles]
+
+        results = poser.solve_ik_batch(targets)
+        self.assertEqual(len(results), len(targets))
+        for angle, target, result in zip(angles, targets, results):
+            self.assertTrue(result.success)
+            self.assertAlmostEqual(result.joints["/World/Robot/joint1"], angle, places=4)
+            poser.set_seed(None)
+            single = poser.solve_ik(target)
+            self.assertAlmostEqual(result.joints["/World/Robot/joint1"], single.joints["/World/Robot/joint1"], places=6)
+
+    async def test_solve_ik_batch_rejects_mismatched_seeds(self) -> None:
+        """Verify that seeds must provide one row per target."""
+        from isaacsim.robot.poser import RobotPoser
+
+        poser = RobotPoser(self._stage, self._robot, self._robot, self._link)
+        with self.assertRaises(ValueError):
+            poser.solve_ik_batch([self._target(0.1), self._target(0.2)], seeds=[[0.0]])
+
+
+class TestBatchedPoseApplication(omni.kit.test.AsyncTestCase):
+    """Tests for :class:`RobotPoseBatch` and :func:`apply_joint_states`."""
+
+    async def setUp(self) -> None:
+        """Create a fresh USD stage with three robot fixtures before each test."""
+        await omni.usd.get_context().new_stage_async()
+        await omni.kit.app.get_app().next_update_async()
+        self._stage = omni.usd.get_context().get_stage()
+        self._robots = [_create_test_robot(self._stage, f"/World/env_{i}/Robot")[0] for i in range(3)]
+
+    def _joint_dict(self, robot_prim: Usd.Prim, value: float) -> dict[str, float]:
+        """Return a joint dict setting the fixture joint of *robot_prim* to *value* radians.
+
+        Args:
+            robot_prim: Robot root prim.
+            value: Joint value in radians.
+
+        Returns:
+            Mapping of joint prim path to value.
+        """
+        return {f"{robot_prim.GetPath()}/joint1": value}
+
+    def _joint_state(self, robot_prim: Usd.Prim) -> tuple[float, float, Gf.Matrix4d]:
+        """Return the drive target, joint position and link world transform of a robot.
+
+        Args:
+            robot_prim: Robot root prim.
+
+        Returns:
+            Tuple of (target position, state position, link world transform).
+        """
+        joint = self._stage.GetPrimAtPath(f"{robot_prim.GetPath()}/joint1")
+        link = self._stage.GetPrimAtPath(f"{robot_prim.GetPath()}/Link1")
+        return (
+            joint.GetAttribute("drive:angular:physics:targetPosition").Get(),
+            joint.GetAttribute("state:angular:physics:position").Get(),
+            UsdGeom.Xformable(link).ComputeLocalToWorldTransform(Usd.TimeCode.Default()),
+        )
+
+    async def test_apply_matches_apply_joint_state(self) -> None:
+        """Batched teleport writes the same joint attributes and link transforms as one call per robot."""
+        reference = _create_test_robot(self._stage, "/World/reference/Robot")[0]
+        values = [0.3, -0.7, 1.1]
+        batch = RobotPoseBatch(self._stage, self._robots)
+        self.assertEqual(len(batch), 3)
+
+        # The second call reuses the joints and kinematic trees resolved by the first
+        for scale in (1.0, 0.5):
+            batch.apply([self._joint_dict(robot, scale * value) for robot, value in zip(self._robots, values)])
+            for robot, value in zip(self._robots, values):
+                apply_joint_state(self._stage, reference, self._joint_dict(reference, scale * value))
+                target, position, link_world = self._joint_state(robot)
+                ref_target, ref_position, ref_link_world = self._joint_state(reference)
+                self.assertAlmostEqual(target, float(np.degrees(scale * value)), places=4)
+                self.assertAlmostEqual(target, ref_target, places=6)
+                self.assertAlmostEqual(position, ref_position, places=6)
+                self.assertTrue(Gf.IsClose(link_world, ref_link_world, 1e-6))
+
+        apply_joint_states(self._stage, self._robots, [self._joint_dict(robot, 0.2) for robot in self._robots])
+        for robot in self._robots:
+            self.assertAlmostEqual(self._joint_state(robot)[1], float(np.degrees(0.2)), places=4)
+
+    async def test_apply_authors_same_specs_as_apply_joint_state(self) -> None:
+        """Schema-defined drive attributes are authored as non-custom, as in the per-robot path."""
+        reference = _create_test_robot(self._stage, "/World/reference/Robot")[0]
+        for robot in self._robots + [reference]:
+            UsdPhysics.DriveAPI.Apply(self._stage.GetPrimAtPath(f"{robot.GetPath()}/joint1"), "angular")
+
+        RobotPoseBatch(self._stage, self._robots).apply([self._joint_dict(robot, 0.4) for robot in self._robots])
+        apply_joint_state(self._stage, reference, self._joint_dict(reference, 0.4))
+
+        layer = self._stage.GetEditTarget().GetLayer()
+        for attr_name in ("drive:angular:physics:targetPosition", "state:angular:physics:position"):
+            ref_spec = layer.GetAttributeAtPath(f"{reference.GetPath()}/joint1.{attr_name}")
+            self.assertIsNotNone(ref_spec)
+            for robot in self._robots:
+                spec = layer.GetAttributeAtPath(f"{robot.GetPath()}/joint1.{attr_name}")
+                self.assertIsNotNone(spec)
+                self.assertEqual(spec.custom, ref_spec.custom)
+                self.assertEqual(spec.typeName, ref_spec.typeName)
+                self.assertAlmostEqual(spec.default, ref_spec.default, places=6)
+        ref_target = layer.GetAttributeAtPath(f"{reference.GetPath()}/joint1.drive:angular:physics:targetPosition")
+        self.assertFalse(ref_target.custom)
+
+    async def test_apply_skips_failed_and_missing_poses(self) -> None:
+        """Robots given None or a failed PoseResult are left unchanged."""
+        batch = RobotPoseBatch(self._stage, self._robots)
+        failed = PoseResult(success=False, joints=self._joint_dict(self._robots[1], 1.234))
+        solved = PoseResult(success=True, joints=self._joint_dict(self._robots[2], 0.5))
+
+        with self.assertLogs("isaacsim.robot.poser.robot_poser", level=logging.WARNING) as cm:
+            batch.apply([None, failed, solved])
+
+        self.assertTrue(any("skipping a failed PoseResult" in msg for msg in cm.output))
+        self.assertIsNone(self._joint_state(self._robots[0])[0])
+        self.assertIsNone(self._joint_state(self._robots[1])[0])
+        self.assertAlmostEqual(self._joint_state(self._robots[2])[0], float(np.degrees(0.5)), places=4)
+
+    async def test_apply_rejects_mismatched_poses(self) -> None:
+        """One pose (or pose name) per robot is required."""
+        batch = RobotPoseBatch(self._stage, self._robots)
+        with self.assertRaises(ValueError):
+            batch.apply([self._joint_dict(self._robots[0], 0.1)])
+        with self.assertRaises(ValueError):
+            batch.apply_named_pose(["home", "home"])
+
+    async def test_apply_named_pose(self) -> None:
+        """A named pose stored on each robot is replayed on every robot that has it."""
+        for robot in self._robots[:2]:
+            pose = PoseResult(
+                success=True,
+                joints=self._joint_dict(robot, float(np.radians(30))),
+                joint_fixed={f"{robot.GetPath()}/joint1": False},
+                start_link=str(robot.GetPath()),
+                end_link=f"{robot.GetPath()}/Link1",
+            )
+            self.assertTrue(store_named_pose(self._stage, robot, "home", pose))
+
+        batch = RobotPoseBatch(self._stage, self._robots)
+        self.assertEqual(batch.apply_named_pose("home"), [True, True, False])
+        for robot in self._robots[:2]:
+            self.assertAlmostEqual(self._joint_state(robot)[1], 30.0, places=4)
+        self.assertIsNone(self._joint_state(self._robots[2])[1])
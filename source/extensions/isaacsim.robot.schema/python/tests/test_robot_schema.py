@@ -618,6 +618,117 @@ class TestPopulateSubRobotBoundary(omni.kit.test.AsyncTestCase):
         self.assertFalse(no_body.GetPrim().HasAPI(robot_schema.Classes.LINK_API.value))
 
 
+class TestRobotKinematicGraph(omni.kit.test.AsyncTestCase):
+    """Tests for the cached kinematic graph shared by the robot traversal helpers."""
+
+    async def setUp(self) -> None:
+        """Create a fresh stage for each test case."""
+        await omni.usd.get_context().new_stage_async()
+        await omni.kit.app.get_app().next_update_async()
+        self._stage = omni.usd.get_context().get_stage()
+
+    def _build_chain(self, num_links: int = 3) -> Usd.Prim:
+        """Create a serial chain of rigid bodies under an articulated robot prim."""
+        robot = UsdGeom.Xform.Define(self._stage, "/World/Robot")
+        UsdPhysics.ArticulationRootAPI.Apply(robot.GetPrim())
+        UsdPhysics.RigidBodyAPI.Apply(robot.GetPrim())
+        parent_path = robot.GetPrim().GetPath()
+        for i in range(num_links):
+            link = UsdGeom.Xform.Define(self._stage, f"/World/Robot/link_{i}")
+            UsdPhysics.RigidBodyAPI.Apply(link.GetPrim())
+            joint = UsdPhysics.RevoluteJoint.Define(self._stage, f"/World/Robot/joint_{i}")
+            joint.CreateBody0Rel().SetTargets([parent_path])
+            joint.CreateBody1Rel().SetTargets([link.GetPrim().GetPath()])
+            parent_path = link.GetPrim().GetPath()
+        robot_schema.ApplyRobotAPI(robot.GetPrim())
+        return robot.GetPrim()
+
+    async def test_graph_is_shared_between_queries(self) -> None:
+        """Repeated queries on an unchanged robot reuse one graph."""
+        robot_prim = self._build_chain()
+        graph = robot_utils.GetRobotKinematicGraph(self._stage, robot_prim)
+
+        joints = robot_utils.GetAllRobotJoints(self._stage, robot_prim)
+        links = robot_utils.GetAllRobotLinks(self._stage, robot_prim)
+        tree_root = robot_utils.GenerateRobotLinkTree(self._stage, robot_prim)
+        robot_utils.RecalculateRobotSchema(self._stage, robot_prim)
+        self.assertIs(robot_utils.GetRobotKinematicGraph(self._stage, robot_prim), graph)
+
+        self.assertEqual([str(j.GetPath()) for j in joints], [f"/World/Robot/joint_{i}" for i in range(3)])
+        self.assertEqual(
+            [str(lnk.GetPath()) for lnk in links], ["/World/Robot"] + [f"/World/Robot/link_{i}" for i in range(3)]
+        )
+        self.assertEqual(len(tree_root.children), 1)
+        self.assertEqual(graph.get_joint_bodies(joints[0]), (Sdf.Path("/World/Robot"), Sdf.Path("/World/Robot/link_0")))
+
+        # Returned lists are copies, callers may modify them
+        discovered_links, _ = graph.get_discovered_prims()
+        discovered_links.clear()
+        self.assertEqual(len(graph.get_discovered_prims()[0]), 4)
+
+    async def test_graph_tracks_connectivity_changes(self) -> None:
+        """Connectivity edits rebuild the graph, value edits keep it."""
+        robot_prim = self._build_chain()
+        graph = robot_utils.GetRobotKinematicGraph(self._stage, robot_prim)
+
+        joint = UsdPhysics.RevoluteJoint(self._stage.GetPrimAtPath("/World/Robot/joint_2"))
+        joint.CreateLocalPos0Attr().Set(Gf.Vec3f(0.0, 0.0, 1.0))
+        joint.CreateLowerLimitAttr().Set(-45.0)
+        joint.GetLowerLimitAttr().Set(-30.0)
+        self.assertIs(robot_utils.GetRobotKinematicGraph(self._stage, robot_prim), graph)
+
+        # Rewiring a joint drops the graph
+        joint.GetBody0Rel().SetTargets([Sdf.Path("/World/Robot/link_0")])
+        rewired = robot_utils.GetRobotKinematicGraph(self._stage, robot_prim)
+        self.assertIsNot(rewired, graph)
+        tree_root = robot_utils.GenerateRobotLinkTree(self._stage, robot_prim)
+        link_0 = tree_root.children[0]
+        self.assertEqual({child.name for child in link_0.children}, {"link_1", "link_2"})
+
+        # Adding a link and a joint drops the graph and the new prims are discovered
+        link = UsdGeom.Xform.Define(self._stage, "/World/Robot/link_3")
+        UsdPhysics.RigidBodyAPI.Apply(link.GetPrim())
+        new_joint = UsdPhysics.FixedJoint.Define(self._stage, "/World/Robot/joint_3")
+        new_joint.CreateBody0Rel().SetTargets([Sdf.Path("/World/Robot/link_2")])
+        new_joint.CreateBody1Rel().SetTargets([link.GetPrim().GetPath()])
+        self.assertIsNot(robot_utils.GetRobotKinematicGraph(self._stage, robot_prim), rewired)
+        discovered_links, discovered_joints = robot_utils.GetRobotKinematicGraph(
+            self._stage, robot_prim
+        ).get_discovered_prims()
+        self.assertIn("/World/Robot/link_3", {str(p.GetPath()) for p in discovered_links})
+        self.assertIn("/World/Robot/joint_3", {str(p.GetPath()) for p in discovered_joints})
+
+        # Excluding a joint from the articulation cuts the chain
+        new_joint.CreateExcludeFromArticulationAttr().Set(True)
+        discovered_links, _ = robot_utils.GetRobotKinematicGraph(self._stage, robot_prim).get_discovered_prims()
+        self.assertNotIn("/World/Robot/link_3", {str(p.GetPath()) for p in discovered_links})
+
+        # Removing a prim of the robot drops its graph
+        graph = robot_utils.GetRobotKinematicGraph(self._stage, robot_prim)
+        self._stage.RemovePrim("/World/Robot/link_3")
+        self.assertIsNot(robot_utils.GetRobotKinematicGraph(self._stage, robot_prim), graph)
+
+    async def test_sub_robot_lookup_and_explicit_invalidation(self) -> None:
+        """Sub-robot ownership is resolved from the graph and graphs can be dropped explicitly."""
+        robot_prim = self._build_chain()
+        sub = UsdGeom.Xform.Define(self._stage, "/World/Robot/Gripper")
+        robot_schema.ApplyRobotAPI(sub.GetPrim())
+        UsdGeom.Xform.Define(self._stage, "/World/Robot/Gripper/Nested")
+        robot_schema.ApplyRobotAPI(self._stage.GetPrimAtPath("/World/Robot/Gripper/Nested"))
+
+        graph = robot_utils.GetRobotKinematicGraph(self._stage, robot_prim)
+        self.assertEqual(graph.sub_robot_paths, {"/World/Robot/Gripper", "/World/Robot/Gripper/Nested"})
+        self.assertEqual(graph.get_owning_sub_robot("/World/Robot/Gripper/finger"), "/World/Robot/Gripper")
+        self.assertEqual(graph.get_owning_sub_robot("/World/Robot/Gripper/Nested/pad"), "/World/Robot/Gripper/Nested")
+        self.assertIsNone(graph.get_owning_sub_robot("/World/Robot/GripperMount"))
+
+        robot_utils.InvalidateRobotKinematicGraph(self._stage, robot_prim)
+        self.assertIsNot(robot_utils.GetRobotKinematicGraph(self._stage, robot_prim), graph)
+        graph = robot_utils.GetRobotKinematicGraph(self._stage, robot_prim)
+        robot_utils.InvalidateRobotKinematicGraph(self._stage)
+        self.assertIsNot(robot_utils.GetRobotKinematicGraph(self._stage, robot_prim), graph)
+
+
 class TestRecalculateRobotSchema(omni.kit.test.AsyncTestCase):
     """Tests for RecalculateRobotSchema."""
 
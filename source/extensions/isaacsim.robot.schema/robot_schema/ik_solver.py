@@ -27,7 +27,7 @@ from typing import TYPE_CHECKING, Any
 
 import numpy as np
 
-from .math import Transform, VecN, quat_conj, quat_mul
+from .math import Transform, VecN, quat_conj, quat_mul, quat_mul_batch
 
 if TYPE_CHECKING:
     from .kinematic_chain import KinematicChain
@@ -54,6 +54,28 @@ def pose_error(Td: Transform, T: Transform) -> VecN:
     return np.concatenate([rot, dp])
 
 
+def pose_error_batch(target_t: np.ndarray, target_q: np.ndarray, t: np.ndarray, q: np.ndarray) -> np.ndarray:
+    """Compute 6-DOF pose errors for stacks of desired and actual poses.
+
+    Batched counterpart of :func:`pose_error`.
+
+    Args:
+        target_t: Desired positions of shape ``(B, 3)`` (or ``(3,)`` shared by all rows).
+        target_q: Desired quaternions [w, x, y, z] of shape ``(B, 4)`` (or ``(4,)``).
+        t: Actual positions of shape ``(B, 3)``.
+        q: Actual quaternions of shape ``(B, 4)``.
+
+    Returns:
+        Errors of shape ``(B, 6)``, each row [rot_x, rot_y, rot_z, pos_x, pos_y, pos_z].
+
+    """
+    dp = target_t - t
+    conj = q * np.array([1.0, -1.0, -1.0, -1.0])
+    dq = quat_mul_batch(target_q, conj)
+    rot = dq[:, 1:] * np.sign(dq[:, :1]) * 2.0
+    return np.concatenate([rot, dp], axis=1)
+
+
 # ---------------------------------------------------------------------------
 # Abstract solver interface
 # ---------------------------------------------------------------------------
@@ -89,6 +111,41 @@ class IKSolver(ABC):
         """
         ...
 
+    def solve_batch(
+        self,
+        chain: KinematicChain,
+        targets: Transform | list[Transform],
+        q0: np.ndarray,
+        **kwargs: Any,
+    ) -> np.ndarray:
+        """Solve IK for a batch of initial configurations and/or targets.
+
+        The default implementation calls :meth:`solve` once per row; solvers
+        with a vectorized formulation override it.
+
+        Args:
+            chain: Kinematic chain providing joints and FK computation.
+            targets: One target shared by every row, or one target per row,
+                in chain-local coordinates.
+            q0: Initial joint configurations of shape ``(B, N)``.
+            **kwargs: Solver-specific parameters.
+
+        Returns:
+            Joint values of shape ``(B, N)``, one solution per row of *q0*.
+
+        Raises:
+            ValueError: When the number of targets does not match the number of rows.
+
+        """
+        q0 = np.atleast_2d(np.asarray(q0, dtype=float))
+        if isinstance(targets, Transform):
+            targets = [targets] * len(q0)
+        if len(targets) != len(q0):
+            raise ValueError(f"Got {len(targets)} targets for {len(q0)} initial configurations")
+        return np.array(
+            [self.solve(chain, target, q, **kwargs) for target, q in zip(targets, q0)], dtype=float
+        ).reshape(q0.shape)
+
 
 # ---------------------------------------------------------------------------
 # Solver registry
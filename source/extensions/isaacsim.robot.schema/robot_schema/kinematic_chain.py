@@ -39,8 +39,11 @@ from usd.schema.isaac.robot_schema.math import (
     _mat4_to_transform,
     _prim_pose_in_robot_frame,
     quat_mul,
+    quat_mul_batch,
     quat_rotate,
+    quat_rotate_batch,
     quat_to_matrix,
+    quat_to_matrix_batch,
 )
 from usd.schema.isaac.robot_schema.utils import (
     GenerateRobotLinkTree,
@@ -331,6 +334,7 @@ class KinematicChain:
         self._debug = debug
         self._tree_root = GenerateRobotLinkTree(stage, robot_prim)
         self._joints: list[Joint] = self._build_joint_chain() if start_prim is not None and end_prim is not None else []
+        self._joint_arrays: dict[str, np.ndarray] | None = None
 
     # -- Construction helper ------------------------------------------------
 
@@ -652,6 +656,175 @@ class KinematicChain:
 
         return Transform(T_t, T_q), J
 
+    def _get_joint_arrays(self) -> dict[str, np.ndarray]:
+        """Return the joint constants stacked into arrays for the batched kernels.
+
+        Built once on first use; the joint chain does not change after construction.
+
+        Returns:
+            Mapping with ``home_q`` (N×4), ``home_t`` (N×3), ``home_ht`` (N×3, home
+            translation in the rotated joint frame), ``w`` and ``v`` (N×3),
+            ``is_revolute`` (N,), ``has_tip`` (N,), ``tip_t`` (N×3) and ``tip_q`` (N×4).
+
+        """
+        if self._joint_arrays is None:
+            joints = self._joints
+            n = len(joints)
+            tip_t = np.zeros((n, 3))
+            tip_q = np.tile(np.array([1.0, 0.0, 0.0, 0.0]), (n, 1))
+            for i, j in enumerate(joints):
+                if j.tip is not None:
+                    tip_t[i] = j.tip.t
+                    tip_q[i] = j.tip.q
+            self._joint_arrays = {
+                "home_q": np.array([j.home.q for j in joints], dtype=float).reshape(n, 4),
+                "home_t": np.array([j.home.t for j in joints], dtype=float).reshape(n, 3),
+                "home_ht": np.array([quat_to_matrix(j.home.q).T @ j.home.t for j in joints], dtype=float).reshape(
+                    n, 3
+                ),
+                "w": np.array([j.w for j in joints], dtype=float).reshape(n, 3),
+                "v": np.array([j.v for j in joints], dtype=float).reshape(n, 3),
+                "is_revolute": np.array([j.is_revolute for j in joints], dtype=bool),
+                "has_tip": np.array([j.tip is not None for j in joints], dtype=bool),
+                "tip_t": tip_t,
+                "tip_q": tip_q,
+            }
+        return self._joint_arrays
+
+    def compute_fk_batch(
+        self, q: np.ndarray, *, return_link_poses: bool = False, chunk_size: int = 65536
+    ) -> tuple[np.ndarray, np.ndarray] | tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Compute end-effector FK for a batch of joint configurations.
+
+        Vectorized counterpart of :meth:`compute_fk` built on the stacked joint
+        constants of :meth:`_get_joint_arrays`: the joint rotations of all
+        configurations are evaluated at once and the loop runs over the joints
+        only. Configurations are processed in chunks of ``chunk_size`` rows to
+        bound the memory of the temporaries.
+
+        Args:
+            q: Joint values of shape ``(B, N)`` in chain order (radians / meters).
+                A single configuration of shape ``(N,)`` is treated as ``B = 1``.
+            return_link_poses: Also return the accumulated pose after every joint,
+                matching the ``per_joint_transforms`` of :meth:`compute_fk`.
+            chunk_size: Maximum number of configurations evaluated together.
+
+        Returns:
+            ``(positions, quaternions)`` of shapes ``(B, 3)`` and ``(B, 4)``
+            ([w, x, y, z]) in chain-local frame. With ``return_link_poses``, the
+            link positions ``(B, N, 3)`` and quaternions ``(B, N, 4)`` follow.
+
+        Raises:
+            ValueError: If ``q`` does not have one column per chain joint or
+                ``chunk_size`` is not positive.
+
+        """
+        arrays = self._get_joint_arrays()
+        q = np.asarray(q, dtype=float)
+        if q.ndim == 1:
+            q = q[None, :]
+        n = len(self._joints)
+        if q.ndim != 2 or q.shape[1] != n:
+            raise ValueError(f"Expected joint values of shape (B, {n}), got {q.shape}")
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        batch = q.shape[0]
+
+        positions = np.zeros((batch, 3))
+        quaternions = np.zeros((batch, 4))
+        quaternions[:, 0] = 1.0
+        if return_link_poses:
+            link_positions = np.empty((batch, n, 3))
+            link_quaternions = np.empty((batch, n, 4))
+
+        revolute = arrays["is_revolute"]
+        for start in range(0, batch, chunk_size):
+            stop = min(start + chunk_size, batch)
+            q_chunk = q[start:stop]
+            # Joint motions of the whole chunk: rotations about w for revolute
+            # joints, translations along v for prismatic ones.
+            half = q_chunk[:, revolute] * 0.5
+            sin_half = np.sin(half)[..., None]
+            dq = np.concatenate([np.cos(half)[..., None], arrays["w"][revolute] * sin_half], axis=-1)
+            dt = arrays["v"][~revolute] * q_chunk[:, ~revolute, None]
+
+            T_t = positions[start:stop]
+            T_q = quaternions[start:stop]
+            i_rev = i_pri = 0
+            for i in range(n):
+                T_t = T_t + quat_rotate_batch(T_q, arrays["home_t"][i])
+                T_q = quat_mul_batch(T_q, arrays["home_q"][i])
+                if revolute[i]:
+                    T_q = quat_mul_batch(T_q, dq[:, i_rev])
+                    i_rev += 1
+                else:
+                    T_t = T_t + quat_rotate_batch(T_q, dt[:, i_pri])
+                    i_pri += 1
+                if arrays["has_tip"][i]:
+                    T_t = T_t + quat_rotate_batch(T_q, arrays["tip_t"][i])
+                    T_q = quat_mul_batch(T_q, arrays["tip_q"][i])
+                if return_link_poses:
+                    link_positions[start:stop, i] = T_t
+                    link_quaternions[start:stop, i] = T_q
+            positions[start:stop] = T_t
+            quaternions[start:stop] = T_q
+
+        if return_link_poses:
+            return positions, quaternions, link_positions, link_quaternions
+        return positions, quaternions
+
+    def compute_fk_and_jacobian_batch(self, q: np.ndarray) -> tuple[np.ndarray, np.ndarray, Mat]:
+        """Compute end-effector FK and spatial Jacobians for a batch of configurations.
+
+        Vectorized counterpart of :meth:`compute_fk_and_jacobian`: the loop runs over
+        the joints only, every step operating on all configurations at once.
+
+        Args:
+            q: Joint values of shape ``(B, N)`` in chain order (radians / meters).
+
+        Returns:
+            ``(positions, quaternions, jacobians)`` of shapes ``(B, 3)``, ``(B, 4)``
+            ([w, x, y, z]) and ``(B, 6, N)`` in chain-local frame.
+
+        """
+        arrays = self._get_joint_arrays()
+        q = np.asarray(q, dtype=float)
+        if q.ndim == 1:
+            q = q[None, :]
+        batch, n = q.shape[0], len(self._joints)
+        J = np.zeros((batch, 6, n), dtype=float)
+
+        T_q = np.tile(np.array([1.0, 0.0, 0.0, 0.0]), (batch, 1))
+        T_t = np.zeros((batch, 3))
+
+        for i in range(n):
+            Th_q = quat_mul_batch(T_q, arrays["home_q"][i])
+            R = quat_to_matrix_batch(Th_q)
+            Th_t = T_t + R @ arrays["home_ht"][i]
+            qi = q[:, i]
+
+            if arrays["is_revolute"][i]:
+                w = arrays["w"][i]
+                Rw = R @ w
+                J[:, :3, i] = Rw
+                J[:, 3:, i] = np.cross(Th_t, Rw)
+                half = qi * 0.5
+                s = np.sin(half)
+                dq = np.stack([np.cos(half), w[0] * s, w[1] * s, w[2] * s], axis=-1)
+                T_q = quat_mul_batch(Th_q, dq)
+                T_t = Th_t
+            else:  # prismatic
+                Rv = R @ arrays["v"][i]
+                J[:, 3:, i] = Rv
+                T_q = Th_q
+                T_t = Th_t + Rv * qi[:, None]
+
+            if arrays["has_tip"][i]:
+                T_t = T_t + quat_rotate_batch(T_q, arrays["tip_t"][i])
+                T_q = quat_mul_batch(T_q, arrays["tip_q"][i])
+
+        return T_t, T_q, J
+
     # -- Tier 2: USD I/O ----------------------------------------------------
 
     def _read_all_joint_states(self) -> dict[str, float]:
@@ -21,7 +21,7 @@ from typing import Any
 
 import numpy as np
 
-from .ik_solver import IKSolver, IKSolverRegistry, pose_error  # noqa: F401 -- re-exports pose_error
+from .ik_solver import IKSolver, IKSolverRegistry, pose_error, pose_error_batch  # noqa: F401 -- re-exports pose_error
 from .kinematic_chain import KinematicChain
 from .math import Transform, VecN
 
@@ -153,6 +153,136 @@ def ik_lm(
     return q
 
 
+def ik_lm_batch(
+    chain: KinematicChain,
+    q0: np.ndarray,
+    target: Transform | list[Transform],
+    lam: float = 1e-3,
+    iters: int = 30,
+    tol: float = 1e-6,
+    w_rot: float = 1.0,
+    w_pos: float = 1.0,
+    max_step: float = 0.5,
+    base_frame: Transform | None = None,
+    null_space_bias: float = 0.05,
+    joint_fixed: list[bool] | np.ndarray | None = None,
+) -> np.ndarray:
+    """Solve many IK problems at once with Levenberg-Marquardt.
+
+    Vectorized counterpart of :func:`ik_lm`: every row of *q0* is an
+    independent solve (its own damping factor and convergence state), and
+    all rows still running are advanced together with stacked FK, Jacobian
+    and linear solves.  Rows drop out of the computation as soon as they
+    converge, so the per-iteration cost shrinks with the active set.  Each
+    row follows the same iterates as :func:`ik_lm` would for it.
+
+    Args:
+        chain: Kinematic chain providing joints and FK computation.
+        q0: Initial joint configurations of shape ``(B, N)``.
+        target: One desired end-effector pose shared by every row, or one
+            pose per row, in chain-local coordinates.
+        lam: Initial Levenberg-Marquardt damping factor.
+        iters: Maximum iterations.
+        tol: Convergence tolerance on weighted cost.
+        w_rot: Rotation weight in cost (x3 for rot components).
+        w_pos: Position weight in cost (x3 for pos components).
+        max_step: Maximum joint step per iteration.
+        base_frame: If set, targets are expressed in this frame.
+        null_space_bias: Bias toward joint mid-range in null space.
+        joint_fixed: Mask of fixed (locked) joints, shared by every row.
+
+    Returns:
+        Joint values of shape ``(B, N)`` that (approximately) achieve the targets.
+
+    Raises:
+        ValueError: When the number of targets does not match the number of rows.
+
+    """
+    q = np.atleast_2d(np.asarray(q0, dtype=float)).copy()
+    batch = q.shape[0]
+    targets = [target] * batch if isinstance(target, Transform) else list(target)
+    if len(targets) != batch:
+        raise ValueError(f"Got {len(targets)} targets for {batch} initial configurations")
+    if base_frame is not None:
+        base_inv = base_frame.inv()
+        targets = [base_inv @ t for t in targets]
+    target_t = np.array([t.t for t in targets], dtype=float).reshape(batch, 3)
+    target_q = np.array([t.q for t in targets], dtype=float).reshape(batch, 4)
+
+    joints = chain.joints
+    n = len(joints)
+    lo = np.array([j.lower for j in joints])
+    hi = np.array([j.upper for j in joints])
+    q = np.clip(q, lo, hi)
+
+    fixed_mask = np.asarray(joint_fixed, dtype=bool) if joint_fixed is not None else np.zeros(n, dtype=bool)
+    if fixed_mask.shape != (n,):
+        fixed_mask = np.zeros(n, dtype=bool)
+
+    I_n = np.eye(n)
+    W = np.array([w_rot, w_rot, w_rot, w_pos, w_pos, w_pos], dtype=float)
+    tol_sq = tol * tol
+    max_step_sq = max_step * max_step
+
+    # Null-space joint centering, as in ik_lm.
+    finite_mask = np.isfinite(lo) & np.isfinite(hi)
+    q_center = np.zeros_like(lo)
+    q_center[finite_mask] = 0.5 * (lo[finite_mask] + hi[finite_mask])
+    use_null_bias = null_space_bias > 0.0 and np.any(finite_mask)
+
+    # Per-row solver state
+    lam_b = np.full(batch, float(lam))
+    T_t, T_q, J = chain.compute_fk_and_jacobian_batch(q)
+    J[:, :, fixed_mask] = 0.0
+    ew = W * pose_error_batch(target_t, target_q, T_t, T_q)
+    cost = np.einsum("bi,bi->b", ew, ew)
+
+    for _ in range(iters):
+        active = np.flatnonzero(cost >= tol_sq)
+        if active.size == 0:
+            break
+
+        q_a = q[active]
+        lam_a = lam_b[active]
+        Jw = W[None, :, None] * J[active]
+        Jw_T = Jw.transpose(0, 2, 1)
+        JtJw = Jw_T @ Jw
+        Jtew = (Jw_T @ ew[active][:, :, None])[:, :, 0]
+
+        if use_null_bias:
+            rhs = Jtew + (lam_a * null_space_bias)[:, None] * (q_center - q_a)
+        else:
+            rhs = Jtew
+
+        dq = np.linalg.solve(JtJw + lam_a[:, None, None] * I_n, rhs[:, :, None])[:, :, 0]
+        dq[:, fixed_mask] = 0.0
+
+        step_sq = np.einsum("bi,bi->b", dq, dq)
+        too_long = step_sq > max_step_sq
+        if np.any(too_long):
+            dq[too_long] *= (max_step / np.sqrt(step_sq[too_long]))[:, None]
+
+        q_new = np.clip(q_a + dq, lo, hi)
+
+        T_t_new, T_q_new, J_new = chain.compute_fk_and_jacobian_batch(q_new)
+        J_new[:, :, fixed_mask] = 0.0
+        ew_new = W * pose_error_batch(target_t[active], target_q[active], T_t_new, T_q_new)
+        cost_new = np.einsum("bi,bi->b", ew_new, ew_new)
+
+        # Adaptive damping per row: accept and shrink on progress, reject and grow on overshoot
+        improved = cost_new < cost[active]
+        accepted = active[improved]
+        q[accepted] = q_new[improved]
+        J[accepted] = J_new[improved]
+        ew[accepted] = ew_new[improved]
+        cost[accepted] = cost_new[improved]
+        lam_b[accepted] = np.maximum(lam_b[accepted] * 0.5, 1e-6)
+        rejected = active[~improved]
+        lam_b[rejected] = np.minimum(lam_b[rejected] * 2.0, 1e2)
+
+    return q
+
+
 # ---------------------------------------------------------------------------
 # IKSolver interface implementation
 # ---------------------------------------------------------------------------
@@ -198,6 +328,28 @@ class IKSolverLM(IKSolver):
         # Target is already in chain-local frame; do not pass base_frame.
         return ik_lm(chain, q0, target, base_frame=None, **kwargs)
 
+    def solve_batch(
+        self,
+        chain: KinematicChain,
+        targets: Transform | list[Transform],
+        q0: np.ndarray,
+        **kwargs: Any,
+    ) -> np.ndarray:
+        """Solve IK for many seeds and/or targets in one vectorized LM run.
+
+        Args:
+            chain: Kinematic chain providing joints and FK computation.
+            targets: One target shared by every row, or one target per row,
+                in chain-local coordinates.
+            q0: Initial joint configurations of shape ``(B, N)``.
+            **kwargs: Solver options (lam, iters, tol, w_rot, w_pos, etc.).
+
+        Returns:
+            Joint values of shape ``(B, N)``.
+
+        """
+        return ik_lm_batch(chain, q0, targets, base_frame=None, **kwargs)
+
 
 # Register as the default IK solver.
 IKSolverRegistry.register("lm", IKSolverLM, default=True)
@@ -33,6 +33,8 @@ conversion helpers.
 
 * :func:`quat_mul`, :func:`quat_conj`, :func:`quat_rotate`,
   :func:`axis_angle_to_quat`, :func:`quat_to_matrix`
+* Batched variants over a leading axis: :func:`quat_mul_batch`,
+  :func:`quat_rotate_batch`, :func:`quat_to_matrix_batch`
 
 **Linear algebra**
 
@@ -152,6 +154,76 @@ def quat_to_matrix(q: Quat) -> Mat:
     )
 
 
+# ---------------------------------------------------------------------------
+# Batched quaternion utilities
+# ---------------------------------------------------------------------------
+
+
+def quat_mul_batch(q1: np.ndarray, q2: np.ndarray) -> np.ndarray:
+    """Multiply stacks of quaternions (Hamilton product) element-wise.
+
+    Args:
+        q1: Quaternions [w, x, y, z] of shape ``(..., 4)``.
+        q2: Quaternions [w, x, y, z] of shape ``(..., 4)``; broadcast against *q1*.
+
+    Returns:
+        Product quaternions of the broadcast shape ``(..., 4)``.
+
+    """
+    w1, x1, y1, z1 = np.moveaxis(np.asarray(q1, dtype=float), -1, 0)
+    w2, x2, y2, z2 = np.moveaxis(np.asarray(q2, dtype=float), -1, 0)
+    return np.stack(
+        [
+            w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2,
+            w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2,
+            w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2,
+            w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2,
+        ],
+        axis=-1,
+    )
+
+
+def quat_rotate_batch(q: np.ndarray, v: np.ndarray) -> np.ndarray:
+    """Rotate stacks of vectors by stacks of unit quaternions.
+
+    Args:
+        q: Unit quaternions of shape ``(..., 4)``.
+        v: Vectors of shape ``(..., 3)``; broadcast against *q*.
+
+    Returns:
+        Rotated vectors of the broadcast shape ``(..., 3)``.
+
+    """
+    q = np.asarray(q, dtype=float)
+    u = q[..., 1:]
+    uv = np.cross(u, v)
+    return v + 2.0 * (q[..., :1] * uv + np.cross(u, uv))
+
+
+def quat_to_matrix_batch(q: np.ndarray) -> np.ndarray:
+    """Convert stacks of unit quaternions to rotation matrices.
+
+    Args:
+        q: Unit quaternions [w, x, y, z] of shape ``(..., 4)``.
+
+    Returns:
+        Rotation matrices of shape ``(..., 3, 3)``.
+
+    """
+    w, x, y, z = np.moveaxis(np.asarray(q, dtype=float), -1, 0)
+    R = np.empty(w.shape + (3, 3), dtype=float)
+    R[..., 0, 0] = 1 - 2 * (y * y + z * z)
+    R[..., 0, 1] = 2 * (x * y - z * w)
+    R[..., 0, 2] = 2 * (x * z + y * w)
+    R[..., 1, 0] = 2 * (x * y + z * w)
+    R[..., 1, 1] = 1 - 2 * (x * x + z * z)
+    R[..., 1, 2] = 2 * (y * z - x * w)
+    R[..., 2, 0] = 2 * (x * z - y * w)
+    R[..., 2, 1] = 2 * (y * z + x * w)
+    R[..., 2, 2] = 1 - 2 * (x * x + y * y)
+    return R
+
+
 # ---------------------------------------------------------------------------
 # Transform
 # ---------------------------------------------------------------------------
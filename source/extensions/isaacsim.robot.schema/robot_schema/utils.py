@@ -20,6 +20,7 @@
 from __future__ import annotations
 
 import logging
+import weakref
 from collections import deque
 from collections.abc import Callable
 from typing import Any
@@ -299,115 +300,383 @@ def UpdateDeprecatedJointDofOrder(joint_prim: pxr.Usd.Prim) -> bool:
     return True
 
 
-def _discover_articulation_prims(
-    stage: pxr.Usd.Stage, robot_prim: pxr.Usd.Prim
-) -> tuple[list[pxr.Usd.Prim], list[pxr.Usd.Prim]]:
-    """Discover all links and joints by traversing the articulation graph.
+# Joint properties whose edits change the connectivity recorded by a RobotKinematicGraph.
+_KINEMATIC_GRAPH_PROPERTY_NAMES = frozenset(("physics:body0", "physics:body1", "physics:excludeFromArticulation"))
 
-    Uses the same logic as PopulateRobotSchemaFromArticulation to find all
-    connected rigid bodies and joints.
+
+class RobotKinematicGraph:
+    """Cached joint connectivity of the prims under a robot prim.
+
+    The graph is built with a single ``Usd.PrimRange`` sweep over the robot subtree and records the
+    nested sub-robots, the articulation root, the joints with their body targets, the rigid bodies and
+    the site / reference point prims. Adjacency maps and traversal results are computed on first use
+    and kept until the graph is dropped, so repeated queries only cost the size of their result.
+
+    Graphs are shared through :func:`GetRobotKinematicGraph`, which discards them when a USD change
+    notice resyncs the robot subtree or one of the joint bodies, or edits a joint's body relationships
+    or ``physics:excludeFromArticulation``. Value edits such as joint drive targets or transforms
+    keep the graph.
 
     Args:
         stage: The USD stage containing the robot.
-        robot_prim: The USD prim representing the robot.
+        robot_prim: The root prim of the robot.
 
-    Returns:
-        Tuple of (discovered_links, discovered_joints).
+    Example:
+
+    .. code-block:: python
+
+        graph = GetRobotKinematicGraph(stage, robot_prim)
+        body0_path, body1_path = graph.get_joint_bodies(joint_prim)
 
     """
-    if not stage or not robot_prim:
-        return [], []
 
-    robot_path_str = str(robot_prim.GetPath())
-    sub_robot_paths: set[str] = set()
-    for child in pxr.Usd.PrimRange(robot_prim):
-        child_path_str = str(child.GetPath())
-        if child_path_str != robot_path_str and child.HasAPI(Classes.ROBOT_API.value):
-            sub_robot_paths.add(child_path_str)
+    def __init__(self, stage: pxr.Usd.Stage, robot_prim: pxr.Usd.Prim) -> None:
+        self.stage = stage
+        self.robot_prim = robot_prim
+        self.robot_path = robot_prim.GetPath()
+        self.sub_robot_paths: set[str] = set()
+        self.articulation_root: pxr.Usd.Prim | None = None
+        self.joints: list[pxr.Usd.Prim] = []
+        self.rigid_bodies: list[pxr.Usd.Prim] = []
+        self.site_prims: list[pxr.Usd.Prim] = []
+        self._joint_bodies: dict[pxr.Sdf.Path, tuple[pxr.Sdf.Path | None, pxr.Sdf.Path | None]] = {}
 
-    def _under_sub_robot(path_str: str) -> bool:
-        return any(path_str == sp or path_str.startswith(sp + "/") for sp in sub_robot_paths)
+        for prim in pxr.Usd.PrimRange(robot_prim):
+            path = prim.GetPath()
+            if path != self.robot_path and prim.HasAPI(Classes.ROBOT_API.value):
+                self.sub_robot_paths.add(str(path))
+            if self.articulation_root is None and prim.HasAPI(pxr.UsdPhysics.ArticulationRootAPI):
+                self.articulation_root = prim
+            if prim.IsA(pxr.UsdPhysics.Joint):
+                self.joints.append(prim)
+                self._joint_bodies[path] = (GetJointBodyRelationship(prim, 0), GetJointBodyRelationship(prim, 1))
+            if prim.HasAPI(pxr.UsdPhysics.RigidBodyAPI):
+                self.rigid_bodies.append(prim)
+            if prim.HasAPI(Classes.SITE_API.value) or prim.HasAPI(Classes.REFERENCE_POINT_API.value):
+                self.site_prims.append(prim)
 
-    articulation_root = _find_articulation_root(robot_prim)
-    if articulation_root is None:
-        return [], []
+        self.body_paths: set[pxr.Sdf.Path] = {
+            body for bodies in self._joint_bodies.values() for body in bodies if body is not None
+        }
+        self._owning_sub_robot: dict[str, str | None] = {}
+        self._articulation_joints: dict[bool, list[pxr.Usd.Prim]] = {}
+        self._body_to_joints: dict[bool, dict[str, list[tuple[pxr.Usd.Prim, int]]]] = {}
+        self._discovered_prims: tuple[list[pxr.Usd.Prim], list[pxr.Usd.Prim]] | None = None
+        self._sub_robot_kinematics: tuple[list[pxr.Usd.Prim], list[pxr.Usd.Prim]] | None = None
 
-    root_link = articulation_root
-    articulation_joints = [
-        prim
-        for prim in pxr.Usd.PrimRange(robot_prim)
-        if prim.IsA(pxr.UsdPhysics.Joint) and not _under_sub_robot(str(prim.GetPath()))
-    ]
+    def get_joint_bodies(self, joint_prim: pxr.Usd.Prim) -> tuple[pxr.Sdf.Path | None, pxr.Sdf.Path | None]:
+        """Get the body0 and body1 targets of a joint.
 
-    root_joint = None
-    if articulation_root.IsA(pxr.UsdPhysics.Joint):
-        root_joint = articulation_root
-        candidate_path = GetJointBodyRelationship(root_joint, 0) or GetJointBodyRelationship(root_joint, 1)
-        if candidate_path:
-            root_link = stage.GetPrimAtPath(candidate_path)
-    if not root_link:
-        return [], [root_joint] if root_joint else []
+        Joints outside the robot subtree are read from the stage.
 
-    root_link_key = str(root_link.GetPath())
-    body_to_joints: dict[str, list[tuple[pxr.Usd.Prim, int]]] = {}
-    for joint_prim in articulation_joints:
-        for body_index in (0, 1):
-            body_path = GetJointBodyRelationship(joint_prim, body_index)
-            key = _path_key(body_path)
-            if not key:
-                continue
-            body_to_joints.setdefault(key, []).append((joint_prim, body_index))
-            if not root_joint and root_link_key and key == root_link_key:
-                root_joint = joint_prim
+        Args:
+            joint_prim: The joint prim.
 
-    queue: deque[pxr.Usd.Prim] = deque()
-    visited_links: set[str] = set()
-    visited_joints: set[str] = set()
-    ordered_links: list[pxr.Usd.Prim] = []
-    ordered_joints: list[pxr.Usd.Prim] = []
+        Returns:
+            The body0 and body1 target paths, None for a missing target or a joint excluded from the
+            articulation (see :func:`GetJointBodyRelationship`).
 
-    if root_joint:
-        ordered_joints.append(root_joint)
-        visited_joints.add(str(root_joint.GetPath()))
+        """
+        bodies = self._joint_bodies.get(joint_prim.GetPath())
+        if bodies is None:
+            return GetJointBodyRelationship(joint_prim, 0), GetJointBodyRelationship(joint_prim, 1)
+        return bodies
 
-    if root_link:
-        queue.append(root_link)
+    def get_owning_sub_robot(self, path_str: str | None) -> str | None:
+        """Get the deepest nested sub-robot containing a path.
 
-    while queue:
-        link_prim = queue.popleft()
-        if not link_prim:
-            continue
-        link_key = str(link_prim.GetPath())
-        if link_key in visited_links:
-            continue
-        visited_links.add(link_key)
+        Args:
+            path_str: The prim path to look up.
 
-        if link_key in sub_robot_paths:
-            continue
-        if any(link_key.startswith(sp + "/") for sp in sub_robot_paths):
-            continue
+        Returns:
+            The path of the sub-robot prim, or None if the path is not inside a sub-robot.
 
-        if link_prim.HasAPI(pxr.UsdPhysics.RigidBodyAPI):
-            ordered_links.append(link_prim)
+        """
+        if not path_str or not self.sub_robot_paths:
+            return None
+        if path_str not in self._owning_sub_robot:
+            best: str | None = None
+            for sp in self.sub_robot_paths:
+                if path_str == sp or path_str.startswith(sp + "/"):
+                    if best is None or len(sp) > len(best):
+                        best = sp
+            self._owning_sub_robot[path_str] = best
+        return self._owning_sub_robot[path_str]
+
+    def get_articulation_joints(self, include_sub_robot_boundary: bool = True) -> list[pxr.Usd.Prim]:
+        """Get the joints taking part in the robot's own articulation.
 
-        for joint_prim, body_index in body_to_joints.get(link_key, []):
-            joint_key = str(joint_prim.GetPath())
-            if joint_key not in visited_joints:
-                ordered_joints.append(joint_prim)
-                visited_joints.add(joint_key)
+        Args:
+            include_sub_robot_boundary: If True, keep every joint with at least one body outside the
+                sub-robots, wherever it is authored, so traversal reaches the sub-robots at their
+                boundary. If False, keep the joints authored outside the sub-robots.
 
-            other_index = 1 - body_index
-            other_path = GetJointBodyRelationship(joint_prim, other_index)
-            if not other_path:
+        Returns:
+            The joints in prim traversal order.
+
+        """
+        joints = self._articulation_joints.get(include_sub_robot_boundary)
+        if joints is None:
+            if include_sub_robot_boundary:
+                joints = [
+                    joint
+                    for joint in self.joints
+                    if any(
+                        self.get_owning_sub_robot(str(body)) is None
+                        for body in self._joint_bodies[joint.GetPath()]
+                        if body is not None
+                    )
+                ]
+            else:
+                joints = [joint for joint in self.joints if self.get_owning_sub_robot(str(joint.GetPath())) is None]
+            self._articulation_joints[include_sub_robot_boundary] = joints
+        return joints
+
+    def get_body_to_joints(self, include_sub_robot_boundary: bool = True) -> dict[str, list[tuple[pxr.Usd.Prim, int]]]:
+        """Get the joints connected to each body.
+
+        Args:
+            include_sub_robot_boundary: Selects the joints as in :meth:`get_articulation_joints`.
+
+        Returns:
+            Mapping from body path string to ``(joint_prim, body_index)`` pairs in joint order.
+
+        """
+        body_to_joints = self._body_to_joints.get(include_sub_robot_boundary)
+        if body_to_joints is None:
+            body_to_joints = {}
+            for joint in self.get_articulation_joints(include_sub_robot_boundary):
+                for body_index, body_path in enumerate(self._joint_bodies[joint.GetPath()]):
+                    if body_path is not None:
+                        body_to_joints.setdefault(str(body_path), []).append((joint, body_index))
+            self._body_to_joints[include_sub_robot_boundary] = body_to_joints
+        return body_to_joints
+
+    def get_discovered_prims(self) -> tuple[list[pxr.Usd.Prim], list[pxr.Usd.Prim]]:
+        """Get the links and joints reachable from the articulation root, excluding sub-robots.
+
+        The breadth-first walk runs once per graph, later calls copy the cached result.
+
+        Returns:
+            Tuple of (discovered_links, discovered_joints) in traversal order.
+
+        """
+        if self._discovered_prims is None:
+            self._discovered_prims = self._walk_articulation()
+        links, joints = self._discovered_prims
+        return list(links), list(joints)
+
+    def get_sub_robot_kinematics(self) -> tuple[list[pxr.Usd.Prim], list[pxr.Usd.Prim]]:
+        """Get the links and joints inside the nested sub-robots.
+
+        See ``_collect_sub_robot_kinematics``, computed once per graph.
+
+        Returns:
+            Tuple of (sub_robot_links, sub_robot_joints).
+
+        """
+        if self._sub_robot_kinematics is None:
+            self._sub_robot_kinematics = (
+                _collect_sub_robot_kinematics(self.robot_prim) if self.sub_robot_paths else ([], [])
+            )
+        links, joints = self._sub_robot_kinematics
+        return list(links), list(joints)
+
+    def _walk_articulation(self) -> tuple[list[pxr.Usd.Prim], list[pxr.Usd.Prim]]:
+        """Walk the articulation breadth-first from the root link.
+
+        Returns:
+            Tuple of (discovered_links, discovered_joints).
+
+        """
+        if self.articulation_root is None:
+            return [], []
+
+        root_link = self.articulation_root
+        root_joint = None
+        if root_link.IsA(pxr.UsdPhysics.Joint):
+            root_joint = root_link
+            body0, body1 = self.get_joint_bodies(root_joint)
+            candidate_path = body0 or body1
+            if candidate_path:
+                root_link = self.stage.GetPrimAtPath(candidate_path)
+        if not root_link:
+            return [], [root_joint] if root_joint else []
+
+        body_to_joints = self.get_body_to_joints(include_sub_robot_boundary=False)
+        if not root_joint:
+            root_connections = body_to_joints.get(str(root_link.GetPath()))
+            if root_connections:
+                root_joint = root_connections[0][0]
+
+        queue: deque[pxr.Usd.Prim] = deque([root_link])
+        visited_links: set[str] = set()
+        visited_joints: set[str] = set()
+        ordered_links: list[pxr.Usd.Prim] = []
+        ordered_joints: list[pxr.Usd.Prim] = []
+
+        if root_joint:
+            ordered_joints.append(root_joint)
+            visited_joints.add(str(root_joint.GetPath()))
+
+        while queue:
+            link_prim = queue.popleft()
+            if not link_prim:
                 continue
-            other_key = str(other_path)
-            if other_key in visited_links:
+            link_key = str(link_prim.GetPath())
+            if link_key in visited_links:
                 continue
-            other_prim = stage.GetPrimAtPath(other_path)
-            if other_prim:
-                queue.append(other_prim)
+            visited_links.add(link_key)
 
-    return ordered_links, ordered_joints
+            if self.get_owning_sub_robot(link_key) is not None:
+                continue
+
+            if link_prim.HasAPI(pxr.UsdPhysics.RigidBodyAPI):
+                ordered_links.append(link_prim)
+
+            for joint_prim, body_index in body_to_joints.get(link_key, []):
+                joint_key = str(joint_prim.GetPath())
+                if joint_key not in visited_joints:
+                    ordered_joints.append(joint_prim)
+                    visited_joints.add(joint_key)
+
+                other_path = self._joint_bodies[joint_prim.GetPath()][1 - body_index]
+                if not other_path or str(other_path) in visited_links:
+                    continue
+                other_prim = self.stage.GetPrimAtPath(other_path)
+                if other_prim:
+                    queue.append(other_prim)
+
+        return ordered_links, ordered_joints
+
+
+class _StageKinematicGraphs:
+    """Kinematic graphs of the robots of one stage, dropped on USD change notices.
+
+    Args:
+        stage: The USD stage whose changes are observed.
+
+    """
+
+    def __init__(self, stage: pxr.Usd.Stage) -> None:
+        self.graphs: dict[pxr.Sdf.Path, RobotKinematicGraph] = {}
+        self._listener = pxr.Tf.Notice.Register(pxr.Usd.Notice.ObjectsChanged, self._on_objects_changed, stage)
+
+    def invalidate(self, path: pxr.Sdf.Path, resynced: bool = True) -> None:
+        """Drop the graphs affected by a change at a path.
+
+        Args:
+            path: The changed prim path.
+            resynced: Whether the prim was resynced. Info-only changes only affect the graphs of the
+                robots containing the prim.
+
+        """
+        for robot_path, graph in list(self.graphs.items()):
+            if path.HasPrefix(robot_path) or (
+                resynced and (robot_path.HasPrefix(path) or any(body.HasPrefix(path) for body in graph.body_paths))
+            ):
+                del self.graphs[robot_path]
+
+    def _on_objects_changed(self, notice: pxr.Usd.Notice.ObjectsChanged, sender: pxr.Usd.Stage) -> None:
+        if not self.graphs:
+            return
+        for path in notice.GetResyncedPaths():
+            # Adding or removing a property only matters for the joint body relationships
+            if path.IsPropertyPath():
+                if path.name in _KINEMATIC_GRAPH_PROPERTY_NAMES:
+                    self.invalidate(path.GetPrimPath(), resynced=False)
+            else:
+                self.invalidate(path)
+            if not self.graphs:
+                return
+        for path in notice.GetChangedInfoOnlyPaths():
+            if path.IsPrimPath() or path.name in _KINEMATIC_GRAPH_PROPERTY_NAMES:
+                self.invalidate(path.GetPrimPath(), resynced=False)
+                if not self.graphs:
+                    return
+
+
+_kinematic_graphs: weakref.WeakKeyDictionary[pxr.Usd.Stage, _StageKinematicGraphs] = weakref.WeakKeyDictionary()
+
+
+def GetRobotKinematicGraph(stage: pxr.Usd.Stage, robot_prim: pxr.Usd.Prim) -> RobotKinematicGraph:
+    """Return the cached kinematic graph of a robot, building it if needed.
+
+    Graphs are kept per stage while the stage object is alive and are rebuilt after USD changes that
+    affect the robot's joint connectivity (see :class:`RobotKinematicGraph`).
+
+    Args:
+        stage: The USD stage containing the robot.
+        robot_prim: The root prim of the robot.
+
+    Returns:
+        The kinematic graph of the robot.
+
+    Example:
+
+    .. code-block:: python
+
+        graph = GetRobotKinematicGraph(stage, robot_root_prim)
+        links, joints = graph.get_discovered_prims()
+
+    """
+    stage_graphs = _kinematic_graphs.get(stage)
+    if stage_graphs is None:
+        stage_graphs = _StageKinematicGraphs(stage)
+        _kinematic_graphs[stage] = stage_graphs
+    robot_path = robot_prim.GetPath()
+    graph = stage_graphs.graphs.get(robot_path)
+    if graph is None or not graph.robot_prim.IsValid():
+        graph = RobotKinematicGraph(stage, robot_prim)
+        stage_graphs.graphs[robot_path] = graph
+    return graph
+
+
+def InvalidateRobotKinematicGraph(stage: pxr.Usd.Stage, robot_prim: pxr.Usd.Prim | None = None) -> None:
+    """Drop cached kinematic graphs so the next query rebuilds them.
+
+    Only needed for changes USD does not report, such as edits made while notices are blocked.
+
+    Args:
+        stage: The USD stage containing the robots.
+        robot_prim: The robot whose graph to drop. Drops all graphs of the stage if None.
+
+    Example:
+
+    .. code-block:: python
+
+        InvalidateRobotKinematicGraph(stage, robot_root_prim)
+
+    """
+    stage_graphs = _kinematic_graphs.get(stage)
+    if stage_graphs is None:
+        return
+    if robot_prim is None:
+        stage_graphs.graphs.clear()
+    else:
+        stage_graphs.graphs.pop(robot_prim.GetPath(), None)
+
+
+def _discover_articulation_prims(
+    stage: pxr.Usd.Stage, robot_prim: pxr.Usd.Prim
+) -> tuple[list[pxr.Usd.Prim], list[pxr.Usd.Prim]]:
+    """Discover all links and joints by traversing the articulation graph.
+
+    Uses the same logic as PopulateRobotSchemaFromArticulation to find all
+    connected rigid bodies and joints. The traversal result is cached on the
+    robot's :class:`RobotKinematicGraph`.
+
+    Args:
+        stage: The USD stage containing the robot.
+        robot_prim: The USD prim representing the robot.
+
+    Returns:
+        Tuple of (discovered_links, discovered_joints).
+
+    """
+    if not stage or not robot_prim:
+        return [], []
+    return GetRobotKinematicGraph(stage, robot_prim).get_discovered_prims()
 
 
 def GetAllRobotJoints(
@@ -1131,11 +1400,12 @@ def GenerateRobotLinkTree(stage: pxr.Usd.Stage, robot_link_prim: pxr.Usd.Prim =
     """
     all_links = GetAllRobotLinks(stage, robot_link_prim)
     all_joints = GetAllRobotJoints(stage, robot_link_prim)
+    graph = GetRobotKinematicGraph(stage, robot_link_prim)
 
     # Augment with rigid bodies and joints from sub-robot subtrees so FK
     # propagation reaches every body in the assembly.  See
     # ``_collect_sub_robot_kinematics`` for the rationale.
-    sub_links, sub_joints = _collect_sub_robot_kinematics(robot_link_prim)
+    sub_links, sub_joints = graph.get_sub_robot_kinematics()
     existing_link_paths = {lnk.GetPath() for lnk in all_links}
     existing_joint_paths = {j.GetPath() for j in all_joints}
     for lnk in sub_links:
@@ -1151,29 +1421,30 @@ def GenerateRobotLinkTree(stage: pxr.Usd.Stage, robot_link_prim: pxr.Usd.Prim =
         return None
     root = RobotLinkNode(all_links[0])
     joints_per_body = [{link.GetPath(): [] for link in all_links} for _ in range(2)]
+    joint_bodies = {}
 
     for joint in all_joints:
+        bodies = graph.get_joint_bodies(joint)
+        joint_bodies[joint.GetPath()] = bodies
         for body_index in (0, 1):
-            body = GetJointBodyRelationship(joint, body_index)
+            body = bodies[body_index]
             if body and body in joints_per_body[body_index]:
                 joints_per_body[body_index][body].append(joint)
 
     stack = [root]
-    processed_joints = []
-    unprocessed_joints = list(all_joints)
+    processed_joints = set()
     while stack:
         current = stack.pop()
         current_path = current.prim.GetPath()
         for i in range(2):
             joints = joints_per_body[i].get(current_path, [])
             for joint in joints:
-                if joint not in processed_joints:
-                    processed_joints.append(joint)
-                    if joint in unprocessed_joints:
-                        unprocessed_joints.remove(joint)
+                joint_path = joint.GetPath()
+                if joint_path not in processed_joints:
+                    processed_joints.add(joint_path)
                     # The other body of the joint (index 1 - i) is the
                     # child link in a parent-to-child traversal.
-                    body1 = GetJointBodyRelationship(joint, 1 - i)
+                    body1 = joint_bodies[joint_path][1 - i]
                     if body1 and (current.parent is None or current.parent.path != body1):
                         child = RobotLinkNode(stage.GetPrimAtPath(body1), current, joint)
                         current._joints.append(joint)
@@ -1274,28 +1545,18 @@ def _discover_articulation_graph(
     traversal_normalized = (traversal or "dfs").lower()
     if traversal_normalized not in ("dfs", "bfs"):
         raise ValueError(f"Invalid traversal strategy: {traversal!r}. Expected 'dfs' or 'bfs'.")
-    robot_path_str = str(robot_prim.GetPath())
-    sub_robot_paths: set[str] = set()
-    for child in pxr.Usd.PrimRange(robot_prim):
-        child_path_str = str(child.GetPath())
-        if child_path_str != robot_path_str and child.HasAPI(Classes.ROBOT_API.value):
-            sub_robot_paths.add(child_path_str)
+    graph = GetRobotKinematicGraph(stage, robot_prim)
+    sub_robot_paths = set(graph.sub_robot_paths)
 
     def _under_sub_robot(path_str: str) -> bool:
-        return any(path_str == sp or path_str.startswith(sp + "/") for sp in sub_robot_paths)
+        return graph.get_owning_sub_robot(path_str) is not None
 
-    def _owning_sub_robot(path_str: str | None) -> str | None:
-        if not path_str:
-            return None
-        # Pick the deepest enclosing sub-robot to handle nested cases.
-        best: str | None = None
-        for sp in sub_robot_paths:
-            if path_str == sp or path_str.startswith(sp + "/"):
-                if best is None or len(sp) > len(best):
-                    best = sp
-        return best
-
-    articulation_root = _find_articulation_root(articulation_prim or robot_prim)
+    _owning_sub_robot = graph.get_owning_sub_robot
+
+    if articulation_prim and articulation_prim.IsValid() and articulation_prim.GetPath() != robot_prim.GetPath():
+        articulation_root = _find_articulation_root(articulation_prim)
+    else:
+        articulation_root = graph.articulation_root
     # The auto-search may walk into a sub-robot when the parent has no
     # ArticulationRootAPI; reject that case so the parent's traversal does not
     # start inside a child robot.
@@ -1316,23 +1577,14 @@ def _discover_articulation_graph(
     # joint -- including a joint authored anywhere whose two bodies span the
     # parent/sub-robot boundary -- is included so traversal can discover the
     # sub-robot at the boundary edge.
-    def _is_parent_articulation_joint(joint_prim: pxr.Usd.Prim) -> bool:
-        b0 = _path_key(GetJointBodyRelationship(joint_prim, 0))
-        b1 = _path_key(GetJointBodyRelationship(joint_prim, 1))
-        scopes = [_owning_sub_robot(b) for b in (b0, b1) if b]
-        return any(scope is None for scope in scopes)
-
-    articulation_joints = [
-        prim
-        for prim in pxr.Usd.PrimRange(robot_prim)
-        if prim.IsA(pxr.UsdPhysics.Joint) and _is_parent_articulation_joint(prim)
-    ]
+    articulation_joints = graph.get_articulation_joints(include_sub_robot_boundary=True)
 
     root_link = articulation_root
     root_joint: pxr.Usd.Prim | None = None
     if articulation_root.IsA(pxr.UsdPhysics.Joint):
         root_joint = articulation_root
-        candidate_path = GetJointBodyRelationship(root_joint, 0) or GetJointBodyRelationship(root_joint, 1)
+        body0, body1 = graph.get_joint_bodies(root_joint)
+        candidate_path = body0 or body1
         if candidate_path:
             root_link = stage.GetPrimAtPath(candidate_path)
     if not root_link:
@@ -1340,16 +1592,9 @@ def _discover_articulation_graph(
 
     root_link_key = str(root_link.GetPath())
 
-    body_to_joints: dict[str, list[tuple[pxr.Usd.Prim, int]]] = {}
-    for joint_prim in articulation_joints:
-        for body_index in (0, 1):
-            body_path = GetJointBodyRelationship(joint_prim, body_index)
-            key = _path_key(body_path)
-            if not key:
-                continue
-            body_to_joints.setdefault(key, []).append((joint_prim, body_index))
-            if not root_joint and root_link_key and key == root_link_key:
-                root_joint = joint_prim
+    body_to_joints = graph.get_body_to_joints(include_sub_robot_boundary=True)
+    if not root_joint and root_link_key in body_to_joints:
+        root_joint = body_to_joints[root_link_key][0][0]
 
     # Resolve root_link: explicit override > auto-detect via scoring
     if root_link_override is not None and root_link_override.IsValid():
@@ -1363,8 +1608,7 @@ def _discover_articulation_graph(
         # path depth (shallower = closer to articulation root prim).
         body_scores: dict[str, int] = dict.fromkeys(body_to_joints, 0)
         for jp in articulation_joints:
-            b0 = _path_key(GetJointBodyRelationship(jp, 0))
-            b1 = _path_key(GetJointBodyRelationship(jp, 1))
+            b0, b1 = (_path_key(body) for body in graph.get_joint_bodies(jp))
             if b0 and b0 in body_scores:
                 body_scores[b0] += 1
             if b1 and b1 in body_scores:
@@ -1439,8 +1683,7 @@ def _discover_articulation_graph(
                 ordered_joints.append(joint_prim)
                 visited_joints.add(joint_key)
 
-            other_index = 1 - body_index
-            other_path = GetJointBodyRelationship(joint_prim, other_index)
+            other_path = graph.get_joint_bodies(joint_prim)[1 - body_index]
             if not other_path:
                 continue
             other_key = str(other_path)
@@ -1533,6 +1776,10 @@ def PopulateRobotSchemaFromArticulation(
     if not robot_prim:
         raise ValueError("Robot prim is invalid.")
 
+    # Joints and rigid bodies are not added or removed by the schema writes
+    # below, so the graph stays valid for the fallback sweep even after the
+    # writes drop it from the cache.
+    graph = GetRobotKinematicGraph(stage, robot_prim)
     root_link, root_joint, ordered_links, ordered_joints, sites_by_link, _ = _discover_articulation_graph(
         stage,
         robot_prim,
@@ -1552,29 +1799,27 @@ def PopulateRobotSchemaFromArticulation(
     # `HasAPI(ROBOT_API)`), not an articulation marker.
     if not ordered_joints:
         visited_joints = {str(p.GetPath()) for p in ordered_joints}
-        for prim in pxr.Usd.PrimRange(robot_prim):
-            if prim.IsA(pxr.UsdPhysics.Joint):
-                ApplyJointAPI(prim)
-                # Defensive: `Apply` is ordinarily idempotent, but guard
-                # against composition cases where it silently no-ops (e.g.
-                # instance masters where schemas do not propagate to proxies).
-                if not prim.HasAPI(Classes.JOINT_API.value):
-                    continue
-                key = str(prim.GetPath())
-                if key in visited_joints:
-                    continue
-                ordered_joints.append(prim)
-                visited_joints.add(key)
+        for prim in graph.joints:
+            ApplyJointAPI(prim)
+            # Defensive: `Apply` is ordinarily idempotent, but guard
+            # against composition cases where it silently no-ops (e.g.
+            # instance masters where schemas do not propagate to proxies).
+            if not prim.HasAPI(Classes.JOINT_API.value):
+                continue
+            key = str(prim.GetPath())
+            if key in visited_joints:
+                continue
+            ordered_joints.append(prim)
+            visited_joints.add(key)
     if not ordered_links or not ordered_joints:
         visited_links = {str(p.GetPath()) for p in ordered_links}
-        for prim in pxr.Usd.PrimRange(robot_prim):
-            if prim.HasAPI(pxr.UsdPhysics.RigidBodyAPI):
-                ApplyLinkAPI(prim)
-                key = str(prim.GetPath())
-                if key in visited_links:
-                    continue
-                ordered_links.append(prim)
-                visited_links.add(key)
+        for prim in graph.rigid_bodies:
+            ApplyLinkAPI(prim)
+            key = str(prim.GetPath())
+            if key in visited_links:
+                continue
+            ordered_links.append(prim)
+            visited_links.add(key)
 
     # Merge sites into the link list according to sites_last policy
     final_ordered_links: list[pxr.Usd.Prim] = []
@@ -2338,6 +2583,7 @@ def RecalculateRobotSchema(
         if first_link and first_link.IsValid():
             root_link_override = first_link
 
+    graph = GetRobotKinematicGraph(stage, robot_prim)
     root_link, root_joint, discovered_links, discovered_joints, sites_by_link, sub_robot_paths = (
         _discover_articulation_graph(
             stage,
@@ -2360,28 +2606,26 @@ def RecalculateRobotSchema(
     # `IsaacRobotAPI` from a prior run.
     if not discovered_joints:
         visited_joints = {str(p.GetPath()) for p in discovered_joints}
-        for prim in pxr.Usd.PrimRange(robot_prim):
-            if prim.IsA(pxr.UsdPhysics.Joint):
-                ApplyJointAPI(prim)
-                # Defensive: guard against composition cases where `Apply`
-                # silently no-ops (e.g. instance masters).
-                if not prim.HasAPI(Classes.JOINT_API.value):
-                    continue
-                key = str(prim.GetPath())
-                if key in visited_joints:
-                    continue
-                discovered_joints.append(prim)
-                visited_joints.add(key)
+        for prim in graph.joints:
+            ApplyJointAPI(prim)
+            # Defensive: guard against composition cases where `Apply`
+            # silently no-ops (e.g. instance masters).
+            if not prim.HasAPI(Classes.JOINT_API.value):
+                continue
+            key = str(prim.GetPath())
+            if key in visited_joints:
+                continue
+            discovered_joints.append(prim)
+            visited_joints.add(key)
     if not discovered_links or not discovered_joints:
         visited_links = {str(p.GetPath()) for p in discovered_links}
-        for prim in pxr.Usd.PrimRange(robot_prim):
-            if prim.HasAPI(pxr.UsdPhysics.RigidBodyAPI):
-                ApplyLinkAPI(prim)
-                key = str(prim.GetPath())
-                if key in visited_links:
-                    continue
-                discovered_links.append(prim)
-                visited_links.add(key)
+        for prim in graph.rigid_bodies:
+            ApplyLinkAPI(prim)
+            key = str(prim.GetPath())
+            if key in visited_links:
+                continue
+            discovered_links.append(prim)
+            visited_links.add(key)
 
     # Flatten discovered sites
     all_discovered_sites: list[pxr.Usd.Prim] = []
@@ -2394,9 +2638,10 @@ def RecalculateRobotSchema(
     discovered_site_paths = {str(p.GetPath()) for p in all_discovered_sites}
 
     all_valid_link_paths = discovered_link_paths | discovered_site_paths | sub_robot_paths
-    for prim in pxr.Usd.PrimRange(robot_prim):
-        if prim.HasAPI(Classes.SITE_API.value) or prim.HasAPI(Classes.REFERENCE_POINT_API.value):
-            all_valid_link_paths.add(str(prim.GetPath()))
+    # Sites discovered above were added to ``discovered_site_paths``; the graph
+    # supplies the ones that were already tagged before the traversal.
+    for prim in graph.site_prims:
+        all_valid_link_paths.add(str(prim.GetPath()))
 
     # Build final link list: existing valid items first, then new links, then new sites
     final_links: list[pxr.Sdf.Path] = []
@@ -15,6 +15,20 @@
 
 from .bindings import _surface_gripper  # noqa: F401
 from .impl import Extension  # noqa: F401 (loaded for Kit extension discovery)
-from .impl import GripperView, create_surface_gripper
+from .impl import (
+    GripperBackend,
+    GripperStatusCode,
+    GripperView,
+    PluginGripperBackend,
+    SimulatedGripperBackend,
+    create_surface_gripper,
+)
 
-__all__ = ["GripperView", "create_surface_gripper"]
+__all__ = [
+    "GripperBackend",
+    "GripperStatusCode",
+    "GripperView",
+    "PluginGripperBackend",
+    "SimulatedGripperBackend",
+    "create_surface_gripper",
+]
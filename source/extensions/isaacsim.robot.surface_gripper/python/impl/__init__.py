@@ -17,7 +17,15 @@
 
 from .commands import CreateSurfaceGripper  # noqa: F401 (triggers Kit command registration)
 from .extension import Extension  # noqa: F401 (loaded for Kit extension discovery)
+from .gripper_backend import GripperBackend, GripperStatusCode, PluginGripperBackend, SimulatedGripperBackend
 from .gripper_view import GripperView
 from .surface_gripper import create_surface_gripper
 
-__all__ = ["GripperView", "create_surface_gripper"]
+__all__ = [
+    "GripperBackend",
+    "GripperStatusCode",
+    "GripperView",
+    "PluginGripperBackend",
+    "SimulatedGripperBackend",
+    "create_surface_gripper",
+]
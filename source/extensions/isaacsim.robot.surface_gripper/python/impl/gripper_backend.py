@@ -0,0 +1,216 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Backends providing bulk access to the simulation state of surface grippers."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from enum import IntEnum
+
+import numpy as np
+
+OPEN_ACTION_THRESHOLD = -0.3
+#: Gripper actions below this value open the gripper.
+
+CLOSE_ACTION_THRESHOLD = 0.3
+#: Gripper actions above this value close the gripper.
+
+
+class GripperStatusCode(IntEnum):
+    """Numeric surface gripper status codes.
+
+    The values match the ``GripperStatus`` enumeration of the surface gripper plugin and bindings.
+    """
+
+    NOT_FOUND = -1
+    """No surface gripper exists at the queried path."""
+
+    OPEN = 0
+    """Gripper is open."""
+
+    CLOSING = 1
+    """Gripper is in the process of closing."""
+
+    CLOSED = 2
+    """Gripper is closed."""
+
+
+class GripperBackend(ABC):
+    """Interface for bulk access to the status, gripped objects and actions of surface grippers.
+
+    Backends are queried with the prim paths of the grippers and exchange NumPy arrays with the
+    :class:`~isaacsim.robot.surface_gripper.GripperView`.
+    """
+
+    @abstractmethod
+    def get_status(self, prim_paths: list[str]) -> np.ndarray:
+        """Get the status codes of surface grippers.
+
+        Args:
+            prim_paths: Prim paths of the grippers. Shape (M,).
+
+        Returns:
+            :class:`GripperStatusCode` values as int32. Shape (M,).
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_gripped_objects(self, prim_paths: list[str]) -> list[list[str]]:
+        """Get the objects held by surface grippers.
+
+        Args:
+            prim_paths: Prim paths of the grippers. Shape (M,).
+
+        Returns:
+            Prim paths of the gripped objects of each gripper. Shape (M,).
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def set_actions(self, prim_paths: list[str], actions: np.ndarray) -> None:
+        """Apply actions to surface grippers.
+
+        Args:
+            prim_paths: Prim paths of the grippers. Shape (M,).
+            actions: Action values, below ``OPEN_ACTION_THRESHOLD`` opens and above ``CLOSE_ACTION_THRESHOLD``
+                closes the gripper. Shape (M,).
+        """
+        raise NotImplementedError
+
+
+class PluginGripperBackend(GripperBackend):
+    """Backend using the batched functions of the surface gripper plugin interface.
+
+    Args:
+        interface: Surface gripper interface. Defaults to None, which acquires the interface.
+    """
+
+    def __init__(self, interface: object | None = None) -> None:
+        if interface is None:
+            from isaacsim.robot.surface_gripper import _surface_gripper as surface_gripper
+
+            interface = surface_gripper.acquire_surface_gripper_interface()
+        self.interface = interface
+
+    def get_status(self, prim_paths: list[str]) -> np.ndarray:
+        """Get the status codes of surface grippers.
+
+        Args:
+            prim_paths: Prim paths of the grippers. Shape (M,).
+
+        Returns:
+            :class:`GripperStatusCode` values as int32. Shape (M,).
+        """
+        if not prim_paths:
+            return np.zeros(0, dtype=np.int32)
+        return np.asarray(self.interface.get_gripper_status_batch(prim_paths), dtype=np.int32)
+
+    def get_gripped_objects(self, prim_paths: list[str]) -> list[list[str]]:
+        """Get the objects held by surface grippers.
+
+        Args:
+            prim_paths: Prim paths of the grippers. Shape (M,).
+
+        Returns:
+            Prim paths of the gripped objects of each gripper. Shape (M,).
+        """
+        if not prim_paths:
+            return []
+        return self.interface.get_gripped_objects_batch(prim_paths)
+
+    def set_actions(self, prim_paths: list[str], actions: np.ndarray) -> None:
+        """Apply actions to surface grippers.
+
+        Args:
+            prim_paths: Prim paths of the grippers. Shape (M,).
+            actions: Action values. Shape (M,).
+        """
+        if prim_paths:
+            self.interface.set_gripper_action_batch(prim_paths, np.asarray(actions, dtype=np.float32).tolist())
+
+
+class SimulatedGripperBackend(GripperBackend):
+    """Pure-Python stand-in for the surface gripper plugin.
+
+    Keeps the status of each gripper in memory and follows the plugin's action thresholds: opening releases
+    the held objects, closing grips the objects placed in reach with :meth:`set_objects_in_reach` or keeps
+    the gripper closing if there are none. Useful to test code built on
+    :class:`~isaacsim.robot.surface_gripper.GripperView` without running the simulation.
+
+    Example:
+
+    .. code-block:: python
+
+        >>> backend = SimulatedGripperBackend()
+        >>> backend.set_objects_in_reach("/World/Gripper", ["/World/Cube"])
+        >>> backend.set_actions(["/World/Gripper"], np.array([1.0]))
+        >>> backend.get_status(["/World/Gripper"])
+        array([2], dtype=int32)
+    """
+
+    def __init__(self) -> None:
+        self._status: dict[str, int] = {}
+        self._objects_in_reach: dict[str, list[str]] = {}
+
+    def set_objects_in_reach(self, prim_path: str, object_paths: list[str]) -> None:
+        """Set the objects a gripper grips when it closes.
+
+        Args:
+            prim_path: Prim path of the gripper.
+            object_paths: Prim paths of the objects in reach of the gripper.
+        """
+        self._objects_in_reach[prim_path] = list(object_paths)
+        if self._status.get(prim_path) == GripperStatusCode.CLOSING and object_paths:
+            self._status[prim_path] = GripperStatusCode.CLOSED
+
+    def get_status(self, prim_paths: list[str]) -> np.ndarray:
+        """Get the status codes of surface grippers.
+
+        Args:
+            prim_paths: Prim paths of the grippers. Shape (M,).
+
+        Returns:
+            :class:`GripperStatusCode` values as int32, grippers that never received an action are open. Shape (M,).
+        """
+        return np.array([self._status.get(path, GripperStatusCode.OPEN) for path in prim_paths], dtype=np.int32)
+
+    def get_gripped_objects(self, prim_paths: list[str]) -> list[list[str]]:
+        """Get the objects held by surface grippers.
+
+        Args:
+            prim_paths: Prim paths of the grippers. Shape (M,).
+
+        Returns:
+            Prim paths of the gripped objects of each gripper. Shape (M,).
+        """
+        return [
+            list(self._objects_in_reach.get(path, [])) if self._status.get(path) == GripperStatusCode.CLOSED else []
+            for path in prim_paths
+        ]
+
+    def set_actions(self, prim_paths: list[str], actions: np.ndarray) -> None:
+        """Apply actions to surface grippers.
+
+        Args:
+            prim_paths: Prim paths of the grippers. Shape (M,).
+            actions: Action values. Shape (M,).
+        """
+        for path, action in zip(prim_paths, np.asarray(actions, dtype=np.float32).tolist()):
+            if action < OPEN_ACTION_THRESHOLD:
+                self._status[path] = GripperStatusCode.OPEN
+            elif action > CLOSE_ACTION_THRESHOLD and self._status.get(path) != GripperStatusCode.CLOSED:
+                closed = bool(self._objects_in_reach.get(path))
+                self._status[path] = GripperStatusCode.CLOSED if closed else GripperStatusCode.CLOSING
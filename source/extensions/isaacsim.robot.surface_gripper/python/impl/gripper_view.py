@@ -22,8 +22,13 @@ import numpy as np
 import warp as wp
 from isaacsim.core.experimental.prims import XformPrim
 from isaacsim.robot.surface_gripper import _surface_gripper as surface_gripper
+from pxr import Sdf
 from usd.schema.isaac import robot_schema
 
+from .gripper_backend import GripperBackend, PluginGripperBackend
+
+_PROPERTY_NAMES = ("max_grip_distance", "coaxial_force_limit", "shear_force_limit", "retry_interval")
+
 
 class GripperView(XformPrim):
     """Provides high level functions to deal with batched data from surface gripper.
@@ -51,6 +56,14 @@ class GripperView(XformPrim):
         reset_xform_op_properties: True if the prims don't have the right set of xform properties (i.e: translate,
                                 orient and scale) ONLY and in that order. Set this parameter to False if the object
                                 were cloned using using the cloner api in isaacsim.core.cloner. Defaults to True.
+        backend: Backend providing the gripper status, gripped objects and actions. Defaults to None, which uses
+                 the surface gripper plugin. A :class:`~isaacsim.robot.surface_gripper.SimulatedGripperBackend` can
+                 be used to run code built on the view without simulating the grippers.
+
+    The view additionally exposes an array interface for large numbers of grippers (e.g. RL tasks):
+    :meth:`get_surface_gripper_status_codes`, :meth:`get_gripped_object_ids`, :meth:`apply_gripper_actions`
+    and the ``*_property_arrays`` methods read and write all selected grippers in bulk and return Warp arrays
+    on the view's device, without string marshalling or per-prim USD reads.
 
     Raises:
         Exception: if translations and positions defined at the same time.
@@ -69,6 +82,7 @@ class GripperView(XformPrim):
         orientations: np.ndarray | wp.array | None = None,
         scales: np.ndarray | wp.array | None = None,
         reset_xform_op_properties: bool = True,
+        backend: GripperBackend | None = None,
     ) -> None:
         XformPrim.__init__(
             self,
@@ -81,6 +95,7 @@ class GripperView(XformPrim):
         )
         self.count = len(self)
         self.surface_gripper_interface = surface_gripper.acquire_surface_gripper_interface()
+        self._backend = backend if backend is not None else PluginGripperBackend(self.surface_gripper_interface)
         # Cache prim paths to avoid repeated USD path queries per step
         self._prim_paths: list[str] = [p.GetPath().pathString for p in self.prims]
         # Cache frequently accessed attribute handles per prim
@@ -94,6 +109,18 @@ class GripperView(XformPrim):
             p.GetAttribute(robot_schema.Attributes.SHEAR_FORCE_LIMIT.name) for p in self.prims
         ]
         self._attr_retry_interval = [p.GetAttribute(robot_schema.Attributes.RETRY_INTERVAL.name) for p in self.prims]
+        self._property_attrs = (
+            self._attr_max_grip_distance,
+            self._attr_coaxial_force_limit,
+            self._attr_shear_force_limit,
+            self._attr_retry_interval,
+        )
+        # Property values written through the view, read back by the array interface without USD queries
+        self._property_values = np.zeros((len(_PROPERTY_NAMES), self.count), dtype=np.float32)
+        self.refresh_surface_gripper_properties()
+        # Registry mapping gripped object paths to integer ids, in order of first appearance
+        self._object_paths: list[str] = []
+        self._object_ids: dict[str, int] = {}
         self.set_surface_gripper_properties(max_grip_distance, coaxial_force_limit, shear_force_limit, retry_interval)
 
     def __del__(self) -> None:
@@ -111,7 +138,7 @@ class GripperView(XformPrim):
         """
         indices = ops_utils.resolve_indices(indices, count=self.count, device="cpu").numpy()
         prim_paths = [self._prim_paths[i] for i in indices]
-        return self.surface_gripper_interface.get_gripper_status_batch(prim_paths)
+        return self._backend.get_status(prim_paths).tolist()
 
     def get_gripped_objects(self, indices: list | np.ndarray | wp.array | None = None) -> list[str]:
         """Get the gripped objects for the surface grippers.
@@ -124,7 +151,7 @@ class GripperView(XformPrim):
         """
         indices = ops_utils.resolve_indices(indices, count=self.count, device="cpu").numpy()
         prim_paths = [self._prim_paths[i] for i in indices]
-        return self.surface_gripper_interface.get_gripped_objects_batch(prim_paths)
+        return self._backend.get_gripped_objects(prim_paths)
 
     def get_surface_gripper_properties(
         self, indices: list | np.ndarray | wp.array | None = None
@@ -175,9 +202,9 @@ class GripperView(XformPrim):
 
         indices = ops_utils.resolve_indices(indices, count=self.count, device="cpu").numpy()
         prim_paths = [self._prim_paths[i] for i in indices]
-        change_values = [values[i] for i in indices]
+        change_values = np.array([values[i] for i in indices], dtype=np.float32)
         if len(prim_paths) > 0:
-            self.surface_gripper_interface.set_gripper_action_batch(prim_paths, change_values)
+            self._backend.set_actions(prim_paths, change_values)
 
         return
 
@@ -219,6 +246,7 @@ class GripperView(XformPrim):
                 if i >= len(max_grip_distance):
                     raise ValueError("Indices should be compatible with length of max_grip_distance")
                 self._attr_max_grip_distance[i].Set(max_grip_distance[i])
+                self._property_values[0, i] = max_grip_distance[i]
 
         # Setup coaxial force limit if provided
         if coaxial_force_limit is not None:
@@ -231,6 +259,7 @@ class GripperView(XformPrim):
                 if i >= len(coaxial_force_limit):
                     raise ValueError("Indices should be compatible with length of coaxial_force_limit")
                 self._attr_coaxial_force_limit[i].Set(coaxial_force_limit[i])
+                self._property_values[1, i] = coaxial_force_limit[i]
 
         # Setup shear force limit if provided
         if shear_force_limit is not None:
@@ -243,6 +272,7 @@ class GripperView(XformPrim):
                 if i >= len(shear_force_limit):
                     raise ValueError("Indices should be compatible with length of shear_force_limit")
                 self._attr_shear_force_limit[i].Set(shear_force_limit[i])
+                self._property_values[2, i] = shear_force_limit[i]
 
         # Setup retry interval if provided
         if retry_interval is not None:
@@ -255,5 +285,156 @@ class GripperView(XformPrim):
                 if i >= len(retry_interval):
                     raise ValueError("Indices should be compatible with length of retry_interval")
                 self._attr_retry_interval[i].Set(retry_interval[i])
+                self._property_values[3, i] = retry_interval[i]
 
         return
+
+    def refresh_surface_gripper_properties(self) -> None:
+        """Read the properties of all surface grippers from the stage into the view.
+
+        The array interface (:meth:`get_surface_gripper_property_arrays`) returns the values last written
+        through the view. Call this method after authoring the gripper properties on the stage by other means.
+        """
+        for k, attrs in enumerate(self._property_attrs):
+            values = [attr.Get() if attr else None for attr in attrs]
+            self._property_values[k] = [0.0 if value is None else value for value in values]
+
+    def get_surface_gripper_status_codes(self, indices: list | np.ndarray | wp.array | None = None) -> wp.array:
+        """Get the status of the surface grippers as integer codes.
+
+        Args:
+            indices: Specific surface grippers to query. Shape (M,). Defaults to None (i.e: all prims in the view).
+
+        Returns:
+            :class:`~isaacsim.robot.surface_gripper.GripperStatusCode` values (int32). Shape (M,).
+
+        Example:
+
+        .. code-block:: python
+
+            >>> status = gripper_view.get_surface_gripper_status_codes()
+            >>> closed = status.numpy() == GripperStatusCode.CLOSED
+        """
+        indices = ops_utils.resolve_indices(indices, count=self.count, device="cpu").numpy()
+        status = self._backend.get_status([self._prim_paths[i] for i in indices])
+        return ops_utils.place(status, dtype=wp.int32, device=self._device)
+
+    def get_gripped_object_ids(
+        self, indices: list | np.ndarray | wp.array | None = None, max_objects: int | None = None
+    ) -> wp.array:
+        """Get integer ids of the objects held by the surface grippers.
+
+        Each gripped object path is assigned a stable id by the view the first time it is gripped.
+        Use :meth:`get_gripped_object_paths` to convert ids back to prim paths.
+
+        Args:
+            indices: Specific surface grippers to query. Shape (M,). Defaults to None (i.e: all prims in the view).
+            max_objects: Number of id columns. Defaults to None, which uses the largest number of objects held
+                by a queried gripper (at least 1). Objects beyond this number are dropped.
+
+        Returns:
+            Gripped object ids (int32), padded with -1. Shape (M, max_objects).
+        """
+        indices = ops_utils.resolve_indices(indices, count=self.count, device="cpu").numpy()
+        gripped = self._backend.get_gripped_objects([self._prim_paths[i] for i in indices])
+        if max_objects is None:
+            max_objects = max([1] + [len(objects) for objects in gripped])
+        ids = np.full((len(gripped), max_objects), -1, dtype=np.int32)
+        for row, objects in enumerate(gripped):
+            for column, path in enumerate(objects[:max_objects]):
+                object_id = self._object_ids.get(path)
+                if object_id is None:
+                    object_id = self._object_ids[path] = len(self._object_paths)
+                    self._object_paths.append(path)
+                ids[row, column] = object_id
+        return ops_utils.place(ids, dtype=wp.int32, device=self._device)
+
+    def get_gripped_object_paths(self, ids: list | np.ndarray | wp.array) -> list[str]:
+        """Convert gripped object ids returned by :meth:`get_gripped_object_ids` to prim paths.
+
+        Args:
+            ids: Gripped object ids. Any shape, flattened.
+
+        Returns:
+            Prim path of each id, empty string for the -1 padding.
+        """
+        ids = ids.numpy() if isinstance(ids, wp.array) else np.asarray(ids)
+        return [self._object_paths[i] if i >= 0 else "" for i in ids.reshape(-1).tolist()]
+
+    def get_surface_gripper_property_arrays(
+        self, indices: list | np.ndarray | wp.array | None = None
+    ) -> tuple[wp.array, wp.array, wp.array, wp.array]:
+        """Get the properties of the surface grippers as arrays.
+
+        Args:
+            indices: Specific surface grippers to query. Shape (M,). Defaults to None (i.e: all prims in the view).
+
+        Returns:
+            A tuple of (max_grip_distance, coaxial_force_limit, shear_force_limit, retry_interval) float32 arrays.
+            Shape (M,) each.
+        """
+        indices = ops_utils.resolve_indices(indices, count=self.count, device="cpu").numpy()
+        values = self._property_values[:, indices]
+        return tuple(ops_utils.place(values[k], dtype=wp.float32, device=self._device) for k in range(len(values)))
+
+    def set_surface_gripper_property_arrays(
+        self,
+        max_grip_distance: float | list | np.ndarray | wp.array | None = None,
+        coaxial_force_limit: float | list | np.ndarray | wp.array | None = None,
+        shear_force_limit: float | list | np.ndarray | wp.array | None = None,
+        retry_interval: float | list | np.ndarray | wp.array | None = None,
+        indices: list | np.ndarray | wp.array | None = None,
+    ) -> None:
+        """Set the properties of the surface grippers from arrays.
+
+        All values are written to the stage inside a single change block.
+
+        Args:
+            max_grip_distance: New maximum grip distance. Broadcastable to shape (M,).
+                Defaults to None, which means left unchanged.
+            coaxial_force_limit: New coaxial force limit. Broadcastable to shape (M,).
+                Defaults to None, which means left unchanged.
+            shear_force_limit: New shear force limit. Broadcastable to shape (M,).
+                Defaults to None, which means left unchanged.
+            retry_interval: New retry interval. Broadcastable to shape (M,).
+                Defaults to None, which means left unchanged.
+            indices: Specific surface grippers to update. Shape (M,). Defaults to None (i.e: all prims in the view).
+
+        Raises:
+            ValueError: If a value is not broadcastable to the number of selected grippers.
+        """
+        indices = ops_utils.resolve_indices(indices, count=self.count, device="cpu").numpy()
+        updates = []
+        for k, values in enumerate((max_grip_distance, coaxial_force_limit, shear_force_limit, retry_interval)):
+            if values is None:
+                continue
+            values = values.numpy() if isinstance(values, wp.array) else np.asarray(values)
+            try:
+                values = np.broadcast_to(values.astype(np.float32).reshape(-1), (indices.shape[0],))
+            except ValueError as e:
+                raise ValueError(f"{_PROPERTY_NAMES[k]} is not compatible with {indices.shape[0]} grippers") from e
+            updates.append((k, values))
+        with Sdf.ChangeBlock():
+            for k, values in updates:
+                attrs = self._property_attrs[k]
+                for i, value in zip(indices.tolist(), values.tolist()):
+                    attrs[i].Set(value)
+                self._property_values[k, indices] = values
+
+    def apply_gripper_actions(
+        self, actions: float | list | np.ndarray | wp.array, indices: list | np.ndarray | wp.array | None = None
+    ) -> None:
+        """Apply actions to the surface grippers from an array.
+
+        Values less than -0.3 open the gripper, values greater than 0.3 close the gripper, and values in between
+        have no effect.
+
+        Args:
+            actions: Actions of the selected grippers. Broadcastable to shape (M,).
+            indices: Specific surface grippers to update. Shape (M,). Defaults to None (i.e: all prims in the view).
+        """
+        indices = ops_utils.resolve_indices(indices, count=self.count, device="cpu").numpy()
+        actions = actions.numpy() if isinstance(actions, wp.array) else np.asarray(actions)
+        actions = np.broadcast_to(actions.astype(np.float32).reshape(-1), (indices.shape[0],))
+        if indices.shape[0] > 0:
+            self._backend.set_actions([self._prim_paths[i] for i in indices], actions)
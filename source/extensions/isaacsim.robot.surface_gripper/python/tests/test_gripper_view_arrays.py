@@ -0,0 +1,147 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Verifies the array interface of GripperView using the simulated gripper backend."""
+
+import numpy as np
+import omni.kit.app
+import omni.kit.test
+import omni.usd
+from isaacsim.robot.surface_gripper import (
+    GripperBackend,
+    GripperStatusCode,
+    GripperView,
+    SimulatedGripperBackend,
+    create_surface_gripper,
+)
+from isaacsim.robot.surface_gripper.bindings._surface_gripper import GripperStatus
+from pxr import Tf, Usd, UsdGeom
+from usd.schema.isaac import robot_schema
+
+
+class TestGripperViewArrays(omni.kit.test.AsyncTestCase):
+    """Test the bulk status, gripped object and property arrays of the gripper view without simulation."""
+
+    async def setUp(self) -> None:
+        """Create a stage with a few surface grippers and a view using the simulated backend."""
+        await omni.usd.get_context().new_stage_async()
+        self.stage = omni.usd.get_context().get_stage()
+        self.count = 4
+        self.gripper_paths = []
+        for i in range(self.count):
+            UsdGeom.Xform.Define(self.stage, f"/env{i}")
+            self.gripper_paths.append(create_surface_gripper(self.stage, f"/env{i}").GetPath().pathString)
+        self.backend = SimulatedGripperBackend()
+        self.gripper_view = GripperView(paths="/env.*/SurfaceGripper", backend=self.backend)
+
+    async def tearDown(self) -> None:
+        """Release the view after each test."""
+        self.gripper_view = None
+        await omni.kit.app.get_app().next_update_async()
+
+    async def test_status_codes_match_plugin_enumeration(self) -> None:
+        """Test that the status codes use the values of the bindings' status enumeration."""
+        self.assertEqual(int(GripperStatusCode.OPEN), int(GripperStatus.Open))
+        self.assertEqual(int(GripperStatusCode.CLOSING), int(GripperStatus.Closing))
+        self.assertEqual(int(GripperStatusCode.CLOSED), int(GripperStatus.Closed))
+
+    async def test_incomplete_backend_cannot_be_instantiated(self) -> None:
+        """Test that a backend missing one of the interface methods fails when it is created."""
+
+        class StatusOnlyBackend(GripperBackend):
+            def get_status(self, prim_paths: list[str]) -> np.ndarray:
+                return np.zeros(len(prim_paths), dtype=np.int32)
+
+        with self.assertRaises(TypeError):
+            StatusOnlyBackend()
+
+    async def test_apply_actions_and_status_codes(self) -> None:
+        """Test bulk actions, status codes and their agreement with the list interface."""
+        self.backend.set_objects_in_reach(self.gripper_paths[0], ["/env0/box"])
+        self.backend.set_objects_in_reach(self.gripper_paths[2], ["/env2/box"])
+
+        self.gripper_view.apply_gripper_actions(1.0)
+        status = self.gripper_view.get_surface_gripper_status_codes().numpy()
+        closed, closing = GripperStatusCode.CLOSED, GripperStatusCode.CLOSING
+        expected = [closed, closing, closed, closing]
+        np.testing.assert_array_equal(status, expected)
+        self.assertEqual(status.dtype, np.int32)
+        self.assertEqual(self.gripper_view.get_surface_gripper_status(), status.tolist())
+
+        # Open a subset, in-between actions have no effect
+        self.gripper_view.apply_gripper_actions(np.array([-1.0, 0.0]), indices=[0, 1])
+        status = self.gripper_view.get_surface_gripper_status_codes(indices=[0, 1, 2]).numpy()
+        np.testing.assert_array_equal(
+            status, [GripperStatusCode.OPEN, GripperStatusCode.CLOSING, GripperStatusCode.CLOSED]
+        )
+
+    async def test_gripped_object_ids(self) -> None:
+        """Test that gripped objects are returned as padded integer ids that map back to paths."""
+        self.backend.set_objects_in_reach(self.gripper_paths[1], ["/env1/boxA", "/env1/boxB"])
+        self.backend.set_objects_in_reach(self.gripper_paths[3], ["/env1/boxB"])
+        self.gripper_view.apply_gripper_actions(1.0)
+
+        ids = self.gripper_view.get_gripped_object_ids().numpy()
+        self.assertEqual(ids.shape, (self.count, 2))
+        np.testing.assert_array_equal(ids[0], [-1, -1])
+        np.testing.assert_array_equal(ids[2], [-1, -1])
+        self.assertEqual(ids[3, 0], ids[1, 1])
+        self.assertEqual(self.gripper_view.get_gripped_object_paths(ids[1]), ["/env1/boxA", "/env1/boxB"])
+        self.assertEqual(self.gripper_view.get_gripped_object_paths(ids[3]), ["/env1/boxB", ""])
+        self.assertEqual(self.gripper_view.get_gripped_objects(indices=[1])[0], ["/env1/boxA", "/env1/boxB"])
+
+        # Ids stay stable between queries and the number of columns can be fixed
+        ids_fixed = self.gripper_view.get_gripped_object_ids(indices=[1, 3], max_objects=4).numpy()
+        np.testing.assert_array_equal(ids_fixed, [[ids[1, 0], ids[1, 1], -1, -1], [ids[3, 0], -1, -1, -1]])
+
+    async def test_property_arrays(self) -> None:
+        """Test bulk property writes in one change block and reads without USD queries."""
+        notices = []
+        listener = Tf.Notice.Register(Usd.Notice.ObjectsChanged, lambda notice, _: notices.append(notice), self.stage)
+        try:
+            self.gripper_view.set_surface_gripper_property_arrays(
+                max_grip_distance=np.array([0.1, 0.2, 0.3, 0.4]),
+                coaxial_force_limit=100.0,
+                shear_force_limit=[10.0, 20.0, 30.0, 40.0],
+                retry_interval=0.5,
+            )
+        finally:
+            listener.Revoke()
+        self.assertEqual(len(notices), 1)
+
+        max_grip_distance, coaxial_force_limit, shear_force_limit, retry_interval = (
+            self.gripper_view.get_surface_gripper_property_arrays()
+        )
+        np.testing.assert_allclose(max_grip_distance.numpy(), [0.1, 0.2, 0.3, 0.4], rtol=1e-6)
+        np.testing.assert_allclose(coaxial_force_limit.numpy(), [100.0] * self.count)
+        np.testing.assert_allclose(shear_force_limit.numpy(), [10.0, 20.0, 30.0, 40.0])
+        np.testing.assert_allclose(retry_interval.numpy(), [0.5] * self.count)
+
+        # Partial updates are written to the stage and visible through the list interface
+        self.gripper_view.set_surface_gripper_property_arrays(max_grip_distance=[1.0, 2.0], indices=[1, 3])
+        values = self.gripper_view.get_surface_gripper_properties()
+        np.testing.assert_allclose(values[0], [0.1, 1.0, 0.3, 2.0], rtol=1e-6)
+        np.testing.assert_allclose(
+            self.gripper_view.get_surface_gripper_property_arrays(indices=[3])[0].numpy(), [2.0], rtol=1e-6
+        )
+
+        with self.assertRaises(ValueError):
+            self.gripper_view.set_surface_gripper_property_arrays(retry_interval=[1.0, 2.0, 3.0])
+
+        # Values authored outside of the view are picked up after a refresh
+        prim = self.stage.GetPrimAtPath(self.gripper_paths[0])
+        prim.GetAttribute(robot_schema.Attributes.RETRY_INTERVAL.name).Set(2.5)
+        self.gripper_view.refresh_surface_gripper_properties()
+        self.assertAlmostEqual(float(self.gripper_view.get_surface_gripper_property_arrays()[3].numpy()[0]), 2.5)
@@ -0,0 +1,305 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Helpers for sweeping gain candidates over many robot instances at once.
+
+A gain sweep drives N copies of the robot (cloned with :func:`create_gain_sweep_instances` or existing
+vectorized environments) with the same test signal, each copy running a different stiffness/damping candidate.
+Tracking errors are scored per candidate and ranked into Pareto fronts, see :class:`GainSweepResult`.
+"""
+
+from __future__ import annotations
+
+import itertools
+from dataclasses import dataclass
+
+import numpy as np
+from pxr import Gf, Sdf, Usd, UsdGeom, UsdPhysics
+
+DEFAULT_SWEEP_ROOT_PATH = "/GainSweep"
+"""Default path under which :func:`create_gain_sweep_instances` authors the robot instances."""
+
+
+@dataclass
+class GainSweepResult:
+    """Scores of the gain candidates evaluated by a gain sweep.
+
+    Args:
+        stiffnesses: Stiffness of each candidate, shape ``(C, D)``.
+        dampings: Damping of each candidate, shape ``(C, D)``.
+        dof_indices: Tested DOF indices.
+        position_rmse: Position tracking RMSE per candidate and DOF, shape ``(C, D)``. Zero for untested DOFs.
+        velocity_rmse: Velocity tracking RMSE per candidate and DOF, shape ``(C, D)``. Zero for untested DOFs.
+        position_error: Mean position RMSE over the tested position-controlled DOFs, shape ``(C,)``.
+        velocity_error: Mean velocity RMSE over the tested velocity-controlled DOFs, shape ``(C,)``.
+        relative_stiffness: Mean stiffness over the tested DOFs, each DOF normalized by its largest candidate
+            stiffness, shape ``(C,)``.
+        pareto_ranks: Pareto front of each candidate (0 is non-dominated), shape ``(C,)``.
+    """
+
+    stiffnesses: np.ndarray
+    dampings: np.ndarray
+    dof_indices: list[int]
+    position_rmse: np.ndarray
+    velocity_rmse: np.ndarray
+    position_error: np.ndarray
+    velocity_error: np.ndarray
+    relative_stiffness: np.ndarray
+    pareto_ranks: np.ndarray
+
+    def pareto_table(self, max_rank: int = 0) -> list[dict]:
+        """Tabulate the candidates of the first Pareto fronts.
+
+        Candidates are compared on position error, velocity error and relative stiffness: a candidate is
+        dominated when another one tracks at least as well on both errors with gains no larger.
+
+        Args:
+            max_rank: Last Pareto front included (0 only includes the non-dominated candidates).
+
+        Returns:
+            One row per candidate, sorted by Pareto rank then position and velocity error. Each row has the
+            keys ``candidate``, ``rank``, ``position_error``, ``velocity_error``, ``relative_stiffness``,
+            ``stiffnesses`` and ``dampings`` (per tested DOF).
+
+        Example:
+
+        .. code-block:: python
+
+            for row in result.pareto_table():
+                print(row["candidate"], row["position_error"], row["stiffnesses"])
+        """
+        candidates = np.flatnonzero(self.pareto_ranks <= max_rank)
+        order = np.lexsort(
+            (self.velocity_error[candidates], self.position_error[candidates], self.pareto_ranks[candidates])
+        )
+        return [
+            {
+                "candidate": int(c),
+                "rank": int(self.pareto_ranks[c]),
+                "position_error": float(self.position_error[c]),
+                "velocity_error": float(self.velocity_error[c]),
+                "relative_stiffness": float(self.relative_stiffness[c]),
+                "stiffnesses": self.stiffnesses[c, self.dof_indices].tolist(),
+                "dampings": self.dampings[c, self.dof_indices].tolist(),
+            }
+            for c in candidates[order]
+        ]
+
+
+def make_gain_candidates(
+    stiffnesses: np.ndarray, dampings: np.ndarray, stiffness_scales: list[float], damping_scales: list[float]
+) -> tuple[np.ndarray, np.ndarray]:
+    """Build gain candidates by scaling base gains on a grid.
+
+    Args:
+        stiffnesses: Base stiffness per DOF, shape ``(D,)``.
+        dampings: Base damping per DOF, shape ``(D,)``.
+        stiffness_scales: Factors applied to all base stiffnesses.
+        damping_scales: Factors applied to all base dampings.
+
+    Returns:
+        Tuple of (stiffnesses, dampings), each of shape ``(len(stiffness_scales) * len(damping_scales), D)``.
+        Damping varies fastest.
+
+    Example:
+
+    .. code-block:: python
+
+        stiffnesses, dampings = make_gain_candidates(k, d, [0.5, 1.0, 2.0], [0.5, 1.0, 2.0])
+    """
+    stiffnesses = np.asarray(stiffnesses, dtype=np.float64)
+    dampings = np.asarray(dampings, dtype=np.float64)
+    scales = np.array(list(itertools.product(stiffness_scales, damping_scales)), dtype=np.float64).reshape(-1, 2)
+    return scales[:, :1] * stiffnesses[None, :], scales[:, 1:] * dampings[None, :]
+
+
+def compute_tracking_rmse(commands: np.ndarray, observed: np.ndarray) -> np.ndarray:
+    """Compute the tracking RMSE of every instance and DOF.
+
+    Args:
+        commands: Commanded values shared by all instances, shape ``(T, D)``.
+        observed: Observed values, shape ``(T, N, D)``.
+
+    Returns:
+        RMSE per instance and DOF, shape ``(N, D)``.
+    """
+    return np.sqrt(np.mean(np.square(observed - commands[:, None, :]), axis=0))
+
+
+def compute_pareto_ranks(objectives: np.ndarray) -> np.ndarray:
+    """Rank points into successive Pareto fronts (all objectives minimized).
+
+    Args:
+        objectives: Objective values, shape ``(C, K)``.
+
+    Returns:
+        Front index of each point, shape ``(C,)``. Points of front 0 are not dominated by any other point.
+    """
+    objectives = np.asarray(objectives, dtype=np.float64)
+    # dominates[i, j] is True when point i is no worse than point j everywhere and better somewhere
+    no_worse = (objectives[:, None, :] <= objectives[None, :, :]).all(axis=2)
+    better = (objectives[:, None, :] < objectives[None, :, :]).any(axis=2)
+    dominates = no_worse & better
+
+    ranks = np.full(len(objectives), -1, dtype=np.int64)
+    remaining = np.ones(len(objectives), dtype=bool)
+    rank = 0
+    while remaining.any():
+        front = remaining & ~(dominates[remaining].any(axis=0))
+        ranks[front] = rank
+        remaining &= ~front
+        rank += 1
+    return ranks
+
+
+def score_gain_sweep(
+    stiffnesses: np.ndarray,
+    dampings: np.ndarray,
+    dof_indices: list[int],
+    position_dof_indices: list[int],
+    velocity_dof_indices: list[int],
+    position_rmse: np.ndarray,
+    velocity_rmse: np.ndarray,
+) -> GainSweepResult:
+    """Score the candidates of a gain sweep and rank them into Pareto fronts.
+
+    Args:
+        stiffnesses: Stiffness of each candidate, shape ``(C, D)``.
+        dampings: Damping of each candidate, shape ``(C, D)``.
+        dof_indices: Tested DOF indices.
+        position_dof_indices: Tested DOFs under position control.
+        velocity_dof_indices: Tested DOFs under velocity control.
+        position_rmse: Position tracking RMSE per candidate and DOF, shape ``(C, D)``.
+        velocity_rmse: Velocity tracking RMSE per candidate and DOF, shape ``(C, D)``.
+
+    Returns:
+        The scored sweep.
+    """
+    num_candidates = len(stiffnesses)
+    position_error = (
+        position_rmse[:, position_dof_indices].mean(axis=1) if position_dof_indices else np.zeros(num_candidates)
+    )
+    velocity_error = (
+        velocity_rmse[:, velocity_dof_indices].mean(axis=1) if velocity_dof_indices else np.zeros(num_candidates)
+    )
+    tested_stiffnesses = np.abs(stiffnesses[:, dof_indices])
+    largest = tested_stiffnesses.max(axis=0, initial=0.0)
+    relative_stiffness = (tested_stiffnesses / np.where(largest > 0.0, largest, 1.0)).mean(axis=1)
+    pareto_ranks = compute_pareto_ranks(np.stack([position_error, velocity_error, relative_stiffness], axis=1))
+    return GainSweepResult(
+        stiffnesses=stiffnesses,
+        dampings=dampings,
+        dof_indices=list(dof_indices),
+        position_rmse=position_rmse,
+        velocity_rmse=velocity_rmse,
+        position_error=position_error,
+        velocity_error=velocity_error,
+        relative_stiffness=relative_stiffness,
+        pareto_ranks=pareto_ranks,
+    )
+
+
+def create_gain_sweep_instances(
+    stage: Usd.Stage,
+    robot_path: str,
+    articulation_root_path: str,
+    num_instances: int,
+    root_path: str = DEFAULT_SWEEP_ROOT_PATH,
+    spacing: float | None = None,
+) -> list[str]:
+    """Author copies of a robot in the session layer for a gain sweep.
+
+    Each instance references the robot and is placed on a grid next to it, with the same world transform
+    as the source up to the grid offset. Joints anchoring the robot to the world are shifted by the same
+    offset so fixed-base robots stay in their cell. Nothing is written to the root layer, so saving the
+    stage does not save the instances. Create the instances while the simulation is stopped.
+
+    Args:
+        stage: The USD stage.
+        robot_path: Path to the robot prim to copy.
+        articulation_root_path: Path to the articulation root of the robot (see ``find_articulation_root``).
+        num_instances: Number of instances to create.
+        root_path: Path of the scope holding the instances. Existing instances under it are replaced.
+        spacing: Distance between instances in stage units. Defaults to 1.5 times the largest horizontal
+            extent of the robot.
+
+    Returns:
+        Articulation root path of each instance, to be wrapped in one batched ``Articulation``.
+
+    Example:
+
+    .. code-block:: python
+
+        paths = create_gain_sweep_instances(stage, "/World/robot", "/World/robot/root_joint", 16)
+    """
+    robot_prim = stage.GetPrimAtPath(robot_path)
+    robot_path = robot_prim.GetPath()
+    articulation_root_path = Sdf.Path(articulation_root_path)
+    # The articulation root may sit above the robot prim, reference whichever contains the other
+    source_path = robot_path if articulation_root_path.HasPrefix(robot_path) else articulation_root_path
+    source_prim = stage.GetPrimAtPath(source_path)
+
+    xform_cache = UsdGeom.XformCache()
+    parent_to_world = xform_cache.GetParentToWorldTransform(source_prim)
+    if spacing is None:
+        bounds = UsdGeom.BBoxCache(Usd.TimeCode.Default(), [UsdGeom.Tokens.default_]).ComputeWorldBound(source_prim)
+        size = bounds.ComputeAlignedRange().GetSize() if not bounds.GetRange().IsEmpty() else Gf.Vec3d(1.0)
+        spacing = 1.5 * max(size[0], size[1], 1e-3)
+
+    world_anchored_joints = [
+        (prim.GetPath(), body_index)
+        for prim in Usd.PrimRange(source_prim)
+        if prim.IsA(UsdPhysics.Joint)
+        for body_index, rel in enumerate((UsdPhysics.Joint(prim).GetBody0Rel(), UsdPhysics.Joint(prim).GetBody1Rel()))
+        if not rel.GetTargets()
+    ]
+
+    num_per_row = int(np.ceil(np.sqrt(num_instances)))
+    instance_root_paths = []
+    with Usd.EditContext(stage, stage.GetSessionLayer()):
+        if stage.GetPrimAtPath(root_path):
+            stage.RemovePrim(root_path)
+        UsdGeom.Scope.Define(stage, root_path)
+        for i in range(num_instances):
+            # Cells start one spacing away from the source robot so the instances never overlap it
+            offset = Gf.Vec3d((i % num_per_row + 1) * spacing, (i // num_per_row) * spacing, 0.0)
+            env = UsdGeom.Xform.Define(stage, f"{root_path}/env_{i}")
+            env.AddTransformOp().Set(parent_to_world * Gf.Matrix4d().SetTranslate(offset))
+            instance = stage.DefinePrim(f"{root_path}/env_{i}/{source_path.name}")
+            instance.GetReferences().AddInternalReference(source_path)
+            instance_path = instance.GetPath()
+
+            # Frames of world-anchored joints are expressed in world space
+            for joint_path, body_index in world_anchored_joints:
+                joint = UsdPhysics.Joint(stage.GetPrimAtPath(joint_path.ReplacePrefix(source_path, instance_path)))
+                local_pos_attr = joint.GetLocalPos0Attr() if body_index == 0 else joint.GetLocalPos1Attr()
+                local_pos = local_pos_attr.Get()
+                local_pos = Gf.Vec3d(local_pos) if local_pos is not None else Gf.Vec3d(0.0)
+                local_pos_attr.Set(Gf.Vec3f(local_pos + offset))
+
+            instance_root_paths.append(str(articulation_root_path.ReplacePrefix(source_path, instance_path)))
+    return instance_root_paths
+
+
+def remove_gain_sweep_instances(stage: Usd.Stage, root_path: str = DEFAULT_SWEEP_ROOT_PATH) -> None:
+    """Remove the instances authored by :func:`create_gain_sweep_instances`.
+
+    Args:
+        stage: The USD stage.
+        root_path: Path of the scope holding the instances.
+    """
+    with Usd.EditContext(stage, stage.GetSessionLayer()):
+        if stage.GetPrimAtPath(root_path):
+            stage.RemovePrim(root_path)
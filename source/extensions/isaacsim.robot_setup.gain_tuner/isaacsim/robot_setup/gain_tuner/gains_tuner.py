@@ -33,6 +33,7 @@ from isaacsim.core.experimental.prims import Articulation
 from pxr import Gf, Sdf, Usd, UsdPhysics
 
 from .base import RobotTest, TestResult
+from .gain_sweep import GainSweepResult, compute_tracking_rmse, score_gain_sweep
 
 
 class GainsTestMode(IntEnum):
@@ -440,6 +441,10 @@ class GainTuner:
         self._joint_entries = []
         self._active_test = None
         self._test_result_metrics = {}
+        self._gain_sweep_articulation = None
+        self._gain_sweep_stiffnesses = None
+        self._gain_sweep_dampings = None
+        self._gain_sweep_result = None
         self.step = 0
 
     def add_inertia_updated_callback(self, callback: Callable[[], None]) -> None:
@@ -1173,23 +1178,34 @@ class GainTuner:
         self.test_params = test_params
         self._test_duration = test_params.get("test_duration", self._test_duration)
         self._test_result_metrics = {}
-        indices = self.test_params["joint_indices"]
         stiffnesses, dampings = [gains.list() for gains in self._articulation.get_dof_gains()]
+        self.joint_modes = self._get_joint_modes(self.test_params["joint_indices"], stiffnesses, dampings)
 
-        self.joint_modes = {}
-        for index in range(len(indices)):
-            dof_idx = indices[index]
+        self._test_timestep = 0
+        self._data_ready = False
+        self._gains_test_generator = self._gains_test_generator_fn()
+
+    def _get_joint_modes(self, indices: list[int], stiffnesses: list[float], dampings: list[float]) -> dict[int, int]:
+        """Classify the tested DOFs by control mode from their gains.
+
+        Args:
+            indices: Tested DOF indices.
+            stiffnesses: Stiffness of every DOF.
+            dampings: Damping of every DOF.
+
+        Returns:
+            Mapping of DOF index to JointMode.
+        """
+        joint_modes = {}
+        for dof_idx in indices:
             if stiffnesses[dof_idx] != 0:
                 mode = JointMode.POSITION
             elif dampings[dof_idx] != 0:
                 mode = JointMode.VELOCITY
             else:
                 mode = JointMode.NONE
-            self.joint_modes[dof_idx] = mode
-
-        self._test_timestep = 0
-        self._data_ready = False
-        self._gains_test_generator = self._gains_test_generator_fn()
+            joint_modes[dof_idx] = mode
+        return joint_modes
 
     def _compute_gains_test_dof_error_terms(self, joint_index: int) -> tuple[float, float]:
         """Compute RMSE error terms for a single DOF.
@@ -1416,6 +1432,180 @@ class GainTuner:
         self._command_times = np.array(self._command_times)
         self._data_ready = True
 
+    # ======================== Gain Sweep ========================
+
+    def initialize_gain_sweep(
+        self, test_params: dict, instance_paths: list[str], stiffnesses: np.ndarray, dampings: np.ndarray
+    ) -> None:
+        """Initialize a sweep evaluating many gain candidates on copies of the robot at once.
+
+        Every instance is driven by the test signal of ``test_params`` (sinusoidal or step) while running
+        its own candidate gains. With more candidates than instances, the candidates are evaluated in
+        successive batches of one candidate per instance. Advance the sweep with :meth:`update_gains_test`
+        and read the scores with :meth:`get_gain_sweep_result` once it completes.
+
+        The robot set up with :meth:`setup` provides the signal (joint limits and control modes) and is not
+        moved. The instances must share its DOF layout, e.g. paths returned by
+        :func:`~isaacsim.robot_setup.gain_tuner.gain_sweep.create_gain_sweep_instances`.
+
+        Args:
+            test_params: Test configuration, as for :meth:`initialize_gains_test`.
+            instance_paths: Articulation root paths of the robot instances.
+            stiffnesses: Stiffness of each candidate for every DOF, shape ``(C, D)``.
+            dampings: Damping of each candidate for every DOF, shape ``(C, D)``.
+
+        Example:
+
+        .. code-block:: python
+
+            paths = create_gain_sweep_instances(stage, robot_path, articulation_root_path, 16)
+            # ... start the simulation
+            gain_tuner.initialize_gain_sweep(test_params, paths, *make_gain_candidates(k, d, scales, scales))
+        """
+        stiffnesses = np.atleast_2d(np.asarray(stiffnesses, dtype=np.float64))
+        dampings = np.atleast_2d(np.asarray(dampings, dtype=np.float64))
+        if stiffnesses.shape != dampings.shape or stiffnesses.shape[1] != self._articulation.num_dofs:
+            carb.log_error(
+                f"Gain sweep candidates must have shape (C, {self._articulation.num_dofs}), got stiffnesses "
+                f"{stiffnesses.shape} and dampings {dampings.shape}"
+            )
+            return
+
+        self.test_params = test_params
+        self._test_duration = test_params.get("test_duration", self._test_duration)
+        stiffness_gains, damping_gains = [gains.list() for gains in self._articulation.get_dof_gains()]
+        self.joint_modes = self._get_joint_modes(self.test_params["joint_indices"], stiffness_gains, damping_gains)
+
+        self._gain_sweep_articulation = Articulation(instance_paths)
+        self._gain_sweep_stiffnesses = stiffnesses
+        self._gain_sweep_dampings = dampings
+        self._gain_sweep_result = None
+        self._test_timestep = 0
+        self._gains_test_generator = self._gain_sweep_generator_fn()
+
+    def get_gain_sweep_result(self) -> GainSweepResult | None:
+        """Get the scores of the last completed gain sweep.
+
+        Returns:
+            The sweep result, or None if no sweep has completed since it was initialized.
+        """
+        return self._gain_sweep_result
+
+    def _gain_sweep_generator_fn(self) -> Generator:
+        """Generator that runs the gain sweep, one batch of candidates at a time.
+
+        Yields:
+            Control back to the simulation loop after each physics step.
+        """
+        sweep = self._gain_sweep_articulation
+        test_mode = self.test_params["test_mode"]
+        if test_mode not in (GainsTestMode.SINUSOIDAL, GainsTestMode.STEP):
+            carb.log_error(f"Gain sweep supports the sinusoidal and step tests, got test mode {test_mode}")
+            return
+        step_fn = self.sinusoidal_step if test_mode == GainsTestMode.SINUSOIDAL else self.step_step
+
+        # Every batch starts from the state of the instances when the sweep begins
+        positions, orientations = sweep.get_world_poses()
+        linear_velocities, angular_velocities = sweep.get_velocities()
+        sweep.set_default_state(
+            positions=positions,
+            orientations=orientations,
+            linear_velocities=linear_velocities,
+            angular_velocities=angular_velocities,
+            dof_positions=sweep.get_dof_positions(),
+            dof_velocities=sweep.get_dof_velocities(),
+            dof_efforts=sweep.get_dof_efforts(),
+        )
+
+        num_instances = len(sweep)
+        num_candidates, num_dofs = self._gain_sweep_stiffnesses.shape
+        position_rmse = np.zeros((num_candidates, num_dofs))
+        velocity_rmse = np.zeros((num_candidates, num_dofs))
+        dof_indices = list(self.test_params["joint_indices"])
+
+        for batch_start in range(0, num_candidates, num_instances):
+            batch = slice(batch_start, min(batch_start + num_instances, num_candidates))
+            batch_size = batch.stop - batch.start
+            sweep.set_dof_gains(
+                self._gain_sweep_stiffnesses[batch],
+                self._gain_sweep_dampings[batch],
+                indices=list(range(batch_size)),
+                update_default_gains=False,
+            )
+            records = ([], [], [], [])
+            for sequence_index in range(len(self.test_params["sequence"])):
+                yield from self._run_gain_sweep_sequence(sequence_index, step_fn, records)
+
+            position_commands, velocity_commands, observed_positions, observed_velocities = map(np.array, records)
+            batch_position_rmse = compute_tracking_rmse(position_commands, observed_positions[:, :batch_size])
+            batch_velocity_rmse = compute_tracking_rmse(velocity_commands, observed_velocities[:, :batch_size])
+            position_rmse[batch, dof_indices] = batch_position_rmse[:, dof_indices]
+            velocity_rmse[batch, dof_indices] = batch_velocity_rmse[:, dof_indices]
+
+        sweep.reset_to_default_state()
+        self._gain_sweep_result = score_gain_sweep(
+            self._gain_sweep_stiffnesses,
+            self._gain_sweep_dampings,
+            dof_indices,
+            [i for i in dof_indices if self.joint_modes[i] == JointMode.POSITION],
+            [i for i in dof_indices if self.joint_modes[i] == JointMode.VELOCITY],
+            position_rmse,
+            velocity_rmse,
+        )
+
+    def _run_gain_sweep_sequence(
+        self, sequence_index: int, step_fn: callable, records: tuple[list, list, list, list]
+    ) -> Generator:
+        """Run a single test sequence on all sweep instances.
+
+        Mirrors :meth:`_run_test_sequence`, broadcasting the commands of the tuned robot to every instance.
+
+        Args:
+            sequence_index: Index of the sequence to run.
+            step_fn: Function to generate step commands.
+            records: Lists receiving the position commands, velocity commands, observed positions and
+                observed velocities of each sample.
+
+        Yields:
+            Empty tuple to yield control to simulation.
+        """
+        sweep = self._gain_sweep_articulation
+        position_commands, velocity_commands, observed_positions, observed_velocities = records
+        sequence_time = 0
+        sweep.reset_to_default_state()
+
+        pos_idx, pos_cmd, vel_idx, vel_cmd = step_fn(sequence_time, sequence_index)
+        sweep.set_dof_position_targets(pos_cmd, dof_indices=pos_idx)
+        sweep.set_dof_velocity_targets(vel_cmd, dof_indices=vel_idx)
+
+        position_targets = np.copy(sweep.get_dof_position_targets(indices=[0]).numpy()[0])
+        velocity_targets = np.copy(sweep.get_dof_velocity_targets(indices=[0]).numpy()[0])
+
+        position_commands.append(np.copy(position_targets))
+        velocity_commands.append(np.copy(velocity_targets))
+        observed_positions.append(sweep.get_dof_positions().numpy())
+        observed_velocities.append(sweep.get_dof_velocities().numpy())
+
+        yield ()
+
+        while sequence_time < self._test_duration:
+            sequence_time += self.step
+
+            pos_idx, pos_cmd, vel_idx, vel_cmd = step_fn(sequence_time, sequence_index)
+            sweep.set_dof_position_targets(pos_cmd, dof_indices=pos_idx)
+            sweep.set_dof_velocity_targets(vel_cmd, dof_indices=vel_idx)
+
+            position_targets[pos_idx] = pos_cmd
+            velocity_targets[vel_idx] = vel_cmd
+
+            position_commands.append(np.copy(position_targets))
+            velocity_commands.append(np.copy(velocity_targets))
+
+            yield ()
+
+            observed_positions.append(sweep.get_dof_positions().numpy())
+            observed_velocities.append(sweep.get_dof_velocities().numpy())
+
     # ======================== For Plotting ========================
 
     def get_joint_states_from_gains_test(
@@ -35,6 +35,14 @@ import omni.usd
 import usd.schema.isaac.robot_schema as robot_schema
 from isaacsim.core.simulation_manager import PhysicsScene, PhysxScene, SimulationManager
 from isaacsim.robot_setup.gain_tuner.base import RobotTest, TestResult
+from isaacsim.robot_setup.gain_tuner.gain_sweep import (
+    compute_pareto_ranks,
+    compute_tracking_rmse,
+    create_gain_sweep_instances,
+    make_gain_candidates,
+    remove_gain_sweep_instances,
+    score_gain_sweep,
+)
 from isaacsim.robot_setup.gain_tuner.gain_tuner_drive_math import (
     damping_from_damping_ratio_revolute_position,
     damping_ratio_from_stiffness_damping_revolute_position,
@@ -2336,3 +2344,100 @@ class TestOscillationAnalysisMath(omni.kit.test.AsyncTestCase):
         self.assertGreaterEqual(len(res.peak_values), 3)
         self.assertAlmostEqual(res.natural_freq, fn_hz, delta=0.15)
         self.assertAlmostEqual(res.damping_ratio, zeta, delta=0.012)
+
+
+class TestGainSweepScoring(omni.kit.test.AsyncTestCase):
+    """Candidate grids, tracking errors and Pareto ranking of a gain sweep (no physics)."""
+
+    async def test_make_gain_candidates_scales_base_gains(self) -> None:
+        """Candidates are the Cartesian product of the stiffness and damping scales, damping fastest."""
+        stiffnesses, dampings = make_gain_candidates(np.array([10.0, 20.0]), np.array([1.0, 2.0]), [1.0, 2.0], [0.5])
+        np.testing.assert_allclose(stiffnesses, [[10.0, 20.0], [20.0, 40.0]])
+        np.testing.assert_allclose(dampings, [[0.5, 1.0], [0.5, 1.0]])
+        stiffnesses, _ = make_gain_candidates(np.array([1.0]), np.array([1.0]), [1.0, 2.0], [1.0, 3.0])
+        np.testing.assert_allclose(stiffnesses[:, 0], [1.0, 1.0, 2.0, 2.0])
+
+    async def test_tracking_rmse_per_instance(self) -> None:
+        """RMSE is computed per instance against the shared command."""
+        commands = np.zeros((4, 2))
+        observed = np.zeros((4, 3, 2))
+        observed[:, 1, 0] = 2.0
+        observed[::2, 2, 1] = 1.0
+        np.testing.assert_allclose(compute_tracking_rmse(commands, observed), [[0, 0], [2, 0], [0, math.sqrt(0.5)]])
+
+    async def test_pareto_ranks(self) -> None:
+        """Non-dominated points are front 0, points dominated only by front 0 are front 1."""
+        objectives = np.array([[1.0, 4.0], [2.0, 2.0], [4.0, 1.0], [3.0, 3.0], [4.0, 4.0], [2.0, 2.0]])
+        np.testing.assert_array_equal(compute_pareto_ranks(objectives), [0, 0, 0, 1, 2, 0])
+
+    async def test_score_and_pareto_table(self) -> None:
+        """Lower gains with equal tracking dominate, the table lists the front sorted by error."""
+        stiffnesses = np.array([[100.0, 0.0], [200.0, 0.0], [400.0, 0.0]])
+        dampings = np.full((3, 2), 10.0)
+        position_rmse = np.array([[0.3, 9.0], [0.1, 9.0], [0.1, 9.0]])
+        result = score_gain_sweep(stiffnesses, dampings, [0], [0], [], position_rmse, np.zeros((3, 2)))
+        np.testing.assert_allclose(result.relative_stiffness, [0.25, 0.5, 1.0])
+        np.testing.assert_array_equal(result.pareto_ranks, [0, 0, 1])
+        table = result.pareto_table()
+        self.assertEqual([row["candidate"] for row in table], [1, 0])
+        self.assertEqual(table[0]["stiffnesses"], [200.0])
+        self.assertEqual(len(result.pareto_table(max_rank=1)), 3)
+
+
+class TestGainSweep(TestGainTunerHarness):
+    """Gain sweep over robot instances authored in the session layer."""
+
+    async def test_sweep_scores_every_candidate(self) -> None:
+        """Candidates run in batches on the instances and stiffer drives track the signal better."""
+        robot_path = self._create_articulation(
+            [JointModality.REVOLUTE],
+            DriveSubmodality.FORCE,
+            distance=0.5,
+            mass=1.0,
+            inertia_diag=1.0,
+            natural_freq_hz=10.0,
+            damping_ratio=0.5,
+            joint_limit_revolute=(-90.0, 90.0),
+        )
+        await self._run_setup_and_compute_inertia(robot_path)
+        instance_paths = create_gain_sweep_instances(
+            self._stage, robot_path, find_articulation_root(self._stage, robot_path), 2
+        )
+        self.assertEqual(instance_paths, ["/GainSweep/env_0/robot/root_joint", "/GainSweep/env_1/robot/root_joint"])
+        self.assertFalse(self._stage.GetRootLayer().GetPrimAtPath("/GainSweep"))
+
+        self._timeline.play()
+        await app_utils.update_app_async()
+        stiffnesses, dampings = [gains.numpy()[0] for gains in self._gain_tuner.get_articulation().get_dof_gains()]
+        candidates = make_gain_candidates(stiffnesses, dampings, [0.01, 1.0, 4.0], [1.0])
+        test_params = {
+            "test_mode": GainsTestMode.SINUSOIDAL,
+            "joint_indices": [0],
+            "test_duration": 0.5,
+            "sequence": [
+                {
+                    "joint_indices": np.array([0], dtype=np.int32),
+                    "joint_amplitudes": np.array([0.25], dtype=np.float32),
+                    "joint_offsets": np.array([0.0], dtype=np.float32),
+                    "joint_periods": np.array([0.5], dtype=np.float32),
+                    "joint_phases": np.array([0.0], dtype=np.float32),
+                }
+            ],
+        }
+        self._gain_tuner.initialize_gain_sweep(test_params, instance_paths, *candidates)
+        for _ in range(200):
+            done = self._gain_tuner.update_gains_test(self._physics_dt)
+            await app_utils.update_app_async()
+            if done:
+                break
+        self._timeline.stop()
+
+        result = self._gain_tuner.get_gain_sweep_result()
+        self.assertIsNotNone(result)
+        self.assertEqual(result.position_error.shape, (3,))
+        self.assertTrue(np.all(np.isfinite(result.position_error)))
+        self.assertGreater(result.position_error[0], result.position_error[2])
+        self.assertGreater(len(result.pareto_table()), 0)
+
+        remove_gain_sweep_instances(self._stage)
+        self.assertFalse(self._stage.GetPrimAtPath("/GainSweep"))
@@ -16,8 +16,7 @@
 """Provides interactive editing capabilities for collision spheres in robot descriptions."""
 
 from collections import OrderedDict
-from collections.abc import Generator
-from typing import Any
+from typing import Any, NamedTuple
 
 import carb
 import isaacsim.core.experimental.utils.prim as prim_utils
@@ -25,8 +24,95 @@ import isaacsim.core.experimental.utils.stage as stage_utils
 import lula
 import numpy as np
 import yaml
-from isaacsim.core.experimental.objects import Sphere
-from pxr import Sdf
+from pxr import Gf, Sdf, UsdGeom, Vt
+
+
+class _SphereBatch(NamedTuple):
+    """Rows of the sphere arrays of one link, as recorded in the undo and redo stacks."""
+
+    ids: np.ndarray
+    centers: np.ndarray
+    radii: np.ndarray
+
+
+class _LinkSpheres:
+    """Collision spheres of one link, stored as arrays and drawn by a single point instancer.
+
+    Sphere ``i`` of the link is identified by the path ``name_prefix + str(ids[i])``. The path is only a name:
+    the spheres are instances of the point instancer at ``instancer_path``, not prims of their own.
+
+    Args:
+        instancer_path: Path of the point instancer drawing the spheres.
+        name_prefix: Prefix of the sphere paths, the sphere id is appended to it.
+    """
+
+    def __init__(self, instancer_path: str, name_prefix: str) -> None:
+        self.instancer_path = instancer_path
+        self.name_prefix = name_prefix
+        self.ids = np.zeros(0, dtype=np.int64)
+        self.centers = np.zeros((0, 3))
+        self.radii = np.zeros(0)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def sphere_paths(self) -> list[str]:
+        """Paths of the spheres, in row order.
+
+        Returns:
+            The sphere paths.
+        """
+        return [f"{self.name_prefix}{sphere_id}" for sphere_id in self.ids.tolist()]
+
+    def rows(self, ids: np.ndarray) -> np.ndarray:
+        """Rows holding the given sphere ids, in the order of ``ids``. Ids that are not present are skipped.
+
+        Args:
+            ids: Sphere ids to look up.
+
+        Returns:
+            Row indices into the sphere arrays.
+        """
+        ids = np.asarray(ids, dtype=np.int64)
+        if len(self.ids) == 0 or len(ids) == 0:
+            return np.zeros(0, dtype=np.int64)
+        order = np.argsort(self.ids)
+        positions = np.minimum(np.searchsorted(self.ids, ids, sorter=order), len(order) - 1)
+        rows = order[positions]
+        return rows[self.ids[rows] == ids]
+
+    def batch(self, rows: np.ndarray | None = None) -> _SphereBatch:
+        """Copy rows of the sphere arrays.
+
+        Args:
+            rows: Row indices to copy. All rows are copied if None.
+
+        Returns:
+            The copied rows.
+        """
+        if rows is None:
+            rows = slice(None)
+        return _SphereBatch(self.ids[rows].copy(), self.centers[rows].copy(), self.radii[rows].copy())
+
+    def append(self, batch: _SphereBatch) -> None:
+        """Append spheres to the arrays.
+
+        Args:
+            batch: Spheres to append.
+        """
+        self.ids = np.concatenate([self.ids, np.asarray(batch.ids, dtype=np.int64)])
+        self.centers = np.concatenate([self.centers, np.asarray(batch.centers, dtype=np.float64).reshape(-1, 3)])
+        self.radii = np.concatenate([self.radii, np.asarray(batch.radii, dtype=np.float64).reshape(-1)])
+
+    def remove(self, rows: np.ndarray) -> None:
+        """Remove rows from the arrays.
+
+        Args:
+            rows: Row indices to remove.
+        """
+        self.ids = np.delete(self.ids, rows)
+        self.centers = np.delete(self.centers, rows, axis=0)
+        self.radii = np.delete(self.radii, rows)
 
 
 class CollisionSphereEditor:
@@ -47,14 +133,19 @@ class CollisionSphereEditor:
     - Import/export functionality for XRDF files and robot description formats
     - Link-based organization allowing operations on all spheres within specific robot links
 
-    The editor uses visual materials to distinguish between filtered and non-filtered spheres, making it
+    The spheres of each link are stored as NumPy arrays (ids, centers and radii) and drawn by one
+    ``UsdGeom.PointInstancer`` per link, so bulk edits such as scaling, recoloring or deleting the spheres of a
+    link are array operations followed by a single write of the instancer attributes. Spheres are addressed by
+    paths of the form ``<link_path>/collision_sphere_<id>``, which name instances rather than prims.
+
+    The editor uses two sphere prototypes to distinguish between filtered and non-filtered spheres, making it
     easy to identify and work with specific subsets of collision geometry. All sphere modifications are
     tracked as operations that can be undone or redone, providing a robust editing experience.
     """
 
     def __init__(self) -> None:
-        self.path_2_spheres = {}
-        self.path_2_sphere_serial_copy = {}
+        self._link_spheres: dict[str, _LinkSpheres] = {}
+        self._next_sphere_ids: dict[str, int] = {}
 
         self._operations = []
 
@@ -65,9 +156,7 @@ class CollisionSphereEditor:
         self.filter_out_sphere_color = np.array([207.0, 184.0, 37.0]) / 255  # All Spheres that don't match filter
 
         self._preview_color = np.array([1.0, 0, 0])
-        self._preview_spheres = []
-
-        self._sphere_path_generators = {}
+        self._preview_spheres: dict[str, _LinkSpheres] = {}
 
         self._lula_path = "/World/LulaRobotDescriptionEditor"
 
@@ -85,40 +174,216 @@ class CollisionSphereEditor:
             return prim.IsValid()
         return False
 
-    @staticmethod
-    def _path_generator(path: str) -> Generator[str, None, None]:
-        """Get a generator that incrementally adds integers to `path` forever.
+    def _get_link_spheres(self, link_path: str) -> _LinkSpheres:
+        """Get the sphere arrays of a link, creating empty ones if needed.
+
+        Args:
+            link_path: Path to the robot link.
+
+        Returns:
+            The sphere arrays of the link.
+        """
+        if link_path not in self._link_spheres:
+            self._link_spheres[link_path] = _LinkSpheres(
+                self._get_collision_sphere_instancer_path(link_path),
+                self._get_collision_sphere_base_path(link_path) + "_",
+            )
+        return self._link_spheres[link_path]
+
+    def _find_sphere(self, sphere_path: str) -> tuple[_LinkSpheres, int] | None:
+        """Find the link arrays and row of a collision sphere.
+
+        Args:
+            sphere_path: Path of the sphere.
+
+        Returns:
+            The sphere arrays of the link and the row of the sphere, or None if there is no such sphere.
+        """
+        spheres = self._link_spheres.get(self._get_link_path(sphere_path))
+        if spheres is None or not sphere_path.startswith(spheres.name_prefix):
+            return None
+        sphere_id = sphere_path[len(spheres.name_prefix) :]
+        if not sphere_id.isdigit():
+            return None
+        rows = spheres.rows(np.array([int(sphere_id)]))
+        if len(rows) == 0:
+            return None
+        return spheres, int(rows[0])
+
+    def _get_prefix_mask(self, spheres: _LinkSpheres, prefix: str) -> np.ndarray:
+        """Mask of the spheres of a link whose path starts with a prefix.
+
+        Args:
+            spheres: The sphere arrays of the link.
+            prefix: Path prefix to match.
+
+        Returns:
+            Boolean mask over the rows of the link.
+        """
+        if len(prefix) <= len(spheres.name_prefix):
+            # The prefix ends before the sphere id, so it matches all spheres of the link or none
+            return np.full(len(spheres), spheres.name_prefix.startswith(prefix))
+        return np.char.startswith(np.array(spheres.sphere_paths(), dtype=str), prefix)
+
+    def _author_instancer(self, spheres: _LinkSpheres, colors: list[np.ndarray], proto_indices: np.ndarray) -> None:
+        """Write sphere arrays to their point instancer, defining or removing the instancer as needed.
+
+        Args:
+            spheres: The sphere arrays to write.
+            colors: Display color of each sphere prototype.
+            proto_indices: Prototype index of each sphere.
+        """
+        stage = stage_utils.get_current_stage()
+        prim = stage.GetPrimAtPath(spheres.instancer_path)
+        if len(spheres) == 0:
+            if prim:
+                stage_utils.delete_prim(spheres.instancer_path)
+            return
+
+        if not prim:
+            instancer = UsdGeom.PointInstancer.Define(stage, spheres.instancer_path)
+            UsdGeom.Scope.Define(stage, f"{spheres.instancer_path}/prototypes")
+            prototype_paths = []
+            for i in range(len(colors)):
+                prototype = UsdGeom.Sphere.Define(stage, f"{spheres.instancer_path}/prototypes/sphere_{i}")
+                prototype.CreateRadiusAttr(1.0)
+                prototype.CreateDisplayColorAttr()
+                prototype_paths.append(prototype.GetPath())
+            instancer.CreatePrototypesRel().SetTargets(prototype_paths)
+            instancer.CreateIdsAttr()
+            instancer.CreatePositionsAttr()
+            instancer.CreateScalesAttr()
+            instancer.CreateProtoIndicesAttr()
+        else:
+            instancer = UsdGeom.PointInstancer(prim)
+
+        with Sdf.ChangeBlock():
+            for i, color in enumerate(colors):
+                prototype = UsdGeom.Sphere(stage.GetPrimAtPath(f"{spheres.instancer_path}/prototypes/sphere_{i}"))
+                prototype.GetDisplayColorAttr().Set([Gf.Vec3f(*np.asarray(color, dtype=float).tolist())])
+            scales = np.repeat(spheres.radii[:, np.newaxis], 3, axis=1)
+            instancer.GetIdsAttr().Set(Vt.Int64Array.FromNumpy(spheres.ids))
+            instancer.GetPositionsAttr().Set(Vt.Vec3fArray.FromNumpy(spheres.centers.astype(np.float32)))
+            instancer.GetScalesAttr().Set(Vt.Vec3fArray.FromNumpy(scales.astype(np.float32)))
+            instancer.GetProtoIndicesAttr().Set(Vt.IntArray.FromNumpy(proto_indices.astype(np.int32)))
+
+    def _author_link_spheres(self, spheres: _LinkSpheres) -> None:
+        """Write the spheres of a link to its point instancer, colored by the current filter.
+
+        Args:
+            spheres: The sphere arrays of the link.
+        """
+        proto_indices = np.where(self._get_prefix_mask(spheres, self.filter), 0, 1)
+        self._author_instancer(spheres, [self.filter_in_sphere_color, self.filter_out_sphere_color], proto_indices)
+
+    def _add_link_spheres(self, link_path: str, centers: np.ndarray, radii: np.ndarray) -> _SphereBatch:
+        """Add spheres to a link with fresh ids.
+
+        Args:
+            link_path: Path to the robot link.
+            centers: Sphere centers, shape (N, 3).
+            radii: Sphere radii, shape (N,).
+
+        Returns:
+            The added spheres.
+        """
+        spheres = self._get_link_spheres(link_path)
+        radii = np.asarray(radii, dtype=np.float64).reshape(-1)
+        first_id = self._next_sphere_ids.get(link_path, 1)
+        if len(spheres):
+            first_id = max(first_id, int(spheres.ids.max()) + 1)
+        self._next_sphere_ids[link_path] = first_id + len(radii)
+
+        batch = _SphereBatch(
+            np.arange(first_id, first_id + len(radii), dtype=np.int64),
+            np.asarray(centers, dtype=np.float64).reshape(-1, 3),
+            radii,
+        )
+        spheres.append(batch)
+        self._author_link_spheres(spheres)
+        return batch
+
+    def _restore_spheres(self, batches: dict[str, _SphereBatch]) -> None:
+        """Add previously removed spheres back with their original ids.
+
+        Args:
+            batches: Spheres to restore, keyed by link path.
+        """
+        for link_path, batch in batches.items():
+            spheres = self._get_link_spheres(link_path)
+            spheres.append(batch)
+            self._author_link_spheres(spheres)
+
+    def _remove_spheres(self, batches: dict[str, _SphereBatch]) -> dict[str, _SphereBatch]:
+        """Remove spheres by id.
+
+        Args:
+            batches: Spheres to remove, keyed by link path.
+
+        Returns:
+            The removed spheres with their current centers and radii, keyed by link path.
+        """
+        removed = {}
+        for link_path, batch in batches.items():
+            spheres = self._link_spheres.get(link_path)
+            if spheres is None:
+                continue
+            rows = spheres.rows(batch.ids)
+            removed[link_path] = spheres.batch(rows)
+            spheres.remove(rows)
+            self._author_link_spheres(spheres)
+            if len(spheres) == 0:
+                del self._link_spheres[link_path]
+        return removed
+
+    def _set_radii(self, batches: dict[str, _SphereBatch]) -> dict[str, _SphereBatch]:
+        """Set the radii of spheres by id.
 
         Args:
-            path: Base path to append incremental integers to.
+            batches: Spheres and their new radii, keyed by link path.
 
-        Yields:
-            Path strings with incrementally added integers.
+        Returns:
+            The spheres with the radii they had before, keyed by link path.
         """
-        count = 1
-        while True:
-            yield f"{path}_{count}"
-            count += 1
+        previous = {}
+        for link_path, batch in batches.items():
+            spheres = self._link_spheres.get(link_path)
+            if spheres is None:
+                continue
+            rows = spheres.rows(batch.ids)
+            previous[link_path] = spheres.batch(rows)
+            spheres.radii[rows] = batch.radii[np.isin(batch.ids, spheres.ids[rows])]
+            self._author_link_spheres(spheres)
+        return previous
 
-    def _get_unused_collision_sphere_path(self, link_path: str) -> str:
-        """Gets an unused collision sphere path for the specified link.
+    def get_sphere_paths(self, link_path: str | None = None) -> list[str]:
+        """Paths of the collision spheres, optionally restricted to one link.
 
         Args:
-            link_path: Path to the link where the sphere will be created.
+            link_path: Path to the robot link. All links are included if None.
 
         Returns:
-            An unused collision sphere path under the specified link.
+            Sphere paths, grouped by link in the order the links got their first sphere.
         """
-        sphere_base_path = self._get_collision_sphere_base_path(link_path)
+        if link_path is not None:
+            spheres = self._link_spheres.get(link_path)
+            return spheres.sphere_paths() if spheres is not None else []
+        return [path for spheres in self._link_spheres.values() for path in spheres.sphere_paths()]
+
+    def get_sphere(self, sphere_path: str) -> tuple[np.ndarray, float] | None:
+        """Center and radius of a collision sphere.
 
-        if sphere_base_path not in self._sphere_path_generators:
-            self._sphere_path_generators[sphere_base_path] = self._path_generator(sphere_base_path)
+        Args:
+            sphere_path: Path of the sphere.
 
-        sphere_path_generator = self._sphere_path_generators[sphere_base_path]
-        sphere_path = next(sphere_path_generator)
-        while self._is_prim_path_valid(sphere_path):
-            sphere_path = next(sphere_path_generator)
-        return sphere_path
+        Returns:
+            The sphere center in the link frame and the sphere radius, or None if there is no such sphere.
+        """
+        found = self._find_sphere(sphere_path)
+        if found is None:
+            return None
+        spheres, row = found
+        return spheres.centers[row].copy(), float(spheres.radii[row])
 
     def clear_spheres(self, store_op: bool = True) -> None:
         """Removes all collision spheres from the editor.
@@ -126,20 +391,20 @@ class CollisionSphereEditor:
         Args:
             store_op: Whether to store this operation for undo functionality.
         """
-        self._sphere_path_generators = {}
-        sphere_paths = list(self.path_2_spheres.keys())
-        if len(sphere_paths) == 0:
+        self._next_sphere_ids = {}
+        if store_op:
+            self.copy_all_sphere_data()
+        if len(self._link_spheres) == 0:
             return
 
+        deleted_spheres = {link_path: spheres.batch() for link_path, spheres in self._link_spheres.items()}
         if store_op:
-            self.copy_all_sphere_data()
-            deleted_spheres = ["DEL"]
-            for sphere_path in sphere_paths:
-                deleted_spheres.append(self.path_2_sphere_serial_copy[sphere_path])
-            self._operations.append(deleted_spheres)
+            self._operations.append(("DEL", deleted_spheres))
 
-        for sphere_path in sphere_paths:
-            self.delete_sphere(sphere_path)
+        for spheres in self._link_spheres.values():
+            if self._is_prim_path_valid(spheres.instancer_path):
+                stage_utils.delete_prim(spheres.instancer_path)
+        self._link_spheres = {}
 
     def clear_link_spheres(self, link_path: str, store_op: bool = True) -> None:
         """Removes all collision spheres associated with the specified link.
@@ -148,23 +413,16 @@ class CollisionSphereEditor:
             link_path: Path to the link whose spheres should be cleared.
             store_op: Whether to store this operation for undo functionality.
         """
-        if self._get_collision_sphere_base_path(link_path) in self._sphere_path_generators:
-            del self._sphere_path_generators[self._get_collision_sphere_base_path(link_path)]
-        path_len = len(link_path)
-
-        to_delete = []
+        self._next_sphere_ids.pop(link_path, None)
         if store_op:
             self.copy_all_sphere_data()
-        deleted_spheres = ["DEL"]
-        for p in self.path_2_spheres:
-            if self._is_prim_path_valid(p) and p[:path_len] == link_path:
-                deleted_spheres.append(self.path_2_sphere_serial_copy[p])
-                to_delete.append(p)
+        spheres = self._link_spheres.get(link_path)
+        if spheres is None:
+            return
 
+        deleted_spheres = self._remove_spheres({link_path: spheres.batch()})
         if store_op:
-            self._operations.append(deleted_spheres)
-        for s in to_delete:
-            self.delete_sphere(s)
+            self._operations.append(("DEL", deleted_spheres))
 
     def delete_sphere(self, sphere_path: str) -> None:
         """Deletes the collision sphere at the specified path.
@@ -172,11 +430,11 @@ class CollisionSphereEditor:
         Args:
             sphere_path: Path to the sphere to delete.
         """
-        if self._is_prim_path_valid(sphere_path):
-            stage_utils.delete_prim(sphere_path)
-
-        if sphere_path in self.path_2_spheres:
-            del self.path_2_spheres[sphere_path]
+        found = self._find_sphere(sphere_path)
+        if found is None:
+            return
+        spheres, row = found
+        self._remove_spheres({self._get_link_path(sphere_path): spheres.batch(np.array([row]))})
 
     def set_sphere_colors(
         self, filter: str, color_in: np.ndarray | None = None, color_out: np.ndarray | None = None
@@ -195,132 +453,100 @@ class CollisionSphereEditor:
         self.filter = filter
 
         with Sdf.ChangeBlock():
-            for sphere_path in self.path_2_spheres:
-                self.set_sphere_color(sphere_path, False)
+            for spheres in self._link_spheres.values():
+                self._author_link_spheres(spheres)
 
     def set_sphere_color(self, sphere_path: str, ensure_visual_material: bool = True) -> None:
         """Sets the color of a specific collision sphere based on filter matching.
 
+        The spheres of a link share one point instancer, so all spheres of the sphere's link are recolored.
+
         Args:
             sphere_path: Path to the sphere to color.
-            ensure_visual_material: Whether to ensure visual materials are created before setting color.
+            ensure_visual_material: Unused, kept for compatibility.
         """
-        if not self._is_prim_path_valid(sphere_path):
-            return
-        sphere = self.path_2_spheres[sphere_path]
-        if sphere_path[: len(self.filter)] == self.filter:
-            sphere.set_display_colors(self.filter_in_sphere_color)
-        else:
-            sphere.set_display_colors(self.filter_out_sphere_color)
+        found = self._find_sphere(sphere_path)
+        if found is not None:
+            self._author_link_spheres(found[0])
 
     def copy_all_sphere_data(self) -> None:
-        """Copies all current sphere data to the serial copy storage for undo operations."""
-        sphere_paths = list(self.path_2_spheres.keys())
-        deleted_spheres = ["DEL"]
-        for sphere_path in sphere_paths:
-            if self._is_prim_path_valid(sphere_path):
-                sphere = self.path_2_spheres[sphere_path]
-                color = np.array(sphere.geoms[0].GetDisplayColorAttr().Get())
-                self.path_2_sphere_serial_copy[sphere_path] = {
-                    "sphere_path": sphere_path,
-                    "center": sphere.get_local_poses()[0].numpy()[0],
-                    "radius": sphere.get_radii().numpy()[0],
-                    "color": color,
-                }
-            else:
-                if sphere_path in self.path_2_sphere_serial_copy:
-                    deleted_spheres.append(self.path_2_sphere_serial_copy[sphere_path])
-                self.delete_sphere(sphere_path)
-        if len(deleted_spheres) > 1:
-            self._operations.append(deleted_spheres)
+        """Synchronizes the sphere arrays with edits made to the sphere instancers on the stage.
+
+        Spheres moved or scaled on the stage take the new center and radius. Spheres whose instance or
+        instancer was deleted from the stage are removed from the editor, recording the deletion for undo.
+        """
+        stage = stage_utils.get_current_stage()
+        deleted_spheres = {}
+        for link_path, spheres in list(self._link_spheres.items()):
+            prim = stage.GetPrimAtPath(spheres.instancer_path)
+            if not prim or not prim.IsValid():
+                deleted_spheres[link_path] = spheres.batch()
+                del self._link_spheres[link_path]
+                continue
+
+            instancer = UsdGeom.PointInstancer(prim)
+            ids = np.asarray(instancer.GetIdsAttr().Get() or [], dtype=np.int64)
+            positions = np.asarray(instancer.GetPositionsAttr().Get() or [], dtype=np.float64).reshape(-1, 3)
+            scales = np.asarray(instancer.GetScalesAttr().Get() or [], dtype=np.float64).reshape(-1, 3)
+            if len(positions) != len(ids) or len(scales) != len(ids):
+                continue
+
+            kept = np.isin(spheres.ids, ids)
+            if not kept.all():
+                deleted_spheres[link_path] = spheres.batch(np.flatnonzero(~kept))
+                spheres.remove(np.flatnonzero(~kept))
+            if len(spheres) == 0:
+                del self._link_spheres[link_path]
+                continue
+
+            # Look up the stage row of each sphere and only take values that differ from what was last written,
+            # so that radii and centers do not pick up float32 rounding from the round trip through USD
+            order = np.argsort(ids)
+            stage_rows = order[np.searchsorted(ids, spheres.ids, sorter=order)]
+            stage_centers = positions[stage_rows]
+            # Non-uniform scales from viewport edits are collapsed to the largest axis to keep the link covered
+            stage_radii = np.abs(scales[stage_rows]).max(axis=1)
+            moved = np.any(stage_centers != spheres.centers.astype(np.float32), axis=1)
+            resized = stage_radii != spheres.radii.astype(np.float32)
+            spheres.centers[moved] = stage_centers[moved]
+            spheres.radii[resized] = stage_radii[resized]
+
+        if deleted_spheres:
+            self._operations.append(("DEL", deleted_spheres))
 
     def undo(self) -> None:
         """Undo the last sphere operation."""
         if len(self._operations) == 0:
             return
 
-        last_op = self._operations.pop()
-        op_type = last_op[0]
-        op = last_op[1:]
+        op_type, batches = self._operations.pop()
 
         if op_type == "ADD":
-            redo = ["ADD"]
-            for sphere_path in op:
-                if self._is_prim_path_valid(sphere_path):
-                    sphere = self.path_2_spheres[sphere_path]
-                    redo.append(
-                        {
-                            "sphere_path": sphere_path,
-                            "center": sphere.get_local_poses()[0].numpy()[0],
-                            "radius": sphere.get_radii().numpy()[0],
-                        }
-                    )
-                self.delete_sphere(sphere_path)
-            self._redo.append(redo)
+            self._redo.append(("ADD", self._remove_spheres(batches)))
 
         elif op_type == "DEL":
-            redo = ["DEL"]
-            for d in op:
-                sphere = Sphere(
-                    d["sphere_path"],
-                    translations=d["center"],
-                    radii=d["radius"],
-                    colors=self.filter_in_sphere_color,
-                )
-                self.path_2_spheres[d["sphere_path"]] = sphere
-                self.set_sphere_color(d["sphere_path"])
-                redo.append(d)
-            self._redo.append(redo)
+            self._restore_spheres(batches)
+            self._redo.append(("DEL", batches))
 
         elif op_type == "SCALE":
-            redo = ["SCALE"]
-            for d in op:
-                path = d["sphere_path"]
-                rad = d["radius"]
-                factor = d["factor"]
-                if path in self.path_2_spheres and self._is_prim_path_valid(path):
-                    sphere = self.path_2_spheres[path]
-                    sphere.set_radii(rad)
-                    redo.append({"sphere_path": path, "radius": factor * rad})
-            self._redo.append(redo)
+            self._redo.append(("SCALE", self._set_radii(batches)))
 
     def redo(self) -> None:
         """Redo the last undone sphere operation."""
         if len(self._redo) == 0:
             return
 
-        last_redo = self._redo.pop()
-        op_type = last_redo[0]
-        op = last_redo[1:]
+        op_type, batches = self._redo.pop()
 
         if op_type == "ADD":
-            added_spheres = ["ADD"]
-            for d in op:
-                sphere = Sphere(
-                    d["sphere_path"],
-                    translations=d["center"],
-                    radii=d["radius"],
-                    colors=self.filter_in_sphere_color,
-                )
-                self.path_2_spheres[d["sphere_path"]] = sphere
-                self.set_sphere_color(d["sphere_path"])
-                added_spheres.append(d["sphere_path"])
-            self._operations.append(added_spheres)
+            self._restore_spheres(batches)
+            self._operations.append(("ADD", batches))
 
         elif op_type == "DEL":
-            deleted_spheres = ["DEL"]
-            for d in op:
-                self.delete_sphere(d["sphere_path"])
-                deleted_spheres.append(d)
-            self._operations.append(deleted_spheres)
+            self._operations.append(("DEL", self._remove_spheres(batches)))
 
         elif op_type == "SCALE":
-            for d in op:
-                path = d["sphere_path"]
-                rad = d["radius"]
-                if path in self.path_2_spheres and self._is_prim_path_valid(path):
-                    sphere = self.path_2_spheres[path]
-                    sphere.set_radii(rad)
+            self._operations.append(("SCALE", self._set_radii(batches)))
 
     def generate_spheres(
         self,
@@ -345,18 +571,15 @@ class CollisionSphereEditor:
         """
         if not is_preview and self._preview_spheres:
             # If preview spheres exist, change them to permanent spheres
-            added_sphere_paths = ["ADD"]
-            for preview_sphere in self._preview_spheres:
-                if not preview_sphere.prims[0].IsValid():
+            self._redo = []
+            added_spheres = {}
+            for preview_link_path, preview in self._preview_spheres.items():
+                if not self._is_prim_path_valid(preview.instancer_path):
                     continue
-                sphere_path = self.add_sphere(
-                    link_path,
-                    preview_sphere.get_local_poses()[0].numpy()[0],
-                    preview_sphere.get_radii().numpy()[0],
-                    store_op=False,
+                added_spheres[preview_link_path] = self._add_link_spheres(
+                    preview_link_path, preview.centers, preview.radii
                 )
-                added_sphere_paths.append(sphere_path)
-            self._operations.append(added_sphere_paths)
+            self._operations.append(("ADD", added_spheres))
             self.clear_preview()
             return
 
@@ -375,34 +598,28 @@ class CollisionSphereEditor:
 
         generator = lula.create_collision_sphere_generator(points, face_inds.reshape((num_points // 3, 3)))
         result = generator.generate_spheres(num_spheres, radius_offset)
+        centers = np.array([lula_sphere.center for lula_sphere in result], dtype=np.float64).reshape(-1, 3)
+        radii = np.array([lula_sphere.radius for lula_sphere in result], dtype=np.float64)
         if is_preview:
             self.clear_preview()
-            preview_sphere_path_generator = self._path_generator(self._get_collision_sphere_preview_path(link_path))
-            for lula_sphere in result:
-                sphere_path = next(preview_sphere_path_generator)
-                self._preview_spheres.append(
-                    Sphere(
-                        sphere_path,
-                        colors=self._preview_color,
-                        translations=lula_sphere.center,
-                        radii=lula_sphere.radius,
-                    )
-                )
+            preview = _LinkSpheres(
+                self._get_collision_sphere_preview_instancer_path(link_path),
+                self._get_collision_sphere_preview_path(link_path) + "_",
+            )
+            preview.append(_SphereBatch(np.arange(1, len(radii) + 1, dtype=np.int64), centers, radii))
+            self._author_instancer(preview, [self._preview_color], np.zeros(len(preview), dtype=np.int32))
+            self._preview_spheres[link_path] = preview
         else:
-            added_sphere_paths = ["ADD"]
-            for lula_sphere in result:
-                sphere_path = self.add_sphere(link_path, lula_sphere.center, lula_sphere.radius, store_op=False)
-                added_sphere_paths.append(sphere_path)
-            self._operations.append(added_sphere_paths)
+            self._redo = []
+            self._operations.append(("ADD", {link_path: self._add_link_spheres(link_path, centers, radii)}))
             self.clear_preview()
 
     def clear_preview(self) -> None:
         """Remove all preview spheres from the scene."""
-        self._preview_path_generator = {}
-
-        for sphere in self._preview_spheres:
-            self.delete_sphere(sphere.paths[0])
-        self._preview_spheres = []
+        for preview in self._preview_spheres.values():
+            if self._is_prim_path_valid(preview.instancer_path):
+                stage_utils.delete_prim(preview.instancer_path)
+        self._preview_spheres = {}
 
     def add_sphere(self, link_path: str, center: object, radius: float, store_op: bool = True) -> str:
         """Add a collision sphere to the specified link.
@@ -414,7 +631,21 @@ class CollisionSphereEditor:
             store_op: Whether to store this operation for undo functionality.
 
         Returns:
-            Path to the created sphere prim.
+            Path of the created sphere.
+        """
+        return self.add_spheres(link_path, np.asarray(center).reshape(1, 3), np.array([radius]), store_op)[0]
+
+    def add_spheres(self, link_path: str, centers: np.ndarray, radii: np.ndarray, store_op: bool = True) -> list[str]:
+        """Add collision spheres to the specified link in one batch.
+
+        Args:
+            link_path: Path to the robot link.
+            centers: Sphere center positions, shape (N, 3).
+            radii: Sphere radii, shape (N,).
+            store_op: Whether to store this operation for undo functionality.
+
+        Returns:
+            Paths of the created spheres.
         """
         if not self._is_prim_path_valid(link_path):
             carb.log_warn("Attempted to add sphere nested under non-existent path")
@@ -423,21 +654,13 @@ class CollisionSphereEditor:
             link_path = link_path[:-1]
 
         self._redo = []
-        sphere_path = self._get_unused_collision_sphere_path(link_path)
-
-        if sphere_path[: len(self.filter)] == self.filter:
-            color = self.filter_in_sphere_color
-        else:
-            color = self.filter_out_sphere_color
-
-        sphere = Sphere(sphere_path, translations=center, radii=radius, colors=color)
-
-        self.path_2_spheres[sphere.paths[0]] = sphere
+        batch = self._add_link_spheres(link_path, centers, radii)
 
         if store_op:
-            self._operations.append(["ADD", sphere.paths[0]])
+            self._operations.append(("ADD", {link_path: batch}))
 
-        return sphere_path
+        name_prefix = self._link_spheres[link_path].name_prefix
+        return [f"{name_prefix}{sphere_id}" for sphere_id in batch.ids.tolist()]
 
     def _get_sphere_list_from_xrdf_geometries(
         self, parsed_file: dict[str, Any], geometry_group_name: str
@@ -487,6 +710,28 @@ class CollisionSphereEditor:
 
         return spheres
 
+    def _add_parsed_link_spheres(
+        self, link_path: str, parsed_spheres: list[dict[str, Any]], added_spheres: dict[str, _SphereBatch]
+    ) -> None:
+        """Add the spheres parsed from a file for one link, merging them into a pending ADD operation.
+
+        Args:
+            link_path: Path to the robot link.
+            parsed_spheres: Sphere entries with ``center`` and ``radius`` keys.
+            added_spheres: Spheres added so far, keyed by link path. Updated in place.
+        """
+        centers = np.array([sphere["center"] for sphere in parsed_spheres], dtype=np.float64).reshape(-1, 3)
+        radii = np.array([sphere["radius"] for sphere in parsed_spheres], dtype=np.float64)
+        batch = self._add_link_spheres(link_path, centers, radii)
+        if link_path in added_spheres:
+            previous = added_spheres[link_path]
+            batch = _SphereBatch(
+                np.concatenate([previous.ids, batch.ids]),
+                np.concatenate([previous.centers, batch.centers]),
+                np.concatenate([previous.radii, batch.radii]),
+            )
+        added_spheres[link_path] = batch
+
     def load_xrdf_spheres(self, robot_prim_path: str, parsed_file: dict[str, Any]) -> None:
         """Load collision spheres from a parsed XRDF file.
 
@@ -543,30 +788,25 @@ class CollisionSphereEditor:
         if sphere_dict is None or len(sphere_dict.keys()) == 0:
             return
 
-        added_sphere_paths = ["ADD"]
+        added_spheres = {}
         for key, val in sphere_dict.items():
             link_path = robot_prim_path + "/" + key
             if self._is_prim_path_valid(link_path):
-                for sphere in val:
-                    center = np.array(sphere["center"])
-                    radius = sphere["radius"]
-                    sphere_path = self.add_sphere(link_path, center, radius, store_op=False)
-                    added_sphere_paths.append(sphere_path)
+                self._add_parsed_link_spheres(link_path, val, added_spheres)
             else:
                 carb.log_warn(f"Could not place sphere from xrdf at path: {link_path}")
 
-        self._operations.append(added_sphere_paths)
+        self._operations.append(("ADD", added_spheres))
 
         for k, v in buffer_distances.items():
             # Compare against the link path *with* a trailing slash so a buffer
             # distance targeted at `link1` does not also match sibling links
             # whose names share that prefix (e.g. `link10`, `link1_tip`).
             link_path_prefix = robot_prim_path + "/" + k + "/"
-            for p in self.path_2_spheres:
-                if self._is_prim_path_valid(p) and p.startswith(link_path_prefix):
-                    sphere = self.path_2_spheres[p]
-                    rad = sphere.get_radii().numpy()[0]
-                    sphere.set_radii(rad + v)
+            for link_path, spheres in self._link_spheres.items():
+                if (link_path + "/").startswith(link_path_prefix):
+                    spheres.radii += v
+                    self._author_link_spheres(spheres)
 
     def load_spheres(self, robot_prim_path: str, robot_description_file_path: str) -> None:
         """Load collision spheres from a robot description YAML file.
@@ -602,21 +842,17 @@ class CollisionSphereEditor:
 
         robot_path = robot_prim_path
 
-        added_sphere_paths = ["ADD"]
+        added_spheres = {}
 
         for sphere_dict in sphere_list:
             for key, val in sphere_dict.items():
                 link_path = robot_path + "/" + key
                 if self._is_prim_path_valid(link_path):
-                    for sphere in val:
-                        center = np.array(sphere["center"])
-                        radius = sphere["radius"]
-                        sphere_path = self.add_sphere(link_path, center, radius, store_op=False)
-                        added_sphere_paths.append(sphere_path)
+                    self._add_parsed_link_spheres(link_path, val, added_spheres)
                 else:
                     carb.log_warn(f"Could not place sphere from robot description at path: {link_path}")
 
-        self._operations.append(added_sphere_paths)
+        self._operations.append(("ADD", added_spheres))
 
     def interpolate_spheres(self, path1: str, path2: str, num_spheres: int) -> None:
         """Create interpolated spheres between two existing spheres.
@@ -626,11 +862,13 @@ class CollisionSphereEditor:
             path2: Path to the second sphere.
             num_spheres: Number of interpolated spheres to create.
         """
-        if not self._is_prim_path_valid(path1):
-            carb.log_warn(f"{path1} is not a valid Prim path to a sphere")
+        sphere_1 = self.get_sphere(path1)
+        sphere_2 = self.get_sphere(path2)
+        if sphere_1 is None:
+            carb.log_warn(f"{path1} is not a valid path to a sphere")
             return
-        elif not self._is_prim_path_valid(path2):
-            carb.log_warn(f"{path2} is not a valid Prim path to a sphere")
+        elif sphere_2 is None:
+            carb.log_warn(f"{path2} is not a valid path to a sphere")
             return
 
         link_path = self._get_link_path(path1)
@@ -645,14 +883,11 @@ class CollisionSphereEditor:
 
         epsilon = 1e-12
 
-        sphere_1 = self.path_2_spheres[path1]
-        sphere_2 = self.path_2_spheres[path2]
-
-        rad_1 = max(sphere_1.get_radii().numpy()[0], epsilon)
-        rad_2 = max(sphere_2.get_radii().numpy()[0], epsilon)
+        t1, rad_1 = sphere_1
+        t2, rad_2 = sphere_2
 
-        t1 = sphere_1.get_local_poses()[0].numpy()[0]
-        t2 = sphere_2.get_local_poses()[0].numpy()[0]
+        rad_1 = max(rad_1, epsilon)
+        rad_2 = max(rad_2, epsilon)
 
         d = t2 - t1
 
@@ -670,11 +905,8 @@ class CollisionSphereEditor:
         else:
             relative_offsets = (rads - rad_1) / (rad_2 - rad_1)
 
-        added_sphere_paths = ["ADD"]
-        for i in range(1, num_spheres + 1):
-            sphere_path = self.add_sphere(link_path, t1 + relative_offsets[i] * d, rads[i], store_op=False)
-            added_sphere_paths.append(sphere_path)
-        self._operations.append(added_sphere_paths)
+        centers = t1 + relative_offsets[1:-1, np.newaxis] * d
+        self.add_spheres(link_path, centers, rads[1:-1])
 
     def scale_spheres(self, path: str, factor: float) -> None:
         """Scale all spheres under the specified path by a factor.
@@ -683,16 +915,15 @@ class CollisionSphereEditor:
             path: Path prefix to match spheres against.
             factor: Scale factor to apply to sphere radii.
         """
-        scaled_spheres = ["SCALE"]
-        path_len = len(path)
-
-        for p in self.path_2_spheres:
-            if self._is_prim_path_valid(p) and p[:path_len] == path:
-                sphere = self.path_2_spheres[p]
-                rad = sphere.get_radii().numpy()[0]
-                sphere.set_radii(factor * rad)
-                scaled_spheres.append({"sphere_path": p, "radius": rad, "factor": factor})
-        self._operations.append(scaled_spheres)
+        scaled_spheres = {}
+        for link_path, spheres in self._link_spheres.items():
+            rows = np.flatnonzero(self._get_prefix_mask(spheres, path))
+            if len(rows) == 0:
+                continue
+            scaled_spheres[link_path] = spheres.batch(rows)
+            spheres.radii[rows] *= factor
+            self._author_link_spheres(spheres)
+        self._operations.append(("SCALE", scaled_spheres))
 
     def get_sphere_names_by_link(self, link_path: str) -> list[str]:
         """Sphere names for collision spheres belonging to a specific link.
@@ -703,13 +934,29 @@ class CollisionSphereEditor:
         Returns:
             List of sphere names (relative paths from the link path).
         """
-        sphere_names = []
-        for sphere_path in self.path_2_spheres:
-            sphere_link_path = self._get_link_path(sphere_path)
-            if sphere_link_path == link_path:
-                sphere_names.append(sphere_path[len(link_path) :])
+        return [sphere_path[len(link_path) :] for sphere_path in self.get_sphere_paths(link_path)]
+
+    def _get_robot_link_spheres(self, robot_prim_path: str) -> list[tuple[str, _LinkSpheres]]:
+        """Links with spheres nested under the robot, with their link names relative to the robot.
 
-        return sphere_names
+        Spheres of links outside of the robot are skipped with a warning.
+
+        Args:
+            robot_prim_path: Path to the robot prim.
+
+        Returns:
+            Link names and sphere arrays.
+        """
+        robot_link_spheres = []
+        for link_path, spheres in self._link_spheres.items():
+            if link_path[: len(robot_prim_path)] != robot_prim_path:
+                carb.log_warn(
+                    f"Not writing spheres of link {link_path} to file because it is not nested under the robot "
+                    "Articulation"
+                )
+                continue
+            robot_link_spheres.append((link_path[len(robot_prim_path) + 1 :], spheres))
+        return robot_link_spheres
 
     # Used for XRDF files
     def write_spheres_to_dict(self, robot_prim_path: str, link_to_spheres: dict[str, Any]) -> None:
@@ -721,19 +968,13 @@ class CollisionSphereEditor:
             robot_prim_path: Path to the robot prim.
             link_to_spheres: Dictionary to update with sphere data, keyed by link name.
         """
-        for sphere in self.path_2_spheres.values():
-            prim_path = sphere.paths[0]
-            if self._is_prim_path_valid(prim_path):
-                if prim_path[: len(robot_prim_path)] != robot_prim_path:
-                    carb.log_warn(
-                        f"Not writing sphere at path {prim_path} to file because it is not nested under the robot Articulation"
-                    )
-                    continue
-                link_name = prim_path[len(robot_prim_path) + 1 : prim_path.rfind("/")]
-                link_spheres = link_to_spheres.get(link_name, [])
-                sphere_pose = self._round_list_floats(sphere.get_local_poses()[0].numpy()[0])
-                link_spheres.append({"center": sphere_pose, "radius": sphere.get_radii().numpy().item()})
-                link_to_spheres[link_name] = link_spheres
+        for link_name, spheres in self._get_robot_link_spheres(robot_prim_path):
+            link_spheres = link_to_spheres.get(link_name, [])
+            centers = np.round(spheres.centers, 3).tolist()
+            link_spheres.extend(
+                {"center": center, "radius": radius} for center, radius in zip(centers, spheres.radii.tolist())
+            )
+            link_to_spheres[link_name] = link_spheres
 
     # Used for Robot Description Files
     def save_spheres(self, robot_prim_path: str, f: object) -> None:
@@ -746,24 +987,14 @@ class CollisionSphereEditor:
             f: File handle to write the sphere data to.
         """
         link_to_spheres = OrderedDict()
-        for sphere in self.path_2_spheres.values():
-            prim_path = sphere.paths[0]
-            if self._is_prim_path_valid(prim_path):
-                if prim_path[: len(robot_prim_path)] != robot_prim_path:
-                    carb.log_warn(
-                        f"Not writing sphere at path {prim_path} to file because it is not nested under the robot Articulation"
-                    )
-                    continue
-                link_name = prim_path[len(robot_prim_path) + 1 : prim_path.rfind("/")]
-                link_spheres = link_to_spheres.get(link_name, [])
-                # Coerce numpy scalars to Python floats before rounding:
-                # `numpy.float32` / `numpy.ndarray` returned by `get_radii()`
-                # do not implement `__round__`, so calling round() on them
-                # directly raises TypeError. Going through float() also keeps
-                # the YAML output free of `!!python/object` tags.
-                sphere_pose = [round(float(x), 5) for x in sphere.get_local_poses()[0].numpy()[0]]
-                link_spheres.append({"center": sphere_pose, "radius": round(float(sphere.get_radii().numpy()[0]), 5)})
-                link_to_spheres[link_name] = link_spheres
+        for link_name, spheres in self._get_robot_link_spheres(robot_prim_path):
+            link_spheres = link_to_spheres.get(link_name, [])
+            # `tolist()` yields Python floats, which keeps the YAML output free
+            # of `!!python/object` tags.
+            centers = np.round(spheres.centers, 5).tolist()
+            radii = np.round(spheres.radii, 5).tolist()
+            link_spheres.extend({"center": center, "radius": radius} for center, radius in zip(centers, radii))
+            link_to_spheres[link_name] = link_spheres
 
         f.write("collision_spheres:\n")
         for link_name, sphere_list in link_to_spheres.items():
@@ -793,6 +1024,17 @@ class CollisionSphereEditor:
         """
         return link_path + "/collision_sphere"
 
+    def _get_collision_sphere_instancer_path(self, link_path: str) -> str:
+        """Path of the point instancer drawing the collision spheres of a link.
+
+        Args:
+            link_path: Path to the robot link.
+
+        Returns:
+            Path of the point instancer.
+        """
+        return link_path + "/collision_spheres"
+
     def _get_collision_sphere_preview_path(self, link_path: str) -> str:
         """Base path for preview spheres belonging to a link.
 
@@ -804,20 +1046,16 @@ class CollisionSphereEditor:
         """
         return link_path + "/preview_sphere"
 
-    def _round_list_floats(self, l: list, decimals: int = 3) -> list:
-        """Rounds all float values in a list to a specified number of decimal places.
+    def _get_collision_sphere_preview_instancer_path(self, link_path: str) -> str:
+        """Path of the point instancer drawing the preview spheres of a link.
 
         Args:
-            l: List containing float values to round.
-            decimals: Number of decimal places to round to.
+            link_path: Path to the robot link.
 
         Returns:
-            New list with rounded float values.
+            Path of the point instancer.
         """
-        r = []
-        for f in l:
-            r.append(round(f, decimals))
-        return r
+        return link_path + "/preview_spheres"
 
     def _get_link_path(self, sphere_path: str) -> str:
         """Parent link path for a collision sphere.
@@ -825,12 +1063,12 @@ class CollisionSphereEditor:
         Extracts the link path by removing the sphere name from the sphere's full path.
 
         Args:
-            sphere_path: Full path to the collision sphere prim.
+            sphere_path: Full path to the collision sphere.
 
         Returns:
             Path to the parent link containing the sphere.
         """
-        # Remove last element of Prim path to sphere
+        # Remove last element of the sphere path
 
         slash_ind = sphere_path.rfind("/")
 
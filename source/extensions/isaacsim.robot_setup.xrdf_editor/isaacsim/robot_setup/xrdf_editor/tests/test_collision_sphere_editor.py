@@ -24,10 +24,27 @@ import isaacsim.core.experimental.utils.stage as stage_utils
 import numpy as np
 import omni.kit.test
 from isaacsim.robot_setup.xrdf_editor.collision_sphere_editor import CollisionSphereEditor
+from pxr import UsdGeom
 
 _ROBOT_PATH = "/World/robot"
 _LINK1_PATH = "/World/robot/link1"
 _LINK2_PATH = "/World/robot/link2"
+_LINK1_INSTANCER_PATH = "/World/robot/link1/collision_spheres"
+
+
+def _num_instances(instancer_path: str) -> int:
+    """Number of instances drawn by a point instancer.
+
+    Args:
+        instancer_path: Path of the point instancer.
+
+    Returns:
+        The number of instances, or 0 if there is no point instancer at the path.
+    """
+    prim = prim_utils.get_prim_at_path(instancer_path)
+    if not (prim and prim.IsValid()):
+        return 0
+    return len(UsdGeom.PointInstancer(prim).GetPositionsAttr().Get())
 
 
 class TestCollisionSphereEditor(omni.kit.test.AsyncTestCase):
@@ -55,9 +72,8 @@ class TestCollisionSphereEditor(omni.kit.test.AsyncTestCase):
         """Test add sphere returns valid path."""
         sphere_path = self.editor.add_sphere(_LINK1_PATH, np.array([0.1, 0.0, 0.0]), 0.05)
         self.assertIsNotNone(sphere_path)
-        self.assertIn(sphere_path, self.editor.path_2_spheres)
-        prim = prim_utils.get_prim_at_path(sphere_path)
-        self.assertTrue(prim and prim.IsValid())
+        self.assertIn(sphere_path, self.editor.get_sphere_paths())
+        self.assertEqual(_num_instances(_LINK1_INSTANCER_PATH), 1)
 
     async def test_add_sphere_path_nested_under_link(self) -> None:
         """Test add sphere path nested under link."""
@@ -69,19 +85,22 @@ class TestCollisionSphereEditor(omni.kit.test.AsyncTestCase):
         path1 = self.editor.add_sphere(_LINK1_PATH, np.zeros(3), 0.05)
         path2 = self.editor.add_sphere(_LINK1_PATH, np.array([0.1, 0.0, 0.0]), 0.05)
         self.assertNotEqual(path1, path2)
-        self.assertEqual(len(self.editor.path_2_spheres), 2)
+        self.assertEqual(len(self.editor.get_sphere_paths()), 2)
 
     async def test_delete_sphere_removes_from_dict(self) -> None:
         """Test delete sphere removes from dict."""
         sphere_path = self.editor.add_sphere(_LINK1_PATH, np.zeros(3), 0.05)
         self.editor.delete_sphere(sphere_path)
-        self.assertNotIn(sphere_path, self.editor.path_2_spheres)
+        self.assertNotIn(sphere_path, self.editor.get_sphere_paths())
 
-    async def test_delete_sphere_removes_prim(self) -> None:
-        """Test delete sphere removes prim."""
+    async def test_delete_sphere_removes_instance(self) -> None:
+        """Test delete sphere removes instance."""
         sphere_path = self.editor.add_sphere(_LINK1_PATH, np.zeros(3), 0.05)
+        self.editor.add_sphere(_LINK1_PATH, np.ones(3), 0.05)
         self.editor.delete_sphere(sphere_path)
-        prim = prim_utils.get_prim_at_path(sphere_path)
+        self.assertEqual(_num_instances(_LINK1_INSTANCER_PATH), 1)
+        self.editor.clear_link_spheres(_LINK1_PATH)
+        prim = prim_utils.get_prim_at_path(_LINK1_INSTANCER_PATH)
         self.assertFalse(prim and prim.IsValid())
 
     async def test_delete_nonexistent_sphere_is_safe(self) -> None:
@@ -98,12 +117,12 @@ class TestCollisionSphereEditor(omni.kit.test.AsyncTestCase):
         self.editor.add_sphere(_LINK1_PATH, np.zeros(3), 0.05)
         self.editor.add_sphere(_LINK2_PATH, np.ones(3) * 0.1, 0.05)
         self.editor.clear_spheres()
-        self.assertEqual(len(self.editor.path_2_spheres), 0)
+        self.assertEqual(len(self.editor.get_sphere_paths()), 0)
 
     async def test_clear_spheres_on_empty_editor_is_safe(self) -> None:
         """Test clear spheres on empty editor is safe."""
         self.editor.clear_spheres()
-        self.assertEqual(len(self.editor.path_2_spheres), 0)
+        self.assertEqual(len(self.editor.get_sphere_paths()), 0)
 
     async def test_clear_link_spheres_removes_only_target_link(self) -> None:
         """Test clear link spheres removes only target link."""
@@ -111,7 +130,7 @@ class TestCollisionSphereEditor(omni.kit.test.AsyncTestCase):
         self.editor.add_sphere(_LINK1_PATH, np.array([0.1, 0.0, 0.0]), 0.05)
         link2_path = self.editor.add_sphere(_LINK2_PATH, np.zeros(3), 0.05)
         self.editor.clear_link_spheres(_LINK1_PATH)
-        remaining = list(self.editor.path_2_spheres.keys())
+        remaining = self.editor.get_sphere_paths()
         self.assertEqual(remaining, [link2_path])
 
     # -------------------------------------------------------------------------
@@ -147,7 +166,7 @@ class TestCollisionSphereEditor(omni.kit.test.AsyncTestCase):
         """Test scale spheres doubles radius."""
         sphere_path = self.editor.add_sphere(_LINK1_PATH, np.zeros(3), 0.1)
         self.editor.scale_spheres(_LINK1_PATH, 2.0)
-        radius = self.editor.path_2_spheres[sphere_path].get_radii().numpy()[0]
+        radius = self.editor.get_sphere(sphere_path)[1]
         self.assertAlmostEqual(radius, 0.2, places=4)
 
     async def test_scale_spheres_only_affects_matching_prefix(self) -> None:
@@ -155,8 +174,8 @@ class TestCollisionSphereEditor(omni.kit.test.AsyncTestCase):
         path1 = self.editor.add_sphere(_LINK1_PATH, np.zeros(3), 0.1)
         path2 = self.editor.add_sphere(_LINK2_PATH, np.zeros(3), 0.1)
         self.editor.scale_spheres(_LINK1_PATH, 3.0)
-        radius1 = self.editor.path_2_spheres[path1].get_radii().numpy()[0]
-        radius2 = self.editor.path_2_spheres[path2].get_radii().numpy()[0]
+        radius1 = self.editor.get_sphere(path1)[1]
+        radius2 = self.editor.get_sphere(path2)[1]
         self.assertAlmostEqual(radius1, 0.3, places=4)
         self.assertAlmostEqual(radius2, 0.1, places=4)
 
@@ -175,9 +194,8 @@ class TestCollisionSphereEditor(omni.kit.test.AsyncTestCase):
         """Test undo add removes sphere."""
         sphere_path = self.editor.add_sphere(_LINK1_PATH, np.zeros(3), 0.05)
         self.editor.undo()
-        self.assertNotIn(sphere_path, self.editor.path_2_spheres)
-        prim = prim_utils.get_prim_at_path(sphere_path)
-        self.assertFalse(prim and prim.IsValid())
+        self.assertNotIn(sphere_path, self.editor.get_sphere_paths())
+        self.assertEqual(_num_instances(_LINK1_INSTANCER_PATH), 0)
 
     async def test_undo_add_populates_redo_stack(self) -> None:
         """Test undo add populates redo stack."""
@@ -190,16 +208,15 @@ class TestCollisionSphereEditor(omni.kit.test.AsyncTestCase):
         sphere_path = self.editor.add_sphere(_LINK1_PATH, np.zeros(3), 0.05)
         self.editor.undo()
         self.editor.redo()
-        self.assertIn(sphere_path, self.editor.path_2_spheres)
-        prim = prim_utils.get_prim_at_path(sphere_path)
-        self.assertTrue(prim and prim.IsValid())
+        self.assertIn(sphere_path, self.editor.get_sphere_paths())
+        self.assertEqual(_num_instances(_LINK1_INSTANCER_PATH), 1)
 
     async def test_undo_scale_restores_original_radius(self) -> None:
         """Test undo scale restores original radius."""
         sphere_path = self.editor.add_sphere(_LINK1_PATH, np.zeros(3), 0.1)
         self.editor.scale_spheres(_LINK1_PATH, 3.0)
         self.editor.undo()
-        radius = self.editor.path_2_spheres[sphere_path].get_radii().numpy()[0]
+        radius = self.editor.get_sphere(sphere_path)[1]
         self.assertAlmostEqual(radius, 0.1, places=4)
 
     async def test_undo_clear_spheres_restores_sphere(self) -> None:
@@ -207,19 +224,18 @@ class TestCollisionSphereEditor(omni.kit.test.AsyncTestCase):
         sphere_path = self.editor.add_sphere(_LINK1_PATH, np.zeros(3), 0.05)
         self.editor.clear_spheres()
         self.editor.undo()
-        self.assertIn(sphere_path, self.editor.path_2_spheres)
-        prim = prim_utils.get_prim_at_path(sphere_path)
-        self.assertTrue(prim and prim.IsValid())
+        self.assertIn(sphere_path, self.editor.get_sphere_paths())
+        self.assertEqual(_num_instances(_LINK1_INSTANCER_PATH), 1)
 
     async def test_undo_on_empty_stack_is_safe(self) -> None:
         """Test undo on empty stack is safe."""
         self.editor.undo()
-        self.assertEqual(len(self.editor.path_2_spheres), 0)
+        self.assertEqual(len(self.editor.get_sphere_paths()), 0)
 
     async def test_redo_on_empty_stack_is_safe(self) -> None:
         """Test redo on empty stack is safe."""
         self.editor.redo()
-        self.assertEqual(len(self.editor.path_2_spheres), 0)
+        self.assertEqual(len(self.editor.get_sphere_paths()), 0)
 
     async def test_add_sphere_clears_redo_stack(self) -> None:
         """Test add sphere clears redo stack."""
@@ -239,7 +255,7 @@ class TestCollisionSphereEditor(omni.kit.test.AsyncTestCase):
         path1 = self.editor.add_sphere(_LINK1_PATH, np.array([0.0, 0.0, 0.0]), 0.05)
         path2 = self.editor.add_sphere(_LINK1_PATH, np.array([0.6, 0.0, 0.0]), 0.05)
         self.editor.interpolate_spheres(path1, path2, num_spheres=3)
-        self.assertEqual(len(self.editor.path_2_spheres), 5)  # 2 original + 3 interpolated
+        self.assertEqual(len(self.editor.get_sphere_paths()), 5)  # 2 original + 3 interpolated
 
     async def test_interpolate_spheres_positions_between_endpoints(self) -> None:
         """Test interpolate spheres positions between endpoints."""
@@ -249,10 +265,9 @@ class TestCollisionSphereEditor(omni.kit.test.AsyncTestCase):
         path2 = self.editor.add_sphere(_LINK1_PATH, p1, 0.05)
         self.editor.interpolate_spheres(path1, path2, num_spheres=1)
         # Collect interpolated sphere paths (those that are not path1 or path2)
-        interp_paths = [p for p in self.editor.path_2_spheres if p not in (path1, path2)]
+        interp_paths = [p for p in self.editor.get_sphere_paths() if p not in (path1, path2)]
         self.assertEqual(len(interp_paths), 1)
-        interp_sphere = self.editor.path_2_spheres[interp_paths[0]]
-        center = interp_sphere.get_local_poses()[0].numpy()[0]
+        center, _ = self.editor.get_sphere(interp_paths[0])
         # Midpoint should be between 0 and 1 on X axis
         self.assertGreater(center[0], 0.0)
         self.assertLess(center[0], 1.0)
@@ -278,6 +293,53 @@ class TestCollisionSphereEditor(omni.kit.test.AsyncTestCase):
         self.editor.set_sphere_colors(_LINK1_PATH, color_out=color)
         np.testing.assert_array_equal(self.editor.filter_out_sphere_color, color)
 
+    async def test_set_sphere_colors_selects_prototype_per_sphere(self) -> None:
+        """Test set sphere colors selects prototype per sphere."""
+        paths = self.editor.add_spheres(_LINK1_PATH, np.zeros((12, 3)), np.full(12, 0.05))
+        self.editor.set_sphere_colors(paths[0])
+        instancer = UsdGeom.PointInstancer(prim_utils.get_prim_at_path(_LINK1_INSTANCER_PATH))
+        # `collision_sphere_1` also prefixes `collision_sphere_10` to `collision_sphere_12`
+        self.assertEqual(list(instancer.GetProtoIndicesAttr().Get()), [0] + [1] * 8 + [0] * 3)
+        self.editor.set_sphere_colors(_LINK2_PATH)
+        self.assertEqual(list(instancer.GetProtoIndicesAttr().Get()), [1] * 12)
+
+    # -------------------------------------------------------------------------
+    # add_spheres / copy_all_sphere_data
+    # -------------------------------------------------------------------------
+
+    async def test_add_spheres_is_one_operation(self) -> None:
+        """Test add spheres is one operation."""
+        centers = np.arange(30, dtype=float).reshape(10, 3)
+        radii = np.linspace(0.01, 0.1, 10)
+        paths = self.editor.add_spheres(_LINK1_PATH, centers, radii)
+        self.assertEqual(paths, self.editor.get_sphere_paths(_LINK1_PATH))
+        self.assertEqual(_num_instances(_LINK1_INSTANCER_PATH), 10)
+        center, radius = self.editor.get_sphere(paths[4])
+        np.testing.assert_allclose(center, centers[4])
+        self.assertAlmostEqual(radius, radii[4])
+        self.assertEqual(len(self.editor._operations), 1)
+        self.editor.undo()
+        self.assertEqual(self.editor.get_sphere_paths(), [])
+
+    async def test_copy_all_sphere_data_picks_up_stage_edits(self) -> None:
+        """Test copy all sphere data picks up stage edits."""
+        path1, path2 = self.editor.add_spheres(_LINK1_PATH, np.zeros((2, 3)), np.array([0.1, 0.2]))
+        instancer = UsdGeom.PointInstancer(prim_utils.get_prim_at_path(_LINK1_INSTANCER_PATH))
+        instancer.GetPositionsAttr().Set([(0.0, 0.0, 0.0), (0.5, 0.0, 0.0)])
+        self.editor.copy_all_sphere_data()
+        np.testing.assert_allclose(self.editor.get_sphere(path2)[0], [0.5, 0.0, 0.0])
+        # Untouched spheres keep their exact radius rather than the float32 value read back from the stage
+        self.assertEqual(self.editor.get_sphere(path1)[1], 0.1)
+
+        ops_before = len(self.editor._operations)
+        stage_utils.delete_prim(_LINK1_INSTANCER_PATH)
+        self.editor.copy_all_sphere_data()
+        self.assertEqual(self.editor.get_sphere_paths(), [])
+        self.assertEqual(len(self.editor._operations), ops_before + 1)
+        self.editor.undo()
+        self.assertEqual(self.editor.get_sphere_paths(), [path1, path2])
+        self.assertEqual(_num_instances(_LINK1_INSTANCER_PATH), 2)
+
     # -------------------------------------------------------------------------
     # write_spheres_to_dict
     # -------------------------------------------------------------------------
@@ -324,8 +386,8 @@ class TestCollisionSphereEditor(omni.kit.test.AsyncTestCase):
             },
         }
         self.editor.load_xrdf_spheres(_ROBOT_PATH, parsed)
-        self.assertEqual(len(self.editor.path_2_spheres), 1)
-        sphere_path = next(iter(self.editor.path_2_spheres))
+        self.assertEqual(len(self.editor.get_sphere_paths()), 1)
+        sphere_path = self.editor.get_sphere_paths()[0]
         self.assertTrue(sphere_path.startswith(_LINK1_PATH))
 
     async def test_load_xrdf_spheres_v2_creates_spheres(self) -> None:
@@ -343,7 +405,7 @@ class TestCollisionSphereEditor(omni.kit.test.AsyncTestCase):
             },
         }
         self.editor.load_xrdf_spheres(_ROBOT_PATH, parsed)
-        self.assertEqual(len(self.editor.path_2_spheres), 2)
+        self.assertEqual(len(self.editor.get_sphere_paths()), 2)
 
     async def test_load_xrdf_spheres_clears_existing_spheres(self) -> None:
         """Test load xrdf spheres clears existing spheres."""
@@ -361,8 +423,8 @@ class TestCollisionSphereEditor(omni.kit.test.AsyncTestCase):
         }
         self.editor.load_xrdf_spheres(_ROBOT_PATH, parsed)
         # Only the freshly loaded sphere should remain
-        self.assertEqual(len(self.editor.path_2_spheres), 1)
-        sphere_path = next(iter(self.editor.path_2_spheres))
+        self.assertEqual(len(self.editor.get_sphere_paths()), 1)
+        sphere_path = self.editor.get_sphere_paths()[0]
         self.assertTrue(sphere_path.startswith(_LINK2_PATH))
 
     async def test_load_xrdf_spheres_resets_undo_history(self) -> None:
@@ -388,7 +450,7 @@ class TestCollisionSphereEditor(omni.kit.test.AsyncTestCase):
         """Test load xrdf spheres missing collision key is safe."""
         parsed = {"format_version": 1.0}
         self.editor.load_xrdf_spheres(_ROBOT_PATH, parsed)
-        self.assertEqual(len(self.editor.path_2_spheres), 0)
+        self.assertEqual(len(self.editor.get_sphere_paths()), 0)
 
     # -------------------------------------------------------------------------
     # on_shutdown
@@ -399,7 +461,7 @@ class TestCollisionSphereEditor(omni.kit.test.AsyncTestCase):
         self.editor.add_sphere(_LINK1_PATH, np.zeros(3), 0.05)
         self.editor.add_sphere(_LINK2_PATH, np.ones(3) * 0.1, 0.05)
         self.editor.on_shutdown()
-        self.assertEqual(len(self.editor.path_2_spheres), 0)
+        self.assertEqual(len(self.editor.get_sphere_paths()), 0)
 
     # -------------------------------------------------------------------------
     # clear_preview
@@ -409,7 +471,7 @@ class TestCollisionSphereEditor(omni.kit.test.AsyncTestCase):
         """Test clear preview does not affect regular spheres."""
         sphere_path = self.editor.add_sphere(_LINK1_PATH, np.zeros(3), 0.05)
         self.editor.clear_preview()
-        self.assertIn(sphere_path, self.editor.path_2_spheres)
+        self.assertIn(sphere_path, self.editor.get_sphere_paths())
         self.assertEqual(len(self.editor._preview_spheres), 0)
 
     # -------------------------------------------------------------------------
@@ -435,20 +497,19 @@ class TestCollisionSphereEditor(omni.kit.test.AsyncTestCase):
                 self.editor.save_spheres(_ROBOT_PATH, f)
 
             self.editor.clear_spheres()
-            self.assertEqual(len(self.editor.path_2_spheres), 0)
+            self.assertEqual(len(self.editor.get_sphere_paths()), 0)
 
             self.editor.load_spheres(_ROBOT_PATH, yaml_path)
 
-            self.assertEqual(len(self.editor.path_2_spheres), len(authored))
+            self.assertEqual(len(self.editor.get_sphere_paths()), len(authored))
 
             # Reconstruct {link_path: [(center, radius), ...]} from the loaded
             # spheres so the round-trip can be checked independently of the
             # paths the editor assigns.
             loaded_by_link: dict[str, list[tuple[np.ndarray, float]]] = {}
-            for sphere_path, sphere in self.editor.path_2_spheres.items():
+            for sphere_path in self.editor.get_sphere_paths():
                 link_path = sphere_path.rsplit("/", 1)[0]
-                center = sphere.get_local_poses()[0].numpy()[0]
-                radius = float(sphere.get_radii().numpy()[0])
+                center, radius = self.editor.get_sphere(sphere_path)
                 loaded_by_link.setdefault(link_path, []).append((center, radius))
 
             for link_path, expected_center, expected_radius in authored:
@@ -503,7 +564,7 @@ class TestCollisionSphereEditor(omni.kit.test.AsyncTestCase):
 
             # Should not raise.
             self.editor.load_spheres(_ROBOT_PATH, yaml_path)
-            self.assertEqual(len(self.editor.path_2_spheres), 0)
+            self.assertEqual(len(self.editor.get_sphere_paths()), 0)
         finally:
             try:
                 os.remove(yaml_path)
@@ -522,7 +583,7 @@ class TestCollisionSphereEditor(omni.kit.test.AsyncTestCase):
                 f.write("- this is a list, not a mapping\n")
 
             self.editor.load_spheres(_ROBOT_PATH, yaml_path)
-            self.assertEqual(len(self.editor.path_2_spheres), 0)
+            self.assertEqual(len(self.editor.get_sphere_paths()), 0)
         finally:
             try:
                 os.remove(yaml_path)
@@ -541,11 +602,11 @@ class TestCollisionSphereEditor(omni.kit.test.AsyncTestCase):
         # different link. After the fix it must return without adding spheres.
         path_link1 = self.editor.add_sphere(_LINK1_PATH, np.array([0.0, 0.0, 0.0]), 0.05)
         path_link2 = self.editor.add_sphere(_LINK2_PATH, np.array([1.0, 0.0, 0.0]), 0.05)
-        count_before = len(self.editor.path_2_spheres)
+        count_before = len(self.editor.get_sphere_paths())
 
         self.editor.interpolate_spheres(path_link1, path_link2, num_spheres=3)
 
-        self.assertEqual(len(self.editor.path_2_spheres), count_before)
+        self.assertEqual(len(self.editor.get_sphere_paths()), count_before)
 
     async def test_interpolate_spheres_general_radius_branch(self) -> None:
         """Test interpolate spheres general radius branch."""
@@ -557,15 +618,13 @@ class TestCollisionSphereEditor(omni.kit.test.AsyncTestCase):
         self.editor.interpolate_spheres(path1, path2, num_spheres=2)
 
         # Two interpolated spheres added between the endpoints.
-        interp_paths = [p for p in self.editor.path_2_spheres if p not in (path1, path2)]
+        interp_paths = [p for p in self.editor.get_sphere_paths() if p not in (path1, path2)]
         self.assertEqual(len(interp_paths), 2)
 
         # Their centers must lie strictly between the endpoints on X, and the
         # interpolated radii must lie strictly between the endpoint radii.
         for p in interp_paths:
-            sphere = self.editor.path_2_spheres[p]
-            center = sphere.get_local_poses()[0].numpy()[0]
-            radius = float(sphere.get_radii().numpy()[0])
+            center, radius = self.editor.get_sphere(p)
             self.assertGreater(center[0], 0.0)
             self.assertLess(center[0], 1.0)
             self.assertGreater(radius, 0.02)
@@ -575,10 +634,10 @@ class TestCollisionSphereEditor(omni.kit.test.AsyncTestCase):
         """Test interpolate spheres invalid path is safe."""
         # Either invalid endpoint should early-return without raising.
         path_valid = self.editor.add_sphere(_LINK1_PATH, np.zeros(3), 0.05)
-        count_before = len(self.editor.path_2_spheres)
+        count_before = len(self.editor.get_sphere_paths())
         self.editor.interpolate_spheres(path_valid, "/World/robot/link1/does_not_exist", num_spheres=2)
         self.editor.interpolate_spheres("/World/robot/link1/does_not_exist", path_valid, num_spheres=2)
-        self.assertEqual(len(self.editor.path_2_spheres), count_before)
+        self.assertEqual(len(self.editor.get_sphere_paths()), count_before)
 
     # -------------------------------------------------------------------------
     # load_xrdf_spheres — clone traversal in _get_sphere_list_from_xrdf_geometries
@@ -602,7 +661,7 @@ class TestCollisionSphereEditor(omni.kit.test.AsyncTestCase):
         self.editor.load_xrdf_spheres(_ROBOT_PATH, parsed)
 
         # Spheres from both the primary group and its clone should be present.
-        paths = list(self.editor.path_2_spheres.keys())
+        paths = self.editor.get_sphere_paths()
         self.assertEqual(len(paths), 2)
         self.assertTrue(any(p.startswith(_LINK1_PATH) for p in paths))
         self.assertTrue(any(p.startswith(_LINK2_PATH) for p in paths))
@@ -629,7 +688,7 @@ class TestCollisionSphereEditor(omni.kit.test.AsyncTestCase):
         }
         self.editor.load_xrdf_spheres(_ROBOT_PATH, parsed)
 
-        paths = list(self.editor.path_2_spheres.keys())
+        paths = self.editor.get_sphere_paths()
         self.assertEqual(len(paths), 2)
         self.assertTrue(any(p.startswith(_LINK2_PATH) for p in paths))
 
@@ -654,7 +713,7 @@ class TestCollisionSphereEditor(omni.kit.test.AsyncTestCase):
         }
         self.editor.load_xrdf_spheres(_ROBOT_PATH, parsed)
 
-        self.assertEqual(len(self.editor.path_2_spheres), 2)
+        self.assertEqual(len(self.editor.get_sphere_paths()), 2)
 
     async def test_load_xrdf_spheres_clone_missing_target_is_safe(self) -> None:
         """Test load xrdf spheres clone missing target is safe."""
@@ -671,7 +730,7 @@ class TestCollisionSphereEditor(omni.kit.test.AsyncTestCase):
             },
         }
         self.editor.load_xrdf_spheres(_ROBOT_PATH, parsed)
-        self.assertEqual(len(self.editor.path_2_spheres), 1)
+        self.assertEqual(len(self.editor.get_sphere_paths()), 1)
 
     # -------------------------------------------------------------------------
     # load_xrdf_spheres — format_version / buffer_distance branches
@@ -688,7 +747,7 @@ class TestCollisionSphereEditor(omni.kit.test.AsyncTestCase):
         }
         # Must not raise and must not place any spheres on the stage.
         self.editor.load_xrdf_spheres(_ROBOT_PATH, parsed)
-        self.assertEqual(len(self.editor.path_2_spheres), 0)
+        self.assertEqual(len(self.editor.get_sphere_paths()), 0)
 
     async def test_load_xrdf_spheres_buffer_distance_inflates_only_targeted_link(self) -> None:
         """Test load xrdf spheres buffer distance inflates only targeted link."""
@@ -720,11 +779,11 @@ class TestCollisionSphereEditor(omni.kit.test.AsyncTestCase):
 
         link1_radii = []
         link10_radii = []
-        for p, sphere in self.editor.path_2_spheres.items():
+        for p in self.editor.get_sphere_paths():
             if p.startswith("/World/robot/link1/"):
-                link1_radii.append(float(sphere.get_radii().numpy()[0]))
+                link1_radii.append(self.editor.get_sphere(p)[1])
             elif p.startswith("/World/robot/link10/"):
-                link10_radii.append(float(sphere.get_radii().numpy()[0]))
+                link10_radii.append(self.editor.get_sphere(p)[1])
 
         self.assertEqual(len(link1_radii), 1)
         self.assertEqual(len(link10_radii), 1)
@@ -742,7 +801,7 @@ class TestCollisionSphereEditor(omni.kit.test.AsyncTestCase):
             "geometry": {"default": {"spheres": None}},
         }
         self.editor.load_xrdf_spheres(_ROBOT_PATH, parsed)
-        self.assertEqual(len(self.editor.path_2_spheres), 0)
+        self.assertEqual(len(self.editor.get_sphere_paths()), 0)
 
     # -------------------------------------------------------------------------
     # redo — DEL and SCALE branches (ADD is covered above)
@@ -754,11 +813,10 @@ class TestCollisionSphereEditor(omni.kit.test.AsyncTestCase):
         self.editor.clear_spheres()
         # Undo restores the sphere; redo of that DEL op must remove it again.
         self.editor.undo()
-        self.assertIn(sphere_path, self.editor.path_2_spheres)
+        self.assertIn(sphere_path, self.editor.get_sphere_paths())
         self.editor.redo()
-        self.assertNotIn(sphere_path, self.editor.path_2_spheres)
-        prim = prim_utils.get_prim_at_path(sphere_path)
-        self.assertFalse(prim and prim.IsValid())
+        self.assertNotIn(sphere_path, self.editor.get_sphere_paths())
+        self.assertEqual(_num_instances(_LINK1_INSTANCER_PATH), 0)
 
     async def test_redo_after_undo_scale_re_applies_scale(self) -> None:
         """Test redo after undo scale re applies scale."""
@@ -768,13 +826,13 @@ class TestCollisionSphereEditor(omni.kit.test.AsyncTestCase):
         # so the final radius is 0.3 again.
         self.editor.undo()
         self.assertAlmostEqual(
-            float(self.editor.path_2_spheres[sphere_path].get_radii().numpy()[0]),
+            float(self.editor.get_sphere(sphere_path)[1]),
             0.1,
             places=4,
         )
         self.editor.redo()
         self.assertAlmostEqual(
-            float(self.editor.path_2_spheres[sphere_path].get_radii().numpy()[0]),
+            float(self.editor.get_sphere(sphere_path)[1]),
             0.3,
             places=4,
         )
@@ -810,7 +868,7 @@ class TestCollisionSphereEditor(omni.kit.test.AsyncTestCase):
             is_preview=False,
         )
 
-        self.assertEqual(len(self.editor.path_2_spheres), 0)
+        self.assertEqual(len(self.editor.get_sphere_paths()), 0)
         self.assertEqual(len(self.editor._preview_spheres), 0)
 
     async def test_generate_spheres_rejects_mixed_face_topology(self) -> None:
@@ -840,4 +898,4 @@ class TestCollisionSphereEditor(omni.kit.test.AsyncTestCase):
             is_preview=False,
         )
 
-        self.assertEqual(len(self.editor.path_2_spheres), 0)
+        self.assertEqual(len(self.editor.get_sphere_paths()), 0)
@@ -303,7 +303,7 @@ class TestXrdfEditorUIPanels(omni.kit.test.AsyncTestCase):
 
         # --- Scale: factor 2 should leave the sphere count unchanged but double radii ---
         def _radius(sphere_path: str) -> float:
-            return float(state.collision_sphere_editor.path_2_spheres[sphere_path].get_radii().numpy()[0])
+            return state.collision_sphere_editor.get_sphere(sphere_path)[1]
 
         radii_before = sorted(_radius(link_path + name) for name in names)
         sphere_panel._scale_factor_field.set_value(2.0)
@@ -534,11 +534,10 @@ class TestXrdfEditorUIPanels(omni.kit.test.AsyncTestCase):
         editor = self._ext.ui_builder.state.collision_sphere_editor
         prefix = link_full_path + "/"
         results: list[tuple[np.ndarray, float]] = []
-        for sphere_path, sphere in editor.path_2_spheres.items():
+        for sphere_path in editor.get_sphere_paths():
             if not sphere_path.startswith(prefix):
                 continue
-            center = sphere.get_local_poses()[0].numpy()[0]
-            radius = float(sphere.get_radii().numpy()[0])
+            center, radius = editor.get_sphere(sphere_path)
             results.append((np.asarray(center, dtype=float), radius))
         results.sort(key=lambda item: float(item[1]))
         return results
@@ -120,6 +120,7 @@ class SimulationApp:
         "enable_crashreporter": True,
         "limit_cpu_threads": 32,
         "disable_viewport_updates": False,
+        "startup_trace": None,
     }
     """Default configuration dictionary for launching the SimulationApp.
 
@@ -173,6 +174,7 @@ class SimulationApp:
         enable_crashreporter (bool): Enable crash reporter. Defaults to True
         limit_cpu_threads (int): Limit the number of CPU threads created to the lesser of cpu core count or specified value. Defaults to 32.
         disable_viewport_updates (bool): Disable viewport updates to improve performance. Defaults to False.
+        startup_trace (str): Path of a JSON report recording launch phase durations, per-extension startup durations and Python import times. Set to None to disable tracing. Defaults to None.
     """
 
     def __init__(self, launch_config: dict = None, experience: str = "") -> None:
@@ -265,6 +267,15 @@ class SimulationApp:
         if launch_config is not None:
             self.config.update(launch_config)
         self._apply_renderer_defaults(launch_config)
+
+        # Start the opt-in startup trace as early as possible so plugin loading and Kit startup are covered
+        self._startup_trace = None
+        if self.config.get("startup_trace"):
+            from .startup_trace import StartupTrace
+
+            self._startup_trace = StartupTrace(self.config["startup_trace"])
+            self._startup_trace.start()
+
         if builtins.ISAAC_LAUNCHED_FROM_JUPYTER:
             if self.config["headless"] is False:
                 carb.log_warn("Non-headless mode not supported with jupyter notebooks")
@@ -284,9 +295,11 @@ class SimulationApp:
             search_paths=[os.path.abspath(f'{os.environ["CARB_APP_PATH"]}/kernel/plugins')],
         )
         carb.log_info("SimulationApp.__init__: Loaded framework plugins")
+        self._mark_startup_phase("load_plugins")
         # Get Omniverse application
         self._app = omni.kit.app.get_app()
         self._start_app()
+        self._mark_startup_phase("kit_startup")
 
         # Register signal handler to exit when ctrl-c happens
         # This needs to happen after the app starts so that we can overide the default handler
@@ -310,6 +323,7 @@ class SimulationApp:
         self._app.print_and_log("Simulation App Starting")
 
         self._update_without_ready()
+        self._mark_startup_phase("render_settings_and_first_update")
 
         self.open_usd = self.config.get("open_usd")
         if self.open_usd is not None:
@@ -324,6 +338,7 @@ class SimulationApp:
             create_new_stage()
         # Update the app
         self._update_without_ready()
+        self._mark_startup_phase("stage_setup")
         self._prepare_ui()
 
         # Increase hang detection timeout
@@ -355,6 +370,7 @@ class SimulationApp:
             except Exception as e:
                 self.app.print_and_log(f"Error disabling default viewport: {e}")
 
+        self._mark_startup_phase("ui_and_viewport")
         # Notify toolkit is running
         self._app.print_and_log("Simulation App Startup Complete")
 
@@ -377,6 +393,7 @@ class SimulationApp:
 
         self.update()  # This app update triggers app ready status.
         builtins.ISAACSIM_APP_LAUNCHED = True
+        self._finish_startup_trace()
 
         atexit.register(self._atexit_close)
 
@@ -395,6 +412,32 @@ class SimulationApp:
             if setting_key not in override_keys:
                 self.config[setting_key] = default_value
 
+    def _mark_startup_phase(self, name: str) -> None:
+        """End a launch phase of the startup trace, if tracing is enabled.
+
+        Args:
+            name: Phase name used in the report.
+        """
+        if self._startup_trace is not None:
+            self._startup_trace.mark(name)
+
+    def _finish_startup_trace(self) -> None:
+        """Stop the startup trace and write its report, if tracing is enabled."""
+        if self._startup_trace is None:
+            return
+        self._startup_trace.mark("app_ready")
+        self._startup_trace.stop()
+        try:
+            report = self._startup_trace.write_report()
+        except OSError as e:
+            carb.log_error(f"Failed to write startup trace to {self._startup_trace.report_path}: {e}")
+        else:
+            self._app.print_and_log(
+                f"Startup trace written to {self._startup_trace.report_path} "
+                f"(total {report['total_seconds']:.2f}s, Python imports {report['python_import_seconds']:.2f}s)"
+            )
+        self._startup_trace = None
+
     def __del__(self) -> None:
         """Destructor for the SimulationApp class.
 
@@ -0,0 +1,326 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Opt-in startup trace recording launch phases, extension startups and Python import times."""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import re
+import sys
+import threading
+import time
+from typing import Any
+
+import carb
+
+#: Version of the JSON report layout written by `StartupTrace.write_report`.
+REPORT_VERSION = 1
+
+_EXT_STARTUP_PATTERN = re.compile(r"\[ext: (?P<ext_id>[^\]]+)\] startup")
+_EXT_VERSION_PATTERN = re.compile(r"-\d[^/\\]*$")
+
+
+def _extension_name(ext_id: str) -> str:
+    """Strip the version suffix from an extension id or folder name.
+
+    Args:
+        ext_id: Extension id such as ``omni.usd-1.10.0``.
+
+    Returns:
+        The extension name, e.g. ``omni.usd``.
+    """
+    return _EXT_VERSION_PATTERN.sub("", ext_id)
+
+
+class _ImportTimer:
+    """Meta path finder that times the execution of every module imported while installed.
+
+    The finder does not locate modules itself: it asks the finders behind it for the
+    spec and wraps the loader's ``exec_module`` on that loader instance only, so
+    specs and loaders keep their original types.
+    """
+
+    def __init__(self) -> None:
+        self.records: list[tuple[str, str | None, float, float]] = []
+        self._local = threading.local()
+
+    def find_spec(self, fullname: str, path: Any = None, target: Any = None) -> Any:
+        """Find the spec with the remaining finders and instrument its loader.
+
+        Args:
+            fullname: Fully qualified module name.
+            path: Parent package ``__path__`` for submodules.
+            target: Module object when reloading.
+
+        Returns:
+            The module spec, or None if no other finder can locate the module.
+        """
+        if getattr(self._local, "finding", False):
+            return None
+        self._local.finding = True
+        try:
+            meta_path = sys.meta_path
+            start = meta_path.index(self) + 1 if self in meta_path else 0
+            for finder in meta_path[start:]:
+                find_spec = getattr(finder, "find_spec", None)
+                if find_spec is None:
+                    continue
+                spec = find_spec(fullname, path, target)
+                if spec is not None:
+                    self._instrument(spec)
+                    return spec
+            return None
+        finally:
+            self._local.finding = False
+
+    def _instrument(self, spec: Any) -> None:
+        """Wrap ``exec_module`` of the spec's loader instance with timing.
+
+        Class-level loaders (built-in and frozen importers) are shared between
+        modules and cheap to execute, so they are left untouched.
+
+        Args:
+            spec: The module spec returned by another finder.
+        """
+        loader = spec.loader
+        if loader is None or isinstance(loader, type) or not hasattr(loader, "exec_module"):
+            return
+        try:
+            if "exec_module" in vars(loader):
+                return
+        except TypeError:
+            return
+        exec_module = loader.exec_module
+        name, origin = spec.name, spec.origin
+
+        def _timed_exec_module(module: Any) -> None:
+            stack = self._stack()
+            stack.append([time.perf_counter(), 0.0])
+            try:
+                exec_module(module)
+            finally:
+                start, child_time = stack.pop()
+                cumulative = time.perf_counter() - start
+                if stack:
+                    stack[-1][1] += cumulative
+                self.records.append((name, origin, cumulative - child_time, cumulative))
+                with contextlib.suppress(AttributeError):
+                    del loader.exec_module
+
+        loader.exec_module = _timed_exec_module
+
+    def _stack(self) -> list[list[float]]:
+        """Return the calling thread's stack of in-progress imports.
+
+        Returns:
+            ``[start_time, child_time]`` entries, innermost last.
+        """
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+
+class StartupTrace:
+    """Record where ``SimulationApp`` startup time is spent.
+
+    The trace collects:
+
+    - **Phases**: wall-clock durations of the launch steps, each ending at a :meth:`mark`.
+    - **Extensions**: start offset and duration of each extension startup, derived
+      from the extension manager's ``[ext: <id>] startup`` log events. Extensions
+      start one after another on the main thread, so an extension's duration is the
+      time until the next extension starts.
+    - **Imports**: self and cumulative execution time of every Python module
+      imported while the trace is active, attributed to the extension that owns it.
+
+    Args:
+        report_path: Path of the JSON report written by :meth:`write_report`.
+
+    Example:
+
+    .. code-block:: python
+
+        trace = StartupTrace("/tmp/startup_trace.json")
+        trace.start()
+        ...  # launch the application
+        trace.mark("kit_startup")
+        trace.stop()
+        trace.write_report()
+    """
+
+    def __init__(self, report_path: str) -> None:
+        self.report_path = report_path
+        self._import_timer = _ImportTimer()
+        self._phases: list[tuple[str, float]] = []
+        self._extension_events: list[tuple[str, float]] = []
+        self._extension_roots: dict[str, str | None] = {}
+        self._start_time = 0.0
+        self._last_mark = 0.0
+        self._stop_time = 0.0
+        self._logging = None
+        self._logger_handle = None
+
+    def start(self) -> None:
+        """Install the import timer and the extension startup log listener."""
+        self._start_time = self._last_mark = time.perf_counter()
+        sys.meta_path.insert(0, self._import_timer)
+        try:
+            self._logging = carb.logging.acquire_logging()
+            self._logger_handle = self._logging.add_logger(self._on_log)
+        except Exception as e:
+            carb.log_warn(f"Startup trace: extension startup events unavailable ({e})")
+            self._logging = None
+
+    def stop(self) -> None:
+        """Remove the import timer and the log listener."""
+        self._stop_time = time.perf_counter()
+        with contextlib.suppress(ValueError):
+            sys.meta_path.remove(self._import_timer)
+        if self._logging is not None and self._logger_handle is not None:
+            self._logging.remove_logger(self._logger_handle)
+        self._logging = None
+        self._logger_handle = None
+
+    def mark(self, name: str) -> None:
+        """End the current launch phase.
+
+        The phase spans from the previous mark (or :meth:`start`) until now.
+
+        Args:
+            name: Phase name used in the report.
+        """
+        now = time.perf_counter()
+        self._phases.append((name, now - self._last_mark))
+        self._last_mark = now
+
+    def _on_log(self, source: str, level: int, filename: str, line_number: int, message: str) -> None:
+        """Record extension startup events from the carb log.
+
+        Args:
+            source: The source of the log message.
+            level: The logging level.
+            filename: The source filename.
+            line_number: The line number in the source file.
+            message: The log message content.
+        """
+        match = _EXT_STARTUP_PATTERN.search(message)
+        if match is not None:
+            self._extension_events.append((match.group("ext_id"), time.perf_counter()))
+
+    def _extension_of(self, path: str | None) -> str | None:
+        """Return the name of the extension whose folder contains *path*.
+
+        Args:
+            path: Module file path.
+
+        Returns:
+            The extension name, or None if the file is not inside an extension.
+        """
+        if not path:
+            return None
+        directory = os.path.dirname(os.path.abspath(path))
+        visited = []
+        result = None
+        while True:
+            if directory in self._extension_roots:
+                result = self._extension_roots[directory]
+                break
+            visited.append(directory)
+            if os.path.isfile(os.path.join(directory, "config", "extension.toml")):
+                result = _extension_name(os.path.basename(directory))
+                break
+            parent = os.path.dirname(directory)
+            if parent == directory:
+                break
+            directory = parent
+        for entry in visited:
+            self._extension_roots[entry] = result
+        return result
+
+    def build_report(self) -> dict[str, Any]:
+        """Assemble the trace into a JSON-serializable report.
+
+        Returns:
+            The report with ``phases``, ``extensions`` (slowest first) and ``imports`` (slowest first).
+        """
+        stop_time = self._stop_time or time.perf_counter()
+
+        imports = []
+        import_totals: dict[str, float] = {}
+        for name, origin, self_time, cumulative in self._import_timer.records:
+            extension = self._extension_of(origin)
+            imports.append(
+                {
+                    "module": name,
+                    "extension": extension,
+                    "self_seconds": round(self_time, 6),
+                    "cumulative_seconds": round(cumulative, 6),
+                }
+            )
+            if extension is not None:
+                import_totals[extension] = import_totals.get(extension, 0.0) + self_time
+        imports.sort(key=lambda item: item["cumulative_seconds"], reverse=True)
+
+        extensions = []
+        events = self._extension_events
+        for i, (ext_id, timestamp) in enumerate(events):
+            end = events[i + 1][1] if i + 1 < len(events) else stop_time
+            name = _extension_name(ext_id)
+            extensions.append(
+                {
+                    "id": ext_id,
+                    "start_offset_seconds": round(timestamp - self._start_time, 6),
+                    "startup_seconds": round(end - timestamp, 6),
+                    "python_import_seconds": round(import_totals.pop(name, 0.0), 6),
+                }
+            )
+        # Extensions whose modules were imported without a captured startup event
+        for name, seconds in import_totals.items():
+            extensions.append(
+                {
+                    "id": name,
+                    "start_offset_seconds": None,
+                    "startup_seconds": None,
+                    "python_import_seconds": round(seconds, 6),
+                }
+            )
+        extensions.sort(key=lambda item: (item["startup_seconds"] or 0.0, item["python_import_seconds"]), reverse=True)
+
+        return {
+            "version": REPORT_VERSION,
+            "total_seconds": round(stop_time - self._start_time, 6),
+            "phases": {name: round(seconds, 6) for name, seconds in self._phases},
+            "python_import_seconds": round(sum(record[2] for record in self._import_timer.records), 6),
+            "extension_startup_events": len(events),
+            "extensions": extensions,
+            "imports": imports,
+        }
+
+    def write_report(self) -> dict[str, Any]:
+        """Write the JSON report to :attr:`report_path`.
+
+        Returns:
+            The report that was written.
+        """
+        report = self.build_report()
+        directory = os.path.dirname(os.path.abspath(self.report_path))
+        os.makedirs(directory, exist_ok=True)
+        with open(self.report_path, "w") as f:
+            json.dump(report, f, indent=2)
+        return report
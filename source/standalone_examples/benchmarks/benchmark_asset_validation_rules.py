@@ -0,0 +1,168 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark the Isaac Sim asset validation rule set on a synthetic many-body robot.
+
+A serial chain of N rigid bodies (each with a nested collider, mass properties and a driven revolute joint) is
+validated with every rule of ``isaacsim.asset.validation``. Each rule runs ``CheckStage`` followed by
+``CheckPrim`` on every prim, as the validation engine does, once with the stage index rebuilt before every rule
+(one traversal per rule) and once with the index shared by all rules. The validation engine is then timed on
+the whole rule set.
+"""
+
+import argparse
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--num-bodies", type=int, default=1000, help="Number of rigid bodies in the chain")
+parser.add_argument("--num-iterations", type=int, default=3, help="Number of validation runs per mode")
+parser.add_argument(
+    "--backend-type",
+    default="OmniPerfKPIFile",
+    choices=["LocalLogMetrics", "JSONFileMetrics", "OsmoKPIFile", "OmniPerfKPIFile"],
+    help="Benchmarking backend, defaults",
+)
+
+args, unknown = parser.parse_known_args()
+
+from isaacsim import SimulationApp
+
+simulation_app = SimulationApp({"headless": True})
+
+import inspect
+import time
+
+from isaacsim.core.utils.extensions import enable_extension
+
+enable_extension("isaacsim.benchmark.services")
+enable_extension("isaacsim.asset.validation")
+simulation_app.update()
+
+from isaacsim.asset.validation import drive_rules, joint_rules, material_rules, physics_rules, robot_rules
+from isaacsim.asset.validation.stage_index import invalidate_stage_index
+from isaacsim.asset.validation.util import DedupBaseRuleChecker
+from isaacsim.benchmark.services import BaseIsaacBenchmark
+from isaacsim.benchmark.services.metrics.measurements import SingleMeasurement
+from omni.asset_validator.core import ValidationEngine
+from pxr import Gf, PhysxSchema, Sdf, Usd, UsdGeom, UsdPhysics
+
+rule_classes = [
+    cls
+    for module in (drive_rules, joint_rules, material_rules, physics_rules, robot_rules)
+    for _, cls in inspect.getmembers(module, inspect.isclass)
+    if issubclass(cls, DedupBaseRuleChecker) and cls.__module__ == module.__name__
+]
+
+
+def build_chain(num_bodies: int) -> Usd.Stage:
+    """Build a serial chain of rigid bodies connected by driven revolute joints."""
+    stage = Usd.Stage.CreateInMemory()
+    UsdGeom.SetStageMetersPerUnit(stage, 1.0)
+    robot = UsdGeom.Xform.Define(stage, "/Robot").GetPrim()
+    stage.SetDefaultPrim(robot)
+    UsdPhysics.ArticulationRootAPI.Apply(robot)
+    with Sdf.ChangeBlock():
+        for i in range(num_bodies):
+            link = UsdGeom.Xform.Define(stage, f"/Robot/link_{i}")
+            link.AddTranslateOp().Set(Gf.Vec3d(0.0, 0.0, 0.2 * i))
+            UsdPhysics.RigidBodyAPI.Apply(link.GetPrim())
+            mass_api = UsdPhysics.MassAPI.Apply(link.GetPrim())
+            mass_api.CreateMassAttr().Set(1.0)
+            mass_api.CreateDiagonalInertiaAttr().Set(Gf.Vec3f(0.01, 0.01, 0.01))
+            collider = UsdGeom.Cube.Define(stage, f"/Robot/link_{i}/collisions/box")
+            collider.CreateSizeAttr().Set(0.1)
+            UsdPhysics.CollisionAPI.Apply(collider.GetPrim())
+            if i == 0:
+                continue
+            joint = UsdPhysics.RevoluteJoint.Define(stage, f"/Robot/joints/joint_{i}")
+            joint.CreateAxisAttr().Set("Z")
+            joint.CreateBody0Rel().SetTargets([Sdf.Path(f"/Robot/link_{i - 1}")])
+            joint.CreateBody1Rel().SetTargets([link.GetPath()])
+            joint.CreateLocalPos0Attr().Set(Gf.Vec3f(0.0, 0.0, 0.1))
+            joint.CreateLocalPos1Attr().Set(Gf.Vec3f(0.0, 0.0, -0.1))
+            PhysxSchema.PhysxJointAPI.Apply(joint.GetPrim()).CreateMaxJointVelocityAttr().Set(100.0)
+            drive = UsdPhysics.DriveAPI.Apply(joint.GetPrim(), "angular")
+            drive.CreateStiffnessAttr().Set(100.0)
+            drive.CreateDampingAttr().Set(1.0)
+            drive.CreateMaxForceAttr().Set(1000.0)
+            PhysxSchema.JointStateAPI.Apply(joint.GetPrim(), "angular")
+    return stage
+
+
+def run_rules(stage: Usd.Stage, shared_index: bool) -> None:
+    """Run every rule on the stage like the validation engine does."""
+    for rule_class in rule_classes:
+        if not shared_index:
+            invalidate_stage_index(stage)
+        rule = rule_class()
+        rule.CheckStage(stage)
+        for prim in stage.Traverse():
+            rule.CheckPrim(prim)
+
+
+stage = build_chain(args.num_bodies)
+num_prims = len(list(stage.Traverse()))
+simulation_app.update()
+
+benchmark = BaseIsaacBenchmark(
+    benchmark_name="benchmark_asset_validation_rules",
+    workflow_metadata={
+        "metadata": [
+            {"name": "num_bodies", "data": args.num_bodies},
+            {"name": "num_prims", "data": num_prims},
+            {"name": "num_rules", "data": len(rule_classes)},
+            {"name": "num_iterations", "data": args.num_iterations},
+        ]
+    },
+    backend_type=args.backend_type,
+)
+
+validation_times = {}
+for mode, shared_index in (("index_per_rule", False), ("shared_index", True)):
+    benchmark.set_phase(mode, start_recording_frametime=False, start_recording_runtime=True)
+    start_time = time.perf_counter()
+    for _ in range(args.num_iterations):
+        invalidate_stage_index(stage)
+        run_rules(stage, shared_index)
+    validation_times[mode] = (time.perf_counter() - start_time) / args.num_iterations
+    benchmark.store_measurements()
+    benchmark.store_custom_measurement(
+        mode, SingleMeasurement(name="Mean Validation Time", value=round(validation_times[mode] * 1000, 3), unit="ms")
+    )
+speedup = validation_times["index_per_rule"] / validation_times["shared_index"]
+benchmark.store_custom_measurement(
+    "shared_index", SingleMeasurement(name="Speedup vs Index Per Rule", value=round(speedup, 2), unit="x")
+)
+
+benchmark.set_phase("validation_engine", start_recording_frametime=False, start_recording_runtime=True)
+engine = ValidationEngine(init_rules=False)
+for rule_class in rule_classes:
+    engine.enable_rule(rule_class)
+start_time = time.perf_counter()
+num_issues = sum(1 for _ in engine.validate(stage))
+validation_times["validation_engine"] = time.perf_counter() - start_time
+benchmark.store_measurements()
+benchmark.store_custom_measurement(
+    "validation_engine",
+    SingleMeasurement(name="Validation Time", value=round(validation_times["validation_engine"] * 1000, 3), unit="ms"),
+)
+print(
+    f"asset validation of {num_prims} prims with {len(rule_classes)} rules: "
+    f"index per rule {validation_times['index_per_rule'] * 1000:.1f} ms, "
+    f"shared index {validation_times['shared_index'] * 1000:.1f} ms ({speedup:.1f}x), "
+    f"validation engine {validation_times['validation_engine'] * 1000:.1f} ms ({num_issues} issues)"
+)
+
+benchmark.stop()
+simulation_app.close()
@@ -0,0 +1,184 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark the importer post-processing that authors colliders, link densities and joint drives.
+
+A synthetic robot with N links, each with M visual meshes and primitives (some already colliders, some guide
+colliders) and a driven revolute joint, is built on the stage of the USD context, where Kit listens to every
+change. Colliders, densities and drives are then authored once with the previous per-prim ``Usd`` API calls and
+once with ``isaacsim.asset.importer.utils``, which authors each helper's edits in one ``Sdf`` change block. The
+number of ``ObjectsChanged`` notices sent by the stage is reported next to the authoring time.
+"""
+
+import argparse
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--num-links", type=int, default=500, help="Number of rigid body links")
+parser.add_argument("--num-visuals", type=int, default=20, help="Number of visual geometry prims per link")
+parser.add_argument("--num-iterations", type=int, default=3, help="Number of authoring runs per mode")
+parser.add_argument(
+    "--backend-type",
+    default="OmniPerfKPIFile",
+    choices=["LocalLogMetrics", "JSONFileMetrics", "OsmoKPIFile", "OmniPerfKPIFile"],
+    help="Benchmarking backend, defaults",
+)
+
+args, unknown = parser.parse_known_args()
+
+from isaacsim import SimulationApp
+
+simulation_app = SimulationApp({"headless": True})
+
+import math
+import time
+
+from isaacsim.core.utils.extensions import enable_extension
+
+enable_extension("isaacsim.benchmark.services")
+enable_extension("isaacsim.asset.importer.utils")
+simulation_app.update()
+
+import omni.usd
+from isaacsim.asset.importer.utils import apply_joint_drives, apply_link_density, collision_from_visuals
+from isaacsim.asset.importer.utils.impl.importer_utils import USD_GEOMETRY_TYPES
+from isaacsim.benchmark.services import BaseIsaacBenchmark
+from isaacsim.benchmark.services.metrics.measurements import SingleMeasurement
+from pxr import Sdf, Tf, Usd, UsdGeom, UsdPhysics
+
+GEOMETRY_TYPES = (UsdGeom.Mesh, UsdGeom.Mesh, UsdGeom.Mesh, UsdGeom.Cube, UsdGeom.Sphere)
+
+
+def build_robot(stage: Usd.Stage) -> None:
+    """Build the synthetic robot under ``/Robot`` on the given stage."""
+    robot = UsdGeom.Xform.Define(stage, "/Robot").GetPrim()
+    stage.SetDefaultPrim(robot)
+    for i in range(args.num_links):
+        link = UsdGeom.Xform.Define(stage, f"/Robot/link_{i}").GetPrim()
+        UsdPhysics.RigidBodyAPI.Apply(link)
+        if i % 2 == 0:
+            UsdPhysics.MassAPI.Apply(link).CreateMassAttr(1.0)
+        for j in range(args.num_visuals):
+            geom = GEOMETRY_TYPES[j % len(GEOMETRY_TYPES)].Define(stage, f"/Robot/link_{i}/visuals/geom_{j}")
+            if j % 7 == 0:
+                UsdPhysics.CollisionAPI.Apply(geom.GetPrim())
+            if j % 11 == 0:
+                geom.CreatePurposeAttr(UsdGeom.Tokens.guide)
+                UsdPhysics.CollisionAPI.Apply(geom.GetPrim())
+        if i == 0:
+            continue
+        joint = UsdPhysics.RevoluteJoint.Define(stage, f"/Robot/joints/joint_{i}")
+        joint.CreateBody0Rel().SetTargets([Sdf.Path(f"/Robot/link_{i - 1}")])
+        joint.CreateBody1Rel().SetTargets([link.GetPath()])
+        UsdPhysics.DriveAPI.Apply(joint.GetPrim(), "angular")
+
+
+def author_per_prim(stage: Usd.Stage) -> None:
+    """Author colliders, densities and drives one ``Usd`` API call at a time, as the importer used to."""
+    removed_colliders = []
+    for prim in stage.Traverse():
+        prim_type = prim.GetTypeName()
+        if prim_type not in USD_GEOMETRY_TYPES:
+            continue
+        purpose = UsdGeom.Imageable(prim).GetPurposeAttr().Get()
+        if prim.HasAPI(UsdPhysics.CollisionAPI) and purpose == UsdGeom.Tokens.guide:
+            removed_colliders.append(prim.GetPath())
+            continue
+        if purpose not in (UsdGeom.Tokens.default_, UsdGeom.Tokens.render):
+            continue
+        if prim.HasAPI(UsdPhysics.CollisionAPI):
+            UsdPhysics.CollisionAPI(prim).CreateCollisionEnabledAttr().Set(True)
+        else:
+            UsdPhysics.CollisionAPI.Apply(prim)
+        if prim_type == "Mesh":
+            UsdPhysics.MeshCollisionAPI.Apply(prim).GetApproximationAttr().Set(UsdPhysics.Tokens.convexHull)
+    for prim_path in removed_colliders:
+        stage.RemovePrim(prim_path)
+
+    for prim in stage.Traverse():
+        if prim.HasAPI(UsdPhysics.RigidBodyAPI):
+            mass_api = UsdPhysics.MassAPI.Apply(prim)
+            mass_attr = mass_api.GetMassAttr()
+            if not (mass_attr and mass_attr.HasValue() and mass_attr.Get() > 0.0):
+                mass_api.CreateDensityAttr().Set(1000.0)
+        elif prim.IsA(UsdPhysics.RevoluteJoint):
+            drive = UsdPhysics.DriveAPI.Get(prim, "angular")
+            drive.CreateTypeAttr().Set("force")
+            drive.CreateStiffnessAttr().Set(100.0 * math.pi / 180.0)
+            drive.CreateDampingAttr().Set(10.0 * math.pi / 180.0)
+
+
+def author_batched(stage: Usd.Stage) -> None:
+    """Author the same edits with the importer utilities."""
+    collision_from_visuals(stage, "Convex Hull")
+    apply_link_density(stage, 1000.0)
+    apply_joint_drives(stage, drive_type="force", stiffness=100.0, damping=10.0)
+
+
+context = omni.usd.get_context()
+context.new_stage()
+build_robot(context.get_stage())
+num_prims = len(list(context.get_stage().Traverse()))
+
+benchmark = BaseIsaacBenchmark(
+    benchmark_name="benchmark_importer_collider_authoring",
+    workflow_metadata={
+        "metadata": [
+            {"name": "num_links", "data": args.num_links},
+            {"name": "num_visuals", "data": args.num_visuals},
+            {"name": "num_prims", "data": num_prims},
+            {"name": "num_iterations", "data": args.num_iterations},
+        ]
+    },
+    backend_type=args.backend_type,
+)
+
+authoring_times = {}
+notice_counts = {}
+for mode, author in (("per_prim", author_per_prim), ("batched", author_batched)):
+    benchmark.set_phase(mode, start_recording_frametime=False, start_recording_runtime=True)
+    elapsed = 0.0
+    for _ in range(args.num_iterations):
+        context.new_stage()
+        stage = context.get_stage()
+        build_robot(stage)
+        simulation_app.update()
+        notices = []
+        listener = Tf.Notice.Register(Usd.Notice.ObjectsChanged, lambda notice, sender: notices.append(1), stage)
+        start_time = time.perf_counter()
+        author(stage)
+        elapsed += time.perf_counter() - start_time
+        listener.Revoke()
+        simulation_app.update()
+    authoring_times[mode] = elapsed / args.num_iterations
+    notice_counts[mode] = len(notices)
+    benchmark.store_measurements()
+    benchmark.store_custom_measurement(
+        mode, SingleMeasurement(name="Mean Authoring Time", value=round(authoring_times[mode] * 1000, 3), unit="ms")
+    )
+    benchmark.store_custom_measurement(
+        mode, SingleMeasurement(name="ObjectsChanged Notices", value=notice_counts[mode], unit="count")
+    )
+speedup = authoring_times["per_prim"] / authoring_times["batched"]
+benchmark.store_custom_measurement(
+    "batched", SingleMeasurement(name="Speedup vs Per Prim", value=round(speedup, 2), unit="x")
+)
+print(
+    f"importer authoring on {num_prims} prims: "
+    f"per prim {authoring_times['per_prim'] * 1000:.1f} ms ({notice_counts['per_prim']} notices), "
+    f"batched {authoring_times['batched'] * 1000:.1f} ms ({notice_counts['batched']} notices, {speedup:.1f}x)"
+)
+
+benchmark.stop()
+simulation_app.close()
@@ -0,0 +1,184 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark the lockstep round trip of the isaacsim.examples.ipc tutorial bridge over TCP and shared memory.
+
+The tutorial bridge script runs as the external process, exactly as in the tutorial, while this process plays the
+simulation side of the **Receive External Step** → **Send Simulation Clock** graph: it waits for a step, answers
+with the clock and times how long the bridge takes to send the next step. The exchange runs over TCP sockets,
+over shared-memory rings, and over shared-memory rings with a payload (e.g. joint states) appended to the clock.
+"""
+
+import argparse
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--num-frames", type=int, default=10000, help="Number of lockstep frames per transport")
+parser.add_argument("--payload-bytes", type=int, default=1024, help="Payload appended to the clock in shm_payload")
+parser.add_argument(
+    "--backend-type",
+    default="OmniPerfKPIFile",
+    choices=["LocalLogMetrics", "JSONFileMetrics", "OsmoKPIFile", "OmniPerfKPIFile"],
+    help="Benchmarking backend, defaults",
+)
+
+args, unknown = parser.parse_known_args()
+
+from isaacsim import SimulationApp
+
+simulation_app = SimulationApp({"headless": True})
+
+import os
+import socket
+import struct
+import subprocess
+import sys
+import time
+
+import numpy as np
+from isaacsim.core.utils.extensions import enable_extension
+
+enable_extension("isaacsim.benchmark.services")
+enable_extension("isaacsim.examples.ipc")
+simulation_app.update()
+
+from isaacsim.benchmark.services import BaseIsaacBenchmark
+from isaacsim.benchmark.services.metrics.measurements import SingleMeasurement
+from isaacsim.examples.ipc.scripts import tcp_tutorial_playback_bridge
+from isaacsim.examples.ipc.scripts.shm_ring import ShmRing
+
+BRIDGE_SCRIPT = tcp_tutorial_playback_bridge.__file__
+
+
+def start_bridge(*bridge_args: str) -> subprocess.Popen:
+    """Start the tutorial bridge for the benchmark frames, without per-frame output."""
+    return subprocess.Popen(
+        [sys.executable, BRIDGE_SCRIPT, "--max-frames", str(args.num_frames), "--quiet", *bridge_args],
+        stdout=subprocess.DEVNULL,
+    )
+
+
+def recv_exact(conn: socket.socket, n: int) -> bytes:
+    """Read exactly n bytes from a blocking socket."""
+    data = b""
+    while len(data) < n:
+        part = conn.recv(n - len(data))
+        if not part:
+            raise ConnectionError("Bridge closed the connection")
+        data += part
+    return data
+
+
+def run_tcp() -> np.ndarray:
+    """Run the lockstep exchange over TCP and return the round-trip times in seconds."""
+    step_srv = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    step_srv.bind(("127.0.0.1", 0))
+    step_srv.listen(1)
+    step_srv.settimeout(30)
+    clock_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+        probe.bind(("127.0.0.1", 0))
+        clock_port = probe.getsockname()[1]
+    bridge = start_bridge(
+        "--transport", "tcp", "--step-port", str(step_srv.getsockname()[1]), "--clock-port", str(clock_port)
+    )
+    step_conn, _ = step_srv.accept()
+    round_trips = np.empty(args.num_frames - 1)
+    try:
+        recv_exact(step_conn, 4)
+        # The bridge listens for the clock before it connects to the step server
+        clock_sock.connect(("127.0.0.1", clock_port))
+        clock_sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        for frame in range(args.num_frames):
+            start_time = time.perf_counter()
+            clock_sock.sendall(struct.pack("<q", frame))
+            if frame < args.num_frames - 1:
+                recv_exact(step_conn, 4)
+                round_trips[frame] = time.perf_counter() - start_time
+        bridge.wait(timeout=30)
+    finally:
+        bridge.kill()
+        clock_sock.close()
+        step_conn.close()
+        step_srv.close()
+    return round_trips
+
+
+def run_shm(payload: bytes) -> np.ndarray:
+    """Run the lockstep exchange over shared-memory rings and return the round-trip times in seconds."""
+    step_name = f"isaacsim_ipc_bench_step_{os.getpid()}"
+    clock_name = f"isaacsim_ipc_bench_clock_{os.getpid()}"
+    step_ring = ShmRing.create(step_name, "consumer")
+    clock_ring = None
+    bridge = start_bridge("--transport", "shm", "--step-shm", step_name, "--clock-shm", clock_name)
+    round_trips = np.empty(args.num_frames - 1)
+    try:
+        # The bridge creates the clock ring before it primes the first step
+        if step_ring.recv(timeout=30) is None:
+            raise TimeoutError("Bridge did not prime the first step")
+        clock_ring = ShmRing.open(clock_name, "producer")
+        for frame in range(args.num_frames):
+            start_time = time.perf_counter()
+            clock_ring.send(struct.pack("<q", frame) + payload)
+            if frame < args.num_frames - 1:
+                step_ring.recv()
+                round_trips[frame] = time.perf_counter() - start_time
+        bridge.wait(timeout=30)
+    finally:
+        bridge.kill()
+        if clock_ring is not None:
+            clock_ring.close()
+        step_ring.close()
+    return round_trips
+
+
+benchmark = BaseIsaacBenchmark(
+    benchmark_name="benchmark_ipc_lockstep_transport",
+    workflow_metadata={
+        "metadata": [
+            {"name": "num_frames", "data": args.num_frames},
+            {"name": "payload_bytes", "data": args.payload_bytes},
+            {"name": "num_cpus", "data": os.cpu_count()},
+        ]
+    },
+    backend_type=args.backend_type,
+)
+
+latencies = {}
+for mode, run in (
+    ("tcp", run_tcp),
+    ("shm", lambda: run_shm(b"")),
+    ("shm_payload", lambda: run_shm(bytes(args.payload_bytes))),
+):
+    benchmark.set_phase(mode, start_recording_frametime=False, start_recording_runtime=True)
+    round_trips = run() * 1e6
+    latencies[mode] = (float(np.median(round_trips)), float(np.percentile(round_trips, 99)))
+    benchmark.store_measurements()
+    benchmark.store_custom_measurement(
+        mode, SingleMeasurement(name="Median Round Trip", value=round(latencies[mode][0], 2), unit="us")
+    )
+    benchmark.store_custom_measurement(
+        mode, SingleMeasurement(name="P99 Round Trip", value=round(latencies[mode][1], 2), unit="us")
+    )
+speedup = latencies["tcp"][0] / latencies["shm"][0]
+benchmark.store_custom_measurement("shm", SingleMeasurement(name="Speedup vs TCP", value=round(speedup, 2), unit="x"))
+print(
+    f"lockstep round trip over {args.num_frames} frames (median / p99): "
+    f"tcp {latencies['tcp'][0]:.1f} / {latencies['tcp'][1]:.1f} us, "
+    f"shm {latencies['shm'][0]:.1f} / {latencies['shm'][1]:.1f} us ({speedup:.1f}x), "
+    f"shm with {args.payload_bytes} B payload {latencies['shm_payload'][0]:.1f} / {latencies['shm_payload'][1]:.1f} us"
+)
+
+benchmark.stop()
+simulation_app.close()
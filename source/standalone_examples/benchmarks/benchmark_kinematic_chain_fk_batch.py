@@ -0,0 +1,146 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark forward-kinematics throughput: per-configuration ``KinematicChain.compute_fk`` versus ``compute_fk_batch``.
+
+A serial arm with alternating revolute axes and a prismatic joint is built on an in-memory stage. End-effector
+poses (and optionally all link poses) are computed for a set of random configurations, once by calling the
+single-configuration API in a loop and once with the batched API.
+"""
+
+import argparse
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--num-dof", type=int, default=7, help="Number of joints of the synthetic arm")
+parser.add_argument("--num-configs", type=int, default=200000, help="Number of configurations for the batched call")
+parser.add_argument(
+    "--num-loop-configs", type=int, default=2000, help="Number of configurations for the per-configuration loop"
+)
+parser.add_argument("--link-poses", action="store_true", help="Also return all link poses")
+parser.add_argument(
+    "--backend-type",
+    default="OmniPerfKPIFile",
+    choices=["LocalLogMetrics", "JSONFileMetrics", "OsmoKPIFile", "OmniPerfKPIFile"],
+    help="Benchmarking backend, defaults",
+)
+
+args, unknown = parser.parse_known_args()
+
+from isaacsim import SimulationApp
+
+simulation_app = SimulationApp({"headless": True})
+
+import time
+
+import numpy as np
+from isaacsim.core.utils.extensions import enable_extension
+
+enable_extension("isaacsim.benchmark.services")
+simulation_app.update()
+
+from isaacsim.benchmark.services import BaseIsaacBenchmark
+from isaacsim.benchmark.services.metrics.measurements import SingleMeasurement
+from pxr import Gf, Usd, UsdGeom, UsdPhysics
+from usd.schema.isaac.robot_schema import ApplyRobotAPI
+from usd.schema.isaac.robot_schema.kinematic_chain import KinematicChain
+
+num_dof = args.num_dof
+
+# Serial arm: every third joint is prismatic, revolute axes cycle through Z, Y, X
+stage = Usd.Stage.CreateInMemory()
+robot_prim = UsdGeom.Xform.Define(stage, "/Robot").GetPrim()
+UsdPhysics.RigidBodyAPI.Apply(robot_prim)
+UsdPhysics.ArticulationRootAPI.Apply(robot_prim)
+parent = robot_prim
+for i in range(num_dof):
+    link = UsdGeom.Xform.Define(stage, f"/Robot/link_{i}").GetPrim()
+    UsdPhysics.RigidBodyAPI.Apply(link)
+    joint_type = UsdPhysics.PrismaticJoint if i % 3 == 2 else UsdPhysics.RevoluteJoint
+    joint = joint_type.Define(stage, f"/Robot/joint_{i}")
+    joint.CreateBody0Rel().SetTargets([parent.GetPath()])
+    joint.CreateBody1Rel().SetTargets([link.GetPath()])
+    joint.CreateAxisAttr("ZYX"[i % 3])
+    joint.CreateLocalPos0Attr().Set(Gf.Vec3f(0.1, 0.0, 0.3))
+    joint.CreateLocalRot0Attr().Set(Gf.Quatf(0.9238795, 0.3826834, 0.0, 0.0))
+    joint.CreateLocalPos1Attr().Set(Gf.Vec3f(0.0, 0.0, 0.0))
+    joint.CreateLocalRot1Attr().Set(Gf.Quatf(1.0, 0.0, 0.0, 0.0))
+    parent = link
+ApplyRobotAPI(robot_prim)
+
+chain = KinematicChain(stage, robot_prim, robot_prim, parent)
+if len(chain.joints) != num_dof:
+    raise RuntimeError(f"Expected a chain of {num_dof} joints, got {len(chain.joints)}")
+
+rng = np.random.default_rng(0)
+q_batch = rng.uniform(-1.0, 1.0, (args.num_configs, num_dof))
+q_loop = q_batch[: args.num_loop_configs]
+
+
+def run_loop() -> int:
+    for q in q_loop:
+        chain.compute_fk(q)
+    return len(q_loop)
+
+
+def run_batch() -> int:
+    chain.compute_fk_batch(q_batch, return_link_poses=args.link_poses)
+    return len(q_batch)
+
+
+# Check that both paths agree before timing them
+positions, quaternions = chain.compute_fk_batch(q_loop[:16])
+for q, position, quaternion in zip(q_loop[:16], positions, quaternions):
+    transform, _ = chain.compute_fk(q)
+    if not (np.allclose(transform.t, position, atol=1e-9) and np.allclose(transform.q, quaternion, atol=1e-9)):
+        raise RuntimeError("Batched FK does not match the per-configuration FK")
+
+benchmark = BaseIsaacBenchmark(
+    benchmark_name="benchmark_kinematic_chain_fk_batch",
+    workflow_metadata={
+        "metadata": [
+            {"name": "num_dof", "data": num_dof},
+            {"name": "num_configs", "data": args.num_configs},
+            {"name": "num_loop_configs", "data": args.num_loop_configs},
+            {"name": "link_poses", "data": args.link_poses},
+        ]
+    },
+    backend_type=args.backend_type,
+)
+
+throughput = {}
+for mode, fn in (("loop", run_loop), ("batch", run_batch)):
+    benchmark.set_phase(mode, start_recording_frametime=False, start_recording_runtime=True)
+    start_time = time.perf_counter()
+    num_configs = fn()
+    elapsed = time.perf_counter() - start_time
+    throughput[mode] = num_configs / elapsed
+    benchmark.store_measurements()
+    benchmark.store_custom_measurement(
+        mode, SingleMeasurement(name="Total FK Time", value=round(elapsed * 1000, 3), unit="ms")
+    )
+    benchmark.store_custom_measurement(
+        mode, SingleMeasurement(name="FK Throughput", value=round(throughput[mode], 1), unit="configs/s")
+    )
+speedup = throughput["batch"] / throughput["loop"]
+benchmark.store_custom_measurement(
+    "batch", SingleMeasurement(name="Speedup vs Loop", value=round(speedup, 2), unit="x")
+)
+print(
+    f"{num_dof}-DOF FK: loop {throughput['loop']:.0f} configs/s, batch {throughput['batch']:.0f} configs/s "
+    f"({speedup:.1f}x)"
+)
+
+benchmark.stop()
+simulation_app.close()
@@ -0,0 +1,110 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark mesh point updates: per-mesh ``Mesh.set_points``/``get_points`` versus the packed accessors.
+
+The points of N meshes are rewritten and read back for a number of iterations, once with one array per mesh
+and once with a single concatenated buffer plus an offsets array.
+"""
+
+import argparse
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--num-meshes", type=int, default=10000, help="Number of meshes")
+parser.add_argument("--num-iterations", type=int, default=5, help="Number of update iterations per mode")
+parser.add_argument(
+    "--backend-type",
+    default="OmniPerfKPIFile",
+    choices=["LocalLogMetrics", "JSONFileMetrics", "OsmoKPIFile", "OmniPerfKPIFile"],
+    help="Benchmarking backend, defaults",
+)
+
+args, unknown = parser.parse_known_args()
+
+from isaacsim import SimulationApp
+
+simulation_app = SimulationApp({"headless": True})
+
+import time
+
+import isaacsim.core.experimental.utils.stage as stage_utils
+import numpy as np
+from isaacsim.core.utils.extensions import enable_extension
+
+enable_extension("isaacsim.benchmark.services")
+simulation_app.update()
+
+from isaacsim.benchmark.services import BaseIsaacBenchmark
+from isaacsim.benchmark.services.metrics.measurements import SingleMeasurement
+from isaacsim.core.experimental.objects import Mesh
+
+num_meshes = args.num_meshes
+stage_utils.create_new_stage()
+stage_utils.define_prim("/World", "Xform")
+meshes = Mesh([f"/World/mesh_{i}" for i in range(num_meshes)], primitives="Plane")
+simulation_app.update()
+
+points, offsets = meshes.get_points_packed()
+points = points.numpy()
+offsets = offsets.numpy()
+points_per_mesh = [points[offsets[i] : offsets[i + 1]] for i in range(num_meshes)]
+rng = np.random.default_rng(0)
+
+
+def run_per_mesh() -> None:
+    noise = rng.uniform(-0.01, 0.01, points.shape).astype(np.float32)
+    meshes.set_points([chunk + noise[offsets[i] : offsets[i + 1]] for i, chunk in enumerate(points_per_mesh)])
+    meshes.get_points()
+
+
+def run_packed() -> None:
+    noise = rng.uniform(-0.01, 0.01, points.shape).astype(np.float32)
+    meshes.set_points_packed(points + noise, offsets)
+    meshes.get_points_packed()
+
+
+benchmark = BaseIsaacBenchmark(
+    benchmark_name="benchmark_mesh_packed_geometry",
+    workflow_metadata={
+        "metadata": [
+            {"name": "num_meshes", "data": num_meshes},
+            {"name": "num_iterations", "data": args.num_iterations},
+        ]
+    },
+    backend_type=args.backend_type,
+)
+
+update_times = {}
+for mode, fn in (("per_mesh", run_per_mesh), ("packed", run_packed)):
+    benchmark.set_phase(mode, start_recording_frametime=False, start_recording_runtime=True)
+    start_time = time.perf_counter()
+    for _ in range(args.num_iterations):
+        fn()
+    update_times[mode] = (time.perf_counter() - start_time) / args.num_iterations
+    benchmark.store_measurements()
+    benchmark.store_custom_measurement(
+        mode, SingleMeasurement(name="Mean Update Time", value=round(update_times[mode] * 1000, 3), unit="ms")
+    )
+speedup = update_times["per_mesh"] / update_times["packed"]
+benchmark.store_custom_measurement(
+    "packed", SingleMeasurement(name="Speedup vs Per Mesh", value=round(speedup, 2), unit="x")
+)
+print(
+    f"mesh points: per mesh {update_times['per_mesh'] * 1000:.1f} ms, packed {update_times['packed'] * 1000:.1f} ms "
+    f"per set/get for {num_meshes} meshes ({speedup:.1f}x)"
+)
+
+benchmark.stop()
+simulation_app.close()
@@ -0,0 +1,111 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark quintic path planning: per-pair ``quintic_polynomials_planner`` loop versus the batched planner.
+
+Trajectories between N random start/goal pairs are planned once by calling the single-pair planner for every
+pair and once with ``quintic_polynomials_planner_batch``.
+"""
+
+import argparse
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--num-pairs", type=int, default=256, help="Number of start/goal pairs")
+parser.add_argument("--dt", type=float, default=0.1, help="Trajectory sample time in seconds")
+parser.add_argument(
+    "--backend-type",
+    default="OmniPerfKPIFile",
+    choices=["LocalLogMetrics", "JSONFileMetrics", "OsmoKPIFile", "OmniPerfKPIFile"],
+    help="Benchmarking backend, defaults",
+)
+
+args, unknown = parser.parse_known_args()
+
+from isaacsim import SimulationApp
+
+simulation_app = SimulationApp({"headless": True})
+
+import time
+
+import numpy as np
+from isaacsim.core.utils.extensions import enable_extension
+
+enable_extension("isaacsim.benchmark.services")
+enable_extension("isaacsim.robot.experimental.wheeled_robots")
+simulation_app.update()
+
+from isaacsim.benchmark.services import BaseIsaacBenchmark
+from isaacsim.benchmark.services.metrics.measurements import SingleMeasurement
+from isaacsim.robot.experimental.wheeled_robots.controllers import (
+    quintic_polynomials_planner,
+    quintic_polynomials_planner_batch,
+)
+
+rng = np.random.default_rng(0)
+num_pairs = args.num_pairs
+max_accel = 1.0
+max_jerk = 0.5
+starts = rng.uniform([-5.0, -5.0, -np.pi, 0.0, 0.0], [5.0, 5.0, np.pi, 1.0, 0.2], (num_pairs, 5))
+goals = rng.uniform([-20.0, -20.0, -np.pi, 0.0, 0.0], [20.0, 20.0, np.pi, 1.0, 0.2], (num_pairs, 5))
+
+
+def run_loop() -> None:
+    for start, goal in zip(starts, goals):
+        try:
+            quintic_polynomials_planner(*start, *goal, max_accel, max_jerk, args.dt)
+        except ValueError:
+            pass
+
+
+def run_batch() -> None:
+    quintic_polynomials_planner_batch(*starts.T, *goals.T, max_accel, max_jerk, args.dt)
+
+
+benchmark = BaseIsaacBenchmark(
+    benchmark_name="benchmark_quintic_path_planner_batch",
+    workflow_metadata={
+        "metadata": [
+            {"name": "num_pairs", "data": num_pairs},
+            {"name": "dt", "data": args.dt},
+        ]
+    },
+    backend_type=args.backend_type,
+)
+
+plan_times = {}
+for mode, fn in (("loop", run_loop), ("batch", run_batch)):
+    benchmark.set_phase(mode, start_recording_frametime=False, start_recording_runtime=True)
+    start_time = time.perf_counter()
+    fn()
+    plan_times[mode] = time.perf_counter() - start_time
+    benchmark.store_measurements()
+    benchmark.store_custom_measurement(
+        mode, SingleMeasurement(name="Planning Time", value=round(plan_times[mode] * 1000, 3), unit="ms")
+    )
+    benchmark.store_custom_measurement(
+        mode,
+        SingleMeasurement(name="Plans Per Second", value=round(num_pairs / plan_times[mode], 1), unit="plans/s"),
+    )
+speedup = plan_times["loop"] / plan_times["batch"]
+benchmark.store_custom_measurement(
+    "batch", SingleMeasurement(name="Speedup vs Loop", value=round(speedup, 2), unit="x")
+)
+print(
+    f"quintic planner: loop {plan_times['loop'] * 1000:.1f} ms, batch {plan_times['batch'] * 1000:.1f} ms "
+    f"for {num_pairs} pairs ({speedup:.1f}x)"
+)
+
+benchmark.stop()
+simulation_app.close()
@@ -0,0 +1,191 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark PoseWriter throughput with inline writing versus the background WritePipeline.
+
+Frames are generated from synthetic annotator data, so the measured rate isolates the writer
+(projection, JSON/PNG encoding and file I/O) from rendering.
+"""
+
+import argparse
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--num-frames", type=int, default=200, help="Number of frames written per mode")
+parser.add_argument("--num-objects", type=int, default=50, help="Number of 3D bounding boxes per frame")
+parser.add_argument(
+    "--resolution", nargs=2, type=int, default=[1280, 720], help="Synthetic RGB resolution as [width, height] px"
+)
+parser.add_argument("--num-write-workers", type=int, default=4, help="Encoding threads of the write pipeline")
+parser.add_argument("--debug-images", action="store_true", help="Also write the debug overlay images")
+parser.add_argument("--output-dir", type=str, default=None, help="Output directory, defaults to a temp directory")
+parser.add_argument(
+    "--backend-type",
+    default="OmniPerfKPIFile",
+    choices=["LocalLogMetrics", "JSONFileMetrics", "OsmoKPIFile", "OmniPerfKPIFile"],
+    help="Benchmarking backend, defaults",
+)
+
+args, unknown = parser.parse_known_args()
+
+from isaacsim import SimulationApp
+
+simulation_app = SimulationApp({"headless": True})
+
+import os
+import tempfile
+import time
+
+import numpy as np
+from isaacsim.core.utils.extensions import enable_extension
+
+enable_extension("isaacsim.benchmark.services")
+enable_extension("isaacsim.replicator.writers")
+simulation_app.update()
+
+from isaacsim.benchmark.services import BaseIsaacBenchmark
+from isaacsim.benchmark.services.metrics.measurements import SingleMeasurement
+from isaacsim.replicator.writers import PoseWriter
+
+BBOX_3D_DTYPE = np.dtype(
+    [
+        ("semanticId", "<u4"),
+        ("x_min", "<f4"),
+        ("y_min", "<f4"),
+        ("z_min", "<f4"),
+        ("x_max", "<f4"),
+        ("y_max", "<f4"),
+        ("z_max", "<f4"),
+        ("transform", "<f4", (4, 4)),
+        ("occlusionRatio", "<f4"),
+    ]
+)
+
+
+def make_synthetic_frame(rng: np.random.Generator, num_objects: int, width: int, height: int) -> dict:
+    """Build one frame of annotator data in the layout PoseWriter receives from Replicator.
+
+    Args:
+        rng: Random generator.
+        num_objects: Number of 3D bounding boxes in the frame.
+        width: RGB width in pixels.
+        height: RGB height in pixels.
+
+    Returns:
+        Writer input data with a single render product.
+    """
+    bboxes = np.zeros(num_objects, dtype=BBOX_3D_DTYPE)
+    bboxes["semanticId"] = rng.integers(0, 4, num_objects)
+    half_extents = rng.uniform(0.05, 0.3, (num_objects, 3)).astype(np.float32)
+    bboxes["x_min"], bboxes["y_min"], bboxes["z_min"] = -half_extents.T
+    bboxes["x_max"], bboxes["y_max"], bboxes["z_max"] = half_extents.T
+    transforms = np.tile(np.eye(4, dtype=np.float32), (num_objects, 1, 1))
+    # Row-vector convention: translation in the last row, objects spread in front of the camera
+    transforms[:, 3, :3] = rng.uniform([-2.0, -1.0, -8.0], [2.0, 1.0, -3.0], (num_objects, 3))
+    bboxes["transform"] = transforms
+    bboxes["occlusionRatio"] = rng.uniform(0.0, 0.5, num_objects)
+
+    focal_length = 18.15
+    aperture = np.array([20.955, 11.787], dtype=np.float32)
+    projection = np.zeros((4, 4))
+    projection[0, 0] = 2.0 * focal_length / aperture[0]
+    projection[1, 1] = 2.0 * focal_length / aperture[1]
+    projection[2, 3] = -1.0
+    projection[3, 2] = 0.01
+    camera_params = {
+        "cameraViewTransform": np.eye(4).flatten(),
+        "cameraProjection": projection.flatten(),
+        "cameraAperture": aperture,
+        "cameraApertureOffset": np.zeros(2, dtype=np.float32),
+        "cameraFocalLength": focal_length,
+        "cameraModel": "pinhole",
+        "renderProductResolution": np.array([width, height]),
+        "metersPerSceneUnit": 1.0,
+    }
+    rgb = rng.integers(0, 255, (height, width, 4), dtype=np.uint8)
+    annotators = {
+        PoseWriter.RGB_ANNOT_NAME: {"data": rgb},
+        PoseWriter.BB3D_ANNOT_NAME: {
+            "data": bboxes,
+            "idToLabels": {i: {"class": f"object_{i}"} for i in range(4)},
+            "primPaths": [f"/World/object_{i}" for i in range(num_objects)],
+        },
+        PoseWriter.CAM_PARAMS_ANNOT_NAME: camera_params,
+    }
+    return {"renderProducts": {"rp_0": annotators}}
+
+
+def run_writer(output_dir: str, frames: list[dict], num_write_workers: int) -> tuple[float, float]:
+    """Write all frames with a new PoseWriter and time it.
+
+    Args:
+        output_dir: Output directory of the writer.
+        frames: Synthetic frames to write.
+        num_write_workers: Encoding threads, 0 to write inline.
+
+    Returns:
+        Time spent inside ``write()`` and total time until all files are written, in seconds.
+    """
+    writer = PoseWriter(
+        output_dir=output_dir, write_debug_images=args.debug_images, num_write_workers=num_write_workers
+    )
+    start = time.perf_counter()
+    for frame in frames:
+        writer.write(frame)
+    write_time = time.perf_counter() - start
+    writer.detach()
+    return write_time, time.perf_counter() - start
+
+
+output_root = args.output_dir or tempfile.mkdtemp(prefix="writer_pipeline_bench_")
+width, height = args.resolution
+rng = np.random.default_rng(0)
+# A small pool of distinct frames keeps generation cost out of the measurement
+frame_pool = [make_synthetic_frame(rng, args.num_objects, width, height) for _ in range(8)]
+frames = [frame_pool[i % len(frame_pool)] for i in range(args.num_frames)]
+
+benchmark = BaseIsaacBenchmark(
+    benchmark_name="benchmark_replicator_writers_pipeline",
+    workflow_metadata={
+        "metadata": [
+            {"name": "num_frames", "data": args.num_frames},
+            {"name": "num_objects", "data": args.num_objects},
+            {"name": "width", "data": width},
+            {"name": "height", "data": height},
+            {"name": "num_write_workers", "data": args.num_write_workers},
+        ]
+    },
+    backend_type=args.backend_type,
+)
+
+for phase, num_workers in (("inline", 0), ("pipelined", args.num_write_workers)):
+    benchmark.set_phase(phase, start_recording_frametime=False, start_recording_runtime=True)
+    write_time, total_time = run_writer(os.path.join(output_root, phase), frames, num_workers)
+    benchmark.store_measurements()
+    benchmark.store_custom_measurement(
+        phase, SingleMeasurement(name="Frames Per Second", value=round(args.num_frames / total_time, 2), unit="fps")
+    )
+    benchmark.store_custom_measurement(
+        phase,
+        SingleMeasurement(
+            name="Mean write() Time", value=round(write_time * 1000 / args.num_frames, 3), unit="ms"
+        ),
+    )
+    print(
+        f"{phase}: {args.num_frames / total_time:.1f} frames/s, "
+        f"{write_time * 1000 / args.num_frames:.2f} ms blocking in write() per frame"
+    )
+
+benchmark.stop()
+simulation_app.close()
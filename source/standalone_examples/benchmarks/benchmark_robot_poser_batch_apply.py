@@ -0,0 +1,179 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark posing many robots: one ``apply_joint_state`` call per robot versus one ``RobotPoseBatch.apply`` call.
+
+N cloned serial arms (alternating revolute axes and a prismatic joint) are built on the stage of the USD context,
+with the simulation stopped. For every frame a random pose is applied to every robot, once by calling
+``apply_joint_state`` per robot and once with a ``RobotPoseBatch`` created before the first frame. Both paths are
+checked to author the same joint states and link transforms before they are timed.
+"""
+
+import argparse
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--num-robots", type=int, default=64, help="Number of cloned robots")
+parser.add_argument("--num-dof", type=int, default=7, help="Number of joints of each robot")
+parser.add_argument("--num-frames", type=int, default=20, help="Number of poses applied to every robot per mode")
+parser.add_argument(
+    "--backend-type",
+    default="OmniPerfKPIFile",
+    choices=["LocalLogMetrics", "JSONFileMetrics", "OsmoKPIFile", "OmniPerfKPIFile"],
+    help="Benchmarking backend, defaults",
+)
+
+args, unknown = parser.parse_known_args()
+
+from isaacsim import SimulationApp
+
+simulation_app = SimulationApp({"headless": True})
+
+import time
+
+import numpy as np
+from isaacsim.core.utils.extensions import enable_extension
+
+enable_extension("isaacsim.benchmark.services")
+enable_extension("isaacsim.robot.poser")
+simulation_app.update()
+
+import omni.usd
+from isaacsim.benchmark.services import BaseIsaacBenchmark
+from isaacsim.benchmark.services.metrics.measurements import SingleMeasurement
+from isaacsim.robot.poser import RobotPoseBatch, apply_joint_state
+from pxr import Gf, Usd, UsdGeom, UsdPhysics
+from usd.schema.isaac.robot_schema import ApplyRobotAPI
+
+
+def build_robot(stage: Usd.Stage, robot_path: str, offset: float) -> tuple[Usd.Prim, list[str]]:
+    """Build a serial arm at *robot_path* and return its root prim and joint paths."""
+    robot_xform = UsdGeom.Xform.Define(stage, robot_path)
+    robot_xform.AddTranslateOp().Set(Gf.Vec3d(offset, 0.0, 0.0))
+    robot_prim = robot_xform.GetPrim()
+    UsdPhysics.RigidBodyAPI.Apply(robot_prim)
+    UsdPhysics.ArticulationRootAPI.Apply(robot_prim)
+    parent = robot_prim
+    joint_paths = []
+    for i in range(args.num_dof):
+        link = UsdGeom.Xform.Define(stage, f"{robot_path}/link_{i}").GetPrim()
+        UsdPhysics.RigidBodyAPI.Apply(link)
+        joint_type = UsdPhysics.PrismaticJoint if i % 3 == 2 else UsdPhysics.RevoluteJoint
+        joint = joint_type.Define(stage, f"{robot_path}/joint_{i}")
+        joint.CreateBody0Rel().SetTargets([parent.GetPath()])
+        joint.CreateBody1Rel().SetTargets([link.GetPath()])
+        joint.CreateAxisAttr("ZYX"[i % 3])
+        joint.CreateLocalPos0Attr().Set(Gf.Vec3f(0.1, 0.0, 0.3))
+        joint.CreateLocalRot0Attr().Set(Gf.Quatf(0.9238795, 0.3826834, 0.0, 0.0))
+        joint.CreateLocalPos1Attr().Set(Gf.Vec3f(0.0, 0.0, 0.0))
+        joint.CreateLocalRot1Attr().Set(Gf.Quatf(1.0, 0.0, 0.0, 0.0))
+        joint_paths.append(str(joint.GetPath()))
+        parent = link
+    ApplyRobotAPI(robot_prim)
+    return robot_prim, joint_paths
+
+
+def build_scene() -> tuple[Usd.Stage, list[Usd.Prim], list[list[str]]]:
+    """Create a new stage in the USD context with the cloned robots."""
+    omni.usd.get_context().new_stage()
+    stage = omni.usd.get_context().get_stage()
+    robots = [build_robot(stage, f"/World/env_{i}/Robot", 2.0 * i) for i in range(args.num_robots)]
+    simulation_app.update()
+    return stage, [robot_prim for robot_prim, _ in robots], [joint_paths for _, joint_paths in robots]
+
+
+rng = np.random.default_rng(0)
+frames = rng.uniform(-1.0, 1.0, (args.num_frames, args.num_robots, args.num_dof))
+
+
+def frame_poses(joint_paths: list[list[str]], frame: np.ndarray) -> list[dict[str, float]]:
+    """Return the joint dict of every robot for one frame."""
+    return [dict(zip(paths, values.tolist())) for paths, values in zip(joint_paths, frame)]
+
+
+def run_per_robot(stage: Usd.Stage, robot_prims: list[Usd.Prim], joint_paths: list[list[str]]) -> float:
+    """Apply every frame with one ``apply_joint_state`` call per robot and return the elapsed time."""
+    start_time = time.perf_counter()
+    for frame in frames:
+        for robot_prim, joint_dict in zip(robot_prims, frame_poses(joint_paths, frame)):
+            apply_joint_state(stage, robot_prim, joint_dict)
+    return time.perf_counter() - start_time
+
+
+def run_batched(stage: Usd.Stage, robot_prims: list[Usd.Prim], joint_paths: list[list[str]]) -> float:
+    """Apply every frame with one ``RobotPoseBatch.apply`` call and return the elapsed time."""
+    start_time = time.perf_counter()
+    batch = RobotPoseBatch(stage, robot_prims)
+    for frame in frames:
+        batch.apply(frame_poses(joint_paths, frame))
+    return time.perf_counter() - start_time
+
+
+def snapshot(stage: Usd.Stage, robot_prims: list[Usd.Prim], joint_paths: list[list[str]]) -> np.ndarray:
+    """Return the joint positions and link world transforms of every robot."""
+    values = []
+    for robot_prim, paths in zip(robot_prims, joint_paths):
+        for path in paths:
+            joint = stage.GetPrimAtPath(path)
+            instance = "linear" if joint.IsA(UsdPhysics.PrismaticJoint) else "angular"
+            values.append(joint.GetAttribute(f"state:{instance}:physics:position").Get())
+        for link in robot_prim.GetChildren():
+            if link.IsA(UsdGeom.Xform):
+                matrix = UsdGeom.Xformable(link).ComputeLocalToWorldTransform(Usd.TimeCode.Default())
+                values.extend(v for row in matrix for v in row)
+    return np.array(values, dtype=float)
+
+
+# Check that both paths agree before timing them
+snapshots = []
+for run in (run_per_robot, run_batched):
+    scene = build_scene()
+    run(*scene)
+    snapshots.append(snapshot(*scene))
+if not np.allclose(snapshots[0], snapshots[1], atol=1e-5):
+    raise RuntimeError("RobotPoseBatch does not match apply_joint_state")
+
+benchmark = BaseIsaacBenchmark(
+    benchmark_name="benchmark_robot_poser_batch_apply",
+    workflow_metadata={
+        "metadata": [
+            {"name": "num_robots", "data": args.num_robots},
+            {"name": "num_dof", "data": args.num_dof},
+            {"name": "num_frames", "data": args.num_frames},
+        ]
+    },
+    backend_type=args.backend_type,
+)
+
+frame_times = {}
+for mode, run in (("per_robot", run_per_robot), ("batched", run_batched)):
+    scene = build_scene()
+    benchmark.set_phase(mode, start_recording_frametime=False, start_recording_runtime=True)
+    frame_times[mode] = run(*scene) / args.num_frames
+    benchmark.store_measurements()
+    benchmark.store_custom_measurement(
+        mode, SingleMeasurement(name="Mean Time Per Frame", value=round(frame_times[mode] * 1000, 3), unit="ms")
+    )
+speedup = frame_times["per_robot"] / frame_times["batched"]
+benchmark.store_custom_measurement(
+    "batched", SingleMeasurement(name="Speedup vs Per Robot", value=round(speedup, 2), unit="x")
+)
+print(
+    f"posing {args.num_robots} robots with {args.num_dof} joints per frame: "
+    f"per robot {frame_times['per_robot'] * 1000:.1f} ms, "
+    f"batched {frame_times['batched'] * 1000:.1f} ms ({speedup:.1f}x)"
+)
+
+benchmark.stop()
+simulation_app.close()
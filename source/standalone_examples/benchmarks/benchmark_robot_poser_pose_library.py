@@ -0,0 +1,212 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark a large pose library stored as named-pose prims versus a columnar ``PoseLibrary``.
+
+A library of N random poses for a serial arm is imported into a USD file twice. The first copy uses
+``import_poses`` from JSON, which stores one IsaacNamedPose prim per pose. The second copy uses
+``import_pose_library`` from ``.npz``, which stores the columnar ``PoseLibrary``. Each file is saved and then
+reopened to time two reads: looking up a single pose, and loading every pose. Both libraries are checked to
+return the same poses, and each is finally exported. The per-prim import dominates the run time at 10k poses.
+"""
+
+import argparse
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--num-poses", type=int, default=10000, help="Number of poses in the library")
+parser.add_argument("--num-dof", type=int, default=7, help="Number of joints of the robot")
+parser.add_argument(
+    "--backend-type",
+    default="OmniPerfKPIFile",
+    choices=["LocalLogMetrics", "JSONFileMetrics", "OsmoKPIFile", "OmniPerfKPIFile"],
+    help="Benchmarking backend, defaults",
+)
+
+args, unknown = parser.parse_known_args()
+
+from isaacsim import SimulationApp
+
+simulation_app = SimulationApp({"headless": True})
+
+import json
+import os
+import tempfile
+import time
+
+import numpy as np
+from isaacsim.core.utils.extensions import enable_extension
+
+enable_extension("isaacsim.benchmark.services")
+enable_extension("isaacsim.robot.poser")
+simulation_app.update()
+
+from isaacsim.benchmark.services import BaseIsaacBenchmark
+from isaacsim.benchmark.services.metrics.measurements import SingleMeasurement
+from isaacsim.robot.poser import (
+    PoseLibrary,
+    PoseResult,
+    export_pose_library,
+    export_poses,
+    get_named_pose,
+    import_pose_library,
+    import_poses,
+    list_named_poses,
+)
+from pxr import Usd, UsdGeom, UsdPhysics
+from usd.schema.isaac.robot_schema import ApplyRobotAPI
+
+ROBOT_PATH = "/World/Robot"
+
+
+def build_robot(stage: Usd.Stage) -> Usd.Prim:
+    """Build a serial arm at ``ROBOT_PATH`` and return its root prim."""
+    robot_prim = UsdGeom.Xform.Define(stage, ROBOT_PATH).GetPrim()
+    UsdPhysics.RigidBodyAPI.Apply(robot_prim)
+    UsdPhysics.ArticulationRootAPI.Apply(robot_prim)
+    parent = robot_prim
+    for i in range(args.num_dof):
+        link = UsdGeom.Xform.Define(stage, f"{ROBOT_PATH}/link_{i}").GetPrim()
+        UsdPhysics.RigidBodyAPI.Apply(link)
+        joint_type = UsdPhysics.PrismaticJoint if i % 3 == 2 else UsdPhysics.RevoluteJoint
+        joint = joint_type.Define(stage, f"{ROBOT_PATH}/joint_{i}")
+        joint.CreateBody0Rel().SetTargets([parent.GetPath()])
+        joint.CreateBody1Rel().SetTargets([link.GetPath()])
+        parent = link
+    ApplyRobotAPI(robot_prim)
+    return robot_prim
+
+
+def read_one(stage: Usd.Stage, robot_prim: Usd.Prim, mode: str, name: str) -> PoseResult | None:
+    """Look up a single pose."""
+    if mode == "named_poses":
+        return get_named_pose(stage, robot_prim, name)
+    return PoseLibrary(stage, robot_prim).get(name)
+
+
+def read_all(stage: Usd.Stage, robot_prim: Usd.Prim, mode: str) -> dict[str, PoseResult]:
+    """Load every pose of the library."""
+    if mode == "named_poses":
+        return {name: get_named_pose(stage, robot_prim, name) for name in list_named_poses(stage, robot_prim)}
+    library = PoseLibrary(stage, robot_prim)
+    return {name: library.get(name) for name in library.names}
+
+
+tmp_dir = tempfile.mkdtemp()
+rng = np.random.default_rng(0)
+joint_paths = [f"{ROBOT_PATH}/joint_{i}" for i in range(args.num_dof)]
+joint_values = rng.uniform(-1.0, 1.0, (args.num_poses, args.num_dof))
+target_positions = rng.uniform(-1.0, 1.0, (args.num_poses, 3))
+poses = {
+    f"grasp_{i}": {
+        "joints": dict(zip(joint_paths, joint_values[i].tolist())),
+        "joint_fixed": {path: False for path in joint_paths},
+        "start_link": ROBOT_PATH,
+        "end_link": f"{ROBOT_PATH}/link_{args.num_dof - 1}",
+        "target_position": target_positions[i].tolist(),
+        "target_orientation": [1.0, 0.0, 0.0, 0.0],
+        "valid": True,
+    }
+    for i in range(args.num_poses)
+}
+source_files = {"named_poses": os.path.join(tmp_dir, "poses.json"), "pose_library": os.path.join(tmp_dir, "poses.npz")}
+with open(source_files["named_poses"], "w") as fh:
+    json.dump({"_meta": {"units": "radians"}, "poses": poses}, fh)
+scratch_stage = Usd.Stage.CreateInMemory()
+scratch_library = PoseLibrary(scratch_stage, build_robot(scratch_stage))
+scratch_library.import_file(source_files["named_poses"])
+scratch_library.export_file(source_files["pose_library"])
+
+benchmark = BaseIsaacBenchmark(
+    benchmark_name="benchmark_robot_poser_pose_library",
+    workflow_metadata={
+        "metadata": [
+            {"name": "num_poses", "data": args.num_poses},
+            {"name": "num_dof", "data": args.num_dof},
+        ]
+    },
+    backend_type=args.backend_type,
+)
+
+lookup_name = f"grasp_{args.num_poses // 2}"
+load_times = {}
+loaded_poses = {}
+summaries = []
+for mode, import_file, export_file, export_suffix in (
+    ("named_poses", import_poses, export_poses, ".json"),
+    ("pose_library", import_pose_library, export_pose_library, ".npz"),
+):
+    usd_path = os.path.join(tmp_dir, f"{mode}.usd")
+    stage = Usd.Stage.CreateNew(usd_path)
+    robot_prim = build_robot(stage)
+    benchmark.set_phase(mode, start_recording_frametime=False, start_recording_runtime=True)
+
+    start_time = time.perf_counter()
+    import_file(stage, robot_prim, source_files[mode])
+    import_time = time.perf_counter() - start_time
+    stage.Save()
+    del stage
+
+    start_time = time.perf_counter()
+    stage = Usd.Stage.Open(usd_path)
+    if read_one(stage, stage.GetPrimAtPath(ROBOT_PATH), mode, lookup_name) is None:
+        raise RuntimeError(f"{mode}: pose {lookup_name} not found")
+    lookup_time = time.perf_counter() - start_time
+    del stage
+
+    start_time = time.perf_counter()
+    stage = Usd.Stage.Open(usd_path)
+    loaded_poses[mode] = read_all(stage, stage.GetPrimAtPath(ROBOT_PATH), mode)
+    load_times[mode] = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    export_file(stage, stage.GetPrimAtPath(ROBOT_PATH), os.path.join(tmp_dir, f"{mode}_export{export_suffix}"))
+    export_time = time.perf_counter() - start_time
+    file_size = os.path.getsize(usd_path) / 1e6
+
+    benchmark.store_measurements()
+    for name, value, unit in (
+        ("Import Time", round(import_time * 1000, 3), "ms"),
+        ("Open And Lookup One Time", round(lookup_time * 1000, 3), "ms"),
+        ("Open And Load All Time", round(load_times[mode] * 1000, 3), "ms"),
+        ("Export Time", round(export_time * 1000, 3), "ms"),
+        ("Layer Size", round(file_size, 3), "MB"),
+    ):
+        benchmark.store_custom_measurement(mode, SingleMeasurement(name=name, value=value, unit=unit))
+    summaries.append(
+        f"{mode}: import {import_time * 1000:.1f} ms, open and lookup one {lookup_time * 1000:.1f} ms, "
+        f"open and load all {load_times[mode] * 1000:.1f} ms, export {export_time * 1000:.1f} ms, {file_size:.2f} MB"
+    )
+
+# Check that both libraries hold the same poses
+for name, pose in loaded_poses["named_poses"].items():
+    library_pose = loaded_poses["pose_library"].get(name)
+    if library_pose is None or library_pose.target_position != pose.target_position:
+        raise RuntimeError(f"PoseLibrary does not match the named poses for {name}")
+    if not np.allclose([library_pose.joints[p] for p in pose.joints], list(pose.joints.values()), atol=1e-5):
+        raise RuntimeError(f"PoseLibrary does not match the named poses for {name}")
+if len(loaded_poses["named_poses"]) != len(loaded_poses["pose_library"]):
+    raise RuntimeError("PoseLibrary and the named poses hold a different number of poses")
+
+speedup = load_times["named_poses"] / load_times["pose_library"]
+benchmark.store_custom_measurement(
+    "pose_library", SingleMeasurement(name="Load Speedup vs Named Poses", value=round(speedup, 2), unit="x")
+)
+print(f"pose library of {args.num_poses} poses with {args.num_dof} joints:")
+for summary in summaries:
+    print(f"  {summary}")
+print(f"  load speedup {speedup:.1f}x")
+
+benchmark.stop()
+simulation_app.close()
@@ -0,0 +1,161 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark wheeled-robot controller throughput: per-robot ``forward`` loop versus ``forward_batch``.
+
+Commands for a fleet of N robots are converted to wheel velocities for a number of control steps,
+once by calling the single-robot API for every robot and once with the batched API.
+"""
+
+import argparse
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--num-robots", type=int, default=512, help="Number of robots in the fleet")
+parser.add_argument("--num-steps", type=int, default=50, help="Number of control steps per mode")
+parser.add_argument(
+    "--backend-type",
+    default="OmniPerfKPIFile",
+    choices=["LocalLogMetrics", "JSONFileMetrics", "OsmoKPIFile", "OmniPerfKPIFile"],
+    help="Benchmarking backend, defaults",
+)
+
+args, unknown = parser.parse_known_args()
+
+from isaacsim import SimulationApp
+
+simulation_app = SimulationApp({"headless": True})
+
+import time
+
+import numpy as np
+from isaacsim.core.utils.extensions import enable_extension
+
+enable_extension("isaacsim.benchmark.services")
+enable_extension("isaacsim.robot.experimental.wheeled_robots")
+simulation_app.update()
+
+from isaacsim.benchmark.services import BaseIsaacBenchmark
+from isaacsim.benchmark.services.metrics.measurements import SingleMeasurement
+from isaacsim.robot.experimental.wheeled_robots.controllers import (
+    DifferentialController,
+    HolonomicController,
+    State,
+    stanley_control,
+    stanley_control_batch,
+)
+
+rng = np.random.default_rng(0)
+num_robots = args.num_robots
+
+differential = DifferentialController(wheel_radius=0.03, wheel_base=0.1125, max_wheel_speed=20.0)
+holonomic = HolonomicController(
+    wheel_radius=[0.04, 0.04, 0.04],
+    wheel_positions=[
+        [-0.0980432, 0.000636773, -0.050501],
+        [0.0493475, -0.084525, -0.050501],
+        [0.0495291, 0.0856937, -0.050501],
+    ],
+    wheel_orientations=[[0, 0, 0, 1], [0.866, 0, 0, -0.5], [0.866, 0, 0, 0.5]],
+    mecanum_angles=[90, 90, 90],
+    max_linear_speed=2.0,
+    max_angular_speed=2.0,
+)
+differential_commands = rng.uniform(-1.0, 1.0, (num_robots, 2))
+holonomic_commands = rng.uniform(-1.0, 1.0, (num_robots, 3))
+
+# Stanley path tracking along a shared sine path
+path_x = np.linspace(0.0, 50.0, 500)
+path_y = np.sin(path_x * 0.2)
+path_yaw = np.arctan2(np.gradient(path_y), np.gradient(path_x))
+wheel_base = 0.5
+states = rng.uniform([0.0, -1.0, -0.5, 0.5], [40.0, 1.0, 0.5, 2.0], (num_robots, 4))
+last_target_idx = np.zeros(num_robots, dtype=np.int64)
+vehicles = [State(wheel_base, x=float(s[0]), y=float(s[1]), yaw=float(s[2]), v=float(s[3])) for s in states]
+
+
+def run_differential_loop() -> None:
+    for command in differential_commands:
+        differential.forward(command)
+
+
+def run_differential_batch() -> None:
+    differential.forward_batch(differential_commands)
+
+
+def run_holonomic_loop() -> None:
+    for command in holonomic_commands:
+        holonomic.forward(command)
+
+
+def run_holonomic_batch() -> None:
+    holonomic.forward_batch(holonomic_commands)
+
+
+def run_stanley_loop() -> None:
+    for vehicle, target_idx in zip(vehicles, last_target_idx):
+        stanley_control(vehicle, path_x, path_y, path_yaw, int(target_idx))
+
+
+def run_stanley_batch() -> None:
+    stanley_control_batch(
+        states[:, 0], states[:, 1], states[:, 2], states[:, 3], wheel_base, path_x, path_y, path_yaw, last_target_idx
+    )
+
+
+benchmark = BaseIsaacBenchmark(
+    benchmark_name="benchmark_wheeled_robot_controllers_batch",
+    workflow_metadata={
+        "metadata": [
+            {"name": "num_robots", "data": num_robots},
+            {"name": "num_steps", "data": args.num_steps},
+        ]
+    },
+    backend_type=args.backend_type,
+)
+
+for controller_name, loop_fn, batch_fn in (
+    ("differential", run_differential_loop, run_differential_batch),
+    ("holonomic", run_holonomic_loop, run_holonomic_batch),
+    ("stanley", run_stanley_loop, run_stanley_batch),
+):
+    step_times = {}
+    for mode, fn in (("loop", loop_fn), ("batch", batch_fn)):
+        phase = f"{controller_name}_{mode}"
+        benchmark.set_phase(phase, start_recording_frametime=False, start_recording_runtime=True)
+        start = time.perf_counter()
+        for _ in range(args.num_steps):
+            fn()
+        step_times[mode] = (time.perf_counter() - start) / args.num_steps
+        benchmark.store_measurements()
+        benchmark.store_custom_measurement(
+            phase, SingleMeasurement(name="Mean Step Time", value=round(step_times[mode] * 1000, 4), unit="ms")
+        )
+        benchmark.store_custom_measurement(
+            phase,
+            SingleMeasurement(
+                name="Robot Commands Per Second", value=round(num_robots / step_times[mode], 1), unit="commands/s"
+            ),
+        )
+    speedup = step_times["loop"] / step_times["batch"]
+    benchmark.store_custom_measurement(
+        f"{controller_name}_batch", SingleMeasurement(name="Speedup vs Loop", value=round(speedup, 2), unit="x")
+    )
+    print(
+        f"{controller_name}: loop {step_times['loop'] * 1000:.3f} ms, batch {step_times['batch'] * 1000:.3f} ms "
+        f"per step for {num_robots} robots ({speedup:.1f}x)"
+    )
+
+benchmark.stop()
+simulation_app.close()
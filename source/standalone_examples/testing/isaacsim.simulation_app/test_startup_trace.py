@@ -0,0 +1,96 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Verifies that the startup_trace launch option writes a report of launch phases, extension startups and Python imports, and that a slow import is timed."""
+
+import json
+import os
+import sys
+import tempfile
+
+from isaacsim import SimulationApp
+
+_TMP_DIR = tempfile.TemporaryDirectory()
+_REPORT_PATH = os.path.join(_TMP_DIR.name, "startup_trace.json")
+
+kit = SimulationApp({"headless": True, "startup_trace": _REPORT_PATH})
+
+from isaacsim.simulation_app.startup_trace import StartupTrace
+
+_SLOW_MODULE_SECONDS = 0.2
+
+
+def fail(message: str) -> None:
+    """Print a fatal message, close the app and exit with an error.
+
+    Args:
+        message: Reason of the failure.
+    """
+    print(f"[fatal] {message}", flush=True)
+    kit.close()
+    sys.exit(1)
+
+
+def test_launch_report() -> None:
+    """Check the report written while SimulationApp launched."""
+    print("\n[TEST 1] Testing startup_trace launch report...")
+    if not os.path.isfile(_REPORT_PATH):
+        fail(f"Startup trace report was not written to {_REPORT_PATH}")
+    with open(_REPORT_PATH) as f:
+        report = json.load(f)
+
+    for phase in ("load_plugins", "kit_startup", "app_ready"):
+        if phase not in report["phases"]:
+            fail(f"Launch phase '{phase}' missing from {sorted(report['phases'])}")
+    if not report["extensions"]:
+        fail("No extension startups recorded")
+    if not report["imports"]:
+        fail("No Python imports recorded")
+    if report["total_seconds"] < sum(report["phases"].values()) - 1e-3:
+        fail(f"Total {report['total_seconds']}s is shorter than the sum of the phases")
+    print(f"Launch report: {len(report['extensions'])} extensions, {len(report['imports'])} imports")
+
+
+def test_slow_import_is_timed() -> None:
+    """Check that a module that is slow to execute is recorded with its import time."""
+    print("\n[TEST 2] Testing that a slow import is timed...")
+    module_dir = os.path.join(_TMP_DIR.name, "modules")
+    os.makedirs(module_dir)
+    with open(os.path.join(module_dir, "startup_trace_slow_module.py"), "w") as f:
+        f.write(f"import time\n\ntime.sleep({_SLOW_MODULE_SECONDS})\n")
+    sys.path.insert(0, module_dir)
+
+    trace = StartupTrace(os.path.join(_TMP_DIR.name, "slow_import.json"))
+    trace.start()
+    import startup_trace_slow_module  # noqa: F401
+
+    trace.stop()
+    report = trace.write_report()
+
+    timed = [item for item in report["imports"] if item["module"] == "startup_trace_slow_module"]
+    if not timed:
+        fail("Slow module missing from the trace imports")
+    if timed[0]["cumulative_seconds"] < _SLOW_MODULE_SECONDS:
+        fail(f"Slow module timed at {timed[0]['cumulative_seconds']}s, expected at least {_SLOW_MODULE_SECONDS}s")
+    if report["imports"][0]["module"] != "startup_trace_slow_module":
+        fail(f"Slow module is not the slowest import: {report['imports'][0]}")
+    print(f"Slow module timed at {timed[0]['cumulative_seconds']:.3f}s")
+
+
+test_launch_report()
+test_slow_import_is_timed()
+
+kit.close()
+_TMP_DIR.cleanup()
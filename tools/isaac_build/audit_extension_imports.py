@@ -0,0 +1,431 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Static audit of heavy eager imports executed when extension Python modules are loaded.
+
+For every extension the ``[[python.module]]`` packages from ``config/extension.toml``
+are parsed with ``ast``. Packages are looked up at the extension root (flat layout)
+and below the extension's ``python`` folder, which the build links to the package of
+the extension's root module. Modules whose source cannot be found are reported as
+unaudited instead of being skipped. Module-level imports of the package ``__init__`` are
+collected, following relative imports into the package's own submodules (they
+run eagerly as well). Imports of known heavy modules, or of modules measured as
+slow in a ``SimulationApp`` startup trace (``startup_trace`` launch option), are
+reported together with the import chain that pulls them in.
+
+Usage::
+
+    ./python.sh tools/isaac_build/audit_extension_imports.py source/extensions \\
+        --trace /tmp/startup_trace.json --json /tmp/import_audit.json
+"""
+
+import argparse
+import ast
+import json
+import os
+import sys
+import tomllib
+from dataclasses import asdict, dataclass, field
+
+#: Third-party and Kit modules that are known to take long to import.
+DEFAULT_HEAVY_MODULES = [
+    "cv2",
+    "jax",
+    "matplotlib",
+    "omni.replicator.core",
+    "open3d",
+    "pandas",
+    "scipy",
+    "sklearn",
+    "tensorflow",
+    "torch",
+    "trimesh",
+    "warp",
+]
+
+
+@dataclass
+class ImportFinding:
+    """A heavy import executed when an extension module is loaded.
+
+    Args:
+        extension: Extension folder name.
+        python_module: The ``[[python.module]]`` package being loaded.
+        imported: The heavy module that is imported.
+        file: File containing the import statement.
+        line: Line of the import statement.
+        chain: Modules of the extension executed from the package ``__init__`` down to *file*.
+        reason: Why the import is considered heavy.
+        import_seconds: Measured cumulative import time from a startup trace, if available.
+    """
+
+    extension: str
+    python_module: str
+    imported: str
+    file: str
+    line: int
+    chain: list[str] = field(default_factory=list)
+    reason: str = ""
+    import_seconds: float | None = None
+
+
+@dataclass
+class UnauditedModule:
+    """A ``[[python.module]]`` whose source could not be found, so it was not audited.
+
+    Args:
+        extension: Extension folder name.
+        python_module: The ``[[python.module]]`` name.
+        reason: Why the module could not be audited.
+    """
+
+    extension: str
+    python_module: str
+    reason: str
+
+
+def _module_file(package_root: str, module: str, package_prefix: str = "") -> str | None:
+    """Return the source file of *module* below *package_root*.
+
+    Args:
+        package_root: Directory corresponding to *package_prefix*.
+        module: Dotted module name.
+        package_prefix: Dotted name of the package whose folder is *package_root*, or an
+            empty string when *package_root* contains the top-level package.
+
+    Returns:
+        The ``.py`` file or package ``__init__.py``, or None if it does not exist in the source tree.
+    """
+    if package_prefix:
+        if module != package_prefix and not module.startswith(package_prefix + "."):
+            return None
+        module = module[len(package_prefix) + 1 :]
+    base = os.path.join(package_root, *module.split(".")) if module else package_root
+    for candidate in (os.path.join(base, "__init__.py"), base + ".py"):
+        if os.path.isfile(candidate):
+            return candidate
+    return None
+
+
+def _resolve_relative(module: str, is_package: bool, level: int, name: str | None) -> str:
+    """Resolve a relative ``from`` import to an absolute module name.
+
+    Args:
+        module: Name of the module containing the import.
+        is_package: Whether *module* is a package ``__init__``.
+        level: Number of leading dots.
+        name: Module name after the dots (may be None for ``from . import x``).
+
+    Returns:
+        The absolute module name.
+    """
+    parts = module.split(".")
+    if not is_package:
+        parts = parts[:-1]
+    if level > 1:
+        parts = parts[: len(parts) - (level - 1)]
+    if name:
+        parts.append(name)
+    return ".".join(parts)
+
+
+def _eager_imports(tree: ast.Module) -> list[ast.Import | ast.ImportFrom]:
+    """Collect import statements executed at module import time.
+
+    Descends into module-level ``if``/``try``/``with`` blocks but not into
+    functions or classes, and skips ``if TYPE_CHECKING:`` blocks.
+
+    Args:
+        tree: Parsed module.
+
+    Returns:
+        The eagerly executed import statements.
+    """
+    imports = []
+    pending = list(tree.body)
+    while pending:
+        node = pending.pop(0)
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            imports.append(node)
+        elif isinstance(node, ast.If):
+            test = ast.unparse(node.test)
+            if test.endswith("TYPE_CHECKING"):
+                pending.extend(node.orelse)
+                continue
+            pending.extend(node.body + node.orelse)
+        elif isinstance(node, ast.Try):
+            pending.extend(node.body + node.orelse + node.finalbody)
+            for handler in node.handlers:
+                pending.extend(handler.body)
+        elif isinstance(node, ast.With):
+            pending.extend(node.body)
+    return imports
+
+
+def _heavy_reason(module: str, heavy_modules: list[str], measured: dict[str, float], threshold: float) -> str | None:
+    """Return why *module* counts as heavy, or None.
+
+    Args:
+        module: Imported module name.
+        heavy_modules: Known heavy module prefixes.
+        measured: Cumulative import seconds per module from a startup trace.
+        threshold: Measured import time above which a module is heavy.
+
+    Returns:
+        The reason string, or None if the module is not heavy.
+    """
+    seconds = measured.get(module)
+    if seconds is not None and seconds >= threshold:
+        return f"measured {seconds:.3f}s"
+    for heavy in heavy_modules:
+        if module == heavy or module.startswith(heavy + "."):
+            return f"known heavy module '{heavy}'"
+    return None
+
+
+def audit_python_module(
+    extension: str,
+    package_root: str,
+    python_module: str,
+    heavy_modules: list[str],
+    measured: dict[str, float],
+    threshold: float,
+    package_prefix: str = "",
+) -> list[ImportFinding]:
+    """Audit the imports executed when an extension's Python module is loaded.
+
+    Args:
+        extension: Extension folder name.
+        package_root: Directory corresponding to *package_prefix*.
+        python_module: The ``[[python.module]]`` name.
+        heavy_modules: Known heavy module prefixes.
+        measured: Cumulative import seconds per module from a startup trace.
+        threshold: Measured import time above which a module is heavy.
+        package_prefix: Dotted name of the package whose folder is *package_root*, or an
+            empty string when *package_root* contains the top-level package.
+
+    Returns:
+        One finding per heavy import statement.
+    """
+    findings = []
+    visited = set()
+    # Breadth-first over the package's own modules, keeping the chain that executes them
+    pending = [(python_module, [python_module])]
+    while pending:
+        module, chain = pending.pop(0)
+        if module in visited:
+            continue
+        visited.add(module)
+        path = _module_file(package_root, module, package_prefix)
+        if path is None:
+            continue
+        try:
+            with open(path, encoding="utf-8") as f:
+                tree = ast.parse(f.read(), filename=path)
+        except (OSError, SyntaxError, UnicodeDecodeError) as e:
+            print(f"Skipping {path}: {e}", file=sys.stderr)
+            continue
+        is_package = os.path.basename(path) == "__init__.py"
+        for node in _eager_imports(tree):
+            if isinstance(node, ast.Import):
+                targets = [alias.name for alias in node.names]
+            elif node.level:
+                base = _resolve_relative(module, is_package, node.level, node.module)
+                targets = [base] + [f"{base}.{alias.name}" for alias in node.names if alias.name != "*"]
+            else:
+                targets = [node.module] + [f"{node.module}.{alias.name}" for alias in node.names if alias.name != "*"]
+            for target in targets:
+                if target == python_module or target.startswith(python_module + "."):
+                    # Own submodule: executed eagerly, so follow it
+                    if _module_file(package_root, target, package_prefix) is not None:
+                        pending.append((target, chain + [target] if target != chain[-1] else chain))
+            external = [
+                target
+                for target in targets
+                if target != python_module and not target.startswith(python_module + ".")
+            ]
+            if isinstance(node, ast.ImportFrom):
+                # One finding per statement: the imported names belong to the module, unless only a
+                # submodule named in the statement is heavy
+                external = next(
+                    ([target] for target in external if _heavy_reason(target, heavy_modules, measured, threshold)),
+                    [],
+                )
+            for target in external:
+                reason = _heavy_reason(target, heavy_modules, measured, threshold)
+                if reason is not None:
+                    findings.append(
+                        ImportFinding(
+                            extension=extension,
+                            python_module=python_module,
+                            imported=target,
+                            file=path,
+                            line=node.lineno,
+                            chain=chain,
+                            reason=reason,
+                            import_seconds=measured.get(target),
+                        )
+                    )
+    return findings
+
+
+def _locate_package(ext_dir: str, entry: dict, declared: list[str]) -> tuple[str, str] | None:
+    """Find the source folder of a ``[[python.module]]`` entry.
+
+    Extensions either keep the package at the extension root (optionally below the
+    entry's ``path``), or keep its contents in a ``python`` folder that the build links
+    to the package of the extension's root module: the module named like the
+    extension, or else the shortest declared module containing *entry*.
+
+    Args:
+        ext_dir: Extension folder.
+        entry: The ``[[python.module]]`` table.
+        declared: Names of all ``[[python.module]]`` entries of the extension.
+
+    Returns:
+        Tuple of (package root, package prefix) as taken by :func:`_module_file`, or None
+        if the module's source cannot be found.
+    """
+    python_module = entry["name"]
+    path = entry.get("path", "")
+    python_dir = os.path.join(ext_dir, "python")
+    for candidate in (ext_dir, os.path.join(ext_dir, path), os.path.join(python_dir, path)):
+        if _module_file(candidate, python_module) is not None:
+            return candidate, ""
+
+    # Extension folders may carry a suffix after "-", e.g. "omni.kit.loop-isaac"
+    prefixes = [os.path.basename(ext_dir).split("-")[0]] + sorted(declared, key=len)
+    for prefix in prefixes:
+        if python_module == prefix or python_module.startswith(prefix + "."):
+            if _module_file(python_dir, python_module, prefix) is not None:
+                return python_dir, prefix
+            break
+    return None
+
+
+def audit_extensions(
+    roots: list[str], heavy_modules: list[str], measured: dict[str, float], threshold: float
+) -> tuple[list[ImportFinding], list[UnauditedModule]]:
+    """Audit every extension found below *roots*.
+
+    Args:
+        roots: Directories containing extension folders.
+        heavy_modules: Known heavy module prefixes.
+        measured: Cumulative import seconds per module from a startup trace.
+        threshold: Measured import time above which a module is heavy.
+
+    Returns:
+        Tuple of (all findings, slowest measured imports first; modules that could not be audited).
+    """
+    findings = []
+    unaudited = []
+    for root in roots:
+        for extension in sorted(os.listdir(root)):
+            ext_dir = os.path.join(root, extension)
+            config_path = os.path.join(ext_dir, "config", "extension.toml")
+            if not os.path.isfile(config_path):
+                continue
+            try:
+                with open(config_path, "rb") as f:
+                    config = tomllib.load(f)
+            except (OSError, tomllib.TOMLDecodeError) as e:
+                print(f"Skipping {config_path}: {e}", file=sys.stderr)
+                continue
+            entries = [entry for entry in config.get("python", {}).get("module", []) if entry.get("name")]
+            declared = [entry["name"] for entry in entries]
+            for entry in entries:
+                python_module = entry["name"]
+                located = _locate_package(ext_dir, entry, declared)
+                if located is None:
+                    unaudited.append(UnauditedModule(extension, python_module, "no Python source found"))
+                    continue
+                package_root, package_prefix = located
+                findings.extend(
+                    audit_python_module(
+                        extension, package_root, python_module, heavy_modules, measured, threshold, package_prefix
+                    )
+                )
+    findings.sort(key=lambda finding: (-(finding.import_seconds or 0.0), finding.extension, finding.file, finding.line))
+    return findings, unaudited
+
+
+def load_measured_imports(trace_path: str) -> dict[str, float]:
+    """Read cumulative import times from a ``SimulationApp`` startup trace report.
+
+    Args:
+        trace_path: Path of the startup trace JSON report.
+
+    Returns:
+        Cumulative import seconds per module name.
+    """
+    with open(trace_path) as f:
+        report = json.load(f)
+    return {item["module"]: item["cumulative_seconds"] for item in report.get("imports", [])}
+
+
+def main() -> int:
+    """Run the audit from the command line.
+
+    Returns:
+        Process exit code.
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("roots", nargs="+", help="Directories containing extension folders")
+    parser.add_argument("--trace", default=None, help="Startup trace JSON report with measured import times")
+    parser.add_argument(
+        "--threshold", type=float, default=0.05, help="Measured import time (seconds) above which an import is heavy"
+    )
+    parser.add_argument(
+        "--heavy", nargs="*", default=DEFAULT_HEAVY_MODULES, help="Module prefixes that are always considered heavy"
+    )
+    parser.add_argument("--json", default=None, help="Write the findings to this JSON file")
+    parser.add_argument(
+        "--fail-on-findings",
+        action="store_true",
+        help="Exit with status 1 if anything is found or a module could not be audited",
+    )
+    args = parser.parse_args()
+
+    measured = load_measured_imports(args.trace) if args.trace else {}
+    findings, unaudited = audit_extensions(args.roots, args.heavy, measured, args.threshold)
+
+    for finding in findings:
+        chain = " -> ".join(finding.chain)
+        print(f"{finding.file}:{finding.line}: [{finding.extension}] imports {finding.imported} ({finding.reason})")
+        print(f"    via {chain}")
+    for module in unaudited:
+        print(
+            f"Warning: [{module.extension}] {module.python_module} was not audited ({module.reason})", file=sys.stderr
+        )
+    print(f"{len(findings)} heavy eager import(s) in {len({f.extension for f in findings})} extension(s)")
+    if unaudited:
+        print(f"{len(unaudited)} python module(s) not audited", file=sys.stderr)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(
+                {
+                    "findings": [asdict(finding) for finding in findings],
+                    "unaudited": [asdict(module) for module in unaudited],
+                },
+                f,
+                indent=2,
+            )
+
+    return 1 if args.fail_on_findings and (findings or unaudited) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the extension import audit.
+
+Run with ``./python.sh -m unittest discover -s tools/isaac_build -p "test_*.py"``.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import textwrap
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from audit_extension_imports import audit_extensions, load_measured_imports
+
+
+class TestAuditExtensionImports(unittest.TestCase):
+    """Audit of extensions laid out the way ``source/extensions`` is."""
+
+    def setUp(self) -> None:
+        """Create an empty extensions folder."""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = self._tmp.name
+
+    def tearDown(self) -> None:
+        """Remove the extensions folder."""
+        self._tmp.cleanup()
+
+    def _write(self, relative_path: str, content: str) -> None:
+        """Write a file below the extensions folder.
+
+        Args:
+            relative_path: Path relative to the extensions folder.
+            content: File content, dedented before writing.
+        """
+        path = os.path.join(self.root, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(textwrap.dedent(content))
+
+    def _write_extension(self, extension: str, modules: list[str]) -> None:
+        """Write the ``config/extension.toml`` of an extension.
+
+        Args:
+            extension: Extension folder name.
+            modules: Names of the ``[[python.module]]`` entries.
+        """
+        entries = "".join(f'[[python.module]]\nname = "{module}"\n\n' for module in modules)
+        self._write(f"{extension}/config/extension.toml", f'[package]\nversion = "1.0.0"\n\n{entries}')
+
+    def test_flat_layout_module(self) -> None:
+        """Packages at the extension root are followed through their relative imports."""
+        self._write_extension("my.flat", ["my.flat"])
+        self._write("my.flat/my/flat/__init__.py", "from .impl import run\n")
+        self._write(
+            "my.flat/my/flat/impl.py",
+            """\
+            import os
+
+            import torch
+
+            def run():
+                import scipy
+            """,
+        )
+
+        findings, unaudited = audit_extensions([self.root], ["torch", "scipy"], {}, 0.05)
+
+        self.assertEqual(unaudited, [])
+        self.assertEqual([finding.imported for finding in findings], ["torch"])
+        finding = findings[0]
+        self.assertEqual(finding.extension, "my.flat")
+        self.assertEqual(finding.file, os.path.join(self.root, "my.flat", "my", "flat", "impl.py"))
+        self.assertEqual(finding.line, 3)
+        self.assertEqual(finding.chain, ["my.flat", "my.flat.impl"])
+
+    def test_python_folder_layout_module(self) -> None:
+        """Modules kept in a ``python`` folder are resolved through the extension's root module."""
+        self._write_extension("my.linked-isaac", ["my.linked", "my.linked.tests", "my.linked.bindings"])
+        self._write("my.linked-isaac/python/__init__.py", "from .impl.extension import *\n")
+        self._write("my.linked-isaac/python/impl/__init__.py", "")
+        self._write("my.linked-isaac/python/impl/extension.py", "import warp as wp\n")
+        self._write("my.linked-isaac/python/tests/__init__.py", "import scipy\n")
+
+        findings, unaudited = audit_extensions([self.root], ["warp", "scipy"], {}, 0.05)
+
+        by_module = {finding.python_module: finding for finding in findings}
+        self.assertEqual(sorted(by_module), ["my.linked", "my.linked.tests"])
+        self.assertEqual(by_module["my.linked"].imported, "warp")
+        self.assertEqual(by_module["my.linked"].chain, ["my.linked", "my.linked.impl.extension"])
+        self.assertEqual(by_module["my.linked.tests"].imported, "scipy")
+        # A native bindings module has no Python source and is reported instead of dropped
+        self.assertEqual(
+            [(module.extension, module.python_module) for module in unaudited],
+            [("my.linked-isaac", "my.linked.bindings")],
+        )
+
+    def test_multi_name_from_import_is_one_finding(self) -> None:
+        """A from-import of several names from a heavy module is reported once."""
+        self._write_extension("my.multi", ["my.multi"])
+        self._write("my.multi/my/multi/__init__.py", "from omni.replicator.core import AnnotatorRegistry, Writer\n")
+
+        findings, _ = audit_extensions([self.root], ["omni.replicator.core"], {}, 0.05)
+
+        self.assertEqual([(finding.imported, finding.line) for finding in findings], [("omni.replicator.core", 1)])
+
+    def test_slow_measured_import_is_flagged(self) -> None:
+        """Imports measured above the threshold in a startup trace are flagged with their time."""
+        self._write_extension("my.slow", ["my.slow"])
+        self._write("my.slow/my/slow/__init__.py", "import slow_dependency\nimport fast_dependency\n")
+        trace_path = os.path.join(self.root, "startup_trace.json")
+        with open(trace_path, "w") as f:
+            json.dump(
+                {
+                    "version": 1,
+                    "imports": [
+                        {"module": "slow_dependency", "self_seconds": 0.4, "cumulative_seconds": 0.5},
+                        {"module": "fast_dependency", "self_seconds": 0.01, "cumulative_seconds": 0.01},
+                    ],
+                },
+                f,
+            )
+
+        measured = load_measured_imports(trace_path)
+        findings, _ = audit_extensions([self.root], [], measured, 0.05)
+
+        self.assertEqual([finding.imported for finding in findings], ["slow_dependency"])
+        self.assertEqual(findings[0].reason, "measured 0.500s")
+        self.assertEqual(findings[0].import_seconds, 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()